@@ -1,25 +1,12 @@
 """
-ChannelPRO™ — Multi-page Streamlit app structure.
+ChannelPRO™ — page modules.
 
-This directory is prepared for migrating to Streamlit's native multi-page
-app layout (https://docs.streamlit.io/get-started/multipage-apps).
+Page bodies live in the ``pages/views/`` subpackage, one module per sidebar
+page, and are imported on demand by ``app.py`` (see ``pages.views``).  They
+sit in a subpackage because Streamlit treats every top-level ``pages/*.py``
+file as a native multipage-app page, which would bypass the app's own login,
+sidebar navigation and tenant gates.
 
-Suggested page files to create as the migration proceeds:
-
-    pages/
-    ├── 1_Client_Intake.py
-    ├── 2_Scoring_Criteria.py
-    ├── 3_Score_Partner.py
-    ├── 4_Partner_Assessment.py
-    ├── 5_Partner_Classification.py
-    ├── 6_Import_Data.py
-    ├── 7_Partner_List.py
-    ├── 8_Ask_ChannelPRO.py
-    ├── 9_Break_Even_Costs.py
-    ├── 10_Break_Even_Analysis.py
-    ├── 11_Admin_Users.py
-    └── 12_Admin_All_Clients.py
-
-Each page should import shared utilities from the ``utils/`` package
-and render only its own section of the UI.
+Each page module imports shared utilities from the ``utils/`` package and
+renders only its own section of the UI.
 """
@@ -0,0 +1,79 @@
+"""
+On-demand page modules for ChannelPRO™.
+
+Every sidebar page lives in its own module in this package and exposes
+``render(ctx)``.  ``app.py`` runs login, the sidebar and the access gates,
+then calls :func:`render_page`, which imports only the active page's module.
+A rerun therefore never executes other pages' module-level setup, and
+dependencies that only some pages need (AgGrid, Altair, Plotly, openpyxl)
+are not loaded until one of those pages is opened.
+
+*ctx* carries the per-run state the sidebar computes:
+
+* ``is_admin`` / ``active_tenant`` / ``tenant_tier``
+* ``page`` — the selected page name
+* ``chosen_cat`` / ``visible_metrics`` — the sidebar category filter
+
+The modules are kept out of ``pages/`` itself because Streamlit turns every
+top-level ``pages/*.py`` file into a separate multipage-app entry.
+
+:func:`page_timings` reports how long each page took to import and render in
+this process; ``python -m utils.cli page-timings`` measures cold imports.
+"""
+import importlib
+import threading
+import time
+
+PAGE_MODULES = {
+    "Client Intake": "client_intake",
+    "Step 1 — Scoring Criteria": "step1_criteria",
+    "Step 2 — Score a Partner": "step2_score",
+    "Step 3 — Partner Assessment": "step3_assessment",
+    "Step 4 — Partner Classification": "step4_classification",
+    "Import Data": "import_data",
+    "Partner List": "partner_list",
+    "Ask ChannelPRO™": "ask",
+    "Break-even — Program Costs": "breakeven_costs",
+    "Break-even — Detailed Analysis": "breakeven_analysis",
+    "Revenue Recovery": "revenue_recovery",
+    "User Guide": "guide",
+    "Quick-Start Guide": "guide",
+    "Admin — Manage Users": "admin_users",
+    "Admin — All Clients": "admin_clients",
+    "Admin — Performance": "admin_perf",
+}
+
+_timings: dict[str, dict] = {}
+_lock = threading.Lock()
+
+
+def page_module(page: str):
+    """Import (once per process) and return the module rendering *page*."""
+    return importlib.import_module(f"{__name__}.{PAGE_MODULES[page]}")
+
+
+def render_page(page: str, ctx: dict) -> None:
+    """Render *page*, recording its import and render time."""
+    t0 = time.perf_counter()
+    mod = page_module(page)
+    t1 = time.perf_counter()
+    try:
+        mod.render(ctx)
+    finally:
+        # st.stop() / st.rerun() end a render by raising, so record in finally
+        t2 = time.perf_counter()
+        with _lock:
+            t = _timings.setdefault(page, {"runs": 0, "import_ms": None, "last_ms": 0.0, "total_ms": 0.0})
+            if t["import_ms"] is None:
+                t["import_ms"] = (t1 - t0) * 1000
+            t["runs"] += 1
+            t["last_ms"] = (t2 - t1) * 1000
+            t["total_ms"] += t["last_ms"]
+
+
+def page_timings() -> dict[str, dict]:
+    """``{page: {"runs", "import_ms", "last_ms", "avg_ms"}}`` for pages rendered so far."""
+    with _lock:
+        return {p: {"runs": t["runs"], "import_ms": t["import_ms"], "last_ms": t["last_ms"],
+                    "avg_ms": t["total_ms"] / t["runs"] if t["runs"] else 0.0}
+                for p, t in _timings.items()}
@@ -0,0 +1,94 @@
+"""Admin — All Clients: overview of every tenant and the cross-client export."""
+import json
+import streamlit as st
+
+from utils.paths import (
+    tenant_dir as _tenant_dir,
+    all_tenants as _all_tenants,
+)
+from utils.data import (
+    load_partners as _load_partners,
+    assessment_frame as _assessment_frame,
+)
+from utils.scoring import grade as _grade
+from utils.exports import all_clients_export as _all_clients_export
+from utils.jobs import (
+    submit as _submit_job,
+    has_active_jobs as _has_active_jobs,
+)
+from utils.ui import brand as _brand
+
+
+def render(ctx: dict) -> None:
+    is_admin = ctx["is_admin"]; active_tenant = ctx["active_tenant"]
+    _job_owner = st.session_state.get("auth_user") or "admin"
+    _brand(); st.markdown("## Admin — All Clients Overview")
+    if not is_admin: st.error("Admin access required."); st.stop()
+    tenants=_all_tenants()
+    if not tenants: st.info("No clients yet. Create accounts in **Manage Users**."); st.stop()
+    total_partners=0; tenant_data={}
+    for t in tenants:
+        td=_tenant_dir(t)
+        ci=json.loads((td/"client_info.json").read_text()) if (td/"client_info.json").exists() else {}
+        ps=_load_partners(td/"all_partners.csv")
+        total_partners+=len(ps)
+        # Load break-even data if available
+        be_file = td / "break_even_configs.json"
+        be_data = json.loads(be_file.read_text()) if be_file.exists() else None
+        be_total = sum(sum(v for v in items.values()) for items in be_data.get("sections", {}).values()) if be_data else 0
+        be_np = be_data.get("num_partners", 0) if be_data else 0
+        tenant_data[t]={"client_info":ci,"partners":ps,"has_criteria":(td/"scoring_criteria.json").exists(),
+                        "be_data":be_data,"be_total":be_total,"be_np":be_np}
+    c1,c2,c3=st.columns(3)
+    with c1: st.markdown(f'<div class="sum-card"><div class="sum-big">{len(tenants)}</div><div class="sum-lbl">Clients</div></div>',unsafe_allow_html=True)
+    with c2: st.markdown(f'<div class="sum-card"><div class="sum-big">{total_partners}</div><div class="sum-lbl">Total Partners</div></div>',unsafe_allow_html=True)
+    with c3:
+        wc=sum(1 for d in tenant_data.values() if d["has_criteria"])
+        st.markdown(f'<div class="sum-card"><div class="sum-big">{wc}/{len(tenants)}</div><div class="sum-lbl">Criteria Set</div></div>',unsafe_allow_html=True)
+    # Break-even overview row
+    be_clients = sum(1 for d in tenant_data.values() if d["be_data"])
+    if be_clients > 0:
+        total_be = sum(d["be_total"] for d in tenant_data.values())
+        b1, b2, b3 = st.columns(3)
+        with b1: st.metric("Clients w/ Break-even", f"{be_clients}/{len(tenants)}")
+        with b2: st.metric("Total Program Costs (all)", f"${total_be:,.0f}")
+        avg_be = total_be / sum(d["be_np"] for d in tenant_data.values() if d["be_np"] > 0) if any(d["be_np"] > 0 for d in tenant_data.values()) else 0
+        with b3: st.metric("Avg Break-even/Partner", f"${avg_be:,.2f}")
+    st.markdown("---")
+    for t in tenants:
+        td=tenant_data[t]; ci=td["client_info"]; ps=td["partners"]
+        client_name=ci.get("client_name",t)
+        is_active = (t == active_tenant)
+        active_tag = ' <span style="background:#1E293B;color:#fff;font-size:.72rem;font-weight:700;padding:2px 10px;border-radius:12px;margin-left:8px;vertical-align:middle;">ACTIVE</span>' if is_active else ""
+        label_style = "color:#000;font-weight:800" if is_active else ""
+        with st.expander(f"🏢 **{client_name}** ({t}) — {len(ps)} partners {'✅' if td['has_criteria'] else '⚪'}", expanded=is_active):
+            if is_active:
+                st.markdown(f'<div style="font-size:.88rem;{label_style};margin-bottom:8px;">Currently active client{active_tag}</div>', unsafe_allow_html=True)
+            if ci:
+                c1,c2,c3=st.columns(3)
+                with c1: st.markdown(f"**Contact:** {ci.get('project_manager','—')}")
+                with c2: st.markdown(f"**Email:** {ci.get('email','—')}")
+                with c3: st.markdown(f"**City:** {ci.get('city','—')}, {ci.get('country','—')}")
+            if ps:
+                af=_assessment_frame([],_tenant_dir(t)/"all_partners.csv").sort_values("Total",ascending=False,kind="stable")
+                tbl="<table class='hm-tbl'><thead><tr><th>Partner</th><th>PAM</th><th>Total</th><th>%</th><th>Grade</th></tr></thead><tbody>"
+                tbl+="".join(f'<tr><td style="text-align:left;padding-left:10px">{pn}</td><td>{pam}</td><td>{tv}</td><td>{pv:.1f}%</td><td style="color:{_grade(pv)[1]};font-weight:800">{gl}</td></tr>'
+                             for pn,pam,tv,pv,gl in zip(af["Partner"],af["PAM"],af["Total"],af["Pct"],af["Grade"]))
+                tbl+="</tbody></table>"
+                st.markdown(tbl,unsafe_allow_html=True)
+                csv_path=_tenant_dir(t)/"all_partners.csv"
+                if csv_path.exists(): st.download_button(f"⬇️ Download {t} CSV",csv_path.read_text(),f"{t}_partners.csv","text/csv",key=f"dl_{t}")
+            else: st.caption("No partners scored yet.")
+            # Break-even summary
+            if td.get("be_data"):
+                st.markdown("---")
+                bc1, bc2, bc3 = st.columns(3)
+                with bc1: st.metric("Program Costs", f"${td['be_total']:,.0f}")
+                be_pt = td['be_total'] / td['be_np'] if td['be_np'] > 0 else 0
+                with bc2: st.metric("Break-even/Partner", f"${be_pt:,.2f}")
+                sup_t = sum(td["be_data"].get("sections",{}).get("Technical and Sales Support",{}).values())
+                with bc3: st.metric("Support Costs", f"${sup_t:,.0f}")
+    st.markdown("---"); st.markdown("### Cross-Client Export")
+    st.caption("Runs in the background — progress and the finished workbook appear in the sidebar.")
+    if st.button("⬇️  Export All Clients to Single Excel",type="primary",disabled=_has_active_jobs(_job_owner)):
+        _submit_job(_job_owner,"All clients workbook","All_Clients_Overview.xlsx",_all_clients_export); st.rerun()
@@ -0,0 +1,65 @@
+"""Admin — Performance: per-rerun section timings, I/O counts and latency histograms."""
+import pandas as pd
+import streamlit as st
+
+from utils.perf import (
+    PERF_LOG,
+    enabled as _perf_enabled,
+    set_enabled as _perf_set_enabled,
+    page_stats as _page_stats,
+    recent_runs as _recent_runs,
+    histogram_labels as _histogram_labels,
+    reset as _perf_reset,
+)
+from utils.data import stat_token as _stat_token
+from utils.ui import brand as _brand, cached_download as _cached_download
+from pages.views import page_timings as _page_timings
+
+
+def render(ctx: dict) -> None:
+    is_admin = ctx["is_admin"]
+    _brand(); st.markdown("## Admin — Performance")
+    if not is_admin: st.error("Admin access required."); st.stop()
+    st.markdown('<div class="info-box">Times each rerun of the app in named sections — login, sidebar, criteria, partners, page, export, ai — '
+                'and counts file reads and writes made through the data layer. Recording is off unless switched on here or with '
+                '<code>CHANNELPRO_PERF=1</code>; it applies to every session in this process until the next restart.</div>', unsafe_allow_html=True)
+    on = st.toggle("Record performance data", value=_perf_enabled(), key="perf_toggle")
+    if on != _perf_enabled():
+        _perf_set_enabled(on); st.rerun()
+
+    stats = _page_stats()
+    if not stats:
+        st.info("No runs recorded yet." if on else "Recording is off.")
+    else:
+        st.markdown('<div class="sec-head">Latency by page</div>', unsafe_allow_html=True)
+        rows = [{"Page": p, "Runs": s["runs"], "p50 ms": round(s["p50_ms"], 1), "p95 ms": round(s["p95_ms"], 1),
+                 "Max ms": round(s["max_ms"], 1), "Reads": round(s["reads"], 1), "Read KB": round(s["read_bytes"] / 1024, 1),
+                 "Writes": round(s["writes"], 1), "Write KB": round(s["write_bytes"] / 1024, 1),
+                 **{f"{k} ms": round(v, 1) for k, v in sorted(s["sections_ms"].items())}}
+                for p, s in sorted(stats.items(), key=lambda kv: -kv[1]["p95_ms"])]
+        st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
+        st.caption("Section times and I/O are per-run averages over the last runs of each page.")
+
+        hp = st.selectbox("Histogram for", list(stats), key="perf_hist_page")
+        hist = pd.DataFrame({"Runs": stats[hp]["hist"]}, index=pd.Index(_histogram_labels(), name="Latency"))
+        st.bar_chart(hist)
+
+        st.markdown('<div class="sec-head">Recent runs</div>', unsafe_allow_html=True)
+        recent = [{"Time": r["ts"], "Page": r["page"], "Total ms": r["total_ms"], "Reads": r["reads"], "Writes": r["writes"],
+                   **{f"{k} ms": v for k, v in r["sections"].items()}} for r in _recent_runs(50)]
+        st.dataframe(pd.DataFrame(recent), hide_index=True, use_container_width=True)
+        if st.button("Reset counters", key="perf_reset"):
+            _perf_reset(); st.rerun()
+
+    timings = _page_timings()
+    if timings:
+        st.markdown('<div class="sec-head">Page modules (this process)</div>', unsafe_allow_html=True)
+        st.dataframe(pd.DataFrame([{"Page": p, "Renders": t["runs"],
+                                    "Import ms": round(t["import_ms"] or 0, 1), "Last ms": round(t["last_ms"], 1),
+                                    "Avg ms": round(t["avg_ms"], 1)} for p, t in timings.items()]),
+                     hide_index=True, use_container_width=True)
+
+    if PERF_LOG.exists():
+        _cached_download("⬇️ Download JSON log", PERF_LOG.read_bytes, "perf.jsonl", "application/x-ndjson",
+                         kind="perf_log", version=_stat_token(PERF_LOG))
+        st.caption(f"One JSON object per run, appended to `{PERF_LOG}`.")
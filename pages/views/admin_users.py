@@ -0,0 +1,127 @@
+"""Admin — Manage Users: client accounts, tiers and partner limits."""
+import os, re
+import streamlit as st
+
+from utils.paths import (
+    TENANTS_DIR,
+    tenant_dir as _tenant_dir,
+    all_tenants as _all_tenants,
+)
+from utils.auth import (
+    hash_pw as _hash_pw,
+    load_users as _load_users,
+    save_users as _save_users,
+)
+from utils.data import (
+    load_partners as _load_partners,
+    load_tenant_config as _load_tenant_config,
+    save_tenant_config as _save_tenant_config,
+)
+from utils.ui import brand as _brand
+
+
+def render(ctx: dict) -> None:
+    is_admin = ctx["is_admin"]
+    _brand(); st.markdown("## Admin — Manage Users & Clients")
+    if not is_admin: st.error("Admin access required."); st.stop()
+    users=_load_users()
+    if st.session_state.get("_admin_saved"):
+        st.markdown('<div class="toast">✅ Changes saved</div>',unsafe_allow_html=True); st.session_state["_admin_saved"]=False
+    st.markdown("### Current Users")
+    for uname,udata in users.items():
+        with st.expander(f"{'🔑' if udata['role']=='admin' else '👤'} **{uname}** — {udata['display_name']} ({udata['role']}) {('→ '+udata['tenant']) if udata.get('tenant') else ''}"):
+            if uname=="admin": st.caption("Default admin account. You can change the password below.")
+            new_pw=st.text_input(f"New password for {uname}",type="password",key=f"adm_pw_{uname}")
+            if st.button(f"Update password",key=f"adm_pwbtn_{uname}"):
+                if new_pw and len(new_pw)>=4:
+                    users[uname]["password_hash"]=_hash_pw(new_pw); _save_users(users)
+                    st.session_state["_admin_saved"]=True; st.rerun()
+                else: st.error("Password must be at least 4 characters.")
+            if uname!="admin":
+                if st.button(f"🗑️ Delete user {uname}",key=f"adm_del_{uname}"):
+                    del users[uname]; _save_users(users)
+                    st.session_state["_admin_saved"]=True; st.rerun()
+    st.markdown("---")
+    st.markdown("### Add New Client User")
+    st.markdown("Each client user gets a **tenant ID** (e.g. `acme_corp`). This isolates their data completely.")
+    with st.form("add_user_form"):
+        c1,c2=st.columns(2)
+        with c1:
+            new_uname=st.text_input("Username",placeholder="e.g. acme_user")
+            new_display=st.text_input("Display name",placeholder="e.g. Acme Corporation")
+        with c2:
+            new_password=st.text_input("Password",type="password",placeholder="Min 4 characters")
+            new_tenant=st.text_input("Tenant ID",placeholder="e.g. acme_corp (lowercase, no spaces)")
+        new_role=st.radio("Role",["client","admin"],horizontal=True)
+        add_sub=st.form_submit_button("➕ Add User",type="primary")
+    if add_sub:
+        errors=[]
+        if not new_uname or len(new_uname)<2: errors.append("Username must be at least 2 characters.")
+        if new_uname in users: errors.append("Username already exists.")
+        if not new_password or len(new_password)<4: errors.append("Password must be at least 4 characters.")
+        if new_role=="client" and (not new_tenant or " " in new_tenant): errors.append("Tenant ID is required for client users (no spaces).")
+        if new_uname and not re.match(r'^[a-zA-Z0-9_]+$', new_uname): errors.append("Username: letters, numbers, underscores only.")
+        if errors:
+            for e in errors: st.error(e)
+        else:
+            tid=new_tenant.lower().strip() if new_tenant else None
+            users[new_uname]={"password_hash":_hash_pw(new_password),"display_name":new_display or new_uname,"role":new_role,"tenant":tid if new_role=="client" else None}
+            _save_users(users)
+            if tid: _tenant_dir(tid)
+            st.session_state["_admin_saved"]=True; st.rerun()
+    st.markdown("---")
+    st.markdown("### Tenant Directories & Limits")
+    tenants=_all_tenants()
+    if tenants:
+        for t in tenants:
+            td=_tenant_dir(t)
+            has_criteria=(td/"scoring_criteria.json").exists()
+            has_partners=(td/"all_partners.csv").exists()
+            pc=len(_load_partners(td/"all_partners.csv")) if has_partners else 0
+            tcfg = _load_tenant_config(t)
+            mp = tcfg.get("max_partners", 0)
+            limit_str = f"**{mp}**" if mp else "Unlimited"
+            with st.expander(f"**{t}** — {'✅ Criteria' if has_criteria else '⚪ No criteria'} · {pc} partners · Limit: {limit_str}"):
+                new_max = st.number_input(
+                    f"Max partners for **{t}** (0 = unlimited)",
+                    min_value=0, max_value=10000, value=mp, step=5, key=f"adm_maxp_{t}",
+                    help="Set the maximum number of partners this client can score. 0 means unlimited.")
+                if st.button(f"💾 Save limit for {t}", key=f"adm_maxp_btn_{t}"):
+                    tcfg["max_partners"] = new_max
+                    _save_tenant_config(tcfg, t)
+                    st.session_state["_admin_saved"] = True; st.rerun()
+    else:
+        st.info("No tenant directories yet. Add a client user above to create one.")
+
+    # ── Promote Demo → Client ─────────────────────────────────────────
+    demo_tenants = [t for t in _all_tenants() if t.lower().startswith("demo_")]
+    if demo_tenants:
+        st.markdown("---")
+        st.markdown("### Promote Demo to Client")
+        st.caption("Rename a `demo_` tenant folder to `client_` and update all user records. "
+                   "This preserves all data and converts the tenant to full client access.")
+        promo_sel = st.selectbox("Select demo tenant", demo_tenants, key="adm_promo_sel")
+        if promo_sel:
+            _prefix_len = 5  # len("demo_") == 5
+            new_tid = "client_" + promo_sel[_prefix_len:]
+            st.markdown(f"**{promo_sel}** → **{new_tid}**")
+            if new_tid in _all_tenants():
+                st.error(f"Target tenant `{new_tid}` already exists. Rename or remove it first.")
+            elif st.button(f"🚀 Promote to Client", key="adm_promo_btn", type="primary"):
+                import shutil
+                src = TENANTS_DIR / promo_sel
+                dst = TENANTS_DIR / new_tid
+                os.rename(str(src), str(dst))
+                # Update every user whose tenant matches the old ID
+                promo_users = _load_users()
+                updated_count = 0
+                for _uname, _udata in promo_users.items():
+                    if (_udata.get("tenant") or "").lower() == promo_sel.lower():
+                        _udata["tenant"] = new_tid
+                        updated_count += 1
+                _save_users(promo_users)
+                # Switch active tenant if we just renamed the one in use
+                if st.session_state.get("active_tenant", "").lower() == promo_sel.lower():
+                    st.session_state["active_tenant"] = new_tid
+                st.session_state["_admin_saved"] = True
+                st.rerun()
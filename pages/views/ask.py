@@ -0,0 +1,435 @@
+"""Ask ChannelPRO™ — AI assistant over the tenant's partner data."""
+import json, pathlib, time
+import streamlit as st
+import pandas as pd
+
+from utils.paths import (
+    save_path as _save_path,
+    csv_path as _csv_path,
+)
+from utils.api import (
+    AI_STREAM, cached_system, resolve_api_key, call_ai, stream_ai, reply_key, cached_reply, store_reply,
+    run_batch as _run_batch,
+)
+from utils.conversation import (
+    load_conversation as _load_conversation,
+    append_message as _append_message,
+    clear_conversation as _clear_conversation,
+    api_messages as _api_messages,
+    recent_questions as _recent_questions,
+)
+from utils.data import (
+    load_partners as _load_partners,
+    apply_score_patches as _apply_score_patches,
+    assessment_frame as _assessment_frame,
+    data_version as _data_version,
+)
+from utils.scoring import (
+    SCORECARD_METRICS,
+    enabled as _enabled,
+    synthetic_raw_for_score as _synthetic_raw_for_score,
+    ensure_criteria_complete as _ensure_criteria_complete,
+)
+from utils.query import answer_locally as _answer_locally
+from utils.retrieval import question_context as _question_context, tenant_summary as _tenant_summary
+from utils.snapshot import criteria_hash as _criteria_hash
+from utils.ui import brand as _brand
+
+
+_AI_INSTRUCTIONS = f"""You are ChannelPRO\u2122 AI Assistant, an expert in partner channel management and analysis.
+You analyze partner scorecard data and provide actionable insights.
+
+SCORING SYSTEM: Each metric is scored 1-5 (5=best). Higher percentage = better overall performance.
+Grade scale: A (\u226590%), B+ (\u226580%), B (\u226570%), C+ (\u226560%), C (\u226550%), D (<50%).
+
+PARTNER DATA: the system prompt holds the scoring criteria and tenant-wide summary statistics.
+Each user question is followed by a <partner_data> block listing the partners relevant to that
+question (named partners, partners matching a mentioned PAM/country/tier, or the highest and
+lowest scorers when the match is large). Base partner-level answers on those lines and the
+summary; if a partner the user asks about is not listed, say so rather than guessing.
+
+INSTRUCTIONS:
+- Answer questions about partner performance, comparisons, filtering, and trends.
+- When listing partners, include their key metrics and scores.
+- You can suggest or make score updates when asked.
+- Be specific with numbers and partner names.
+
+Always respond with valid JSON (no markdown fences, no extra text) in this exact format:
+{{
+  "answer": "Your detailed analysis in plain text. Use \\n for line breaks.",
+  "table": [
+    {{"Partner": "Name", "Tier": "Gold", "Country": "US", "PAM": "Jane", "Total": 85, "Pct": "72.3%", "Key Metric": "value"}}
+  ],
+  "chart": {{
+    "type": "bar or pie or hbar",
+    "title": "Chart title",
+    "x_label": "X axis label",
+    "y_label": "Y axis label",
+    "data": [{{"label": "Name", "value": 42.5}}, {{"label": "Name2", "value": 38.1}}]
+  }},
+  "updates": [
+    {{"partner": "Partner Name", "metric_key": "metric_key_here", "new_score": 3, "reason": "Explanation"}}
+  ]
+}}
+
+RULES for the JSON response:
+- "answer" is ALWAYS required.
+- "table" should be included when listing/filtering partners. Use null if not relevant.
+- "chart" should be included when a visualization would help. Use null if not needed. Keep data to \u226415 items.
+- "updates" should ONLY be included when the user explicitly asks to change/update scores. Use null otherwise.
+- For "table", dynamically choose columns that are relevant to the query.
+- For "chart", choose the best chart type: "bar" for comparisons, "pie" for distributions, "hbar" for ranked lists.
+"""
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _ai_context(csv_str: str, version: str, criteria_version: str, _cr: dict) -> str:
+    """Criteria and tenant summary section of the system prompt.
+
+    Built once per (tenant, data version, criteria version); *_cr* is not
+    hashed — *criteria_version* stands in for it.
+    """
+    cr = _cr
+    em = _enabled(cr)
+
+    criteria_lines = []
+    for m in em:
+        mc = cr.get(m["key"], {})
+        if m["type"] == "quantitative":
+            ranges = []
+            for s in ("1","2","3","4","5"):
+                r = mc.get("ranges",{}).get(s,{})
+                lo, hi = r.get("min",""), r.get("max","")
+                if lo and hi: ranges.append(f"  {s}: {lo}\u2013{hi}")
+                elif lo: ranges.append(f"  {s}: \u2265{lo}")
+                elif hi: ranges.append(f"  {s}: \u2264{hi}")
+            criteria_lines.append(f"- {m['name']} (key: {m['key']}, unit: {m.get('unit','')}, {m['direction']}, quantitative)\n" + "\n".join(ranges))
+        else:
+            descs = [f"  {s}: {mc.get('descriptors',{}).get(s,'')}" for s in ("1","2","3","4","5")]
+            criteria_lines.append(f"- {m['name']} (key: {m['key']}, {m['direction']}, qualitative)\n" + "\n".join(descs))
+
+    return f"""SCORING CRITERIA ({len(em)} active metrics):
+{chr(10).join(criteria_lines)}
+
+TENANT SUMMARY:
+{_tenant_summary(pathlib.Path(csv_str), em)}
+"""
+
+
+def _build_ai_system_prompt():
+    """System prompt as content blocks: fixed instructions, then the tenant's criteria and summary.
+
+    The data block is cached per tenant data version and criteria version,
+    and the whole prompt is marked for provider-side prompt caching, so
+    follow-up questions neither rebuild nor re-process it.
+    """
+    cr = st.session_state.get("criteria", {})
+    context = _ai_context(str(_csv_path()), _data_version(), _criteria_hash(cr), cr)
+    return cached_system(_AI_INSTRUCTIONS, context)
+
+
+def _with_partner_data(api_messages, questions):
+    """Attach the question-scoped partner data to the latest user turn.
+
+    Matching looks at *questions* — the latest question and the one before
+    it, so short follow-ups ("and in Germany?") keep their subject.  Only
+    the API copy is changed — the stored conversation keeps the bare question.
+    """
+    em = _enabled(st.session_state.get("criteria", {}))
+    ctx = _question_context("\n".join(questions), _csv_path(), em)
+    last = api_messages[-1]
+    return api_messages[:-1] + [{"role": "user", "content": f"{last['content']}\n\n<partner_data>\n{ctx}\n</partner_data>"}]
+
+
+def _call_ai(messages, api_key):
+    """Call Anthropic API with conversation history (delegates to utils.api)."""
+    system = _build_ai_system_prompt()
+    return call_ai(messages, api_key, system)
+
+
+def _stream_ai(messages, api_key):
+    """Streamed variant of :func:`_call_ai` — iterate for the answer, then read ``.result``."""
+    return stream_ai(messages, api_key, _build_ai_system_prompt())
+
+
+_BATCH_MAX = 50
+_BATCH_TEMPLATES = {
+    "PAM": "Summarise the strengths and risks of PAM {name}'s partner portfolio.",
+    "Tier": "Summarise the strengths and risks of our {name} tier partners.",
+    "Country": "Summarise the strengths and risks of our partners in {name}.",
+}
+
+
+def _md_table(rows):
+    """Markdown pipe table for a list of row dicts."""
+    cols = list(dict.fromkeys(k for r in rows for k in r))
+    cell = lambda v: "" if v is None else str(v).replace("|", "\\|").replace("\n", " ")
+    lines = ["| " + " | ".join(cols) + " |", "|" + "---|" * len(cols)]
+    lines += ["| " + " | ".join(cell(r.get(c)) for c in cols) + " |" for r in rows]
+    return "\n".join(lines)
+
+
+def _batch_report(batch):
+    """The batch results as one Markdown document."""
+    out = ["# Ask ChannelPRO\u2122 batch report", "",
+           f"**Question:** {batch['template']}  ", f"**Run for each {batch['dimension']}** \u00b7 {batch['when']} \u00b7 {len(batch['results'])} answers", ""]
+    for r in batch["results"]:
+        out += [f"## {batch['dimension']}: {r['label']}", "", r.get("answer", "").replace("\\n", "\n"), ""]
+        if r.get("table"):
+            out += [_md_table(r["table"][:_BATCH_MAX]), ""]
+    return "\n".join(out)
+
+
+def _run_batch_questions(dim, values, template, cr, api_key):
+    """Ask *template* once per value — cached answers first, the rest concurrently."""
+    tenant = st.session_state.get("active_tenant")
+    results, jobs = {}, []
+    for v in values:
+        q = template.replace("{name}", v)
+        msgs = [{"role": "user", "content": q}]
+        ck = reply_key(msgs, tenant, _data_version(), _criteria_hash(cr), _AI_INSTRUCTIONS)
+        hit = cached_reply(ck)
+        if hit:
+            results[v] = {**hit, "label": v, "seconds": 0.0}
+        else:
+            jobs.append((v, _with_partner_data(msgs, [q]), ck))
+    bar = st.progress(0.0, text=f"Asking {len(jobs)} question(s)…" if jobs else "All answers cached.")
+    t0 = time.perf_counter()
+    out = _run_batch([(v, m) for v, m, _ in jobs], api_key, _build_ai_system_prompt(), tenant=tenant,
+                     on_done=lambda done, total, r: bar.progress(done / total, text=f"{done}/{total} answered"))
+    for (_, _, ck), r in zip(jobs, out):
+        store_reply(ck, {k: v for k, v in r.items() if k not in ("label", "seconds")})
+    results.update({r["label"]: r for r in out})
+    st.session_state["ai_batch"] = {
+        "dimension": dim, "template": template, "when": time.strftime("%Y-%m-%d %H:%M"),
+        "wall": round(time.perf_counter() - t0, 2), "results": [results[v] for v in values if v in results],
+    }
+
+
+def _batch_panel(cr, api_key):
+    """Batch mode: one templated question per PAM, tier or country, asked concurrently."""
+    df = _assessment_frame(_enabled(cr))
+    b1, b2 = st.columns([1, 3])
+    with b1: dim = st.selectbox("Run for each", list(_BATCH_TEMPLATES), key="ai_batch_dim")
+    values = sorted(v for v in df[dim].str.strip().unique() if v)
+    with b2: chosen = st.multiselect(f"{dim} values", values, default=values[:_BATCH_MAX], key=f"ai_batch_vals_{dim}",
+                                     max_selections=_BATCH_MAX)
+    template = st.text_area("Question — {name} is replaced by each value", value=_BATCH_TEMPLATES[dim], key=f"ai_batch_q_{dim}")
+    if st.button("▶ Run batch", key="ai_batch_run", type="primary"):
+        if "{name}" not in template: st.warning("Include {name} in the question.")
+        elif not chosen: st.warning(f"Choose at least one {dim}.")
+        else: _run_batch_questions(dim, chosen, template, cr, api_key)
+    batch = st.session_state.get("ai_batch")
+    if not batch: return
+    secs = [r["seconds"] for r in batch["results"]]
+    st.caption(f"{len(secs)} answers in {batch['wall']:.1f}s — slowest call {max(secs, default=0):.1f}s, "
+               f"{sum(secs):.1f}s if asked one at a time. Cached answers take 0s.")
+    for r in batch["results"]:
+        st.markdown(f"**{batch['dimension']}: {r['label']}**")
+        st.markdown(r.get("answer", "").replace("\\n", "\n"))
+        if r.get("table"):
+            try:
+                st.dataframe(pd.DataFrame(r["table"]), use_container_width=True, hide_index=True)
+            except Exception:
+                pass
+    st.download_button("⬇️ Download report", _batch_report(batch), "channelpro_batch_report.md", "text/markdown", key="ai_batch_dl")
+
+
+def _render_ai_chart(chart_spec):
+    """Render a chart from AI-generated spec using native Streamlit charts."""
+    if not chart_spec or not chart_spec.get("data"): return
+    title = chart_spec.get("title", "")
+    data = chart_spec["data"]
+    df = pd.DataFrame(data)
+    if "label" not in df.columns or "value" not in df.columns: return
+    if title:
+        st.markdown(f"**{title}**")
+    chart_df = df.set_index("label")
+    try:
+        st.bar_chart(chart_df)
+    except Exception:
+        st.dataframe(df, use_container_width=True, hide_index=True)
+
+
+def _score_patches(updates, cr):
+    """AI ``updates`` as ``(partner, metric_key, score, raw_value)`` patches for :func:`utils.data.apply_score_patches`."""
+    return [(u.get("partner",""), u.get("metric_key",""), u.get("new_score"),
+             _synthetic_raw_for_score(u.get("metric_key",""), u.get("new_score"), cr) if isinstance(u.get("new_score"), int) else None)
+            for u in updates]
+
+
+def _apply_ai_updates(updates, cr):
+    """Apply score updates from AI response — one write per file; returns the applied diff."""
+    return _apply_score_patches(_score_patches(updates, cr), _enabled(cr))
+
+
+def render(ctx: dict) -> None:
+    _tenant_tier = ctx["tenant_tier"]
+    _brand(); st.markdown("## 🤖 Ask ChannelPRO™")
+    if not _save_path().exists():
+        if _tenant_tier == "demo":
+            st.warning("⚠️ Import data first.")
+            if st.button("📥 Go to Import Data", type="primary"):
+                st.session_state["current_page"] = "Import Data"; st.rerun()
+        else:
+            st.warning("⚠️ Complete **Step 1 — Scoring Criteria** first.")
+        st.stop()
+    st.session_state["criteria"] = json.loads(_save_path().read_text())
+    _ensure_criteria_complete()
+    cr = st.session_state["criteria"]
+    partners = _load_partners()
+    if not partners:
+        st.warning("⚠️ Score at least one partner in **Step 2** before using the AI assistant."); st.stop()
+
+    st.markdown("""<div class="info-box">
+    Ask questions about your partner scorecards in plain English. Examples:<br>
+    • <i>"Which partners have MDF utilization below 40%?"</i><br>
+    • <i>"Show me partners with both a low close rate and long sales cycle"</i><br>
+    • <i>"Compare the top 5 partners by revenue vs their customer satisfaction"</i><br>
+    • <i>"Set Partner X's renewal rate score to 4"</i><br>
+    Conversations are multi-turn — ask follow-up questions to refine results.</div>""", unsafe_allow_html=True)
+
+    # API key management — env var → session cache → user input (see utils.api)
+    api_key = resolve_api_key()
+
+    # Chat history is stored per user in the tenant directory (see utils.conversation)
+    chat_user = st.session_state.get("auth_user") or "anonymous"
+    conv = _load_conversation(chat_user)
+    if "ai_pending_updates" not in st.session_state:
+        st.session_state["ai_pending_updates"] = None
+
+    # ── Pending updates confirmation ──
+    if st.session_state["ai_pending_updates"]:
+        updates = st.session_state["ai_pending_updates"]
+        st.markdown("### ⚠️ Confirm Score Updates")
+        st.markdown("The AI has suggested the following changes:")
+        # Dry run: current scores and the overall % each change leads to
+        preview = {(d["partner"].strip().lower(), d["metric_key"]): d
+                   for d in _apply_score_patches(_score_patches(updates, cr), _enabled(cr), dry_run=True)}
+        upd_rows = ""
+        for u in updates:
+            upd_rows += f'<tr><td style="text-align:left;padding-left:10px">{u["partner"]}</td>'
+            mk = u["metric_key"]
+            mname = next((m["name"] for m in SCORECARD_METRICS if m["key"] == mk), mk)
+            d = preview.get((str(u.get("partner","")).strip().lower(), mk))
+            cur = f'{d["old_score"] or "–"}/5' if d else "skipped"
+            pct = f'{d["old_pct"]:.1f}% → {d["new_pct"]:.1f}%' if d else ""
+            upd_rows += f'<td>{mname}</td><td>{cur}</td><td style="font-weight:800">{u["new_score"]}/5</td><td>{pct}</td>'
+            upd_rows += f'<td style="text-align:left">{u.get("reason","")}</td></tr>'
+        st.markdown(f'<table class="hm-tbl"><thead><tr><th style="text-align:left">Partner</th><th>Metric</th><th>Current</th><th>New Score</th><th>Overall</th><th style="text-align:left">Reason</th></tr></thead><tbody>{upd_rows}</tbody></table>', unsafe_allow_html=True)
+        uc1, uc2, uc3 = st.columns([1, 1, 3])
+        with uc1:
+            if st.button("✅ Apply Updates", type="primary", key="ai_confirm_upd"):
+                diff = _apply_ai_updates(updates, cr)
+                st.session_state["ai_pending_updates"] = None
+                table = [{"Partner": d["partner"], "Metric": next((m["name"] for m in SCORECARD_METRICS if m["key"] == d["metric_key"]), d["metric_key"]),
+                          "Old score": d["old_score"], "New score": d["new_score"], "Old %": d["old_pct"], "New %": d["new_pct"]} for d in diff]
+                _append_message(chat_user, "assistant",
+                    json.dumps({"answer": f"✅ Applied {len(diff)} score update(s) successfully.", "table": table or None, "chart": None, "updates": None}))
+                st.rerun()
+        with uc2:
+            if st.button("❌ Cancel", key="ai_cancel_upd"):
+                st.session_state["ai_pending_updates"] = None
+                _append_message(chat_user, "assistant",
+                    json.dumps({"answer": "Updates cancelled. No changes were made.", "table": None, "chart": None, "updates": None}))
+                st.rerun()
+        st.markdown("---")
+
+    # ── Chat history display ──
+    if conv["summary"]:
+        st.caption(f"{len(conv['summary'])} earlier exchange(s) are kept as a summary for the assistant.")
+    for msg in conv["messages"]:
+        if msg["role"] == "user":
+            with st.chat_message("user"):
+                st.markdown(msg["content"])
+        else:
+            with st.chat_message("assistant", avatar="🤖"):
+                try:
+                    resp = json.loads(msg["content"])
+                except (json.JSONDecodeError, TypeError):
+                    resp = None
+                if resp and isinstance(resp, dict):
+                    answer_text = resp.get("answer", "")
+                    if answer_text:
+                        st.markdown(answer_text.replace("\\n", "\n"))
+                    if resp.get("table"):
+                        try:
+                            st.dataframe(pd.DataFrame(resp["table"]), use_container_width=True, hide_index=True)
+                        except Exception:
+                            pass
+                    if resp.get("chart"):
+                        try:
+                            _render_ai_chart(resp["chart"])
+                        except Exception:
+                            pass
+                else:
+                    # Plain text message (non-JSON)
+                    st.markdown(msg["content"])
+
+    # ── Controls row ──
+    ctrl1, ctrl2 = st.columns([1, 6])
+    with ctrl1:
+        if st.button("🗑️ Clear chat", key="ai_clear", use_container_width=True):
+            _clear_conversation(chat_user)
+            st.session_state["ai_pending_updates"] = None
+            st.rerun()
+
+    # ── Batch questions ──
+    with st.expander("📋 Batch questions — ask the same question for every PAM, tier or country"):
+        _batch_panel(cr, api_key)
+
+    # ── Chat input ──
+    user_input = st.chat_input("Ask about your partners...", key="ai_chat_input")
+    if user_input:
+        # Display user message inline
+        with st.chat_message("user"):
+            st.markdown(user_input)
+        # Add user message to history
+        conv = _append_message(chat_user, "user", user_input)
+
+        # Token-budgeted history: recent exchanges verbatim, older ones summarised
+        api_messages = _api_messages(conv)
+
+        # Call API and display response inline
+        with st.chat_message("assistant", avatar="🤖"):
+            # Plain filters and rankings are answered locally; the rest goes to the model
+            resp = _answer_locally(user_input, _csv_path(), _enabled(cr))
+            # Repeat questions against unchanged data and criteria are served from disk
+            ck = reply_key(api_messages, st.session_state.get("active_tenant"), _data_version(),
+                           _criteria_hash(cr), _AI_INSTRUCTIONS)
+            cached = None if resp else cached_reply(ck)
+            if resp:
+                st.markdown(resp["answer"])
+            elif cached:
+                resp = cached
+                st.markdown(resp.get("answer","").replace("\\n", "\n"))
+                st.caption("⚡ Cached answer — your partner data and criteria have not changed since it was generated.")
+            elif AI_STREAM:
+                # Answer text renders token by token; table/chart follow once complete
+                stream = _stream_ai(_with_partner_data(api_messages, _recent_questions(conv)), api_key)
+                st.write_stream(stream)
+                resp = stream.result or {"answer": "No response received."}
+                store_reply(ck, resp)
+            else:
+                with st.spinner("🤖 Analyzing your partner data..."):
+                    resp = _call_ai(_with_partner_data(api_messages, _recent_questions(conv)), api_key)
+                store_reply(ck, resp)
+                st.markdown(resp.get("answer","").replace("\\n", "\n"))
+            if resp.get("table"):
+                try:
+                    st.dataframe(pd.DataFrame(resp["table"]), use_container_width=True, hide_index=True)
+                except Exception:
+                    pass
+            if resp.get("chart"):
+                try:
+                    _render_ai_chart(resp["chart"])
+                except Exception:
+                    pass
+
+        # Store response
+        _append_message(chat_user, "assistant", json.dumps(resp))
+
+        # Handle updates — stage for confirmation (requires rerun to show confirmation UI)
+        if resp.get("updates") and isinstance(resp["updates"], list) and len(resp["updates"]) > 0:
+            st.session_state["ai_pending_updates"] = resp["updates"]
+            st.rerun()
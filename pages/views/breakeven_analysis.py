@@ -0,0 +1,266 @@
+"""Break-even — Detailed Analysis: per-partner cost and revenue breakdown."""
+import streamlit as st
+import pandas as pd
+
+from utils.paths import sd_path as _sd_path
+from utils.data import load_be as _load_be
+from utils.cache import frame_version as _frame_version
+from utils.exports import cost_analysis_xlsx as _gen_cost_analysis_xlsx
+from utils.ui import (
+    brand as _brand,
+    cached_download as _cached_download,
+)
+
+
+def render(ctx: dict) -> None:
+    _brand(); st.markdown("## Break-even — Detailed Partner Cost Analysis")
+
+    # Load break-even config for cost metrics
+    be_cfg = _load_be()
+    sup_cost = sum(be_cfg.get("sections", {}).get("Technical and Sales Support", {}).values())
+    sc_ = be_cfg.get("support_calls", 0) or 0
+    am_ = be_cfg.get("avg_min_per_call", 20) or 20
+    cpm = sup_cost / (sc_ * am_) if sc_ > 0 and am_ > 0 else 0
+    cpc = sup_cost / sc_ if sc_ > 0 else 0
+
+    if sup_cost == 0:
+        st.warning("⚠️ Complete **Break-even — Program Costs** first to set support cost metrics.")
+
+    st.markdown("""<div class="info-box">
+    Upload a CSV with columns: <b>Partner</b>, <b>Revenues</b>, <b># of calls</b>.
+    Optional: <b>Time spent</b> (minutes). If missing, it will be estimated using your configured average minutes per call.
+    Support cost per partner is calculated using cost-per-minute from your Program Costs configuration.</div>""", unsafe_allow_html=True)
+
+    # Show current cost metrics
+    cm1, cm2, cm3 = st.columns(3)
+    with cm1: st.metric("Cost per Minute", f"${cpm:,.4f}" if cpm > 0 else "Not set")
+    with cm2: st.metric("Cost per Call", f"${cpc:,.2f}" if cpc > 0 else "Not set")
+    with cm3: st.metric("Avg Min/Call", f"{am_}")
+
+    st.markdown("---")
+
+    # Configurable avg minutes per call for this analysis
+    avg_min_override = st.number_input("Average minutes per call (for estimating missing 'Time spent')",
+        min_value=1, value=am_, step=1, key="da_avg_min")
+
+    # File upload
+    uploaded = st.file_uploader("📁 Upload Partner Cost CSV", type=["csv"], key="da_upload")
+
+    # Try loading previously saved data
+    df = None
+    sd_path = _sd_path()
+
+    if uploaded is not None:
+        try:
+            df = pd.read_csv(uploaded)
+        except Exception as e:
+            st.error(f"Error reading CSV: {e}"); df = None
+    elif sd_path.exists():
+        try:
+            df = pd.read_csv(sd_path)
+            st.info("📂 Loaded previously saved analysis data.")
+        except: df = None
+
+    if df is None:
+        st.info("Upload a CSV to begin analysis, or complete one on the Program Costs page first.")
+        st.stop()
+
+    # Validate required columns
+    col_map = {}
+    for col in df.columns:
+        cl = col.strip().lower()
+        if cl in ("partner", "partner name"): col_map["Partner"] = col
+        elif cl in ("revenues", "revenue"): col_map["Revenues"] = col
+        elif cl in ("# of calls", "calls", "number of calls", "#calls"): col_map["Calls"] = col
+        elif cl in ("time spent", "time", "minutes", "time spent (min)"): col_map["Time"] = col
+
+    missing = [c for c in ["Partner", "Revenues", "Calls"] if c not in col_map]
+    if missing:
+        st.error(f"Missing required columns: {', '.join(missing)}. Found: {list(df.columns)}")
+        st.stop()
+
+    # Normalize column names
+    df = df.rename(columns={col_map["Partner"]: "Partner", col_map["Revenues"]: "Revenues", col_map["Calls"]: "# of calls"})
+    if "Time" in col_map:
+        df = df.rename(columns={col_map["Time"]: "Time spent"})
+
+    # Clean numeric columns
+    for c in ["Revenues", "# of calls"]:
+        df[c] = pd.to_numeric(df[c], errors="coerce").fillna(0)
+    if "Time spent" in df.columns:
+        df["Time spent"] = pd.to_numeric(df["Time spent"], errors="coerce").fillna(0)
+    else:
+        df["Time spent"] = df["# of calls"] * avg_min_override
+
+    # Fill missing time using avg
+    df.loc[df["Time spent"] == 0, "Time spent"] = df.loc[df["Time spent"] == 0, "# of calls"] * avg_min_override
+
+    # Sort by revenues descending
+    df = df.sort_values("Revenues", ascending=False).reset_index(drop=True)
+
+    # Calculate percentages and costs
+    total_rev = df["Revenues"].sum()
+    total_calls = df["# of calls"].sum()
+    total_time = df["Time spent"].sum()
+
+    df["% of revenues"] = (df["Revenues"] / total_rev * 100) if total_rev > 0 else 0
+    df["% of calls"] = (df["# of calls"] / total_calls * 100) if total_calls > 0 else 0
+    df["% of support time"] = (df["Time spent"] / total_time * 100) if total_time > 0 else 0
+
+    if cpm > 0:
+        df["Support cost"] = df["Time spent"] * cpm
+    elif cpc > 0:
+        df["Support cost"] = df["# of calls"] * cpc
+    else:
+        df["Support cost"] = 0
+
+    total_support_cost = df["Support cost"].sum()
+    df["% of cost"] = (df["Support cost"] / total_support_cost * 100) if total_support_cost > 0 else 0
+
+    # Save processed data
+    df.to_csv(sd_path, index=False)
+
+    # --- Display results ---
+    st.markdown("### 📊 Analysis Results")
+    rm1, rm2, rm3, rm4 = st.columns(4)
+    with rm1: st.metric("Partners", f"{len(df)}")
+    with rm2: st.metric("Total Revenue", f"${total_rev:,.0f}")
+    with rm3: st.metric("Total Calls", f"{int(total_calls):,}")
+    with rm4: st.metric("Total Support Cost", f"${total_support_cost:,.2f}")
+
+    # Display table
+    st.markdown("### Partner Cost Table")
+    display_df = df[["Partner", "Revenues", "% of revenues", "# of calls", "% of calls",
+                     "Time spent", "% of support time", "Support cost", "% of cost"]].copy()
+
+    # Add totals row
+    totals = pd.DataFrame([{
+        "Partner": "TOTAL", "Revenues": total_rev,
+        "% of revenues": 100.0, "# of calls": total_calls,
+        "% of calls": 100.0, "Time spent": total_time,
+        "% of support time": 100.0, "Support cost": total_support_cost,
+        "% of cost": 100.0
+    }])
+    display_with_totals = pd.concat([display_df, totals], ignore_index=True)
+
+    # Format for display
+    fmt_df = display_with_totals.copy()
+    fmt_df["Revenues"] = fmt_df["Revenues"].apply(lambda x: f"${x:,.0f}")
+    fmt_df["% of revenues"] = fmt_df["% of revenues"].apply(lambda x: f"{x:.1f}%")
+    fmt_df["# of calls"] = fmt_df["# of calls"].apply(lambda x: f"{int(x):,}")
+    fmt_df["% of calls"] = fmt_df["% of calls"].apply(lambda x: f"{x:.1f}%")
+    fmt_df["Time spent"] = fmt_df["Time spent"].apply(lambda x: f"{int(x):,}")
+    fmt_df["% of support time"] = fmt_df["% of support time"].apply(lambda x: f"{x:.1f}%")
+    fmt_df["Support cost"] = fmt_df["Support cost"].apply(lambda x: f"${x:,.2f}")
+    fmt_df["% of cost"] = fmt_df["% of cost"].apply(lambda x: f"{x:.1f}%")
+
+    st.dataframe(fmt_df, use_container_width=True, hide_index=True)
+
+    # Downloads
+    dl1, dl2 = st.columns(2)
+    _da_ver = _frame_version(display_with_totals)
+    with dl1:
+        _cached_download("⬇️ Download CSV", lambda: display_with_totals.to_csv(index=False), "partner_cost_analysis.csv", "text/csv",
+            kind="cost-analysis-csv", version=_da_ver, type="primary")
+    with dl2:
+        _cached_download("⬇️ Download Excel", lambda: _gen_cost_analysis_xlsx(display_with_totals), "partner_cost_analysis.xlsx",
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", kind="cost-analysis-xlsx", version=_da_ver)
+
+    # --- Visualizations ---
+    st.markdown("---")
+    st.markdown("### 📈 Visualizations")
+
+    chart_df = df.head(15).copy()
+    if len(chart_df) > 0 and total_support_cost > 0:
+        try:
+            import altair as alt
+
+            tab1, tab2, tab3 = st.tabs(["Support Cost vs Revenue", "Cost Distribution", "Cost/Revenue Ratio"])
+
+            with tab1:
+                st.markdown("#### Top Partners: Support Cost vs Revenue")
+                # Melt for grouped bar chart
+                bar_src = chart_df[["Partner", "Revenues", "Support cost"]].copy()
+                bar_src = bar_src.melt(id_vars="Partner", var_name="Metric", value_name="Amount")
+                bar_chart = alt.Chart(bar_src).mark_bar().encode(
+                    x=alt.X("Partner:N", sort=list(chart_df["Partner"]), axis=alt.Axis(labelAngle=-45, labelLimit=120)),
+                    y=alt.Y("Amount:Q", title="$"),
+                    color=alt.Color("Metric:N", scale=alt.Scale(domain=["Revenues","Support cost"], range=["#2563eb","#dc4040"])),
+                    xOffset="Metric:N",
+                    tooltip=["Partner", "Metric", alt.Tooltip("Amount:Q", format="$,.0f")]
+                ).properties(height=400)
+                st.altair_chart(bar_chart, use_container_width=True)
+
+            with tab2:
+                st.markdown("#### Cost Distribution by Partner")
+                top10 = df.head(10).copy()
+                rest_cost = df.iloc[10:]["Support cost"].sum() if len(df) > 10 else 0
+                pie_src = top10[["Partner", "Support cost"]].copy()
+                if rest_cost > 0:
+                    pie_src = pd.concat([pie_src, pd.DataFrame([{"Partner": "Others", "Support cost": rest_cost}])], ignore_index=True)
+                pie_chart = alt.Chart(pie_src).mark_arc(innerRadius=50).encode(
+                    theta=alt.Theta("Support cost:Q"),
+                    color=alt.Color("Partner:N", legend=alt.Legend(title="Partner")),
+                    tooltip=["Partner", alt.Tooltip("Support cost:Q", format="$,.2f")]
+                ).properties(height=400)
+                st.altair_chart(pie_chart, use_container_width=True)
+
+                # Revenue distribution pie
+                st.markdown("#### Revenue Distribution by Partner")
+                rev_src = top10[["Partner", "Revenues"]].copy()
+                rest_rev = df.iloc[10:]["Revenues"].sum() if len(df) > 10 else 0
+                if rest_rev > 0:
+                    rev_src = pd.concat([rev_src, pd.DataFrame([{"Partner": "Others", "Revenues": rest_rev}])], ignore_index=True)
+                rev_pie = alt.Chart(rev_src).mark_arc(innerRadius=50).encode(
+                    theta=alt.Theta("Revenues:Q"),
+                    color=alt.Color("Partner:N", legend=alt.Legend(title="Partner")),
+                    tooltip=["Partner", alt.Tooltip("Revenues:Q", format="$,.0f")]
+                ).properties(height=400)
+                st.altair_chart(rev_pie, use_container_width=True)
+
+            with tab3:
+                st.markdown("#### Cost / Revenue Ratio by Partner")
+                ratio_df = chart_df[["Partner", "Revenues", "# of calls", "Support cost"]].copy()
+                ratio_df["Cost/Rev %"] = ratio_df.apply(lambda r: (r["Support cost"] / r["Revenues"] * 100) if r["Revenues"] > 0 else 0, axis=1)
+                ratio_chart = alt.Chart(ratio_df).mark_bar().encode(
+                    x=alt.X("Partner:N", sort=list(chart_df["Partner"]), axis=alt.Axis(labelAngle=-45, labelLimit=120)),
+                    y=alt.Y("Cost/Rev %:Q", title="Support Cost as % of Revenue"),
+                    color=alt.condition(
+                        alt.datum["Cost/Rev %"] > 10, alt.value("#dc4040"),
+                        alt.condition(alt.datum["Cost/Rev %"] > 5, alt.value("#d4a917"), alt.value("#1b6e23"))
+                    ),
+                    tooltip=["Partner", alt.Tooltip("Revenues:Q", format="$,.0f"),
+                             alt.Tooltip("Support cost:Q", format="$,.2f"),
+                             alt.Tooltip("Cost/Rev %:Q", format=".1f")]
+                ).properties(height=400)
+                st.altair_chart(ratio_chart, use_container_width=True)
+
+                # Table view
+                st.markdown("##### Detail")
+                tbl_html = '<table class="hm-tbl"><thead><tr><th style="text-align:left">Partner</th><th>Revenue</th><th>Calls</th><th>Support Cost</th><th>Cost/Rev %</th></tr></thead><tbody>'
+                for _, r in ratio_df.iterrows():
+                    rc = "#dc4040" if r["Cost/Rev %"] > 10 else "#d4a917" if r["Cost/Rev %"] > 5 else "#1b6e23"
+                    tbl_html += f'<tr><td style="text-align:left;padding-left:10px">{r["Partner"]}</td><td>${r["Revenues"]:,.0f}</td><td>{int(r["# of calls"]):,}</td><td>${r["Support cost"]:,.2f}</td><td style="color:{rc};font-weight:700">{r["Cost/Rev %"]:.1f}%</td></tr>'
+                tbl_html += '</tbody></table>'
+                st.markdown(tbl_html, unsafe_allow_html=True)
+
+        except Exception:
+            # Altair unavailable — fall back to native Streamlit charts
+            st.markdown("#### Top Partners: Support Cost vs Revenue")
+            fb_df = chart_df[["Partner", "Revenues", "Support cost"]].set_index("Partner")
+            st.bar_chart(fb_df)
+
+            st.markdown("#### Cost / Revenue Ratio")
+            ratio_df = chart_df[["Partner", "Revenues", "# of calls", "Support cost"]].copy()
+            ratio_df["Cost/Rev %"] = ratio_df.apply(lambda r: (r["Support cost"] / r["Revenues"] * 100) if r["Revenues"] > 0 else 0, axis=1)
+            st.bar_chart(ratio_df[["Partner","Cost/Rev %"]].set_index("Partner"))
+
+            st.markdown("##### Detail")
+            tbl_html = '<table class="hm-tbl"><thead><tr><th style="text-align:left">Partner</th><th>Revenue</th><th>Calls</th><th>Support Cost</th><th>Cost/Rev %</th></tr></thead><tbody>'
+            for _, r in ratio_df.iterrows():
+                rc = "#dc4040" if r["Cost/Rev %"] > 10 else "#d4a917" if r["Cost/Rev %"] > 5 else "#1b6e23"
+                tbl_html += f'<tr><td style="text-align:left;padding-left:10px">{r["Partner"]}</td><td>${r["Revenues"]:,.0f}</td><td>{int(r["# of calls"]):,}</td><td>${r["Support cost"]:,.2f}</td><td style="color:{rc};font-weight:700">{r["Cost/Rev %"]:.1f}%</td></tr>'
+            tbl_html += '</tbody></table>'
+            st.markdown(tbl_html, unsafe_allow_html=True)
+    else:
+        st.info("Add support cost data in Program Costs and upload partner data to see visualizations.")
@@ -0,0 +1,156 @@
+"""Break-even — Program Costs: partner program cost inputs."""
+import streamlit as st
+
+from utils.data import (
+    load_partners as _load_partners,
+    load_be as _load_be,
+    save_be as _save_be,
+)
+from utils.scoring import BE_SECTIONS, BE_SECTION_ICONS
+from utils.ui import brand as _brand
+
+
+def render(ctx: dict) -> None:
+    _brand(); st.markdown("## Break-even — Program Costs")
+    st.markdown("""<div class="info-box">
+    Enter your annual partner program costs by category. The tool calculates your <b>total program cost</b>
+    and <b>nominal break-even point</b> (cost per partner). For <b>Technical and Sales Support</b>, it also
+    derives cost-per-call and cost-per-minute metrics used in the Detailed Analysis page.</div>""", unsafe_allow_html=True)
+
+    cfg = _load_be()
+    if st.session_state.get("_be_saved"):
+        st.markdown('<div class="toast">✅ Break-even configuration saved</div>', unsafe_allow_html=True)
+        st.session_state["_be_saved"] = False
+
+    # Custom categories in session state
+    if "be_custom" not in st.session_state:
+        st.session_state["be_custom"] = cfg.get("custom_items", {})
+
+    # --- Add custom category UI (outside form) ---
+    with st.expander("➕ Add custom cost category"):
+        ac1, ac2 = st.columns(2)
+        sec_names = [s["section"] for s in BE_SECTIONS] + ["— New section —"]
+        with ac1: add_sec = st.selectbox("Section", sec_names, key="be_add_sec")
+        with ac2:
+            new_sec_name = ""
+            if add_sec == "— New section —":
+                new_sec_name = st.text_input("New section name", key="be_new_sec")
+            add_item = st.text_input("Cost category name", key="be_add_item")
+        if st.button("➕ Add", key="be_add_btn"):
+            target = new_sec_name.strip() if add_sec == "— New section —" else add_sec
+            if target and add_item.strip():
+                custom = st.session_state["be_custom"]
+                if target not in custom: custom[target] = {}
+                custom[target][add_item.strip()] = 0
+                st.rerun()
+
+    # --- Main cost form ---
+    with st.form("be_form"):
+        new_cfg = {"sections": {}, "custom_items": st.session_state.get("be_custom", {})}
+
+        grand_total = 0
+        support_subtotal = 0
+
+        # Iterate default sections + custom-only sections
+        all_sec_names = [s["section"] for s in BE_SECTIONS]
+        custom = st.session_state.get("be_custom", {})
+        for csk in custom:
+            if csk not in all_sec_names: all_sec_names.append(csk)
+
+        for sec_name in all_sec_names:
+            # Find default items
+            default_sec = next((s for s in BE_SECTIONS if s["section"] == sec_name), None)
+            default_items = default_sec["items"] if default_sec else []
+            custom_items = list(custom.get(sec_name, {}).keys())
+            all_items = default_items + [ci for ci in custom_items if ci not in default_items]
+
+            if not all_items: continue
+
+            icon = BE_SECTION_ICONS.get(sec_name, "📁")
+            st.markdown(f'<div class="sec-head">{icon} {sec_name}</div>', unsafe_allow_html=True)
+
+            sec_data = {}; sec_total = 0
+            saved_sec = cfg.get("sections", {}).get(sec_name, {})
+            # Layout: 2 columns of items
+            cols = st.columns(2)
+            for idx, item in enumerate(all_items):
+                saved_val = saved_sec.get(item, custom.get(sec_name, {}).get(item, 0))
+                with cols[idx % 2]:
+                    v = st.number_input(item, min_value=0, value=int(saved_val or 0),
+                                        step=500, key=f"be_{sec_name}_{item}", format="%d")
+                sec_data[item] = v; sec_total += v
+
+            st.markdown(f"**Sub-total: ${sec_total:,.0f}**")
+            new_cfg["sections"][sec_name] = sec_data
+            grand_total += sec_total
+            if sec_name == "Technical and Sales Support":
+                support_subtotal = sec_total
+
+        # --- Global inputs ---
+        st.markdown('<div class="sec-head">🔢 Program Parameters</div>', unsafe_allow_html=True)
+        pc1, pc2, pc3 = st.columns(3)
+        existing_partners = len(_load_partners())
+        with pc1:
+            num_p = st.number_input("Number of partners", min_value=1,
+                value=int(cfg.get("num_partners") or existing_partners or 60), step=1, key="be_num_partners")
+        with pc2:
+            sup_calls = st.number_input("# of support calls (annual)", min_value=0,
+                value=int(cfg.get("support_calls", 0)), step=100, key="be_sup_calls")
+        with pc3:
+            avg_min = st.number_input("Avg minutes per call", min_value=1,
+                value=int(cfg.get("avg_min_per_call", 20)), step=1, key="be_avg_min")
+
+        new_cfg["num_partners"] = num_p
+        new_cfg["support_calls"] = sup_calls
+        new_cfg["avg_min_per_call"] = avg_min
+
+        st.markdown("---")
+        _, bc = st.columns([3, 1])
+        with bc: be_sub = st.form_submit_button("💾 Save Configuration", use_container_width=True, type="primary")
+
+    if be_sub:
+        _save_be(new_cfg); cfg = new_cfg
+        st.session_state["_be_saved"] = True; st.rerun()
+
+    # --- Results dashboard ---
+    st.markdown("---")
+    st.markdown("### 📊 Program Cost Summary")
+
+    # Recalculate from cfg
+    gt = sum(sum(v for v in items.values()) for items in cfg.get("sections", {}).values())
+    np_ = cfg.get("num_partners", 1) or 1
+    be_point = gt / np_
+    sc_ = cfg.get("support_calls", 0) or 0
+    am_ = cfg.get("avg_min_per_call", 20) or 20
+    sup_cost = sum(cfg.get("sections", {}).get("Technical and Sales Support", {}).values())
+    cpc = sup_cost / sc_ if sc_ > 0 else 0
+    cpm = sup_cost / (sc_ * am_) if sc_ > 0 and am_ > 0 else 0
+
+    m1, m2, m3 = st.columns(3)
+    with m1: st.markdown(f'<div class="sum-card"><div class="sum-big">${gt:,.0f}</div><div class="sum-lbl">Total Program Costs</div></div>', unsafe_allow_html=True)
+    with m2: st.markdown(f'<div class="sum-card"><div class="sum-big">{np_}</div><div class="sum-lbl">Number of Partners</div></div>', unsafe_allow_html=True)
+    with m3: st.markdown(f'<div class="sum-card"><div class="sum-big" style="color:#49a34f">${be_point:,.2f}</div><div class="sum-lbl">Break-even per Partner</div></div>', unsafe_allow_html=True)
+
+    if sup_cost > 0:
+        st.markdown("#### 🛠️ Support Cost Metrics")
+        s1, s2, s3, s4 = st.columns(4)
+        with s1: st.metric("Support Costs", f"${sup_cost:,.0f}")
+        with s2: st.metric("# Support Calls", f"{sc_:,}")
+        with s3: st.metric("Cost per Call", f"${cpc:,.2f}")
+        with s4: st.metric("Cost per Minute", f"${cpm:,.4f}")
+
+    # Section breakdown table
+    st.markdown("#### Cost Breakdown by Section")
+    breakdown_rows = ""
+    cfg_sections = list(cfg.get("sections", {}).keys())
+    if not cfg_sections:
+        cfg_sections = [s["section"] for s in BE_SECTIONS]
+    for sec_name in cfg_sections:
+        sec_items = cfg.get("sections", {}).get(sec_name, {})
+        sec_t = sum(sec_items.values())
+        pct = (sec_t / gt * 100) if gt > 0 else 0
+        icon = BE_SECTION_ICONS.get(sec_name, "📁")
+        breakdown_rows += f'<tr><td style="text-align:left;padding-left:10px">{icon} {sec_name}</td><td>${sec_t:,.0f}</td><td>{pct:.1f}%</td></tr>'
+    if gt > 0:
+        breakdown_rows += f'<tr class="hm-total"><td style="text-align:left;padding-left:10px;font-weight:800">TOTAL</td><td style="font-weight:800">${gt:,.0f}</td><td style="font-weight:800">100%</td></tr>'
+    st.markdown(f'<table class="hm-tbl"><thead><tr><th style="text-align:left">Section</th><th>Cost</th><th>% of Total</th></tr></thead><tbody>{breakdown_rows}</tbody></table>', unsafe_allow_html=True)
@@ -0,0 +1,91 @@
+"""Client Intake — the client's company profile and partner tiers."""
+import json
+import streamlit as st
+
+from utils.paths import client_path as _client_path
+from utils.ui import brand as _brand
+from utils.countries import COUNTRIES
+
+
+def render(ctx: dict) -> None:
+    _tenant_tier = ctx["tenant_tier"]
+    _brand()
+    st.markdown("""<div class="info-box">
+    The <b>Partner Revenue Optimizer</b> is a structured process that will:
+    <ol><li>Right-size the margins you provide to your partners, freeing up significant cash flow and revenues; and</li>
+    <li>Lay the foundation for targeted partner marketing programs to drive more revenues.</li></ol>
+    <p>An experienced channel consultant from <b>The York Group</b> will guide you through the process.
+    Each metric is rated <b>1–5</b> (5 = best).</p></div>""",unsafe_allow_html=True)
+    if st.session_state.get("_ci_saved"):
+        st.markdown('<div class="toast">✅ Client information saved</div>',unsafe_allow_html=True); st.session_state["_ci_saved"]=False
+    ci=st.session_state.get("client_info",{})
+    with st.form("ci_form"):
+        st.markdown('<div class="sec-head">📇 Client Contact Information</div>',unsafe_allow_html=True)
+        c1,c2=st.columns(2)
+        with c1:
+            ci_name=st.text_input("Client name",value=ci.get("client_name",""),key="ci_name")
+            ci_url=st.text_input("URL",value=ci.get("url",""),key="ci_url")
+            saved_country=ci.get("country","")
+            ci_country=st.selectbox("Country",COUNTRIES,index=COUNTRIES.index(saved_country) if saved_country in COUNTRIES else 0,key="ci_country")
+            ci_phone=st.text_input("Primary phone",value=ci.get("phone",""),key="ci_phone")
+        with c2:
+            ci_pm=st.text_input("Client project manager",value=ci.get("project_manager",""),key="ci_pm")
+            ci_city=st.text_input("City",value=ci.get("city",""),key="ci_city")
+            ci_email=st.text_input("Primary contact email",value=ci.get("email",""),key="ci_email")
+            ci_logo_url=st.text_input("Company logo URL",value=ci.get("logo_url",""),key="ci_logo_url",placeholder="https://example.com/logo.png")
+
+        st.markdown('<div class="sec-head">🏢 Client Business Information</div>',unsafe_allow_html=True)
+        st.markdown("**Company size — Number of employees**")
+        sz_opts=["<100","100-200","200-500","500-1,000","1,000-5,000",">5,000"]; saved_sz=ci.get("company_size",[]); sz_cols=st.columns(len(sz_opts)); sz_sel=[]
+        for i,o in enumerate(sz_opts):
+            with sz_cols[i]:
+                if st.checkbox(o,value=o in saved_sz,key=f"ci_sz_{i}"): sz_sel.append(o)
+        st.markdown("**Verticals**")
+        v_opts=["Manufacturing","Automotive","Health care","Financial services","Retail","Government","Education","Media and entertainment","Professional services","Life sciences, pharmaceuticals","High-tech, electronics, communications, telecom","None - horizontal solution"]; saved_v=ci.get("verticals",[]); vc=st.columns(3); v_sel=[]
+        for i,o in enumerate(v_opts):
+            with vc[i%3]:
+                if st.checkbox(o,value=o in saved_v,key=f"ci_v_{i}"): v_sel.append(o)
+        other_v=st.text_input("Other verticals",value=ci.get("other_verticals",""),key="ci_ov")
+        st.markdown("**Solution delivery**")
+        d_opts=["On-premise","SaaS/PaaS","IaaS/VM","Device (HW+SW)"]; saved_d=ci.get("solution_delivery",[]); dc=st.columns(len(d_opts)); d_sel=[]
+        for i,o in enumerate(d_opts):
+            with dc[i]:
+                if st.checkbox(o,value=o in saved_d,key=f"ci_d_{i}"): d_sel.append(o)
+
+        st.markdown('<div class="sec-head">🎯 Target Customers</div>',unsafe_allow_html=True)
+        st.markdown("**Target customer size — Number of employees**")
+        tc_opts=["<100","100-200","200-500","500-1,000","1,000-5,000",">5,000"]; saved_tc=ci.get("target_company_size",[]); tc_cols=st.columns(len(tc_opts)); tc_sel=[]
+        for i,o in enumerate(tc_opts):
+            with tc_cols[i]:
+                if st.checkbox(o,value=o in saved_tc,key=f"ci_tc_{i}"): tc_sel.append(o)
+        st.markdown("**Average first-year transaction value**")
+        t_opts=["Under $1,000","$1,000–$10,000","$10,000–$50,000","$50,000–$100,000","More than $100,000"]; saved_t=ci.get("avg_transaction_value","")
+        txn=st.selectbox("Select range",t_opts,index=t_opts.index(saved_t) if saved_t in t_opts else 0,key="ci_txn")
+
+        st.markdown('<div class="sec-head">📊 Channel Information</div>',unsafe_allow_html=True)
+        st.markdown("**Services as % of license/subscription**")
+        s_opts=["No services","<20%","20–50%","50–200%",">200%"]; saved_s=ci.get("services_pct","")
+        svc=st.selectbox("Select range",s_opts,index=s_opts.index(saved_s) if saved_s in s_opts else 0,key="ci_svc")
+        svc_c=st.text_input("Comments",value=ci.get("services_comments",""),key="ci_svc_c")
+        st.markdown("**How many resellers/channel partners do you have?**")
+        p_opts=["<100","100-200","200-500","500-1,000","1,000-5,000",">5,000"]; saved_p=ci.get("partner_count","")
+        pc=st.selectbox("Select range",p_opts,index=p_opts.index(saved_p) if saved_p in p_opts else 0,key="ci_pc")
+        st.markdown("**% revenues from indirect channels**")
+        i_opts=["<10%","10-30%","30-50%",">50%"]; saved_i=ci.get("indirect_revenue_pct","")
+        ind=st.selectbox("Select range",i_opts,index=i_opts.index(saved_i) if saved_i in i_opts else 0,key="ci_ind")
+        st.markdown("**Discounts to partners** *(Click all that apply)*")
+        disc_opts=["<15%","15-30%","30-50%",">60%","Other"]; saved_disc=ci.get("discounts",[]); disc_c=st.columns(len(disc_opts)); disc_sel=[]
+        for i,o in enumerate(disc_opts):
+            with disc_c[i]:
+                if st.checkbox(o,value=o in saved_disc,key=f"ci_disc_{i}"): disc_sel.append(o)
+        st.markdown("**Partner designations**")
+        desig=st.text_input("Comma-separated, e.g. gold, silver, bronze",value=ci.get("partner_designations",""),key="ci_desig")
+        st.markdown("---")
+        _,cr=st.columns([3,1])
+        _ci_next_label = "Next →  Import Data" if _tenant_tier == "demo" else "Next →  Step 1"
+        with cr: ci_sub=st.form_submit_button(_ci_next_label,use_container_width=True,type="primary")
+    if ci_sub:
+        st.session_state["client_info"]={"client_name":ci_name,"project_manager":ci_pm,"url":ci_url,"city":ci_city,"country":ci_country,"email":ci_email,"phone":ci_phone,"logo_url":ci_logo_url,"company_size":sz_sel,"verticals":v_sel,"other_verticals":other_v,"solution_delivery":d_sel,"target_company_size":tc_sel,"avg_transaction_value":txn,"services_pct":svc,"services_comments":svc_c,"partner_count":pc,"indirect_revenue_pct":ind,"discounts":disc_sel,"partner_designations":desig}
+        _client_path().write_text(json.dumps(st.session_state["client_info"],indent=2))
+        _ci_next_page = "Import Data" if _tenant_tier == "demo" else "Step 1 — Scoring Criteria"
+        st.session_state["_ci_saved"]=True; st.session_state["current_page"]=_ci_next_page; st.rerun()
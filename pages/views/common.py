@@ -0,0 +1,13 @@
+"""Helpers shared by more than one page module."""
+from utils.data import append_partner as _append_partner_raw, upsert_partner as _upsert_partner_raw
+from utils.scoring import enabled as _enabled
+
+
+def append_partner(row_dict, raw_dict):
+    """Delegate to data module, passing currently enabled metrics."""
+    _append_partner_raw(row_dict, raw_dict, _enabled())
+
+
+def upsert_partner(row_dict, raw_dict):
+    """Delegate to data module, passing currently enabled metrics."""
+    _upsert_partner_raw(row_dict, raw_dict, _enabled())
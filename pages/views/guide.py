@@ -0,0 +1,55 @@
+"""User Guide / Quick-Start Guide."""
+import streamlit as st
+
+from utils.ui import brand as _brand
+
+
+def render(ctx: dict) -> None:
+    page = ctx["page"]
+    _brand()
+    from pathlib import Path
+    if page == "Quick-Start Guide":
+        st.markdown("## Quick-Start Guide")
+        st.markdown("""<div class="info-box">
+        Welcome to your <b>ChannelPRO™</b> demo environment. This guide covers the key steps
+        to explore the platform during your trial period.</div>""", unsafe_allow_html=True)
+        st.markdown("""
+### Recommended Workflow
+
+```
+Client Intake → Import Data → Partner List → Break-even Analysis → Revenue Recovery
+```
+
+### 1. Client Intake
+Capture your company profile — name, industry verticals, partner tiers, and target customer size.
+This personalizes the scoring experience for your organization.
+
+### 2. Import Data
+Upload a CSV of partner data from your CRM or PRM system. ChannelPRO™ auto-maps columns
+and scores partners against pre-configured benchmarks. Scoring criteria are pre-configured
+with sensible defaults — just import your data and review the results.
+
+### 3. Partner List
+View all imported partners with their total scores and grades at a glance.
+
+### 4. Break-even Analysis
+Enter your program costs to calculate the break-even cost per partner,
+then upload per-partner data for granular cost-vs-revenue analysis.
+
+### 5. Revenue Recovery
+Identify non-performing partners and calculate how much margin you could
+recapture by adjusting their discount rates.
+
+---
+
+*Scoring criteria customization, partner classification, and scorecard editing are available
+in full ChannelPRO™ engagements. Contact your York Group consultant to unlock.*
+""")
+        if st.button("📥 Go to Import Data", type="primary"):
+            st.session_state["current_page"] = "Import Data"; st.rerun()
+    else:
+        _guide_path = Path(__file__).resolve().parents[2] / "USER_GUIDE.md"
+        if _guide_path.exists():
+            st.markdown(_guide_path.read_text(), unsafe_allow_html=False)
+        else:
+            st.warning("User guide file not found.")
@@ -0,0 +1,280 @@
+"""Import Data: CSV upload, column mapping and resumable import jobs."""
+import json
+import streamlit as st
+import pandas as pd
+
+from utils.paths import (
+    save_path as _save_path,
+    raw_path as _raw_path,
+)
+from utils.data import (
+    load_partners as _load_partners,
+    load_raw as _load_raw,
+    max_partners as _max_partners,
+    partner_count as _partner_count,
+)
+from utils.scoring import (
+    enabled as _enabled,
+    ensure_criteria_complete as _ensure_criteria_complete,
+    recalculate_benchmarks as _recalculate_benchmarks,
+)
+from utils.importer import (
+    DETAIL_FIELDS as IMPORT_DETAIL_FIELDS,
+    auto_partner_column as _auto_partner_column,
+    auto_detail_mapping as _auto_detail_mapping,
+    auto_metric_mapping as _auto_metric_mapping,
+    create_import_job as _create_import_job,
+    run_import_job as _run_import_job,
+    unfinished_import_jobs as _unfinished_import_jobs,
+    discard_import_job as _discard_import_job,
+)
+from utils.ui import brand as _brand
+
+
+def render(ctx: dict) -> None:
+    _tenant_tier = ctx["tenant_tier"]
+    _brand(); st.markdown("## Import Partner Data from CSV")
+    if not _save_path().exists():
+        if _tenant_tier == "demo":
+            st.warning("⚠️ Import data first.")
+        else:
+            st.warning("⚠️ Complete **Step 1 — Scoring Criteria** first so metrics are available for mapping.")
+        st.stop()
+    st.session_state["criteria"] = json.loads(_save_path().read_text())
+    _ensure_criteria_complete()
+    cr = st.session_state["criteria"]; em = _enabled()
+
+    st.markdown("""<div class="info-box">
+    Upload a CSV exported from your CRM, ERP, or PRM system. Map its columns to ChannelPRO™ scoring metrics
+    and import partners in bulk. Existing partners (matched by name) will be <b>updated</b>; new names will
+    be <b>created</b>. Unmapped metrics are left blank for manual scoring later.</div>""", unsafe_allow_html=True)
+
+    # Show import results from previous run
+    if st.session_state.get("_import_done"):
+        res = st.session_state.pop("_import_done")
+        st.markdown(f'<div class="toast">✅ Import complete — {res["created"]} created, {res["updated"]} updated, {res["errors"]} errors</div>', unsafe_allow_html=True)
+
+    # Partner-limit banner
+    _imp_limit = _max_partners()
+    if _imp_limit:
+        _imp_count = _partner_count()
+        _imp_remaining = max(0, _imp_limit - _imp_count)
+        if _imp_remaining == 0:
+            st.warning(
+                f"⚠️ You've reached your partner limit of **{_imp_limit}**. "
+                "Importing will only update existing partners — no new partners can be added. "
+                "Contact your York Group consultant to upgrade your plan."
+            )
+        else:
+            st.info(f"📊 Partner usage: **{_imp_count}** / **{_imp_limit}** — you can import up to **{_imp_remaining}** new partner(s).")
+
+    def _run_import(job_id):
+        """Run/resume a checkpointed import job and render its results."""
+        progress = st.progress(0, text="Importing...")
+        try:
+            res = _run_import_job(job_id,
+                progress=lambda done, total: progress.progress(min(done / total, 1.0), text=f"Processing row {done}/{total}..."))
+        except RuntimeError as e:
+            progress.empty(); st.warning(f"⚠️ {e}"); return
+        created = res["created"]; updated = res["updated"]; error_rows = res["errors"]
+        skipped_limit = res["skipped_limit"]; max_p = res["max_partners"]
+        progress.empty()
+
+        # Show results
+        st.session_state["_import_done"] = {"created": created, "updated": updated, "errors": len(error_rows)}
+
+        st.markdown("### ✅ Import Results")
+        r1, r2, r3 = st.columns(3)
+        with r1: st.metric("Created", created)
+        with r2: st.metric("Updated", updated)
+        with r3: st.metric("Errors", len(error_rows))
+
+        if skipped_limit > 0:
+            st.warning(f"⚠️ **{skipped_limit}** partner(s) skipped — partner limit of **{max_p}** reached. Contact your admin to increase the limit.")
+
+        if error_rows:
+            st.markdown("#### ⚠️ Errors")
+            err_df = pd.DataFrame(error_rows)
+            st.dataframe(err_df, use_container_width=True, hide_index=True)
+            st.download_button("⬇️ Download Errors CSV", err_df.to_csv(index=False),
+                "import_errors.csv", "text/csv")
+
+        if created > 0 or updated > 0:
+            st.success(f"Successfully imported **{created + updated}** partners. View them on the **Partner List** page or in **Step 3**.")
+
+            # Show imported data with actual values (not just scores)
+            st.markdown("#### 📊 Imported Data — Actual Values")
+            st.caption("Shows the raw values imported from your CSV alongside the computed scores (1–5).")
+            imported_partners = _load_partners()
+            raw_all = _load_raw()
+            preview_rows = []
+            for p in imported_partners:
+                pn = p.get("partner_name","")
+                raw_p = next((r for r in raw_all if r.get("partner_name","") == pn), {})
+                row = {"Partner": pn}
+                for m in em:
+                    raw_key = f"raw_{m['key']}"
+                    raw_val = raw_p.get(raw_key, "")
+                    try: score_val = int(p.get(m["key"],"") or 0)
+                    except: score_val = 0
+                    if raw_val:
+                        row[m["name"]] = f"{raw_val}  →  {score_val}/5" if score_val else str(raw_val)
+                    else:
+                        row[m["name"]] = f"{score_val}/5" if score_val else "—"
+                try: pct = float(p.get("percentage",0) or 0)
+                except: pct = 0
+                row["Total"] = p.get("total_score", 0)
+                row["Pct"] = f"{pct:.1f}%"
+                preview_rows.append(row)
+            if preview_rows:
+                preview_df = pd.DataFrame(preview_rows)
+                st.dataframe(preview_df, use_container_width=True, hide_index=True)
+
+    # ── Interrupted imports (closed tab, server restart) resume from their last checkpoint ──
+    for _job in _unfinished_import_jobs():
+        _done_rows = _job["offset"]; _tot_rows = _job["rows"]
+        st.markdown(f'<div style="background:#FFF3CD;border-left:4px solid #FFA500;padding:12px 16px;border-radius:6px;margin:8px 0;font-size:.92rem;">'
+                    f'⏸️ <b>Unfinished import:</b> {_job["filename"]} — started {_job["started"]}, '
+                    f'<b>{_done_rows}/{_tot_rows}</b> rows applied ({_job["created"]} created, {_job["updated"]} updated).</div>', unsafe_allow_html=True)
+        if _job.get("active"):
+            st.caption("This import is still running in another session."); continue
+        jc1, jc2, _ = st.columns([1, 1, 3])
+        with jc1: _resume = st.button("▶️ Resume import", key=f"imp_resume_{_job['id']}", type="primary")
+        with jc2: _discard = st.button("🗑️ Discard", key=f"imp_discard_{_job['id']}")
+        if _discard:
+            _discard_import_job(_job["id"]); st.rerun()
+        if _resume:
+            _run_import(_job["id"]); st.stop()
+
+    uploaded = st.file_uploader("📁 Upload CSV file", type=["csv"], key="import_csv")
+    if uploaded is None:
+        st.info("Upload a CSV to get started. Required column: **Partner** (name or ID)."); st.stop()
+
+    # Parse CSV
+    try:
+        df = pd.read_csv(uploaded)
+    except Exception as e:
+        st.error(f"Could not read CSV: {e}"); st.stop()
+    if df.empty:
+        st.error("The uploaded CSV is empty."); st.stop()
+
+    csv_cols = list(df.columns)
+    st.markdown("### 📄 CSV Preview (first 5 rows)")
+    st.dataframe(df.head(5), use_container_width=True, hide_index=True)
+    st.caption(f"{len(df)} rows × {len(csv_cols)} columns")
+
+    # ── Mapping interface ──
+    st.markdown("---")
+    st.markdown("### 🔗 Column Mapping")
+    none_opt = ["— None —"]
+
+    # ── Required: Partner name column ──
+    st.markdown('<div class="sec-head">🏢 Required</div>', unsafe_allow_html=True)
+    auto_pn = _auto_partner_column(csv_cols)
+    partner_col = st.selectbox("Partner name column **(required)**",
+        csv_cols, index=csv_cols.index(auto_pn) if auto_pn else 0, key="imp_partner_col")
+
+    # ── Optional: partner detail fields ──
+    st.markdown('<div class="sec-head">📇 Partner Details (optional)</div>', unsafe_allow_html=True)
+    detail_fields = IMPORT_DETAIL_FIELDS
+    auto_details = _auto_detail_mapping(csv_cols)
+    dc1, dc2, dc3 = st.columns(3)
+    detail_mapping = {}
+    for i, (label, field, hints) in enumerate(detail_fields):
+        auto = auto_details.get(field)
+        col_widget = [dc1, dc2, dc3][i % 3]
+        with col_widget:
+            sel = st.selectbox(label, none_opt + csv_cols,
+                index=(csv_cols.index(auto) + 1) if auto and auto in csv_cols else 0,
+                key=f"imp_det_{field}")
+        if sel != "— None —":
+            detail_mapping[field] = sel
+
+    # ── Metric mapping ──
+    st.markdown('<div class="sec-head">📊 Scoring Metrics</div>', unsafe_allow_html=True)
+    st.caption("Map CSV columns to each metric. For quantitative metrics, the raw value from CSV will be auto-scored using your Step 1 ranges.")
+    metric_mapping = {}
+    auto_metrics = _auto_metric_mapping(csv_cols, em)
+    mc1, mc2 = st.columns(2)
+    for idx, m in enumerate(em):
+        auto = auto_metrics.get(m["key"])
+        col_widget = mc1 if idx % 2 == 0 else mc2
+        with col_widget:
+            mtype = "📏" if m["type"] == "quantitative" else "📝"
+            sel = st.selectbox(f'{mtype} {m["name"]}', none_opt + csv_cols,
+                index=(csv_cols.index(auto) + 1) if auto and auto in csv_cols else 0,
+                key=f"imp_m_{m['key']}")
+            if sel == "— None —":
+                st.markdown('<div style="height:3px;background:#DC2626;border-radius:2px;margin:-8px 0 6px;"></div>', unsafe_allow_html=True)
+        if sel != "— None —":
+            metric_mapping[m["key"]] = sel
+
+    # Summary — highlight unmapped fields
+    st.markdown("---")
+    mapped_count = len(metric_mapping)
+    unmapped_metrics = [m["name"] for m in em if m["key"] not in metric_mapping]
+    unmapped_details = [label for (label, field, _) in detail_fields if field not in detail_mapping]
+    st.markdown(f"**Mapped:** {mapped_count}/{len(em)} metrics  •  Partner column: **{partner_col}**")
+    if unmapped_metrics:
+        um_list = ", ".join(f"<b>{n}</b>" for n in unmapped_metrics)
+        st.markdown(f'<div style="background:#FFF3CD;border-left:4px solid #FFA500;padding:12px 16px;border-radius:6px;margin:8px 0;font-size:.92rem;">'
+                    f'⚠️ <b>Unmapped metrics ({len(unmapped_metrics)}):</b> {um_list}<br>'
+                    f'<span style="color:#6a5a00;font-size:.84rem;">These will be left blank — you can score them manually later.</span></div>', unsafe_allow_html=True)
+    if unmapped_details:
+        ud_list = ", ".join(f"<b>{n}</b>" for n in unmapped_details)
+        st.markdown(f'<div style="background:#E8F0FE;border-left:4px solid #4285F4;padding:12px 16px;border-radius:6px;margin:8px 0;font-size:.92rem;">'
+                    f'ℹ️ <b>Unmapped detail fields ({len(unmapped_details)}):</b> {ud_list}</div>', unsafe_allow_html=True)
+    if mapped_count == 0:
+        st.markdown('<div style="background:#FDEDED;border-left:4px solid #D93025;padding:12px 16px;border-radius:6px;margin:8px 0;font-size:.92rem;">'
+                    '🔴 <b>No metrics mapped</b> — partners will be created with blank scores for manual entry.</div>', unsafe_allow_html=True)
+    elif not unmapped_metrics and not unmapped_details:
+        st.markdown('<div style="background:#E6F4EA;border-left:4px solid #34A853;padding:12px 16px;border-radius:6px;margin:8px 0;font-size:.92rem;">'
+                    '✅ <b>All fields mapped!</b> Ready to import.</div>', unsafe_allow_html=True)
+
+    # ── Process import ──
+    st.markdown("---")
+    _, _, btn_col = st.columns([2, 2, 1])
+    with btn_col:
+        do_import = st.button("📥  Import Partners", use_container_width=True, type="primary")
+
+    if do_import:
+        _run_import(_create_import_job(uploaded.getvalue(), uploaded.name,
+            partner_col, detail_mapping, metric_mapping, cr))
+
+    # ── Recalculate Benchmarks ──
+    if _raw_path().exists():
+        st.markdown("---")
+        st.markdown("### 📐 Recalculate Scoring Benchmarks")
+        st.markdown("""<div class="info-box">
+        Analyze the distribution of your imported partner data and automatically set
+        <b>quintile-based scoring ranges</b> (1–5) for all quantitative metrics.
+        This replaces the manual thresholds in Step 1 with data-driven boundaries
+        where each score bucket contains roughly 20% of your partners.<br><br>
+        <b>Qualitative</b> metrics (descriptors) are not affected.
+        </div>""", unsafe_allow_html=True)
+
+        raw_all = _load_raw()
+        st.caption(f"Partner data available: **{len(raw_all)}** partners")
+
+        if st.session_state.get("_bench_result"):
+            res = st.session_state.pop("_bench_result")
+            if res["updated"]:
+                st.markdown(f'<div class="toast">✅ Benchmarks recalculated — **{len(res["updated"])}** metric(s) updated, all partners re-scored</div>', unsafe_allow_html=True)
+                with st.expander("Updated metrics", expanded=False):
+                    for name in res["updated"]:
+                        st.markdown(f"- {name}")
+            else:
+                st.info("No quantitative metrics were changed (not enough data variation or no mapped metrics).")
+            if res["skipped"]:
+                with st.expander(f"Unchanged metrics ({len(res['skipped'])})", expanded=False):
+                    for name in res["skipped"]:
+                        st.markdown(f"- {name}")
+
+        _, _, bench_col = st.columns([2, 2, 1])
+        with bench_col:
+            do_bench = st.button("📐  Recalculate Benchmarks", use_container_width=True, type="secondary")
+        if do_bench:
+            with st.spinner("Analyzing partner data distributions..."):
+                result = _recalculate_benchmarks()
+            st.session_state["_bench_result"] = result
+            st.rerun()
@@ -0,0 +1,284 @@
+"""Partner List: browse, add, edit and delete partners."""
+import json, re
+import streamlit as st
+
+from utils.paths import save_path as _save_path
+from utils.data import (
+    load_partners as _load_partners,
+    load_raw as _load_raw,
+    delete_partner as _delete_partner,
+    partner_exists as _partner_exists,
+    max_partners as _max_partners,
+    partner_count as _partner_count,
+    assessment_frame as _assessment_frame,
+)
+from utils.scoring import (
+    CATEGORIES,
+    SC,
+    calc_score,
+    enabled as _enabled,
+    tiers as _tiers,
+    synthetic_raw_for_score as _synthetic_raw_for_score,
+    ensure_criteria_complete as _ensure_criteria_complete,
+)
+from utils.ui import (
+    brand as _brand,
+    show_premium_placeholder as _show_premium_placeholder,
+)
+from utils.countries import COUNTRIES
+from pages.views.common import (
+    append_partner as _append_partner,
+    upsert_partner as _upsert_partner,
+)
+
+
+def render(ctx: dict) -> None:
+    is_admin = ctx["is_admin"]; _tenant_tier = ctx["tenant_tier"]
+    _brand(); st.markdown("## Partner List")
+    if not _save_path().exists():
+        if _tenant_tier == "demo":
+            st.warning("⚠️ Import data first.")
+            if st.button("📥 Go to Import Data", type="primary"):
+                st.session_state["current_page"] = "Import Data"; st.rerun()
+        else:
+            st.warning("⚠️ Complete **Step 1 — Scoring Criteria** first.")
+        st.stop()
+    st.session_state["criteria"] = json.loads(_save_path().read_text())
+    _ensure_criteria_complete()
+    cr = st.session_state["criteria"]; em = _enabled()
+    partners = _load_partners()
+
+    # ── Edit mode (single partner) ──
+    edit_pn = st.session_state.get("_pl_edit")
+    if edit_pn and _tenant_tier == "demo":
+        st.session_state.pop("_pl_edit", None)
+        _show_premium_placeholder("Edit Scorecard")
+    if edit_pn:
+        raw_all = _load_raw()
+        raw_p = next((r for r in raw_all if r.get("partner_name") == edit_pn), None)
+        csv_p = next((p for p in partners if p.get("partner_name") == edit_pn), None)
+        if not csv_p:
+            st.error(f"Partner '{edit_pn}' not found."); st.session_state.pop("_pl_edit", None); st.rerun()
+
+        if st.button("← Back to Partner List", key="pl_back"):
+            st.session_state.pop("_pl_edit", None); st.rerun()
+
+        st.markdown(f"### ✏️ Edit Scorecard — {edit_pn}")
+
+        # Show save confirmation
+        if st.session_state.get("_pl_edit_saved"):
+            st.markdown('<div class="toast">✅ Partner scorecard updated</div>', unsafe_allow_html=True)
+            st.session_state["_pl_edit_saved"] = False
+
+        with st.form("pl_edit_form"):
+            # Partner details
+            st.markdown('<div class="sec-head">📇 Partner Details</div>', unsafe_allow_html=True)
+            d1, d2, d3 = st.columns(3)
+            with d1:
+                ed_name = st.text_input("Partner name", value=edit_pn, key="ple_name", disabled=True)
+                ed_year = st.text_input("Year became partner", value=csv_p.get("partner_year",""), key="ple_year")
+            with d2:
+                tiers = _tiers(); t_opts = [""] + tiers if tiers else [""]
+                cur_tier = csv_p.get("partner_tier","")
+                ed_tier = st.selectbox("Tier", t_opts, index=t_opts.index(cur_tier) if cur_tier in t_opts else 0, key="ple_tier")
+                ed_disc = st.text_input("Partner Discount", value=csv_p.get("partner_discount",""), key="ple_disc")
+                ed_city = st.text_input("City", value=csv_p.get("partner_city",""), key="ple_city")
+            with d3:
+                cur_country = csv_p.get("partner_country","")
+                ed_country = st.selectbox("Country", COUNTRIES, index=COUNTRIES.index(cur_country) if cur_country in COUNTRIES else 0, key="ple_country")
+                ed_pam = st.text_input("PAM name", value=csv_p.get("pam_name",""), key="ple_pam")
+            ed_pam_email = st.text_input("PAM email", value=csv_p.get("pam_email",""), key="ple_pam_email")
+
+            # Metric scores — show actual values (raw) with computed scores
+            st.markdown('<div class="sec-head">📊 Metric Scores — enter the actual value; the score (1–5) is computed automatically</div>', unsafe_allow_html=True)
+            edit_raw_vals = {}
+            for cat in CATEGORIES:
+                cat_metrics = [m for m in em if m["key"] in cat["keys"]]
+                if not cat_metrics: continue
+                st.markdown(f"**{cat['icon']} {cat['label']}**")
+                for m in cat_metrics:
+                    mk = m["key"]; mc = cr.get(mk, {})
+                    if not mc: continue
+                    iq = m["type"] == "quantitative"
+                    # Get the raw value from raw JSON (the actual imported value)
+                    raw_val = raw_p.get(f"raw_{mk}", "") if raw_p else ""
+                    # Fallback: if no raw value stored, try to reverse from score
+                    if not raw_val and csv_p:
+                        try:
+                            cur_score = int(csv_p.get(mk, 0) or 0)
+                            if cur_score and 1 <= cur_score <= 5:
+                                raw_val = str(_synthetic_raw_for_score(mk, cur_score, cr) or "")
+                        except: pass
+
+                    if iq:
+                        u = mc.get("unit", "") or ""
+                        hints = []
+                        for s in ("1","2","3","4","5"):
+                            r = mc["ranges"][s]; lo, hi = r["min"], r["max"]
+                            if lo and hi: hints.append(f"**{s}**: {lo}–{hi}")
+                            elif lo and not hi: hints.append(f"**{s}**: ≥{lo}")
+                            elif not lo and hi: hints.append(f"**{s}**: ≤{hi}")
+                        ic, sc_c = st.columns([4, 1])
+                        with ic:
+                            pv = st.text_input(f"{m['name']} ({u})" if u else m["name"],
+                                value=str(raw_val) if raw_val else "",
+                                key=f"ple_v_{mk}",
+                                help=(f"{m['explanation']}  •  Ranges: {', '.join(hints)}" if hints else m["explanation"]) if is_admin else m["explanation"])
+                        scr = calc_score(mk, pv, cr) if pv else None
+                        with sc_c:
+                            if scr:
+                                st.markdown(f'<div style="margin-top:28px;text-align:center;padding:6px 0;border-radius:6px;font-weight:800;color:#fff;background:{SC.get(scr,"#ccc")}">{scr}/5</div>', unsafe_allow_html=True)
+                            else:
+                                st.markdown('<div style="margin-top:28px;text-align:center;padding:6px 0;border-radius:6px;font-weight:800;color:#888;background:#eee">—</div>', unsafe_allow_html=True)
+                        edit_raw_vals[mk] = pv
+                    else:
+                        opts = ["— Select —"] + [f"({s}) {mc['descriptors'][s]}" for s in ("1","2","3","4","5")]
+                        # Pre-select matching descriptor
+                        sel_idx = 0
+                        if raw_val:
+                            for oi, o in enumerate(opts):
+                                if oi == 0: continue
+                                desc = re.sub(r"^\(\d\)\s*", "", o)
+                                if desc == raw_val:
+                                    sel_idx = oi; break
+                            else:
+                                for oi, o in enumerate(opts):
+                                    if oi > 0 and raw_val in o: sel_idx = oi; break
+                        ic, sc_c = st.columns([4, 1])
+                        with ic:
+                            pv = st.selectbox(m["name"], opts, index=sel_idx,
+                                key=f"ple_v_{mk}", help=m["explanation"])
+                        if pv and pv != "— Select —":
+                            raw_d = re.sub(r"^\(\d\)\s*", "", pv)
+                            scr = calc_score(mk, raw_d, cr)
+                        else:
+                            raw_d = None; scr = None
+                        with sc_c:
+                            if scr:
+                                st.markdown(f'<div style="margin-top:28px;text-align:center;padding:6px 0;border-radius:6px;font-weight:800;color:#fff;background:{SC.get(scr,"#ccc")}">{scr}/5</div>', unsafe_allow_html=True)
+                            else:
+                                st.markdown('<div style="margin-top:28px;text-align:center;padding:6px 0;border-radius:6px;font-weight:800;color:#888;background:#eee">—</div>', unsafe_allow_html=True)
+                        edit_raw_vals[mk] = raw_d
+
+            st.markdown("---")
+            _, save_col = st.columns([3, 1])
+            with save_col:
+                edit_sub = st.form_submit_button("💾  Save Changes", use_container_width=True, type="primary")
+
+        if edit_sub:
+            # Build updated raw dict and row dict from actual values
+            new_raw = {"partner_name": edit_pn, "partner_year": ed_year, "partner_tier": ed_tier,
+                       "partner_discount": ed_disc,
+                       "partner_city": ed_city, "partner_country": ed_country,
+                       "pam_name": ed_pam, "pam_email": ed_pam_email}
+            new_row = dict(new_raw)  # start with same detail fields
+            si = {}
+            for m in em:
+                mk = m["key"]
+                raw_val = st.session_state.get(f"ple_v_{mk}", "")
+                # Handle qualitative selectbox values
+                if isinstance(raw_val, str) and raw_val.startswith("(") and m["type"] == "qualitative":
+                    raw_val = re.sub(r"^\(\d\)\s*", "", raw_val)
+                if raw_val and raw_val != "— Select —":
+                    new_raw[f"raw_{mk}"] = raw_val
+                    scr = calc_score(mk, raw_val, cr)
+                    if scr and 1 <= scr <= 5:
+                        new_row[mk] = scr; si[mk] = scr
+                    else:
+                        new_row[mk] = ""
+                else:
+                    new_raw[f"raw_{mk}"] = None
+                    new_row[mk] = ""
+            total = sum(si.values()); sn = len(si); mp = sn * 5
+            new_row["total_score"] = total; new_row["max_possible"] = mp
+            new_row["percentage"] = round(total / mp * 100, 1) if mp else 0
+            _upsert_partner(new_row, new_raw)
+            st.session_state["_pl_edit_saved"] = True; st.rerun()
+
+    else:
+        # ── Partner table view ──
+        if st.session_state.get("_pl_added"):
+            st.markdown('<div class="toast">✅ New partner created</div>', unsafe_allow_html=True)
+            st.session_state["_pl_added"] = False
+
+        if not partners:
+            st.info("No partners yet. Use **Import Data** to bulk-import or add one manually below.")
+        else:
+            pl_df = _assessment_frame(_enabled())[["Partner", "Tier", "PAM", "City", "Total", "Pct", "Grade"]]
+            st.dataframe(pl_df.sort_values("Total", ascending=False, kind="stable"), use_container_width=True, hide_index=True,
+                column_config={
+                    "Partner": st.column_config.TextColumn(width="large"),
+                    "Total": st.column_config.NumberColumn("Total Score", format="%d"),
+                    "Pct": st.column_config.NumberColumn("Percentage", format="%.1f%%"),
+                })
+
+            # Edit / Delete controls
+            st.markdown("---")
+            st.markdown("### ✏️ Edit or Delete a Partner")
+            partner_names = sorted([p.get("partner_name","") for p in partners])
+            sel_partner = st.selectbox("Select partner", partner_names, key="pl_sel_partner")
+            ec1, ec2 = st.columns(2)
+            with ec1:
+                if _tenant_tier == "demo":
+                    st.button("✏️  Edit Scorecard", use_container_width=True, type="primary", key="pl_edit_btn", disabled=True,
+                              help="Editing is reserved for full ChannelPRO™ engagements.")
+                elif st.button("✏️  Edit Scorecard", use_container_width=True, type="primary", key="pl_edit_btn"):
+                    st.session_state["_pl_edit"] = sel_partner; st.rerun()
+            with ec2:
+                if st.button("🗑️  Delete Partner", use_container_width=True, key="pl_del_btn"):
+                    _delete_partner(sel_partner); st.rerun()
+
+        # ── Manual add ──
+        st.markdown("---")
+        _at_limit = _max_partners() and _partner_count() >= _max_partners()
+        if _at_limit:
+            st.markdown("### ➕ Add New Partner")
+            st.warning(
+                f"⚠️ You've reached your partner limit of **{_max_partners()}**. "
+                "To add more partners, contact your York Group consultant to upgrade your plan."
+            )
+        else:
+            st.markdown("### ➕ Add New Partner")
+            with st.form("pl_add_form"):
+                a1, a2, a3 = st.columns(3)
+                with a1:
+                    new_name = st.text_input("Partner name *", key="pla_name", placeholder="e.g. Acme Corp")
+                with a2:
+                    new_year = st.text_input("Year became partner", key="pla_year", placeholder="e.g. 2022")
+                with a3:
+                    tiers = _tiers(); t_opts = ["Please choose..."] + tiers if tiers else ["Please choose..."]
+                    new_tier = st.selectbox("Tier", t_opts, key="pla_tier")
+                a4, a5, a6 = st.columns(3)
+                with a4: new_disc = st.text_input("Partner Discount", key="pla_disc", placeholder="e.g. 20%")
+                with a5: new_city = st.text_input("City", key="pla_city")
+                with a6:
+                    new_country = st.selectbox("Country", COUNTRIES, key="pla_country")
+                a7, a8 = st.columns(2)
+                with a7: new_pam = st.text_input("PAM name", key="pla_pam")
+
+                _, add_col = st.columns([3, 1])
+                with add_col:
+                    add_sub = st.form_submit_button("➕  Add Partner", use_container_width=True, type="primary")
+
+            if add_sub:
+                if not new_name or not new_name.strip():
+                    st.error("Partner name is required.")
+                elif _partner_exists(new_name):
+                    st.error(f"A partner named **{new_name}** already exists.")
+                elif _max_partners() and _partner_count() >= _max_partners():
+                    st.error(f"Partner limit reached (**{_max_partners()}**). Contact your admin to increase the limit.")
+                else:
+                    row = {"partner_name": new_name.strip(), "partner_year": new_year,
+                           "partner_tier": new_tier if new_tier != "Please choose..." else "",
+                           "partner_discount": new_disc,
+                           "partner_city": new_city, "partner_country": new_country,
+                           "pam_name": new_pam, "pam_email": "",
+                           "total_score": 0, "max_possible": 0, "percentage": 0}
+                    for m in em: row[m["key"]] = ""
+                    raw = {"partner_name": new_name.strip(), "partner_year": new_year,
+                           "partner_tier": new_tier if new_tier != "Please choose..." else "",
+                           "partner_discount": new_disc,
+                           "partner_city": new_city, "partner_country": new_country,
+                           "pam_name": new_pam, "pam_email": ""}
+                    _append_partner(row, raw)
+                    st.session_state["_pl_added"] = True; st.rerun()
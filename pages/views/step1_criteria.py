@@ -0,0 +1,110 @@
+"""Step 1 — Scoring Criteria: enable metrics and set their 1–5 ranges or descriptors."""
+import html
+
+import streamlit as st
+
+from utils.paths import raw_path as _raw_path, save_path as _save_path
+from utils.scoring import (
+    save_criteria as _save_criteria,
+    recalculate_benchmarks as _recalculate_benchmarks,
+)
+from utils.ui import brand as _brand
+
+
+def _summary(m: dict, cr: dict) -> str:
+    """One-line description of a metric's current 1–5 ranges or descriptors."""
+    if m["type"] != "quantitative":
+        return " · ".join(f"{s}: {html.escape(cr['descriptors'][s][:28])}" for s in ("1","2","3","4","5"))
+    r = cr["ranges"]
+    return " · ".join(f"{s}: {html.escape(str(r[s]['min'] or '…'))} – {html.escape(str(r[s]['max'] or '…'))}" for s in ("1","2","3","4","5"))
+
+
+def _card(m: dict, cr: dict) -> str:
+    ie=cr.get("enabled",True)
+    tt='<span class="tag tag-q">Quantitative</span>' if m["type"]=="quantitative" else '<span class="tag tag-ql">Qualitative</span>'
+    dt=f'<span class="tag {"tag-hi" if m["direction"]=="higher_is_better" else "tag-lo"}">{"↑ Higher" if m["direction"]=="higher_is_better" else "↓ Lower"} is better</span>'
+    xt='' if ie else '<span class="tag tag-del">EXCLUDED</span>'
+    dc="" if ie else " mc-off"
+    return f'<div class="mc{dc}"><span class="mname">{m["id"]}. {m["name"]}</span>{tt}{dt}{xt}<div class="mexpl">{m["explanation"]}</div></div>'
+
+
+def _row(m: dict, cr: dict) -> str:
+    xt='' if cr.get("enabled",True) else ' <span class="tag tag-del">EXCLUDED</span>'
+    return (f'<div class="plist-item"><span><b>{m["id"]}. {m["name"]}</b>{xt}</span>'
+            f'<span class="hint-row" style="margin:0">{_summary(m,cr)}</span></div>')
+
+
+def render(ctx: dict) -> None:
+    visible_metrics = ctx["visible_metrics"]; chosen_cat = ctx["chosen_cat"]
+    _brand()
+    st.markdown("## Step 1 — Define Scoring Criteria")
+    st.markdown("Configure **1–5** thresholds. Toggle metrics on/off. Changes apply retroactively to all scored partners.")
+    if st.session_state.get("_p1_saved"):
+        n=st.session_state["_p1_saved"]
+        msg="✅ Criteria saved — all partners re-scored" if n is True else f"✅ {n} metric{'s' if n!=1 else ''} updated — all partners re-scored"
+        st.markdown(f'<div class="toast">{msg}</div>',unsafe_allow_html=True); st.session_state["_p1_saved"]=False
+    elif st.session_state.pop("_p1_unchanged",False):
+        st.info("No changes to save.")
+    crit=st.session_state["criteria"]
+    metrics=[m for m in visible_metrics if crit.get(m["key"])]  # Skip metrics not yet in criteria
+    # Editor widgets exist only for the selected category or the one metric
+    # picked below; every other metric is a read-only summary row.
+    if chosen_cat=="All Metrics" and metrics:
+        st.caption("Pick a category in the sidebar to edit all of its metrics at once, or choose a single metric here.")
+        focus=st.selectbox("Edit metric",[m["key"] for m in metrics],key="p1_focus",
+                           format_func=lambda k: next(f'{m["id"]}. {m["name"]}' for m in metrics if m["key"]==k))
+        edit=[m for m in metrics if m["key"]==focus]
+        st.markdown("".join(_row(m,crit[m["key"]]) for m in metrics if m["key"]!=focus),unsafe_allow_html=True)
+    else:
+        edit=metrics
+    with st.form("p1_form"):
+        for m in edit:
+            mk=m["key"]; cr=crit[mk]; iq=m["type"]=="quantitative"
+            ud=f' ({m["unit"]})' if m.get("unit") else ""
+            st.markdown(_card(m,cr),unsafe_allow_html=True)
+            st.checkbox("Include in scoring",value=cr.get("enabled",True),key=f"p1_{mk}_en")
+            if iq:
+                cols=st.columns(5)
+                for idx,s in enumerate(("1","2","3","4","5")):
+                    with cols[idx]:
+                        st.markdown(f'<div class="sb sb{s}">{s}</div>',unsafe_allow_html=True)
+                        st.text_input(f"Min{ud}",value=cr["ranges"][s]["min"],key=f"p1_{mk}_s{s}_min",placeholder="No min" if s=="1" else "")
+                        st.text_input(f"Max{ud}",value=cr["ranges"][s]["max"],key=f"p1_{mk}_s{s}_max",placeholder="No cap" if s=="5" else "")
+            else:
+                cols=st.columns(5)
+                for idx,s in enumerate(("1","2","3","4","5")):
+                    with cols[idx]:
+                        st.markdown(f'<div class="sb sb{s}">{s}</div>',unsafe_allow_html=True)
+                        st.text_area("desc",value=cr["descriptors"][s],key=f"p1_{mk}_s{s}_desc",height=100,label_visibility="collapsed")
+        st.markdown("---")
+        st.markdown('<style>[data-testid="stForm"] [data-testid="stFormSubmitButton"]:last-child button{background:#dc4040!important;border-color:#dc4040!important;color:#fff!important;font-weight:800!important}</style>',unsafe_allow_html=True)
+        _,cm,cr=st.columns([2,1,1])
+        with cm: p1s=st.form_submit_button("💾  Save Criteria",use_container_width=True)
+        with cr: p1n=st.form_submit_button("Next →  Step 2",use_container_width=True,type="primary")
+    if p1s or p1n:
+        had_file=_save_path().exists(); dirty=_save_criteria()
+        if dirty or not had_file: st.session_state["_p1_saved"]=len(dirty) if dirty else True
+        else: st.session_state["_p1_unchanged"]=True
+        if p1n: st.session_state["current_page"]="Step 2 — Score a Partner"
+        st.rerun()
+
+    # ── Auto-calculate from data ──
+    if _raw_path().exists():
+        st.markdown("---")
+        st.markdown("#### 📐 Auto-Calculate from Partner Data")
+        st.caption("Analyze your imported partner data and set quintile-based ranges automatically. Qualitative metrics are not affected.")
+
+        if st.session_state.get("_bench_result_p1"):
+            res = st.session_state.pop("_bench_result_p1")
+            if res["updated"]:
+                st.success(f"Benchmarks recalculated — **{len(res['updated'])}** metric(s) updated. All partners re-scored.")
+            else:
+                st.info("No quantitative metrics were changed.")
+
+        _, _, bc = st.columns([2, 2, 1])
+        with bc:
+            if st.button("📐  Recalculate Benchmarks", use_container_width=True, key="p1_bench"):
+                with st.spinner("Analyzing partner data distributions..."):
+                    result = _recalculate_benchmarks()
+                st.session_state["_bench_result_p1"] = result
+                st.rerun()
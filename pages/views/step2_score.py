@@ -0,0 +1,218 @@
+"""Step 2 — Score a Partner: the scorecard form, for new partners and edits."""
+import json, re
+import streamlit as st
+
+from utils.paths import save_path as _save_path
+from utils.data import (
+    load_raw as _load_raw,
+    partner_exists as _partner_exists,
+    max_partners as _max_partners,
+    partner_count as _partner_count,
+    criteria_version as _criteria_version,
+)
+from utils.scoring import (
+    CATEGORIES,
+    SC,
+    calc_score,
+    enabled as _enabled,
+    grade as _grade,
+    tiers as _tiers,
+    ensure_criteria_complete as _ensure_criteria_complete,
+)
+from utils.ui import brand as _brand
+from utils.countries import COUNTRIES
+from pages.views.common import (
+    append_partner as _append_partner,
+    upsert_partner as _upsert_partner,
+)
+
+
+def render(ctx: dict) -> None:
+    is_admin = ctx["is_admin"]; _tenant_tier = ctx["tenant_tier"]; chosen_cat = ctx["chosen_cat"]
+    _brand()
+    st.markdown("## Step 2 — Score a Partner")
+    if not _save_path().exists():
+        if _tenant_tier == "demo":
+            st.warning("⚠️ Import data first.")
+            if st.button("📥 Go to Import Data", type="primary"):
+                st.session_state["current_page"] = "Import Data"; st.rerun()
+        else:
+            st.warning("⚠️ Complete **Step 1** first.")
+        st.stop()
+    st.session_state["criteria"]=json.loads(_save_path().read_text())
+    _ensure_criteria_complete()
+    cr=st.session_state["criteria"]; em=_enabled(); mx=len(em)*5
+    # Form version counter — incremented on submit to clear all fields
+    if "p2_ver" not in st.session_state: st.session_state["p2_ver"]=0
+    fv=st.session_state["p2_ver"]
+    # Edit mode: if a partner was clicked in sidebar or assessment
+    # Transfer _view_partner to persistent _editing_partner
+    if "_view_partner" in st.session_state:
+        st.session_state["_editing_partner"] = st.session_state.pop("_view_partner")
+    view_raw = None
+    is_edit = False
+    editing_pn = st.session_state.get("_editing_partner")
+    if editing_pn:
+        raw_all = _load_raw()
+        view_raw = next((r for r in raw_all if r.get("partner_name") == editing_pn), None)
+        if view_raw:
+            is_edit = True
+            col_edit_info, col_edit_cancel = st.columns([5, 1])
+            with col_edit_info:
+                st.info(f"✏️ Editing scorecard for **{editing_pn}** — make changes and click **Save Changes**")
+            with col_edit_cancel:
+                if st.button("✖ Cancel Edit", key="p2_cancel_edit"):
+                    st.session_state.pop("_editing_partner", None)
+                    st.rerun()
+        else:
+            st.session_state.pop("_editing_partner", None)
+    if st.session_state.get("_p2_submitted"):
+        st.markdown('<div class="toast">✅ Partner submitted & saved. Ready for next partner.</div>',unsafe_allow_html=True); st.session_state["_p2_submitted"]=False
+    if st.session_state.get("_p2_updated"):
+        st.markdown('<div class="toast">✅ Partner scorecard updated successfully.</div>',unsafe_allow_html=True); st.session_state["_p2_updated"]=False
+    st.markdown(f"Total out of **{mx}** ({len(em)} metrics × 5).")
+    st.markdown('<div class="partner-hdr">Partner details</div>',unsafe_allow_html=True)
+    tiers=_tiers(); t_opts=["Please choose..."]+tiers if tiers else ["Please choose...","(Set tiers in Client Intake)"]
+    pc1,pc2,pc3,pc4=st.columns(4)
+    with pc1: pn=st.text_input("Partner company name",key=f"p2_pn_{fv}",placeholder="e.g. ABC reseller",value=view_raw.get("partner_name","") if view_raw else "")
+    with pc2: p_yr=st.text_input("Year became partner",key=f"p2_py_{fv}",placeholder="e.g. 2020",value=view_raw.get("partner_year","") if view_raw else "")
+    with pc3:
+        tier_val = view_raw.get("partner_tier","") if view_raw else ""
+        pt=st.selectbox("Tier",t_opts,index=t_opts.index(tier_val) if tier_val in t_opts else 0,key=f"p2_pt_{fv}")
+    with pc4:
+        p_disc=st.text_input("Partner Discount",key=f"p2_disc_{fv}",placeholder="e.g. 20%",value=view_raw.get("partner_discount","") if view_raw else "")
+    pc5,pc6=st.columns(2)
+    with pc5: pcity=st.text_input("City",key=f"p2_city_{fv}",placeholder="e.g. Paris",value=view_raw.get("partner_city","") if view_raw else "")
+    with pc6:
+        country_val = view_raw.get("partner_country","") if view_raw else ""
+        pcountry=st.selectbox("Country",COUNTRIES,index=COUNTRIES.index(country_val) if country_val in COUNTRIES else 0,key=f"p2_country_{fv}")
+    pam1,pam2=st.columns(2)
+    with pam1: pam_name=st.text_input("Partner Account Manager (PAM) name",key=f"p2_pam_name_{fv}",placeholder="e.g. Jane Smith",value=view_raw.get("pam_name","") if view_raw else "")
+    with pam2: pam_email=st.text_input("PAM email",key=f"p2_pam_email_{fv}",placeholder="e.g. jane@company.com",value=view_raw.get("pam_email","") if view_raw else "")
+    st.markdown("---")
+    if chosen_cat=="All Metrics": ve=em
+    else:
+        cn=chosen_cat.split("  ",1)[-1]; ck=next(c["keys"] for c in CATEGORIES if c["label"]==cn); ve=[m for m in em if m["key"] in ck]
+    # Per-metric scores are memoised for the session (per criteria version),
+    # so a rerun only scores the metric that was edited.
+    _p2_memo=st.session_state.setdefault("_p2_score_memo",{})
+    if _p2_memo.get("_ver")!=_criteria_version() or len(_p2_memo)>2048: _p2_memo.clear(); _p2_memo["_ver"]=_criteria_version()
+    def _p2_score(mk,raw):
+        if (mk,raw) not in _p2_memo: _p2_memo[(mk,raw)]=calc_score(mk,raw,cr)
+        return _p2_memo[(mk,raw)]
+    def _p2_collect():
+        full={}; raw_vals={}
+        for m in em:
+            mk=m["key"]; pv=st.session_state.get(f"p2_{mk}_{fv}","")
+            if not pv or pv=="— Select —":
+                full[mk]=None; raw_vals[mk]=None
+            elif m["type"]=="qualitative" and isinstance(pv,str) and pv.startswith("("):
+                raw_d=re.sub(r"^\(\d\)\s*","",pv); full[mk]=_p2_score(mk,raw_d); raw_vals[mk]=raw_d
+            else:
+                full[mk]=_p2_score(mk,pv); raw_vals[mk]=pv
+        si={k:v for k,v in full.items() if v is not None}; total=sum(si.values()); sn=len(si); mp=sn*5
+        return full,raw_vals,total,sn,mp,(total/mp*100) if mp else 0
+    # Metric inputs and the Live Summary rerun as one fragment: editing a
+    # metric skips the sidebar, CSS and criteria reload of a full rerun.
+    @st.fragment
+    def _p2_scorecard():
+        for m in ve:
+            mk=m["key"]; mc=cr.get(mk,{}); iq=m["type"]=="quantitative"
+            if not mc: continue
+            tt='<span class="tag tag-q">Quantitative</span>' if iq else '<span class="tag tag-ql">Qualitative</span>'
+            dt=f'<span class="tag {"tag-hi" if m["direction"]=="higher_is_better" else "tag-lo"}">{"↑ Higher" if m["direction"]=="higher_is_better" else "↓ Lower"} is better</span>'
+            st.markdown(f'<div class="mc"><span class="mname">{m["id"]}. {m["name"]}</span>{tt}{dt}<div class="mexpl">{m["explanation"]}</div></div>',unsafe_allow_html=True)
+            view_val = view_raw.get(f"raw_{mk}","") if view_raw else ""
+            if iq:
+                u=mc.get("unit","") or ""
+                hints=[]
+                for s in("1","2","3","4","5"):
+                    r=mc["ranges"][s]; lo,hi=r["min"],r["max"]
+                    if lo and hi: hints.append(f"<b>{s}</b>: {lo}–{hi}")
+                    elif lo and not hi: hints.append(f"<b>{s}</b>: ≥{lo}")
+                    elif not lo and hi: hints.append(f"<b>{s}</b>: ≤{hi}")
+                if hints and is_admin: st.markdown(f'<div class="hint-row">Ranges ({u}): {" &nbsp;·&nbsp; ".join(hints)}</div>',unsafe_allow_html=True)
+                ic,sc_c=st.columns([4,1])
+                with ic: pv=st.text_input(f"Value ({u})",key=f"p2_{mk}_{fv}",placeholder=f"Enter number ({u})",label_visibility="collapsed",value=str(view_val) if view_val else "")
+                scr=_p2_score(mk,pv)
+            else:
+                opts=["— Select —"]+[f"({s}) {mc['descriptors'][s]}" for s in("1","2","3","4","5")]
+                # Pre-select for edit mode — match descriptor exactly
+                view_idx = 0
+                if view_val:
+                    for oi, o in enumerate(opts):
+                        if oi == 0: continue  # skip "— Select —"
+                        desc = re.sub(r"^\(\d\)\s*", "", o)
+                        if desc == view_val:
+                            view_idx = oi; break
+                    else:
+                        # Fallback: substring match if exact fails
+                        for oi, o in enumerate(opts):
+                            if oi > 0 and view_val in o: view_idx = oi; break
+                ic,sc_c=st.columns([4,1])
+                with ic: pv=st.selectbox("Level",opts,index=view_idx,key=f"p2_{mk}_{fv}",label_visibility="collapsed")
+                if pv and pv!="— Select —": scr=_p2_score(mk,re.sub(r"^\(\d\)\s*","",pv))
+                else: scr=None
+            with sc_c:
+                if scr: st.markdown(f'<div class="live-score" style="background:{SC[scr]}">{scr}</div>',unsafe_allow_html=True)
+                else: st.markdown('<div class="live-score" style="background:#ccc">—</div>',unsafe_allow_html=True)
+        # Summary
+        st.markdown("---")
+        _,_,total,sn,_,pct=_p2_collect(); gl,gc=_grade(pct)
+        st.markdown(f"### Live Summary — {st.session_state.get(f'p2_pn_{fv}','Partner') or 'Partner'}")
+        c1,c2,c3,c4=st.columns(4)
+        with c1: st.markdown(f'<div class="sum-card"><div class="sum-big">{total}</div><div class="sum-lbl">Total</div></div>',unsafe_allow_html=True)
+        with c2: st.markdown(f'<div class="sum-card"><div class="sum-big">{sn}/{len(em)}</div><div class="sum-lbl">Scored</div></div>',unsafe_allow_html=True)
+        with c3: st.markdown(f'<div class="sum-card"><div class="sum-big">{pct:.1f}%</div><div class="sum-lbl">Percentage</div></div>',unsafe_allow_html=True)
+        with c4: st.markdown(f'<div class="sum-card"><div class="sum-big" style="color:{gc}">{gl}</div><div class="sum-lbl">Grade</div></div>',unsafe_allow_html=True)
+    _p2_scorecard()
+    full,raw_vals,total,sn,mp,pct=_p2_collect(); pname=st.session_state.get(f"p2_pn_{fv}","Partner") or "Partner"
+    st.markdown("---")
+    # Build row + raw dicts (shared by both submit and save)
+    def _build_row_raw():
+        row={"partner_name":pname,"partner_year":st.session_state.get(f"p2_py_{fv}",""),
+             "partner_tier":st.session_state.get(f"p2_pt_{fv}",""),
+             "partner_discount":st.session_state.get(f"p2_disc_{fv}",""),
+             "partner_city":st.session_state.get(f"p2_city_{fv}",""),
+             "partner_country":st.session_state.get(f"p2_country_{fv}",""),
+             "pam_name":st.session_state.get(f"p2_pam_name_{fv}",""),
+             "pam_email":st.session_state.get(f"p2_pam_email_{fv}",""),
+             "total_score":total,"max_possible":mp,"percentage":round(pct,1)}
+        for m in em: row[m["key"]]=full.get(m["key"],"")
+        raw_dict={"partner_name":pname,"partner_year":st.session_state.get(f"p2_py_{fv}",""),
+                  "partner_tier":st.session_state.get(f"p2_pt_{fv}",""),
+                  "partner_discount":st.session_state.get(f"p2_disc_{fv}",""),
+                  "partner_city":st.session_state.get(f"p2_city_{fv}",""),
+                  "partner_country":st.session_state.get(f"p2_country_{fv}",""),
+                  "pam_name":st.session_state.get(f"p2_pam_name_{fv}",""),
+                  "pam_email":st.session_state.get(f"p2_pam_email_{fv}","")}
+        for m in em: raw_dict[f"raw_{m['key']}"]=raw_vals.get(m["key"])
+        return row, raw_dict
+    if is_edit:
+        # Edit mode — update existing partner
+        _,_,save_col=st.columns([2,2,1])
+        with save_col:
+            if st.button("💾  Save Changes",use_container_width=True,type="primary"):
+                if not pname or pname=="Partner":
+                    st.error("Partner name is missing.")
+                else:
+                    row, raw_dict = _build_row_raw()
+                    _upsert_partner(row, raw_dict)
+                    st.session_state.pop("_editing_partner", None)
+                    st.session_state["_p2_updated"]=True; st.rerun()
+    else:
+        # New partner mode
+        _,_,submit_col=st.columns([2,2,1])
+        with submit_col:
+            if st.button("✅  Submit & Start New Partner",use_container_width=True,type="primary"):
+                if not pname or pname=="Partner":
+                    st.error("Enter a partner name first.")
+                elif _partner_exists(pname):
+                    st.error(f"A partner named **{pname}** already exists. Use a unique name.")
+                elif _max_partners() and _partner_count() >= _max_partners():
+                    st.error(f"Partner limit reached (**{_max_partners()}**). Contact your admin to increase the limit.")
+                else:
+                    row, raw_dict = _build_row_raw()
+                    _append_partner(row, raw_dict)
+                    st.session_state["p2_ver"]=fv+1
+                    st.session_state["_p2_submitted"]=True; st.rerun()
@@ -0,0 +1,204 @@
+"""Step 3 — Partner Assessment: the score matrix of every partner."""
+import streamlit as st
+import pandas as pd
+
+try:
+    import st_aggrid  # noqa: F401
+    HAS_AGGRID = True
+except ImportError:
+    HAS_AGGRID = False
+
+from utils.paths import csv_path as _csv_path
+from utils.data import (
+    load_partners as _load_partners,
+    partner_index as _partner_index,
+    data_version as _data_version,
+    assessment_frame as _assessment_frame,
+    criteria_version as _criteria_version,
+    stat_token as _stat_token,
+)
+from utils.snapshot import parquet_bytes as _parquet_snapshot
+from utils.heatmap import (
+    SORT_OPTIONS as HEATMAP_SORT_OPTIONS,
+    PAGE_SIZE as HEATMAP_PAGE_SIZE,
+    heatmap_page as _heatmap_page,
+    heatmap_names as _heatmap_names,
+    heatmap_pams as _heatmap_pams,
+)
+from utils.grid import (
+    GRADES as GRID_GRADES,
+    PAGE_SIZES as GRID_PAGE_SIZES,
+    grid_page as _grid_page,
+    grid_pams as _grid_pams,
+    grid_sort_columns as _grid_sort_columns,
+)
+from utils.scoring import enabled as _enabled
+from utils.exports import assessment_xlsx as _gen_xlsx
+from utils.ui import (
+    brand as _brand,
+    display_styled_assessment_table,
+    cached_download as _cached_download,
+)
+
+
+def render(ctx: dict) -> None:
+    _brand(); st.markdown("## Step 3 — Partner Assessment")
+    em=_enabled()
+    if not _partner_index()["rows"]: st.info("No partners scored yet. Complete **Step 2**."); st.stop()
+
+    def _p3_pager(page_key, page, n_pages, page_size, total):
+        if n_pages <= 1: return
+        pg1, pg2, pg3 = st.columns([1, 3, 1])
+        with pg1:
+            if st.button("◀ Previous", key=f"{page_key}_prev", disabled=page == 0, use_container_width=True):
+                st.session_state[page_key] = page - 1; st.rerun()
+        with pg2: st.caption(f"Page {page + 1} of {n_pages} — rows {page * page_size + 1}–{min((page + 1) * page_size, total)}")
+        with pg3:
+            if st.button("Next ▶", key=f"{page_key}_next", disabled=page >= n_pages - 1, use_container_width=True):
+                st.session_state[page_key] = page + 1; st.rerun()
+
+    if HAS_AGGRID:
+        # ══════════════════════════════════════════════════════════════
+        # AG-GRID — PROFESSIONAL ALPINE-THEMED TABLE
+        # Server-side row model: filters, sort and paging run against the
+        # cached score matrix; the grid only receives the current page.
+        # ══════════════════════════════════════════════════════════════
+        def _p3g_reset_page(): st.session_state["p3g_page"] = 0
+        g1, g2, g3, g4, g5, g6 = st.columns([3, 2, 1, 2, 1, 1])
+        with g1: g_search = st.text_input("🔍 Search partner, PAM or country", key="p3g_search", placeholder="Type to search...", on_change=_p3g_reset_page)
+        with g2: g_pam = st.selectbox("Filter by PAM", ["All PAMs"] + _grid_pams(_csv_path(), em), key="p3g_pam", on_change=_p3g_reset_page)
+        with g3: g_grade = st.selectbox("Grade", ["All"] + list(GRID_GRADES), key="p3g_grade", on_change=_p3g_reset_page)
+        with g4: g_sort = st.selectbox("Sort by", _grid_sort_columns(em), key="p3g_sort", format_func=lambda c: "Score %" if c == "Pct" else c, on_change=_p3g_reset_page)
+        with g5: g_dir = st.selectbox("Order", ["Desc", "Asc"], key="p3g_dir", on_change=_p3g_reset_page)
+        with g6: g_size = st.selectbox("Rows", GRID_PAGE_SIZES, key="p3g_size", on_change=_p3g_reset_page)
+        _g_args = dict(query=g_search, pam=None if g_pam == "All PAMs" else g_pam, grade_f=None if g_grade == "All" else g_grade,
+                       sort_col=g_sort, descending=g_dir == "Desc", page_size=g_size)
+        p3g_page = st.session_state.get("p3g_page", 0)
+        gp = _grid_page(_csv_path(), em, page=p3g_page, **_g_args)
+        g_pages = max(1, -(-gp["total"] // g_size))
+        if p3g_page >= g_pages:
+            p3g_page = st.session_state["p3g_page"] = g_pages - 1
+            gp = _grid_page(_csv_path(), em, page=p3g_page, **_g_args)
+        st.markdown(
+            '<p style="font-size:0.88rem;color:#475569;margin-bottom:12px;">'
+            'Use the controls above to search, filter and sort all partners; '
+            'the table shows one page at a time. Metrics are grouped by category \u2014 '
+            'scroll horizontally to see all groups. '
+            '<b>Partner</b> is pinned left; '
+            '<b>Total / Score% / Grade</b> are pinned right.</p>',
+            unsafe_allow_html=True,
+        )
+        st.markdown(f"**{gp['total']}** partners · **{len(em)}** metrics")
+
+        grid_response = display_styled_assessment_table(gp["rows"], em, server_side=True)
+        _p3_pager("p3g_page", p3g_page, g_pages, g_size, gp["total"])
+
+        # --- Handle row selection → open scorecard ---
+        selected_rows = grid_response.get("selected_rows", None)
+        if selected_rows is not None and len(selected_rows) > 0:
+            if isinstance(selected_rows, pd.DataFrame):
+                sel_pn = selected_rows.iloc[0].get("Partner", "")
+            else:
+                sel_pn = selected_rows[0].get("Partner", "")
+            if sel_pn:
+                st.markdown("---")
+                oc1, oc2 = st.columns([3, 1])
+                with oc1:
+                    st.markdown(f"**Selected:** {sel_pn}")
+                with oc2:
+                    if st.button("✏️  Open Scorecard", use_container_width=True, type="primary", key="p3_open_btn"):
+                        st.session_state["_view_partner"] = sel_pn
+                        st.session_state["current_page"] = "Step 2 — Score a Partner"
+                        st.rerun()
+
+        # --- Clickable partner access (always available as fallback) ---
+        st.markdown("---")
+        st.markdown("#### 📋 Open Partner Scorecard")
+        # Only the current page's partners, so reruns never ship the full name list
+        partner_names_sorted = gp["rows"]["Partner"].tolist()
+        if partner_names_sorted:
+            oc1, oc2 = st.columns([3, 1])
+            with oc1:
+                open_pn = st.selectbox("Select a partner on this page to view/edit their scorecard", partner_names_sorted, key="p3_open_partner_sel")
+            with oc2:
+                st.markdown("<br>", unsafe_allow_html=True)
+                if st.button("✏️  Open Scorecard", use_container_width=True, type="primary", key="p3_open_btn2"):
+                    st.session_state["_view_partner"] = open_pn
+                    st.session_state["current_page"] = "Step 2 — Score a Partner"
+                    st.rerun()
+
+        # --- Downloads (always the full score matrix, not the current page) ---
+        st.markdown("---")
+        dl1, dl2, dl3 = st.columns(3)
+        _p3_ver = (_data_version(), [m["key"] for m in em])
+        with dl1:
+            _cached_download("⬇️  Download Excel", lambda: _gen_xlsx(_load_partners(), em), "Partner_Assessment.xlsx",
+                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", kind="assessment-xlsx", version=_p3_ver, type="primary")
+        with dl2:
+            _cached_download("⬇️  Download CSV", lambda: _assessment_frame(em).drop(columns="City").to_csv(index=False), "Partner_Assessment.csv", "text/csv",
+                kind="assessment-grid-csv", version=_p3_ver)
+        with dl3:
+            _cached_download("⬇️  Download Parquet", lambda: _parquet_snapshot(st.session_state.get("criteria")), "Partner_Assessment.parquet",
+                "application/vnd.apache.parquet", kind="assessment-parquet", version=(_p3_ver, _criteria_version()),
+                unavailable="Parquet export needs pyarrow and scored partner data.",
+                help="Typed columnar file (int8 scores, float64 raw values) for BI tools")
+
+    else:
+        # ══════════════════════════════════════════════════════════════
+        # FALLBACK: original HTML heatmap table (when st_aggrid not installed)
+        # ══════════════════════════════════════════════════════════════
+        st.warning("📦 Install `streamlit-aggrid` for interactive column filtering: `pip install streamlit-aggrid`")
+
+        # ── Quick filters row (changing any filter returns to page 1) ──
+        def _p3_reset_page(): st.session_state["p3_page"] = 0
+        f1, f2, f3, f4 = st.columns([2, 2, 2, 2])
+        with f1:
+            search_q = st.text_input("🔍 Search partner", key="p3_search", placeholder="Type to search...", on_change=_p3_reset_page)
+        with f2:
+            pam_names = list(_heatmap_pams(_csv_path(), em))
+            pam_f = st.selectbox("Filter by PAM", ["All PAMs"] + pam_names, key="p3_pam_filter", on_change=_p3_reset_page)
+        with f3:
+            sort_by = st.selectbox("Sort by", HEATMAP_SORT_OPTIONS, key="p3_sort", on_change=_p3_reset_page)
+        with f4:
+            metric_filter_opts = ["All metrics"] + [m["name"] for m in em]
+            metric_filter = st.selectbox("Filter by metric score", metric_filter_opts, key="p3_metric_filter", on_change=_p3_reset_page)
+        filter_mk = None
+        if metric_filter != "All metrics":
+            filter_mk = next((m["key"] for m in em if m["name"] == metric_filter), None)
+
+        # ── Heatmap table: filtered, sorted and paginated server-side ──
+        p3_page = st.session_state.get("p3_page", 0)
+        hm = _heatmap_page(_csv_path(), em, search_q, None if pam_f == "All PAMs" else pam_f, sort_by, filter_mk, p3_page)
+        n_pages = max(1, -(-hm["total"] // HEATMAP_PAGE_SIZE))
+        if p3_page >= n_pages:
+            p3_page = st.session_state["p3_page"] = n_pages - 1
+            hm = _heatmap_page(_csv_path(), em, search_q, None if pam_f == "All PAMs" else pam_f, sort_by, filter_mk, p3_page)
+        st.markdown(f"**{hm['total']}** partners, **{len(em)}** metrics.")
+        st.markdown(hm["html"], unsafe_allow_html=True)
+        _p3_pager("p3_page", p3_page, n_pages, HEATMAP_PAGE_SIZE, hm["total"])
+
+        # ── Clickable partner access ──
+        st.markdown("---")
+        st.markdown("#### 📋 Open Partner Scorecard")
+        partner_names_sorted = list(hm["page_names"])
+        if partner_names_sorted:
+            oc1, oc2 = st.columns([3, 1])
+            with oc1:
+                open_pn = st.selectbox("Select a partner on this page to view/edit their scorecard", partner_names_sorted, key="p3_open_partner")
+            with oc2:
+                st.markdown("<br>", unsafe_allow_html=True)
+                if st.button("✏️  Open Scorecard", use_container_width=True, type="primary", key="p3_open_btn"):
+                    st.session_state["_view_partner"] = open_pn
+                    st.session_state["current_page"] = "Step 2 — Score a Partner"
+                    st.rerun()
+
+        st.markdown("---")
+        _hm_pam=None if pam_f=="All PAMs" else pam_f
+        def _hm_xlsx():
+            # Filter membership is computed only when the export is prepared
+            names=set(_heatmap_names(_csv_path(),em,search_q,_hm_pam,sort_by,filter_mk))
+            return _gen_xlsx([p for p in _load_partners() if p.get("partner_name","") in names],em)
+        _cached_download("⬇️  Download Excel",_hm_xlsx,"Partner_Assessment.xlsx","application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            kind="assessment-xlsx-filtered",version=(_data_version(),[m["key"] for m in em],search_q,pam_f,sort_by,metric_filter),type="primary")
+        if _csv_path().exists(): _cached_download("⬇️  Download CSV",_csv_path().read_bytes,"all_partners.csv","text/csv",
+            kind="assessment-raw-csv",version=_stat_token(_csv_path()))
@@ -0,0 +1,120 @@
+"""Step 4 — Partner Classification into the four quadrants."""
+import csv, io, json
+import streamlit as st
+
+from utils.data import (
+    load_partners as _load_partners,
+    load_q_config as _load_q_config,
+    save_q_config as _save_q_config,
+    data_version as _data_version,
+)
+from utils.scoring import (
+    SCORECARD_METRICS,
+    Q_LABELS,
+    Q_DESCS,
+    enabled as _enabled,
+    classify_partners,
+)
+from utils.exports import classification_xlsx as _gen_classification_xlsx
+from utils.ui import (
+    brand as _brand,
+    cached_download as _cached_download,
+)
+
+
+def render(ctx: dict) -> None:
+    _brand(); st.markdown("## Step 4 — Partner Classification")
+    partners=_load_partners(); em=_enabled(); em_keys={m["key"] for m in em}
+    if not partners: st.info("No partners scored yet. Complete **Step 2** first."); st.stop()
+    st.markdown("""<div class="info-box">Classify partners into <b>three quadrants</b> plus <b>Long Tail</b>. Partners that don't match Q1–Q3 criteria are automatically classified as Long Tail.<br>Levels: <b>High</b> ≥ 4, <b>Mid</b> = 3, <b>Low</b> ≤ 2, <b>Any</b> = score &gt; 0. First match wins (1 → 3).</div>""",unsafe_allow_html=True)
+    q_config=_load_q_config()
+    if "q_config" not in st.session_state: st.session_state["q_config"]=q_config
+    if st.session_state.get("_q_saved"):
+        st.markdown('<div class="toast">✅ Classification saved & applied</div>',unsafe_allow_html=True); st.session_state["_q_saved"]=False
+    st.markdown("### Define Quadrant Criteria")
+    metric_options=["(none)"]+[m["name"] for m in SCORECARD_METRICS]; level_options=["high","mid","low","any"]; MAX_C=6
+    with st.form("class_form"):
+        new_config={}
+        for qn in(1,2,3):
+            ql,qc=Q_LABELS.get(qn,(f"Q{qn}","#666"))
+            st.markdown(f'<div style="display:flex;align-items:center;margin:18px 0 8px;"><div class="q-badge" style="background:{qc}">{qn}</div><b style="font-size:1.05rem">{ql}</b></div>',unsafe_allow_html=True)
+            st.caption(Q_DESCS.get(qn,""))
+            current=st.session_state["q_config"].get(qn,[])
+            crit_list=[]
+            for ci in range(MAX_C):
+                if ci<len(current): cur_key,cur_level=current[ci]; cur_mn=next((m["name"] for m in SCORECARD_METRICS if m["key"]==cur_key),"(none)"); cur_li=level_options.index(cur_level) if cur_level in level_options else 0
+                else: cur_mn="(none)"; cur_li=0
+                mc,lc=st.columns([3,1])
+                with mc: sel_m=st.selectbox(f"Q{qn}M{ci+1}",metric_options,index=metric_options.index(cur_mn) if cur_mn in metric_options else 0,key=f"q{qn}_m{ci}",label_visibility="collapsed")
+                with lc: sel_l=st.selectbox(f"Q{qn}L{ci+1}",level_options,index=cur_li,key=f"q{qn}_l{ci}",label_visibility="collapsed")
+                if sel_m!="(none)":
+                    mk=next((m["key"] for m in SCORECARD_METRICS if m["name"]==sel_m),None)
+                    if mk: crit_list.append((mk,sel_l))
+            new_config[qn]=crit_list
+        st.markdown(f'<div style="display:flex;align-items:center;margin:18px 0 8px;"><div class="q-badge" style="background:#dc4040">4</div><b style="font-size:1.05rem">Long Tail</b></div>',unsafe_allow_html=True)
+        st.caption("Automatically assigned to partners that don't match Q1–Q3 criteria.")
+        st.markdown("---"); _,cc=st.columns([3,1])
+        with cc: q_sub=st.form_submit_button("💾  Save & Classify",use_container_width=True,type="primary")
+    if q_sub:
+        st.session_state["q_config"]=new_config; _save_q_config(new_config); st.session_state["_q_saved"]=True; st.rerun()
+    st.markdown("---"); st.markdown("### Classification Results")
+    ac=st.session_state["q_config"]; classification=classify_partners(partners,ac,em_keys)
+    if not classification: st.info("No partners to classify."); st.stop()
+    by_q={1:[],2:[],3:[],4:[]}
+    for pn,qn in classification.items(): by_q.setdefault(qn,[]).append(pn)
+    for qn in(1,2,3,4):
+        ql,qc=Q_LABELS.get(qn,(f"Q{qn}","#666")); members=by_q.get(qn,[]); cnt=len(members)
+        if qn<=3:
+            cp=[]
+            for(mk,lvl) in ac.get(qn,[]):
+                mn=next((m["name"] for m in SCORECARD_METRICS if m["key"]==mk),mk); cp.append(f"{mn} = <b>{lvl}</b>")
+            ch=" &nbsp;·&nbsp; ".join(cp) if cp else "<i>No criteria</i>"
+        else:
+            ch="<i>Does not match Q1–Q3 criteria</i>"
+        ph="".join(f'<span class="q-partner">{n}</span>' for n in members) if members else '<span style="color:#999">None</span>'
+        st.markdown(f'<div class="q-card" style="border-color:{qc}20;background:{qc}08;"><div style="display:flex;align-items:center;"><div class="q-badge" style="background:{qc}">{qn}</div><h4 style="margin:0;color:{qc}">{ql}</h4><span style="margin-left:auto;font-size:1.4rem;font-weight:800;color:{qc};font-family:\'JetBrains Mono\',monospace">{cnt}</span></div><div class="q-criteria">Criteria: {ch}</div><div style="margin-top:10px">{ph}</div></div>',unsafe_allow_html=True)
+    st.markdown("### Full Classification Table")
+    tbl="<table class='hm-tbl'><thead><tr><th>Partner</th><th>Total</th><th>%</th><th>Q</th><th>Classification</th></tr></thead><tbody>"
+    sc=sorted(classification.items(),key=lambda x:(x[1],-next((int(p.get("total_score",0) or 0) for p in partners if p.get("partner_name")==x[0]),0)))
+    for pn,qn in sc:
+        p=next((p for p in partners if p.get("partner_name")==pn),{})
+        try: tv=int(p.get("total_score",0) or 0)
+        except: tv=0
+        try: pv=float(p.get("percentage",0) or 0)
+        except: pv=0
+        ql,qc=Q_LABELS.get(qn,(f"Q{qn}","#666"))
+        tbl+=f'<tr><td style="text-align:left;padding-left:10px;font-weight:600">{pn}</td><td>{tv}</td><td>{pv:.1f}%</td><td><span class="score-pill" style="background:{qc}">{qn}</span></td><td style="color:{qc};font-weight:700">{ql}</td></tr>'
+    tbl+="</tbody></table>"
+    st.markdown(tbl,unsafe_allow_html=True)
+    st.markdown("---")
+    # Downloads: Excel, CSV, JSON
+    dl1, dl2, dl3 = st.columns(3)
+    # Build classification data for export
+    class_rows = []
+    for pn, qn in sorted(classification.items(), key=lambda x: (x[1], x[0])):
+        p = next((p for p in partners if p.get("partner_name") == pn), {})
+        try: tv = int(p.get("total_score", 0) or 0)
+        except: tv = 0
+        try: pv = float(p.get("percentage", 0) or 0)
+        except: pv = 0
+        ql, _ = Q_LABELS.get(qn, (f"Q{qn}", "#666"))
+        class_rows.append({"Partner": pn, "Total Score": tv, "Percentage": round(pv, 1),
+                           "Quadrant": qn, "Classification": ql,
+                           "Tier": p.get("partner_tier", ""), "PAM": p.get("pam_name", "")})
+    _p4_ver = (_data_version(), sorted(em_keys), {str(k): v for k, v in ac.items()})
+    with dl1:
+        _cached_download("⬇️  Download Excel", lambda: _gen_classification_xlsx(class_rows), "Partner_Classification.xlsx",
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", kind="classification-xlsx", version=_p4_ver, type="primary")
+    with dl2:
+        def _class_csv():
+            csv_buf = io.StringIO()
+            if class_rows:
+                cw = csv.DictWriter(csv_buf, fieldnames=list(class_rows[0].keys()))
+                cw.writeheader()
+                for r in class_rows: cw.writerow(r)
+            return csv_buf.getvalue()
+        _cached_download("⬇️  Download CSV", _class_csv, "Partner_Classification.csv", "text/csv",
+            kind="classification-csv", version=_p4_ver)
+    with dl3:
+        _cached_download("⬇️  Download JSON", lambda: json.dumps(classification, indent=2), "partner_classification.json",
+            "application/json", kind="classification-json", version=_p4_ver)
@@ -5,13 +5,41 @@ Key resolution order:
   1. ``ANTHROPIC_API_KEY`` environment variable (preferred for production).
   2. Session-cached key (survives page navigations within a session).
   3. User-provided key via ``st.text_input`` (fallback for local dev).
+
+Requests go through one pooled, keep-alive ``requests.Session`` per process
+(:func:`http_session`), so follow-up questions reuse an open TLS connection.
+429 / 503 / 529 responses and failed connects are retried with jittered
+exponential backoff (honouring ``Retry-After``) — only statuses that mean
+the request was not processed, so a retried POST is never billed twice.  Endpoint, timeouts, retry
+count and pool size come from the environment — point
+``ANTHROPIC_BASE_URL`` at a local stub server to exercise the client
+without the real API.
+
+:func:`stream_ai` consumes the Messages API's server-sent events and yields
+the ``answer`` text while it is generated; the trailing ``table`` /
+``chart`` / ``updates`` JSON is parsed once the stream completes.
+
+:func:`cached_system` marks a system prompt for provider-side prompt
+caching.  :func:`cached_reply` / :func:`store_reply` keep parsed replies
+on disk (``utils.cache.ai_cache``) under :func:`reply_key`, so a question
+asked again against unchanged data is answered without an API call.
+
+:func:`run_batch` fans a list of independent questions out concurrently
+(asyncio, bounded by a semaphore and a per-tenant request-rate bucket), so
+a batch takes about as long as its slowest call rather than the sum.
 """
+import asyncio
 import json
 import os
 import re
+import threading
+import time
 
 import streamlit as st
 
+from utils.cache import DiskCache, ai_cache
+from utils.perf import section
+
 
 # ── Key resolution ──────────────────────────────────────────────────────
 
@@ -61,9 +89,103 @@ def resolve_api_key() -> str:
     return ""  # unreachable
 
 
+# ── HTTP client ─────────────────────────────────────────────────────────
+
+API_BASE_URL = os.environ.get("ANTHROPIC_BASE_URL", "https://api.anthropic.com").rstrip("/")
+API_VERSION = "2023-06-01"
+AI_MODEL = "claude-sonnet-4-20250514"
+AI_CONNECT_TIMEOUT = float(os.environ.get("CHANNELPRO_AI_CONNECT_TIMEOUT", "5"))
+AI_READ_TIMEOUT = float(os.environ.get("CHANNELPRO_AI_READ_TIMEOUT", "60"))
+AI_RETRIES = int(os.environ.get("CHANNELPRO_AI_RETRIES", "3"))
+AI_POOL_SIZE = int(os.environ.get("CHANNELPRO_AI_POOL_SIZE", "8"))
+# Rate limited / unavailable / overloaded: rejected before any generation.  Other
+# 5xx may arrive after the request was processed, so they are not retried.
+RETRY_STATUSES = (429, 503, 529)
+AI_STREAM = os.environ.get("CHANNELPRO_AI_STREAM", "1").strip().lower() not in ("0", "false", "no", "off")
+AI_BATCH_CONCURRENCY = int(os.environ.get("CHANNELPRO_AI_BATCH_CONCURRENCY", "4"))
+AI_TENANT_RPM = float(os.environ.get("CHANNELPRO_AI_TENANT_RPM", "50"))
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def http_session():
+    """Process-wide pooled ``requests.Session`` for the Anthropic API (created on first use)."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                retry_kw = dict(
+                    total=AI_RETRIES, connect=AI_RETRIES, read=0, status=AI_RETRIES,
+                    status_forcelist=RETRY_STATUSES, allowed_methods=frozenset({"POST"}),
+                    backoff_factor=0.5, respect_retry_after_header=True, raise_on_status=False,
+                )
+                try:
+                    retry = Retry(backoff_jitter=0.5, **retry_kw)
+                except TypeError:  # urllib3 < 2 has no jitter
+                    retry = Retry(**retry_kw)
+                adapter = HTTPAdapter(pool_connections=2, pool_maxsize=AI_POOL_SIZE,
+                                      pool_block=True, max_retries=retry)
+                sess = requests.Session()
+                sess.mount("https://", adapter)
+                sess.mount("http://", adapter)
+                _session = sess
+    return _session
+
+
+def _headers(api_key: str) -> dict:
+    return {"x-api-key": api_key, "anthropic-version": API_VERSION, "content-type": "application/json"}
+
+
+# ── Response parsing ────────────────────────────────────────────────────
+
+def _reply(answer: str) -> dict:
+    return {"answer": answer, "table": None, "chart": None, "updates": None}
+
+
+def _error_reply(answer: str) -> dict:
+    return {**_reply(answer), "error": True}
+
+
+def parse_ai_text(text: str) -> dict:
+    """Parse the model's JSON reply, falling back to a plain-text answer."""
+    # Strip markdown fences if present
+    text = text.strip()
+    if text.startswith("```"):
+        text = re.sub(r"^```(?:json)?\s*", "", text)
+        text = re.sub(r"\s*```$", "", text)
+    try:
+        resp = json.loads(text)
+    except json.JSONDecodeError:
+        return _reply(text or "Could not parse AI response.")
+    return resp if isinstance(resp, dict) else _reply(text)
+
+
+def cached_system(*blocks: str) -> list[dict]:
+    """System prompt as text blocks, with a prompt-cache breakpoint on the last one.
+
+    Put the blocks in order of stability (fixed instructions first, then
+    tenant data): the API caches the whole prefix up to the breakpoint, so
+    follow-up turns with the same prompt are billed and processed as cache
+    reads.
+    """
+    out = [{"type": "text", "text": b} for b in blocks if b]
+    if out:
+        out[-1]["cache_control"] = {"type": "ephemeral"}
+    return out
+
+
+def _request_body(messages: list[dict], system_prompt: str | list[dict], **extra) -> dict:
+    return {"model": AI_MODEL, "max_tokens": 4096, "system": system_prompt, "messages": messages, **extra}
+
+
 # ── AI call ─────────────────────────────────────────────────────────────
 
-def call_ai(messages: list[dict], api_key: str, system_prompt: str) -> dict:
+def call_ai(messages: list[dict], api_key: str, system_prompt: str | list[dict]) -> dict:
     """Call the Anthropic Messages API and return a parsed JSON response.
 
     Parameters
@@ -72,62 +194,302 @@ def call_ai(messages: list[dict], api_key: str, system_prompt: str) -> dict:
         Conversation history in ``[{"role": ..., "content": ...}, ...]`` form.
     api_key : str
         Anthropic API key.
-    system_prompt : str
-        System-level prompt containing partner data context.
+    system_prompt : str | list[dict]
+        System-level prompt containing partner data context — plain text,
+        or content blocks from :func:`cached_system`.
 
     Returns
     -------
     dict
         Parsed response with keys ``answer``, ``table``, ``chart``, ``updates``.
     """
-    import requests as req
-
     try:
-        resp = req.post(
-            "https://api.anthropic.com/v1/messages",
-            headers={
-                "x-api-key": api_key,
-                "anthropic-version": "2023-06-01",
-                "content-type": "application/json",
-            },
-            json={
-                "model": "claude-sonnet-4-20250514",
-                "max_tokens": 4096,
-                "system": system_prompt,
-                "messages": messages,
-            },
-            timeout=60,
-        )
+        with section("ai"):
+            resp = http_session().post(
+                f"{API_BASE_URL}/v1/messages",
+                headers=_headers(api_key),
+                json=_request_body(messages, system_prompt),
+                timeout=(AI_CONNECT_TIMEOUT, AI_READ_TIMEOUT),
+            )
         if resp.status_code != 200:
-            return {
-                "answer": f"API error ({resp.status_code}): {resp.text}",
-                "table": None,
-                "chart": None,
-                "updates": None,
-            }
+            return _error_reply(f"API error ({resp.status_code}): {resp.text}")
         data = resp.json()
         text = "".join(
             b.get("text", "")
             for b in data.get("content", [])
             if b.get("type") == "text"
         )
-        # Strip markdown fences if present
-        text = text.strip()
-        if text.startswith("```"):
-            text = re.sub(r"^```(?:json)?\s*", "", text)
-            text = re.sub(r"\s*```$", "", text)
-        return json.loads(text)
-    except json.JSONDecodeError:
-        return {
-            "answer": text if "text" in dir() else "Could not parse AI response.",
-            "table": None,
-            "chart": None,
-            "updates": None,
-        }
+        return parse_ai_text(text)
     except Exception as e:
-        return {
-            "answer": f"Error: {str(e)}",
-            "table": None,
-            "chart": None,
-            "updates": None,
-        }
+        return _error_reply(f"Error: {str(e)}")
+
+
+# ── Streaming ───────────────────────────────────────────────────────────
+
+def _sse_events(resp):
+    """Yield ``(event, data)`` pairs from a server-sent-events response."""
+    event, data = None, []
+    for line in resp.iter_lines(decode_unicode=True):
+        if line is None:
+            continue
+        if not line:
+            if data:
+                try:
+                    yield event, json.loads("\n".join(data))
+                except json.JSONDecodeError:
+                    pass
+            event, data = None, []
+        elif line.startswith("event:"):
+            event = line[6:].strip()
+        elif line.startswith("data:"):
+            data.append(line[5:].lstrip())
+    if data:
+        try:
+            yield event, json.loads("\n".join(data))
+        except json.JSONDecodeError:
+            pass
+
+
+_ANSWER_START = re.compile(r'^\s*(?:```(?:json)?\s*)?\{\s*"answer"\s*:\s*"')
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+class _AnswerDecoder:
+    """Incrementally decodes the ``answer`` string out of a partial JSON reply.
+
+    Replies that are not JSON are passed through as plain text.
+    """
+
+    def __init__(self):
+        self.buf = ""; self.pos = None; self.done = False; self.plain = False
+
+    def feed(self, piece: str) -> str:
+        self.buf += piece
+        if self.done:
+            return ""
+        if self.plain:
+            return piece
+        if self.pos is None:
+            m = _ANSWER_START.match(self.buf)
+            if m:
+                self.pos = m.end()
+            elif self.buf.strip() and self.buf.lstrip()[0] not in "{`":
+                self.plain = True
+                return self.buf
+            else:
+                # JSON that does not lead with "answer" is shown once complete
+                self.done = len(self.buf.lstrip()) >= 40
+                return ""
+        out = []; i = self.pos; buf = self.buf
+        while i < len(buf):
+            c = buf[i]
+            if c == '"':
+                self.done = True; i += 1
+                break
+            if c != "\\":
+                out.append(c); i += 1
+                continue
+            if i + 1 >= len(buf):
+                break
+            e = buf[i + 1]
+            if e == "u":
+                if i + 6 > len(buf):
+                    break
+                try:
+                    cp = int(buf[i + 2:i + 6], 16)
+                except ValueError:
+                    cp = 0xFFFD
+                if 0xD800 <= cp < 0xDC00:  # surrogate pair: wait for the low half
+                    if i + 12 > len(buf):
+                        break
+                    try:
+                        lo = int(buf[i + 8:i + 12], 16) if buf[i + 6:i + 8] == "\\u" else 0
+                    except ValueError:
+                        lo = 0
+                    if 0xDC00 <= lo < 0xE000:
+                        cp = 0x10000 + ((cp - 0xD800) << 10) + (lo - 0xDC00); i += 6
+                    else:
+                        cp = 0xFFFD
+                elif 0xDC00 <= cp < 0xE000:
+                    cp = 0xFFFD
+                out.append(chr(cp)); i += 6
+            else:
+                out.append(_ESCAPES.get(e, e)); i += 2
+        self.pos = i
+        return "".join(out)
+
+
+class AIStream:
+    """Streamed Anthropic Messages API call.
+
+    Iterating yields the reply's ``answer`` text as it arrives (suitable for
+    ``st.write_stream``); once the stream is exhausted :attr:`result` holds
+    the parsed reply with ``answer``, ``table``, ``chart`` and ``updates``,
+    exactly as :func:`call_ai` would return it.  Errors end the stream with
+    an error answer instead of raising.
+    """
+
+    def __init__(self, messages: list[dict], api_key: str, system_prompt: str | list[dict]):
+        self.messages = messages; self.api_key = api_key; self.system_prompt = system_prompt
+        self.result: dict | None = None
+        self.usage: dict = {}
+
+    def __iter__(self):
+        with section("ai"):
+            yield from self._run()
+
+    def _run(self):
+        decoder = _AnswerDecoder(); parts: list[str] = []; streamed = False
+        try:
+            resp = http_session().post(
+                f"{API_BASE_URL}/v1/messages",
+                headers=_headers(self.api_key),
+                json=_request_body(self.messages, self.system_prompt, stream=True),
+                timeout=(AI_CONNECT_TIMEOUT, AI_READ_TIMEOUT),
+                stream=True,
+            )
+            with resp:
+                if resp.status_code != 200:
+                    self.result = _error_reply(f"API error ({resp.status_code}): {resp.text}")
+                    yield self.result["answer"]
+                    return
+                for event, data in _sse_events(resp):
+                    kind = data.get("type", event)
+                    if kind == "content_block_delta" and data.get("delta", {}).get("type") == "text_delta":
+                        piece = data["delta"].get("text", "")
+                        parts.append(piece)
+                        out = decoder.feed(piece)
+                        if out:
+                            streamed = True
+                            yield out
+                    elif kind == "message_start":
+                        self.usage.update(data.get("message", {}).get("usage", {}))
+                    elif kind == "message_delta":
+                        self.usage.update(data.get("usage", {}))
+                    elif kind == "error":
+                        raise RuntimeError(data.get("error", {}).get("message", "stream error"))
+        except Exception as e:
+            self.result = _error_reply(f"Error: {str(e)}")
+            yield ("\n\n" if streamed else "") + self.result["answer"]
+            return
+        self.result = parse_ai_text("".join(parts))
+        if not streamed:
+            yield self.result.get("answer", "")
+
+
+def stream_ai(messages: list[dict], api_key: str, system_prompt: str | list[dict]) -> AIStream:
+    """Start a streamed call — iterate for the answer text, then read ``.result``."""
+    return AIStream(messages, api_key, system_prompt)
+
+
+# ── Response cache ──────────────────────────────────────────────────────
+
+def _normalise(text: str) -> str:
+    return " ".join(str(text).lower().split()).rstrip("?!. ")
+
+
+def reply_key(messages: list[dict], *versions) -> str:
+    """Cache key for the reply to *messages* (case, spacing and trailing punctuation of questions ignored).
+
+    Pass everything else the reply depends on as *versions* — tenant, data
+    and criteria versions, prompt — so that changing any of them misses.
+    """
+    turns = [(m["role"], _normalise(m["content"]) if m["role"] == "user" else m["content"]) for m in messages]
+    return DiskCache.key(AI_MODEL, turns, *versions)
+
+
+def cached_reply(key: str) -> dict | None:
+    """The stored reply for *key*, or ``None``."""
+    cache = ai_cache()
+    data = cache.get(key) if cache else None
+    if data is None:
+        return None
+    try:
+        return json.loads(data)
+    except ValueError:
+        return None
+
+
+def store_reply(key: str, resp: dict) -> None:
+    """Keep *resp* under *key* — errors and proposed score updates are not stored."""
+    cache = ai_cache()
+    if cache is None or resp.get("error") or resp.get("updates"):
+        return
+    try:
+        cache.put(key, json.dumps(resp).encode())
+    except OSError:
+        pass
+
+
+# ── Batch ───────────────────────────────────────────────────────────────
+
+class _RateBucket:
+    """Token bucket of ``AI_TENANT_RPM`` requests per minute (burst of the same size)."""
+
+    def __init__(self, rpm: float):
+        self.rate = rpm / 60.0; self.capacity = max(1.0, rpm)
+        self.tokens = self.capacity; self.t = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.t) * self.rate)
+            self.t = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+_buckets: dict[str, _RateBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def _tenant_bucket(tenant: str | None) -> _RateBucket | None:
+    """Process-wide rate bucket for *tenant* (``None`` when limiting is off)."""
+    if AI_TENANT_RPM <= 0:
+        return None
+    with _buckets_lock:
+        return _buckets.setdefault(tenant or "", _RateBucket(AI_TENANT_RPM))
+
+
+def run_batch(jobs: list[tuple[str, list[dict]]], api_key: str, system_prompt: str | list[dict], *,
+              tenant: str | None = None, concurrency: int | None = None, on_done=None) -> list[dict]:
+    """Ask many independent questions concurrently.
+
+    *jobs* are ``(label, messages)`` pairs.  At most *concurrency* requests
+    (default ``AI_BATCH_CONCURRENCY``, never more than the connection pool)
+    are in flight at once, and requests are spaced to stay within
+    ``AI_TENANT_RPM`` for *tenant* — the bucket is shared by every session
+    in the process.  ``on_done(done, total, result)`` is called on the
+    calling thread as each job finishes.
+
+    Returns one parsed reply per job, in job order, each with ``label`` and
+    ``seconds`` (wall time of that call) added.
+    """
+    limit = max(1, min(concurrency or AI_BATCH_CONCURRENCY, AI_POOL_SIZE))
+    bucket = _tenant_bucket(tenant)
+
+    async def _gather():
+        sem = asyncio.Semaphore(limit)
+        done = 0
+
+        async def one(label, messages):
+            nonlocal done
+            async with sem:
+                if bucket is not None:
+                    wait = bucket.reserve()
+                    if wait:
+                        await asyncio.sleep(wait)
+                t0 = time.perf_counter()
+                resp = await asyncio.to_thread(call_ai, messages, api_key, system_prompt)
+                result = {**resp, "label": label, "seconds": round(time.perf_counter() - t0, 2)}
+            done += 1
+            if on_done is not None:
+                on_done(done, len(jobs), result)
+            return result
+
+        return await asyncio.gather(*(one(label, msgs) for label, msgs in jobs))
+
+    with section("ai"):
+        return asyncio.run(_gather()) if jobs else []
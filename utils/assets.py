@@ -1,5 +1,68 @@
-"""Base64-encoded image assets for ChannelPRO™."""
+"""
+Static image assets for ChannelPRO™.
 
-YORK_LOGO_B64 = "/9j/4AAQSkZJRgABAQEAlgCWAAD/2wBDAAMCAgMCAgMDAwMEAwMEBQgFBQQEBQoHBwYIDAoMDAsKCwsNDhIQDQ4RDgsLEBYQERMUFRUVDA8XGBYUGBIUFRT/2wBDAQMEBAUEBQkFBQkUDQsNFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBT/wAARCAB3AjoDASIAAhEBAxEB/8QAHwAAAQUBAQEBAQEAAAAAAAAAAAECAwQFBgcICQoL/8QAtRAAAgEDAwIEAwUFBAQAAAF9AQIDAAQRBRIhMUEGE1FhByJxFDKBkaEII0KxwRVS0fAkM2JyggkKFhcYGRolJicoKSo0NTY3ODk6Q0RFRkdISUpTVFVWV1hZWmNkZWZnaGlqc3R1dnd4eXqDhIWGh4iJipKTlJWWl5iZmqKjpKWmp6ipqrKztLW2t7i5usLDxMXGx8jJytLT1NXW19jZ2uHi4+Tl5ufo6erx8vP09fb3+Pn6/8QAHwEAAwEBAQEBAQEBAQAAAAAAAAECAwQFBgcICQoL/8QAtREAAgECBAQDBAcFBAQAAQJ3AAECAxEEBSExBhJBUQdhcRMiMoEIFEKRobHBCSMzUvAVYnLRChYkNOEl8RcYGRomJygpKjU2Nzg5OkNERUZHSElKU1RVVldYWVpjZGVmZ2hpanN0dXZ3eHl6goOEhYaHiImKkpOUlZaXmJmaoqOkpaanqKmqsrO0tba3uLm6wsPExcbHyMnK0tPU1dbX2Nna4uPk5ebn6Onq8vP09fb3+Pn6/9oADAMBAAIRAxEAPwD0WiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAK9K0f/kE2X/XBP/QRXmtelaP/AMgmy/64J/6CKAPNaKKKACiiigAr2Xw3+zjN4g8L2Otv4ht7KC5gE5WSE4jB9W3V41XqPxG8bySeAPB3hu0uP9HXT0nu1jb7zHIVGx6YJx7igC1b/BPQ7u+js4PiFpM11I4jSKNcszHoB83NdH/wyZef9DHD/wCAx/8Aiq8m+Gn/ACULw5/1/wAP/oQr7poA+S5/gnoVreyWk3xC0mK5jcxvE6gFWBwQctwaueJP2cZvD/he+1tPENvewW0BnCxwHEgHo26vOviJ/wAj94i/6/5v/QzXZfDnxxIvw/8AGHhq7uP3B0957RZG+6wwGRc+uQcexoA8sortvh3o/hXxNq2n6Rqv9rWt5dP5QubeWLytxztG0pkDoOpr2i8/Zf8ACthZz3M2q6ssUKNI53xcKBk/we1AHzDRW7qU3hn7fD9gttWNkrnzftFxF5jr224TCn65r1r4a/Brwb8StDk1C0vNatHhlMMsEskRKtgHIITkEGgDwiivavil8LfBnwvt7Iz3GtX9zeFvLhjliUALjJJKe4rz7wpB4V1DU4bPVo9WgW4uPLSe1mjIjVjhdwKckdyPyoA5aivqNv2VvDKqWOqatgDP34v/AIivJWsfhVHM0bah4nUqxUnyoccHHpQB5tRXv3hf4M/D3xrptzdaL4h1O5aBCzws0aSJxxuUpnHvXgTDaxHocUAJWloFjp+oX3k6lqf9lW5Xi48hpRnPQgHIHvWbRQB7vZfssy6jaQ3Vr4otp7eZQ8ckduSrKehB3VleMPgBa+BdLGoav4qjht2cRrssmdmY5OAA3sa6n9mL4g+ZHN4UvZcsmZrIsf4eroPp94fjXrvxG8Gw+PPCN9pMmFldd8Eh/glXlT+fB9iaAPhy6SKO5lSCUzwqxCSFdpZc8HHb6Vo+HtP0vUrl49U1b+yI8DZL9naYE55BweKz7yzm0+8ntbmNoriF2jkjbqrA4Ird+H/g248d+KbPSYcrG53zy9o4hyzflwPcigD0HWv2f7Lw/oK6zfeMrSHTnVWjm+zMfM3DICgNkkivIbyOGG6mS3mNxArkJKU2F17HHb6V6B8YfGQ8YeJrfSNIDPo+lgWdjDFk+YwwpYAdScAD2HvXVeF/2bzDpD6v4w1P+x7SOPzXt4sb0Uc/Ox4B9gDQB4fRXptxq3wqtbwwQ6FrV5bKdv2s3QRj7hf/ANVdUfgHoXjjw+NY8D6zIytn/Rb7Bww6oSBlT9QaAPCKK1rzRpPDOvPYa9Z3MLQNiaCNgkhGOCrEEY98GvZPhz8FfB3xI8PnU7S91q1KSmGSGWSIlWAB6hORgigDwWivbfHvwz+Hvw61C2s9V1HxA0txF5yfZxCw25I5yo7irPhX4MeBfiJZzP4e8SakLiH/AFkN1Gm9M9CV2jj3BoA8JorufiV8I9X+Gs0b3TJeadM22K8hBC7v7rD+E/zrmtDk0WOV/wC2YL+WIkbTYyojL65DKc/pQBl0V9NaX+zL4T1jTbW+t9V1YwXMSzRkvFnawBH8HvXjnxM0Hw14T1q90bSTqdxeWrhJLi6lj8rOMkBQgPfrmgDiKKv6O2mrd/8AE0hu57YjAWykVH3ZHdlIPfivavEvwf8AAHhHw7batqusaxbfaYlkisy0XnsSM7duzqM89hQB4NRV7WH0175jpUV1FZ44W8kV5M+pKgCqNABUlvby3c8cMEbzTSNtSONSzMT2AFR/rX1r8DPhHb+DtHh1fUYFk126QP8AOM/ZkIyEHocdT+FAHlnhX9mfX9Wt1utYuodDtyNxjkG+UD3HRfxNQal4D+GWjTG3uPG13cTqdrm1tw6g/UAj9a679pr4iXFvND4WsJmiR4xNeshwWB+7H9O59eK+dqAPXLf4J6P4shdvB/jC01S4UZ+x3aGKT/H9MVRtfgNr1npuu3+uwNpttp1rJNGVdXM0gGQBgn5fU15vZ3k+n3UVzazSW9xE25JY2KspHcEV9J+G/ik3xB+EHie1v2X+2bGwkExHHnIVOJMfoff60AfM1FaugyaGkjDW4dQliJXa1hKiFRznIZTnt6V9EWH7MPhTUrG2u4NV1ZobiNZUJeIZVgCP4PQ0AfMVFeqap4d+F2j61daZdal4kjmtpmhkkEcTIGU4J4XOPwrrv+Ga9F8SaLHqXhfxLJPFMu6JrlFdG9iVAIP4cUAfPtFa3ijwvqPg7WZ9L1SDyLqLn1V1PRlPcGn+E/COqeNdWTTtJtmuJ25ZuiRr/eY9hQBjUV7rq3wZ8I/DPRYr7xhq11e3Unyx2dhhPMbuFzyQPUkCub0q8+FWs3i2l1pWr6Ikh2refahIqn1Yc4H4GgDy6ivZPH/7OOoeH7F9T0C6Otaeq+Y0eB5yrjO4Y4cY9OfavKtHfTY7o/2rDdzW+MBbORY3Bz6spFAFCivo/wALfs7+EPFvh+x1ez1LWEt7uPzFWR4ty9iD8nYg1578UfB/hD4favJo8DaxfagsIkMjTRLGhYfKD8mT6npQB5lRV3SH06O6zqkV1Nbbfu2cio+fXLKRivUfEXgPwFoPgfSvEaXeuXSalxb2wkhVsgHduOzAxigDyGiun8Np4UvNSW31WLVoIZp9kc1vPEfLQkAbgU5I7kY+le+P+yv4ZjRmOqathRk/PF/8RQB8uUV7L4W+H/w18aakdM0/X9ZtNRYkRx3iRrvI/u4XBPtnNUfiN+z7q3gmxl1KyuBq+mxcylU2yxL6lecj3FAHlFFFFABRRRQAV6Vo/wDyCbL/AK4J/wCgivNa9K0f/kE2X/XBP/QRQB5rRRRQAUUUUAFFFFAHS/DT/koXhz/r/h/9CFfdNfC3w0/5KF4c/wCv+H/0IV900AfCXxE/5H7xF/1/zf8AoZrnq6H4if8AI/eIv+v+b/0M1z1AHT/DH/konhv/AK/4v/Qq+0fF3/Iq6z/15zf+gGvi74Y/8lE8N/8AX/F/6FX2v4h8j+wdS+1bza/ZpPN8v72zac498UAfAK/dFfTn7KP/ACK2t/8AX6v/AKLFeYCb4R4H7jxL/wB9JXuHwDbww2g6n/wi6aglt9pHnf2gRu37B0x2xQBwX7Wn/H94a/65z/zSvDNF/wCQ1p//AF8R/wDoQr3P9rT/AI/vDX/XOf8AmleGaL/yGtP/AOviP/0IUAffs3/Hu/8Aun+VfCfhvQT4o8bWWkjcFu73y3ZOoUsdxH0Ga+7ZMeS2em3n8q8R+CcHw7/4SS5bRJLuTXhvwNSADhc/N5YHy/1xQB4r4J8TL8PPiBJPvk+wxyTWs4XlmiO5eR3I4P4VxrHczH1OaveIP+Q9qf8A19S/+hmqFABRRRQBe0XWLrw/q1pqVk/l3VrIJY29x2Psen419zeDvFFr4y8N2Or2h/d3EeWTPKOOGU/Q5r4Lr279mTx1JpfiCXw3OzNaX+ZYP9iVRk/gwH5gUATftN/D/wDs3VIfE9nFi3vCIroKPuy4+Vv+BAY+o96zJj/wp/4YiAfu/FXiWPc/Z7a19PYn+ZPpX1Dq2mWmr2MltfW6XVsSGaOQZBKkMP1Ar4d8e+Kbvxl4s1HU7s4d5CiR54jRThVH0FAHrf7L/gWG+urzxNdxCQWr+RaBhkB8ZZ/qAQB9TXR/tUeIpLHwzpmkROVF9OXlx3RAMD6biPyrf/ZtVF+FtmUxk3Exf67/APDFed/tZFv7b8PD+D7PL+e5aAPBq9r/AGW/EMln4uvtILn7Pe25lCdvMQ9f++SfyrxSvSP2eiw+LGk7f7k2fp5bUAezftIeBYde8IvrkMQGoaYN5cDl4SfmU/Tr+Bqn+yp/yJeqf9fx/wDQFr0/x4sb+CdeWb/VGxm3fTYa8v8A2U/+RJ1P/r+/9kWgDjv2rv8AkbtF/wCvE/8Aoxqwf2bbiaH4pWqRFvLltpllA6bQuRn8QK9R+NPgjSPHHjnQ7G78RLpGoy2xjgtmtmfzRvJyGyFB6jBrpvh/8JNK+FNreX9v9o1bUmiIaUqA5Uc7EXOBkj154oAsfHW3t7j4V699oC4SJXQns4dduPfPH418XV6j8XvjXd/EJRpttbPp2kxPuaGQ/vJWHQv6Y9K8uoA+7fh3/wAiH4e/68If/QBXyV8UrG51T4t6/aWkElzczXpWOKNcsxwOAK+tfh3/AMiH4e/68If/AEAVjeDdO8KL408TXGnMtx4hW4/015h88e4D5Uz/AA9sjv1oA8Ft9K0X4MQx3esLDrXjEgPBpqndBZHs0p7t7f8A66858SeJtS8W6rLqOq3T3V1IfvN0UdlUdgPSvbv2ifhIYZJvFmkQkox3ahCg6H/nqP6/n618+0AFFFFAHXfCXQ4/EXxG0KymXfD9oEsinoVQFiPxxX3BXxh8B7yOx+KmiNIcCRnhH1ZCB+tfZ9AHxD8XtQbUviZ4jlZt227aIfRMKP5Vx9dP8Trc2vxF8SRt1F/MfwLEj9DXO2qRSXUSTymCBmAeRU3FV7nHf6UARVd0zWbzRzcmznaD7TA1tNjB3xt1U/lXpfgv4K6T8QBONG8YJLLAAZIZbBo3UHocFuR9K6K7/ZVksbWa5uPFEMUEKGSSRrU4VQMkn5vSgDwRvun6V96+Cf8AkTdB/wCvC3/9FrXxB4j0/SdPmRNK1dtXQg75GtWgAPbGSc5/Cvt/wT/yJug/9eFv/wCi1oA+LviN/wAj94i/6/5v/QzXvn7KdxPJ4R1eJyxgjvf3eegJQFgP0/OsH/hSuifELxt4hltvFe6aK8drq0jtCrxEseAWPIzxkAivS9TutK+AvgFPsOmXV5ZwvhvLILF2/jkY9ATxnHpQB5t+1pb26z+HJxj7WyzI3qUG0j9Sa9N+CvgWHwT4KswY1Go3qLcXUmPmyRkL9FBx+dfLHjLx1ffETxVHqWplUj3rHHAn3Io933R+uT3r7ijwI0A6YGKAPj39oLxFLrnxKv4S5MGnhbWJc8DAy35kn8q82rpvicWPxE8SFuv2+br/ALxrmaAPr/8AZ18RS698N7aKdy8thK1ruJydowV/Q4/CvGv2jfAsPhXxZFqNlEIrLVFaQoowFlB+fHscg/ia9B/ZPLf8IvrgP3ftq4/79il/auWP/hF9EY/60XjBfXGw5/pQB23wN/5JV4f/AOuLf+htXzx+0V/yVbU/+uUP/oAr6H+Bv/JKvD//AFxb/wBDavnj9or/AJKtqf8A1yh/9AFAHmlem+Mv+SJeAv8Arvd/+hV5lXpvjL/kiXgL/rvd/wDoVAHnWn/8f9r/ANdU/wDQhX6A3P8Ax7y/7h/lX5/af/x/2v8A11T/ANCFfoFMAYZATgbTk+nFAHwboM00Hi7TpLcsJ1vozGV67vMGK+8LqOOa1mSYKYmRg4boVI5z+FfMPhG1+GXgvXl1i88UTazdW8hkht0sZEVXzwTxyR25Aq58TP2kTr2mXGleHbaa1gnUxy3s+BIVPBCqOmfU0AeIXyxpe3Cw8wrIwT/dycfpUFFFABRRRQAV6Vo//IJsv+uCf+givNa9K0f/AJBNl/1wT/0EUAea0UUUAFFFFABRRRQB0vw0/wCSheHP+v8Ah/8AQhX3TXxx8OV8GeH9a0zWtW8RTSS2rLP9ihsX4kA4BfPIB9BziveP+GkPA/8Az/3H/gK/+FAHzD8RP+R+8Rf9f83/AKGa56vRviJH4M1/WtU1nSfEU0ctyWn+xTWL8yEZ2h88An1HGa85oA6f4Y/8lE8N/wDX/F/6FX2j4u/5FXWf+vOb/wBANfIfw0PhnRdc0vWtZ11oWtZRN9ihtHdtwPAL9MdDxXveoftBeBNS0+5tJL+5EdxE0TFbV84YEHt70AfJC/dFfTn7KP8AyK2t/wDX6v8A6LFeBalouh29/BHZeIlurSRyHmezkQwrjgsvf04r2j4S/EbwN8M/D89i+t3F9cXE3nSyrZOqjgAAD04/WgCD9rT/AI/vDX/XOf8AmleGaL/yGtP/AOviP/0IV7V8YvGngn4oQ6c0GvTWF3ZFwpkspGR1bGQccj7orzTwjp/hyPVYLrV/EBtoLe5DeVDaSO8qqwIIPQZx35FAH29N/wAe7/7p/lXwr4X8QHwt44stWywW1vfMfZ1KbiGH5E19PH9o7wMRg31xj/r1f/CvD77RPhfdahPPH4p1aCKR2cQix3bcnOM4oA4G6V9c16cWUTzSXl03kxgfM25ztGPXmtP4geG4fCPiabSIWZ3tYolmYtnMpQF8e2Sa9e8B+JPhJ4BuheWt1e3moAYW6urdmKeu0AYH16143461yPxJ4y1nVISWgurl5Iywwdufl4+gFAGFRRRQAV3/AMB/+SraF/vyf+i2rg4VSSaNZJPKjZgGkxnaM8nHfFes/DK78C+A/EkWs3fiae/mgVliii0+RFBYYySSexNAH1fN/qn/AN01+fd9/wAf1z/11f8A9CNfW/8Aw0d4HPH264/8BX/wr538VaT4Pmur+80jxNK4dnlis57Bw2Sc7N+cfiRQB6l+yz40hjjv/DNxIElZ/tVqGP3sjDqPcYB/Or37VmhyXGh6NqyKWW1maCUjsHAIP5rj8a+cbC/udLvILu0me3uoWDxyxnDKw7ivetD/AGhtH8UaBLonjiwYpOnlyXVsu5H/ANoqOVPfIz+FAHz7Xsn7L2hyX3jq51Lb+4sbZgWxxvfgD8g1ZNx8PfAs10ZbT4hW8ViTnZPaOZVHp2yfwrttP+MPgz4U+GzpXhKCfWbonc91KpjSR/7zE8n6AUAdt+0R4zh8OeBbjTkkH2/VB5CIDyI/42+mOPxrH/ZU/wCRL1T/AK/j/wCgLXz5rXiO78eeJDfa7qIhaY4MzRsyQqOiqi84+le2fCn4leBvhr4bfTjrVxezyzGeWZbJ1XJAGAPQAUAY37VEz2/jPQpYnaORLPcrqcFSJCQRXrPwX+JifELw2FuHUaxZgR3Sf3/SQD0P8815F8YvFHgv4m3VjeWviCWxurWNois1lIyOpOR05BBz+deZeCfGF34C8T2+q2L+Z5TbZI+izRk8qfqPyOKAPVf2jfhZ/Zd23inS4cWk7YvYkHEch6SfRu/v9a8Jr61vP2gvAGr6dLa3k88kFxGUlhktWIwRyDxXz5qHh/wfJq0v2PxW0WmM25PNsJGlRSfu8cEj1oA+u/h3/wAiH4e/68If/QBXy74w8XX/AIJ+N2t6tp74mivGDRk/LKhAyjexr2fRfj54D0PR7LT4tQunitYUhVmtXyQoAyePavC/irceGvEHiDUdd0XWnne7kEhsprV0YMcA4bpjjPNAH1j4R8Vab8QPDcOo2ZWW2uFKSwvglGxhkYf5zXy/8bvhQ/gDWPttjGzaFeOTERz5Dnkxn29Pb6VpfAjx5onw9N9c6rrUsaXaBTp8ds7BWB4ct0zjPT1r07Xvjl8OfE2k3Om6jPNcWlwu10a1f8wccEdjQB8oUVv+LNN0Gxug2gazJqls7HCTWzRSRjtknhvwrAoAsaffTaXf215bP5dxbyLLG3oynIP5ivuL4f8Ajaz8feGrbU7R1EhAW4hzzFIB8yn+ntXwrXQ+C/HWr+AdUF9pNx5ZbiWF+Y5V9GH9eooA7z9pTwlLovjg6skZ+x6ogYOBwJVADL9cAH8a8ir6Tj+O/gz4haG2leLtPlsRJjcdpkjDf3lZfmU/hXD3vwz+H9xMZNP+IdvBAxyI7qLLL7Z4/lQBd/ZVY/8ACeakM8HTW4/7ax1738VSV+G/iMjj/QZP5V5D8Orr4d/CW/udSXxg2rXk0BgKxW7bQpZWOAAecqO9R/Ev9o7TNe0C/wBG0bT55Vu4mhe6usIFU9SqjJJ+uKAPn1vun6V96+Cf+RN0H/rwt/8A0WtfEPh/TdK1CRxqmsf2TEpXBFs8zODnONvTHv619P6X+0B4D0nTLSyi1C6aO2hSFS1q+SFUAdvagDwy98ZXngP4x6xq1mdxj1CZZYc4EsZc7lP+euK+sdOv9K+IHhVJ4wt5pmoQ4ZG9CMFT6EdPqK+RPiQPDWq63qesaLrrXBu5jMLKa0dGBY5YBumOprd+BvxdT4f309hqjyNodzl/lUsYZMfeA9D0P4GgDm/il8Pbn4deJpbFt0ljNmS0uCPvp6H/AGh0P596+q/hL40h8b+CbC8Vw13CggukzysijBJ+vX8a84+I3xO+HPxG8PPp11qFxBMp3290LNy0T+vuD0Irxbwj461D4a+IprnRbxby23bJFdCsdyg9VPIPoeooA1/j1ocmifE7VWZcRXhW6jbHBDDn/wAeBrzyvoDxN8Q/APxi0i3i12W48OatB/qrkxmRUz1GV+8p9CBXI6X4F+H+m3i3Gr+Oob+zQ7vs1lbOHk9iecUAezfs16HJpPw4juJVKPf3D3C5/ucKp/8AHc/jXlv7TXjOHXfFFro1rIJIdLVvNZTx5zYyPwAH4k1qeOP2ko/7L/snwdZvYQKnlLeTKFZFAxiNO3Hc/lXg8kjSyM7sXdiWZmOSSepNAH2T8AbxLz4VaNsbJiEkTexDnj9RXgX7RsLx/FS/ZhgSQQsvuNmP5im/B34xy/Da4mtLuF7vRrht7xxn54n6blz146j2r0nx1rPwv+LUFvc3XiA6XqEK7EnMbK4XrtYFcEZ96APmqvT/AIlRnR/hr4A0eYbbryJr14z1VZGBXNTR6f8ADPwbcretq954vniO6Kyig8qFmHTex6j/ADzXC+MvFt7421+41W+KiSTCpEn3IkH3UX2AoAzNP/4/7X/rqn/oQr9Abn/j3l/3D/Kvhrwfp+gTXUFzrettp8UUwZreO1eV3UEHgjgZ6V9NN+0b4GdSpvrjBGD/AKK/+FAHyNc/8fM3++386irofFem6Fa3Es2i62dSiklJWGS1eJ0U5PJPBx04rnqACiiigAooooAK9K0f/kE2X/XBP/QRXmtelaP/AMgmy/64J/6CKAPNaKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKM0AFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRnNFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFelaP8A8gmy/wCuCf8AoIrzWvStH/5BNl/1wT/0EUAea0UUUAFFFFABUtvdzWMyz28jQzJyrr1FRUj/AHW+lAH018cLg6b8JdGurRI7a6umgE00MaqzAxkkZA7muG8E/BfSviD4LfUdM1K4t9ZCuFs7goUZlOM5AB2k8Z7Zrtfj5/yRrw1/v23/AKJNeQ6P4sv/AAXp3hXVdOk2Twy3W5D92Rd65RvY0AZ+keHrNYdfj1iG+t77S4TKYomVcsHVNjAg45bOR6Vv+GfBfhfX9e0HRBeak19qECyTSxGPyoHKltvIycAfrXpHxDXQfG3w71bx3pJ8m8ms1tLuEYzu82M4b/aXGM9wRXlfwP8A+SqeH/8Arq3/AKA1AGh4r8DeF/DXiTWdBe91Jb2ztmlgnkMflSuIw4QjGRkcfWrlv8MfD5+FI8aTXGphQdrWcbR5z5mzhiv41mfH7/krGt/9sv8A0Utei6PeW9h+zCk93Yx6jbpPlraV2RX/ANJ6Eqc0AeTalo/huHRYL22fVEuVulgubG6MauqMhZXVgOc47iur+IHwz8LfD2fRlu7zV7mHUU8zzIvKBiXjnBHPX9K5Dxo6eJPE+t6vpsQXTUaKT5fuxqwVVT654x7GvfPiLD4ZvfE3gWz8TW8j281uVimExRFf5MBx3UnjqKAPGvid8L4/hrqWmSPdyalo9+peORAI5cDGRzkZwwINdB40+BMGn+Dk8QeG7+fVIoxvubeUKXRcAkjb3XuKg/aRbXk8YRQ6ns/suOM/2b5KbU8s43A/7QwAfoKn8J/FKT4e/ES+huy0uhXhjW5i67D5ajzAPUdx3FAHnt5pmlR+D7LUovtn26e4kt2VnTyl2Kjbhxk539Patbwj8Mb3xZ4O8Q67DuC6aoMUYH+uYfNIPwXn6muw+Ong+w0GHQ49BIms9Vu5rq3ij5UF1iG1fYkZH1ro/hT4gsvC/i638O/21Yy6Y9sLFrVfM3NdZy7cpt5YsvXoBQB4todjoTaHf32rz3gmjljit7azKBpNwYsSWHAGP1rvPGvwv8MeCfD+havcXWrXEGqbTsjMQaIFA3cc8GuQ+K3g9vA/jbUtOC4tS3nWx9Ym5A/DkfhXqHx9/wCSX+BP9xP/AESKAOa8BfCvQPG/jDWdGi1G9FvaRieC7jKHzIztxkY4PzVneE/hQnjDWtZaG5l07w/pLOtxeXGHf5c5CgADOBn2rpv2U/8AkctX/wCvD/2otdL8PLiPVPhj8QtKtD/xMUubx2jX7zBgdpx/wEj8KAPLvCfhfwp46146JYzanpd1MG+x3V28cqSsATh0CgrkDsTWl4K+EdlqfizVPDfiK5udK1GywVlhZDFICwCgbhnncMeua574NWst58TvDiQglluRIcdlUEk/kK9A+NGrQXfjLxe1nJ+8tdMtonkjPIkE6Hr6jI/KgDhvEnw4bwT48g0TWRcPYXEqrBdW+FMkbMAGGQRkdxXMatYwjXp7HTUnkRZzBEsxBdzu2joB1PavoPwH4j0744+G7fRtcdYvEmlOlxDcYG6QKR849c9GH415H4dtI4de13Wri5hsksZZFt5rjds+0uzBPugnKjc3T+EUAQfE74c3Pw31aytZnM0dzbJKsh6b8YkX8G/Qitv4QfDLSfiRDqa3V1e2c9iiuWhKFXBz2I4PFeg+KrNPil8D4LyK8h1TWdCGZJrfcd+0AOPmUHlMN06isr9lj/WeKv8Ar3j/APZ6APDb4QLdyi2WRYFYhRKwZuPUgCoDyDV/T9Ln1zW4rC1XfcXExRB25J5PsOv4VRYbWIznBxmgD2LwX8QrvxN8TvD2nwiKHRMx2/2X7PGN4WLBLHGSSwJ61tfG3xlfeBfiZYR6cII7BbWKaSzNvGY5Mu4bII7gCvN/gx/yVLw5/wBfP/srV1X7UX/JSLf/ALB0X/oclAC+FPh7oPxKsPFfiEz39ktlNLP5Mfl4dSGkAGR8vAxXHf2R4avfD+oXNvJqtnqEMAuLeK88to513hWwVAORn9K9R/Z5dY/hz45Z0EqKjFo2JAYeS3GRXmPia8tfGNxoQ0bT47NLfTcTWcTFlh2M7OSx5wRzk+tAGtB8MbLw74Lg8TeLLm5t4rwgWem2YUTTZGQWZgQoxz06Vk2Oj+FdY03Vbu3n1GzuLG3M62FwyP543AHbIAMYznBWvUv2lmTVvCXhLVLH95ph3BWT7o3IpX9FI/Cvn6OKWRJWjRmEabnKg4VemT6DkUAen/EL4YaL4M8G6LrcFzf3UmqBCkUjIojym7khefSnax8MNE034U2XjBLjUHe62qtozR4VixHLbeRwa7j4uahaaf8ACjwS13pkOpq0UQVJpHQKfJHI2EVB45uIrr9mfRZYLZLOJpoisEbMyp878AsSfzoA5zwn8E9M8eeBzqmk6lcRayY3ZbG4KFSysV6gA4JHBrg9H0GxNpry6rFfQ3+mReZ5MTKoLeYsexgVJBBb9K19K8X3/gez8H6rp74liS5Dxk/LKhmOUb2NeseNm8O+JPCNx8QdNwjzxwQXsAA6i4iY7v8AaG0j3BFAHmet/DXT/APhnTtS8TS3Uuo6jzb6ZZsqFFABJkdgeeRwB1NR3XwztdY8Ct4s8Nz3E1rbMVvdPutpmhxjJVlADDBB6Diu0/an/wBNm8MajA3mWM1vII5F5U5KsP0NWvgjcR6L8G/F+oX58uydpFUt0Y+UFwPqSBQByGsfDDQ9N+FVl4xW41B3utiraFo8KzEjltvTivNdL0251rUraws4jNdXMgiijHdicCvc/FHH7LPh8H/npF/6G9cJ8D41tfHenatc7UsLWdYZJZOAJJQyoPrn+VAEnjLwT4e+G91a6Zq019q2rPEstytjIkMUAPQDcrFj+VVvHnwx/wCEb0HTfEelXb6j4f1BVKSyJtlhYjhXA47EZHcVoftGWstv8VNQeUEJNDC8ZPQrsA4/EGu81C8t9B/Zo0SHUQPMuJIzFE33mHnmTgf7n86APPrv4Z2Xg7wfZ654qnuluL8/6JpdntWQjGdzuwO0YxwB3FZem6H4X17S9Vuba6v7C9sbVrhbC4ZJBPjH3ZABjGeQVr0n9qJhqNn4V1O1YS6dLHII5E5XLBWH5j+VcV4f+F1lrPw81DxYNZuIIrLck1t9lBYkAcA7+h3CgDQuPhPo9/8AC2Txdod3fXssa5ms5Cn7kg4fOF5x19xzXE6TpGmN4Xv9U1E3SOkiwWghZQs8hGSDkZwo5J9wO9eifsz+I5rfxXd+HnXz9N1KF2aN+gZVPOPdcg/hXF/FZYtO8XXeh2cfkaZpLtb20IOcZO5mJ7kk/oB2oA5COR4ZFkjYo6nKsvUH1r6W1DUprX9nG11yLyk1YQxf6Z5KFz++C5ORzxxXzNX00+oyaT+y/ZXUcUEzxwxYS4iWVDm4A5VuDQBn+MND03xV8BrXxTqNlbWWupbrILiGIRGRvM24IHXcOfx4ryrWPhle6R8N9J8VPu23kzLJER/q4z/q2/HB/MU9PFGt/E3WLHT9b1RhpUJ82VFURwwQoMu21RjhRgfWvY/h3qVr8RPDniXwpe6pZXv2gNNaR23mfuIzgKo3ovCELjFAHiPwx8K2PjbxZbaLeyXEAuQ2ya3K/KVUtyCDnpXWWvwx8MXvxGvPBov9Utr6NmSK6dY3jdgm7BUAEcZ79qpfBHT59J+M+n2Vynl3FvJPFIp7MqMDXrvhy10C/wDiz4ve2hEHjC1ZjbSXUheJwY1G8JxgjOD7GgDxnWPAeieEb6LStZu7241d7xrcpYlBGseV2SHcCcnd09q3PGvwv8J+BfFel6Nf6hqpS+QP9rXytsWWKjIx0zXEaxJq83xGdtdDDVzfoLgEY+beBwPTGMe2K9E/as/5HLSP+vH/ANqNQBn/AA3+EOifEPSb4rql1Y6nbyyQRxsUaOUqMhhxnHIzXI6b4OisfE2o6J4hiu7a5tIZpP8ARmUcxoX/AIgchgOCPWjR9ZvPD3hOy1Gwma3u7fVy8ci/9cRwfUHoRXtl9qGifFnwTP4uhVbXX9LsLiG6hXr80TDafVedyn6igDzX4W/DPRfiFpWtXUtxf2T6aokKxsjB1IYgcrwflrn7fSfC+oaNfzxPq1lex27T2qXRjaO42sAyggZBGT+Vel/sysF0DxqWXeogjJU8Z+SXivNvEV5a+Mo/DdtounR2DwWckctpE5ZUKuzM5J5wR82TQB0k3wz8PWvwttPGUtxqjJMyo1pG0eQS5XhivTiqPir4V2ll8P7Lxjol/Pc6bMQJbe7QLLES23qvBwwxXoNvNpkX7NmiNq9vNc6cbpBMkEmxwpmbkHHUelVPjta3WleAdCtvDxiPgdkUjyQS2/qpdieQc5+vXtQBwGreBdP8HeG9D1HWodRu5NWi84GzdI4oF4wpLK25yDnHArnfF2j6do95ZjSr2S/tLi1S4EsqBGBYnKkDoRjFeq+Evi8fCOnW3hTxrpi6lpPkRtFOEDkQuoZcqfvAA9RyMd65T43eDNI8J67p9xoUmdM1S2F1FFkkRgn+HPO05yM+9AHnFFFFABRRRQAV6Vo//IJsv+uCf+givNa9K0f/AJBNl/1wT/0EUAea0UUUAFFFFABUtrcfZZ0l8qObac7Jl3KfqO9RUUAdvrvxi8ReJdHXS9SNlc2C7dkJtFATAwCMdMCsDUPE1zqWj2mmSW9oltaljCYoArruILfN1OSOc1j0UAaWn+IL7TNL1LToJytlqCKlxCeVbawYH2II61L4Y8UXvhHVI9R05YBeR/6uWaIPs4wSAfY1kUUAbXirxZfeMtUbUdSED3rAB5ooghfAwM49hW1b/FrXrXw6NBRNPOjgY+yPZoynndznqc81xdFAHU3HxF1O40ldL+z6dFp4mWc28NmiK7rnBbHJ696Xxb8Sta8cW9vFq5tZxbjELpbqjRg4yAR9BXK0UAdhqvxV17XtHtNM1R7XUrW12+V9pt1ZxgYB3dTx+dYXiDxBc+JdQa9u47dLhgAzW8QjDYAAyBx0ArMooA6TS/H+r6THpSRyQzrpbvJZ/aYhJ5JbGcZ+nHpk1mQ65NBrS6pHDbrcrJ5yqI/3YcHOQufXms6igDqvFnxJ1nxxNay6yLS7ktv9W/2dVOP7pI6j2qTxH8Udc8WaPBpmpfZJrO3AECrbKpiwNo2kdOK5GigDpvB3xC1jwHJNJoxt4J5l2PNJAHcrnO3J7ZqCx8cavpXiF9a0+4XT7+QkubZAqPk5OU6EE9qwKKAOvt/ihqunzXNxpttp2k3typWW7srUJKQeu0nO3P8AsgVk6b4qvNLtL+3SK1nW/G24e5hEjuM7vvHkcjPHesaigC7o+sXnh/VLfUbCZre7t33xyL2Pp7j2rRvPGV7faKdKkgs/shna5+W3AfzW6vu65xxWDRQB1nhH4na74Hs7i10h7aCK4OZvMgVzJjIGc+xNSeGvinrng9rs6OtlZG6bdNttVO7rgc9ByeBXH0UAdbYfEzVdKmmnsrXS7SeVGRpobCMPhhg4OOOvauSoooA2PDHii88I6kmoaelv9sjOY5poRIYzgjK56dau+MPiBq3jqSObWPss9xGoRZ44FRwuc7cjtkmuaooA67wx8Utc8H6XPp+lm0htbj/Xq9srmXjHzE9eOKiT4japb6bfWNrb6dZQX0RhnNtZIjsh6jcBkVy1FAHUaD8SNb8P6TLpKSw3ukyfesL6ITRfUA8j8DVW+8ZXl5b/AGWO2srKxLB3tLS3EccpHTf3YexOKwaKAOv8QfFLXPFGj22maiLOeytseRGLZV8vAwMEe3FLefFTXL/wzH4fmWybR4wAlsLVQFwcgg9c5rj6KANfUvE1zqul2eny29olvZ5EJhgCuuTlvm6nJ9aisfEN/p2k6jpkM5FjfhRPCeQSrAqw9Dx19KzaKAOl0/4gatZ6GNGn+z6npKtuS0v4hIsZ9UPVfwNM1zx5q2v6fa6dNJFb6XbHMWn2sYigB9So+8fck1ztFAHat8Xdek8Pw6G6afJpMIAS0ezRkXByOvvWZqnjvUtV0EaM0dna6eJluPKtLVIsyAEAkjk8E1ztFAHWS/ErVb+0tLfVYbLWxaDbBJqEAkkQem4EEj2OazfFHjDVvGF1HPqt2Z/KXZFEqhI4l9FUcAVi0UAdLpPxB1fS9FbR2eHUNIY7vsN/EJY1PqueV/Aip7j4maxJ4cn0G1W00zSJzumtrOAL5hOM5Y5PYd+1cnRQBu+E/Geo+Cb/AO3aWLeO8AKrPLCHZQRggZqv4k8SXfirU5dQvkg+2THdLJDEE3n1IHHasqigB8cnlyK+1X2nO1hkH2NdrN8YvEVx4fGhSfYG0gIIxafY02BQcgfnzXD0UAbWi+K7vQbe/gtoLRo75DFP50AclCc7AT0GcdPSneFPGWo+C9UOo6V5MV5tKiSSIPtB6gA1h0UAdfH8Utbi8UN4iRbFdYYYNyLVc9ME46ZI4zVS6+IGs3XiqLxGJYrfWEfebi3iCbzjHzDoeBiubooA6jWviNq3iLXrfWNQjsrjUIMbZfsyjODldwHXHbNN8Y/ETWPHjQyaybaeaEbY5kgCOq5zjI7ZrmaKANdvE1y3h8aN9ntBZiTzgwgHmb8Y3b+uccVFoviK/wDD7XZspzEt3A9tOnVZI2GCCP5elZtFAHWeE/idrngixntdINrbxXGPOLW6u0mAQNxPsTSW3xI1SxtryC0tdMs1u4mgmaCxRXZGGGG7GRkelcpRQB18/wAUtbufC6eHZFsjoyABLUWqgLg5BB65zznNR6X8Ttf0nwvL4djnhn0eTcDbXMKyDB5IBPIGefY1ylFAHU3fxE1HVIbWHUbTT9SitI1it1uLYZiVQAAGBBI46EmsjX/EV/4m1D7ZqM/nShFjQKoVI0HCoqjgAegrNooAKKKKACiiigAr0rR/+QTZf9cE/wDQRXmtelaP/wAgmy/64J/6CKAPNaKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAr0rR/wDkE2X/AFwT/wBBFFFAH//Z"
+Images are served by Streamlit's static file server from ``static/`` next to
+``app.py`` (``enableStaticServing`` in ``.streamlit/config.toml``) and
+referenced by URL, so they are downloaded once per browser instead of being
+inlined into the page on every rerun.
 
-LOGIN_BG_B64 = "/9j/4AAQSkZJRgABAQEAYABgAAD/2wBDAAMCAgMCAgMDAwMEAwMEBQgFBQQEBQoHBwYIDAoMDAsKCwsNDhIQDQ4RDgsLEBYQERMUFRUVDA8XGBYUGBIUFRT/2wBDAQMEBAUEBQkFBQkUDQsNFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBT/wAARCAN2BQADASIAAhEBAxEB/8QAHwAAAQUBAQEBAQEAAAAAAAAAAAECAwQFBgcICQoL/8QAtRAAAgEDAwIEAwUFBAQAAAF9AQIDAAQRBRIhMUEGE1FhByJxFDKBkaEII0KxwRVS0fAkM2JyggkKFhcYGRolJicoKSo0NTY3ODk6Q0RFRkdISUpTVFVWV1hZWmNkZWZnaGlqc3R1dnd4eXqDhIWGh4iJipKTlJWWl5iZmqKjpKWmp6ipqrKztLW2t7i5usLDxMXGx8jJytLT1NXW19jZ2uHi4+Tl5ufo6erx8vP09fb3+Pn6/8QAHwEAAwEBAQEBAQEBAQAAAAAAAAECAwQFBgcICQoL/8QAtREAAgECBAQDBAcFBAQAAQJ3AAECAxEEBSExBhJBUQdhcRMiMoEIFEKRobHBCSMzUvAVYnLRChYkNOEl8RcYGRomJygpKjU2Nzg5OkNERUZHSElKU1RVVldYWVpjZGVmZ2hpanN0dXZ3eHl6goOEhYaHiImKkpOUlZaXmJmaoqOkpaanqKmqsrO0tba3uLm6wsPExcbHyMnK0tPU1dbX2Nna4uPk5ebn6Onq8vP09fb3+Pn6/9oADAMBAAIRAxEAPwD83KKKK9g5AooooAKKKKACiiigBQM0oGKAMUtNAFFFFDAAM04DFAGKWmkAUUUUxXsFFFFBmFFFFUgFAxS0UUAFFFKBmgQoGKWiimSFFFKBmmgFAxS0UUwCgDNLtpQMUAFFFFWlYBQM0oGKAMUtUSFKBmgDNKBigAAxS0UoGaAADFLRRVJEtigZo20oGKWmIKKKUDNACAZpwGKAMUtOwrhQBmgDNOAxVAxAMUtKBml20BsJtz1pQMClopokKUDNLtoAxTAAvPNLgDpQBk0u3HWnYBMUu2nZpKaC4YA6UUUUxXCiijBPSmIKM08Rk0uzHWiwDACaXaakHFGfYUWAj8oUojAp9FUAYX3owB0oooFcKKKKdguFFFFFguFFFFFguFFFFFguFFFFFguFFFFFguFFFFFguFFFFFguGF96QqDS0UgGGMGk8vHSpKKBkRUikPHapjz2pCoNTYCKinmMik2GiwDaKMEdaKLAgowD1oopDuNxRT6QjJqbDGEZpNtP256UhGDRYBlFO20hBzxSAaQMcUmKdRmlYaYwjNJtpxXjikwR1pWHuNopdtIRigNhu2kIxT6QjNTYY2iiikA0jFJTyM0mwnpQNDSM00jFOoIzSaHcbSEZpxGKSpGMopSMUlACEZpCMU6kIzSauCG0UUVPKyhpGKKcRmmkYqQEIzTSMU+kIzQA2iiikwEPNIRinUmM0hobRRRSKAjNNIxTqCM0ANooooAKKKKkAooooNE7jSMUlOIzSEYpNDEoooqQEbpTaeRmmkYoASiiigAooooAKKKKACiiigAooooAKKKKACiiigApy9KQDNOAxQAUUUU7AFKBmgDNKBihALRRRVCegUUUUEbhRRRVCADNOAxQBiigAooooAUdadSYxS0EsKKKUDNVYQoGKWiimAAZpwGKAMUUAFFFKBmqSuAoGKWiirJuFKBmgDNKBigBaAM0AZpwGKaAQDFLRSgZp2JuKBiloopiClAzQBmlAxQAAYpaKUDNVYTEAzTgMUAYpQM0w3DFKBilzRVWFcKKUA55pw4FACAYpaAM0u2mhBtpQMUUU7AFFFFMm4UU7YacE45poBgBNOCcc08cUU7AIFApcAdKKKACiiimhBRQAc80u2qsK42jPsafijaT0AosFxuDS7afsI60baVhDNgo2Cn7aUcCmA3FGKfn2FGfYVSAZto206iiwDdtG2nUVIDdtG2nUU0A3bRinUZp2AbikKZPSpM+woz7CiwEO0ehpduOlPxRtqQGbaQ8GpNtGzNKwEWfY0U/FGKdh3G0UpXjikwR1pWC4UUUUhoQjIpNgp1FIZGUIFJipaTFFgIqKdsNIRg1ICUUUUBcCM03FOpc0rFEZGaTbTyMUlJgMop22kIxSGMxSU+gjJosBHtpCMU6gjNQNjaQjNLRRYEMopSMUlSMQjNIRinUhGaAG0hGaWilYaG0hGacRikqShlFO20hGKAGkZpCMU6kIzQA2iiioasUNIxRTiM00jFSAhGaaRin0hGaAG0UUUrAIRmm0+kIzUlJjaKKKBgRmmkYp1I3WgBKKKKLAFFFFSVHcKKKKCxpGKSnN0ptQAUUUVW4DSMUlObpTakAooooAKKKKACiiigAooooAKKKKACiilAzQA6iiimgCiilAzSAdRRRVIAooopkN3CiiimiQpV6UgGacBimAUUUUAKBmlHFGMUtMVwooopokVetOpAMUtMAoAzQBmnAYoAKKKUDNWlYBQMUtFFUSFKBmgDNKBigBaAM0AZpwGKdgCilAzS7aolsAMUtFFAgAzS7aUDFLVJAFAGaAM04DFMBAMU4DNAGacBinYVxAMUtFKBmmhBtpQMUtKBmnYQbaUAY5oopoLhRRRTFcKWnCMmnBdop2ENCc804KBS0VQgooooC4UUAHPNLtFNCuIOTS7acBk8Uu3HWqEMCgHinYpwGDRQAgXnmlwB0oowT0poAopQDnml20wG0DmnYpwUkcUkK4zbRtp+w0bcdaYXGbaNgPWn7aNtAXGbBRsFP20o4ppXC5H5Y9DR5Y9DUufYUZ9hT5WFyLyx6Gjyx6Gpc+woz7CjlYXItgo2CpDyKTbSasFxm2jbT9tG2kFxm2jFP256Uuw0BcizRTsUbamwXG0U7b6U0qQaLDEKg0m3HSnUUWAYy8c03YKlpMUWAjIwKSpCvHFN2+tJoBKKUrxxSYI60rDQUYB60UUrDGGMGkKYqSkIzQMizRUhTjimFSKmwCUUUUhoTbSEYp1BGaBke2kIxT6QjNSA2kIzS4I60UhoZSEZp+2kIxUgMopSMUlIoaRikpxGaQjFSAlIRmlooAZSEZpxGKSk0NMbRS7aQjFSUNIxSU4jNIRigBpGaQjFOpCM0AhtFFFS1coaRiinEZppGKgBCM00jFPpCM0ANoooqQEbpTaeRmmkYNIaEooooKGkYopxGaaRigAoooqbAFFFFBSdgpCM0tFIsZRRRUgFIRmlop2AZRRRSAKKKKACiiigAooooAKKKKAFXrTqQDFLTQBRRRQwFXrTqQDFLTAKKKKZLdgooooRAUAZopV6VQC0UUUAFOXpSDk04DFArhRRRTRIAZpwGKAMUtUAUAZoAzTgMUAFFFFUlcBV606kAxS1ZNwpQM0AZpQMUALQBmgDNOAxTQBSgZoAzTgMVRNwooooEAGacBigDFLTSAKAM0u2lAxVC3FAzSgYoAxS00LYKUDNAGaUDFMQAYpQM0AZpwGKpAFFFFMApaAM09Rgc00SNUZPNO2ClpaYBRRRTJuFJmlAzTsVVguJtz1pVXjinbaUDFAhAvPNLgDpRRgnpTQBRmnbaMVQCbaNg70/YR1o20rE3EwaMGn5pKYXF2rSYx0pQDnml21pyoLjaM+xp2KXFHKhDdtG2nUUcqAbto2A9aeFJpdho5UBHsFKFAp+wjrRtoSsA3C+9GF96dto20wG4X3owvvTttG2gCPYKNgqTbRsJ6UmrgR7aNtSbDSEYNHKgGbaMU6jNHKgGZop2KNtHKgG4X3pCOeKftz0pCpFQ1YdxmDRtB6g0+jPsKQXIsGkwak20u09qAuRUU7bSEHPFJlDSM0m2nUVIEW0dqMGpMUhBzxQAyil20hGKLDuFFFFQUMZQBxTcVLSYosBFRSlSBSVIBSEZpaKCkNpCM07bSEYpWAZRTttIRipsAwjFJTyM00jFKxSGEYopxGaaRipsFxu2kIxT6QjNKwxtIRmlopAMopSMUlKw0NIxRTiM00jFSUNIxSU4jNIRigBpGaQjFOpCM0ANooorIobRSkYpKAEbpTacRmkIxQAlFFFSA3GKSn4zTTSKTEpCM0tFAxtFKRikoAKKKKkAooooNRCM00jFPprdalgJRRRRuAhGaQjFOprdaGAlFFFIAooooAKKKKAClAzSGnDpQAtFFFO4BTl6UgGaUDFFgFoooqg2CiiigzeoUUUVQhQMUtFFABSgZpKcvSgTFooopkhTl6UgGaUDFUAtFFKBmgBaKKKqO4CgZpQMUAYpaskKUDNAGaUDFAC0AZoAzTgMU7AFKBmgDNOAxVE3CiiigQAZpwGKAMUtUkAAZpwGKAMUoGaZO4AZpQMUAYpaaHcAM0u2lAxS0yQAzTgMUAYoqkgCiilCkimSAGacqAjmhUIPNOAxVIACgGloopiuFFAGTS7RTQrhtz1pVXjinbCOtKBimIQDFLRShSasBAM0u2nKvPFLtx1pIVxoUA8UuKcBg0tXyskTAHSilAOeaXbRysBNtGwHrTqUKSKsBMAdKKdtpRwKdgG7aNtOAOeaXbRYBML70nA6A0/FGKLCvYTbRtpaKaQxNuetGwU/YaNhpivYZsFGwU/bRtoFzIZsFGwU/bRtoDmQzYKNgp+2jbQHMhmwUbBT9tGwnpQPmQzYB0o20/YaQqRQPYbtpDwadRSaFdDML70FeeKfik20rAncZtoxTyvHFJhvaiwxlIVBNP20bCelICPbRinYI60ZoAZgHrSFeeKftpCMVHKwG7c9aay4PFPoIzS2GiMjFJT2Q45pNtIYwjNJtx0p1FKwxhGaaRipNtNZeaVgG0UpGKSpsNBSFQTS0UhkVJUpANNKc8VNhjKKKKQIaRiinEZpNtJooYRikpxGaQjFSA0jNIRinUhGaVhojIxRTiM00jFINhCM00jFPpCM0rFDaQjNLRUgMopSMUlJoaY2ilIxSVJQyilIxSUAI3Sm08jNNIxSeoISkIzS0VGxQ2ilIxSUgGkYpKc3Sm0AFIRk0tFSNDKKUjFJSKAjNNIxTqCM0ANooopWAKKKKQ07BRRRQaJ3GkYpKc3Sm1NgCiiiiwDKKUjFJSAKKKKACiiigByjvS0dBiimgCiilUZNCAVRgUtFFMAooopmd7hRRRTQgAzTgMUi9aWmAUUUUAOAwaWiimibhRRSgZqhDqKKKAFAxS0UUAFOXpSAZpwGK0SsTcKUDNJTl6UwFoAzRSr0poBaKKUDNUTcdRRRQIAM04DFAGKWmkAAZpwGKAMUoGaokUDFLRRTQABmnAYoAxTgM1SEG2lAxRRTsAUUUoGapE3FUZPNPAwKKWnYAooopoQAZpdtKq807bVEibaUDFLRVWAKAMinYpwFFhNiYzS7TSgYoqkriuFKBkUuKWr5UIQDFLSgZpdtMBNtGwHrTgM0u2qQCDk0u00tGCelFhPQQKAaXNO20Ypk8zExRtp4Un0pduOtAczGBQKXHpTsUo47UCbuN20badRVWHdjduetGwU/YaNhosLcaFApcL70u2jbRYQlFLto20WASjAPWl20baLAJhfekKg07bRsJ6UWAZsA6UbafsNGw0WG3cZtoxTqM0WERlQfWk246VJijbUjTsR7aMU8rxxScjrigfMxlIVBNP20bCelKwczIyMUnB65p9GKLFLUj20h4NSEYptSMYRkUm3HSnleOKTBHWk1cBtJTzyKTYT0qWrDI8GkYHNPoIzUhcjIxSU4jNIRigoaRmkIxTqQjNSBGRiinsvFN21NgEooopFIYw4plTU0qDU2GR0UpGKSkAEZppGKdQRmlYojIxSU4jNG2pAYRmkIxTqQjNKxW5GRiinEZppGKQthCM00jFPpCM1LRQ2kIzS0UgGUhGacRikpWGhtIRmnEYpKkoZRSkYpKAGkYpKeRmmkYpNXGhCM00jFOoIzWYxtIRmlooAZRSkYpKTAQjIpMYp1IRmpHcbRRRQUNIxRTiM00jFABRRRSsAUUUUi47BTW45p1IRkUmUNooopXAQjNIRinU1+BmkAlFFFABTk4OaQDNOAxQAUUUUAAGacBikXrTqpAFFFFMV7BRRRTRmFAGaKVelMBaKKKACngYpo606glhRRRVIQq9adSAYpaYABmnAYoAxRT3AKUDNJTl6VaVguLRRSgZpkigYpaKUDNAABilopQM1SJYoGKWiimIAM04DFAGKWqQABmnAYoAxRTJ3FXrTqQDFLTQ7gBmnAYoAxTgM1ViQAxS0UVQBRSgZpwQGmSIq5PNPAwKAMUtUIKKKUDNOxIAYpwGaXbSgYqgCigcmnbaLCADFKBml20oGKvcLhSgZoAzTgMU+VkiAYpaUDNLtrQBNuetKBgUoGaXbRYA2560oGBSgZNLtx1qg2ExRtp4+bil2460xcyGjk0u2lpaLGYgUA0tLsI60bapIBMUu2nBSfSl24607CuNwvvRwOgNOxS4poLjdtG2nUUBcbtz1o2CpNho2GmSNwvvRgDpTttG2iwDaKdto20WAbRTttG2iwDcL70hUGn7aNtFgI9gHSjbUmw0hUiiwDNtGKdRmkNMZhfekK88U/FG2hjuR4oxUhHpScjqBSsFxmAetIV54p22jYT0pNDIyMCkKhuakpMVNgI8UlSEYpCMmkNOxHsA6UhGKeRikIzSaLuiPYB0pCMVIRimkZpWGMIzSbaeRikpAMpCM0/bnpSEYNRysCMjNNIxUm2kZeaTVhoZSEZpxGKSosUMIzTSMVJtprLzSAbRRRU2KuIRkUxlweKkpCM0ARUUpUgUlTYaAjNNIxTqCM1LRQxulNpxGaQjFSA0jNIRinUhGaVhojIxRTiM00jFINhpGKSnEZpCMVLKEprdadSEZpANpG60tBGaTQ0NprdadSEZqShtIRmlooAZRSkYpKUtihG6UlOIzTSMVmAhGaaRin0hGaAG0UUUrANIxSU7GaQ8GpKEpCM0tFAxtFFFABRRRUgFFFFBqMYfNminEZpCMVLASiiii4DDwcUUrDvSUgHKO9LR0GKKACiilAzQA6iiirAKKKKCJbhRRRVEir1paAMUUAFFFKBmgB1FFFBIU5elIBmlAxViFoAzRSr0oAWiiiqjuA4DFLRRVkgBmnAYoAxS0AKvWloAxRVIm4oGaUDFAGKWmIKcvSkAzSgYpoBaAM0AZpwGKoW4oGaUDFAGKWmhbABmnAYoAxTgM1SEAGKWiiqAKUDNAGaeq8U0TcUDFLRRTAKKKUDNWTcVV5pwGKAMUtUhBRjNKBmnKvFAABmnAYoAxSgZpkgBmlAxQBilrRKwgAzS7AetKBinAZpgG2lAxRSgZqgDFKAMc04c0u2mS3YTbSgYpaUDNVYm9xKMU4DBpwGaaQhtLinAYNFUTcQDFLSgHPNLtoC4mKNtO5PTFKF45qrCGAetLwOgNPxRiiwDcGjBp1FFibjduetLsFOCk0u3HWmFxmwUoGBTttG2gLjaKdto20BcbRTttG2gLjSMik2Cn7aNtAXGbBSbcdKk2GkKkUBcZg0Hg06ilYpDCoPrSbcdKkxSbaLAMxSU/DegpCMnmkwGEZFJtx0qTbnpSEYNIdxhGBTSM1JSYosFyMjFFPZDjmm7alooZtpCMVIRimkZqQI9tBGKeRimkZpFczGbTSEYp1BGaVilqRkYpKcRmjbUjI8UlPoIyaTVwIsGkKnNPoIzWY7kVFO20hGKVhoYRimkZqQjNNIxSaGMopSMUlQxiEZpjLzUlIRmkURUUpGKSpACM00jFOoIzSsURkYpKcRmkIxUgNIzSEYp1NbrSsVuMIxRSt0pKmwxpGKSnEZpCMVIDSM0hGKdTW60AIRmmkYp1I3WlYsa3Sm04jNIRipAaRmkIxTqQjNDVxobRRRWbVhjaKUjFJSAaRikpzdKbQAUhGTS0VA0MooooKAjNNIxTqRutACUUUVLAKKKKC07hSMO9LQeRikUMooopIAFNPWnU1+BmhgOoooouAAZpwGKRetOpoAooopilsFFFFBmFAGaKVelUAtFFFACgZpRxQBxmlpiuFFFKBmmiR1FFFMBQMUtFFABTwMU0dadWomwpQM0AZpQMUCFpV6UgGacBimhBTl6UgGacBiqJClAzSU5elAC0AZopV6VSAcBmlAxSL1p1UhXCnL0pAM0oGKZIoGacBigDFFWAUUUoGaZI5VINPooqhBQBmilXpVIkVV5pwGKAMUtMApQM0u2lVeKaFcUDFLRSgZrRKxIoGKWilAzVAKBilAzQBmnAYqkgClAzS7aUDFMiW4AZpdg70oGKcBmqSJEAzS7aUDFKBmqsK4AZo2A9aUDFLgnpVBcKXFKBg0vJ6YosSIBilAzS7aUDFUK4m3PWlAwKUDNLtp2C40cml207HpSheOaaENC880vA6Zp22jFMBNtG2nUoUkU7CuM2560bBT9ho2460WC4mAOlFLto20WC4lFLto20WC4lFLto20WC4mAetGF96XbRtosFxmwUbcdKfsNGw0WC4zbRinUZosFyMqD60m3HSpMUbakZHikqQqV5pCMmlYCPYKNuOlP256UhGDRYdyM/NxSbcdKkxSbaloLkeaQqCafijYT0pWGR4pKfQRk0hoiIxRTiM0m2paGMIxTSM08jNG2psMjIxTSM1IRmmkYpGnMiMjNNIxUm2kZeamw9yMjNIRinkYppGalq4DSM00jFPIxSEZqGrARkYpKcRmmng0ihpGKaRmpCM00jFKwxlFKRikrOw0IRkUxlweKkpCM0DIqKUjFJUDQEZppGKdSN1pMoYRikpxGaQjFSAwjFNIzUhGaaRipZSGUhGacRikpMBlFKRikqRjSMUlObpTaBoaRiilbpSVIxlFKRikpDGkYpKeRmmkYoGhCM00jFOoIzWQxtNbjmnUhGRQA2iiikwEbpTaeRmmkYqRoSiiigobRSkYpKACiiipGnYKKKKDRO4j8nNNpx6U0VNgCiiigAoooHLYoQDxwMUUUUwCiiimZ3uFFFFNCFXrS0AcZopgFKBk0lOXjmgBaKKKaIADNOAxSL1p1UAUq9KQDNOAxQAUUUoGapK4DqKKKskcBilopQM0ALRRSgZqiBw4GKKKKYDgMUtFFVYBQMU4DNJTl6UxIWlAzSU5elUSKBmnAYpF60tUgCiilAzVIm4qqTzTwMUAYGKWmAUUUoGasm4qrzTgMUAYpaBABmnAYpF608DNUIAOaWilAzVpXEKBinAZoHJpQMVYhQM04DFAGKUDNNAAGaUDFKq807bVoi7ADFLjNAGacBiqUbkNiAYpwGaXYe9KBiqsK4UoGaADnmnKhxxVWbAQDmnbSaekfepBGcdBVWEQhSKXFTeWfSjyzTsTciC880uPSn+UaMbeKAG7c9aUDApQMml2460wEoxTgMGnAZp2JuMC880vA6Zp22jFFguJto206irsIbtz1o2CpNho2460WAbgDpRTttG2iwmNop22jbRYVxtFO20baLDTG0YB607bRtosMj2CjbjpUmw0hUiiwDNtIeDT6KLAMIHak20/FG2osO5Hiin8jrikIyaLBcYQMcUm2nlSBSVJRGeaTbUmKQjFFgI6QjNP20h4NSNDGXjmm7cdKkIzTSMUrDGUhGaftpCMVIyNl4pNtSEZppGKVhojIzSbaeRikqLDIttBGKeRimkZpGkdiMjFIRmnkZppGKVhjKQjNOIxSVDVwGEZppGKeRikIzWYyLGKKcRmkIxQNDCMU0jNSEZppGKgYyilIwKSpKQh6VGetS0xlAGamwxlFFFIBpGKQjNPIzTSMUrFDKQjNOIxSVNhjCM00jFPIxSEZqR7DCM00jFPpCM1LBDaQjNLRSGMpCM0tFBSG01utOpCM1AxtIRmlooAZRRRUNWKGkYopW6UlSAjdKbTiM0hGKAEpCM0tFSAyiiikWBGabT6YetABRRRSsAUUUUi47BTW45p1IRkUmUNooopXAKcvSkAzSgYoQC0UUVQr2CiiimjMKAM0Uq9KYC0UUUAKOtONNHWnUEsKKKUDNWIdRRRQAoGKWiinuAoGaUDFInIzTqtaEhTh0poGafVAAGacBikXrS0WFcUdacaQDFLVEhTgMUg606mAAZpwGKRetLVAOAxS0UDk4qkSOAxSgZopV6U0IWiiiqJYq9akXpTVXmnAYqkAtITilrqvht4Xs/FniJrS+87yEgeUrCcMSMcfrXRRpOtUUI7synNQTk+hywGDTwOOlenxWHhy2u/stt4I1q/uFJBW5ZlyOxxn/CuhHgrS7nQ9UuLjwY+jNDaPLFLNcbyWAPAAPHrzXrRyupNPlktPI45YuKs2tPVHittazXkgjt4ZJ5DwEjUsfyFdVpPwn8T6r8y6W9umMhrlhH+h5/Sui+GTatZ+HLvVn18aNpNo4jAkthKrk9eOvcDj1r0PTvGeh+I7U2c2s6dfTBhgTK9sGP4n+VduDyyhUipVpNN7HLiMZUi/3STR5evwL8Vt0gtfp9oGamt/gT4leRRObO2hz88zz5CL3OK9WTwzY6kjR6hp9rZwAkC5sdUfr2Hbn6mvJtM0B9Yv5razl1jxJF5hUrCWigAz0Z2JyPwrsq5dh6Ek1Ftvz/AOAYU8VVqpu6VvI2rH4L6HqCuLfxhDcyRD94sMattPfjdmluvghpsDRgeLrWAMNw+0xhCfQj5ulaCfD7V9Ljb/iZaH4ShI5Mbb5gMd5G559iKdb6T4cvU+z65rZ8W3AXYj2FizSx89pFyT2610xwtFrldKz8/wDIx9tUV2p3Rjr8ItAtbuW2vPG9nHOhwYY4xuz3BBauqsfgd4dfTLmdJtTv3ELPE7qYVLYyMDbk8gfnW/p9rPDLdXumeG7bQXZsvqutuN5GOoQHI7dxXMav8RNE0a8SXUdWvPF2oxuHCWj+RaIR6AcMR/wLpXZDD4LDrmrQSXfX9TJ1cTVfuNs5a6+AviO18PtqLNbyXCJ5jWKMfNxjJwemQOwrl7TwF4jvYEmg0K/kibkOtu2D+le+6F8cND157a2ggvE1G4OxLYxjhsE43dME9PrzWVqsHji6u/t1p4nMFosbu1u1psuIVBx/qQCX57jNc1fLcFKKqUG2vK36lU8Xio3jVVvU8Lu9A1SwXdc6bdwD1kgYD+VU1AzzwfevXW/aA1azt4La2U35jP7251FF3SjPICrjb+OTW9c/FmZ7Ma3a+HNMv9Jdgk6tCBNayf3XPOQezYA/GvJ+pYSd1CptvodjxOIjbmhv5niemaPeazP5VhaT3kv92CMuR+VdLa/CXxhdFgnhy/BH99An8yK9Jn+PYurFLbTrN/DbHmSa0iilz9FbGP51Qi8Uarqu54/iVPbTseI7u3khXv3UMB09utaRwmHitJORjLEV+1jEsf2d/GNyqtcWlrYqepuLhRjjPQZq9c/Aa10yVINT8Z6TY3bkBYWGScjjqw/lW34V+E/ibxbdHUr3XI9X0y0cOyw3xnM5Ubgg7AnA+961zPxL8N65rvjG2caPcteXlpAPKjhON+zlPTj+lbvD0YU+f2beumv+RjGvUnNw9olYnn+BFurjyvG+hOmOfMl2nP8A30f5123h/wCAvg6DTmm1DVptVIXeZbdxGigZyy4BJHB79q8xh8LW3gfZe+JYElvwSYdDY/MeOHmI+6uT93qceldjZ65eWmu+FtP1GTN5fzpdX2F2CJHBSGFQOgVTux/tCtsOsND3qlO3ldkVnXlpCdybVvhj8OIr2W0/4Sy80e5QKfLvICwIPIYHaMjHcHFOt/gFoWsXC2+jeP8AS7q5fGyGQAFmJ4Hyt+mKw9MntNVQeGvEO8raztb2WqR/NJbfMQUYdXjyPqO1d3q/w5l+BwimuXi1LxDeRv8AYJ4QRFaIMKZcEZL8nHYdalxpylpBWZk5zjp7R3Zwvir9n3xh4Vt5Ll9PW/s4xuaeyffge68H8ga87Wxkml8uKJ5ZP7kalm/IV9H/AAP8LePL/UZtS0nUTaaPCSLq41J2e2Y8kgrnk85yCMevau51zxdoumSzDSfEnhDSb1ifPnW0klLv3ORgH8zXO8NSk9NLFfXqtP3Gk2fGMtrJHuDxuhX7wYEY+uelV2GOnSvf/jr8SLTWPDmm6Fp+o2mrzyYnv76zi2IxHRADyOea8HkQ81w1qUabtB3PUw9WdWHNONiDbSgYpxGKAM1zNNHTcSgDIp2KXB7VSVwuIF55o4HTNO20uKfKxCbaNtP2EdaNtNKwhm3PWk2j0NSbaMVQCYoxT/m9BR83oKBXGbaNtSbDRsNAXI9tG2pNhpCpFAXGYpDx2qT5vQUhHqBQMj2CjbjpT9tG2k1cBm2kPBqTbnpSFTnoKnlYEZAxxSbaftpCDnijlY0Mop5BI5ApNtKw7kewDpRinYI60ZqBjCM0m2n7aQjFS0NEZGaTbT9tIRikMjIzSEYqTbTWUZpNDGEZpuKk2+lKIzilbuPmRFsB7Gk8qrPlHtThET2p8r6A2im0XFMaLmtE2/Hf8qieAjtRysE0ygQR1pCMmrEkeagIwcVi0WmRkZpCMU8jFNIzUWKTsRkYpCM08jNNIxUtGm4ykIzTiMUlQ1cBhGaaRinkYpCM1NmBGRikpxGaUR5FSVchKnFJtNT+WaRozmlYLkBGKKeyHFMIwajlsWMZSTmmVNUTDBqWhiUhGaWipKGEZppGKkIxTSM1IDCM0hGKdSEZpDRGRiinEZppGKkdxpGKSn4zTDU2GBGaZT6aetIBrdKSnEZppGKmxY0jnNJTj0popAI3Sm08jNNIxSeo0JSN1paCM1GwxtIw70tB5GKQDKKKKVgEbpTaeRmmng1I0JQeRiiigobRSsMMRSUAFFFFSAUUUUGo0jBpKc3PNNqWAq8806kAwKWmAUUUUyJbhRRRTRIDrTzTV605V3GmAlA5qTYKUACmTcbmipNgppTninYlsaBmnAYpFBB5p1MYUq9KQDNOAxQAUdTiilUd6qO4mOp6pkUKozU6r2rVIQzyx6GlCAdjU6xlh0pfJPpVKLIckVmUAcA0gUmrBjzSbCOwp2sF7kVFKwwaAM1IDqAM0n44rpNI8Aa7rMHnW1g/lHo0hCZ9xk9K3p0pVNIq5nKcYfEznqcDXYp8JvEp/wCXBM/9dk/xrK1TwdrWi5N5ps0SDrIq7l/McVq8PVjq4sj2sHopGIBmnAYpwjxzRtrKxoAGKWiinYAp6DnNNHXnpWhZaLqF9EWtrC5uFU4LRxMwB/KtIQlN+6mzNyUfiZUoqW5tZrSdoJoZIJlPMUikMPwphhkz/q3/AO+TV+zle1ieZdxY4ZJfuRs/OPlGa3dF0/xLpUn2/TbTULd1UjzoYmHHfPHSu4+EGq29l4d1i1Gp2mnajJMGge6wQPlHOD154reu7f4ii8jvbPU7HVoI3J8m2ZVjf2Ix/XNe9QwEfZxqqTb8raHn1q9puLWnn1KfgTVfGfjuxnePXYbG2gcRtN5CtKxIyQK6rw/4fu/DWpSXOoeJL/VywMb2zwOyHPQgDOD9Kz7PxB4ssixh8BwwtJzIYZkTeffHX8a038TeJbkKr+CbzGesd8qn9MZr6ahGnCCc3JyXVpnjVnKcnypJHE/EDxX4pFw2nPo0MWmmcrCzWZZZ+fl4bIz7dav+DfB9/qYEup2mlqw6WK2cYbJ6byAdv0611ni/xhN4Q8M2uoeUllduRjS78+Y7nPUMDwR19OcV5X4g+Muva5aG3gEWlROD5n2MENJx3Y8jj0rjxE8PhqzqVpuT7HTTjVrQ5YRS8z0q/m8MeErBk126sr7Yd0em20CfK3oFHP4sa878R/GXVtQiNrpEceh6ao2rDbAbiOerDp+GK8+JyxY8sepPOacOleTXzWtUXLTXLH8Trp4GEHzSd3+B9HXs+l+Hhpclr4NbV1vLVZ2ura280qW6g7snnr1qpd6x471CFv7BS2tYyP8AUtYNbyjjGPnyue/FeS2nxK8UWFrFb2+t3UUMShERSMBRwB0qYfFTxcRzr93+a/4V6rzajNWvJLy0OP6lNO6s/Uk8T2fje+Lvrlvqs0aHJ81WMY9wB8tUdO8H3EqedqU8Wi2YG7zLzKuw/wBiP7zfgK6fwn8bvEGj6skmqXkmq6e+FmglxkL6qcdR6d63/iqul/a7DU7mxOp6FqUQe31K2bZPEe6Z6N2IDc8HmuT2WHrwdeE3JrpL9TVTqU5KDilfscbY+LtO8H3ccvh2zM13GedQ1AZZh3CoDhQemeTVnxhr+oaze6b4utJ3tZZEED/Z2INtMnVQeuCDuGff0rNXwfFqqF/D+oJqbDrZyr5VyB/unhv+AmpfCsRF5e+HdRRraPUFCKJ1KmK4XJjbB98qfZq54VK9vZPRPtsauNO/MtWt7m1Drfh/x5iLxDEui6uRhdYtI/3Up4/10Y/9CXFS2uja78OL4XyRw6lpEw8t54D51ldxnqhYcZ9jyK4UQtFIyOMMjFWUjoR1Fdt4D8a6r4QmcWUyy2U3E9hcr5lvMO4ZDx07jkUU6nPL3/i7rr6k1IckbQ1T6f5GnrfgqBbVNb0UGfQ5yMjdueyc/wDLKXvn0PQjHeqUGhPIu7a2PpXufwws9A8T6mbnw3bxafqlwhjvfC+oy/6Jfxn7ywyH7rZ5Aboele0+Hv2L9Q1y6tr60kFnokrLIba/yl1En8UZABBI6A9+DXTOrhsO+au7HnRrVW+SKufLeo2GoeC/BlhoWnm6g1jXGF5dRwEiQRY2wxYHOWGWx6EVreIPE9z8MItFkYXMviFtMijk06SRvssG0ld7gH5nIGMZ47816f8AE+V/DGv6vHoqPqXiq5Ypd6pBEXFoo48i3GMghQAX9jivMvHHwp8Va3D4dlh0i42RaTEk090wiVH3PkMzkYPOT35FdVOq+Xng91ockZRnJKatq7nJaN42vPG/i4ya5Y6TNYhXnuWks1JjhRdxAcfNnjAyTyRUmheLfCmteNbXUtf0WayZrgSyXdrduUTGNpMeM4GF4U10jfB+Pwj4DvLvVdf06xfUzFE9wA0qRIG3FFZM72JAHpwaz9F8JeBdF0n+39Q1PVNYtIZ1SKJLUQR3jjkou4kkY6noOneq/e6cz1eups50rScb9tD0GbwZ4L8OeLpdck1BIDcs0lhp+oQO8XmcETttJYxZyRkcn2r1L4VfCLUfjCt9YazrVh4j0wKZk1S1l3XNjKeQEUqCFOCCpGOOK4DxNffY/FlpcWnw4GoX9/bRTwy3rS3AHyLlBGpCjbwMf419I/Bvxzf/AAy8KX+veNbWx8P2suIrLQ7K0SGSRhk5wOST6HoMk44ry8wq1aVF+wXvPbuc1C1Scfay0/I4j9qzwHqfgrwRomlaXFHZ+FVHkzRwrtZ5RyN3seT7nrXxVrVgIS2B0r7F/aM/aFX4p6bbWFrY/wBn6dA/nESOGeR8YGccADJr5J8Qyq7uSR+Fehl1KtHCL60rTZ180I1WqLvE4K8hAYjuKzJY8Zrav8b2xWTMoya4asVfQ9WD0sVXGWpNgPWpXHNN21zNI2QmKNtPHNLtpJWAaAO1LtpwGTxS7cdaYDNuaULgU8DBpc+wqrE3G7aNtOCk0u3HWiw7jNtKAMc07bRtosIbhfejC+9O20YosA3C+9GF96dto20WAZto20/bRtosAzbSYp5XjijDegosBGVGOKTbUh5FJtosO4zFNKZPSpdpFO2H0ot2GRCLnpS+UPQ1aSLNSi2J6AU1FkOVjOMGKY8YFajWRxUEtsR2pOA00ZxUikqzJFtqBhzzxWLi7l3GMBjikxXpvwT8LaZq95rer63bJd6PpNm0skcn3Wc5IH1wp/Op/wDhZHgNuR8OIMe90R/SuqOGTgpTna5yyxDU3GEea34HlKqz52qWI6gc4q3pGjX2v30dnp1rLeXL9I4lyfqfQe/SvadF+LGpagZYvDHhfR9B0yFQZ7u6XMUa997DaDn05Na3iP44w6Dpuk3Flp1vcNeeYktxDH5DPEpCl4+6gtnGf7tdUMDRlHndTReRzSxla/Koavz2OGj+AzWIiTXvFOkaFeNhms5pNzqvr1Aq9H8FPD+oxy2uj+ObC/1lThLdwER/YHJOfzFV7vwn4V8ZQS6npF/qb3DDzLiOXFzNEe+5CQ7D3UtXPWnw6uNQOdH1PTtYweEin8mUH/ck2nP0q50YQdo0016kqpUnq6jT7WHXnwi8XadePbSeHr+R0P3oITIh9wy5BqSP4VeK9pY+G9VAUZJ+xvwPyrp4fGfxG8KJHZ3WpatYJGNqCde3sxHP5mu08GfEf4j6tqUNvp2s3t9cy/KlusSyl+Oy7f8A9VKOGhZyjovMJV663aZ4fd+Hrqwcpc2s9s/TbNGUPTPf25rNuLAqc4Oa/RE+G/Gi/DPxNffEOLTLWI2Ei2oaNVnEjKQNxHygngDvmvhjVtJ+ygg4JAFc0IQq35Xe3YqjiZSfvqxwU1vtzxzVOROtbt9EFYnIrKlHWvOqU2metCaZQPBpCM1I45ph4NcslY2IyM0hGKeRimkZqCk7EZGKQjNPIzTTwaVjQZTW608jFC8nFJAGz0p6xE9qkjj5q7Db5I9KcYNibsrlFbYt7UNa7evNb0Ons4yFzUkulttyRz711Kg2jn9qjl5YD6VA0eVrdubMxnBFZc8JUGuWpTcdGdEJ8xnkEUjDIqeQAmoTXI9zZERGDSU9x3plZjAjNNIxTqCM0FIj2n0pypxzUuM1KkWaFFiuVDGBSbBV425qJomHYflScBcyKJXbTGFW5I8VCw7GoaNEQ0HkYoPBxRWYxlIRmnEYpKTGhtNbjmnUhGRUlDaQjNLRQAyiiioluUhpGKKVulJUgNI5zSU49KaKACkI70tB5GKgaGUUUUFCN0pKcRmmkYoAKKKKlgFFFFBadxDTcYp9NbrUsodRRRVBsFFFFBm9QoooUZOKoQ9V3VKB2FNU/LUqDAzTSuSxBGBUixcdDViG2zyaurYnaCf5V0Rp6GbkkZXl+xpCnPFb9h4bv9WmENlZy3Mh4xGhI/PpW63wrudPhE+s6hbaVGedrtub/DP510xwlSWqWhlKtBaN6nAMpppBBwa664s/CUHyreajcEcF0jABP4irWmL4cXdJFYT3ECD97PeOFRD9O59sUlhnezkh+10vZnDg4/lT8EYyMfWvS7jxBpul2AnttPhTcEHEQzGGBKsR3Bx061WbxC2pRN5un2OtWvdbYbZF/wCAnJ/KtHhYJ25/wM1Vb6fieejnvTlUg5rpXh8KXRLia+01ycGEx7wDVyx8NeH9Tyltqt4rno0lodv6VCw0pfC7lOsupyqLjGKu29vvOe9dtH8Hr2ZR9k1K1ncjIRwUJFMk+GXiTTuZdKnljHWS3HmD/wAdro+p1o/FExdek9OY5yGyLYwCanfTzj7pr1j4U/AvxL8S9eOl2Fi1q0aCSWa9RokjUngnIyc+g5ru/Gv7Hvj3wzqiWUOmDVopE8xb2zb9yB0IYtjafY12rCp6Pc8+pj6MJ8jkj5gntdvUVTliC8V7zq37OuoaQmNb1zS9HuG5WB5d7EfoPyzXH6l8OdD0F/M1TxTbSw44js13SP8ATk1lPB1LXtZHVSxdKeqdzzBlPStHw74euvEuqJZ2pVXILM7nhVHU+/UV03/CGaDqkmdN8TQoD/yyvE2OPbqK1vDfgLU/DmtWeo29/p10qE7kWfbuUjBGSKinhJymrq68jSeIjyNp2ZTm1Dw54Jf7Pp1oNZ1WNiDdXHKI3oB0P4fnV+78PePPFOmLeSlhEx3JZo/lNjsdvH5E1qavLaeDbo6gfCKmZssl2k3mRBie/HByf8K6H4caZ4i8Ra4viN7qz1aHyWjFtDcmPyS2DjG3jGD16166pxc/ZN6dlp9/c8+VVwh7Rfe9Txy9s9X0iXyr5b20k7CVnXP61s6N8Q9d0q4hMl3Je2yn5rec5Dr3GSMjjpX0xd+BIvGRS31y3hhtF6qmq8Aj/ZAHP1r5h1bR4LTUruK2k862jmdIpf76gkKfxGKxqUKmHlzQloFDEQxKtJanR30Hw6v5vtpubu2ZwHezhVgoOOnT+RqbRrfwT4rW9jXTjpUdmFnM8khBkjB5zycehHPWuCl06UxGUROYh/GFJUfjVCVSpIBx2IzxWf1hxld0156bnR7GLVlJ6eex6joI8HeIr27t7Xw66RwQvKbhs7QFBI4zxnsDXC+Dk0C51M22txypDKcR3EcpURn/AGvb+VdV8L9Uubi2udBbS5bnT7wlZbq2XY0eepZu4xXPt8OdVvddv7LS7WW5trWZohcSAIpwcdTxW81OrGnUjC7vqrWMoyjGU4SlbRa3O7vdA8M+CriOeDRr7VbtlD2ykGWFz7Hp+n0rb8H3/inUpH1PWEaw0+Hc8VjBABJPxwCOpA7dOa5zQpPFXg6fS9I1W4OnaW8vlpdJEs2C3RN3bn1HFbvj/wATaxBdHTdDurSK5jUNKGlUTnIyAobA/LNe7T5KcXVd42+ykt35nFNSlJQve/U1LRLa0t7XVr1bLSb663S3cl4n+kYGflUk8EDHak8K+O9P8S6v9l06LUbrYMu8kcYjC/3ieMD0rjfixZ6he+F/DN1cQSyypE32mQLnY5VeuOnIrK+GGu2VtBquh3k81kdVCpFdwjlGwRjj1yOf5UpYvkxMaMY6efVsiNBTpOpfX8jV1mTwR4Qnkt5LH/hI9SaQvO/mbUjJJ+UduPTmtHw38VbK4untLHRrLSbmRttqxXKPxja5UAg++MVHB+z5cecnnazGY92XCQncR3xk9atWZ8K6NdTaRbR6j4dmO5I9ZuowA7jtuYZA/KphDF0588koRvp5lTlQmrK8n+RsXvxB1vw3Kj+ILXTbCFuVWGRpZJPXaoP6mmx/EbR/FmnwR6mLnRorueSC3u4bhlaNlCkFiuMZz3yOOaoGwsdXkKeI/GulapZONvloqo6NjhkIPyn19ar+J/h9oun/AA/t5La/nuraG4Mgv4F81Pn4YsF/hAUD612Ori3dxd422b1f3HOo0tmnfy2ILn4NajfagBq3iq0KFvLgkmlaSRwTxwxGPpmvPPEnhu98KaxNp18nlyx8q38Lr2Ye1XF8JXM7rLpmp2WpupBQRTbJRzx8j4P5V6f4j8Sx3GkWEvjLwtJcWMqKEu42CTQyfxKe/UZHPIryHh6WKhJtcklbVu6/4Y7lVnRklfmT+TPEACO1PXpXZfEbwRaeFX0270yeW50rUofOheUDI77ePYiuOAxXjVaUqM+Se5305qpHnWwoGacq8UgGKevSsi3qOA/GvWfg5NF4r0XWvBmoHzIJYTc2nG4xOODt+mVP515OqEitPQdav/Depw6hp1w1tdRZ2uMEYPUEHgg134KqqNVSnt1OOvTdWm1Hc0pNN8O2dy0cuo6vBPE21lazQMjD1G/IrqtC1/StQu7WzubnVfEZGFgtJrKMuWBzgPu3Ae+eK6vx5oVz8RfAnhjXksLSDUpgWvbwYjSOPkbmJ/hyPr6V5rP4hs/DdnPp+gMZJZMrcauy4eRccrEOsan8zXtTTwtTmaSjuvNHDFrEQ0vf128z1LxvoPw9uNai3zmw1GaPz2RJjHDLuPVn2sAeD6DishrS28LxrcDwKk1pklL2a9kuYW9DuQhfwrhfFuUXw/nIxpUPUe7Vt/C9PEd/rBg0G/ksEjUy3Vw8hFvDGOrS54x7Y5pTrwnVaUEvQyVGUKSk5Nnpfw71y/8AE2vwWGg+HNGjvZOVWO23bAOWYmRiFAHJJ6V936H+1n4P8NaZ/Z+o6n9q1KyiSOdrGAvFNKF+bym6EZz6CviO7+OHh2w0G78P29jNdeeoS51rS1js2nJwWKrt4BPGD1GeKwNNs9J1qLGk+JbeGc/ds9WT7Ox9hIMoT+VY4rB4fH2VZ6LscdOdanLnirH0h8X/AI3k37RyzX2jWWoKLqy1Xw+6BZoyeC8bDO4chsN1z614X498M6p8Q59AbTNci1xHs0iZppzHOQJHBlMTnJ44OCfumqcct9HpzeEvE9tLYW00xl07UpF3R2854I3jgxvwDgnnmtLw94C1ZLNL24jksb21097CGQruaJ2lk8yRR/EQvC+pYc114fCxoxUYLRHNKSh7zfvHFeJdPS/8R3h1KKey8JeHwtssLbozJtyFVFP8UjZOccAk1veC4bGXxTpuofEHTX0zRbi326LbzArZxgH7rfhgjPU8mm33j/SNC1iy0/Wpl1bSLcCE6PGq3Hkgf8tJZmzuk7kIeORmvSbnUdJ+LWj+ItC0/wAR2Go/a0jktY0hObOMbckjucgnjpnsK6FCLb5XqiqlSVOKU42XfsjO+JnxH+JngmdWV7TTtFlfZbXumxhg46qCzZKnH5+9edal8T9b8TzJcaxqtxqEqZCGZ8hAeuAMAdulWfGPxD8L6L4EufAmji+1xI5d39pXUwCxyhhkoMcrwQAMda8qi1BgByRWDnCM9NzpoUOandxt+qO9vPErTJ/rMn61zOoX+8HLZz61lvqLFcdKqS3O7kk0VMS5Kx106Kg7jLl95NUZeTipZJMnFQtwM15cm2dyVkRsNxoAwKdsI60o4FZ2LQgXnmlJAp22jFMQm2jYD1qTYaUJxzQK4yipcUYFWosLojVQTTwgr0TwN8DfEfjSMXbwjRtIwWa/vxsXb6hep/l716TYeFPhf8NLC2l1WX/hJr26dYleYfu2BIBdE6bBn7xz04NdEKEp6vRHnVsdTp3jC8pdkfOO0UbAa+nTrvwxnuLmxtPCGmPqtvK0T2d262+4qSPkcgq2ccciuV8R+MPAuk3qwat8KJdOnA4VrgRhh1yMcMPcZq5Ya32kYxxspaezZ4ZsGcUuwV7DFq/wo8XqdPm0K68GSOP3OpxTmZEbp86+n4VT8Sfs8eItOto77QpIPFWmSjclxppBOP8Adzz9VJrH2Leq1No4yKfLNcr8zyrYKNgrpbj4a+LLSFpZvDeqJGvVjaPgfpWFdWVxY3DwXMMlvOn3oplKsv1B5FZ+za6HXGpCfwsr7BRsFP2GkKkUuVFtpK7G7BTGGDUlFHKi732IqKlx7UcCk0wuRInIIqxFHuNMXBHVfzrd0vwvq+oRLNa6Xe3MDdJIrZ2U/iBWig30MpVIxV7le0s/MYADvX0Bp/7LMenWUN54o8V6ZoUU0YkSMfO5BHuV/QGvNNG8C667AtomoAdSTaP/AIV9n+KvgXe/Gh/Dur+HLuwurOKxW2kZ5cFGHPIAPrjHByK1q1KdFx9pLlT6nmValSclGk/uPANU/Zj0q/0bULjwr4ttvEOoWcZmayhRdzr6DaxOT2rzfTPgB408RWkF5Z6Mws5wrJPNMiKynoeTnH4V9HXXgvW/2ffG1pd3cI3ov7xImylzC3Bwf5Z7gVzPxv8AiJe6/qdjB8PBqkFhp8REz2ETqjM+1gpQA/dwRz3zitU4yacXzRezOSFatGTgnqu55hpX7MGqWztd+J7yCx02AF5Y7NjLM4HZcDg/nTb3VtP0m6+y+F/hS15DB9271S1cvIOm7BHH4/lWJqnxk8V+VLY6pJHfoCVkiuojHJ7glCrA1nWF9Y+O7l7RNK1K0k275JLfVW+zxAclnEgIVR9a3tTjpT3N1Gs3zVndeRsa14j8d61oOoaLb+ELTRLC7x532W3FucbhwWLAHPT8awNC+EU9pazX/iILAsPC6aLmOKWU/wC0xOEX35PpVixufCHh24uYbLWJbrUhJth1K/tGlgiH95EB5Oc/MRjuBXPXfgq41qaW5tvEGlazNKxZmN35crd8kSbT+FTKMbqU/ea89jpptxTjB8qflub0Hg3WvG2qWekyXemaLpW4mK0tLpJFTjqqKxLscdT/APWpnxH8Di38SPaHXdItLKwgjtreOa4/eKoA4ZACQSSWP1qv4T8Hax4Vu7/XL3TJ4v7NtXlt9q7xJM3yJtK5zjcWP0rgJRPLdMJfMa4djuDZLsx9Qec1lUlGFO0ou8n+BpTi3UupqyR1Gn+G7WwuFuk8Y6XayQ/MkluZmfd7YTNddE/hLVrOc+INatZ78AGPUNNs5UnLdP3ilQrDuSMGvKngktpWimR4pF6pIpVlP0NTQMN3AyfauanV5fdjE3lS5tXM+hNE00eDtHivY/G+pXWjzL8jWFj58GehVvMYqp9iBXvP7M2ueHbz4gWBs7KTVNSCsPtI0yK0aFDwzsyvtxz3XJzxXy38FbPxHeapK+lXP9n6TEvmahc3URktBGOu9Dw5wMBev0r6Z8Ia1HYeHWi8KaTJ4evL15jaGaBtt1IAB50mATEv3tiMcZIz0rbEQdai4JNXPErWpzu3c+0fHl/oVt4I1OeeGC9hhtpJWgZBKH2jpt5zzivzi8UftDeIluHc6foWzdnyRpqYA9M5zXXeJ9Q8c6DrmgT6ZZ3jTaVYwxSTPKPLlkbc8q5JAYHcQcZrjfid8Hbi+sD4j0h7fT7a6KyPpd7MqfZS3DDzd20gH3zj3rjy7LvqSfO+a/4G9XEwxEouSSR5/rHx8uVcSQeFPDsF3kl51s8ls9eM8fnWFcfEXwPrUbya14FRL5wA8umy7FY9yBxj9ay9S8Eshc3Gu6HCB0P29Xz9AoJq94B+H+kXetm7vfEWnXMFgouZIoNxTg/LvZgBjODgcnFelFVpVFBWt5pM6nCiocyvp5s072H4VWGqjTr/AEe5s7gRI7F7h2VGZd2xiGPIBGfrWbrUHgbQ1Etx4L1J7VjhLqC98yJvTDB8Vx2tWOi3t9d3UviU3E0sryNssH+ckknGW/ziodK1W18PfPY65qAZj88cVqvlMP8AaVnwfyqZYhJuEoRXnY2jRdk1JnUW3in4YzlLWXwpd20TjBuTJudPf72fypmpfB6y160e+8E61DrEfX7DKwEyj6nH6gVjz3/hbxJfW0Y0fUIpyQJZdPVF83jr5IyM/Q11lp4B0vQL03VnNqCSxRiUCO6K3Sj08pU3Z+vFVFKv7tWMXHvH3WXK9J3g2n563PI9V0a/0W6e2v7OaznXqkqFT/n3qEWF00YkFrOYyM7xG2MfXFe+z/GGC08Pfbb3Rbi6iSTyLVr8KJJmwSzfd4Axye+ax5vi/r2p2ct9oS2Zit0DXOlywZkiXuykEb09SBkelc1TAYWEtKmu9raouOKqtfAvU8QcFPvAqfQivUdI+GWh6LoVhrPi7VZLSO7j82LT4V/eMOuM8npzwB161I/xl0zWYlOv+ErDUbhSNs0ZC8fiCfpzWR4y8ZaZ491OK4ukvdOjijWGKGIJIka9+OO/8qwhDC0bz5lOXRdvU1lKvWai4uK6tG7BH8JrtBufWrBi3UZYqM/jXT6b4D+FWptJ5Xja7sjxtFzbkgH/AL5Ga8psdE0a5CgeIo7eTP3bq0kUfmN31rr/AA98MtV1u5WLRbrTtblI3eXaXa78ZxuKtggVpFuo9YL5HNVUY7VWj2nR/wBkm/8AEX2O68Ja5p3iLS5yFa63hDCe5YDPA9jn2p/xe/ZN1/4VeGxrNzPaX9h5ixySW24NETwuQwGQTxxXa/Ay3l+Amp2+o3dnqXiK9vkEUsOkKGtbRSwGXk6O+ewxgV7v8Ufjn4c8S+DfEtq3h6TxDHocqC90+dQnmLnmVM53KpHXHY1z1alelWioRvHqeV7eSesr/qfmHrNikZYCuTu48E19P+JPjN8N52Yx/DOBc54Eif4V51q/jj4d69m3uPB8mjwseLqzkG+M+uBjP60V6UZPV2Z69DEVHvBnikgxVZ+DzXptxovw7024XztcvdUR3GEhi2BVP944p918FX1SZ7rRtXsp9PlO+HJbIU8gE89q4pZdWkrw19D0frUIW59PU8tNMZSOa9Cl+CniGJCwezkP91Zuv5io1+C/iGSLLG0iP91puf0FczwGJW8Gb/WaP8xwCgHk1ImAwxXej4Ja+OBLZH/tsf8ACpovgb4gdlxLZf8Af4/4UvqOIX2BPFUV9o4OKKr8Fn5nODXoVt8AfFEgHlCymbONiz4P6gVoWvwO8aWzfN4cvJlyBut1EoP/AHyTW8MLUi7SVjGWLp9JHnSaUSPumq1zpxUYwRX1H4H/AGP/ABz4z8NS6vb6fFaRDcEt71/KmkxwcKRxzwM4zXifivw3caFe3NleQNa3Vu5jlhkGGRh1BrWVCDT5Xdrcwp4qM5WizzW4g2MQBVGRcE+lbt/EFJrFlGc15FSPKepTlfQqOOaZU0i8mocYzXI1qboCM0yn009akpDW6UlOIzTSMVLGNI5zSU5ulNpDEbpTafjNNNA0IabjFOpH4GayGJTW606kIzQA2iiikwGsPmzSU5ulNqSkFI3WloI+UmgY2iiilYAooopFR3CkYZFLRQWFFFFApbBRRRQZhToxlqbT1+Vh71QmSjrVmFQTk/SrPhuwTVNdsrWRS0UkmHCnB24yf0Fd1Nqek+GpmQeEmfaSBNdD5GPrnmu/D0PaR527I56lTl0SOT0+EMwyQB719v8AwD+AOmaz8PdL1WXQrebUp4TK0lzFuJ+Y7Tg9MjFfN/hv4x2Vtex/avCelzWZ+WRFjG8g9cHGK+r/AIS/tSx6Poly1/4eOhWEabLWeeZI4WQcBcN8xIH90EV9HhKcKd5Qak/RnzGaTxDp/u4nifxU8YvoGsal4ff7R4aurU+W6QWUb7eBjDB+hByDivD7zQYPEF47Qa5LfTt837+2lLD6kbq93+K+oeFviBqGu+NdKE2vX4dGvNOaQxxxYUL5qjAZ4+PYivEdV1DxFq8TQW9lPa2o/wCXeytjGmPfAy34k08W00udXv2OnB/CtLPqU/8AhXttYWZvdR1SIQo37yOLOT6DPUH8KoPbWOtXkUH25VtYct5FtCRGijkkscZPuaik8HauAS9jLGO/mlUGfxIq3B4fl03SLwy3Fpb3FwREpknXGzq3I79BXlqN9Ixsj1795XK4vdP1ObUFSG7mM0ZkKFlUfLyAMZxgCslNYtrdle202GNxnDPI7kfqK2fDmjWsGtW7S6vaDBI2IWO7ggjJAHeqWsaNpOl6lc2zX07mNsbY4QccZxnODXO/acimrIqLim4u4+28ZTebI11bQS7/APlpGirIv0JB/WpJrm51Bd1lrEkgP/LvNJ5cg/Lg/nWYZNGjz+6vZvq6p+PANamjWMesbhZaIGiU/PcXNwwjQe54ohzz0cr/AJlO0dSfRrW9sn1X7Qk0Mv2FyN+c9RyDXY+A9d8bRotxp2pTW2nqwDXd648hB3+Z89uwqxba7Z+EtKcForyURrJ5EAIQISF4LZPc9cZxWNrfjTWYfIeK7gudLl5t/wDRk2Lj+EqRgMK9SMYUEnzu66HBPmqpx5VY+ufg1+0tpWg67Z6Pq2sza5cXLrH9ut7NYraJycBVH3mBJ+9+ldX+0Z+07fRpotj4btGv9PvYpHnnKSATAEoY1K4ZWUg89fY18Z+BfiLrk3iexSbUGNuHLvGsSYIVS2Bge1bWhfErXfE3hPWtOOr3X9p2rf2jaSrKQ7oOJUz7D5gPaupVKVS03v00PnqmWQjV57adSt4k0G28X3Dz2ceo6ZqD8tbaorzI5x/DLjP/AH0PxrjdQ+GOv21i921qmAeY1cFsZxn0xWde+KtVuQyyapeOGzkNcOc/rVS38TapYqFgv5xGG3eWzlkz9DxXBVrUJt8yd+59DTp1KaSiyOfwxqkQ3PZOi9MsVA/nTB4evdm51jiGcDzJ0XP5mrZ1HT9YbZeWDwXLH/X2A6+5jPB/DFbtt8KrqW0F0t7CLc/OMxOHKfTHB9qwhRdTWkr/AD2N3U5X77sy54O8Sa54ZCRNdWF1ZO202d5dI2fpgkivY9I8Eo13puv+GdSsfC2pygG4sr2UCCQHrx6fh3yMV4j9ofwp8um6VPDMOuoX0G5/+ALjCD8zVWDUJb278+6me4mbkySvuY/jXp0qvKvZ1NTzq1H2ivF2X9dD758FfC3SfGurQPqGheE9SvpEAuJrS9MkrDGCwj2YP4n8a6TxL8DfA/w08MyXN7oenwaZZIGku7qDzpBkjljgk8kV88/swawnw61N/iBqdwtlodiklsE2bpL+Rlx5UQ9uCW6DFevfGX9pbTvjR8P/ABDovhy1uLW7W3W4mW9VQZYFYeYsYBPzAbTz2zW8nU9ouVaHytShUVXljJ2PPPEHxI8CQzbLPX7aK1X/AJdYrJgnXn+DiuE1XV/Dmvt5vh9dC1DUeSsV0nlswJ7fL1rxTVpQ75H6Vz9ywVsgkEdCO1VPGun7vKmfQ0sDFJNSZ7Bqa+K7mBbe+1DSvC0Lnbst2BkfsAOePwxW1/whyzeG7LSU1W9VISc3Fq215TyTuPOOteKaJGYILjWrhmYW2Et95JLzHpj/AHep/CrfifxHq2m6xq1lBfTwQTshljVsZOwZ+nvitKeOpwi5Ti9dNzeWGlKSjB7anoS+NtC8O2N9o11LLetpcmYxK3mG7PDDn1DHn6VzstnH8QtNn8Tari0NoZN8UC7TPEoyoB9RnGea5DR9IggtBqmrZ+wg/uYQcPdN3A9FB6t+Vdj4It4/EUd7r2p6kNOsdPItjbJF+4ETjBXHbr1696VPETxXLCS0tov1foEqUaKc09erIPBPxH1L/hJbCy8yG10iZ1iNqygpGmD0J5z3JJ5rtrq00rw9rmp67arFrWtXLlrS3gYGO3XAUsx6L0ySfoKwbH4J2o1mC7k1S3l8OuBIspcK0g7J6fjXY+IkTw1pcv2TwdZ6loxwzmzlU5A7su3J/WvQw1OtGnL6xbTZ7nLVnSlNKD336HA2vjrWre9Nrp+o3Gu6zdMxCR/NbQk84QfxY6ZOFFWPipq86eGtJ0TVL5b3X4pPtFyUUYjBBwp9+QPwqNfi7p+mQzvovha202/dNiXCkHbn1woJ+maybf4WeMvETNfvp0ha4/eGW5lVGfPfk1x1Kk6lJ0qLc2/Wy+83UUp807RX5nE11/w9+IE3g66eCdftejXOVubRhkYPG5c98fnXQ6P8B9Vl1SFNVubS0sVO6Z45wz49AMDk+vatXxBr+meH757Sx+H8V1ZQ/u0ubmBgZSOp+7yPfPNYYXB1sO/a1HydPN9/kaVcRSrLkgub8LHMePPh0NLhXXNBf+0PDs43rNEd32fno3sDxn86n0HxhrF/4Sn02C58y604rLDE8av5sOcMpBHzYJB+ma7LUfiCvhrwAs9v4YTSZ9ULRxxEZgxgfOwwOoPA745qj8NPCejaJpGleKtU1SaB7uVoYliUeVGSSuHODwcew6V6n1ZfWEsNKya97ol95ye1fsn7RbPTq/wNG4bS/H2mReDb+4isNf09Fa3kQBYWmK5eMKPTgEflXj2t6He+HdSmsNQgNtcxHlDzkdiD3B7V6FH8HfEcXj6BVQ3NmLhbr+0+kbIGDEn/AGu2P6Vl/GrUrXV/iHey2c63ESRxxF0ORuUYIz3xWGOpuVD2lVWknb1Rrh5pSUabumrvyZwqLzk9KmRBmlRcirMMG8+9fPxjc9FysibStEvNbvorOwtZbu5kOFiiXLH/AD6mvZND+H+jfDOy+2+JrN9c8SFBJBotshlEQPQvgEZ9zx6ZqP8AZnsXf4gXGwHeNOnKkdcjBFJH4+n8S2yWHiDUL/TbhPkXVNPdh0/56xAjdz3XmvoMLThTgqj+LoeHiatSpN047Lctr4k8X+P1vNH1LQ307Rr6Bo43itWRbcgZTLn+HIAOfWvLLr4f67Z3EkFxYfZ3XOTJKiDHry3A9M10ni7wjrljb/2hLqD65pT8DULa4aWPr0fJyp9mrbsvByfELw/b+IdWmbS4dKH2fVL6SM5niUAoyesn8H4itpReIdpp8y79i4TjQXNGyT/Mr6z8OtT8Q3ljdS3VnY6Raadaxz3ss6lbddnOcdeegHXNWfEEmkxaVB4f0TxVp2naEMG4J3vNev1MkmxDwOy54rH+LPiSfUrrTdKtPMtdCtrKB7WzznG5AQX/ALzdBk+1TeG/gN4k1uwW+vWtdCtDgh9RcoxB77ev54pSfvyjShfuyfsRlWlZdEZ0Om+F4FBl8TzzEtj/AEbTmOB/wJhzXSeHPDWj+JGkj0jTfE2tsrYZoo4YkQepY5H4HFWk8C/DjwgC+t+Kn1q4T/lz0wYyfTKk/qRVbxV8dLqSzj0fwfb/APCNaHChRVhULM/qSf4fw5PrSvGnrUaXktWZtyq6Uk35vRHrGi2XhP4cW8sOt682nyFdzaR/aRuhjuHjCgbvb9ah8VfF/wCHvinSRYXGtara2oHzR2UTRl1xjaTjOPbivl55Gd2d2Z2Y5LMckn3NMLKP55pfX5pcsY6BHLYyfNOTuexv8RvhtoHyaL4HOouv3Z9Sfr+B3UyL9pPUNPuTLp3hjRbLK7fkhIbHcbhjivHd4biuk8EfDzW/iDezW+j26SCAAzSyuESMHpk/gelZLEVZyShubywuHgnKbMe6u2urue4ZVRppGkKp0GTnA/MigSe+PrXrX/CnvCHhdXXxX45ghu8YNrp6h2U/qT+Qohtvgvp7KJLzXNSBTkqpQZ/AA5pewkneTSF9ap/Yi36I8oE3vTd5zXs1j8Pvhz8RJTZ+EdavdO1hkYw2N8hZZSoz1I/rXjd5azafeT2twnl3EDtFIh/hYHBH51nOEoWe6NqdeNVtLR9mRbqOtG2lAxWR0iAYpaeqkHmnYos2S2NEYFLsFLShSRVpWC4lFPVSDzTuB7nsKpK4iPFe4fCn4Upouljxh4o0u6u1jIbTdGjhLSXT/wALsOy9PvYHc9Kd4J+G2k/Dzw9B448djg4fT9EIG+dsZUsPyOOgHJ9K2PHN3faho2l/ETXmnNnNbxrb6FBMwhM5ZyjPg4CbQCe5PHeuylSt7z6HhYnEut+6p/C9L9yrrWq+LvErXWp+L/KsNNtyDaeG5LhLdLlj90yZYbkXgknrjgV5tqejy+I76XUtZ8V6NFcTHDfvmkKY4CqqKcKAOAK53XdZvvEmqT6hqMxuLqU5LHgKOyqOwHpWn4B8E3nxA8VWOiWeVedv3kuMiKMfeY/QfmSKHU53ZHSqLoxc5NI7/wCJHh3wItrpGtrrV/eG+j8uWXT4ldJZI1RWYlsbD6jrmoPBPxQ8P+H723sf7G1fWbBjtWC+mjuSrfw+XFtwD0HXp2Neg+Mvhp4KvPh9qp0PVWtLDSL9ftZcNN9nlX5JcL1y4weOMjNeLz+MLTw9A1p4TtXtMjEurXYBu5fXaekQ68Lz71rKXK01ZHFR5cRT5NW/yPULy78Ji+kubzTbDwZcPOSbe9tYp55VJyG28iLn1XArP1HxR8SNYxbeDrOS30eMkxvorRy+YM/eZ1wMk84AXr0rxCWSSeVpZXaSRjlnc5Zj6k12/wAHfiSnwv8AFL6lNZve200JgkijfawBIO4Z4J470nWUvd2Np4N048y95roy3N8Z/iT4fkNrd6zfWsoJJS7gXfn/AIEua6W0+OHh/wAc2kdj8RfD0d664VdWsF2Sr7kDBH4Ej2r1rxh8RdVuPCMXi/wpa6d4p0UKTPDdwH7RZ46ggdQOhHUdeRzWB4T8e/EHxxpEeq6P4J8OXVmztGH8xVIYHBBBbIqNnuec6iqU+d00mtL3s7nlnjf4OWUHhtvFPgvVW8ReH1YicFcS231HcDvkA96o/Cv4T2fxJ0/VrmfXxpD6biSSNrfzMxFc787hxwe1e1f23feMfh/4oPj/AEiXwnolhKiuNMPlPcsCdyYbO4Z2Yx1/CuBuPiH4K+Gfhu9t/h59rvdX1RfKnvdRTJt48dMEAHqeMdeuaThBO7N6WJxE4OEG+a+/T7x8f7KdzqttDe6L4osb6wnhEkM7wOgkPYcZ4xznNUY/hV4O+HFsH+IWsNc6o5BTSNKcllX+85HPI57fnXdfBT4+6LDoOieGNYSW2voSlnFcKoMLgnClj/DgcGvFvjBrU/ib4ma3dT2Rs50m+zfZ87mURjYM+pOM/jTahFJxWoqUsXOq6VaVorr3OobXPgrZXSPD4d1u9UDJDzEKT6EF+a7DwBqXwx1u9uZNK8FtEbdR+91Ahw0hzsjUFm+Y4b8q8DsPDWqatKsdlp11dSM21VigZsnrjOMV7R4X+FniHQ9A0CWSNNNMWonUb1ZsmRtuFjjCKDk7dx9t1aUlJyu46GuIp01H43f1O5T4j+FL+08/SPD9pqarGJJTbWMcrweoeIYcY9QCODiuVm+LHifXr1F0Lxto9kAcLYRWb27DnGPnVs/gfwrn7jwRZeEtau7uysrq5uoZ2aKe91WGxhQls7QEbefzH0ras/ELak15BqetaJ4bvLggpeeHpVeZnPASRVBL/VSPxrofvaPRnJGEYK8dV3f+R2PhzxR8Y7DUrFptVtHilYMn2yWBY2H+0DhvyFfYPwr8Z3Om2Df8JBDY2uoO43SabDJ5UrY6kkc4x16V8Ual8M9A+HBh8Qaxrlzq8qqAhu7Zp4lm67pAvO3nhWIGep7VP4H8daXFqms69P4p13UZ7awledktxCoD4jUIC5AILcDoMe1eTjsDDFR5Tpo15QkqlP8AI9x/az8cx+I4tHvbKAzaKInSPUApCtIT8yHPKsNo4YA815N8BtZup08ZadpzmLUJrVZ7a4C7lV13BQRjHVh161n6P+0bpmmxtZ341zXtOuDtlj1WaKVYhx86rsOWHUZPatHXfjFpfw4uv3fhqzm8LaxE0tvqGksFNzgfddcDDAnDDt1FVhqbw+HWGtovxJrOdWbm43cvxM7XfDGk/GDwt4d1jxcF8N67O726vbsiNdYJxgHOehIHUfjXmfiPwvYajaLo2ias82jxMfMttFtVnkdlPJlO8MzYB7YHauc+Jfxd1Dx/f6XKlpb6TbaWxaygts/uzlSCT6/KOgxXO+PbaSDXU1aDMcOrRJqELRnG0v8AfXI6EPuFdPtIqLtG500cPUi0pytfoR3WneE9MuJI7oeIvMUYEMkEUBP55/lVd7zweigLo+qXBHV5r5EPtwI6ntfiBrsMP2e6uI9WtcY8jUo1nXHsW+YfgavaP/wi3i3WbKwutJudDmupli87Tp98WWIA+RwSBz2PFYLll/Dsn5noNzgrz19DVPjXTvCvhjTk0/RJLd76R7ry31CXIVfkRiVwTklzjgcZqC3+Od/FdWk0ui6bObeQOGlRnkx7OxJBq/8AE/wRa6h4kS38Patpt1HZ2sVqtm12iyrsGMDOA2Tk9eprzfWfDWq+Hm26lp1zZZOA00ZCn6HofwNa1quIpStF6LtqRRp0Kkbvd9z0S/8Ajja6trEt3eeEtPn3bQkjENOuBx8zKQT+Fbnh7UP+Ek0651OLWr/w1pcI/f3txYWxjOD9xHQKWbpwB9a888IeAl1Gzm1vXZn0vw3a/fuCuHuG7RRA/eY+vQVPfaxf/FLXLPTbWJNL0i1XbbWqHENnCv3nY9zgZLHr+NVCvVetTVvoKdKm/dpvRbs9cufEzarLp9/aeKRbeDrD90I1uWt7i8nAyVkJVQC/HPRRxXIX8/jvxfrNxdN9ruEuXBeOxuw8KITjACsRgAV5/wCLNdtL24t7HSw6aNYJ5VuG4MjfxysPVj+QAqb4cMX8b6MFcoq3Akcj+6uWOfbAP60niFKfs195KwvLBzPTvGnxN1LT/FWsWF/avqnh5p/LWyv1baFUbA8T4yh+XqvH1qDw94gW2lCaDqMviHQLtWiu/C99IFuFRvvbVPysR1DJzx0rz4fE7xHDcTvFq1w0UrtIYpm81OTkDa2RU+n+LbvxBciE+F9O1e5zkNa2zQyg5HOYiADx1xSjVpyla4nh7RV0kVPiN4R/4RPUg9s7XGkXYZ7SdgQdo4ZHBHDqeCKr64f+Ee8HWelbtt5qTC+vF7pGP9Sh+uS2PcV7RZatoWuaNH4e8Xm1sZy4liinvhPMjKRy0mPlOBjliSM1U8T6Lo1rrV4+mSLJr0p3uTFHLcBSBs8lZGVdoGANueK6XgoNSnCa/UUMVJNU5R2+5/M8GtfB2r3dstz9ka2tGOBdXTCKP/vpsZ/Crh0/wzoozd302uXQH/HvYfu4QfeQ8kfQfjWx4hj0ue/Y63qXiNrwdReWiBh7AF+n0rLaz8Khf+P/AFf/AMBI/wD4uvIlSjT+FL5nqKrKa1enkU7vxte+S1vpkUWiWneOyG12/wB5z8x/MVlaNaX2pa1axWLyC/lkASRGIYH1znIx1zmt37H4Ux/x/av/AOAkf/xdbWmWOgaDo02tRX+pxi432Nu7W8YfcR87KN3OB8uT03UU41Jyu5qy/IHOEVaMdX5Fnxt8T7DWIotFuNLXU7CzYIbwzlZJGUbS6EDjPJ5zmuXttOtre7h1Dw3raLco25LW8xFMpP8ADn7rZ6defSoJLbwuP+X/AFb/AMBY/wD4umfZvC+P+P7Vf/AWP/4ulVqzqT5qjTKhCMY2jdfI0PEXhefUWN7a6c1hfMnmXOmEEE+ssQ6Mh7gZIPtXHLz0r1DwDcGW+W20W71e7SMhnS5tI2hi/wBosX+T6giutu7jwHod5Hq8S2UmoyySJHN8/wBn81QNzYwVHUc471v9QjXj7TmS736mP1mVN8jjc810bwI4SK+8QXieHtLYbhJcg+dMMZ/dx9T9TgVuS/EeWKzfRfCVm+j6Y3ySPD811ddsyOOef7q4FVfFGr6jDdNqVx4ftbwOMDUZ5HvUbjs2do69MD6Vgt8Q9dEZSK+NnEf4LONYR/46BXLJ06D5FdeZoozre9Kz/Q9S+Edh4h0nxNYajLa31lp1ruupC7NErhFLBeSMgkAfjXa/Dv4neJ7XxMF1nxLaTW90kiCxurxJyzscKu0Z4zxjsD0rx7wtBrGreGNfvDJLPNdLFZxzXkuFCFt0h3OcYwoH41kRW+ieHpklvtXbUbiIhhb6UPlB4xmVuPToDWylaMZPr30OKWHVXmXXyPYPiHd+HrWeTU5LSz1PR7mWQQrY6Vh4WBAaN5Ay4YN6jJFebzWegfaFuZvCFzYWDgssl/qPlrj12nkj0xXWwfFGzhMVqtsumaf4gDSrfRvkwTtlXLg9SGCnIxwc4rw3xBb31prF1b6i0rXkLlHaViW+uT69aVetGklKCv8A15mmFoyacJaHez+IPCWm3pS0nSKMDIFtZqyhvQyEFj+AFZ+reItR1si30/xBYW8TkKI4jJFIc+7KT19DXnb9at6HYHU9asrXOBLKob6Z5/SvOjjZzajyqzfTQ9L6vGPvX1XzPT5bDVvDU9vpC3ayRy2uPO3g7Z9zHcysckE/KfbFcpeeFbrUUd4ba70q/Bw9nPu8qRv+mb9B/umuZ1/UW1PW7y6ycPMxjz/CoPGPStu/k1DULaz1bS5rsyT4huI7V2ysygAHjswwfrWsq6qtxSenQUaTgk7rUw/7P1RNSFg0Nyt6TgQEnd/n3rZm1NPDlk9lZXJuNRmG24vFclYhn/Vx/wBW79K2R4xl8Nxx6fqE76jdMD9ouFKs9uD/AMswSPm9weOSBVZreW5aJ7XRNP121lYIktnG0T5z0ZVPyt+GPeslC38Obv8AkU2205xVkdLd+IrfXbfTbm+upLFrmLZDqcJKm2mXh0kAPKnr6jNdz4C1P4jaNco8niafQ9HjbJ1PUZ91sV6ApuyXyOgFc54dtfDOl2cmlarbQTXzA3baWsxnKFV+6G7MRwRmoh480PxTHPba3q072DAm2hey2tZtjC+UUJAGMfKRzXobJSlJXfmebOKqXSjp6H3T4E/a78DRaJFZ3fiJhdR4gee5tmj88jjzQACAG6+1eAfE/wCJXgH4geNNQsda8C3keuPdGD7TZzDzJSDgMcFf4QD34rwC+8HXNlbwy22s6Zd2twpaB/tAjLqD/tcAjuM12fi7Rr+z8Jwa4qG78SvaR2TyW3zbV5G9SM7m2AKSKyhSScppepwQwlOjNOMnr+ZleKPAnw9uYbi403X7i0jilaF3kYSRo/YE4/I55xXnV38MLidWk0fVbDWUAJCwSbXP4GqWn6jceH7uSK8tZvsNwvlXUEiFd6+oz3XqP/r1b8NeDHl8Yy2twZUtLeIzmdWKFkI+Rgevv9Qa5XyV5JezPfpqdJWc7/qchq2h6hpEojvLOa3YjI3p1/GsxjXsc1v430qSWC3eDWLJeYprjaWZfzGa5u58duJGg1zw3bsmNrAReWw55PIriq4SnB7teqOqGIk1sn6M8/6HHf0oPIxXbar4e0fWPD1xq2gLPE1u+JraQ5wO/Ht1+gNcTXBXoOi7PVPbsdUJqa0GUjDvSng4oPIxXMbIbTW606kI4zUDG01utOpCM0ANooorIobRQeDiigBpGDSU5ueabSYBTT1p1NbrUjuJRRRQUNIwcUUretJQAUUUVI07BRRRQWncKKKKCW7hRRRTRIDlhVy2027vube2lmz02ITVUDgn0r0Xw9eyWXg62MDBZpHdULDI3ZJA/HBrqw9JVW+boZVJ8qMLTvCOvxzJPbwNayqflkMgUrx9eK7vw3b6zpl1GNT1u2ltWPz28hDl+OAM155deJTqRxdG6iY8Hyrg7f8Avk/41s6VpNjbad/aEN+GvZFYW/2nCAHpnB79eelelh3TpSvDW2urOSopSXvHYX/xJ03QrprXTdHtZpLebIlKqFB/ixgZBzRL8T7TVpGlu7O4t5m/5awmKU+330/TNeXT6be2mWkt3C/3x8yn/gQp9lDcXkgS3hknc/wxjNbfXa7b7drGX1anbmPTofGyC5M9r4o1OxkyDia2VkPqCEPI9sYrT1mwX4hlZ9E11Bqezfc6cJZEjYjq8Ybp9P5Vw+ieCL3UbhY5ZFjbvDCPNl/ELwPxIru9L+Her+GDDqNnoF1qN1Gd8chuADGfUxxnP4ZrtpurUXvR0OWapwl7rszkLX4aa5rV0I7ZYbwFgGliuFdUH95ucgfhVbx/oE3h3UrbS3jCra26bXA4kLcs/wCfH4V7PoGn6t8UpY7LR7iXQPF9uGdtLCmGK9I5LA4G1+eQ3HvWv8T/AIQ+KU18W+r6GdR065VXivo5VR7I7V8wGToFBycNwe1aTw0HBqF7mKxqjUUZtHyjJCQRkVvXOgXniN7K6s4fMM1uPOkJwish2kseg6V2Gt+CtG8MxTXcV0PFSwOVkjtmCRxf9dCCSR9OPeua1DXLjxD4dvYiI7WO0kSRYLVdkfltwRjvg4OTXlyoqknGfboemqvO04Ga8ei6ETx/bd6p9Stuh9PVv0qaDVZjYm/v2U2+4izsI12RFx/EVH8I/U1l6bpqTwy3dyxSyhwHI6ueyL7n17VBqF++p3W8oI1A2RxR/dRR0ArmU3FKS08jXlTepoPcT3OjXd3M5aS4uVjZ2PJwpOPpyKXR9aNiGt7hBc6fKf3sB7H+8vow9asPo97caFpsccYVGaSZ5JmEagk4GSe+BVRrDT7VP32o+fLnHlWcZb/x44FU41YyXcV4tWZ0OmWUuh6jd3EbNLbCymlt7lD8rqV2g59eelU/CV1qNprdreafbzXDwsCyopIZOjKT2BBNdN4e1aw8P2MunSwMWML3M0Uj+Z5YwOCMAZxyRWT4j15crDPbTC3K5he1uWSF0PQhcY+or0ZRhThGXN8vM47ylJxaH+KfC1ppmszPPqMFnZTHzoIwC7lDzgKOOMkdayrT+zXnW30/TZ9SuD0a7k2oPcqvQfU1vtptrrPhGG4uxdWEOmA7NyrI8sTHsOOAeAT61QurnSpbP7HpuoNpduwxIJoCXlP+06549sYpVIRUuZWs9r7lJu3Ld6CzeIV8PFvIaC5v8YK2sYS3hPpxy5/HFVPEur3r2Gm2s9zLJK8ZuZtzn5i5yox7KBxUcHhAX9xHDa6rY3BcqAqyFGIPoGA59qsa34Y1S71S4ngtftMIYpGYZFc7V4UcH0A4qG6rg7KyBKHMurM/T/EWp6euyDULiJT1USHH613vw81uaa/Op60IJ9F08B7iW5tUcs38CKcA7ifeuV0PwDqeozM91G+nWUPM80qcqAM5CnlqTX/E63sFvplhHJZ6RaEiOFz80jZ5kf1Y/pVUVOilVn8vMmoo1bxiv+Aeq+J/jRpviy6gjvNBkfTbYBbeOO7aFo/7x2jKZP0qhpvijw1p+o21/YX+r6RdQnIWeNLiMjHKkqVJU8g8dDXkkVz71Ibsnqa2+uN6tGH1KCVo6Hofi7w3ZXmpteaPq1gthe5nt7eaQxMoJwVG7jg8da521+Heu6rc+VDbR7MH9+JlaMD6gmodInXX9Il0Vxm6RmuLJvVsfPH/AMCAyPcVu/Drw7rUlpNf6c62sl1mBJ5PuRIPvSEdzxgD61vCMK9RPlugbnRh8WvQ57xJ5iarb6RbQTJa2TeXGhQ5kfI3yY75I/IV2elfDSTXPFmpajqyG30yOdnCyHb5vv7LVy38VaH4Juylxrmoa7qCbt7IA0Sse3/6ia841nx1ruvBorvUpngbgxJhEI9CBWknh6HvT953vbsJOrU92Gnn3O2vdf8Ah/HrDSSWV9qPkZSNc5gwOyrkDbmsnUfiE2q2LaRYaTZaVptxKokjhTLOAwIyf/rVw8Sk1aihLEfnXM8dUm/dSS8ka/VoJe87+p7r8Q/DOmX9wsus+I4tO0S2jVLawtQGdW6E7R/hVr4deA5dN1nT9R8P662p+G5Q4njdiCG2kDK9OuPQ14bHaFiT1Y85NbvhrRtY1jU7bStJkuPtN1IFWOGRlBPqcHoByfavThjFKfO4fc2cEqLjC3OYOob7XW7t4yEaO5dkIHQhzg16bD8dYbjTI4tV0MX12E2vIs+xHPqVxx71t+JNQ8NfCnboFjo9n4j1SE7r+9vlDDzCOVXg9Py+pzVHQ/G0OtzPM/gvQrbTocG4u5E2xxj6kcn2HJqqKlh6j5KiTe5M5wrRTlBtdNTG0/4yJqOpi213SbJtClXy3gghy6DswY8nHp+VM8W+C9U0JYNV8OaneX+g3hHly28zExZIwrYPTng+3NdFqXg/wr8QpFg0OI6NrM1t9sgTGIpkyRyvYnHbsa4bwJ8Q9T8AXcsIT7XZEsstlI/yhvVT25/OuicpK0MVK8XtJdBU4xkr0FZ9UztbyLxN4o1aOyS8ay0y2z5CFFa5ugqgMwRvvd+TgVszW+q2Xw28WWl/o72FnDbg232pULyEk7mO35QRgYx0yK5Oz+LOkWOsrq0XhKMakucXDXrs3IIPUe9c34i+IWua/Nfo2oXUenXTMTZNLuRVJzt6DIrZ4zDUouSm5Sd18mrELD15tKUUktTOj8a+IEshZJrV8lqE8sRiY4C+lZMY5o8oinxoQM18zKpOpZSbZ7CUY35UTQrnFbFhahyPWs23TDV0WkqCwzXXQjrqc9RtI9y/ZR01j8V7KNQNs1tMjcdgu7+YrOuPgz4mvr+6MHh7UnHmyMMWr4xuPOcVv/s66hNo3xL8OXFq8aySXK27eYMqUf5WB/A1+h3in4JeE9V0e5upNNkmuMtcmNLmRRM452MN2NrEDjGK2x2PWXTipq6klY8ZU6lWU5w6H56fD74Q+I/C11Nr+qWl7p2m23H2HcI5NQfGVj2twVz1J6dqtalfah401a0bWdLPh9IiYFjF/FLbXCvwyPFnJJ7FckHFU/jDP4o8W+IZF1OwvUmVvJhsI7ZlSBc8Iq4/z61X8L/Bs+ALmHxb44nt9NtLIGeHT3cNNJIPu5HTrjgE84r26c5RS5upwyXPeTfvDfF2k+D/AITasNX1E/2vrK28cOn6Y2D5flqFDt78dT+FeC+LfGGreM9SlvNUu5JizErEGPlxg9lXsP1qTxdr83ijxHqWrXAxNeTtKV67R2H4DArBfpXl4nFSnJxjovzPZwuHVOKc/ef5DF9uKeDjqeaaBinAZrzzvSsOoxmgDNOAxVpWJFHtwa92+F3i7wLoPw7fRtU1O5t77VJT9te1jdHjXOFBkA4AA7f3jXhQGDTlA9BXRSqujLmSv0OXEUVXioN2W+h7LL+zZqGpXkVxoevaZqOjTsWW8aX5kT/aAzuI9j+Ap0ngT4WeHLxrbV/GF7qNxAP30VlF8jP/AHQwB/nXj6SvGu1ZHVfRWIB/CkUDHT8q29rTWsYamCoVXo56eR7DdfF7w34Ni8rwB4bjtLvaVOragu+cZ67Rkn06kfSvI7u6lvLqa4nkMs8rl5JG6sxOST9TzTAMninKvHNROpKpZPZG1OjClfl3fcRVyeaeBgUAYpQpIqUje4lKFJFPCbTTqqxIgQA1JBbyXUyQwRtLK5CpGgJZiegA7mmAZr1P9nPw/b6t8Qhf3Uix2+jW0moNuGeVGAfw3Z/CrhHmkkYV6vsqbn2OQ0/4a+KtTvYbSDw9qJlmYIvmWzoo+rEAAe5r1uPQPB3wBsUuddEHijxo4DxWCHMNqexOeBj1IyewHWuq1T4/ab4kuJ7XSPEd3pRMeyP7THHDHKcfeWRkYqc/3se1ebX/AIM0zwRFD4k8T2Oq39xNcbks5pUlW44z5kkijG3kcE5auv2Kj8Lv+h4jr1cRZVlyrourKOu6td3stt4q8dzHU72cGTTdBY7V2dQ7j+CLPbq3riqWoeI9R8cfDfUvtt081xpd/FcCIfLGkEilNqqOAqsBgdsisrUdW0DxBqtxfalJrRnuCWaUNC+D/CAvHyjgAZGBXefDLwFayvdrcy6hp+navavYiTUoo4BIzYK+WN+5yGAIwD9aFdvlRvNQowUpKzR5j4O8G6p461+30jSYfOupucscIijqzHsK990jRtJ+B2mXGhWetQX3j/XjHZxy24ylkHbaGzyQATnB5JA4qdBYfD74C6jqXgVnubyS6NlqWqypsnjwxVmC9VA+UAejZ614N4fu5NL12w1HHmSW1wlwxfncVYE5/I1MI8uxnOcsZza2iunVnrfxM1vR/hb4RvvhzoQkvdUuWVtZ1GYEbn4YgZ7np7A9814SLc9gTXt37RnheSz+J11qCqzWuqwRXkMpHysCgDAfQgfnXl76aV9M/WnGHMubobYRwhTunq9X6nPtD7VGYs1r3Fns68Z6A96istHvNVuRb2NrNeTnpHBGXY/gKlwfQ7uddzZ+HXxJ1f4a6yt3YSGS0kOLqxdv3dwmMEEdjjoa+iPDvjLwNL4O1y60y11Pw9Z3rm9eOIhXRkKB5oFBOApIzj34rxvwZ8Eb3XdahttcvbfQYDE0zo8yNc7V5OEz8vuWxiumudV8K6d8TrLRrW8udQ06OH+xUSIottHHIu1zuyS5LEnPHOK1gmt2eNjIUK0rQ3WrsL8VfHV54ms4rq70KPX9CiKrBd22oyNbZ/vSKmCr4/v9OcVy2lWmsalC1xYeAtHsrVsYu76BliVf96V8H64zVX/hY9/4MvLuy8P6XZeHjFI0Mzohnmk2N0d3Jzz6VLqnirTPiNexSa99p0e/PEl5bO09sx9TCx+T/gJ/CqdpPc1p03RjyxXumiLvStGuBPf6vpJuV/5dvD2kxymMgdpXG0H3Ga734lfFVbTTvD+s+GbKDzdUgkMl5dwBnWRGCkYzjfnkkg8Fa8u1P4a6poUCXbRJf6U/+q1OyPmQOO3I+6fZsEV3vg3wp/wlvwz17SlDNe6RKur2ydS0ZGyZQPX7rfhVN8kbtkyhByU5atHD6f4k8X+OPENlpkmu3qm9uFRlhkMSKP4jhcYwMmsL4j69L4h8U6jPHPKbJJPKto952rGg2rgZ7gZ/GvSPB/hOfTLTXPECAIdNsysTE4/ezfu1H1ALn/gNcvpnw3kvbKTVNRuBpGgx8NfTLlpWx9yJersTxxwO5pvstzWM4KV2tkZPiTwXfeIfGMMemw/aWvrG3vmmJCIgaJd7sx4Ubgck1Fd63p/giFbPw1OLvVf+XnXPLwVPQpb55UdcvjJ7YFd18UfG8eufC/w5b6TaSafYrK9nMS4DyCJQFV9oAIIYNjPXNeJuhFYTfK21uzow96yvJW8jW0nxbqujXM09rfzxyTZ87c+9ZQeSHDZDfjmvaPCeveDdW+GmtS6vZ2vh+/1GQWPnwrIInkRd6OFGdmCcnHFfPobnpn6V1viRhYeCPCmnAkPKs+oyc8/O+xfw2xg/iaiFRq7ZpXoRnypaO5B4k0DU/DEiC9ixBKN0N1E2+Gdf7yOODWh4K8aWVnDPoniK3N/4bvGy4U/vbSToJoj2PqO4rG8P+NdS8PRSW0bx3Wny8S2F2nmwP/wE9D7jBrVg0jw/4ukk/sy5Tw7qBP7uwvpS8Ep9ElxlT7P+dO/NqmOSduWf3md458FT+DtSijE6X+m3SefZahBzHcReo9COhHY1LZ41zwHeWLqXu9Il+127A9IHIWVfXAbY34mum0S8m8PWsngzxpYy22jXL+ZFNImZLCQ/8t4j0Zem4A4NFhoM3w58di11DbcadMphkmQfu7m0lGPMQ+hB3Z6gjHaiMfe9TNVbRtLVo8uNv7V0vgW3FhLqevSKCuk2zSREj/l4f5Ih+BJb/gNaninwTN4X16+0yQ+YbeTasi9JEOCrD2KkGrfiPTz4d+H+j6bkLcas7ancY4IjGUhU/X5m/GpjR5WpM3lWUo6dTzCZNwJblidxb1Nel+BjqPg/Rh4k1+6u00Qf8eOltL/yEJeQuFbP7sdS2O2BRZ+EdN8DaTb674rge4vZiHsfD5OxpV6iWY9VjPQDqa5LxFrer/EHxCbidXur2YiKC2gT5Y1/hjRB0A9Kxi3SfMt+wTaqvl2j1f8AkdR4r+LNv8QNStob3wvFcWiqIreGOd1nRmP8LDjk9ttP1u18NaXZXXhvR9c/sm7eT/TpryMusvAIh85B91SCOmDR4b8D614Usv7QGmSPr86MIEuB5cenocgzSs2AGPO0Z461yt1onh/RsfbdafVbvOXt9KjBT6ec3Gc+gNdTnVUeaold/gZxjRbtTe3zuVrvwFrVrC08Fuup2g/5edPcTpj1+XJH4iuk+H/hG+0+e71bVQNHs47Cdo7i7GDlk2hgn3iBu7D09ayE+IMuixPH4bsYdBV12vcKfNuX+sjfyAFdR4R+KlxF4a16416wXxCypHbxzXAUNh8jYWxnHGfWooxw/tE7u618rl1ZV1B6afick194W8PjFrZz+ILodJ7wmC3DDuIx8zD6kVm3njbV7qF4I7o2No+QbaxUQRY9MLyfxzU8k3hjUnBNtf6L6mGQXMf5NtYfmalXwH/aILaLrFhq3fyPM8if6bHxk/Q1zTU5609V5HTH2a1mnfzOW2+ZnI3Z65r0TwpcH4g6UnhW/ZP7UhUto9/KfmVgMm3J/usB8voa5DUdA1HQZjFqNhPZtnGJoyufoeh/CktImWVJI2KupDK6nBBHIIrnpucJa7eZpU5akbRZsDxB4g0qV7C9leYW7GN7LUUE6oR1Uhgcfhiry3HhjXCf7R0ufRbg9LnSzviz7xN0/wCAn8K7uLSF+Muly3sIWPxnYQ7p4FGP7UiUcyKB/wAtVHUdxzXGL4dcrypBHXI6HvXoRpylotV5nGqkeujH6L8HZ/Fuqx22h61p9/bsNzzljG8S9y0R+b8s1jfFC3k07xG+iiB7ay0pfstvE44PALSe5Y5PFd9pmnzeBPC02vwTPBrGol7OyK8GKJcGWbPfso/H0ql4aj8S+KoXbUmgvfDlu265vtcXfBCO4En3t3oFPXFKVGKhyR0bYRrTUueTukeMNAWZVALMxwoHJJ7Cuvt/Atj4Zt47/wAX3LWe9d8WjwYN1OP9rtGD6nmu40zUvC1rrF1beENHv2vmO2LWGg+1CL1KRMflHoWOa5i6+F1ze3d/dXmuQ6hIh3SLYk3Ny5PPKEjHvnpXPHCOmuaK5n+COj6w6js/dX4s5bXvGdxqcLWVhAmi6OOlhaEhX95D1dsdyfwrRl8Hazf+CdDMGnzOjTXEgcgKoQ7MMSeADg8+1Ul1TTNBkeODRPtN2rcTasSSv/bIYA/HNbHifxvquteANKt7iWPyZriVHEUYTKx7NgwOgG48ewrODg1P2zbdtlsayTXLyLS+5naZbweFAz3HiVoZG4ez0n96W9mY/J/OrieOdBnuZd3h+LT1YDbeQKkkyEfxbWGwkn0xXBkYFKkTTyJGgJdztUe54FcUMXJfw4/edXsIvWT1PVfH3hfWH8O6PFb6jJr6tvuSoxv2sF2lUB5UAds815XJvhcrICjr1DDBFbnjS+eHxCYLeZkXTo0s43QkEbBgkEdOd350L4wk1GPytatItWUDAmb5LheOMSDkj65rTETp1qjS0t80zKjGVKCvqvuY/SZf7Z8M6lpjHdNaf6dag9cDiVQfQjB/4DV2Zv8AhP8Awu0o+fxBpEYLH+O6tgOvuy/ypvhm105NUtbzTNSEVwj/ADWOogJvU8MokGVOQT1xVG8tdS+H3ivz4EeB7eYmGQqdkiemejKQe1LaK5tVs/0Y3Zy006/5o5QnIrX8NmS2lvr5Mg2tq7AjsW+Qfq9a3jPSrSUW+u6VGU07UdxeEdLacH54/wCo9qr2ltJF4RmWFDJc6ndrboijJZUG4gfVmWuSNFxqt+V/8jpc+aN+5yyRvI6oiM7sQqqBySegr0HQPEVv4MU6Esgklu2Iurpfu28hXaAvrtPU+tVNN0ifR737BpcH9p+JHTDPHzHZDuAem71boKrSR6J4QnzPs8R6qB88ati1if3I5kP6VtRjLD+/s+7M6ko1Fy20K9n4Hnjae41m4TSdPhco883LSkdRGvVvXPTmnzeNV0Y/Z/DVsNMtxgNcSAPPOP8AbPQA+gpviG/vPGVjbarJ81zA4tJY04QZOUZR0UHlfqK0dQ+H+jaCYrfV/EiWd+UDyQR27SBM9sinyT19hou7FdNJ1dX2RS0+8sdTvre7simj6zE4cRE/uJm/2Sfuk9MHik8S+GNS0/WJPL0+fyJ28yLYm4fMNxUEccEkVoL8Lhq2nR3fh/VodViMhSRXXyin5/yrvtfsv7Rig8Mi6uNNuFgRra8RiEuCq4ZOPT0zW0MLKrBqqrNbW2bZlKuoSXJ8zm/A3hnU4re6k1WOJdHjBllsrwA72C/eH9zHr3A6U1xb3d3PeHX57vT9Qb7Pi3UhICfuAnPy4IGCBg/jWJrktrpQfRYtcnsI4AYrlFgc+c55ZmIPPUY9qzNOFhoshlg8QW06SDEtvNbybJF9CMGpVRQtTt66gqfO3N9TQbxddWt7/ZtlaXU935nl7dQumky+cfdGB2roLn4i6TqaX2mX00lgzr5DXsK5U8YbHoM5FUPGNjFo+mvr9scXd7HHApYH92CvLLnnJAA5rlvCHg4a2JNR1Bza6PbAtJMTgyY52r/U0OVelV9nHW/fZI0jClOPM+n5mpceB9Xt1S88Pav/AGnCoyjQz7XX2xnFZ0vjrxJpMrWl/seRMAx3sALY96tp4y8P6ZcM+m+H5Y3U5SQXLJuGeCR/SsPxj4pbxZqENy1qtt5UflgK2Sec9cCuLEVKcYt0qln2WxtTjKbtKOhfm+J2qNE6R21jCHGG2Q9R6YziuPY7mJwFyc4HQU7GaYa8mpWnVtzu9jthTjD4RG6U2nHpTRWJoI/XNJSt0pKgsZ3xRSsO9JQA0jBpKc3PNNpS2KEbpSU480z1rMAPSm0+mEYoAKRhkUtFSwGUUUUiwIyKbTxTD1I9KACiiipsAUUUUFx2CiiiggKKQ8CrVnpl3qLhba3klP8AsqeKuKb0SE2lq2aXhBbV9dt471FlifK/P0Bxwa6HxKmvy7fLs447GCTzUFtg4weCce1ULHwDN8rahdR2anogO52+n+TXTxaRbaPpssMTm2ikUpJc3bnODwcL68169CjPktJW/M4qlROV1qcNd6b9q1cPGNtrOouN46Ip+9+Rz+NXF0fU/Et2JbayaK0A2xGT5URB0rtfDFppg0/FiWuYUZot8oznnJH0yav3mrWuliL7XdRWgwf3b87x04reGDglzSkRKs72scppsmj+DgXn1CW/vF/5drZz5effsfxq8PiJpEkRjfRGMbdVV1UH8BivObllNxKUPyFyRjpjJpUJPFc0cVOHuwVki3QUtZ7nod18TbpIBaaJbpo9p3MYHmH8e38/epvDnxB8QaNffarXV7pJSctvkLhj7g5H6V5/E2Oa0LW42nrWkMVVlK7kTKhBRson2z8Av2sodP8AEtjD4ws7GPTWQpLqMEJEitj5WYZ6Z64r0346/EXwd8VNIvNF8NappWsX0kYlSzlldVlCtkruGCDgf4jFfnna6myrgNx+Vb/g4w614u0uzumf7PNLtcxSFGxg9GHIr1qeIU5pvV7HgV8rp+09snaxv654ck8NXD3svh/V9AMON1xazrcRKDxyD1HsTWJbQaFrMt1Nb3IgmkgZbkCExxlT/FjopBA6HFetQ6QbEj7C94lqZWhuLXUbgzLJFjAZAScc4x685rxnxHBpl/LdaZoE6W+JmaWCYbPPb0Vj2BzhTXRiIey95/d1OrDzdV8qMnXZdJt51tHa5mitfkS2iURqD3ZmPJJPfFY7eIHgBWwtYLEdmVd8n/fTf0xWibd9bj+xXStFrNupWJnGDMo/gb3HY/hWNpdm9zrFrbshQtMqsG6jnn+tfPVHJzXLpc9iFrW7FzxRcSy6mIpXaQwwxoSx6tjJP5k07TbePS7YaldqC55tYG/5aN2Y/wCyD+Zp8ccV/qV9qV3uFikrMR/z0OTtQe5HP0qSa1lv5f7R1h/stu3+riH+sdR0VF7Dtk0ct5ObJclaw/wmk+pa3NnfK00EqySEZHzIcFj25xWrpN9pml2sOnXkq3sgfes+wPDaORjj+9zgntVLRtfeXWNOtraIWdgLhQIIur5OMu3VjzWRLb+Vcyx8jbIy88HgmtoVPZwTjqyHDmk76HWaJc3OmeKtmszGe1v4zBNMTlHifgOp6YBwelY+reHrjQ9VurG4U+ZA5UH+8OoYexHP41t+Fza6xAmiapJ5UZJFndn/AJdnPZv9g8Z9M5rvvGfgq9vfCmm63c27R39i40rUgRzuAzC+e4ZOAe+K7FR9tTuuhxyrqlUSfXQ848KWP2eS+1JgAljblwWH/LRvkT9Tn8KzNH8PXut3wt7KMl1HmPITtWNO7MewFemp4PvX8H6Tplhatcalr140iQqPmaOP5V/AtvOe201k+NZ7XwtYP4X0kpKy4/tO/jJzPKOqKf7inI98U3RUIpS2Q411NtLd/gY2s+MH0eIaPoN1L9jiBEl2x3PO/dlJ+6vpisZPGWrKu2WeO5HPFxCkg5+oqrbaReanN5dpay3LDtGpIH1Parf/AAj0Fl82qalDbH/n3tz50p/AcD8TWM51ajutF+Bso0o+osfidHX/AEnSNOmzjLLEY/8A0Ej+VaNjbWWrrvj8O3axDO+WC5wg9OXGP1rNGs6dp7f8S3TEdx0uL8+Y31Cj5R+tWLdrrXon1DWryZdLhOACceYevlxr0yf0qoSu7N3+Wn3ilGyulY6XSvCGjLJZagmsS2AW4RcM6yfPnoHHBP06VP8AFnxXqFrqD6BbR/2fp8aqxEXBmBGe38PUY9Qa4DVtWk1q5DJH5NvEuyG3j+7EvTA9++e9ex6VoNn8UPD+nXmrwXNte2gNuzJ8hlxjnkdOn616uHviac6FDSX52OGp+6lGpVd1t6Hh/SnoDmun8f8AghvB2qpFFI9zZSoHjmZMY9VJ6Zrmk+9614VSlOjNwqLVHpwnGpFSg9CzGucVp2UAcis+HqK3dNUZFdFGF3YyquyNXT9KabHy5r6YtfB1j+zp4OGo3ey98b6tbbraIDcltGe+T2Hc55OB0Fcd+zT4K0zxx8UNE0rVVD2MjPJJFnHmBELBfxIH4V+hPxU+C2jeIPDsOpWukWV94h02DZpy3b7Ygf4VcdGUZJwe4FelUxFPCThCXU+cxUp1Hyrbqfl7P4FaBzrPiy4ksLWfNwkZIN1e7jnKL1AJP3m49K47xZrj6wY7a3tl0/S7fIt7KJjtX/aY/wATnu35V7R8U/hb47j1e91DV9GvbuV3JkubcCeP6AoSAB0A7V49aaPNdeJbDT5YnilluY0aORdrAbhng+1bzg1pB79e510akZLmb+XY7TwOBb/GbS7RnC/ZLEWuCQPmEGSB75Y1y9l8IvE2veJL21XTpLOOKdhPc3I2xxAktnPf5eeKyvEmovP4x1G/t5Xif7W7xOjYK7W4wfwFdD4l+LXiTxXo8Gm3NyILZFCym3G1rg+r/wCA4rRVKM48la7s3bzNeSrB89PqlfyOx0O1+HOka3pnhq200eJr26mWGW/c/IrnjjPUew/OuD+K3h+30T4g6xY2VstrawyII4YxhVBRTx+JNZOlRT2V1BcwMUnhcSRsOzA5H8q9g/aA8Prcav4f19EKSa1pcVzLEf4GAx/h+VaTl7ei4WSs9Ldjnh/s9dO7d0eDGE9MUqRgDFbc+nFMnFUJYTG3SvLlScT01O6I4xjFbOnThG9qyApBqeCUq+e1VSlZkzTaPTvDevGweORJGjkRgyspwQQcgg17jL+1d48k0eCyHiOVVhxiRUUSNj+82Mt+NfLFrqJX+Lir39rtgc5r2uehUS9tFSttc8udFt+6e9a5+1Z46nyf7UtnPqbOMn+VeGeMPFep+LdUkv8AVr2W9um/jlbIUeijoB7CqFxfFx1zWXPNkmuWcopctNWNKWHjB3tqV5arnrUrnmoj1rgex6CQwDNPVeKFXmnAYpJXHcXGacoOKQDFPXpVki4zTgMUAYpQM00iRQMGlxmlAzTlXirSuIUDBpaUDNPUcVdiRAnPNOAAFBr2D4e2fhLwv8MZfFPiTQj4huLrUvsMNuW2hFChievHGfrwK1jHmZy166oq9rnkGDTgMV7F428JeCfE/gC88Z+DvtOlvZzRw3mkz8qpcgDb6dc8EjHpXj+0eufpVOPKKlWVVabiYNeufs2XdmnirWdPub2Gym1PTJLO2aY4DSsQAB79TjvXkwU96chKMGUlWByGBwQfanHR3QYin7Wm4Xtc9c0r4Ma/4He51LVdBm1S7tZTFY6dDA0yTOOBM5UECNeoB6njFekSfBLxVpkj6zD4xu7iaRPOv7NLbzTLxyscRO1gOAAQOK8h0P4tfEfWNRsdL07xHfz3U7pBBEGXLHOAMkfqa93v9B1Xw94Zv9XtfEcmv/EXQUiub1vMLqITkm22DjaV3H1JUHjit00loj57Fyr02lOSu/uf+R47afEfwlFf3f2fw5/wj92/yrq0cCTyRMOGYwt8q5PZelZF1oOvazrsGp6XrC+L7mJ1mWWCUmdSPmwYnwy9B90EV1vx38NaPqvhfQPiFpdtJpkuutturJlwvmbSS49OQfrwa8fsIria8hjtFka6dgsSwAlyx6AY5zT529ztoRjUpOcX9/c+ovAfh298K+I/Fmuay8em/Dy9hFxdWt/HuS4aVQdiqejKxIP4D6eHX1np97rl7JpNtNbaW8rG3huG3SImeATXsv7QMl/F8OPAlpq14trqyRj7VpYl3MxCAeYfoRjn+97Vw3wn8Hz+OPFem6JbNskupdrNj7iDlm/AAn8K0ptRjKtJ6I5sPzcrqy3Z9Q+BfBvjmfwZptj4h8EaX4pjt4wbO4u7uIFYyo2ggg8gYGeOMVp3HgrxQsMcFz8KfDL2kfPlpcxDGOmCVr1rwDrmk32vpplp4tllNkRbNp09uiK+wbSFbaCTkdc/hXUfFT4e6X4s8Kz2MoMDomYJ7fCvERz8vI9xg8c18JUzCUK6hNWv5M9SGAjVoyqxe3mfLnifUdJ0nSr7/hYsPhaO3CYttM00efc4zkLn8B0x/SvkPxJ8Q9ZuHnt7G9fTNM3t5VtZxrbAJngN5fU49TXuHxH8IeCfCNyf7U07xWdzEAEQRxyj1WXkH8M1xeg2Pw41e/vpj4d1o6ZZWzXNzc3upKFj2/dUKiDJY4UAnv0r6/Du0Lq7ueZSUKd21c4C8x4M8Fm2LY13xAgkuDnLwWfVUPoZDhj/ALIHrXCwSyW00c0Z2yxOHQjsQc5/QV6lq/xH8I6lqVxd3Hw/juXmbd5lzqkxdRgAKNuAAAAAB0rNPxK0eKIJb/D7w7Gy/wCrkl86Vhzxuy/zfjW0t0d1OUox+DfczvihBE3i2TUYMC11WCLUIyOh8xAWx9H3Vz9mgLgAg/Q17l4u+Mker+B9E1fRvDulW0tncmylW9tI7gW58sMojBGAp56jPy1yNr8cvFUUubVtLsMjDC00uBA31+XmtEnfQmjUrOmk47eZL8PtU1zQpPN0mW4WN+JI1QvFKO4ZSCD+Ir6v/Z98CW/irxBBqKaNNoV7HEwuI0gYWV3C42MACcox3dBkcV4l4D8ffEfxCjXqeIG0rSY2/fX8yxwW0frjC8n2Xmvof4JfGQWmsyWkGpXutadaW0l1qOq6m7DCKOBFHnCAtgZPJzXl5lUrujJU0r+VzKl7OVZKttfoa/j39n3T/APgmUql1renxXX2qWxjTElzJgLErbeiLlyccnNfIPxNsfE2vXZudR0y8WCBNsMMdo6QQJx8qLj5RX2d4r/aQTxV4O1K80OFoJtOKSXdnM+JJbc/KWR0OVIJHvXzV4k8Va94xeWXwn4y1U3R+ZtFvr0rOB/0yfO2Qe3B571z5VLGR5liF73d3NcR7BVFKhseJLYXF78N9bs/s03m2N9BeIpjb7rgxvj8dlebzRFWKsCGHBBGCK968MfFHxvd6/qejXut3q3T2NykSSgK8UyIWXtnPy4/GuCi+OHjS3Rv+JuspY7i01pC7fmUzXtVU92XQnUvJJef3nnSQyXEqQxI0k0hwiICWY+wHJrqvimPsnioabggabaW9kFbjlYxu4P+0TXaeAvi74l1fx9osV6+n3ayXCo7S2EKsq5ySrqgYEAHBBrP8XfHPU/EOs3Uo0fQ2tDJ+7jubCOdyq8DLsNxz+nSs7JRuy/aVnWXu7JnlwwWOelTxRgnFd2Pi8zcHwf4UOeP+QZ/9lU1l8SNKVFEvgHw5K/dwkq5/DfxUxir7mzqVLaw/Ei8LeLrq2tBpmpQrrWjMcGyuzkx+8T9Yz9OPUV9B+CPB2j/ABT0C38M2+qJcIis+lvegLe6e+MmFu0sJ6ZByOuK8g0fx34ZmuGkuvAGlndgKLW8niA/DdX0D8G9O0rxjqdk9l8O3s4N3y3kOqTQpu7Ydhyc/wB2jFTdOk5pNW66Hnz96aVrHN+Mfg3rWq6Po/2nTbhNaspE0i8j2EsVJ/cSZA5BU7cj+6KpeO/C9l4W8VXd/c6eNe8SRMltpHh6AGVbSKNQqS3AXPXGQnvzX6LQQWcOkQwowcRxhNxfe2QMHLHknrzXxr8UvEehXUWoR+GNHl1WzWR1uE0fVDbXLOCcmRNu9x15BNeFgMxq4ubjKOiOjE4b6qotSvc+Q/FHhnUNU1u81HxjrVvpV3MfMlS6bzLg9gFiToOwHAqx4T1Hw74KWbxJZabd3SWeY7e/1GQIZ5yMBI414GMkkknArodGn8L69q81rL4GjhtrcG4vr661Kcm3iH3mbpz1AB6k1zHiT4m+Fr8Q2MfgeGXTbHdHZxyX8ybVJ5JCnGT3/Kvpm1T957macqnuJM4nx18QNX8e6k11qE2yIBVS1hZhCgHopPJ965c813cXjvR7VSq+BdEkBOcyyTufzLUp+I2lDp4C0D/yN/8AFV5tSKm+aUrs9SnKVNcsIWRwLcDmulixa/DS6c4DXuppGMg5Kxxlj+ritGL4lpa7lh8J+G1QsThrFnx+Jauh134kNp/hrw7jw54eY3aTXLQmwykf7woCoz1IQ5q6cIRUm5fgTUqVG4rl/E8iYj1GaAVOPmGfrXb2/wAVNUsg/kaXoMKsckLpUR/mKmT4w62T/wAeOhD66TD/AIVgoUv5jbnqv7JjaD421rRF8q21B5Lb+K3uAJoj7FWyP5V02neItA1Z1XWPDkcTkDN1o8hgfrydhyh/IUug/ETxrf3bx6RDDJI55jstLhwPbhOPxNd5pXjHxfpbh/EHifStDReWhNpBPcn2EaKefqRXdS5mtG/mjirPTbX1J/BnhXTTqVvqfhXxWtre2sglji1KB4JUI/21DKR25xkZr6ds/wBkVviZbw+I9Nnt9AS/iEs9jInmqk38TRspIKMcsPTPavP/AAH8Qp9ASDUby91FIpmBia/CRSXR7LDaRDccnpuYDmvqTwr8f9Ntm1LTLgML/S7D7depAAVgHXyic8yY6gcA8V5eY1sXRS+rKzOOg6c5/v72PnX4m/CHwj4Q15W8YatZ2ttpdqtvpuiLId00a8+ZKVBb52LHaOvrXzv8SviNol/tit7KbVYbc/6NbTqLXT4Of4bdOW+rmvsD4x/EbQtfkuribRbHVYRbR3Szm1S4mS3YfLOqEgyRjJBUEFSD1HNfKfjVNAks5tSj8G6ZrWk8H7d4dvZYWiHYPGclDnrkYrtwUqsqPNV+IUXB1Gldo8P8ReNtY1mPyXuha2nQWtkggiA/3Vxn8c1ygZ4ZBJG7RupyGUkEGvRLo/D3UmbD6/pDHpuEVyo9+MH8KzZPBnh+7Yix8aWIz91dQt5IP/HsEcCsKlOpOXNGX4nu06kIq1mvkYsPji9aJYdSgttbgHQXybpFHtIMMPzrZvLXQ9Z8KaSI7l9CzcXHlpcZmizhN2WHIHIxkGqzfCnWJyTp8+m6un8LWV9GxOfYkHpzVjX/AANr+neDNKS40q5BhuZzIFXeVDbNpIXPB2mrhGu1LmhzKwSlSvFwlZ3Oal8Ham/mGyjTVIUGTLYuJQR9ByPyo8G2oPiS3knUrFZ7ruUNxgRjdz+IFZpe506beDNaTqcZ5Rh/Wu10vxXct4Y1K+1iGPU0Zo7KMyrslkDfMw8xfmOAo9eorlo0oOalJNW3N5yklprc4G4ma7upZpDl5GMjH3JJ/rTQmK6c6d4d1cZsr6XR5z/yw1AeZH+Ei8j8RUd/4J1bTLb7Q9qZ7T/n6tWEsX5rnH41yujO93qvI2VWNtdDB8nPIFehya9fv4P0y8hKXcFsfsN5aXKCSIkcxMVPTK5GRj7tchbW+/sK9A+GuljU7+78PzELFrMBgQnos4+aJv8Avobf+BV0UIzV4rqctecUk30LXw4tNF8atf8Ah0Wc2n/b4TK0CHzIlkX7ssZPzIR6cgiuvuPg9a+H9KtVXUzbLaKyNezAKYlZsuy9g54XJ6D3qb4ZeGdP+Gvg6+8fawks12J5NOtLOPg+Z/ED7nH4AVyXxQ+NFx400GTSoNJTToZiDM7SeYxAIOBwOMivahOlTpN11eR479rVr2oaRM/xJ4M8UJv0jw7pkVposhA+0206s9yP70khOT9BxXM33gXwjpczWt54tZbqL5ZVjg3BW7jIrkpZ54gAs8qqOAokIA/DPFZso3EsxLEnknqa8KriaLvanf12Pdp0Z2tzW9D0/Q/h89nfW95olwmv6DdJsuCWVGHOeF7kHB9a5r4vAjx5fD/Yiyf+ACuTju57Vh5M8sODkeW5Xn14pb2/uNSuDPdTPcTEBTJI2SQOBzWNbFUpUPZQhZ3TNadGcanNJ3K/mSRZ2uy5/utiui+HokvPGujo8r8Tbxkk9ATXOsN1eofDyysPDvhyLXLhvK1C+ma2t5pQCIuuCPrjr/SssFCdSsrOyj+heJajTbtqyj4g8NWviX4lTQtfxWcFyolDsOZCPlKr2zkVZ1rUvDPgvU1sH8MSTSQbSlxNwXxzu5zmsTxHp0cwtfP1b7Nc27yIXu4HjYvv39RnH3uMfhXSaVdp4rsRo/iC6sNQQ/LDfW8485GxxkEA/wCea9SNueagkpPZ73OR35I8z07GCPio2oPfQ6zp6Xum3B+S3TCmMeme/wBetY/ivxs+u28FjZw/YNKhUBbZTycD+L/Pv1qp4u8LXHhPUzazsJY3BeGVf4lzjkdjWEK8aviMReVKqztpUaNlKC0GkYPNNbjmntzzTSMivObdzuu2NprdadTX4GaiwCU1vWnUhGRSAQUw9adSN1pWLGt0ptOIzSEYqQGkZptPpp60pbDQlI3WlpH4GazGJTWHenUHkYoAZRRRUsBpHOaSnN0ptIsKRutLQRxmgBtFFFDAKKKKkadgooopoQV3lr47sLaygh+zzuUjCttwoJx9a4OlXjNdFKtKi24mc4KotTq73x3Ic/YLSO0dh80z/vH/AAJ6Vz17qN1qLh7meS4Yf89Gzj6VWoonWqVPiYRpxhsiWOeSMYSR0HorECkeRpDl2Ln1Y5picjNOrNSdrMphT0OKZTl6UCZPGcCpo27jpVZX7HpT1bnA6VcZWJNBZz64rb8G6lHY+KdMnnLeWswyVbbtzwD+ZFcyp4yamjODxXVTqOElLsY1I8yaPpnVH1S+gnjhkghkSaNreVHPKAjcHH5jA9a8q+Ing+6vfEks+mWMkscihpWUqFMncjn8/fNTfCe6kgtfEd180vkWXmBSxOcE8flXO+IdF/s+/Vrd2ezuUFxbtk/cPb6qcg/SvocRVVehGTjv5nlUaTo1XFMt22jeIl2Je6Q+oRKBgysA6f7jg5FdBbeDft95BqKl7a5RWWQXCguxIIVjg4JGetcGLOeWVY4/Mkkc7VVSSST0ArW1K4m8KRHTLS4K3gYPdTxt0bHEYPoO/vXJTnTiryjdeZ0SjOXwvU0dY0a6sNtvpemNceUNqSyBSiHuwBPLnux+lc1P4X8QXkrS3FpPNK3VnYE/zqw5h8TSEF0sdTPOd22Kdv5I36GsG6hnsrh4ZxJFKhwUfIIrmrShL3ktDSmpL3b6m5ZeENbguIZBp8nyOrfeXsfrWzqXgjWbvWryS10+SSGSVnRgy8gnPr71zumeGtZ1ZAba1n8s/wDLV8xoB6ljx+tdXqukafHfPcaprscEsiIwtrNDM/3QOvA7eta0aceTWLRM5O61/A0dD+F3ie7kVY9HmfPo6c/+PV9jfs1fCbX/ABr4Z8QeGPGFqLXSri3jit7uXZJcIQSQFPIIXkjd0zxXx74f8U+HdDmBtdCuNZn3BVfU7lgpP/XNMfkTX1h8KPjTfeAdAu77V3sw5kt7SHSdOgSCKCV24QsMlnCnceTgADqa9KEVyNUnqfO5i60kkkj0D4w/Biw8CaNZ2+la1p+hqbcWTaxfMPtEUCKMxQA4AZyXZmyDyBXxz4h0fwpoBkjsrzS7mUL/AMfF9M9yc9OI412/mTXqPxn/AGhdK+Kupz6L4m0qWys7C4kS11GymLywsCVLMhwHU46dR618/eN/CV5oDLco0eo6VOSbfULXLRSDsD/db2PeqUuSGq5mPB0Z/wDLx2bKupajp7R+RN4gvJbYnBhsbQRR49ACR/Kuea48PwrlbO/uT3M06xj8lH9atJ4Wvp4hPcCPT7ZuRPeN5YYeoHU/gK1dDsNE0Ef2vdSSanaxgoimEKk0h7IG5bHrjArjSnUlqrLz6HuLkgtNSDR0sLiJbyTQ4IbLftj3NJNLOf7qLnnnqegqW8nv5FiOpyabotrHkQwNCskiAnoqYJz7nFZ2u+Pb7UJ2WwxplkvyxxQKFYL6Ej88DiuYLF2JYkk9WJyT+NROvTh7kdbddEioU5T1Z2UPjZNIGdPWS5lAx591hUH0jXA/Mmupi+IOpeD9HtJNR/4mGo6gTcG2kOxbeHGF6dCTz9K4nwjpEDi41jUlJ0vTsO6f895P4Yh9eCfaszWtWn13U57+5OZZmyR2UdlHsBx+FbwxVWhD2idm9rdjOVGFR8ttFv6nYD4xavNfyvewW15p0p+awkjBQL0wDjOfrmtcj4a62UvJJrzRpnX95awqSqn2+Uj9a8sXrWv4X0CfxLrVrp9shLzOAzKM7F/iY/QZ/T1pUsZUnLlmlO/cdShBJyi7W7HW/ETwro/hU6O2kT3E8d7A05a4IPy8bSOBjvXR/DD4YjxJYSa3rOpx6F4fhbDXMuN8uODsB/n+QNc78VLp9T8b/YbaNmjtEjsIQBkMwAyAfq2K6X4tzjS7bwx4Xti7tp9pvlRDnc7e3rwT+Neh7OEalSajaMbI4ZTnKnCnze9K7v2PY/CfxU+Hvwzu4T4N0a41bX1Ijg1O9JKxseNyg8k89gM1q/H74+eJNS8aapoya5Oml6fOiRQ20nlrvRRliRyTuyevHQV88/DXw/qep+LNHb+z7kWq3UcskzIyKEVsn5iMdq6Lx74Y1y58Za3d3ctlAk9zJOJri8jjDKzZU4Jz0I7VrBKX72UbtHn+xpxqW5r97mt/wua5n/daubh2Y5/tTT5jBeKfUkELL9GH41oeGvE+sR63JqS6uvi/RVglkM9yoE9s4UsNwILKTjHGQc15fcaFZRD/AEvxPpcTZwUg8yc+/wB1cH861PC8mkaBa61qdjrd9NNDaCJpYrURFTI4AKbm5PB46VpCcuf3rI1lRgo3ivwK83j7Q9bupX1XwdZFZGLeZp8z28oyfxBPvjmr9jpfw91eXEWp6xoDkjCXVutzEv4oQcZ9qojxN4R1u/thq2k3S/MRNf2zrG756FkQbSfUjBrpZLay0WP+0NJ8L6ZrWkgjF8Lia5VfQSJkFD65GKlWk3JtMub5FazRv6J8Dn1jnQ/Emga4M/LEl4IJT/wCQKc19Tx/stXnxE+FnhqDxEz6Pr+lQyW8ckarJmLd8gfB54APBr5l8K/FHUbYhbS10jThwAbXTogw7/eYE/rX2Fon7U6+DvhvolrrOnvq2uzW7TMS4jKxlj5Rfj+JeeO2KyxkMXGMHhop3Z58m3L95K1tj4Y+JXw5vPAPiW+0XUEUXFq+wug+VxgEMPYgg+1ebX9uFz2r7W8f+NLz44/CjxleX2mW9vNpE0dzaXEMeMpk7o93chcZx6jIr4y1Rly2OlayblFc695bnZhKjmrMwH4fFIH28U6UfMT3qBmPJrzZbnrIuJORUouDis8Sc1IHGOppqYuUttMWNRtJzUHmCjdmnzNisPJzSUgOacBmq3HcFBzTwMUi9aeBmmlYkVQc08DFAGKUDNWhXFAwaXGaUDNOVeKpK5Nx1LjNAGaeq8VqSAGDW74M8G6p4716DSdJgMtxJy7EfJEnd3PYCsQDcQK950TVbv4Yfs6Q6npqQ2Gsa7etELvA85oeRuX3GCPbOa0hFN6nFiasqcUobvRFWf8AZrtRcLbW/j/Q5L3fsaGVghB9MBic5zwRXVaZ8KJP+EK1n4Z3up2D+JIp01fTwM7HQjHGQDztYEc4zXh/w48KyeNvHmk6XHOsUtzcb2mkG4gLl2PucA/nXvnizwbH8SPijqniZ9dtdF8P+HJoLOe6mJDO6fM65yB1bbnPet42toeNiJVYSUJz1Wt/MTTdbtwLT4YePPCdt4fTVdnkz6TIqRs+flYgE4JYf/WFeBePfCUngbxhquhPIZvscxRJGGC6YyrY9wRXZfHbxxZ+Ivit/bGgaiLq2tY4BbzoDtV05OM443Gu41DSfD/7S8MOp2Go2/h/xtFCsd3Z3XEV0RwGU9+ARkdOAR3qZa7F0G8Oo1ZaRktfJnzuBTsVs+LfCWoeCfEF3ouqxrFfWxAdUbcpBAIIPcYNei/Dj4RaTN4TuPGfja8m0zw5HlbeGL5Zrxug2n0zwB356AUkepOvTpxU5PR7HK/BaPHxZ8J/9hCOul1z4gav8Ofjp4m1HSpuW1KVZ7d+Y7hN33W9vftXpfwv0H4Z2l7pPiO0sNV06+LNLYw6pchw+GEayYXsXYAE9SK4bxP8GPE/ifxVeaykllLFqE8t08zb4PKw2WzEw38dOM5xWnLJ9Dx3Wp1q0nNWXL19T0j4j6x4V0AxN8RdUk8VaoAssPhvTwIra13LwQuR2P3nOT6VyOm/Gn4eeGpHvfC/w+e215UK2s87B1RzxnAJP5c9s1s6/wDtIaCtsbS98N6f4ov0CpLObTyoiy8f8tNzn2zisDSPj94V0fVZdZsPhvY2OtohWCeCfEa5yCSu3H4gZqORo5KVGfL70G/nocrN4T+IXj/UJNau9D1nVJrg5Nw1s+COwUEcKM8AcV7T+zp8MfEPh3xpb+JNdtpvDmk6WGkmmvT5LPlSMDP8PPJ4446mvItQ/aE+IGtzb38QS2a5yI7JFiUfkM/maq3/AMRvFHiW1W11XXr7ULUNv8maUlc+uO9aSp1asXBWSeh6DjWsk0kj2eX4iLceKtW1GyYW8c13JNF5TYwpbgg/rXbfGj4tas8+i28WrXKhNNtZ2RJSuJimdx9+RXzPZ30iLkE/nXofx0vmTxpGBx/xLLL/ANEJUzw1OVanGSvZM5oxcXJJ2vY17Hx9cfEDyfD000drrM74gllTfZ3rf3LiLBAYgH51HXrWH8VNM0Lw9bL4TvivhbUbtU1C6udPQy2U8hyFVgTvCrzjHGSeK5jwmH0aK78XzbfK0pgtoj8eddMMIB67eXP0HrWNc/Ed/E1u1j4xWXWrcndFfrgXlqT/AHG/iXnlG49MVp7NQk1DYtQlzJx2X3nLeIvAeseH4ftUluLvTWG5NQsm82Bh6ll+79Gwa5jAPPXPpXpJ8O+KvA1ymoeGLm51HSrobor3T4zLFOv92SPBwwzgqwra1LQvDi21pceNrRfDeruylrXQgDLLGeryxfdiP0OT6VXKmdkcTyaP3vT/ACOU+HunXPibQvEvh62hM8s0MN3bg4CrJHKBkseANrvk1eitvDXgMj7Q0PivXVH+oRv9Atz/ALR6ykegIXjrXe6ZYXmoana2nh0afL4GmdraZNJJMwEiFA9yGxKcFgefl44rxG606bTrqe0lX97BI0bjphlOCPzFWRCXtJtPRfidHfeMdT1uSP7ddO8MRxFAnyxQj0RBwor0yXXLjwR8LNOsAxgvvEchvZzwGFqh2xr64ZgzY+lecfDbwmfGXiy1sJpPJ0+MNc30+cCG3QbpGP4DH1NO+IfjZvGni291NI2gsyRDaQcfuYEG2NB+Az9TUuSm1DotRSgnPkj0On8N/EefwvrltfgC5iQlLi2flZ4mG10P1BP44qj8WdEi8N65HdaZKX0PU4xe6ZOD/wAsz1T6oflP4VwMl6xyCT+Nd/4C1KPx5oEvgDUZVjnkka50S7kI/c3GPmhJ/uyAY9jTqu0vaIqUOS0lsSfDf4o28Hiuw/4Sy3i1S3Q7Ib6WHfc27EbV+fqycnIOeKzPih8Po5fE2t3vhaNLrT7edhPptspE9jjg7kPO0kEhhkc157ewT2F3LbXCNDcQSGORG4KMDgg/TBrq/iJqd1Z+L7XXtPuJbKbUbK3vVmiYo24oFfBH+0p496mTTWpXIlUU6b3Xy0MXwLEy6peXigk2FjcXPHUEJtB/NxXMkYHUYr3fwnGfHHhHXr7XLGDRJrlI7JtdjRYFkjZgzO6khWK7FyV5O7vXJ6p8P9H8KaZb6u0914u09zzPpZEVuhz913yzg/8AAR9alwdlY0p4i82mtTzvT7G51K4S3tLeW6nc4WKFC7N9AOa7GH4e/wBiKsvijVINAUjItB++u2+ka/d/4ERVa9+I+pJA1posUPhywPHk6aux2H+3L99j9TVXwf4N1Px5qkkNrtWKIebeX9y+2K2j7u7HoP1Pas7qL2ubOU3q9F+J2vhjV7CbUrfSvB/hv7dqNwdiXmq7Z5D6sI/9WgHJJOcCvUNT+Kz+Cbf+yNN1WbVfESAxXutmQ7IP70Nr2VexYAZxgcV5HqXjXS/B2mXmgeEczGfdFe+IZVAmu0PBSJf+Wcf45PfrXOeG4pNZ1qw06M4a6nSEEdssAT+RP5Vpyxqtc+q7HL7Lm9/8z6tf4k6ho3gGXRor65huI9DXVZJEmZWEr3CMMkH+7t/A15t8Qll8b2+neM/DEMi3d3MttqFraZVra87MMdFcAtnjBzWEvis+IPHPjMWpBtZNKureCNsfNHCgCY+gjBq34G+IMHwRtktdUja7vNZaKW8t0ODZQYIQn1Yht23sAO5qYUI0nzw0/rUwamtFqzE8aeP7fTjJ4b1SMeJYQijUNRjmMc7zAk7VkHDKmdo3AgnPtXCTeBrbxBE9x4V1E6o65Z9MnQR3aD2H3X/4Dz7VF8Q/DcnhPxNc2DTJdQOBcW1zGMLNC43I4/A9PauVEkkcytEzrLuyrRkhgfbHOaidRSdmrnpUKahFSpu35Fe5t5bS5khnieGZDho5FKsD7g1E3WvUtLi8QazYK3ibRYdQ0wqVXUNXkFpLGPVZj8zfQhqrw/D7wrqF7PFpviZ9VuEwUsEVYXm9Qkr4VsdOBz6Vm8PKWsToWJivi/A85stPuNUvYbO0ha4up22RxIMszHoMV3vjXwRr11rOnaZb6ZPjT9Pggd3OIkYrufLnC9WI60zTtefwn4hstP0zwzFpGrrOkf2jUszXCsTjI3AKo57LVL4s+MNQ8UeMNUSe7kaygnaCGBWIjCqcZx0J4PNVywp0nzX3Ic6lSrHkStZso/8ACJaPpLMdZ8RW4dfvWulL9pk+hbhB+ZqP/hJtE02Mx6V4dhdun2nVH+0OffYMIPyNYulaLe63dpaWFrJdzt/DGOg9SegHucVvy2Ph7wpMou5l8SahHnfa2rFLVG9DJ1fHcLx71nG9rxSS7m0kr2k7vstC3o8vifxXayN/aP8AZuiQnE1wzC2tY/bCAZPsATVlPEej+FP3Hh6D7fqORnWLyMHB/wCmMZzjP95smuV17xTfeJHjFy6RQRDENpboI4Yh/soOB9evrXXeE9Ph8C6TbeL9XiiluZDnSdLlODO3QzuOyL2z1NVGpd2j03ZnUhyrVfI7yHXZvhnYrrOq3H9o+PtRjElqt0S7abERxK2f+WhH3R2Fb3wr8Uy2XhXV55Jne51WW5iMjtkusdpK7HPU/M4J9xXzzqGv3mtajcX99cPdXc7l5ZZDksT3/wDrdhXpeh376fa+GdPycnSdRvpFzjmWNwv/AI6oraFRTbOWtRtFX3Zu+EPFN14n8LS6XZXUkHijRg97pM6N80sWP31uPUdWA6deK5DUNQHiKCXXvDbPpGv265v9OsyUEi/89ogO395exOa4bS/EN3oWo2mo2cxhurWQSxuOxH/1uK6XxuTDPp/jnw6zWVrfyszRw8fYrof6yP6Hkj1BxUe2UovsaujyT9TE/wCEm0zWMR6/pgZif+QjpwEU492XG1/yB96pal4HuRayXukXEeuacvLSWgzJEP8Abj+8P5VpXlnbePY7i/02JLXXUXzLjToxhbn+9JD79yn5Vx1nf3WlXi3FpcS2twh4kiYqw/KuKco/8vFdPqjviv8An27PsU8Yz/CR3ruLvxvr9r4G0EQarcwlbi4QPG+1tqhAoJHPG41mXniay1+Mf2zp/wDphODqNliOQj/bTG1iPXjPrXV+I/h0F+G+lXmlX39qhJXnWKOP52WTbngEnK7Rn61rRp1OWboy0sKpOHNGNRWdzjE+IniIMxl1OS7VuGS7RJlI9MMD/Sux8S/EdY/DmgWd5oOm3kktv9olSWPCKCSAVVcbSwGcivLkgeWdIVB8xnCKvfOela/je7F14iuQgAitglrGAcgLGoX+YNctLE1adKfvPXT+rmsqMJyV1pua6eIPCV+3+meFZbRj1bTb1lA9wrgitnQ38IQXIk03xBr3h6Zsj97Csqc8clCOPXIrzmNcsoGST0AGTXU6X4J1W5hW5uY00uyP/L1qDCJPwB5P4A0U6tSb1in6KwVaUY6uTR6/4b0TRtXPlXGueE9dRj969WTTrr2+cLjP1zXrvgn9lL/hJ720uNB1lLF0lVsSSx3PlgN95JIm5wem5RyK+arKDwppDoHvbzXZF+9Hax/Z4foHbLfkor6b+D/xLb4caJF4tm03T/DujLlLDT7eMG71R/eV8sIxnJYY9BXXNz9m3SspHiVoyUk09GemftJ/AcaF8INXGlxRyH7cuq3m9cMxwFcxgcLzz+Jr8+tQ0mW6uRb2sD3Fw5wsUSFmJ9ABzX6KwftbReO9GxLpy6ZczJceT83ng+UELZXAz8rk4znCkdTXzJ8Rfj5qfh3WJobnwpoa6gImez1SzTAdX+7Kh5ypB559jXNh41lTccSrMVGrOE3CnG58u6rp9xYSNFc281tIOCs0ZQj86xpAAOK9ng+PepXsq23iOws9YsX+SQrAFkAPcdiefaszWPhj4W+2ztH4wt7NGbcttOF8yIHkK2WzkZxz6VhPCe1V6Lv+B7lPEOnpVVjyFxim11PxA8FnwZqFrEl0L62uYRNFcKuAw7/0/OuWryatKdObhLdHpRkprmWwYzweh4rt/BviCy1TT18Ma8q/YJGJtrkcNA5yevuTXEU1+me9KjWdCXNEKkFUjys9H1HwtcmxudG1O4Ju7WdBY3TLkSIwIUE9ccY9jiuegsY/Dt7b2a4m1yV1jZ15W0DEdP7z4J57V1fhPxN/wmWivodzeix1lI/LtrwjmRO6k+v61j2EE0PiK207V7by9XsctBccATKoJVWJ6jphvzr2qkab5alHbv2OCHNHmjP/AIc0ze2fxHludEusQalavJ9iulHDKpxhvw/PrXl93btZ3U0En+sidkbHTIODj8q9I8JWcPhTw5qXiOWB7nVbd2ga3f5fIJIBJ+oOc+leazyNLI8jHLOxY/U815+N96EJT+L80dOHSUpKOy/MYaZjFPprda8dnchnSilYdKSkxoZRQeDiipGMoP3cUrDBpKTGhtNbrTqQjjNSUNpGHeloPIxQCGUUUVEtyhtFB4OKKkBlFKwwaSgAxmmAYzT6aetQNCUUUUFDaKKKACiiipAKKKKaAKcBimjrTz2pgJRRR60APooooJAdaeaavWnVYhKeKaBk06gLEy9APerMClmAHJPGKrDrVyyl8iaOQYJVg2D7V1Q1lYzlse5+CPh9f+FvD/iebUZLYLc6awjWOXLZwTyCBWz8OvgV4m+J/wAPPMsdMZntZt9hPM6osyNxIgJ7AjIJ96oweH7L40WsGpaVexadrMKiG5trtyFA7Hj8wfTg4r7r+At5ofgvwna6S9yv2fSrdEnupTti6Ek7+nqT9RX1jgoQTjrFLTzufG43F1KEbx1k2vkfB958NdT+HEcq3umzP4umJS106NPNe2ToZnC55PIUfjXB6j8NdascS6pHDpCSDfv1GdUY89SuSxP4V9m/Hf47aDfeKdY0S8ttT8NzxS7UubaTalymBskZo/nwV6YJ4r5Z8VeHdLvXnurW1v8AVoCd32uy1BblvXDKyBh+NZVKMZQX5XOvB4mrNc1VWbOCl0vw5pY3XOpz6pJ/zysYiifi78/kKuR+OrN3SL+zorSNI/Kiu5QLiaM9ixYcisy7g0Hzdpk1K1ccFJYkYg/mPyqpJYaQwOzVpEI/56WpH8if5V5bnODtCyPZSjLV3DxBc6w7I+oXUt1DIN0UgfMTjH8OOB9OKNVDY05yoHmWqYI74JX+lXdFjityLVNTtb+zmP7yzkSQE+6jacH3rtZPCljpUVldzXiRm2jaODz9vDFiVJyRuxk4961p4eVRNpilUjBrQwvD6zeGXgZbcTeILoqllA+D5Gejlf7x/hz0612mpT395qWi6Tp6SXNhpMyyXV4zYSa5ZwZXLHAJz8oHXisjRbcaZFfatbWn2vUFG22urm5WVpJj1IAO0bRzjntWHaQeJNT1ywk1SO9mhS4Rm3fdUbuuBwK61+6io9+xyOLqNyf4mvrkejR63qdzqOrNMz3UrfZLGMtJyxOCzYUfrVWy+KE/h4+ToljBaWJcM8U5MzTY/vE9D9AK5rWrO+l1e8kNlcoJJncZibOCxxV4eFm0BTea/F5UCgGK2VvnuG6gcdAO5NZ+0qtvkVu5r7Om4pSdzoptFsPGE8esxi5Mkqs/9jzS/vJmB/5ZOx5TJ+o6CuF1/ULu/vCt5H5DQ/u1twuxYQP4QvYVHqet3OqXwuZH8t0wIljO0RKOgUDoPpW/b+JbTxPCll4jO2YDbFq8a5lj9pB/GP1rGU1X9xaP8H8+hpCLp+81f9DkasWFlNqV3Da20ZluJnCIi9ST0rW1rwjf6LLFuQXVrOcQXVt+8jl9MEd/Y10mj6Hf+DdFm1SWxmGs3ga2sIfLJeFSPnlIHQ4OB9azpYWblZrRb6FTrxS0epj+LbiPT47bw/aSiW2sctO6dJLg8OfoMBR9DXN1fvNA1SwhM13p91BHnmSWJgB9SRVDn0xUVueU3KSsui7Fw5VHz6ir61oaLrF5oGpQ39jMYbiI5BHQ+oI7g96oKo4HpTx1xWUW4tNbjklJNS2PoHQvivo2sWD3U1r5d9bIJ5kMIKo2cF1OckDqcc4Nc5r/AIhubm5E8niC70lbkForgxLLDKOnEkYDDHuMivOvDGpjR9ZtriQbrfPlzr/ejYYcfkSfwrZjuX8H6lf6PeQLqGmeZh7d+Mj+F0b+FsY5r6R46demlP0v5+Z5P1WMJ3j/AEvI7D4dvrMnjXT7s6sutQwiSQqt4WPEbY+RiD1x2NcPr8mrPqMtzrMdyt7K26R7pCGJ/EV1GhaHDp8era5pl2LrTItOnCl+JIJHAQJIvr8xwRwa5mw8Y6zpkXlRX8ssGAPJuMSoR6bWyKxqSUacYzui4Lmm5RSe25lCbIzkYrqdHsrq58FXsVnbT3Nze38aBIELErGjMeAPVhT9Ke38Uy7H8MqzgfvLrTpDbhf9pt2UGPwr2m1utK07wdZWPhvxDp3hwnlprjZI0uMhj8xG75gfm5HpXXgsD7dyblpb5/joY4nEOmopLW54XH4G8SseNA1I/wDbq/8AhXS+GND8ceHL0XWm6VrFpL0Jjtnww9GGMMPYg11Xj/xN4u8A2On3C+MF1Fr0ny0SzjUbAAd2eeORXIH44+NpkC/29NGAc5ijRD+YFaVYYfCz5JOSa9DPnr143STT9T6B+H/wxg8XGO/8T6DP4VKAO728qRw3XPTymyYz69BzXocvwx8P/EXUr3WR4unnh84RMLWFRAgXCrHGx6gABcjPNfNHgvSPEPxUl/tbxTrV3H4ZtPmnvLqUqpA6og6Z7Zxxn1r11fiP4Vj8Y6V4WLfYNN0oIbe1YhbaSVgCpb/bQ4IDcZPrXbTTklNNrojwa8JqTSd2l06GR+0d8SBp8o+H+h239l6Hpe0TKjc3LlQfmI6jkHnknr0Ar5wvrjzSec19A/Fn4TT+L9S1fxJpmsrdXsm6ZtPlhKOwQBdq984XHI5r5ulmOSD1BwcjpXn4iEqDtJad+57GBdOUFyb9RkvLVBJzUhPeox8zc15Tdz10LSr0pAM04DFCBjgMGlxminL0q0SLjNOUHFAGKcvStUrEDl607GaFXmnAYqkhXHAYNKBk0VIqgc1aJADBp2M0U8KMVaJADBp2M0AZpwGKuxNw7GvoKa/8A+PPAPgzTdY8WLow0W2xcW0dsxld2wpAOMduwNeAAYOQacpwAK1jJo48RQ9vbW1tj6BsfjP8OPAviNZdC8E/aVskCwaqkgSeRsbWbDevPJ/Kuo+FGkN8U9B8YWGreH7yy8Pa5qD6jBfiQIUfIIXB5OMAggEHkGvlnAxzwPbivojwz8aviX4g8LWdn4U8MRzpp8aWkt5b2xmyVUYG3gKcAEjnrWieh42LwvJFOju+rOC1H4D+I7nX7uz8N2lx4h06LJTUBAbeNvVSZMDI9iRXpHwx/ZQ1KHxBFeeLxCthEnmLbWlx+8eXIwrMAMAcng8103gAfFbxV4lgvvGt1LoPhuycPPBMi2ouW/hTjBI3bcknHavcfF97b6J4T1W+u71tNt47aTN5H9+PIIBUd2yRgdzUOSR5+Jx2ISVGLV32PB9c+FI+JPxeXWPEl3o9ppMEawnT7XUBLcTCPOFYAAgnq3sOtYPjSXQfijrs89/rK2Hhnw7CVTTdMjJjhRTgF3OEDucKAoPGBnrXF6b4K8KPqVtd6X8Rvs2peaJY5LvTJkZXzkElS2Wyfxr0L4g/DM6vpV1BpPiHw/aiGdJdcUytbq96VAX+HCLySAcAMzc1pHljqza3LKKc+lu1jjbH4pT+IdZ1JNE0a10Q/wBlTLDNGS86LFGWQBm4UfL0Uck561h2mqT/ABNsrbbeyweOLFFjtp/PKHUYh/Dn+GVR05+Ycda674Y/BbWbTx1YSJqei3trskjuXsNTjlZUeNlPyjknB6YrnNc/Z78deGdZaKw0ufVBBIDBeacQd2OQwGdy4PcjrWvtE+p2J0OZxi9dDC/4T9NXBt/Fmiwa0V+Q3kY+z3qEccyKMMRj+IH60r+C9K1qVD4Y1qO4dzxp+pkW9wp9Ax+RvwIPtXe3nwZ8RfEq1fVrfRp9G8QwYi1K0vojBHcuB/roiRjLY5X15715LPoV/p87w3lhc28iZ3JLCy49eo6UKUX1N4VIS+CVmt0XtS8Map4duxb6nYT2MueBMhAb6Hofwq9YWhcjArT8LePdV0i1Fi8keq6UfvadqK+dCfoDyp91Ir0DRNM8HeK3X7NLN4VvW/5ZXBNxaMcdA4+defUGtPaez3InVl1OPstKeQAYbB4OK9I+LnhG81T4sXelWMTzTP8AZraFCfSBAMn0GM11ej/BLX2uLeKPT2u0lYeXcWuJYpB6hl4x+Vep+Ofh5q1rr/ibVIbPZqt8fslrcSfJFBbhAsk5c/dyBtBPqcV5tfH0o1VyyT0fX0OX95NOSi7HyX8Tbi3jaz0DTHEmk6SpTzR/y3uG/wBbL7gsMD2ArmrT4dXtxaQajqksWg6PKeLy+yC4/wBiMfM5+gx7ivWdftvD/gDd9jEfiTXY87bqRf8AQrdunyoeZSPU4X2rx/xPql/r+oS3up3ct5ctwXlbOB6DsB7DivSpXqRVtjanOTXLE7bwr8bbL4YWt3pHhnRWvbCVg0t5fzsksz4wWCrwgx0AyR3Oa5XV/BsHiVLnXPCz3GoW23zr2xnbfd2hPUnvImcneOmOa5XysnGOK2vD1zd6VqEN7YXElpdRHcksTbSv/wBb271aptao09nGl70dynoxvdKvYb2wnltrqJgySwsVIP1Fes/EK90fUfEDNrmgpLbX9tDeW2paXiG4RXQE7h92TDbhyAeOtauleG9O+KI8y2t4dK8VNybeMBbe/buU7RydOOh7YrsI/hBfeMtD8L2Rhe3vLW6l0y68xcGGLPmhmB6YUv8AlXHVxNOk0pu3cwcnOV0tTmj8Ibnwr8ItUl8O3Q1bUfEgh8tGQQz/AGMZYoqluWY43AdRnrXznqWn3GnXEkFzBJbzRnDxyoVYH3Br2f4tStrHi25uYGZLO022lkVYgrDGNiEH1IBOfeq+jrr3imyjXxDpMOs6DANo1HVJvsrQD/YuDyeP4fmzV0oyUeeXUKVSVO73ueISKc9Kl0ez1G+1KFNJguLi/Rg8S2qF3VgRg8dOe9evxeAPArXd9JomqP4tvoWBt9GmmFqJfXEhA83B7LgmuJ8U+NvEtm8ujvbf8ItbgkPp1jAbbI/2j95/xJrbc7I1nUXLBffoeh/ED4U2GsaHF481LVk8PvLHF/a1mkQnYXH3WK7DgMzDJU9CTXK6z4x0rRPCPh660DSo7uaA3Fil/rEKyyxBHDghB8gP7wnuRWH8LvFlr4f1m4sNZ3TeG9ZjNnqMZOdqt92Uf7SHnP1q94o8C3fhLw14k0m6ZZX0nUba4hkT7s0EyOolU/3ThPxrNOzscyjKEuSq7q+nb0+RV8Z67qWqfDvQm1S+nvLrUL24u8yv0jQCNMDHAzv6ccVyGgeJdT8LXZuNMvHtpGG11HKSD0ZTww9jXRfEpBZXWh6UD/yDtJt43AwcO4Mrfq9W/BXw5t7rTf8AhJvFdy+j+FYn2hsYnvnxny4B3zxlugFRJ2Z2x9nGl7y32R0ngn4ZaX8Z7K41JIn8JSW7KlxNGgazuGOc+WGI2MOSQCR/KsX4p3tz4d0628NaRpk2k+FtxIuvMWQ6q4P+teRflbGOFB4HvXP+OvH134ulgtYkOmaDYqI7DS4WPlwIOMn+857seSag8H+JNZsWk06xtf7Zs7g/vdLmgM8UnvtHKn/aXBoTUnZohUqmk5u66J9Dm1PcV1Xw7uk03WrrVJTj+zbGe5j4z+827E+nzOPyr0TT/wBn+PxlYT39k0/hWeNNz6Xf4nIOM5UqdwU9gwznineFPCPhfQdH1qa9S9vrS3nW31CTUYzbJhB5hCIPnJ3bAA2MkirjTdwq4unKDS37HP8AwY0aSDWItbvMJFJHPb2ULxl/tkpjIYYH8AHU+px1rltY8I6/PcvqOvSw6Y90xleXUbhVck9TsBL/AIYrrfDfxX1bXPHmjafZrFpegtcC3i063iVQkJz8hbGT1J69a8lu5GkuZGdmdix+ZiSevqetTOSUVbU0pKbqNy00/A9m0fTvC/i7wzFoU17N4n8QaLFJPZx2m62+1Qnk26u4y23lugPJArzt/iFcaajR6FpljoA+75sMfmXBHoZHyfyArB0vVLrQ9TtdQsZWgu7aRZYpFONrD+n+Ndn8TNItdas7PxrpMax6fqrbL23jH/HpeAfOvsG5YfWsnUbV46FRpKlUSnqn+Bwmo6peavMZr67nvJj/AB3Ehc/rVNwS1PIwK6HQvA17rFqb+5eLSdHT7+oXjbUPsg6yH2UVzcrm9D0uaFNWZu/DbxRf6n4j0fS9Qii1m1icyR/ak3ywbAWyj/eHT7uSPauhvfhl4UksW1C/1S+0/WLiXzRol1cQrcHJyUyemTkhmx9KzvDGuaVosGvDQLVgLLTZZX1i5UC4eQkIuwdI1ywwOpxzXldw7zSNJK7SSMfmZ23En1JNdzqqnTUZrmf5HBGlKpNyg+Vfmdb4v1rWNISTRYtLfwxprD/j1QEPOOzSSdZPzx7VxLLjoK6jSvHWo6dZfYLgRatph/5ctQXzUX/cP3kP+6a7HwH8K9D+Jtw91p1ze6Xa2zL9striMSgZ52pKCB0B68jiuRw+sv3H950uqsLG8193U5nwV4YsILE+J/Em5NDt3229spxJqEw/5ZJ/sjjcfwrC8VeK73xhrEuo35USt8iRRjakUY6Io7AVtfFS/vbnxH9mn07+yLCyU29hZquEWEE4YH+It1Le9cWetZVW4rkRrRXtP3st3t5D2b5T/SvSjdRv8Q57eAnybPSZbRMjH3LRgf1zXB+G7BtT8Q6ZaKMma5jT8CwzW/4cuTeePNWmYgl4tQbIOR/qpKui+VJ93+QqqvfyRx4f5Rn0rq/AOoQXv23w1qFyINO1cBUkfpDdLzE/tk/KfZq44MQopnfPQ+orijPknfp1OmVNThYu3kF/4Y1p4pQ9jqVlLjA4ZGB7VuT2dr46hNxp8SWviIEtPYpwl2OpeLPAb1Xv1FauvQt8QvCVvrtuhl1zTQlpqUSDLzR9IpsDk/3T9K5PQ/Des6tKs2mWVw/lkN9oX5EjI6EucAY+tdHLKMlFK8JfkYxkpRu9GvzMd0KFlZSrDggjkH3robm7nsfB/h+e2meCVLu6KSRMVKn916V1s/h/TPFV0jahqMUviFIWa4tNIKsbvb0IY/KJMdQCc9etUNS8TJonhTS30XTo7D/SrlFe7UTzxlfLyQzDCk55wOMVrDDOgpzcrK3TcTrc7jG2ty74PW88SX1veeINEDRW3786xj7OwCDPz9BIOnPXnrWRD4M0u7ku71NRk8QKJHY2mlKFlIznJ3c4/wB0GqVtqt7P4c1/Vb27luZ7jy7BJJmLH5jufGenyqBx61yKSyQSrJE7RSJgqyMQQfqKVXEU1GMZR5ut3oyqdOXM3F2OjfxidMYxaNp0OjbeDIV824z7u/Q/QCsi41K61CczXdzLdTH+OVy5/M1qx+KrbVQI/ENmb8gbVvrdglyo9z0f/gXPvXWeFvhZpesWU2uDV3v9FtyzNbQwFbhwoyUIJ4Y8DjNYRp1cS7UpXXbayNHKFFXkrP8AMh8EeGbU2qa/4jmax8ORMduP9beuP+WUY757seBk0vib4h3/AIu1dr29kwqqIreBOI4Ih91FA6ADH1Ncx4r8WTeKNQV2hWysrdfJtbGPhIEH8IHr3J7mscXRXvSlXjSfLHp+LEqXtH7Ser/I9Rg8ZXWh6F4f1OzkAnstRnYDPcrEcH2IyPzqfxVe2mqoNIl8tdPvwb3QbxwB9mZjl4GP93flcdjg9688mvCfCMQzg/bn/wDRa1seDbUeM9OOjSyvHLZSi8gkUZITIEqD3Pyke4NaRm5y5LbmDpcnv3IB4fuPAbtqmu2vk3EY/wBBtXYN5sv984J+VOD9cU/4XeF7PxhrN7f6lILt4MzGxH3p3JzknpjJ6Z5+ldD4ovIPGVzHa6vIj6nbNJJa6bZyjc6YH7uR+gc7c8fSuW0nxhqNva6vdW4TS4bGHZBbQJtCyM+0Fj1ZgA3X0q+SlTqJvWP6milUqQdtJfod/wCM9D8PaloNrbXkkun2sUjJb3QXi1c/8snB6DPGDx054GfIPFHw91TwtGbiRVu9OOCl7bnKMD0J9P8APNe0G8g8aeHIY7h4oJNdsCERuMzJ1x+n4CvP/AU+uaH4pHhfULd7myk3Rz2cg3Iq4PzqT0X6cfjXTjqNHEzjePxbNd/Myw0504vXbozzKkYZFbvjbRbbw94mvLG0uFuLeNsoVOdmedhPqKw6+QqU3Sm4S3R70JKcVJdRkcjQyq6MUkUhlZTgg+oNemaZ4ntfHmktp2pzRWeuLE0UF9JwHB6gnscAZ/OvMWGGpCM1pQxEqDtvHqiKlJVEr7ntOm2kGmeG9St9c1awnWSHymmhl3MygYG4Y5I7H0rxQgKxAOQD19fenBFz0pp6mqxOJVdRSjawUqXsrtu9xlIwyKU8HFFefY6Bh6GmCn00jBqCxG6U2nHpTRSARulNpx6U0UhoR+uaSlbpSVLKGUUHg4opAMopWGDSVEtxoRulJSt0pKkYjdKbTm6U2gAprcc06kYZWoGhtFFFBQj9c0lK3SkoAKKKKlgFFFFNAKvWlpF60tMAoUZainLxzQJi0UUVSJFUd6dQPu0UwFXrS0idKWgCZTlAKtWyPI8ccal3chVA6kngCqKvt7V3XgjTotJtpfEepLiC2GbaNhjzHxwR/L/9VdtCm6k0lt37GFWXJF9z0Se50T4deHtPR9EtNXvxtS4M4wwZgTyefQ4HpiszxZ8YtV8WW0FhHjSdGgQImm2rERH3bGN3PqOK4aXXLjXNL1u5uHzI9xDOV7AcrgfoPwrFW6K9j+Jr1quMasqekeh58cNFvmmrs9hm19/iX4QS0ncy+I9EiP2eQn57q1H/ACzJ6lk7Z7V5a1/LBKJYpXicdGRip/MYqz4bl1SHVIL3S0YzW77/ADCcRrjqGY8AY4rZ8W2OkWrjV1WS6iu3OYLVwII5h99C/XGckAClNyrQ5+2/mVGMaMnFbPYxbHW9T1CTyDCur5GNk8fmED/e6j65qzeadoNs0X22RrS4z+8trSXzlUe7Y+X8zWZeeILm5tzawJHY2h/5Y2427v8Aebq340mnaXFFarqd8dloCRDD/FcMOwH931Nc8Zcza+LzeyNnG3l+Z1Fra3NlC15aW1vJb7d1ta2HDTf7Tk/OVH61x876hrOq+VN5kl5NJtEb5XDH/Z7VFfanc6hdm6llbzuilDgIOwXHQV2vhfxHNpOh3Gr6mPtkayLBaCUDzGbq2G64AxVKca0uS7SX4kSi6cb2TbMXxfdwW72mjWeDbacpR3H/AC0mOC7f0/Cqfhi5kTX9O2u4zOgOD1G6kabSL+WR5kuNPkck5iIljyT6HB/U10Xh/wAILaX1peSXCXY8xJIIYflZlzgswbBAHtzTip1avOnpcpuMIWa1IbW7udJR9Q1C7uRAZH+zWSzspnO48nnhB+tZ2o+NdZ1SfzZr5xgYCJhVA+lUddurq71e4kvN4mLEYcEYUE4AHYYqmi7iBgnJwAO9TUrST5Yt/wCYRpxtzS1f5GoniLUCFLTpLt6ebEj/AMxV+DxReOSj2lhPu42tZR/pgUWXhfy4Y7nVpv7LtW5UOu6aQf7CdfxOBWja6zb6VGy6PZm3lPS/nO+cD/Z/hX8OfetaaqbzdiJuOyR6v8KvD+r+Q15qFlbadbsMR28cZVnP98rnC+nTNdrrtvc3Oj3NtpF7bw6s67Yi0gyrZGeOecD0rw3R/H3iTTdGk02C/YW8m7946BpU3HLbX6jP+cV1fgf4KXF7paeJddv5tE0/eptnRT9onckbSo68npxk19PRxa9mqVOO+7Pn6tLkk6tWSXYoaRefEOw12KLUrK+1Ky83yp45IA6MmcEhsenIri/iholroPjbULW1URwHbIqLwF3KCQPbOa+ndbjv9Csoo1msoiQG87XLrbK575VRxXlvjzWbvw3qtpHeeGtE1e7v0MiPBG0jOBx1K5PFTiMNB0Lczeu71t5F4fFOVW6j0+88JzUka55NeweKfBln4h8HN4hk04eFdRtl2yW0i7IpsHjAxnJ7Hrn868kRd2MV8/XwroSSez1Xoe1TrqrG60sPSPIGK6zVIxq3hvSb/aWuIN1jcP3O35oif+Akj/gNQ+GvBep+Io2ktYAlrH/rLudhHCn1c8flk16l8PtF0Fbmfw4JV8QXOoruXKlLUXEYZo1B4ZsnKk8Dn3rpoUW077M5MRXjTtJatGR8KvCmrt4V8TavZwRASRJbRS3DqIwRIrSFt3AUL1zQ3h/wxfXdzPpcNvquuxrvbS4pWS0kf+IxZGXx/cyPau0vdS1ab4K3xnCWq3mqixjtoIBFGkSR7nVQB3JGc88da8w0XwPrWv3yxaNYXV5cqdwNuh+Q+pbov1zXqW5YRhFXPNhN1JSnJ2OY1rW9U1GR4bmVoY1JUWcS+XHGQfuhBgfnk+9ek6L4AsNc1qWbVZQuieG7OGGeFQS8j7N7Agchck5x1xiu9t/gZJrMtlceKri1t9ciKyOli26SdV/56g8Z9161wP2Dxv4R+JmsRaJENSuLiQvMI13wsjHK7/7hHuQa3pYeVBqpWi3Fv+vxHLEwrJwpOzSOK+I3jKTxvryXEVq1rYW0fkWsAXG1B3PufTtgVzOWBAIIJ9RX0xp958Rp2D6hpeg6PaAnfPcEnaPXAavNPjv4m0zXtW0yDT7qK8ks4nSeW3XEZckdPXp74qcZhVyyxMpa9mjbD15XVG115HoM/j7wBq9pocV5rd1b22npG39nwQstuzgDll2/NgjPpTZfEvwwcSvbazdWU8jtLLcw2+6eRmOSd7oSPwxXzojYGRTxIcdqy/tSbivcQnl0L6SaPojw78UPAXhy6huF1XXNRnhz5Ut7FvdAeq7hglT/AHTkV4Vreorqus396AEW4neUKBgAFiQKzQxNLuNctfGVMTFRkkkjoo4WFCTlFt3Hs2TSjpTQM0+uI6xQMGnr0pAM04DFWiBV607GaQDFOXpVpXJY8DBp69KQDNOVeK1JuKBzTwMUg609RuNNCFQc5p9AGBSqMmtUQPX1p1IBgU4DNWiWOxmlAxQBinAZq0hbABg09elIBmnqvFWkZtq4Ac89K+gfh7488F3fw20nwtqmuat4SureWSSW504eWszsx2s7qCSACBjjpXgK9asxpnHANWrM48RRjiIpc1vQ9b+MHgPxV4MS3a58Q3viPwxfYe2vWuXeJz1VWGSAe4PI9KX4V+K5ZtYXQvEV/c3fhzVYTYTRXEzSJBux5cqhjgFGAPGOK3PBF5fa5+zf400+eUzwaXd2ssIds+WhcFguenT9TWD8MfCMniTxJZwRkRwxMLi4nkHyxRIcuze2B078DvVLllCXN0PNjZwanujc0XwXN8M7fUNa1O2/4mcM72OlQTJjdKpIa42n+FRgg9yR6VzXh/Ub/wANaw2oAG7SYlbu3n+ZLuNvvJJnrnrnscHtX1L4w8NTfHHRtM1/R7OSaeyklsriziQsyIW3RyY64Yfka8s8U/DO50JnhureS3mXqkibSPrVYWtTrJxm/e6o5nVaXNNb9TzbW/Dsfg7xBoviXQZZDodxcJNazK2HgZWBeBz/AHlyfqOawfiWt9pfxE8RKLu5jk+2SnzBIysVY7h0PTBGK7fT7u206K80PV2kXQdQZfOKDLW8g+5MoPde47jI9Kyvjvow0zx0XWWO5S5sracTwjCSExKpZfYkZ/GtrOM+Vm9KSdRLfQ5TRPiR4r8Ouj2PiDUIwgwsb3DSJjOcbWJH8q7zXvHHibVNGHirQtb1C1spHWHU7JLh3W1uCOqhicRv1HYHil+CfwPsPiRpGqavrWsNo+m20yWkToFy0zdNxbgDLKMdyeves7U/Cniv4D+KbtLywe70zBhnfy2NnewNwFZsYGc9+Qaw9pTc3DqTKdB1XGHxITT/AIueJpZUNzd2t7t4C3en28gH0BTivSvDfxdv7gQxXWi+HrqNSNytpUSbz6krg15Vr/hi2srO113RZDc+H7whBlsy2k2MmCX3HOD0IqXRdSELA5FdKw9GqtUOouZXhoffv7OvjzTb+e4tJNPstLmljEiiyVkjfA5G0kgYHcYrrPi1r3hbxBax6RNcxXM8mHjUXRijY9lLrkAntkY+lfK3gfxQ3hD4bajrruEutTk/syyGeiDmZx+GFrktX8cSXUWxnDDAH6V8pHJo4jFzrU5NRjoi1mNanhlh+VO+7N74hyeCdHvbixv/AAhrFldp1xqYDDnqMoQR79K801O4+FjK6rp3ipXOcN9ptyAfpt5rWu/iNFrGnx6R4lje+09PlhvYxm7sx/sMfvL/ALDHHpiuS1n4b6pJqFgmkFNcsNTmENlfWg/duxP3XHWNh3B9M17sKLox5akmn66HOnG+rsi7pfh74ca1OsFjL4zu71l3eRBYwyt+QPIrU0zwl8PbeQxXPifXLS6jOJLafRsPGe4b5+tdZ4q+IMH7OlrF4P8AB0VpN4gSNX1fWZYw7Gbg+Wo6HA4wegI71J42RfjP8P7Hx/pWl+X4ht7n7BqlnYxl/M6bZMD5jxjr2Jz0rCnUkmpNtQez0/VGftJPV3S6HX/CX4YeHNf1G2i0zxVJezlt3k/2ZKrJz1Y5wPrmvtpdI0+DSzH5Ufl+XsYuOq4wcnvxXy78JPEeoXXwg1W0TTB4DvdMjG7UpLfyorjAzliw3bj3POM8elai+Oj4Y+A8usT3k+uNrH7ncsh8u1Zsjk5yMEH6nFfLZhCtjKq996Oy+fpY9jBYmlhlK8btrfseQfE/xFpPhzUr+38O6NZQ7ZXQX12oupCM/wAAYbVHpwT7187eMdZ1DWps399cXZXJUTSFlX6DoB9BXaeJvEIvGYk5zXm2rz+a7NX39CgqNNLfTfuefRUpPml/wxz9wCDnoRW3pvxB1WyUx3wh160I2G21ZPPUL/ssfmX/AICR+NYs/LEV13wr+E+pfFLWmt4HFlpVt+8vtSlGI4E69TwWx0H4nioqSUdWejUdOMOaZJpngrQviTepaeFpLjSdZlQt/ZV8jSws3/TOZRwP98fjXuHhT4P+KNa8C3egeKrQWt7DbLb2l35ol823MiuI3YfxRsvHsxHauF1X48ab8OYbrw/8NtIs7S3jHkvrtyge4umX70g9j2z+AFesfspXnibWvCmr6jr891fWl1db7S6u5jIz7RiQKD0Ge/Q8+lcM6krc2x4GNqVoU+d6Lpfc8t1j4VXVh4w1fxN4j0yXU7mW6k/srw/CnmfagvCPMynCQjC9TzjtXDeK7C88Rag99408V6dprR8RaZZH7S1uuMBI4oyUjGAO4969k/aL+KmgQeKrfwvqGnXGqWNvGGvZrK/eCSMvj5VCnaxAAJDd+O1eeJ8Kfh94i0qbUdA8QayYFG54japcSW3/AF0iUh8f7QBFaQ95c0kdGGq1FBVa6avtoefnXfCehhf7K0CXVrhf+XrW5cox9RDGQPwLGs/UPiDrt6zeTdjTIic+Tpka2qenITBPHqTXTf8ACmJdWJ/4RzxPoWvjn90tz9mn+hjlxg+2a5vxB8N/FPhcBtT0G/toyMiTyS6H/gS5H61blfQ9enOg3dvXzMTTodR1XUEs7Np57u9cRrHG7bpWPQHnn8a9b8f+Jbfwtp+j+DNWU+IdPFmlxezrOfOExJ2tHJ6KOgYEYx9a5ux0lvBFjaJt/wCKu1pBFbxZ5sIZPlEh7iRw2AOoHNc38QnB8ZanArK0VpJ9jjKnjZGAg/8AQapNxTJajWqJPRI6HQ/A0c2v6Zqvhq//ALa06G7ieWEJtvLddwyXjHLAf3lyPpXn+p25ttRu4iQTHM6EjocMRxVjRtRn0rVrS7tpXhnilVleNyp68jI9en413XiPVNJ8T+L73TdT0WSG7W6kijv9GjHnPhiB5kXRzjuNpqOVSjojbmlSl72qseYkYFejfBPT5fEmuXvhyeGWfRtTt3S5K/dt3A3RzZPAYEYHQnOK6Dxn8DbL4Z6VDqurXl5rUL4CwWFv5ahuv7yQk7FPTI5zmuE1zxre6taR6faxRaNpMTB0srAFFLDozt9529yaShyP3hyqfWYNU/v7HReLfDui/B7WpdOeBvEWuKqypLexhLWFWHyny8kyP9cAVwGr6zqGvzibULqS6dfuhj8qc9FHRR7AV6bbwf8AC3PCH2eQlvFugWxeJ+rahaDllPq8Y6eo9683WxOOlOUebSOwYd9J/Et/M1NEhFt8PvE13ghp5rWyU4HTc0jD3+4K4904r0HULQWfwz02FQN97qU878cgRoiL/wChGuf8P+ENQ8WazBpemw+bczEnLHCoo5Z2PZQOSayqQfQ3pVEuZyKfg/whd+MtYWyt3SCFEMtzdSnEcEQ+87H/ADmtLxt42S/eHSdAEmmeHbDKW0MTkNOe80hB+Zm6+wNa/jHxDZ+HtKn8IeGZmk08P/xMNS4D38g4wCOkSkHA79a86kU5zWM3yLlW5pTj7V809uhraP4x1HRkFvvjv7HvZXyCaEj2B+79VIrQNn4b8Vy7bGT/AIRrUG5FvdyGS1c+iydU9t2R71yjDvVrS9D1DX7gQadZzXsvdYkLYHqfQfWpjUm/dav5Gsqaj7y08zsfCfgrWvDuuXOo32nTRQabaT3QuAu+JmEbBCrDIOSQePSuf+Hv/Ifkycn7Dd9/+mD16l4I1e8+HXgnVrfWtRs0tvOSNLdALuSNnB3IwVgOVHAzxWR4K1PwXc+Ib06Zpc+n37wTm3a9kMlsqiNt2VHQY7HPevSWHgvZpSt1s99Tg9tP3243XdbHluj+HdS14hdPsZrsD7zRr8q/Vug/E1rv4R03RVLa5rlusq8fYtNIuJifQt9xfzNW/G83ihYIRqU4bS2GYW08gWbA/wB3y/l/A81xpUDgDAHavMn7OlLSN35nowlOqt7em56D4T+KNh4F1Hdo2hCO2k2pcS3M7STyIDnjGFXucAVj/EeLVdP16e1utQuLyxnxdWjeYfLkhflSB074PuDXLiPFeheG4v8AhYXhZvDsp/4nWlo9xpMhPM0fWSA/hll/KnGvOtD2Te23+RnKnGi/aJep5zGXgkWSJ2jkQhlZCQQfUEV6Pd2snxA8E6UWZf7eWa48mJEC/bAoTfn/AKaYwffHrXCfZTuIIKnP3SMEc967Owt7qHQvBsljj7aNUn8ncuRv3Rbcj8aWHXLzRls1qXiLaOO5ieLNMuPD/h7QtIuoJLa5YS308UilSGc7VBHsq/rXHSLgcV7Z4/1C2+J3iW70xnjsdUsXeCwk3YhusH5kYn7rFgcHoelcD4Z8CXWv390Lpv7M02wy1/ezrhbcA8j3Y4wB6+1TiqHNVtTfu7fJDoVkqfv6Mp+DvCS6689/qDtZ6DZDfd3f8o0z1c9KPEfjm61S6iTTQ2jaVa/LaWdq5UIP7zY6se5p3jDxLFqccGl6VE1noFmT5EP8Uzd5ZPVz+nQVzcFtNe3CQwRPPM/CxxqWY/gK55VPZr2VL523ZtGKk+ep8vI6CHxjHfxCHW9Pi1Ff+fqPEVyv/AwMN/wIGprTwRNrz/8AFPXUWqoRuaFmEU0Y/wBpT27ZUkVWPhqy0aMvrt8YJ8fLYWeJJ/8AgRztT8cmprH4iXmgSKdCtLbSogMMNgleX3d25P4YFVFwTX1n/glNS3pf8A1/+Eat9D8NpFrolkuxfYSxsZFaTeYwAjnkITgHuaTWPGK+E7qx0yxtLa1+zuHv0tuQ5P8AyyLHlsA8knrV6z8XXcPhBNa1u0a+me+ItLpVVGUlCC+cYJHIGR2rjbvwzFqga40XUP7Sc/M9pONl0O5O3o//AAE11VWqUUqG+nrYwpxcn+8KPiXTv7D12RLV3+ztie1lBOTG3zKQfUZ6+1dpqUFhrvw2+028ZOsz7bidIQVMpjYozle4AOSR35rmnR9b8LSQyIRqGi5OGGHaBjyMHn5Sc/Q0zXdSn0e/0iO0nAfTrWPDL03ON7A+v3gD9K4oS9i5Skvda+5s3a5nFJ6q5r+K7hl+G/gmWGRkeMzjehwVYMOh7fWul8P+JrzxT4bjv7P994o0fAdMf8fUJ6gjvkfkR71jeNLqC9+Fvh+eG2FiHvJWEGeDnO4r/s57VwOia7eeG9Uhv7KQJNH2IyrDuCO4repiHQxCTb5Wl+RnGj7Wld7o67xvoWnaxo58VaOptEaQR3tlICDHIfT+o/H2rz+vobxVHb+IdCstK1HVIrCbVFSWJRAQC+A2M5x1/GvCdc0G/wDD19Ja39tJA6MVDMpCv7qe9YZnhuSaqQ1TWr8zTB1lKHLLf9DNk5qOpSMiosYzXz7Wp6j0CkbrS0MOM1JVxjdKbTj0popANIwaa3rT255pj/dNQWIKYetPprdalgJTW606mt1pAIRmm08daYepqWUhH65ptObpTaQxG6U2nN0ptA0Bpg70+mkYNZDAUw9afTW60AJRRRUDQyiiigoCMim08d6YaACiiipYBRRRVWAcOhoo6DFFABTl6U004UCYtFFFUiR9FFFMB1FFT2VpJf3cNtCN0srBFHuapK7SQm0ldm74K0G31e7uLi+Yixs4xLLj+Lnpn8KTxN4ml8TXiRwRmKyi4ggQdvUgd/p2rpv9C8PaVc6FYrHdam8fmTbxlXYYJX64zx6Vy1jqep6pcLb2siWatkt5KCNUUdSSOcCvXnH2VKNNPV72OJPnk5NadDT0Dwtqd9pepARm3DomPOBUths5H4VSQ6VpYYyhtTuh/wAsxmOFT75wx/SodU1xxttbG4lFvEcmbed8z93J9OwFIPEIvECapbreY6XCnZMv/AujfjUOdJWjHddyrTb5mJf6/eakgieQJbr923iGyMf8BH/160vC2pwbbjSNQkKafe4Ac8iGUfdcfjwfaqg8OtdxmfS501CMcmJflmQe6Hr9RTtF0L7W0lxeu1pp9uwM0rDBJ/uKO7H0pU1VdRN/8AJOHK7lyPws+k3Nw+sq8NpbNtwn/Lw3UKh9COcjoKztUv5NVuRK6LGijZFDHwka9gK7zWtTPxE8NSG2tmgutKbzWgDbt8JG0t9QQMj8a4hLUt/DxXRVpqPu0vhZjTk2ve3RTt7KW8njggjMs0jBEQfxE8AVs+Lphbz2+kRyCSDTU8osOjyHmRv++jiuj8K6V/YOhX/imYbXiJtdPRv452HL/wDAQc1kwWEPh21j1PUVFxfzDfa2j9PaWQenoO9NUeSmk+v4Euqpy9DMsrCHR4I7/Uod7MA1raNx5n+0w/uj070/QLu51XxhY3M2Z5jNuPHQAHoB0HHTtSRaRf8AiBpL+6nWCAn57u6ban0XufovStfwpqdhomv2sWnRtdyyt5b3c/y/KRyEUdOnU06UbTir8sb/AHlTej6sjtLvVtu7VWt49Pdjgaom78FH3/yq1a6v4ctZ5RYJLp85+5fSxeaq8fwqTlR78muS1TUptW1Ce7nOZZWLEZyFHoPQVHGOnPah4hxk0vxGqTa1OpPh6+1q8eW2vItakPV0l/eN/wABfBP4U6PSrizufJureS2kHVJkKn8jWJYI0kqrGrM+eAgJP6V634Kl8ZOkUf8AZsmq6evHk6tCGh/BnwV/AiumjFVJapnLWlKktGjpfgF8GZfij4vit5EKaRZj7RqE/QLGP4c+rcj8692udQjn07xB8Rr23KaFo5On6BYkYR3+6ZR7scAeig16R+yJd6Vpw1WwGkaZpl1IVuJ47DUBdA8beRzsHJ43HnNaX7a2njWPhtbLo9nLILW8WaS3s04CbWBZlXsCR9K7I1pRrqio6dz5edX29T3nsfnnd+IpbzxlDrfiCL+3CJRJLDO3Drz8o9AOw6V6drnijSrqS68VaQ95q13DY+TaWf2JhHbk4LNuC4+vPbiuG8I/2FJ45sB4gcJpYc+YJB8hYD5Q/wDs5xmvXNd+I2j6VqdrYW9/banNdS+VBaacVEUEf95j9Af5AV6dCyUrzt+Lv0O6u3zQjGN7L0Vj58t7rxD8QL2BtXu7mfSo5laeZ2WKKNSQGIJ4zjPqa9xu/DXgnQdFkEuk2csBTMSwwedNJxwRjJ5IHOQK8N1z4m61f3twtvcpaWQlJhgghQKi54xx34JrKPi7W7lx5mrXjc5wJmH8q46eMpUVJNczfVndUw06qi0+VdjuT4d8aeKmQTaXdJbIdkVt5Yghi9lUkAfXr616f8HPgxq2qePdBtLma1sBJdK5mS9heQbTuO1QxJbggDHevC9Ah1LxFqNtZW32i+vJn2pEGLEknk89Pc19Q/D74d+GfhTeWmqeM/F4sdUt2WeLT9Jb98rA5HOCfboB71VN80XUW7OPEydJcif3K7PrPxl+z34Kt/Bs1/qGmynTNNmn1eSCOUhZJGHz5HfOOnFfH3xG+PeoJA+l+EtMtPCukpwgt0XziPcgYB+g/GvSvjL+13/wnnh46DoUU9jpUgK3Utxt8y4XgqMDO0Z9+a+VvEGpJcM59aeBoVadGU8S/eey8jjp0YSkvd7HofhXx54eh+Ha2V74nfSNfuZZXvbwQNLcMC5x85B5K8A5OK4Xx98XVsHbRfBbrYaUo/eX0YPnXLkZLbm5HUjJ5PtXnl/Jvc8CsmUY/CnVx1VR5IaHqUsDTUuaWq7E2pa3qOqZ+1391dAnJE0zOCfXBNUQMCnP1xSdTivIlOU3ebuemoqCtFWHU5elNpwGGA9am4xyjAp46U004dKtEXHKMCnp1zSUq9KtIm48DBpcZopy9Kuwhy+tPTrmmqMcU/GK1jsSOUHNPAxSL1pyjJqkQOHTFPCnFNHWpB0q1qxXCpFGBSKoIzT61RncVetOxmkA5p+MVaQCr1p2M0KvNOAxVoybuKRwSa+q5v2fvh1p+n2r3b6rJeyWcV01vFdorMH+XI3AD73HWvlVvumvpn44eI08L+LvA89whm0650IWt7CD9+F+G/EcMPda0jbqeNj/AGspQhTla5z1z4W+CZuPsc+q+JNCvY3KyxXURLRkcYYbDj14pE/Zzi8Sj7T4I8X6Vr1mc5SeTyZoh/tDB/PANZlrp03ijX7jwp4nspbp7OMm38QRgCW2twNyPKxwskW3HU5HY1D4rurr4cRaVB4akI0Rylz/AGvC4YalMhDZZh91VPAjP1q+RrVMwXtYtRhPX70d3qkXh74R/C7UvCkGqJrnirX/ACjefY5d8FuqtkYxx2I9TnnilgZfAPh9fD0bL/beobZdVKnJt0zmO3z687m98CuffTbTw/rdx4/hgil0OWNLzToJAAr3cuR5QHcRuGY+yj1q98J/hr4k+K19dahDIsFksha61W8YhA55bH94859B3IqYqFP3qj03Mvsczl/wWfcX7L89lovw1S7vESyW5uXYTzFUEw6DBJ5xhqZ8Y9Z+Gmu3wOtajO1xEmzdYZYYznkgEZ5r59+JXxS0DTvDGheC/Dl42pW2kHdLqG75HfBBC+vLE56dua8r1Txi11GVEhb8a8ChlEq9aWKcnFyb+47Z42fsY4dQTS77nr81z8KNN1eIeHPD2p+NtdmciCxuAdgIGckMAPU8g9KPih8Irn4v+FrO/l0VfCfjW0RoYNOeZDFcxr82xSpxgA8HAwc54rzT4C64lt8YdHlkSeVSk64t42kfmNhnC84Hc9q6j9pLXJPA/h3whp+narq02r2uoT6jFqF6jrLgk9WYDdguF78da7alOdGvGEW792ePV5/axhDRnlfwk+JP/Cqta1fw34p00z+HtQf7PqlnLHl4WHy7gO+AeR1I5HOK9yvfE83hgQWmuXC+Lvg/rNsIYdVMYleyz90SsOWA4G4jIwOhFcXrWheEv2mIYdZ0vWbbw746ESpeWF+dkdy6gDcvf6MMnGARxVDSv+FjfswW6x6xplvrfg+9ci4t1fzrcE8Ebsfu2I7EYNXVUaj5lpPt/kTWUasuZaT6p6fcXrL4CeLPCfia/wBP0zT5/EvgXVEAeaCaIGSJhlHG5sCRCQQw649yK8/8e/C/X/hlrwsbyzmkt55NlldonyXGegGOjcgbev4V6fP4U0f4t6eb34XeL73QtTC7m8L3V7JCq+0YDfKOp4yv06V7z8IvBl9a/DPQ7Lxek+parDJ9okTVCJmglVzswTn7uMg571n9cnh7N/d1OeeNdCKdR3e1up8r/FPxQtrqGl+Gbb93beHrNLN1U5BuSN05yOp3nGfauW0qHVPEtyLXS7K41Gfrst0LEfUjgfjXZfGf/hFfAHxN120i0SXW9Reb7U0mpXR+zo0gEmBGmC2C38TV57rHxN17WYPsQu/sFkThbDTEFvEc+qpyx7c5Neth5uNJcit1PWpvnipJaW6m3ceCjYXRj8Ra5pughSdyNJ9pn6dPLiyR6fMRXr/wNm8NeBfCnivxpYzavcWOmR+UJr5hFDdTkcBYVzgglRkkkbjXiuq/BLx7pOgS61eeGryDTY4vPeZipKoe5XO4Dnnjjv0r1bwh4ef4u/s32fhPwvqdpFrunXrXN7p8/wC7NyC7FDnvwQQeR8uO1c+LmqkE+e6uk7bI58RNOCtK6ur26HzrrGsXGt6veajdEG5u5nnk29NzMScfma7H4dfGjxR8MLW7tvD97DbQXUgllEkCyEsBgEE9OO1dBYfsofEm6vnt5tJt7CNcE3VzdJ5WPqpJP0xXZ6to/wAF/hGLTw/4gsLzxdrsUQe8vbCX5Ec/wH94oGOw9OtXUrUHFU4rn8lqb1MRTaUIrm9DjfFH7QvjLxzpf9m6xqqyWRYM0MEKx7yOgYrjIHXHTNanw4/aAuvAWmXmj3el2uv6HeSeZLZ3Z6NjBK9QM8cEHpWtBafBH4lKdK0r7f4H1Zv+Pa7vjuhkb+63zMPbkr161y/ir9mXx94ZLyQaWuu2X3kutLcSB17HacNz9DUx+qzh7KceXyen4ijVpP3ZrlfZnb3mkfCz4uxBPDmpN4K8Ry/csdQJ+zSsf4Q2SB9QR9K8U+I/w88QfDbUo7PXrL7M024wSo4aOZQcEqR/I4PtWd/wiHiKW6W2TQtT+0FtmwWcm4t0x93rXunjtNU8E/s2W+jePFS916+uQuk2tx809jGOSzPkngflvAycUozeHkownzJ9AU/ZTiou6k9up8ySnNey/s//ABEtBHc/DzxIU/4RnXN0YlzsaGVhx8wxwxGOehx6kV4ywyKaFI9voa9CrS9pFxZ6Nakq1Nxl/TNrx54Hv/h74qvtD1GJopIXbynYf66Mn5HHqCAPx4r2Lxtp2t+JvgT4DvfCs091YaTZyW+qw6fKwaJztz5iKcnGGzkH1rR+Fvxuj+IOsaD4Q8b+H9L1u2nK2cd/OmZlOMKWznJOACRj1rjV8R69+z58UtesdIkC2sN4yS2EozDPFnKAjsdrDBHIrzZc7ag17y/E85yrVGoSXvRs/VHj7RliSx3Enkk5NSWdxc6Zdx3NpNLa3MRyksTlGU+xFfUPhv4kfD74ma8mg6n8PtP0Q6uXg/tOIx745WBw2QgwSe+euK8M8eeA7rwL4r1LQ7phJNZy7PMXo6nlW/EEHFdVGfPJwkrM7qWI9pLlnCzHP4n0TxiVTxVZGz1Dp/bmmRgSMemZouj/AFG0/WvQfD3hjX/hX4YXxlb+JrjWdF8pmtbHT3mMc7HiNpVPAQZJbPTbivNPCPglvE+pS/aJvselWaGe/vSPlhiHp6segHckU/xD8RNSn1yG40W4uNH06xjFvYWkMh2xxDsw6MWPLZzkmtHHWxnOk5NRpbdTpfCHxj1LxD4ljufEOkaJrAtUe8kvZrJYriMRqWBEiY7gAZB6iudur74b+KbiSa4ttc8LXc7l2eGRb2AMeTw21wO/U13vgzRx498Ja/qV1okHh27vLf7EuswQlLWUM253ZD8qgeXhnU9+lcdrWnWvwltraazsDrGpzoGi164QPYoTz/o68hmH95ueOFqHHTQmnKmpNU1aWxvaZ+zfZajatqK+MbaHT9omhkubRoHKdcurkED3Gas/EXQPGWl6tqsvhfw1JbWl1IZJtW08rcXNwGwc7lJMaHsoA+teHatqd5rNzPd311Nd3Mud8srlif8A61dh4/1e90jxs19pt7dWEs9paXGYJmQqWgQ4yMUXstDo9jXc1zyv5GLY+I/EHhbUhIt3eWlzGpjMN1uIK9djI/UexFbsZ8N+MYWaSOLwxrWN3mJlrK4PcFeTEfplfWprD41eKBCkGozWniC2X/llrFolznnP3iN361s23izwXrzY1fwZ/Z0jHJudBu2jI9/LfK/rSg32uXJOD5nG3mv8jLsNB8Q/DjW9N1ZYGgdHEsFzEwkhlHdQ6kqQRwRnvXSfED4e20Mtv4h0OMv4c1fMlvjn7PL1khb0KnOPau58BW/hm3V7fRvGTW9lNjzNH8TWBa2kPuUJUH/aAFfQvgD4CWWu+HdU060ubZ9G1CMO9tHdLdJbXA5SaFxzjsQwBwe9cmIx0MK1KaM4udSSUVqfF2u+Ebu507wrplnaSXF3NbvKkMSHdI0krY+vCrT/ABZa2vwv8OXPhyxmjuPE98AmrXkIyLaLg/Zkbuf7xHpjtX2b46+DNz4B0WO+spLYaotlHpseqSK5+xRKmHaNVBZpHJbBA4Ar5V8ReFtE8Ps7QaHrfie9yT5l3bSW9qT67B87fiRmnQxlPGO8dhzUqclGaPA4NFu9UuRBY2k13MeBHBGXP5Cr7+BJbCcJrWp2Gijuk0vmyjjP3I8kfjium8TeLfE8kT6eI5NGssbTY2FqbZcHs2BuP4k153c200YLtDIoHJZkIAq5xhHfU9KnKc1ukjcGpeFtB+Wz02bX7kc/aNSYxQg+0SnJH+8fwrO1XxxrGqW7WrXIs7Fv+XOyUQQgehC4z+OaxXxu6j86ikIUZyK53Um9FojeNOmtXqzpdT3WHw70a26G+vJ7xueqqFjXI+u6ofh9/wAjBKP+nG7/APRD1Y+IGLWfRdO3Aiy0yBGA/vODIf8A0Om/DazlutfumhjaRYtPuncqM4BhYD9TWlm66S6aE8yVJy7mPofirU/D6NHZ3BFtIP3ltKoeGT/eRsg1riXwz4kiYSxf8I3qOCfNj3SWch7gryyfhkVyQI4Ge1SR4Pp9e9Y+1nZxlqvM39nHdOxtXvgzVrKy+3fZxdaf0+2WjCWL8SPu/jio9Du7rRtTtb+zlMN1byLLE47EH+Xb6Gn+H9f1Hw5d/adOu5bWQ8MEPyuPRl6MPrXdabeeF/Fc2NVtG8O3z/8AL5py77Zm9XhPK/VT+FaUoRlJOOjRhOcop8yuh3j7w7bas9p4p0q3MenaqMzRoPkt7sf62P8AH7w9jXTeDdDjt9B8MalOn7nT5dTvSMcExxxlR/30V/Su8+GXgCeO0u/DOqSwah4W13AttYs282C2uxnypCf4M8KQwHWvTtJ/Z81uX4SnSp7J7DVnv5rPM0Z2xxF43klJx9zbF1HXgd62nWo0JfvJWb/q/wAjypVJSgoxvZHxjoHgTUfGOpTiArBHCv2i8vpm2xWyZ5dj/IDk10/inWrL4mAeGNHmuIJrbBtJJcKuqSKuGaUADDEDKk8Y4ODXrvxM8H6d4c0KPQPtieGfC8bCWaW4TdqOryD+MRDlU67Q2B3rxhNY1e3lNv4H0GewjDZ+1Lbma5m92kIwoPovHNawso3Xwvc3jUdV3W62ucHe+Bj4autvie5GlMFD/ZIsS3Ei+wBwPqx/Cql74uFpA9poNkuj27DDzBt91IPRpO30XFega34e1HxnalvE91aaV4iQqlvcXE8a/aEJ4jdF5BGeGx3wa4y+8MaD4du5rbVNWuri7hYrJb2VoVwR23vj88Vw1aUoa0dI92ejTmpL39WcU+SxPOTznvW7oXg281MLeXUE1po6DzJb1kIXYDghD/ExPAHrWhb6joqXCRad4da+ndgkf264ZyxPA+RAB3rpfF/xIvtPsI/DumNbwx2yhJrm1QL845ZIx0CgnGepxmsKdGlFOpVlt21uzedSppCnHczb6x1jxR4cv/K06W2t1uoFtLeQeWkcSrIOC2B9T6muQTw+9tKPtOp2Ng6ng/aN7gj08sE1ti7udW8F6015dzXE0V1byZmct8p3jjJ9TXHMh3H9ayxFSLcZNX+ZVKDScWz2T4d2Uev3kvnStryQRtFJe/ZvLCBlOVMhIL5HGCPeuY8S/DXV9a8e39tY6fPBZtKALmZcRqu0ZIPceg64xVjRxLYfA3WpklMZlv0UFGIOMoCP5Vzdx8UPFFzYNZyapJ5LR+WcIoYrjH3gM16Favh40YQrLV66dfI54U6rnKdN+Re+KupWD3WlaPplwtxa6Tb+QzJ90yZ+b8eBXCOMrTmPzUh5GK+dr1PbVHPb9D1qcOSKies6BqEN18L5ZPFUyzWAcxWJX/XhlzgA+oI4PoKxIPiJrWnabbQ69pS6tpk6brc3seC6jjO7HP5Vc8LyaLr/AMPItK1XUbfTms77zQZjy6nkjHuCwrf8TeJFS7urDUvDUmq+G0Eb2txbRnCJsGDnpx65HSvpVepSjJTtovP1v2PI0jOScb6/h5HLa5pug+JPBU+v2Vj/AGDNayeVs6pOT2X/AB9jXmp469a7Dxv4zi8RLa2GnW5sdGtFxFbkAEt/eOPy/WuQcbeRXzuNnGc/c6dup6tCLjDUbRRRXnHUhoph60+mt1qWMa3Sm0/Gaaamw7jKD93FIfvEUtTYaGUjDIpaKkYykbrS0jdallIaelNp9MIxSGGM0wDGafTT1oC4lI3WlpH4GayKEprdadSEcZoAbRRRUtAMb79FKw5zSUikKOtMPU06kbrQMSiiipYBRRRVAOooooAUdadTV606gVwoAyaKcn3qpEi0d8UU5FBNUlcByjdXTfDuBZvFtkp/h3OPqFNc6q54ro/Adx9h8W6a+cBpRGfowx/UV1YZL2sb9zCrrFlW+ju5vFNz9m3NeG6bywnUtk/4CtHxOUtIVFkUWO4JN08ByDKOqfTqcd66HxZoU3hm41GWyhaZ7iRzLdoNwtlJJKeoJzyT+Fc1oCRziTSrlgltdsNkh/5YyAYVvoeh+tejKDpuUJbv8DmjJSSl2Oc2CkKHPFXbyyls7iW3mQxyxsVZSMEEGpdK0ebVbkxoRHEg3yzPwsa+pNedyPm5TqurcxNoGmvf3DSea1rb248ya5H/ACzHt7nsK328WW+oSrb3VgLrTE4jVnImX1ff3Y985rD1LVVmjSxs18nT4TlQOsh/vv6n09BUenW8t3OEhieaU9FjUsT+ArshN03yR+ZzSXNrI9L8H6M0WrW+p+E7oahcRHc2mzjZOyd1x0kBGRx+Vegaz+z9rGt6xaXvhjRru40fVAJVCQMfsTEgPHIMfKVJP4VxPhX4aXkflXWtahaeF7X7yyX0mJT/ALsa5Ymv0b/Z68X+GpvhfZS/2udQtbJGt5dRvh5DSspOXO49D2Of8K9j4Kd+X5HzeYYueHalT16HyH8QPhe/h6eGB7aEafo0IgsIrwiO33Yy9zOx7kg7UGSRjNeI6giC7ll0/T5/EWquSX1G4gYwg9vLjx0HTLfgBX1H+0v8YzpHje6sx4XsLyw2LLYahOxbzoyoPmRnlcZJ6fjXzL4k+Jn9rySCfTmKt1QahMqf98ggfpW9Rw5U3oGBdaceaSOR1Hw9rd7KJNSkjtRyR9snWMIPRV7D2ApfD+k2Ntrlmx1e3nmEnyxW0bPk4P8AEcCoZ9Y0tnP/ABIYcnubqU/1q74V13TINftn/sSNfvYdZncqcdQG47frXmxVL2ibaPdvPlZjeboNqSEtr68IP/LaVYh/46Cf1qxF4kS2XFppFhb44DyRmVvzYn+VR3et6XcXMsy6DCqO5YL9ocYz7A4pq6vpmP8AkBQ/+BMn+NYSmot8s0vkaR21RYTxVqbklbprcHqtsoiH/juK3/C8eq+NNch08Xsksj5aSW7mJSJFGWdiTwAKydKubXVL6G1s/DkdxcyttSNLiXJ/Xp712+q+N9C8NaRP4f0/TVuJMLHdSwyFI3OcsocfOw7fhXdQjdc8p6fmctaV/dhHX8jpNY+J66Na2vhzwfcvZaVasDJf27NFNfzgYMjMDnaDnaOgHNdn8Z/iTqk0ej3ljql1b3mmSzaW00Uzh22LEfmbPzclsn1rw/Rdf0i81O0th4bgUyzIm77XNxkjnrW/feNbDV9A1eaTRopxDqKzlGupRuLhl8zOfbpXdCfPG6sedLDxjOPu7b/MnvfHmieNcR+LLL7NfEbf7b0xAjn3liA2v9Rg1m2fhKfw49/rkF3bappkFpK0N7ZtkbmXaoZT8yn5z1HauauvEWkSqVHh6FCf4lu5ciuk8E3MmlWV3qlrYjTEd442lursrG8eSW+8Pm6YwAaijKNaavr5rodLg6UdNPLocQPDuq/2f/aK6bdNYjrceS3lgeucdPeu48PfCuwn8N2Ora7r8ehC8JMMcqjlfXJI+te2Sa7pZ0Jr+S4gOliEMXOCmw+o9D6YrwX4w69/a3i5YbeVH061gjW1ER+TaVDZH54/DFduIwdDAx9rJ891sc9PE1sVLkiuW3U7eXx7ovws0b+yvB0sOoaxOhFzrZUHaD2T3x2HA964BNbubq4e5uZ5bidzlpZXLMx9ya5KKT3q5HcbR1rzFipSa2SXRHbHDxgnu2+rOvXWm8vG81SutSLqec+9Yi3Z6ZprXBxxVvEyYKlYnuJ9xJqo7ZpDKGpjOOtcc5XN0rDc5anL0pgHGaeOlSUxy9aco60gHGacvSqRI5etOA5zTU5GakXpVokUdaeB82aavWnr0qkSxcZpw9KRetPUd62juQxy9akTrmmAcZp46VYh44Bpw6UgGaeoycVZA9Pu04DJpAMCnJ96tEiWxyjAp69KSlXpWgrj1Henr0pFHalAxVIi9hwGDTx0pAM09Rk4rVGZ23wW8H2/jj4maJpN4cWbyGWZf76Ipcr+OMV1nxNfUPi58WdUgh22Wl6TutfOmO2Gzt4iQzse2TnA6ngVi/s/eINN8K/FTStS1a7jsrGJJg80v3QTGwGcepIFenfFrwR/b3gq61nwDqUGseHmu5LvU4bJT50shJbzHPVgueFxwORnmnFq+p4VebhiU32sm9lrqYXj/wCITfEv4e3lroytbQ6DJGlwoJ8y8tQoRZTj+EOMlefvCuI+E2oan/wldjpdsEvNPupt13YXYD27RDmR2U8DCgnd1FZngq/1DwzrMN9Hp1xdWkiGG4hELFZ4HG11zjuDnjoRXrtv8DfEthpV5Y+E9PfUf7bAI1aVxCsVicFYyWx87fxYzgAD1rRzhbVkynSoRcLqz8/vOq1jT/CPx20y28MeCJLbT73TbnzIYmiMSeUTiV1X+JcEH1z9ateIIo9bu9C+FngUT6lomjyRya9c2cgQy5dQ5ZgRuxkk44z64rE8NfDqH9nbSdX8T+KdXt5dYks5bCy0vT5QzOZFxkk4ORweOABnPavK/hJ8XNR+EGtXWoWNpbX73UAglS6LDIDZyCDwc/zrmnF1NYapHDTpNqSotyitrn1toXwg+H/hnWNS1CbSdUs7bQSszXepyb7SdNpJZV53qo4OQO1eSftK+M/Beu/8I/8A8IfPp8oj877R9gh8rrt27vlGeh9a4Xx7+0L4s+I9wUill0mxmg+zS6fp8rNFOCTksDySQcfhXmsyT27FJ45Imxkh0I6+uaWHoyjUVSpLVeZth6El79WWvY9b/Zt1q2sfjToUl3OlvE4lhVpDgF2jIVfqScV1X7X4ls28F6deXqXuq21nP9pZX3Mcuu1j35A7+leB6Fpt/r+s2mn6TDLdalPIFgigPzls8EemOue2M17xf/sqeJ9e10x6r430O48QXCq8sFxcu9weO4xk4A+nGa0rSpRrxqzlsiqypU8RGtOdrI+d2OMHJBHTFeyfs/fFjV9F8XWHhrUJH1nw5q8y2c+n3h8xVL/KGXdnGCeR0I/OsP4PaX4Xt/irHpvjU276MhntpGnZliMoyqHIxgFh1OBzX0MPCnhnwL8S9Ds2+FTNHJdJLp+u6RcyTwryAryA8DBOTk+4zWWMrwV4ON9NzPG4mm06bje6vc4zwJ4F8N+CfiN8Vr+90s3ei+FYzLZM8zRtFJncqLIDkEjgda6r4W/GnVPix458ZDTZpdHe40TGm6ZNdB8XSDb5iEgc884HbJrnv2nviRpnhuTxD4G0GxMd5qlyl7rd8/8AG5CsqL+AT2HQdTXzVpuo3mj6hBfWFxJZ3kDB4p4WKujDuCKzp4WWKpupLd2tc5KGGeMp+2qLVpWv5Hout/A74oTyXmqap4b1O6mYNNcXEjLK78ZLcMWP4c8cV7FB4j0H4dfBXw/4l8GaBoniKK2lEWp3GrRD7ZDcsRzwMj5s4GcY2kVo/s8+KL3WfAPiDUdJ1u88TfENELHTNau38lBuyDGucEEZ5654OBXAafpeo2n7O3xG1DxNavZXmp6tDLALpPJaWZZF37E9ju4Axwe1YTnOo1SqWXK0rLS/yJlVnUn7Oq/hdtOpo/AD4p+I/HfxqvpdX1eSd9QsLnybB5G+ymQKCieV0wAD7nnnNeB69Pqln4m1GW6hbSNT89/Ogt0Nv5Tk8qFGNoHYdPSq+lapeaDqVtqOn3Mlne2ziSKeJsMjDuK92/aP06fxV4N8CePPsMBlv7AR6nfWigAzkLtD46Y5HPpj0r0nCFCvGNtJfg0dzhGhVSS92R4pdeNvEd7am3uNf1Se2YbWhkvZGQgdAQW6Vi1NFGZXVI1MjuQqqoyWJ6ACr2uaBqPhnUZLDVbKbT72MAvBcJtYAjIP5V6ijGDskelH2cPdjoZuR3Ga3NI8e+JNBEY03xBqdisZ3IkF3Iqg4x93disQpt5PAppU4BAOD0yOtOcIy0mi5RjLSSPRT+0Z8SSOPF18P+Ap/wDE1wut69qfiS7a61S/udRuTn97dTNI3JyRz2qmQT1ApNhPSso0acNYxSFClTg7xikQr1p6KCeelOUc1IiZGRWlja51Xwo0m61b4j+GYLSF5pjqELBUHOFcMx/AA12fx+tVvPjV4qZCHX7SoypzyI0BH51zfwq8eX/wy8WW2uafDDcSIpikhnXKyIeoyOQfcV7ze/B7TPi9HL4t+H92klxckzX+hXUoE8MrcttJ9Tk88HPB7V5laoqNdTqaRtZP5nm1HJVua2ljN/Zq0VINJ8ZXlppVlqniS0to59Nt7mJXcsN2SoPP93ofSuA8UWus/E7xtLdz2Sf2xqEixGCBCgDKoXGCSRwuTn3r1f4afD/xLpfjKzgsLOex1uB9yxyoVwB97OeCuOD2r3v4h/Dqw0zST4guYItD1m/h+z309iDK4BHzCFem9gACx6DNeXiMdTwuJbTUufbyFSpzrRlVitFuz4f8aWTxeR4N8PxNcW9u+24e0Bdr+5H3n45KKeFByOprDuvCGj+BR53ihhqOqAZTQbKYfuz1/wBIkH3R/srz9K9yv/DHio2kun+DfDF5pdrJlZdQ8srcTr/tytgKO+1SB9a8vvvgfcxXccOteJNC0aWZwiwveC4uGcnGAkeTn8euPWvThWg1q/1uONSy3svzM74mfEXVrv4Z+G9CkitbO21CNrt7W2i2rFAspEEa+3ykknOeK8v0XxZqfh0hba4EloT+8srhRLbyDvujb5Tn14PvXrfxSh+HcGvvby6rreo3Gnxx2AtbC2jijVYlCkeY5PUgnIB69K4iHxr4X0R2OneB7W7bHyS61dyXDfiq7V/StU76xR00FGNO0YECWXhrx/Mkdgi+Ftafj7O5MtjM3orYLRk+jZHPWuq8efBXxlfXujMmlrKyaXbwz3HnxrGkiLtIZiR2xzXO3Hxy8UrEY9NksdAgP8GkWMVuR6/MBu/Wuj1v4jeJdY0bwnFIh8TR6lZOlzp11b+YJpEmZCw2jIbAHzD0oTvdNE1HXhJNWS8zBT4VWOk86/400PTGzzb2shvZfyj4H4mtTS4fhtpUyKp1/wAUT8BURUs42P8A4835YqVfhb4cuLmCG61ZvD2ryIxbw/JPHLKCB8qrKSFXPPD8itDRdL8U6PN9m8O+EJfDbZKS63fjfKq92MzAIi/7g57VXK0twlU5tHLX7j1PwfNDpBtbhvC2g+E7WYgRHUo3vb6TJ42Qsck88ZAHNfVHgH4iaJ4T0TUZLpti2aI04VIwY2Y4SMiMBFcnnYM47mvgm28Z2vhjUHt/D0z61r1wfJk1+4BZtzcMLdTyM5++ck9sZrtvFfjKHQp9K8D2Fz9ptbCdW1G4B5uLtmG859EGVFeHjcB9asi6FeeHlzx3Psvxd8WodWTW4NCha71DRjuubI4SSaPGSYj0yDnqOenFfNHjP4w3OradJqFpdyXulrg3E1lHultunE9sxBxx95Gx615/rPxfvPB/xc1PWbUnEV7JHJDuJEke7aV/QEe+KqfGKFbe5bx34QuXspGKzXUNu3BjkyUmUd0Y5VweAwI71eDy+OEa7MitWniZc1TdmfN4mvdUMk+k3EWtCQZdNJ1ee0uu+P3MzMOM/wAORxXn+ueMyJpbW78R+LdCmycw6hGsyjjvjaTz3xWdea1oPjO63arEnh3U2H/H/ZJ/o8kh6NJF/B7sn5VU1nW/FXhEx2OtCLV7BlzD9vQXUEqdjHIecfQg17NSUUa0qTjoXzr2uSgLpvj7SblVGFS6iW3c9h9+PB/M1No2lfEHWtds0kWyvYWYB7l4rWeJE6nJAPbJHvXFrdeFdYuC13ZXehs38VgwniH/AAB/m/Imuo+Hnht9H8VQatoes22rQ20EsjR2zGO4YiNtqGJueTgcZqKajOStqrnVNezi+jsQfEPxv4j0fxfqtvcWNjbxpORGJ9Mgb93/AAncVORtwevetH4Y/FXVpbzUbV7TTPlsJ7gSQ2SQuWRSw3bAMj2P51xt58QvGFnezC+1K8S4Zi0kF4mRk4z8jjGOB0ra8FeOJLq81RrrSNMmePTbhzLDbCF2AXlSUxwc4PFKE0q3MpNblOk/ZWcU9Ohiy/FS+vHia50Tw/MFOdraXGAfxGDUy/FCPOf+ER8ND6WJ/wDi6wn1Dw/dSN5mjXFkMcfY7vcB+Dg5/Oul0LwBo/iqLzbG91LTYF/1l1qNqn2def8AnoGA/CueMKtR+7K50S9jBe/Gwyz8f6WpYz+CNBmdmzlRMg+mA5rqdD8W6Xrs8VlZ/DnS7ieRhiO0e48wn8Go1r4T+HfDNxAsWtR6xcuodbKW8itt49S3PB9uaS7m8cWdm1rpuiPo2mEfNHose4OMfxSKSzfia29nOn8e/kcjlSq6U1959MfBrV/CngzxFpranotv4dvbmZI00+21Ga7mZicKZI1yoGT0fJHpX1/4v+I/h7SvCd899qFrDDGnlSlpCdhY7Ru2fMoyQM+4r8xPhzqq/DvRLvxlfoP7UjlNrpFpcKVJnx88zA4OEB/M0ngLxWdX8TyWN7OzjWIJrR5XbJMjrlCfX5wp+teZisqji6iqSla34mdGpOjzRjrc9n+Meq2lir3g0q506wlYumr6RBbajDIRghjKyhwcDHJz718469Jb60JFj+IUzKxJMWoRTwjgcfdJWoNP+JWv+D7uY6ZqM1mxJSa3JDRPjghozwehFVr/AMSeEfGFyzatpkvhu8c83ej/ADwE9y0LdOf7p/CvQUVTXs73sVSoyh7y2+85u4+H95NJusr/AEvVAeQbe9QMxx6Pg10Fp4M17xRYppOsaVcJqCDbYao6FlPGfJkcZyp/hJPB9qyNd+GmpWVodT0+SHX9HPP2/TiXC/76/eQ/UVU8G+J9T8Ia3balps7pNEeY2YmOQd1YdxisY8qnaasnv5ndJynC9OV2ttNj1XSPDGi/ArTbO711INQ8V37J5UDfNHaJkZb2xzlh1xgVQ+LXwR8R6v4zuL/QNDW70m4ijeCSyCKuNoySOOScnPoa7aHw/wCDP2grkXR1WTwt4seIK0F4262mYdNhJ6cdAQfUV0Vv+z34hsYILCf4q2lgIisUNpb3b8AnhQNy85PAwa6qk6Lj7K1onlKtKEufm97rdafI8pT4AvY+H7/RG1q2Pie8t4ro6ccYQIxON3XnOM4615Nqnwv1yxvJbYx201xGQrxxXUe8H6Eg16N418La/wDCr4mW0uvz3T3UFwk325XLNcwhgCysTzlQRg9OlS+PPDeg/Fn+1/EXhOe5/tyIiS40y5AV5VAA3RgHsB2P5cVhOlSrQulqvPoehTrVItXleL6+Zz/xphuPDmiaZ4fsNL+yaEqJM1wq58ybB4LeoySfXP4V4433T7V7V4F+IWpXmkS6DfWS6oyKVhW7jJEyjrETj7wGcE/Q1z3xG+GSaZpqeIdFWT+yZgJJbaUYktc9vpk49qxxuHliY/WKOqtt2SOrC1fZfuqnffueZP1ptOPSm18weyncYwzx3r2HxHrusad4b0XX9C1FZNNhto7a5gGGUPwOQffj1ryW2sp7+7jt7aF555CFSNBksa9Y1a2tvAHw3t9J1COO9nvLj/SIUPK5wTj3UbcH1r28ApKFV7Ky18+h5+JavFdTmfi1awPqOmaraxqkGo2iy5RQFLDr+PIrgn+7XrXiLwzNH8LkiMhu/wCz5/PgfaQwgbsc9wGyQK8mYZTNcmYU3CtzNWUlf/M6cLLmhbtoRUUUV5J2IR+tMb1p7c01hlaljG01utOprdaTGhhHOaKVulJUlDKKDwcUVADKD92g8HFB5GKCkNprdadTW61AxKa3WnU1utACUjDKkUtFZFDaD93FFFADKKKKTARulNpzdKbUlIKRhS0H7v0oGNooooAKAMnFFKn3hQAtFFFACr1p1NXrTqCApy9KbTl6VSACM4qVRxiox1qZBkirW4MmjXIFaWnq0FxFMv3o2DD8Dn+gqjD1FbNgoLgdjXbRj710c9R6WPUvihYXmjeK7PV9Pme3j1OyiuVKnhhjBBHQ9utc5PFo+uRZvoTo+oY/4+bSPdDIf9qMcqfdfyr7H+APwv8ABfx88H+GpNTaaafw/B9iuLQOUDMQCNx6leMjB71zv7TnwL+HXwcurHUfI1SWC83RxaZaTAR715JMjZYLgjgV9FKzm0nvqfKUcfD2n1dp8yPmXWPAd94l0601K1e2up0/c3NxDIGVwB8sh7528MOvSsXVfDF3Dp62sSJpelqwaS5v5BE9w2Pvbeu30GK9H1nxEdK0lNJ0fToNAuri1lvTFCzNJEAMpuY8lmAJ+hryW68X3GoyZ1O2ttUPTfOmJP8AvoYNYYhUKaXdnsUZ1Jq/QSODw3pih5p7rWJxz5cK+TF+LHkirafEC/tY/J0qKDRLfpizTEh+rnk/mKyRJod31S705z6ETJ/Q4qSLw2br5rHULS97BA/lvn/davO5ppWpW+R1csftX+ZseGYZ/EGq4muGCKplubqZifLjH3mJP6fWvX9Z+Igm+FN1FbA2thfahFZ2duONttApb82d9x9/pXjl/a3HhvQktXgmjurs77mQKdqoD8seenXk1f8AFV6bXw94W04nBjtHuXAPeRyc/kBXo05ulB33OKtRjVcb6r/I7HR/H1rrWgf8Ix4luHGlpl7C9ILPYSn+cZ7jt1FcB4o0e68P6jJaXgUuAGWSM7klQ9GU9waxvtRPeuq0HXrPW9Oi0DXX2WynFlf4+a0Y9j6oe47Vi6irLlejNVT9i3KOxyEvNXPD0e7Wbb1y3/oJqzrXh298PalJZXseyRQGVl5WRT0ZT3Bq34RsXuPEFsiLuOHOPYIxP6A1zxptTszpc04XRzATPrT4rZ55kiiRpJZCFRFGSxPAAq8LM4HH5V2UVlF8O9KjvJtkniS8jD28LLn7FGefMb/bI6Dt1pxoczvLZEOrZJJ6szbmQ+ANOm0+J1Ov3S7bqeNsm1jP/LIEfxHv6DiuSVuck/8A1qtQ2V3ql4Y4Ipbq5kJYhQWYk85NdR4bh0LwpqBk19otRlaMr9lgQTLCfVjnGe2Bmtre3kovSP5E/wAJN7speBIpJ/E9q8aNIYFebC88qhIH54rqfBvhy0NrrVjrmpQ2RmhWQwRSq7oFbcWPUDHTHvUdpqUGrWGrDSLuOxt/I2LZPGLcIzkAEyDr3AJPWue8PaRfaZr32a8tZbcXMM0JZkyrFkOORwecdDXfTjGjyq3N+RyzbqKV3YG8RafpG6PR7BZJFyPt18BLIT6qn3V/U1vGVtQ8LadqGvXMs1qJ5bplZsmZvuxxL2A4Yn0GfWuQ8J+F77xZqcdjYpg9ZZSPljX1J/pXqOpX3gfQ3srW6vLnUptGj2R2ajMLyAdTxgnPvx0rXC05zjKVS0Y+f6dya0lFpQu2Z/m31t8N/El/rW21l1d4vskTcEquMKq9gB09hXlw6g546VreKvFl94w1V7y8bCD5YoFPyxL2Uf1PeshelcGLxCqyUYbR0u+pvQpOCblu/wACWN+xqVX4wKrr1p6DLVyxfU6OVFpXOaGc5qBTzTgecVomyrEpfPSjOetNXrTqZm9x460401etOqiLjsZxT6aOtOqkTcePu475p+MU0dadWiJHDhfenDpSAZp1WkSOHC+9OHSkAzT1GTitI7kD1609OtMXrT16VYrjl9akTrTVGOKkVQK0SuSxakUYFMHWpB0rQiw5etPTrTQOM05elaIkco709elIo7U4DnFWkRLceOnvUijApijJqXGMVqlcgUDBr0v4A+JfEejfEHT9P8Pzwq2pyCCaC7BaB1wSWYA5yoB5GD+ZrhNC0O+8S6va6Zpls93fXLhIoYxyx/oMc5PSvoqS70b9lvw+lnZpb658Rb9FMrsu5LRT/CO4HoOC3U4FTO1rLc8vHVI8nsrc0pbeXr2PbvHmi+OYtD+0+FNetY7+EDNlPZxLBIOM4ZvuYGTye1eI+K/DXx/8Sz29ndvOYJ1xnTLiOK39fnZCMfjXpPjfxZfeOfAFx4WtmFp4t1PSXuvs9p86OYyvmwgnoTkr9QRXjPgW71vwfJ/YJ1vUdW1abk6Bp98VtbUAZLXE/wDAoHVUI6cmsIRlqfM4VVFFuSTa8je8Kfsj393Ol34y16G0XdiS0s5PPuD/ALJc/KuevGa9A0fVPhf4J03WZPD3hu31e30F401G7aJZ5F3nBIZ8l8Yyceh9K8O8ffFaUWMmi6ZfLeSyJsub+2zHBGM8xWy9k7Fz8zfSj4Q6tDpHh68W6I+wXurW1hdZ6eVLDMjZ+mQfwrWVJyV5s66lCvUp89eenRbHuXiH4zGz0NdT8MTaLZ6QH+S6GkNPHH32v5b5jPP8SCudsPjn481uKZbe08FeKjJgBI2VJCvp5bspP4ivCPC0firwz4huk8PQXs1xFJJbyJbwNLHKFJG10wQwODwa9W0P4Cj4oXCSyW6+BNXAzPYMFeOYDrJFHv3R84yp49PSlOjRhqypYejQXvu677k+pftCeOPB0zPL4B0bQbvaVS6GmPGUzxlWzg/nisH9mjU7vXf2hNG1C/uJLy+uftEktxK25nYwvyTSNbt8I9XuNN1Lx9qcdxbyYfT9OtJJVcdifOIQgj2I9M10PgT45eFtM8faFeR+FreGQXIhl1y48uCVEf5GcpEoToec1MqaVOTpx3QTSVOXsoXutzw7xTkeJ9aOP+X2fgj/AKaNX2tc+HJ/hr8A7rV/DnifWopLXTFu4YnuUmhSQqpZQGQ4XJPy5xXzL8ePhfqfw+8bahcyW5OiajcSXFhexndHIjHdt3DoRnp+Wa4W08QanY2NxZQalc29lcLsmt45mEci+hXOCPwqpUVjIwlGWi3NqtNYunTalZLcl8S+I9T8Ya3c6trNybzUbjaZZyAC2FCjgADoorNAwKUDd0p6jA5r3lCMUlHY9ZWStHY0fC/ifVPBuuWur6PdPZ39s25JEPX1UjuD0INex+IYPiL+1RJ/bNtpsEWk6aBDHCZxDCr4BdgXPzEnknsDivDcgHrzXoXww+OfiX4XA21hNFe6RIxaXTLsbomz1K91J9uPUVwYmhf95SSc13OHEQ+3SS5l3Oktv2TvFcz+S+raBHeOm6G0N8GkmYclRgdeOteheFfjlp/wr+H1x4N8XeFnttd0hPLh0424MN7kkrI2cgHPJbkHqK42D9pPR7fUk1CL4Y+H4b5HMq3MbbZFb+8GC5H4Vwnxb+K2qfF7xBFqOoQQ2cNvH5Vvaw8iNTyct1Yk+tecqGIxUlDFR93ffscCpVsVLlxC93f5o9M0r4//AA4tr9dcb4ZRWXiK2Vnt5LNk8kyEYBIwMducEjtzzW74Q+IHhb9o/WtK0Pxl4RkufEj+ZGl/p8hjiSIZck/NuGMYxz14xmvmJI89q774PfESX4U+LRrkOnQ6kxhaAxysVIViMlSOh4xyDXVXy6EacpUr83TU0nhYqLcPi6an0D4i07wL8IPAM3ibwj4Q0/xEkN+9nPcalLvaBw5Q4LAkjdx8ted/tPiLV/Cvw411LK20ue/sZZJLK2jCKm7Y/AHOPmIrH+J/xfvviomn6TBp8eh+H7eUFLG3bducn7zHAyRk8Y7nrXTftdWhtvGXh/SIV22Wn6REkKA9Mkjp9FArzqNGpSrUlU+J3e/Q5qFKdOpGU373qfNzQ1BJFjkda2p7Mr0GKoyQkdetfUtJn0KncojrUqfdoaMlq1vDPhTWPF+orYaLp1xqV0eSkCZCj1Y9APckCsZuMFeTsglNL4nYZZffFet/CHRPEmrasJ/Da3MU1udz3kUnkpCP9tyQAPYn8Kqw+G/A3w0iDeItQ/4S/wARIM/2LpUm21hf+7NP/Fg8EJ6GumtfFlz4g0WPVPEzJovhGMEafoGkr9nW9YdlA6qD96Rs+g5rzK2JlVg4046ef6LqefOrzr3dvuPsD4bfEaKz0JLvxLqVheXFuwgOoWsZ25PVN/R29dgwK7XxD4n0vxFpXk6fq3lzSR+dFNboHYqCQSoI5weoHNfAd98Ub3XryOWUrbWkShLayg+WK3QcBVH06nqTmuoj8b3eoeAJLm1neK+0G9WeOWM4ZYpeCR9HUf8AfQr5atkUk41XK0r/ACO+lmNWMHQcfdsbfxi8MaxfRPdjxgdV0584knklWIeqkjKqc9jivJ/Bvwq11fFtpqyWcOp2FhuvDNZXEcyu6IWjT5WzktgY9j6V2sXjBviRcfaNE1D/AIR7x+AA0PmBLbV8A54+6snHIPBqH4fa/rK2OvKNGm8M63cTx2019Z2W2Po5M0kTkIu3BBZSPvV7NCVSEOSaV15f5HlTk4J2PlvWxdfb53vUlju3kZ5VmUq24nJyD7k1Do/hzU/Et01vpllLdyLy5QYVB6sx4Ue5Ir6Buhf6JoV3qWqaqnxNt4neI2VnFHcRxAfxTSMDIg/3R26151qHxQ0bxFo0ej32jXWh2CdU8P3ASI89XjcYc/Vq9VO6sd9OrJrlhHbr/wAA5uLwx4f8PTuPEes/apo+unaJiVifRpj8i/huNdB4m8d30Pw68OrokX/CPWUs13AYrNm3FUZCoMh+Yk7yTggHPSsEeDfD2qqTpXi61jcDKwaxA1s3f+Mbk7dcivTovgrc6T8KbS919ZL2CxuZr46bpjeZJOrqiIocZAGRkkZ4oCpVpx5XJ3fZnkGgeEJ9Xs5NWvbpNL0WKTZNf3BzubrtjXrI3sPxruNQ+N8TaHD4VTSBqPhW3UQqb2ZhdyqM4bepwp7gYI6A5rgPGHiO+16/UXcC6db242W+nRoY4rdPRV9fVupPWqXh7QrvxNrdjpVihkuruVYUUDoT3PoAMk/SpTtodMqUKi56vTbyPcfhl4X0mxebxnoly96tukkWmabqSrHK99tyqhs7X2AluMc44rzjRXuv+E10+z1FZ7e7e/iWdZgVkDGQZyD0PNO+KviO0fU7Hw5o0/maH4ej+ywSLwJps/vZvqzZ59BW38KvHcOueLdG0vxXBHq0PmgWl7KhNzBKMeWPMByVz2OaUWrmHJONN1Gr36eRzXjnXft3i7XJlyivezMF7j5zXT/DPx5dR2EmmfZ11GaySSWO0c8XVqw/0i3x3yMOvoVPrWR498K22va5qur+DZo9V0t5Wd7OEn7Rbn+ImM/MVLZIIz1rz6y1a60LVYL21cwXlrIHRscqw7H9QR705TcXZrQ6oQjVpK250XxC8JQ6R5Gt6NK154X1Fm+yTn70TDloZB2dTx79axNE8a3uiW72UiRanpMhzJp15lom917q3uK9ETXtN0+ctdQeZ4D8VgtPbp10+6GAxXrhkJz7qfavM/F/ha98Ga9c6VqCBZYjlJFHyTIfuyIe6kYNc804e9E0oyU1yVPl/XkaU3hWw8TyGbwrKfNK7n0e8cCdW7iNjgSD0/i9RVLQ7G60zTvEl3JDNbzWtsLcblKsjySKp68g43dKzNJ0fUdZvFi0u1uLq4BBH2dSSvvkdPxxXuOo65ZxfCm20Xxzds9xNciPztNlW4mbYVYmQjgEA4PJ4x3qqcFVvLZpfIqrUlRSitU/vPIbP4g600UdpdCLXrfottqEIuD9FP3h+Br0Lwh4S0T7XNd6taTeFluLGZJbR7tXBiIG9gpHmJgf3s1geJru/wDCloZvDFnZ2miSEqmsWP7+V89nlYbo2/2cL+Ncz4Kmkub3XZZZHlkbSbotI7Es3yjqTVwn7KajP3mKUHUg3H3Trb/wzo2nXMs3grT7fxWUO4TXdyshiPosHylsepB69K898Sa3reqXnlazLcCWL7trKhjSL2CcAD6CslJHidZI3ZHByGU4I/EV0MPj/UzCtvqQg1u1A2iHUY/MIHqr/eX8DXLOrCp7vw+h1wpTp6/F6nPBs4xzXSeCbHVNc8QWmm6XcTW08xy0scpQRoOXckEcAAk/Sn/8UhrRGGvfDdwRkg/6Tbf0dR9c16FqvgK/+G3gO5bSw+r6nrCrFPdW0Z/cW2NzKq8sQxIBNFKhP+IneK3sRVqxsqbVpS8in4w+NWoNrf2TRb37Rolii20P2yJZ/tG370rbweWJJ+lUNE+K1la6tZXWqeGNKuPIlWQy2cTW8gxjkBSFJB5xgDivMHZoW2PuVl4KsCCD9KY03PU1n9ZqRluaLCU5Rske0fFvW/B2teJkvHs9S09bu1juEuLFYgkwbncYzznkg89Vrzy70nQZipsfEikNk7by0kjI9ASu4UuqzDVvAWlXWAZtMnksZD3KP+8jz9DvFczaWd1qEgW2tpbl+yxRlj+lVXqOUvhumFGjyRtzbHa+GdI17SboXmga3ZCdTwbfUEjLfVWxkfUV6HDp48SIo8YeELnSZyM/2/odrkA+ssa5RgT3XBryq0+HuuyLvurVNOiP8V/MkAxn0Yg/pXU+HbW28NzRyS+OVtJAQPL0fzZnJ+o2r+ta03JK1repjXit07vyPS9C+DN/qEEl1oFxbeJrSLBf7CCLhB/tQNhx+RFfT3gj9muy+HfhiTxr4psX1S9sovtMGk2oDlcDIZ89WHXHQe+K86+DniibRli1m+utVextVD/adcaFJGByoCRqpk+Y4Aywzx1r6FuPjx4f1HRbqSPUlnjhc29wiAs0TjAZW/3d2SR2ye1cWMrYqyo0/h6+h4rqxu/aK5+fPxt8bah8RPE1xqmosqAAx29vH9yCPOdo9fUnua8o0/XrvwrrdtqdhIUnt33DHRgeGU+xHH416h8dvDP/AAgfje80pbhrm2KrNbzOACyN644yDkfh714zqEuc1vXmqbUoaWPewsVOml0Z7D8VPEmy003VoVln8M6xGG32svkywS45CsPX0OeRTPAp07xMupxQXovLe/tzHfROpRlcAhZSp6Eg/NjjIzXCeDviamgaNd6LrGmjW9Hk+eO3dh+7bOccg/KTzj1p2p/Gy8itnttC0ix0GJsgtDGGbH5Afoa6o42hf2tSWjW1upn9VqOPs1Hrv5HDaX4cvtd1ptM06L7TOrsoI4XaCRuY9h3rrNS+G/h7T5jZzeMLe31GFB50UsXyBuuMj+vNdh8GNEh0/QJ9Qubs202sM0MI3BGKrnlSe+d35CpovAfhGwnv2l02+urqwdXnS6dizqT/AK0DOGHUn/GooZYp01JpNy79EdFTGNVGk2kuxzOma/4Y+Gmmk2NyNb1m4Uh7m2AAjX/Z3dPp371Fqzadb29lfX0F9eeR+8jjdg5uJn+ZiwxztyOenGK7TU/DnhjW9cvPDa6da2N3DHDdJNBGFZhn5l4+nI9DXJeMPi9qGj69c6dplpaxWto5g/fxlmYqeTwRgVpVjHDwtVklHZW6EQm60k4q7317F34faoNStPECeRftA8TTSSXpBQsQcgYAx9PavFl5jA4PHauv1/4o674hsHs55YYLeTh1to9hf2JzmuSr53HYinVUIQ1UU9T1MPScHJvS/Qh74opWGGpK8g7kI3SkpW6UlSxjKa3rTqRhlaTGhjdKSnHoaYORUlA/XNNpzdKbUAI/XNNpzdKbQUhtNf7tOpGGVqBjaRxlaWg/doAZRRRWRQ2iiigBlFB4OKKTAQ00d6fjNMxjNSUgoP3cUUUDG0UUUAFKnWkpyd6ACiiigBU+7Tqan3adTICnL0ptOXpTQC5walTkjHpUNSxHmrjuDLcLYxWtYT7WFYiNirUM+w9ea6acuVmMlc9j+Fvxm8Q/CrUJLvQLwQNMAs0Mqbo5QORkfnyK9b+LHj8/EnSPBnjPXFAhtrOaSe1ViY5pt4EcagnqxBJ9ga+T477HQn6CvWYb6HxF8M9ChFwUGnSkOwPEcm/gOP7pBxnscV7+FqqpdPex4mIwsI1I1UlfuV7nwr4jtdct/EGswgR3k2JgHDOgkG35l7DnHtXkt2hhnlibhkcqc+oOK9+1nV75PiJbAzsNL1C0KFDypdATx6NyPyrxnU5rTVL67iu9ljqCSsnnxj91KQcfOP4T7jj2qMdSil7ra16nRhZyfxI50thq2dCjjs45dVuVDxQELCjDIklxwPoOpqkuhXj6oli8XlzNzub7gXruz0x70/WruKVorW1YmythtjJ4Lk/ec/U/pivIinD35I73aWlyW21XUJb4NHdzCaZsEhjySfSuq8Y+KiviO8tZbO0vra3YQoJYvmAUAcMMEc5rmvBduLjxNYl/9XCxnf8A3UBb+lZ97eNe3txcN96aRpD+Jz/WuhVpxpXvuzKUIyntsdAk/h+8GXivdMf1jZZk/I4P86uW/hQX/wDyD9Usr49kd/Jk/JsfzrlI2LDH8quQDJWiNRTdpRHyS3iz1Xw7olzqFmvhzxNbzWELnOn6rPGWS1k/uluf3bdOvBqxoHgLUdA8W3Om6hbPb3kVtcFlAyCPJchlI6qeoI61n/Cyz8W6zqS2nhlrx3yA4Rj5K5/v7vlA+tfo98A9DUaBY2/iW50+98R28RS7eExu0SknanABxj+tezFwVNTtex81jMTLDO0XdP8AA+EdB8BJ4F0K08Ua3ZNcaleHGh6QVy07f895F5Owdhjk1xeteGF0+6kvvFt+/wBunYyNp8DBrpif7/aMex5HTFfcf7SngnxEmtXGq+AtLtb+C6iSKXU7aRZbyNlyDHHub92gAH3AOc18qW/wbm0pbzXfHhk0fS4GLNDI4M9y+emAT1/M/rWiiqsU4IVDEp+9N6njet+IJbiMW1lDHpliuQIoMhm93fqx/Suf5Aya9Vv/ABF8PNUmmtn8N3OmW7EhLuCUs6+h254/WsWTwj4Qu3k+x+LfJUkBFurcj8zxmuGpQlN+5NPyuezTrRiryg0c7bgW/g27ccm5vEQH2RSxH5sK7H4cWUeh6LN4n1e7mTToW8uC1VjiZunTvzkD8azPHHg688K6HpdtJi4tBNJI13Dkpliu3PpwO9X/AIuSNp8Gg6PbKE0uG2EsRU58wkYyce3P412U6csNepNawSsvNmbkq7UIvST3KWt/Fa+v7Kax0yyttFspRhhbLiQj03DGPwFcTknOeaavWnV5dSvUrvmm9jtp04017qsOQHbTwMCmjpinntWNrmjYJ92pE65pijC09elWtCRU71InWmJ90U9elaCew5Pu09OtNUYWnLxmqRmOX1pyjLU1Pu1IvHNaECrzzT1GWpqfdp68c00Sxy9acBk01ORmpE6mtUJir1pwGTTU5GakXjmrRI5etPXpTE5GaevStiCRemO9PPGKYOtP6tVIljh1qUdKjQbqkq0tRMeg5z2p9NXjinqMmtUZsXGaeBnimr1qReOatIWw5aetMTp9akxirSM3qOjGBUgHOe1Iowtdf8NfhjrXxQ1r7BpUQWKPDXN5LxFAuepPc+g6mtL21ZjUnGnHmk7I9a8H3Nv8JvgJb+L9ItBJ4p124azS9kAY24DuPkH0Xp3Y81jeAvBN54fvV8YeMYL2SaQs2n2flGe8urgjiTYegXOctjmuvv8A4gafoV1ovw+8E/ZLux0UvNda7qKiZYSuTK8fbIBbn1IA9ao6T4w8TePPFJ8RPqFzpngTS5DMw3+U9zHENzHaMGRmIG4dBuxVQX2j5q9VqUmt+r3sXPEMXj2TxPbHSYl8MeG9HeJvt15KsQO3DO0r53OCxbjocniq3xesvDGntGdP8Qx6V4d1rdqXl6TbPPLeybismXyFCKwOEzgZ5HNeU+M/iJeeLN9nbx/2dogleVLONyfMcsT5krHl3578DoBXQeCLJfiJ4E1DwpktrelNJqmkKT/rUxmeAe+FDgDuDSmuVqZosNOnGNSWluiMg6n4F0xG+yaHqmsyjhX1K7WGP8UjGen+1XpEPxmlsPgk8WlaBpuk3I1H7HFLBGHWMbDJvCvnL8kZJPUmvC44ie34Gu3miS2+D9kMMZLnW5X7bQEhUfn81buMZW9Tqr0ITUb66l/4reItTvtR0vU4NTvV0/VbCG7SJZmCLIBslUAHH31Y/wDAq4GG7uIp/PjnljmPWVXIb885rvdI0m68afC68t7W3lu73w5dG5VYkLf6NNw44/uuobHoxNchY+HdU1IgWmm3lzkZAht2bI9eBV05xs0+hdN04x5W7W0Og0Hx+8NmdJ8QWx1/QpD80Mz4uIOfvQynJQ+xyD3FT6t8OEutOl1jwpeHxBo6ZMsWzbeWg/6axDt/tLx9KrW3wo8YXSqw8OahGhGd80Xlrg9OWwO9bOj/AA38W+GtQiv4b2x0C7hXeLifVoInj9Afmz36YxUScU7xZlJwi705W8ujL/gX9ofxV4E8P/2LCtjq2nq++GHV4DP5Hsh3DA68c49q6bRv2q9VUrDr3hbw9rNkzDzU+xLGxXPOOoyB047Vj3+ieG/En2uTxDqui6DrKx+Z9v0W48+3uHx/y0hUHDHqWQ45ORWRqHwpttAXT5dT8S2xtL5N8F1ptpNdxuc/dDAAFvUdRWDhhJX5o2ZyOOGndzjZnXfHn4RsniGw8QeC9JnvvDuu2q3cKadbs6wNgblwo+UHOfxNcBpHwh8a69LPDZeF9SkkhUFxJAYguenL4FfQvgiTWPh14QsUvPHl3oPhyFS0T3+kxROwYlsRpIxlPPbb/FxXr/gz4maPqHh3SpLzXJZZbtJpLa51GBbWW7ijBZ5VjHRAAeeM7fevOePrUIckVzW69zznjq1GHLBXt1PJPiF8Vrv4K6L4L0qPwtpN1c3GjxSXP26HEiSKApU4HrnOe9cWv7Tmk+IybTxZ8PdHvtNb/nzQLIh9QWH8iKzf2qZH1nx3Za/ag3OgX9jGtjfxuHin253bSOhBPIPPFeLba9DCYGlXoqc/ievo+x30KFOpSUprV6+jPfV+GXwn+JWJfCXi1vDGoyA7dM1fGzcegBY/yZqwNc/ZV+IGkPutdOg1qAnCzafcKwP4NtNeRFSwwehrotB8ceI/DgVdL17UbBAdwSC5dVz/ALucV3RwuJpaUql12kv1Wpt7KtH4J/eXpvhV4wsbgwT+FtXSReoFnI36gEVbj+H2v2iq11oOpW6k4Bls5Fyfbiugsf2hPiMiIg8VXZVRtG5UJx9dvNdz4Q/aI8fwS4k1lL0E/durdG/UAGs5vHQV+WL+bIlUqbzsZXwY+E0njTxfZRXEDJplqwuLyVhtCxrzjJ9SMfnWx8brk+PfHN9qUUebKJVtrfjqid/xOT+Ner6H4+8R+NtPk068e3WG5wkn2WAIzc9Miui1H4E6lJZK0Vlu3Y/iUYz3NeJ9d9niPa4ppO1kr/iYt1a1vq8HK27PiTVdEaEt8vT2rO0bwTq/jDVF07RdPn1C7Y/ciXIX3Zuij3Jr6U8QfDXQdEe4/tBdR8Rain3dP0aJhGPXfMV5HrtH41xXiW0+Imq6UNH0nw2fCmhsdrW1mPsomOODLI7Bn46549q9T6+qytRt6vb/AIJvGcoKz0Zw974O8IfDB1fxPfp4p12PkaHpM3+jRt6Tzjv6qn51zXin4sa/4lg+xo8WiaMn+r0vSUFvAoHTdt5b6sTWinwd1u6uYrYXejLdzNtjtf7TiaWQ/wCyqkk1taXoPhn4crJLqOs6dqHi2GQoLVo5LmztG4GSFXErjnvgHsaSjST5pPnkHPBO7fMzI0jQNO+H+n2+s+JIEvdUmCzWGhF+xGRLcY5VOmE4Ld+KwNV8S6h4k1CS91G5aeZiSBjCIOyqo4VR2A4ro7rT/CWo3st/qvi7U9Uu7mQyTNbaZtZvXl3HfgYGAK9Psvgt4A0XwLp3ibxTd+IdIs9QlC2inymkkUqWDFEVsDAz1z7VLxFPDtSqatjdSMfenv8AkeHRXxiXgmvRvhJo+q6zqFwr2si6DqNtJY3F5MQkIZx+7IY4DEOFOBk10nxD+GFj8KLHT/EXh7TF8VaLcgPFqt/IJoYmYnbmJAB6csSM8YrxnX/GWu63fW93fX808lqyyQR/diiIORtQfKvboK19ssXD93saJe1Xu6G9e6j4X8DXE0Yik8V61AxXzJ90NlFIPRRh3wfXaK7fxb48074neEPDOj+Lbw+H9VvbaS4tdRt2Itk+Yoizpz8r7D838PFeW/ETTbjUvG0c0MWDr4hvYEUcZmxlfwfcPwrM+Kl3HL4vuLKB99rpccenREd1iUKT+LBj+NQ6anZ317h7JScddSh4g0HxD8NfETWl0Z9Mvo8Mk1tIQkqnlWRxwy81p2Pimz8bTw6d4i0Rr+9mYJHqWjxBL0sf7ygbZfxAPvW/8MtZuPHccHgnXrb+0/D67pF1GQ/vdIyP9asp4CZABVuK0fHfhj/hT8CHwukl7Z6lEYx4n3rJnOQ8MRTiM9j/ABHtxVqdnyy3NXNKfI173f8AUZH8NrTwSl/daQ1v418Q2r7Y7IFM2Py53yQ5Jkcf3RkAjvXJnVtSvPhtrcl3d3n26LWYZDI8rKxLxyAqRnj7g44+lc1aQzQ3KzxSyRTq25ZUchwfXd1zXrGkeJLnxP4E8TxeILaLV/s/2WdpFxBcuvmFNxkUfMV3DG4dzWri4q7Q5Jws5+8zzK2+I3iGzhMMt4moQcAxajAlyuB7uCf1r1LwL4p0Hwp4Ev8AxLreg22l3WqPJp9k2kIyTTKEPmMgYkRgZxlcCqHhD4M6L8S9fNvoWtTWdvHGJri21CHM8a5AO1l+Ruo54x6VgfHZL+LxWNNksJdP0bSYxZaXCykIYF/jDYwxY/MSOuaxlL3uUqTp15qmtO/c5R9A8Kaicaf4lm0+T/nlrFqVHT/npGWH5itzwJ8NtasvGmiXsX2TUrCG6SWS6sLpJkVRgkkA7h+IrzuWLB9frXd/A7wjqXiPxtHcaeEEdgrSTu0m3AZWVR7kn/Glo3ax11fcptqWnmcFe/bNH1WRyLiwuVkYqWDROOfwIrej8cWevRC08V2jX6KNsWp2gVbuEe56SD2bn3rqIdQ1nwjcPYeLPE1s0cJIfTpYk1OXjjGDkJ+LCrtx8Y/BttozWum+C47e6WcSJOUhyD0LjIbDf7OCKLK+srepLqSlGyhd91oM8KfDO/vNMu7OOePUvCmrReZFf4MbW0y8o5RuQc/KcZGD1re8K6z4Uu9FTwJqDxa9rtv5kNpPqduUhMvJWJXJ3qoYY5xnNcFd+JtL1TUU1aDxVr2l6nCMp9tjEyr7K0ZGF9tuK6aTw7o3xJs4tUM0EmtxjF/e6TOsZ37gElMUgXOe+CDkV0R5XpT3OapGe8/8jy/xV4m124uprC+J0z7KxiOn2ieRFEVyCNq9fqcnmpPGCNZeH/Cmnk422b3jr6NLISD/AN8qv516l42+FGv+NtAj1p1iuPENoFhlaMbDfQgfLKQeRKOhHcYIrgPHHhXWNY8X3ltp2k3k1vYpHZI4hIQLGiqfmIAxkE9e9ck6VSKlzJ6nfQrQqW5WtNzjtI1+/wDD90txYXDQN/En3kf2ZTwR9a9V+GWkeGvHdxrNyZP+Ee1E2UkM9tHIphdZBhpUDcrg9V6c15/deAb+wQG+vdLsCesc16jSD32pk1u+BtG0KGfVmm103Df2dcK8dpaNkJt+Zgz4GR6VGGUozSnsb1+WdNuDszhdd0O78PalcWF7DJDNGxA3pjcueGHqDwazSML716NJ418PrpcOlS6Tfa5YxYKSajcIksPqI2UZUH0JxVyMRX7A+B9L0q5kBB8i4tt16hJHRXZgwHdl+tZPDxk3yy+Rqq0opKS+Zzfwy8HHxVr3mXUEr6RYIbq8MaklkXkIvqWI24+tXNe0LxXrutXWr6jImkec7Mv2u8WARp0VVTdkDAAxjtWt8SPG+o6VY2/hW31N5bm2O/U7q3IjDT/88k2YGxOnua8skYyPudi7ddzHJpzlToJUlfz9QgqlZ+1dl29D0u31uysIRb6/4g0/xDCGI8hLFriQDviY7CD07ms+C7+Hl1ezFLPULMn/AFK30xNuD/tbMuB+JrgPwppGCayeNasnBW8zf6stWpHtPhqx1mZdTstJ03Rktbi3L29zpm2dPOQgpvLknOMjkDk9K8p1LxFrrXM9teahcrLG5WSLzNgDA8jC4Hatv4bSa/pGqnVtKCw2kWBd3FyQkBTIJVmbg9OMZOa3fGfiiw0bVZbW7sYPEmpxzCRru8txEoU8hRtwz/KRyx/Cu2bVegpN8lnbU5oqUKjSXNfscnpHhe91yI6hd3CWOmqcHUL9yEPqE7ufYV0/h7U7WHUodJ8H2rSajPlW1i/A3ouPmZF5EagcknJx6Vl6hf6X4/vYS+oXmnag7LDDbTRia3XJwFQpgoBn0rqNd+GuoeFIRpGhFdW1DUgI7m6DqjRR5+4FzlVbBJbuBisqdKVuanqu/V+nmOpNL3Z6Pt/mbum+No7EXd3BLJeaNoK71nnck6hqD/KkjE8kKcso7BQayvB3ju60Twpq1+rvJLaala3LqT8squJEdWHowJ/OuR8dwz+EbPT/AAs6mN4V+2XT5yJZnB6eqqBgH61S8KSy3mieJrKFZJJZbSOREQbixSVeMevNQ5yVT2fX9TFYeDpuXR/ke8ePLDRfi9b6VAutppuv21sFtFuPuXVu3zIck5JA+U45BB4xivnnx14VvvBetHTNQeJ7jyklzCxZcMPUge9dra3knh/RRHHPBda9oozK+3ebS3d8usZ6FlPU9gSKi+PlqdW1Gx8VWc0Nxo97CkMUiN825dxII+n8qvEwhVw7qJe8rfd1HheejVVP7L/M8jkIyartyaldsnioj1r5iW9z6CKs7npXhGKDx74MPhn7QbbWNOke7sWY/K4PVfz/AJiulvvGV34X8BaFq13Zre6nKjWT+eSpwCcluMn7grx7Q9cu/DeqwajZOEuISdu4ZUgjBBHcYq94r8eav4xWBNRmjMUJLJHFGEXd6+5r3KOYqFG2qla3+T+R508K5VL6co3xD421DxB4jTWcJY3caqENtkYx0571g6heTajd3F1cNvnmcyO3qSeaQd6jYZyK8GpVnVu5PzPSjTjBJRQ2iiiuZmyGOMdaZT5Dk0yoGhR3ph608daYeppWKGd8UUH71FSxoYaYO9PppGDUgxG6U2nN0ptQUI3Sm05ulNoAR/vGkpX+9SVBYyiiigBlFFFZ2sUMP3zS0H71FIBH+9Tac/3qbSYB6U1utO9Ka3WpKQlFFFAxtFFFABSr0pKVelAC0UUUAOQYWloH3aKaIAjOKfjFMHWnntVAIelPHQfSmGnjoKadgHo2RipUfbVenqeKtdyGi1vNd78P9UOm+FvE8xjE6pGmYXPytkMOn5flXnQbnmur8E6vYxQ3+k6gzRQaiAnng8IecZ/PrXfhZctRNuxz143g9DrvCPidtU0BZb590mlXCP5pHIiPyn8gSPpXH+P9Jk03xHcSNzBdEzRP1BB5P5H+ldO2mf2F4a8Q6Ui71itll80DmUtuy2O3AxioPCV9F4m0SWw1KH7RJpgFxFN975ewPc/1FerVi6sIUZv3rHHF8jdWO1ytp2ovpfh640h9s949q8+HOREpA+T64+b2rhRjAxXS6dpt5DrcN87LeWk8jJJcwHeuH4JI6jr39K564ga1uJIWGGjYofw4ry8RzSir9NDqgoqRs+F5VtLfWbo8PHZlEY9i5C/yzWLWzBG0Pg65m4AubxIh7hFLH9SKxayqXUYxZpB3bZOhwBXonw38P6W+m6nr+uxGfS7NdiQhiPMk/Mew+tcDptlNqd1FbQJvkkOPYDuT7AZNegeM549H8F+HtItphLDIGndlGBJg8H8ycfhXdhIcsZVpLSK09Tmr3klBdTd/4XdrMMH2LQFi8OaaBtEVkoDkf7TY6/TFUdK8VXdpI06XcyTvnfKsjBmJ65Ocn8a87in2d6uw35Axurqjipt6s55YaEVZI9U0z4s+JPDdtNFpGuXunxSnLxwykKT646fj1rlPFnjzXfF2xdX1a51FYiSizPkKT3xXNtfFhjNVJrnJ60VMQ5aXCOHgpXS1G3D881VYgKadK+TUZORXnt3OxLlPVvCWt3f/AAqbXHlYXItJBHFHP8yhPlyv05P51V8eXNvrXw88M3tvCyMJGgRWO5wMHKg9wCo/ACm+Bom1L4Y+KbC3HmXW9ZBGOpXAP/sprovDmmXVpo3gO2NuXuBcyXTwvwUiIOWYHpjcPxr6ulGVejydHFa/Ox4s3GnUc+qf6HkNvpN9Op8qyuZcddkTHH5Cqx4JHccV9HQeIbu01PUdSvtasoPDlrcGBUWLJkO3pu9QTj3wa+f9eNodbvjYv5lm0zNE2CMqTkcGvKxmDjhlHlldv+rnbh68qraa0Kg6innrTV60teYtzrH05elNpy9KsB9OXpTacvSrFLYkpV6UlKvSqRmSU5elNpy9K0RA+nL0ptOXpVolkg+7ilXpSUq9KtCZIPu4py9KbTl6VaJJB1p3fFNHWnqMtWxA9etPWmL1p69KpEslT7tLSJ92nKMmtIk3HqMCpF702lXpWiIY9RhaeOlNHTFPHXFaomWw9etOUZamr1rU8N6BeeKNdstJ0+IzXl3KIo19CT1PsByfpVoxk1FOT2R6B8GPgfffFS7kuZZv7P0K1kCXF1jLucZ2IO5xjJPTNeofEgXvhHSJfB3gq3svCmiMf9Kvr7UIop75iMcFm3AYGOxOew4pdc8YxeDblPh54WmaG30TSrqa7u4D80135Jbj1w2T9cDtV/Q5NS1PQU1XxLbW19r6QLHDoM7RkXFwF3IfmGY5NoyY1PoepxWkIqSuz5WtVqzqe1n8PRfqcxZ/DzRfhl4WFt4m1PTEv9TQyzQvI5EqAjy4soCwj3fMzAfNgCqt7e6XN4P1e+1PxW1xDqDppVodO01xFbRph5I4o2YfKfkBb25yTXD+JfFui+M9Te61zS9Q03VmcrcXVrdGVVx28qXpg9gwxXUeL/BMNxpuieHdJ8Qac02mWxmezv3+yTSSz/vCw3fLnaUGN2RitUb8jbj7WWrd2cskfgG3DfP4ivnyACFggX6/xH8CPxrpfBXjTwh4P8TWGrWXhnUXe0mV1lm1PLgYwSFVVGTk8E4riNU8Ga34cfGp6XdWadRK8ZMbD1DjKkfQ1Lplr52AB1rR01ONu521Ixknq2j2P4wSaDBqemaro3hDSv7L1qyS8gu5FkBL5IkUqjhQVPBArO1DWLu2+GejXEGmaTZ+fqFyqItlG6qqpECVD7sHPVuprofAGmDxj8OtX8LzL5l5p5bVdLbBJGP9fEPqo3Y9VNW9a8HSN8PfCwC/dmvcn6tH/hXJSnZqlLdO3yseeuWnFJ7IyfhP8ZvEGk67Bo91NappupEWrSJaRxGBmBVJF2gDgkdc8V514j8Y+MIdQu9P1HXtS823laGSP7QyAFSRwAQBWjqWiNaPuGUdSGDDsR3rtfFnwm1n4g6na+KbCOC00zVbSO7u7++mWC3gm+5ICzdTuUtgAnmtZqlQqczVkyoOlGfPbc8Su9Qu75ma6up7hm5LSysxP1yaseH/AAvqvivUVstG0251O8Y4EdtEWP4nsPeu9l0z4feCbsNd3t147ukH/HvYA2lmD7yn53x/sgD3qn4h+M/iDVbF9L0z7N4X0Rsj+ztDjFujjP8AGw+Zz9TWvPKa/cx07vT8NzpUnLSnH5s0m+Fvh7wZ8/jjxPFHdLydE0Ei4us+jyH5I/ockVZsfjxP4O2WngXRrXQNLWUSul1/pUtwwGAzs/CnGfuAdeteU4BJzyScnNdD4I8GX3jvxHa6Rp4VZJSTJNJwkEY5eRz2VRz+lVPDxUefESv+SM5Uo2bra/ke5+A/h9o3x81O78XytqKNYOG1DSLmZpluZNpIWKVjlVYjBB6duK4608SazrGv+Ntd1qH7Dd6ZoktrDZOgjWzWRlhjiVSOMBjjjnB9ax/H/je2gsrXwn4Unmg8N6aWDXKMUfUZz9+d8Y4PAUdgPeuk0Tx7/aPwj1Y+LhLqlvNewabDdQMq3oVVaXlyCZFU7cK35153sZ8vtGtHol1S8u557p1ILm3T2RyXw98a2enwP4a8SRfbfCV5IWkTbmSykIwLiE9iOCR0IFZvjvwJdeBtaWzkmS+s541uLLUIAfKuoG+66n9D6EVc174cXNppf9s6NdR69oDdbu2XEtv/ALM8XWM+/I9DW34I1zTPEmiR+C/FE7QWjzb9K1XIY6dI3BU56xMcZGeMZr0U1Tft6Xw/aX62/M6+ZJ80PmjzkIM1MkOTxW74l8Hal4Q1y40nVLcwXcJ5wcq6n7rqe6kcgiqcVoQwFevTnGpFSjszfnVrhbR4INdZoEgicEjmsGG1K4ra0Syur+/t7Ozia4uriQRRRIMlmPAH+ff0rKs0oNs5qnvJpH1T+zTd3SapcX3lBdIghIup5eEU9sE988/jX0Fr3xK0TTvDlvq0t6i2N2QkE4UlGJ6ZwOB6/Q18pW/xasfhR9n8D/ZYte0qANHq7uwxLM+C4jPQKnTnqc9MV3c1haw6hqfw0luWOma1af2jolzMxcxSclkz3AI3D2z1zX5hjsK8RXVaomovbzit38tzuwmMlhKLpQ2f5nE/E34iQHUrqw10a5pUwwVl0m/LQuOquqPwVPBGDXj9x4BtfiFevH4f8XJf3QVp3g1hJYJEUfeYv8y4AxnkV1GgW+qfEF7rwbrFlJImkStENaXBfTcEgo2f9YjEcJ19KqePPDFr8OdGm0K+1n+wdPnJMnkKJ7/WQCPm2ggRxDoFZuvXNe/RjCjalTfvffp3XXU8idVOW/vGFrvg/Vfh9o7ReENMm1S4eMfbfE1iyzHBHMcAQkxrzgscMfYcVxemfCnUzaLf65LB4Y00nifVCUeTufLi++5/AD3q5b/Eez8IROng3Sjpd03ynVr2Xzrv32AAImfYE+9Fj8XfEtxsj1O5t9egXpHq1qlxxxxuYbh09a9eEMTa8Pve/wDwDpgqsdVY6Dw5ZaDJqNpo3hbRDrWqTyqianq67lz3KwD5Qo5Pzk8DpXuekePNL8Saq/gzxHbrrPhZkjtIr0qFZZ1GDKu0Dapbpj7ox6muQ8N6hoXh3w5a6pP4ej03XNcgkiiTTJ2Qw25+VpQH3BCxyBjtmu7+HngnQtTCNb3s9vISCqXMIOD2G5Sf5V4mJlCcXKpdJbPzMZT95Jb+ZWXSdE+HkWv/AAv8SzXTaBqEqzW+pq+3yFYBlDDthgORwTnOK8E+M3wN1X4a3STKTquiTrvt9RgQlCvGA2MhT+h7V9p/GH4RTeObm1uLea0iufswjKzMQ0hGTxx7mvm7U/iP4v8Aglqk/h2W6tNWsbUBZNOn/fRIDyVDYyvB6dB6VzZbXdVKph5Xl1i9L+h2VYVcNVlFx06HnfgC0h1vQ9K1qQGefwg9y0q4yWhMbSQDH/XUED61wPhX4b6h4qS91rVRd2OjROTcXCWzPNNITnZEgHzMfU4AzzX1X8FviDpvjfxFqN1pnw/g0EiIfbtVtpFW2UjJAZdoBOeeOcZJxR8UfA1/8VfCuhT6N40t49ajExt5bGVre2v1yNwAViQV2jnnHOeteisZKNTllG36HnfW5Uqji1ZP5nzPrei+LtStn0bRfCGpaF4fds/ZRbsGmI/inlIG48ZxkAZ4FbPw/wDDXjDwyJrPUNCjvfDd06m80rUbmKOKb0ZCWGxx1DL+ORXNeI/hj8QdBuLgano+syKCd80e+aN/U7lyCPrVLTfCusOUD6Rfkds2r/p8ten+7qR+JHp3i42umeva1+zlLJnVPDV3az6MUWSaK7vYhLYk9UkYHaQOgYdq2fB/wihi0vxPZz69o5WewGZYbhnWIpKjbmwvK5GMjNc/8Njr3gzVIr62trmzLfI8c0DCOZTwVdSAGGD3r7T+G/wZ8NXektrK2clsmr2uHsC+6OJGwWUZGeoHXpXg4/H1MHDllO66NG2Gw9XFS5KerW9z5Q1HwRpHgHwBPpr+I7ew1jWdk091FbzO7WefkRBtBUMQST6AVyWjeEQ2jPEfFM1zoBOJTqWmH7CuBnhpXBB/3Oa+m/jR4S0vQdbur+5bTI7hgPKu9VSS4EUYX5VjhVduFx3Jr5S+JWp6Pq148uo+ItX1/Yfkjit1gjU9MKGYhR06LXVl+IeIjzJvXcipCdObpvoZd3Z/Bv8A4SlUklvTAE2uyFlsWfgHBOXAP5e9a2k38nh3WWjsdK1Sw02W1uZoTp01ubKQCJj/AKyNNxPHGWJBIrzW68QeGdPUC08KfaZgOX1O+eQZ/wBxAorW8C/FLW47jVYLJbLTLODTrm5S2srREj8xFBUt1JwfU17WkdGKpRk4aa+ph2OiwawvnWHw91O981t7XN9fybTnqd+1R1PU1cfR9JsEH9oaX4U0eJeDHc6jNdTH8ImP9Kydc8b6f49mhfXnvtLvCMSXVnI01ux7MYGPHTnafwrD1L4fX8FkdQ0yWDX9NHBudPJZox6yR/eT8RisZS6rU7Iwa0m+U6A6v4E0yUu1qmpyc4SzsTFGMg4+aWQk446qa2PBPj6y1PxNZaNo3gzTraDUJFt7uWVTKzw5ydwAC4HHbFcHovgG+1BJrvUc6HpNvjz729RkA9FVcZdj6D8adqPjOKx019J8OW76ZZSDbcXTkG6u/wDfYfdX/YHH1pKrOLvIuVGFROEXzP1dj1jx746v/g1fnStOlhvrm4H2iIG3SK3t4ixGNi8sxwfmz0xWV4v8Yw+PPCkHiWTTkv7eDba6rYJO8ctq5PySoynBRv8AaBwTiuC0mD/hNPC01gWaTWtKV7m13Nkz255kiGedyn5h7Zqh4H8TP4T1n7S0AvbGaNoLyzc/LPC3DL9e4PYgU6lecpLXRmcMJCMdF7y38yyvh/wtrhzpmtyaRM3/AC7axHlM+glTj8wK2vCvw28QadcayTpslzC+lXKJcWpEsUhKjADKTyfTrVLxv4Dh8Pmz1LSp2vvDmqKZLK5I+Zcfeif0denv1rovg34k1XwvJr0Vi0fltp011tlTcBJGuVP6nNTThGUlzI6JTkqbcH95480JXIYYIOCDwRXa+DbeTwd4evfGbgJcoxstJV+rTsMPKB3CLn8SK6nwnE3xL8QwaZq+i2l5JNl5tTtx9mmgjAJeRig2tgZ6jJqn42n8PeNLi1sdM1dtH0/S4vsthbX8JETgH5nMiZ+ZzhuRWSo8vvRd+3QuVZ1P3clp1OMi8R6d4iZ4/E1sxuX4XV7JQJlPrIowJB6ng+9Y+v8AhO80NEucx3umSn9zqFqd0L+2f4T7Ng11Wm/BjxPrN08dnbW08SrvF0lyjQuOwDA9T6UukSQ/DC7L6jqYvp2O250OyKyxsO6ysflB+gJqfZSmr1lZd/8AM39rCP8ACd32OG0bQL/xDc+RYWzzkfffGEjHqzHgD6mtmeDQfC6kSPH4i1YfK0aE/YovX5hgyH6YFdV4m8RWfxJ32ui3C+HRtAXSJdsUV2397euBu7Yb86801HTbrSbuS1vbeW1uYzhopVwR/n2rnnGFDWn73mbU3Kr8Tt5E+s+JdS14RR3t0zwwjEUCAJFGP9lRgD/PNaXi8/2npeg6wR889t9lnfGMyxHaM++0rXNOvzV6D4PsYz4HvrzVLL7TZ2k/220hL7WnZRtkGO6DKk49KjDqeIcqbe/6GlRxo2mkY1q//CFaPFetGV1+9XdaFx/x6wHI8zHZm5A9AM1V8GXsmnatPrsrSSjTojLuLHJlPyxqT3yxz+BqjcrrHi7U5rwW1zqFxM2SYImcD/ZGM4AHQV3Fx8NfEFv4W0/TIbUWxvGF1ezXUqwgN0jj5OTgEnGOp9q2pRqTl+7TtHbzfQibhFe81d7+hyt18QtX1u6X+1EttaZsKEubcFj6BWUBh+BrutFfQND1C7sbZZdJ1+excyzxyGaKyO0syg9cgcnr6Zok8BaV8MYlub/X7eHVJ1xbSvbNJ5P95o0HVuRgkjFYvgBvCdl4sgEl7qGqXNwHiSR7cRxlmyCSNxY5G4fjXTGnUpVEq7Tk+/QwnKM6b9mnZfiZvhzwxq9v4gt7rTRB4gt5G8udrOYOHjbhg4OCuRnqK7P4u+GZvD3wu0bT0Vpo7G7bLLzsRi+3P5gVT+GOs6GPH0FroPhyaPeJFa8lu2Zkj/vbcYxwOOeuM10fxM8YWPivQNR8O6Csusamw/erbIdsSxsCxJPX7uBjrmu6jQo/VKj5ved166GM6lR14e7ovwPnNhhqa3rUjqQxyMEcEGo3+7Xws9ND6JO41ulMbjmnt0pj/drItIQU09adTW61NyhlFFFQykNl61HUknIzUdTYYUjdaWkbrSGhr/eptObnmm1DKGUjdaWkbrUj3GnpTafjOaZjGagYh6U2nnpTB3oAH7U2lbmkqCxlFFFADKKKKUtihrDpRSt0pKzARulNpzdKbSYB6U1utO9Ka3WpKQlFFFAxtFFFABSr0pKVelAC0UUUAPH3cUUUU0QA6089qYOtPPaqAQ9qeOlMPb608UAFOXpTacvStI7EsWnKcU2nL0qkLR6M9at7o6ldWutaXIbuF0S1vrE8sF6Zx7Z/EVzeti8+HviySXT8xW8oDojD5XXup9cGuY0nVb3R5/Os7h7eQjaSp6j6d6tanrmoa4Yvt1y1x5YO0sBxnr0FetLFxnG7XvHF7Fxn3izrdesDcWieJ/DztCjj/S4YTzG3ckfp+tUPEEmmXmoD7VbtatPGky3dsMghlBJZO/OeQQaX4da9/YWtpDOvm2F4RDPGeRzwD+uPpWj8RfCR0LUbaGEF48tBGT6AhlX8AwH4V0SXtqLqR+aME+SooP5FLX9CuIPDujW1kPt0IWS5Z4AcnceGK9QMCuPETSSKigl2O0KByT6V2Pjl5dO8VPDbyNAbCGK1V0bBBVRn9Sa2dG1ez06xF/4ggja+uVJt5I4B52wfxN2Bz0PXis5Uo1arje1u+xpGpKEFJK9zH0XSCL230C2dRqF4cXswP+qjHJiX3wDk++Kh+ImsR6h4ia2gUC0sEFrEB3C9f8PwrX+HehAeLrW9tbyO+tV37yp2yplT95Tz171x3iH/AJGDU/8Ar5k/9CNXVvTw227t8kKD5q2rvp+JVRyKm8ziqoOTTgGdgBkk8ADrXmp7JHUy0ZCelIWPetpfh94kYAjSLj9P8apav4a1XQo45NQsZrVJDtVnAwT9RXTKjWiuaUXYy9pB6JmfuFBIHet/wL4SfxlrJtDMIII18yZxy23IHy++SK9cs7KbT7c2ui+H7KHT7Ztn2jWCUeZu5Xgkj3PXtXbhcDLERc27ROatiY0ny7s8Y8OeJr/wtfi90+YJIV2urjKuPQiuw8JfE2eXxrDqevXX+jGCSErGvyop5ACj3Fd9PZ6/LFtPh7w5cKeQvmHr+K1xtx4s0YXMml+KPB8Wnsp5azXY6eh7E/ga9NUJ4W37zTs9vmcbnGq2+TXuij411vQF8JWej6BeS3UYu5LqRpEKkEg46jnGf0rvfFPguwPw6lnsdFtftgs4ZFkhjHmZypY/lk5rz3xP4Ds/7Hj1zw1PLqWluxSSNl3SQN7+34V654C1i58Z+EZPOtFsIPK+xxSB97NhdpYjtg9vrXo4WEsRWqU6sdZLSy0+RzV5KlCM6b2evc+cF60tdH488HjwRriaet0bsGFZfMKbepPGM+1c5XydSlOhUdOorNHrU5KSU1sx9OHSmHtTx0qdzdO4+nDpTT2p46VZkPpwGBTfWn9h9KpAOpy9KaacOlaIgfTl6U2nDpWiJZJSr0pKdjAFUhMfTl6U2nL0q0ZskXrUidc1GvWpF6VsIePu04dKaPufjTx0qkSSJ0NPT71MT7op68c1rFaEElKvSkp2MAVaJZIvWnAc5pq9aevStUSxwPGQM19GfB/Qv+FT+CJvG19ZtceJdVH2XQtOK5kk3DhwvXng57KD/ery34KeDbXxx8QtO0++YDT4w91dBmwGjjGSM9snAPtmvaPi7470vV77ZofirRtOWO38lb0yPJLDF0McKoh27v4mznGB2rSMeZ2Z4OOqynJUI7dfTscr8P8ATv7J1HW0sbz+0vH13p88ryxOrQWbl13ISeGfJJbsu31rhfH3iCGXV7Wy0y9kurfTM/8AEwDtuu7kkGS4z1yWGAfRRXoXhTwp4f8ABXhjWZ7jxBNc6pqmjvcRT2VswMFruVXZQxBJY4AzjIHHrXnar4Cs1Iz4g1MhRjAht1Jzyf4j+FdVtERR5XUcrN22Ox8DWFp8cdcsLHUClr4ogdZZLwJhdQt1YFxIB/y1A6N371x/xMjvE+IniJNRVEuheyBlU5UDPyge23GK6rwbrfh/RrHXNf0nw9eQy6bbrFHPc6owZmmby/4FXB2lzkHtWvoXxEsPiNfy2GoaBpFvrskSRadfXED3SnbwI59xLHPQOenes9nd7EuTpVHNR9xHB+GPHWveHAY9P1a4ghOAbcyb4j7FGyv6V6b4b1zT/E8iDWPBwuJBgG70JGtpPqyAFD+QrQsPD/xA03fLrE/hvwFYh8edd29vE7AZ+4gUu49K27b4qaF4elAPiLxB41vAc/JMdOsg3TovzsPrgVjUqKWlON35Gcqkanwo9g+DHwlY+ItO1LRptQtDDJulg1iweFgpBDLuHytkEjHHWvbfF/wI0690O3t7SYW8ds0jBWTdgO249OeOg+leAfCT44a7rni2wtYZLTRtIh33NxFBGSgiRSzl3Ylm4GMk9SK9D1D9qLT/ABDDJYXli9pplxujkuYZcyIh6OBj8xXyOKpZjLEqUenbsd1GeCjQlDEK7ex514y03T/h/LI2k+CrrVb9SUGp61bM8St6pEBt+hJNeV+KX8UfFzwVPNLHe6rqWkX5L28MO1Ut5EH3UXAwrR/hurd+JWs+I/Bervb/ANsXkcM6Ca2ube6fZcQn7rqQenTjsao/DD45+J4/ET6Jdan9sh1RHhhkvFDmGcoRGQfQtgEHOa+jpUpwpqurSe97u55Dcorngtj56l++R1PpULHj8a7yf4l3izPDqnh3w9fNEzI6S6YkTdcFSY9pGMGoV8Y+GLoqLzwLZKdpUvY308B9iASwz9c17yqySvy/cz0Izml8NzjraF55I4o42kkkYKiKMliTgAe56V6nr9w/wl8Gt4WtykfifWY1l1maI/vLWA8paZB4J+831xXS+E18DeBdB0/x5eaNqmn3twzR6TYy3KXO5wMG5VWVeEPQsev0rhrmx8E67ezXbeLdZt7qd/NlfUtMErMzctlo365zzgcVxKp9YmrxfKtdt2ckq/tJ2s+VfizhAM9K7zXg2m/CvwjaFji9urzUCpbqMrEhx/wFufenWfw20jUruKHT/HmhStJKsSi4WeA/McAjcmD+dejfGH4Ja3p9x4W06wurHUI7TS1tVV7pIJGcMSxCOwyGLHGM+ldVXE0fa04t233uugqtenKcY38zxrw14h1LwrqC32lXctpcgbSYyMOv91geGHseK7pYfDfxGiMga08KeIwCXRspYXjY6qf+WL+33T7ViP8ACPxnarvfw3qDptLb4IvNXH1TIqr/AMI7qWmti8068tSME+fAyAZ6dRW0o0pvmhJKXk1+PkE3CTvF6nqllo954n0S28HeK7P7B4itYs6DqdydvnpnP2dn6Mh/hbOAeK4lvC1zYXk1rdW0lvcwOUkikXDKwPIIrpvAvia5srZdJ1GEavoxYH7FO5DQn+9C/WJh7cHHNfQlx4J034o6BFqOmXpvdeskAZbhAlxPF2EgHDOOzDgjivDeKnl1W1Ve43utkZR5pXjDWR8wJ4ek28Ia7bwhbL8O/Dl54rmT/ic3ANroqOPukjElxj/ZBwD6k16fpHwju9Qu4Y7i1ltLX7008qFQiD7x5HpXIfFi5Gu6qGhi8jTrSMW1nAOkcS+3qepraeLjjpqhB3ju3+hz88ormmrdkeGXUsgkd3JZnJZmY5LEnJJ9zXu+iazP8Ufhjpl/pshPjrwU6SRRpzLcW646euQMfVfevFNYt/KY4qt4L8a3/wAO/FdprunkmW3bEkJOFmjP3kb2P8wDXdjcIsRQTh8Udv8AL5nQ05Ruj3/4o69rHjX4fSeJPhzqAtLM5m1zTLCMR3iSkfMzsPmJGOR6DIPavn3wv4q03WNOfw14slc6dLIZLPVTl5NOmPf1MTH7y/iK9e8X+JE+CXxd03xfpKP/AMI54qtUvLqyccFXOXAHTcCQw+vpXm/7RngCx8DeNoZ9GIOi6xAL+1VeiBvvKP8AZzyPY47V5WBUVy0npzap9bro/NEUFFWi1vqn5nC+KfC+oeEtQFrfoCrr5kFzEd0NzH2kjYcMp/StT4feGR4n1tY7ib7LpVqpuL+7P3YIB94n3PQD1ap/B3iu1u9J/wCET8RyE6HK5e1vDGXk02Y8h0HXYxwGUdevWuo8YeE9U8BaVpfgKxtZLzWNWIvr2a2QkXBBIihQ4GVQZZunLc9K9SpXlFeyn8T6+XVnVOq4/u5bv8hJPE8vivxO9xBFI4kZYbS1UFikK/LHGB3woH4k19C/DzU08J3VpprSw3HiO5kVWhUh1sE6sX7FwMnHbHrXzy/iKz+FtrNpeiTC78SyII73V1IK2v8Aehtz65yGk9iBxWt8M72+/sLxFqdjFcX2psi6faRwoXcyTZ3t7YRWyf8AaFeViqftqNlpBfiY8sbqofQHxH+MDSw6V4jsnjlFpfzwRljkMqbWXd/vAk/jXLeMPCHhX4+eX4p0nWoNCnQhtdt7lsmJAOX9jx1PB47jnhZdFGn/AA3u7bxRqlvpQtNSjnMUBW4uUDxMoTap+Vm2/wAR6CvOrz4iaDoAk/4R3QPOmddj3utyeeWGc8RLhBz65rhoYFQSVBtSi7X6WNeapWbberO0+JXjfUdX8OP4Q+HGiz2XgqA+RPqqr5f2w5wWMpwNp7knJ78cVr/BzS7Nvh03hnxdrOmvps0zyaVNZT/vbWRQXkZJhgZX72VJxzng4rydLi88Q6efE/jrULqbw/G5W001XKfb5Af9XEgwEjH8TAYHQc1Q8N+ML3xT4t1XU7oRJ9m0a9FpaxLiG2QQlQiL2ABPPU9TXofVrU3Bff5mdShz0+VaWe523jrxb8Wvgtq32abxNd6hpExzZalKqzRTqcEfMwOGx1GfXHFZ2nftPfERyN+v7v8At1i/+Jpnwb+Ouo2Eek+DNdsbXxB4duLhLcLfIZJIEY7cKecgZ4B6etcj8WNETwf8UPEemQxR29vDdFoYohhVjYBkAHbhhW1GnDm9nVgr9zanBc7pziua17rqe5+Ff2qfGls0Yu7myv0BP/HxbLk5/wB3FesaR+1zrCWzedaaczkYUqjKB/49Xw/ZaoUwN3NbUPiJkTAf9aurlmDr/FTRvGeIpP8AdTaPsrxT40vfivoDar4Q1eS28SW0eLzQ/MDCZRwWRWyD/XoeRXy14s8e3DPIniLwpp12zMQZJLNrOUnPOGTbk9e1c3Y+PNR8O6pBqenXj2t7btuSVD+YI7gjqO9e/wDj/wAZ3KfA/wDtT4g2Vn4im1J1+yWthHsSHcDsJkBOCMZyP92uKGGWAfJFJxe3dCqTnKSc1dvc+Z7y68C6jnzLXWdFlI6wSx3Uefo21v1rpPhr4E8OXuneKpYPGluFk054PnhMLwoxBLyBz04A4J6mvPfC3hS/8eeJrXRdLWP7VclivmsVRAFJJJ5IHFdhZfCzxP4WfxZoVzp4Op3Omx+QY2VkeM3EYdlfoAADknGMc16TlrodFXljHk57Psefz/D3XpCTa2B1GMDImsXWdSB/uk/lW34b0uT4ZXNv4i117mxvIjus9Jhcxzzn1k4+SP1B5PTFNOr2Pw3DQ6K8Go+Iyu2bWE+aK1PQpAOjMOcuePSse2+I/ia2BU6tNeQknMN9i4Q+vyuCKz9yLu9zptUqR5dOX8WdP40+MWnfE64t4/EOhyW0EAIhudPuMyxE/eOGG1x044PvXJ3HgGW8Kv4fv7fxBE5+WG3bbdKO26JsHPuuatv4y07UP+Qr4U0ufn5pbLfav15+6dv6UJb+DL6RXhutZ0GdTkNLGtyinnGGXaw/Kpfv/E0y4QdBWhFpdtzntNu7/wALa9b3Mava6hZyhgkqlSCOqkH1HBHoa6PxholtHcW+taWmNH1QGWNepgl/5aQn3BOQPQiuss0bXoUtbzU9E8bWy/ca4uTaX8YHGFd8E/Q7q7Xwp8GZdZtNR0O3uLm00y7xPHFqUGZLWVc4dHTKOCMqcEHpxVxpq3dfkZyxCT5npb8jh/hdrdlDHc+G9fBk8Naow81x96zmHCzp9OM+1dV4b+HN/wCGdf8AEWnXsBEiaNdlHx8sqFBtdT3UjBBq/wCGf2a/Gt7rE9pFp8Yt4JSgvZpBHFIB/EueSD9K+4Phd8EdH/4RLS7LVrpNfurOGS1NwGyFR8b4QR1UcYB5/OuDG4+ngoqSfyFGEsTJxpdT4QvdAn+Hvw8a0W2eLxD4mALcfvIrEHhcdQZGGfoK4C6+Gh0hHuvFFx/YVso3LbMoN3P7JHnge7YH1r9FPjB8OvD3hW9utZa6ls9Ru8/6YZYUeOPAURxNJxGAPQZPrXyT4tsPDtncSz2Oj+Hr+6Ztxudc8RfaWYnuyggHmng8ZHGQ5oq5EvaUJuEt/wATwqT4i3Ph/daeELX+wrU/efAluZvd3I/QAAU6CPxB4niL6t4Hk1uMjLXkVq1tPj+9vUAN+INdhqfiTxNbbo9M1LwfocXTbpsluhA/3iCf1riNb0bxbryNPc+JbXU1LfcGso314LAV2z572d/TodFNJ6pJefUZqfwqsvs32hNWh8PMSAbLXp4w/wCDISSPqoreh8JW0HhwJ4k1uPxBpkaZhfSLd7ma1PqJR0X/AGTkH0FefSfDzV9xJNiSep+3wZ/9DrY8G/DrxHca9BBZ6nBpTsCxngvEcjAz91GyailK9VJU99N/02Oia9zmdTY39B8H+DHnhvLGC+1+ygPm3N1LcLGtvj5sPCq7ieMY6H1on+MOn6l4w0+Ow0e0ttMcC1a4ubdTKqvwQBkqq5K8Y7c1pa9favpOp/2atpY30FqVMl4b6O1uZZgDmXKsMdcYYHiqeqfD/TPHFp9rs0/sXWAQCfPikimf38s8H3AH0r1HCcY8mGsmrX8zkjKLfPV26HO6b4p8T33ie4tdT1i5tdP0wtJeRWwEK7Ub7uFxyxAAHvWbqmpXWh3Nzrmpz58S3bM1tZyfObVW/wCWjA/dbHCjqOtd748EPw306S7lQXOt6s8cgZV/dLJHGAWJPX5jvAPfHpXjuj6LqfjXXks7YNd3905d5JGz7szH0ry8U50WqSbc3r6HbQ5asXUatH8zJurqa6l3zyyTSHPzysSTk+9XfDM/2TxJpUxYoEuoiSB0G4ZP5cV6TdeHPAnw3VotcuZPEusr96ytmKxxnHIPP8z+FZyePPAkLJIngUq6MGUi7PBByK4lg+SalWqpPtuzoVdzi1Tg7GxMLX4N6Le3cuJvE+seYIFUcW8Rc4J/Hn64Har3hu+j+H3hjwfDbwxx6jr9yj3dw4y3llge/sVHp3rzL4keNZPHviA6h5LWsCxrFDCzbii9z+Jya9AvPDM3xO8OeGL7QNRt1n0u3W2mguXKGOQYOeM+n8q9aliI1Ks1h/s2S+/VnLUpONOLq6X3/Q88+Klm1l8QdbQxiINPvVQMDawBBrkn+7Xpfx8e1k8aQNDIklx9kQXPltkBwTgflXmrDK18vjoKOImo9z18NLmpRv2GkZFRuPlqXsfpTG+5XnbHUhlNbrTqa3WosUMoooqGUhrdKjFSN0qMUmMKRutLSN1rNjQ1ulNpzdKbSGMpG60tI3WpKQg70w9aeO9MPWpsMD0pg7089KYO9IBG6UlK3SkqCxlFFFADKKDwcUUpbFCN0pKVulJWYCN0ptObpTaTAKa3WnU1utSAlFFFBY2ihhgkUUAFKvSkpV6UALRRRQA+iiimiAHWnntTB1p57VQCdx9af60zuPrT/WgApy9KbTl6VpHYli05fSm05OpqkJk6DIAqxDHzioI/vCtC1j3c1vBESZ3fwd8I2/irxraWl0HMCI1wVj6tswQPpXpOl2w+LXiaSRLMwxWGoW8wQnlYBuDs34qM+lecfDnxBd+EfEdlq1ntM0DAmN/uyKeqn2Nfop8JPgt4Z8W+G/8AhOLPTPsF5r1l/pCQzkqgYFWAxgBvUgZzX0VCUKVJOW19T5bMMQ6E+drR6I/PB9MivtT1bxHqcD3Fk1y/kw4P+lTE5VBjPAHJ9setZOpaDKZzqXiO4+yeaNy2ij9+4HQKn8C9snt2Ne/ftDwRfCrxSPDei6ebVbOBBbX043FUYAsYxjAbOQznJOO1fO0Onza/rAjkdnaQl5pnJJVRyzE+wz+lZ1oRSsldnbhqrrQ9otEbWgeIoPD4h1H7LDY2txKsMMCcsyAjfI7Hk45H1zxWT8TNCk0/xBNfxx7tPvSJYpk5QnA3DP15/GsnxHqo1W+3Qp5VpEgit4f7kY6fn1Pua6rwb4qt4vCd9p+p2pvrGAhmjByyxtxlc+jY/OslONe+Hk7dn5nXyyhapFbnnhHFdn4C8N+dcLreoFbbR7FhI8sq5EhHQD15xz7Vb03QvBmotLcR3uoG3gBkkjkUAKvu2O/1zWR4s8ZSeIBDZ2sQsdJtxiG1Tj6M3vWUKMMNatUafZLr/kaSnKr7kFbub3iLx9q1/psWoWWoT2kRupYtkbY+Xgpn8M1o6PrN7efDTXb3Wpm1CMuI7YXADHfgDIPsSP8AvmuQ8M6fceItK1HSrVBJcl454lz0IJU/oc1s/ETUYtJ07T/Ctk6mCxQPcMhyHkI5/LJP4iu2FafJLETelvk32+Rzypx5vZxWqf4HHabqd3pF0txZXMlrOAQJIjg4NXtU8T6vrUCRX2oXFzEp3LHI+VBx1rJXrUh7V48Kk4R5U9DucI3vYmjvbiGRHjuJUdSCrByCD7V6x4Zdfi34cvLDVIQ2sWEY+z34wGbOcA/iOe2D615DXrXhn4eaPP4T0zVZotXmnu0PmJpzZxyeSMdOPWvXy91KknFax7M8/F8kUpPR9GU9D8G/ELwhO50uDCyD5ljlR439DgnrXaQ3njBvCuuHV7YaRcwQefbXdptUkryVIBP+TXLeNfD8fhzwjHqWnXWuWb/aBD5N7Oy4GDk7R9K1PDXwuuPEvh2wv5/Emo7LuEPJACWXB6jluRXu4aEoTdGnfbbm0/Q8+rJSjzzf4Hm2p/8ACQeI5oru+gv72QRBFla3Y5TkjkDnrUU3hTWre1a5k0m9jt1GTI1uwUD1PFe2eN5/HdtqkNv4bgYaaqJGjxqjMWA5znoOlN0WD4i206XOsazp1paqfnS9KMGHvtx/MVyvLYOo4zcr99GvvuarFNQTilbtc8CzkA08dK9t1Dwd4V8feKtQ+xThDa2qzTHScETSbmDAAjBP3enrzVHU/gfBfaJFe+Hbi6kk8xhJHqa+TtVQc8bc5ziuf+x8Q03TtJfj56GscdS2ldfI8iPbv9KkFfQHiX4RaPN4Sun0TRQ2pmCJraWOcne5xuwC2Onr615xbfBPxjdKSNKEQHaWdAf506+U4mhJLl5rrpqFPG0aibva3c4mn9h9Kta1o134e1S506+QR3du22RFYMAcA9R9RVXsPpXmOLg+WSsztTurocOtPPamDrTz2oRI408dKYaeOlaIlj/Wn9h9KZ60/sPpVITFPanjpTD2p46VaM2SL1qRelRr1qRelbCH/wAC08dKZ/AtPHSqQmSJ90U9elMT7op69K2WxmSetP7D6UiRSSnEaNIe4QE4qVreZFy8EqqMZJQgD8atIzcknZsRetPXpTF609elaIGetfsz3dlH8SPsd4TG+pWM9jby5+47r/UA1iad8N5dK8Z6pp3iANa6doZM2oTAY3Rj7iqfWTgL/ve1bH7NGhabr3xUsU1JgRbRPcwRN/HKvT8vvfhX1R8VvCPh3WPDtzf63p9xcw27Lczx2J2SXOxSAHxguFBJxnPBq46M+YxeM+r4nk11S/M+UdA1XUPFyePLqOKaa6utPjjit4VLssf2iNVjUDsEGOOwpbH4JazDapeeJb3T/B9m4zu1eXZMw/2YRlz+Qr0XS/HmnzeG/ECeGtcsfDNhDZof+JfpEkM1uTMgDPJlmckfLwc8k4rzmw8B2PjLXrGAePrC9u72RYi93HOJtxP+0pGe4ywzWj5jeNWa5vso7O+uvAfw38E6bZJbXPjSXU5DqQaYtaQNszGm9fvMmQxA75zXHP8AGXX7ZmXQ0sfCtuST5Wi2ywsfq5y7fia6r4y/DX7D4tt7RfEejwW1rYQQwwXtz5UkaquOVwep3HP+1XFP8MNRU/u9V0CdCARImrwAH82B/SrUYvV6iw6ouPPJ3b7mvoni+18ZRrpHjK5LuRss9fkBee0bOQJCeXjJPOeR1HpWdq2iah4Q1L7JqEao7KJI5UcNFMh6OjDhlNL/AMKn8TxuVW2s5O4kj1CAqeOx3816d8LfhzrWv3MPhnxb4fnbQbUvcpqYlAezUDcyIwJDI+MbPU5FVKaormvoh1J06C5ovTsXUvV+HHwltRKNniDxX+8yT88FgjDA9vMbn3AriD4mkK8uQcdAelbXxg8K+NtU+IOoXU+hXlxbnEdmLCF5YY7ZRtjRcDjAHIODmuEbRNdjdkfR9QVlOCptHBB/KqwsYxg5S3e5hFRnFNvU9P8ACXxI0vUNO/4Rbxirz6BKT9mv1+afTJD/ABoe6E/eWuL8deGNV+G3iaGGaZJCCl3YahbNuiuY85SVD3H8q5R4rreVNtOCOuY24P5V3Pg3xrpeqaCvg3xaC2ktLmw1VTmXS5W4JGesRONy/UioqQ9g3Up7PdfqOSVP3k7rqUvizb27eKV1WzQR2et20WpIi9FZx+8X8HDU74X+BrfxPe3eq63K1n4U0ZRcalcdC392FP8Abc4A9ia9PX9nLxh4l8HafpZt4hd6TqLwwX5lUwXFnLh/MjPUqrc477iK4H4i6yiiDwF4Zt7htG0eciVhEfO1C6B2vNIoHGDwo7CsYYhVIKjSl8+yMoV1OPsoS16+SOc8b+Mrzx1r02o3REcI/c2tqgxHbQDhI1HQAD8ySawR0rstI+DXjbWoVltvDV+kDcia5j8hMeuXwK1R8GDpgz4g8YeG9DI6xC8+1S/98RA+3foa9KFfD0YqEWvlqdPtIQVos4XS7NtR1C0tU+/cTJEvOOWYAfzrrPivqh1f4ka9J5jPFBctbRB2J2JH8ijnp92uu+HXhTwPafEDR/K8V3mtTW0n2oR22mmKNzGpcjez5x8p7dxWMvi/wBHd3V1/wh+patNNK0qvqOqbVYsSTuWNR69iax9t7SteEG7Lt39Tmc1OppHY5DT9Su7GRGt7ue3ZT8pilZSPyNej+D9d+IeoukWkXmvXsYGFSMyTJ+uRVNPjVdafgaH4a8O6AAMLJb2ImlH/AAOQk575xU0XxL8c+MryOyGsaldvKQqWlmxQNz0CpjirqKrKL5qcUvPX8kKSbW1j2Lw/4d+IDEPrT2dlGSGZtaNuvTvhhn/9de1/DLSLX+1I5jeaRcvGwZ2021b5P+Bjaor5l0/SdP8ACE8Mvia/Oo6orAto9pLudBjpLNkhCP7oye2RXrmjfEOXRtBttWuEhsIZgw0rSrcbY0A4M7jqwHQE5JPtXx2Y0qtRe41rporL7tww06dOopyV7H1TrYs7nR7iKQJIsqFAjEDeSOB+NfGnxDsDY3UsMsJilXgoy7SK9K1bxvJefb9LEx86DS4pxliW8xFEjfjhjXOX3jLSvidoEtrq1m8urWKbmns/+Plou8iL0fbgbk9ORXBlcauAvNq8eve3RndmuKp5jKNlyuP3M+ZvEYX5iB0NcRfDqK9W+IvgS90Kw/tezuYta8PSn5NTs+UU/wB2QdY29jXk9243Gv07DVqdenzQd0cFCLWjPZvFBTx3+y5o+pEmW/8ADN4bSR2GWETHbyeuMNGf+A1Bp2kTfHf4IWVhZOtz4v8ACcjqsDn95PaNnaoPfsB7pjvXMfB/4tW3gF9S0jXbBdU8L6wAl7AwyU6jeo78HkdeBip/iH4V1H4FeKtO8QeEdYlOj6inn6ffwncNpwTFIej8dj1A5GRXgOnOnN0Vo780X0fdGHLKMvZre91/kUPg18ONW1jX77URpayy6OSsdtfIVRrz+BXyOiY8xs/3QO9epSzyeFrabRdf1RbLRZo5xd69qd0yahNPLy72sQy6R5GNpA3A5PWtbxB8XrnXfgHa+L49P/0h7v7JqsWn3L2hD52796Ddg4Xgno1fPOoeJPA9/cPcS+GdYEr4Lj+2Qwz9WjJPryawiquKm5VFa2mlnb8TCKrYicpzWm2m5v8AiS18MfC67hgh0W58S3MkKzwajqsmyznjI4eOOM5YZOPmbj0FTfEfxvqehaLofh61mXSJXtRe6jBpq/Z42aX5o0IXk7U29c9aufD3xB4V8VuvhW90XUP7Ah33/m3l8sn9nrGpeR0IjBwwG0r0OfWsT4s2WiReLZ9TvW1V4dVJu7a7tXhlt54yeDGxCkYGFKkZGK3ir1FGotV3OuDvNRqLVGb4TvXvPA3jmzZnYi2t7wALkZScDP1w55qnoPhmy03TbfxJ4rZ49HkJNpYKcT6kw7L/AHY89XP0Ga7z4aeHvDehaZdeIdQlvmsr+wuIY9Ivo0WS+RcOzR7X5QBOc4zyBmuC8Rar4d8aarLqWq+KNQiuGwqQDSR5cUY+6iKJcBQOAB6Vt7RuUlDY2jLmnKMb29DlfFfiq88Vaj9ouisUKL5dvaRcRW0Q+7Gg7Af/AK61fh4JhZ+L5IQxcaJKgKDJBaRFx9TnGO+ae/hrwhdR5t/Gckcm7Gy60qQZHttZs17H8M9I0P4H+AdW+IN9cnxC1y6WVjZNavbq8gYMCRIM5yAQ2MDacc0Va0YQ5Y79jStXhCHJHd7IoeDvA+l/ALwovjnxjGk3iiVc6NojnDRyY4Zh/e55/uj36eC634hvvE2s3mq6lObi+u5DJLKe5P8AQdAPQVd8e+PNW+I3iO41nWLgzXEnypGpISFOyIOwH6mubyTnmnSg17837z/qx04ag4e/Vd5P8PI0EuStSC+YDqay/MPemmbnrXRzWO3kuy/LfMf4jXaeAvjTf+DLO50jULYeIPDNxE0b6Rdv+7BPIKkg7ee3/wCuvN2lwetQyvmsKlprUJUYVI8s0e36T+0B4d0K6eXQvh1ZaZqM0bW6XEE5LLu46beee1eneL/GmkQ+JbrwNfwC5gt9FjYvglpGwS6HByfl2tgHsa+Qra7NpeQXCHDQyLIDjPKkHp+Fe1ftDSz+Gvi5o/ivT5A5vbSC9ibOVYqNpH0Kgce9ZQfLJHlV8HTVWMY9Uch4j8MeFrTVPs1xLc+HnlUS29zb/wCl2NxGfuuh4cA45HOOlZVx8LNWeJ7jSZbXxFZqMmTS5PMcD1MZw4/Kuk1TV9Ktrg6ddwPc+EtVjF9ZNGB52ms5+fyz3CsGBTocDvWLq3g/UPB9/Bc2t15tnMN9nqlkxVJh14YdGHdeorfkU3sd9OpKMVaVjjZbCWCUxyxtFIvBSQFSPqDTBa5Gf516vp3ijXNbaKx1Cyg8U7/kSG8tvMmb/dkXD5/Gu4s/hb8PLaK4l8S37aFeKof+y4dQE7IMcgsE+8TxtyT61EoKGjKeKUfiR4BofhjUvEl0YNNs5Lp1G52UfJGO7Mx4Ue5Ir3b4E+EINN8TxyW+qSanLZYlvJ7aZk060UDO1nyPMfrwPlHU5FQf8K71nx/cw6X4WvtNg8IK4Ev9nOw8oHPzTq2Hdzg4zkZ9Kyvip8QNO8P6L/wgHhDamjWp2Xl8pBa7kB+bkdRnOT3xjoKekdEYVKksT+7j1/Au/ED4q6nrfjPV1sdfu5dC+0MLaOOZljKDHQDGRnPWvQfhF+0VrvwxtZLawliuLKQ7za3ILIG7sCCCD/Ovlq2vfLwOBWrDr7RjAb9av2GHrU/Z1I3TNVSlSadN2aPvfXfi/rnxF8IxeKPC1zHd31jF5OqeG7hA8Uvcsi9c9wc8j6V87av4i8GfFB5449H0/S9al+/Y3f8AoyysM/6m4XGGz/C6nPrXlXhX4qat4G1yLU9LnKSqNskTH5Jl7qw9O/t1rpfjFbaP478FRfETRLf+z5ZbgW+pWQIIWQnG4Y6HOPrkGuCjhKeEbVPboRU55zTqdevmcN4t8F6PYXzWs1zf+GL8kkWutW+6Ijttmj4I98VxmreANasIfPFoNQtDyt1YMLiMj6rkj8QK3NI+Kuo6faLpurRReI9Dxg2Gojfs943PzIfoce1P0rRNN1y7aXwfr8+i6sx3JpeoS+Uzf7Mcy/K3tkCrk4VNFuehB1KC97buebtEzTGJYyZc7dm3nPpiur1QDwDp4062bZ4hnUNeXUTYa2Q8iFSOhPG4j2HrXdad401H4aobrxbpkd/rtw2yCGWGNJ1iU8u0gHIJ4A9ic157dv4c8QahNM099oss8jSMZlFzHljnqu1hz7GplTVGPuS996a6WNoVHVfvL3fLqcvI7XMzSSFppXOS7HczH3Nez6VoOkfBTw9DretxRah4rul32dgeVt/9o+mO5/Ac81zHhfwQ1r4k0++iNv4l0u3nWWVNMmBlKg8fu2w3XBxjnFdD8cfh/rL6zJ4mhaTVdKvlDI8UbE264G1GXqBgdfX0NaYenUpQlV3l0/zMsRWjKUad7R/rQ6Dwv/a3xE0WTS/G3hvUruOWfz7fUIo1hEQIHAzgge/OQfasD4neLJfhrfSeHPDWmW+hxmFGe+iUNcTKfft365P0rv8Ax34L8e66dFPhm9e30s2MKzJHc+VtfHLEdcYI/KvLf2ihG/xEaKOVJXhtIY5djZ2uM5B9+R+ddmJqShQbV+Zfae7OXDqM6yT+F9Ox5LOzyyM7szOxJLMckk9ST61Efu1bkj5qvIhxXx8k73Z9KiE9KQSvErbHZM9drEZpX4OKRInncRopZ3IVVHJJJx/MikubmSi9SntcjfJySSSTkk96afu17JrHwg8PG9stGh1s6d4gaBHeC4G+OViP4emDkHgGvJdV0+TSr+6spv8AW28rRNj1BxXRiMLVw9nU/wAzGjXp1dIlPsfpTG+5T+x+lMb7ledLc6hlNbrTqa3WoZYyiiis2UhrdKjFSN0qMUmMKRutLSN1qRoa3Sm05ulNqBjD96kbrSn71I3WpZSEHemHrTx3ph60mMD0pg7089KYO9SAjdKSlbpSVBYyiiigBh+9RQfvUUpbFCN0pKVulJWYCN0ptObpTaTAKa3WnU1utSAlFFFBYj/eNJSv940lABSr0pKVelAC0UUUAPooopogB1p57Uwdaee1UAncfWn+tMPanigApy9KbTl6VpHYli0+M4yKZTl45qkJlhPvVftXxWep4BqxFJtNbwZDR1elXIQqc4r3r4c/tP8AjP4a+Gm0TR9ShXT9zOkVxCsvlk9dpPQd8c8182W13sPBxV5dROPvV61KslGzVzy62GhW0krn0RdftDWvjvThpHxFso9Xt1/1OpRJieNvU7cfmOfUVyU3w+06TR9TfwtrcN/FcsEeQjdLHD1KBV7k4546Yrx+a83A89ahtNYutKuluLK4ktpl6PGxB/8Ar1v9bgnacbry6GCwfs/4Tt5dDRvtH0rT53hubzUPOU4ZFstpUf8AAm/lXTeGvBLEx3EGmX7Wt0jRu9xPGgEbDHKjnvnrVEfGTW9irNBZTOBgyNEcn64Nc1rPjHVNc1H7ZLdPC4wESFyqpj0GfXms1Vw1N86u/I6lGu1yvQ6bxjr9lpiRaGmjgpaEBvOJQPgcHjBYcnk1zJ8Qqn+p0rTYs85MJc/+PE119pPB8U9KFpdOlv4htV/czHgTr6H+v51wuqaNfaLL5V7ayWz5wN68N9D0NTiVUb9pT1g9rLYdBRivZy+JHofwt8R3Go6jqFi4iinmtmaGSCBUKMuf7o965vS/h34g16KW6WAIC5Be7fYZG7kZ61h6RrF3od0t1Yzm3nwV3gA8HqOav+IPGmreJ1gW+utyxDhYxsBPqQOppxr0p0VCtduP4g6U41HKFrMn1X4f69odqbq7sGFuoy0kbBwo9Tg1hGvQvg3qV5JrF7BLO81iLVnkic7gcdOD04zXATOJZpHAwGZmAAxgEnHFRWp0/Zxq0769GXSnJycJdCM9K6DTvHviDSrKK0tNUngtohtSNcYUe3FYFKnXFc1OpOn8DsaSgpfErm7qvjLWtetRb6hqEt1bht4RwMAjp2qtDr+qW8KRQ6ldxRIMKiTsoUegANUFGeKkEXFaurUb5m9SXCCVkjYtPGmv2kcscWtXqLIMN+/Y/qeRVC61G6v33XdxNcn/AKayFv51GqHPSnbD6VbqVZJXbM3CK2SLmj6/qHh64afTbyWymYBWaE4yM5wfUZrubb49eJ47UwzGzuiVKmSSAhsYx2I/lXnGw0uCOtdNHF16KapzauZSoQqfFFM9++DnxE0iz8Jx6ZqWpRWdzayN/wAfT7VaNiSNh9s16tfy6amnxQ30qC0nZEQyMcOxIKgHOeTjvXxdXvPwM1DWvEGjazFfznUNLijWKCK4fLeaPmCgnkDp3+nSvssozedblw043aW54GPwKgvbxfU83+K8rzfEXXmeJoW+0bdjHPRVGfxxmuW7D6V6T8fdOis/E2n3vlC3vNQtFmuog4YLIMLwfoPxxXmoOQK+Xx8HTxM0+57WGmp0otDj2p46U2nDpXCjceacOlNpy9K0RLJKdnIFNpV6VSEx5p46U2nL0q0ZskXrUi9KjXrUi9K2EP8A4BTx0pg+7Th0qkSyVPuinr0pifdp68nFaR2IPY/2b/F+i+D9f1qbWtQh06KezWOGWZC4Lb89AOeK958T6RZ/HXwC1hoHiG3+zC5UXN4ls2HKchNvGOoP4V8T179+yzcaRZHXL3ULu2t721eI2f2y98hPmDh8AnB4AzkGu2nNP3Gj57MKEoXxNN+8uhznxY+A8vws0O01J9ZTURcXH2fylgMe07S2c5PpXlq9K+lv2mPENtq/w+0aI6jpl3fjUS0kWnXIlVV2Pg+vQjt1r5pBwSPSlOylodOAq1K1Dmqv3rs9J+Afhi48R/ESwmWeaxsdNJvbu9iYqIo1BOC3YMRt+ma9D1f4y3/jnxt4oGl3DLZWlmZ9KiySrPbuHZ8dy6h8+xxWB8ArW41DwJ8ULWzjea7l0tFiii++x/ecD1rz/wCGV+NN8eaO8hxFLP8AZZcj+CQGNhz7MauK1OarSVatUlLeOx2Oo6QmneDPFmp6Y+dG1eO0mgZDwhMxMkB90bjHpg1z/wAK0S08Qy61Moa30W1lvzuX5TIFxEPxdl/Kum+HWlrqHhzxt4Wvr0wWP2mGK2kPEaXfmsqEnsCVAP1zXP8AkS+Ffh7q1ncxvb6lqGpizmRuCscA3sPcF3T8q2HGT96m9/0OSlupby4knnkaWaRizyOclieuaVAOeKij4NSp96qR32S2HRquOQPyr1C6vZ/AXwlg0wq0GqeKZBdzksd6WMZxEv8AwN9ze4UVz3ws8FL418WQ2tzIINItFN5qVwxwIrZOX59SPlH1qD4h+MJPHXi6/wBXKeRbyMI7WAdIYFG2NB6YUD8c1Ekqk1HtqcU1GdRU101ZteDPiNNpkUukaxc3t1oF24aYQzsJ7dx0libPDDuOhFX/ABTeeMPDDJdQeKNS1LRZm/0TVba9kMMoxkA/N8r+qnke9ecD7oPeun8GeNJfDJurS4tl1TRL0bbzTZThJB2ZT/C6nkMOa1cLe8hVKKi3OC06ovx/FrxlFIsg8T6kzKcjdMWB/A9fxrofDHjz4heJ7xl0+/E6QjfcT3FtALeFO7SsU2gfX8Kvt8AFbQv+EtXxBaQeB5FE4u5FY3SoTjZ5WMF93ydcE89K4/xR41jv7JdF0K3fSfDUbbxalsy3L/8APWdh95vQdF7VEXCr7tNLzORSp1rxpq59v/C/4reFtT8KW9t/wkWnyXOlxxWl5KgEERfIQOi4ACMxwO3NeK/EH9o2fTfF2t6LcaDeaJFBcOi3GmzraXrLxhnJRgSc7hzjBH1rxfwLuuPB/j61XAzpsExbPZLqM4/Hd+ldfpkqfHPw1FpFwyr460eAiwuHb5tUtlBJgb1kUfdJ6jivIjg4UKkpSV4/keZDA06FVzeqf4Gfqd5oHjWdnm8ea5aySt/q9fhadR048yNjxyf4fwrIu/htcq0a6drOia0H5UWd+iv6fck2t1rjijxO0boY3QlWVhggg4II+oP5UoODjtX0FOg4WcJHr+ycbOL0PSfCXgbxJ4fm1DV7rQ76CCDTbloZTCxUyMnlrgrnnMmce1efoBH8p+TbxhuCK9s+EfgrxhZ/DfXvEGmXJ0yC/SGCyu3vBCsKrNmWUnICKAu3PU9Bmk1H4xWfhm1Szjaz8f6xHIrtq2p2KCCEqc4iAAd+R95iB7VywxVR1JKC5ntp5HDGvNzkoLmZx2ifDudoIr/xDeReGNJdPNSa9/1869vJh+85Ixg4A961rr4h2ui2UmmeDbebR7OQbJ9QmYNe3Q75Yf6tTz8qfjmq+p/EHwx4x1Ga+8QeGruG/mbMl3pmpMCOnRJQwAHPAOK0fBXw/wDCfj/xHYaXpXie9sp7l8fZdRsR5jADLbXRiucA9cVs56c+Li7L7l92/wAxObS5qit+RF8PdOi1S+mv9T81NB04edfzr1/2YwT1Z2woHvntXRr4uufHXjG0MoSH7XcRW0NvDjZDHuCqijoABitX4l/DjUdIjtPCXhNrfVNKsR586w3cf2y4uGHLSx7gcqCAoGQBWF8IvDeraR8StKk1fSruxhshLeyG4gZFxFGz9SMdQMVy+1pVYzxDetnZdjK6mubodyvjVYvjVOLh0W2k1F7Fxn5RGxMOPoAa801HX77wr4kcwTvb3+n3BVXXgqytj8jjkd+lcbca7Nc3cl55h855TMG77i2c/ma6b4vyJ/wmU1/ENkGqW8Gox/SSMFv/AB7dW9KhGFSMHqpRt9xoqffqde3iu4jt7nxh4WS3EW3b4g8OSZaDk4Mnl94nznI5U5rmtQ8JeHfiHD9r8GXA03WG5l8M30o3E4z/AKNIfvD/AGTg/wAq4vw54su/Cmt2+p2ux2iJDwyDMc0Z4aNh3VgSCK0/Gvhq0gsrbxR4c8w+HbpwNhk3y6dcdTC5HI9VbuPeoWH9hUtB2vs+no/0NFCUJK7ON1GzuNOvJrS6hktbmJjHJFKpV0buCDXt/wAH1l+I3wZ8b+DpSbu8sI11DTIHwzRnkkJ3HzDHH9/FcrYfEHR/Hlrb6R49t5DcqBDa+JLJB9qhHQCZf+Wyjj/axXUeF/AmrfADxbb+KtZ1y10/SIX2xSW6tM+pRsMmNI+CuRjO8jB6ZrHF1XKnyT0qLVefoTXqLl5JL3lqYfwM8faNY2Gr+BPFybPDWvEeZdFiptZgBgn0GVH0IHbNch8WPhff/CzxMdPuJBeWU6+dZXyfdni7H6jjP/169r+MPwO03xiL/wAW+Brlbm7mhS/vNFUDzNki7hJGo5yeSV6Eg49KoxW7/F/9mqS3ERm8Q+D5VEYxl3g4AHr93j6x1zxxUI1FXjopO0l2fczhVUZKrHZ7o8k0oL4X+FurXzELfeIJhp8APDC2jIeZh7Fti5+tbvgJtN8LeF2bx7btcaDfyxyafpjx7pi4OTcIMgpGBkH+/kCum8WaJpvhP+yr3xBbpPbaPZpZ6RoZOPtky/NNNL6Reazf7xGOleRatPrfj/xC88iz6pqt22Fjt4ixwOioo6KOwFdaft4tvRX3/ryOlJVE7uy7nYXena5ffFXT7nULiHVbLVUmtbC+tRttJIWidAkQHCbQQCvUEc561wvw5+H2q/EvxTa6HpcZLuczXG0tHbx93b29PU19BfBb4U+LfBg+3eK30/Q/CiuLqSDVZh5kcgHEkY/gbHByeQSMVz3jX4t+FPhv4Ou/Cfwxdrm7vy/9pa8U2sQ38MZwM8HAxgKOnJrm+sSv7Oirvv0RlDES5nToK72v0RLrnxY8FfBHUP7D8FeFtO13VbBfJuNevlB3zDhyMAk8j+EgdceteZ/EX4/+K/iXoh0nWXsnsfOWdEgtghRlzjByTjBxXnJ5bPemv2rqhhoQfM1d93uejSwcINSlq+/UjNRnrUjHg1F/CTXQ9z0o9xhOBxTA5GaeelRnrWbLRGzEcVGST1p79ajzmsykNAzX0Ba20Xx5+EdlaWzKPGPhaLYltu+a6gwOg9cKPxHvXgC9a3vBXi2+8DeJbLW9PYie2fLKScSJ/Eh9iP6Vic+IpOqlKDtJbM6/wpodx448FXeiW1jLPrujT/abeNEy7wSNtljI9VYBh+NeifCDQY/DD3Nv49gS08NTLvGnX4PmPOPuukY+cfxZPA5710PizxGPh/c6f4+8K+HYG0/xDHHNe3jlm25IJj2A4TP97uRXC+JbZm8c3Vz5r3sGpEXtrO/LSRS8rj6Z24HcV0QXtFy3smeZ7V1Ndl0PTtf0x9ED/wDCG6dBpug3pPl6tZkyTTDuhkPMeMkbODjua5fQPglrHjPVlsdPtmABBuLl1/dwqf4mP9Opr2/4G6Cvh/EPiu4ttM0bUVCtYXz4llbB2uE6oRx83FdV+0B4qtvh7op8IeHIv7PSaITXN2p/eSBuwbryOCfyryPrs41vqdGN2/tdLDhTbg60paLp1Pmv4teKdN+HOhHwL4JuB5ZUnU9Wjb95NIeGUMP1x0GB6mvmq7UITgfhXoniwoJm2kYxXnmpMAW9q9qVL2UNXdnXhVbXuZ7T7Dz1pjXm3uKrTvlj7VUlk9a4HUaPXUL6l17wt3r034fWNx4s+FHi3QdOeKbVZby3uIrR5gjOiDLFQTz07V5B5gp9rqVxpd1HdWdxLa3MZyk0LFWX6EVlGsk/eWhNSjzwsvU9U+F/wovB4llvvF2kTWWiWEDzTC9jKpIcYx9B978Ki1n4Mf2F4rnuhFPqvhyONbq3S3Q+ZOW5SHjofVv7tcbrXxb8Xa5plxp99rlxc2k6bJImCgMOOCQAe1eh/F/xNf6r8LfCV/ZzmLTr1Ql0sfDeai4AyOgyG4rtpvDOnJ2b5dfM4prEKpHna97TyMNfEPiW/uZYPFeh22o6XLJn7PfyJA9sCOBDISGUAY9RU83wZ0bXbBL3w74hhVriTEVjdyozL/eUMhO9h2AHNeU2WnXmqGc28El0YIzNLsXcUQcFj7DIq74d0G/1/UFh06MvKnzmTdsWNR/GznhQOtc6rKo7ThzX6nW6LguaMuX9Tobjwno3hvUHg1LW76K+iI3RWunOjr+Lla9s8DeLX8IWcQ1G51jyJgFt7LVpY3uLgkgL5cQXcByOWYD61h6B8XNG8M6Sml6uJvGV/Bx9v8tCq9MIjv8AMQp6Ma2/AXw4tPFPjW28S6JrA8RWsDm+uLG5bGoIyqWVCh++NwAytd0ZRoax/wCGPLrNzi1UuvMr/Hrw8zR6d4q8P3M0Fusz2F2LR2QRXCE8nGOeo/AeteB3unvK7SSFpJHO5nYklie5J55619j/AAU8Hz/EDwN478G38EiapNnUoEkQhxN1IIPIO4L+deA+LfBV74euJLbULOaxuk+9DcRlGH59qwaWInON9V0NMLUVKNmePXdtsPTms+aPBrqtUtfLYgiucuF2k14tanyOx9BTldGbKOa6T4Y2EGpePdFguSBEZw5B7lQWA/EgVzsoyas6FqZ0XW9PvhnFtcJKcDJwDz+gNc9FqFaDltc1qRbptLc7m+uL3WPjyCAyTx6iqKD/AAomP6An8a5H4gPDJ401xoGLRG8kwT9ea9L8UX9r4H+Ktn4reH7XpOqw70kiP3MqFZh6kDBx6MayfEPwavtXv7jUNAv7PUrK6fz4w0u2T5juIPGO5Ne3iqE6kJwhq+a/ysebSqRg1J6KyXzPKR0P0pjfcq1e2U2nXlza3CeXPAxjdPQjg1Vb7lfLTTi7NWZ7MdVdDKa3WnU1utZ3NBlFFFZspDW6VGKkbpUYpMYUjdaWkbrUMaGt0ptObpTakYw/ezSN1paRutSUhB3ph608d6YetTcYHpTB3p56Uwd6QCN0pKVulJUFjKKKKAGH72aKKKUtihG6UlK3SkrMBG6U2nN0ptJgFNbrTqa3WpASiiigsR/vGkoJyc0UAFKvSkpV6UALRRRQA8fdopFOVpaaIAdaee1MHWnntVAIaeOgph6U8fdH0oAKcvSm05elaR2JYtOXpTacvSqAchwOamVsGoBT88CmiWW0kIPFSiY+9UUkG7qak356VtzNE2LRmOOaZvJqDzBRvz0pXbCyH789aXrUanIp69KNxEkM0lvKksTtHIhyrocFT9a6qw+JWrW9u0F35GrQEY2Xse/H41yVOXpXRTrTpfA7GcqcZ/ErnoHh7xnZapqlvZah4d0z7NcsIi1vDtdSeAc1zHizSY9B8R39hE5eKGTCFuuCAR/Os21nktZY5om2SxsHRvRhyD+dep3yaP4x8Jf8JFq0X2C6GYGuYSTukzgMVHXn1r0Ka+u0nGT96OvqckrUJqXRmX8GP+Qrq/8A14n+YrgV6CvTfhZpEuk+ILpZJI7izu7QpHeW7bo85Bwe4PPQ1wGtaRPoOqXFhcjEsDbT6EdiPqMVtVpyjhoNra6JpyTrSRRp6A5poGaljHNeVE7WTxx5ro/B/g3UfGmsw6ZpsPmzycszfcjXuzHsBXR+BvAuhXHhZvEviS/ubewW4MCQWqAvIRj198/l1rtdM8d6Vo+l3GleA9EurK/1B1je+uW8ydgeMIBkg+nbvXs0cJa0pvR/eeTWxWjVNar7jB1/4A6r4c8PajrEmp6be29jxMls7MwOQMdODyOtecS2m3PQ/QjmvvPwf8FLHw54Ki8NapZXVx9vsm1nVZsb8mNkJiHucY+imvBr/wAZeC49UCyfDqwi0wy4MiyuZljz1weM45xmuyWFp1P4eh5mHx85cya5rHz3JFtPPFRsuRgV7n4l+AUesXL6h4Q1jT7vSLgLJBBNMVkTP8B4PT35rjtQ+BXjCx3EaclwoOMwzqc/gcVySwVZfDG56tPGUZLWVjz+3ge6uIoYwDJK6xrk45JwP1NfVKmy+E/w5hkntoHexjjLpF8gmnzjOT1JOT+FeB2vwv8AGFvqluqaHcxypKpWSRR5akEEEnOMV9F6/qVnp/g1b3xVZw3MUYja5hjTzk8wnGVB6jJ/Wvp8koyoQqzkuWVtG+h5WY1VUdOEXePWxxXw98TaRqfhlrvVL/SLbUptSknlTUCruIi2di7jkccA9K8p+J89lc+O9Wk094ZLNnXy2t8eWRsUcY465rA1qe2u9Xvp7NBHaSTu8Kbdu1CxKjHbiqi9K8XE4916SoSivd69/M76OGVOftLuz6ElOXpQEJFPEXFeUdoU5elO8o0mwirRLH0q9KSlXpVITJKcvSm05elWiLEi9aehw1MHWnD734VsSSqetOXpTF609elUiSVOhp6HDUxPu0vQ5rSOxBNSgA9QKQcjNKvStESyRQAeBin5+YVGpyM08HJzWqItpY9n/ZYieXx7qghkZLsaRcfZ1V9u+TgDjvjrXKp4xNnqD2nizQIb67t5SJZwv2a+jdT13rwTx/EprldA16/8Maxaapply9pfWzB4pU7H39QehHcV73r2l2H7SPhCTxHpEMdl430uLbfadHj/AEpR0K9yeOD9VPY1ak0eNWjyVnKa0lpfsyr4k8ELeaN4qj8O6gk899e2V+1jKwgeMOryBQxO1ydwIwRyprI+Leg38+g6PdXLyS6ppNrFDq0TRhWR5QGWXj739xm9UHNbWkaF/wAJf4C0CecFRNc2lre7sAoLXz92fQ+XiuQtfjfqf9u6i2oJHqvh/UJGEunXShtsDNnZG3VeMHHTIBxXU3ZI46XtJO8LNxZ52Ox7VKOma9H8VeCvCcGsfZ7XUptDS7iS5sLm6JmsriNumXA3oR0IIOCOvNXPA3wF1rWvElqdQgV/DkeZ7nUbKVZo5IlBYqhU8s23GMZ5pX5U2zvliaahz7eo/W5R8NfhXZ6BGpi17xMqX2pSKcPFaf8ALGE/72C5FeY5yM9PpWn4y8SzeL/E2oavMuw3Ep8uLtHGuFjQegVQox7VX0bSL3X9QhsdPtpLu7lOEiiXJPv7Adz2p01yxu92OlH2cOeXXVkEeWwACSenvXoGl+EtN8G2UOseL1aSeRRLZ+Ho22zXA4IeY/8ALOP2PzN2pgn0r4W3C/ZJYdd8VxghpsB7Oxkz/Bx+9kHqflB9a4u/v7nVL2W8vLiS6upm3yTTNuZz7nvWqvLRbEe9W20j+L9Du4PjZ4lEwguriO80FjsfQZEAsjF2jCAfKBxgjkEZ61W8VeFbKbSY/EnhpbmXQpW8u4gm+eTT5v8Anm5HVSMbXPXvzXFDkA10PhDxbqHg7VBd2Lq6Ovlz2s3zQ3MZ4KSL0YEE9elCpKn71Pf8yJUlT1pL/gm38MXWRvFNqwLm40C7CRAE73UK44HptLfhXL2N5c6ddw3dnPJa3MLiSKaJirow5BBHQ17d8JPBmk+LvEF3qvhqV7ZW0++ivNGkYNNaF4GCGI/8tELHHqM4NcJpvwvnsrEah4ruj4X0wZCrcx5u5yP4Y4OGP+8cKPWsY14Oc1LrbQ5o1Yc0lL7joNf8PQfFfQV8VeGrP/ioIdsOt6Narud3JAW6iQDlXP3h2NZw8MaF8PwJfFZOqa2OU0CzlGyI9vtMq/d/3F59SKm0D4vyeAru3XwjpVvp1ujj7TNdDzbi/T+7K/8AChHVU4HqaqfEbwvpr2Fl4v8ADUUq+HtUdlltnO5tPuerQMeeMHKk9QcVjCM4S9lJ2i9u/wA+xjFTTUZaR6HQ+J/H2s3vwW0+0Lx6fp2o6pOqWFjH5cEdvEqfuwOpBdy2TnJ6mvKVYEV2Hj/Nh4d8E6XtC+XpZvHHGS08rvz/AMBC/pXFq3FengqcY0211bNqEIxg0tmWN+ORXosks3ww8JRwKqweJtei8ySQ/wCts7I/dQd1eXqe+3A71Q8DaNY6RpUvjLXoBPptpKI7CwkHGo3I52H/AKZpwWP4d65bXdbvfEesXep6hM095dOZJHY9z2A7AdAOwq2/rE+T7Md/Py+XUHepLlWy/EYsz+b5m9hJnO/cd2fr1r134WeNNd0vwf471E6vetDZ6YsFvHJMzIk00gQEAk4OAcHH1rxhX5r0aB/7I+Adw5+/rmuJGuepjgjyT/304pY2MZwjC27S/X8iK0YtKKW+hnw/Em7Lh77R9F1luQTeWKqzZ9Wj2n8eT6V6H478aeAvFvgvwlLceHb/AE7ykks/O02SMNCYwvyYfO9fnBGSD79a8I3+h5r1bQvh7LdfCe+u/ELv4dsLbUIb2G6uIWd5InQo2yIfNywTBOAT34rmxdHD03Cd7O/Q560KcOWV7Mw28L+ENVB/srxkbWY/ch1myeHJ9PMjLD17V3/w9+D3ijwvqtyNUnsJvD88CyXmnRuLp9Qh52qkAw27klWIBHX2rz638faT4PSQeFdHAvs/JrerYluU944x8kZ9/mPvXFX+s32qahJfXd5PdXsh3NcSyEyE+uah0q9ZOKdo+e/yKdKrUTSdk+5618S4ZfhTcWMfhrw+2iWVxGJrfXL2PzL2TI+ZCXGImU8FQAeM1xnh34m65pFzdG4uv7asb1997p+qZnguT6sDznj7w5FbHw3+MuqeGXl03Vb66vdDvAI3Erec9pz/AKyIPkcd1PBHHFavi7XhomqC117w14f120uEFxaarYwtZtdQt0dWjIHsQQcHIrBKVP8Ac1YX877/AHkwjKn+7nG773O/0+3k8V6LovjL4ZC40/VvD4Npc6PNJulaJiXWND/y0QAvgHnHTkV6xba14Z8As/jZNKuodK8T20SXMdnbArBcoW3B1JG0neR9VPrXhPwp1Lw/fyatpdpa6rokt5F9oie0uhP5ckGZVKbgpD7Qw5PQnNfTXw08caJ4w0v+wdVvIdViugUzPZmCWYt3dRlC3+0COea+Zx8JUZW5Xyr77BToxcuRvc8d8R6X8GNcvLnVNR1HxJqF7M2+Qvu3N7DKgAdsdq5PxJ8Z7Dwfay2Xw28N2/hlHGyXU5ow91IB0xnOD9Sa+lNb/ZP0iaxlax1CeCUZK/aFDRgenABx71434p+BvgjQw39ueP4Ldz/yzs4RIw9RgEn9K0w2LwNXeUpW6M6auErYdr28bL8z5f8AEWteJfH2qQx6hf6hrt652QxSO0rEnoFX39hXITRtG7KwKsp2lSMEH0Ir7S8BJ8Lvh+V8QaXZ6nc3OZI7XUdUUBpAqFpXiXjaFVcFsDk4BrxH9rLw7Z6J8UTd6fALe21azjvsKu0M7ZDNj1OAT7mvdw+LjOr7KEOVNehNDEr2vsVGyPD2GGOajc5NSydTUJ616LZ7Q1zgYqM/d/GnyHJqNj0qSkMcjpULcKfrUj/epj/drFs0IyeKZ0Q05ulMY4Wsm7FpaCKRk09W5zUOcU8N6VHqB9XfBC4tvFPwajtr7VH09dEu5VeUlSnkt8wSQNwUO49fTgirviHUINM8It/wj2nTaVrWlyM8SyASypaM5LPA/IMecH5SSucZryb9nPxLp8Opa34W1e4S20/xDaG2V3IAEoBCj0yQxHPcYq3p3ibxV+z14tXSNU3XWkbj+6ky0U0ROC8RPQ46gd+CKuNtj5+dGUa8op+aR0PgLUtV8Z+KrKwt53utQvJRulmcscDlnYnnAAOa6/8AaU+JMGufEO6SzvPtMFnBHallOVDrncB+P65qfwOfDv8AwuVbvR520rU3hleTTHT91cxPFuWWBsY5ypI7c+lfMmp6rNHe3Mcr5lSV1fJydwJzn8avli66qbcq0+ZpSiql4W8y5repiaQksa46/n3k1Yu9QMmcnNZE827NFardHsUqfKV5nyaqSMSeKlc8moGPBNeVJ6noJDM4qOQ7iKe3SmN1rFuxY1+vrXr3wrvtL8b+Drr4f6pO1pcyzG506c4IDjB2j8QTjuCa8gJya7f4IwPP8VPD+xC+yZnbHQLsbJP0z+tdOElaql0ehzYuKlRb6rVHb/A7wlqHhPxd4jvtRiQWGlwTWk9wWHlvICDtBPXgfqBVvxb4ZTxx4TGqfD+WMaWwD3uh2yhJN+c5YDkkeh47ioviXrFxrXwv1V45GiS08RzwXMcRwsiFmI3eoyRxXlXgPxhdeB/Etnqts74jcedGp4ljPDKfXg/oK9GpVp0rYd/D3POp06la+IT95Fe2BjkKOCjKcFWGCDnpXsvw5un8PeCdd1eKRoLu5lg062lRtrrz5khU9Rwij8aq+Pvho3iiWTxf4LK6xpt85kltLfmWKT+LC9+eSOoJPbmtu+0e0+H3gfwyviYPI3mTXQ0mA4M8zYwJJP4VCBc45OSKIUnTl72q/BoVatGrBJPV9OqPtr9kXx0mreFZZ/EcyPq9xcGC2vLoIst3Gq52q33n2nd69a8j/bt8SeH9V1vS7KxME2q2ayC7kiOTGpxtjb3zk47Vx/w1svEl/wCING8ceJbyz8M6JYbXtoJGEYWEDAREPCqQep5P1rxD4u+PYfFXjzxBqVq++2ubyR4mz1XPB/H+teXSwNOljnir6NbefYVOrOpBUex55rTDe1cpdsMmtnUrzeT61g3LjmoxM1J3R7dGNkUZfvVXfpU8pxmur8CfDG/8cSGYt9h0xchryQcFuyqO5ziuGlRqYifJTV2dU6kaS5ps9A8EeH7fxv8ADjw/aX8bXkNtfyB/nw0cfzYGRyBnbVfRfBnhnWdcY+GNRvtJ1DS7gGaFwWDBWxkZ9cY6/hXna6jrvwy8Sz2C3slo8EoWVYm3xuvHO08HKn619FWt5eXsk93YQ2MumT2qzWkiEq8kvORIR29x0r7LBOliI8k4WlGyffTY8Cup0neMtJartr3PG/ir4M1TXPHd1LpGlzTwyRxl5Y0whfGDknjPAzXl+pWFxpd3LaXcLwXMTbXjcYINfRfh7/hJPEfh1rXVLm403U7bUPLllhwG8oDdg9jwQM15L8WfFtv4p14rb2SwizLQm5b/AFk2D1b24yK8XNMJRjF4lNpt7HoYOtNtUd0kcNTW606mt1r5Q9kZRRRUspDX4FR1JL1qOkxhSN1paRutSNDW6U2nPwcU2oYxlI3WlpG61JSEHemHrTicU2oGB6Uwd6eelMHegBG6UlObjFNqCxlFFFADKKKKUtihG6UlK3SkrMBG6U2nN0ptJgFNbrTvSmt1qRoSiiigobRRRQAUq0lOTvQAUUUUAKn3adTU+7TqaIENPHSm05elUAHpTx0FNpV6UALTk+9Tacn3q0jsAtOX0ptKpw1MkdSr0pKVelADl606mjrTjVkCr1p1NHWnGmgBe9SJ96mL1pynDVaJHU5elNpy9KYhwwQRXZeBvGsejpJpeqxrc6Jc8SKwyYyf4hXGr1p2a6aNWVCanHp+PqZVaaqRcWewWvgu48O6df3/AIbvheicxyWyNyuwNk5PQnt+FXU1DSvEsLxeKtKtba/jTAmE6oWHsSQQfbJrynSPF+s6DEIrDUJreEEkRA5UE9eDXUWvxavLi3aDWtMstagx/wAtU2sD9QP6V9FRxtDlUbW8nrH7jzJ4eone9/zR2Nh8O/B01pFcXaT6ckxxELm9UGQeowTVbWfA3gnTbkWd3dXuhzkCSOaRvNSVO5UjP9CK8+8aeLl8WR2Eaaemnw2cTRRxRuWUA4xjgY6V1HxQtZX0nwrfoFe0awSDzAwPzgZI/KtZYig4TdOmvdS+fcz9lUTipSet/kbfjK90m+8H6fZeHJpJtK0m5Mcxk6u7rlZD7Z3jNbvw8H/CEaX/AMJHcRR/2ldxmLSYpOWXOQ9xj2HCn1PtXEfCm0XULjVLe8hEulTQhJVLbd8gIaNFP94kEfjU8Wtah4x8TxqF/wBJnkW2gt14WJRwqr6Af4mohPmcaklv0MqkNHT6dfM/Wv4X3uga38MtLuorqK/tGsUV5Xwd22MBg/vwQQe9fnj8XPBul3HirVpPC2q6Re6a9zI1tBFdBHRCxwuHC5x7Gs3VPi5ceFtf0yy0C9lXS/D7LHGqylUuZFYGV3A4O5sj6AVh/GaO0XVoNb0lCmha5Gby2B5ETE/vYj7q2R9MVFGisPKc+Zu/TsebQpOM0lpc4fxD4S1vQiXudOurdeolQFkP0Zcg/nWFa+JtYsCDb6rew4bPyTsMH86tw+JdS0w5s9RubZc/cilYL+WcV0vhfWl1P/iY+Krexn0aFsfaJrYCaV+yoVA3nuc8YqYv2krQlY9htwjzSjco6F4z8Zaiku3xBd2+nw83F5O25IlPHJIzn2HNdF4X+IHh6WG78LapBM3h65OBf3EjNKZP+ej/AN0ZHGOmBnNReLj4c8Q6PHLpcl3baPak74rFFKwuSfmkhODzjhs/lXFJ4Tt7wZ03XNPuj2inY27/APj3H5Gu72uIw7ShLn76t3MFTp1ldrlLHjjwJfeCtQEcqmbTpiWtLxeUmTqDn1x1H4iuejj9a9k8Eandx6UfCvjXTJ59Bmwlvf7fMFu3b5xnjOMHt9K43x38PbzwDrP2WY/aLOUF7a6UcSL6H0I7/nWGIwkUva0fh6rsa0qzUvZVN+j7nMxRbqsraEjgVcsbIyAccVvW2iOyZ2k/hWNLDuSukXKry6nKtb4HSo2irq7nRmjU/KfyrEurYpniqnRcVqEavMjM6UVLImDUZGK5WrGoJ92pF9KjXjipE+9TQCryoqQdKYvHFPXpWxBKvWnKe1MHWn9CDVIklVgABTqiHUVKK0TEyRPu09PvUxPu04HBzWiM2PTpipF6VGvWpE5OK0TJeo8EEA1s+F/FWp+DdcttX0i5a1vbc5Vx0Yd1Ydwe4rFX09KeORVpmMo3Ti1ufY/iGGDxT8JV1fw3aR22p+IY2kWzWVUQ3EihJioJA3YD8DknNfNkvwp8WxA/8SK4lZeGSArIy/UKSR+Neh/CDxtoXi/wpH8OPF2LWHzC+k6or7WglYkgbv4TknB6HODVHxsL7wTrx0Dx9bT6j5S5sdesH8q68roGDdJAO6vyOQDW0Z3ST6Hz2HVTDzlSS631MnSNG1XXfC1x4W1DS7yHUrIte6S08DRknrLBkjoyjcB6g+tdHYeMNV+Bvw/sdP064Fv4m11/7QuUmQP9kt8YiG08Bn+99MVofDLTtXh8RWupW3jS51fwdYI93etBct5sSRqXEckLHKljhcjI5Na+u+Jl8Vx2/jnWItNt/C92gWW1vNNSa5EyHAhhbAJDAAhicAZ9KUvekl0Iq1FKfJJJx7efY4fQLTR/iXBczanon9gG3ANxr+nsIrVDzzLG/GSeyEHnpWhcaZcWOhyaT8Opk1q2lizqeo2hAvLgnPyCM4dIwOyg57ntWPq3xV0bXrOLTbvwlFBpFtIzW1tp99JAEy2csvKs2OM4qLQdL8L+INRQaJB4rsL1DuQ2kcd3sOeoK7COM8/rWzXc3amvelouz2Rw0sMlvO0U0bRSqcMki7WB9wacCAB0Ar6Fm0rRbe5srPx14u0bWbBj8630LR6nAo6DzIyT6ZDk11WsfCTQ9W09tY+F2h6Hrko+VjcTPNGhH/PNCdm7H9+odeMLKRMsxhCykt+vQ+cvD/gjXvEcTSadpVzcQJy1xt2RKPd2wv5mu+8H/BeHUbaa+1fXrW2sbd9lwbFhKIzjo0pIiX6Asfauk1zwX4k0XS4tR8d2mt+I5UUNFotjE62Nvxx5zoNoA/uoO3Jrz7VvE+oeL5YFn8q2sbcbbbT7RPLt4B6Knr7nJ96pVHWbUJaEe1nV+CWndHuHww1rwD4S+Jeg6V4Q0yfUru5lNvLrd3IxI3KfliXgcnAJwBWR8UfFj6zfJ4mm8OaPremXj+TILu3YT2U6jDwPIjAnp8p7iud+DunyW3xE8M3EQAddQh6jjBYA/oTXZWmnQeHPFniLTNRjkufD2oXMttdofvACQ7Jl/wBpCc/TI7159WlGFe6u9E/xOXkhGfPe7PL5NR8EXx/0vwrqGnEjltN1LcBx1Cyqe/OM/jXUfD/XPA2jy3emT63qjeHdWTyL3SdSstylsApIkkbcOp6Nt/Cud8aeCrrwprN1p9ymJIW+V8cSIeVcexBB/GsrwVoo1bx3oFoybkkvot4wCNoYFuvsDXfUo06tFyUnY3lFTg1zM7r48fDGfTPFNrPHq2lLp8trFbaek0/lM0cMaxkMSoQHcGJGeK5/wV+z34r8bXkiWi2UdlE6pLei8jlQAnnbsJ3HHOOKv6H4zi8b6prng/XJl/szXNQln069lO46fds5KMuB91yQrD6Gq/i++1D4K2L+C9KvJbHW5MTa5e2rFfNYr8kEZwDsVWJJ4yTXPTniIRVBP3ul+3V/Ixi60Y+xi1zdPQzfinDrMmqRWbaPqOnaHpcf2TT4Z7V41EanBkOQMs7ZYn3FcCHwcd/TvW5pfxF8T6NF5Vl4i1K2ixjYLliuM/3ScV6B4W8Q+LPFUDXusQaBLoikebqniGwiWMY5wrgK7nrwuTzXoKdTDQs0tPN3Om86MdbNHkof149zXtninwPdyfDb4c2t3d2ehaWLWe9uLvUJtgEk0mdojGXZtir90VH/AMLE+Hmg67anRfBkep3gzE2oRs1vGHbjdDC5kAPPBb8qtfHO68Ha38R7y11bVtds7/T4YLGScW8dzE5RBk/eU5Ock4GSOlcdWvVq1YRUXG2v6HPKpUnOK5WjjR400LwLI0fhOwXUdQT5f7e1SMOQe7QQnKp7Fsn6VJ4E13UPGet+ItP1W9uNRu9b0qeFJJ5CzPNHiaPr7pwKzv8AhAtDv5Aum+O9Ik3YITUIprRunT5lI7etb/gD4X+KdL8ceHtQsIbDVYYryJmm06/hnTYSN2cNnG0nt2rap7FU27+93e5cnSUG+vnueVs5I5pMiu0+KHwy1rwB4p1G0utPn+xiVpLe6jQvE8RYlfmAxnB5Bx0riGYKxU8MOoPWvUpV4VYKUWdtOpGpFSix9d/4N1rT9b0hvC+v3Bt4S5l0zUWbIsZiOVbP/LJ+M+h5rgLK2n1G7itbSCW6uZW2xwwoXdz6ADrXqNn4E0T4cxR3fxBmkl1FwHg8MWEg85h/08OOIhz9371cmLqU+XkfxdEKra1n8R0/w08A+LPD/jWzuptHntLfTpVmubu4IjthD0Y+aflKlSehOa+gfB1n4f8ABXiiezsCdTvbc/apb+4Xba2VufmVh/eO1lwc8mvEZ/jLdfGvQF8Hmyi0W7i2vpkNrIxiuSinEEm491+76sB611+uS3sej+EPDlvcQyXc9xHpeszwZL+dGFKxMe4RHPsSPavlcXCtXfLW0bW3l59zhjOcZJy+JH0p4k+MOnlhpazJbLdQAG6Y48ouvykj8Rn618ueK/D1tZane33idZLHTLCTY8IXEl3IBkRRZ4wRyW6AH1NU7fxJ/bnjLVNauLlYNA02886a4kUlWRXwkaj+JmAAA9Oazfjl8TV+MOiwa7Y20lrFo8htri3Zw5VJMGOTjjllIPodvrUYPB/VZxhS2ktX2N61eri5KVd7behzcmqan45tfFGqC2864nhi0PSdPtx8iNK4/dRqMY2ohJPvk0ftYI0I8B2t6Yl1y30YRX0SSh2Qjbjcc9/mr0L4YRt4B+DF/wCKnija6srKbUIBKAy+fKdkZwe4RQP+2lfJWu61e+ItUutS1K6kvL65cyTTynLMx/p7dhx2r1KUfa1+aGkYaGWHj7avzJ6R/EzJjzUJOBT5Gy30qN/u16zPeIzy2aa3rTicUxz8tZstIjY5OaYzAjFOPSoj1rNmiGse1Mc4FP6nNRvzxWUtyhjelIGAoY55pmc1kUSbz1BwRyMGvbvHGvX/AIo/Zz8LXuoyNfX0WpyW4nZN0mxQ4UE9+AP0rwsNivSvBP7QGu+AvDkGiWNjp1xaQyPIrXMTs+WOT0YD9KqMktGceKpTlyyirtM9r8P6boXw58PeDvFfiW+uLXU9PsXjSKVQJJ/MBIhC9SV38frXI6/8J/BNnHZQa34mn0HxPqaG7MU214laRzhSAOOWx19a8Y8Y+PNW+IXiFdT1acSS5VI4UyI4Vz91Fzx/Ouj/AGkLh5fitqiu5fZDbqoPOB5SnA/M/nWzqJ62OCOHnGpFSlZu7fkc74/8Fal8PtffTNSCM23zIZomyksZ4DD06d65SWTNet/tJsRr3hkHhhodvkHqOvWvG3JINcVVpSaPZws3VpKTCRs1E/TFPbpTG61zNnchr/epjdacxzzTM5rJ7jGV7H8BLZ7DRfGGvWtu11qlnaiK1iRdxJYMeAOScqPyrxwVt+GvHeu+DlnXRtQeyWdlaRVVWDkZxnIPrW+HqQpVFKZhiac6tJxgehfD+CHxZ4K13wLe3D6Z4imu/tsAvFKCRwAdpzzngnn1rynVNLu9E1G40++ha3u7diksTdVP+Fe14g+Nmlwa9phjsfHWk7Hkt1baLpVIII79sA9s4PFU/HOg2fxc0eXxVoEbx+ILUCPUtK6yfLxkDrkY69x7ivQrYd1qd4u7W3mv8zz6Nb2U7SVk9/J/5HmfhrxhrPhK5M2kajcWTk5YROQr/wC8Oh/KvoXWPiD4D1vVdP8AEWra+dSGn2weDQliO3zyAWPTk5AGDxx+FfLbMY5GVgVZSQysOQR60ed6HH0rgpYuVBOD1O2thIV2p7PyPRPiD8VdT+ImuPf3z+XCPlgtFJ2QqOgx3Pqa5KfUS4rI87PXmkMhI46Vi67kdEKMIRUUiSecueetVJcsM1IaY3pXHKV3Y64xsO0i2hvdbsLe4OLeW4jjkOcYUsAee1fQ+taLq83izTYxbw6b4I0j99uimUK5RcgsB2Bxx7Zrw/RPh/4g8S2ZvNL0q4vLYMUMkYG3I6jJPuKra9pXiDws62eqJe2HmoSIpHIVweD3wfevWwteWEpylKDs+pwVqaxE1FSV9rEHjrX18UeLNT1ONdkU8vyL32gAD8SBn8a9A+Ceom906/0S7e8W3eWN4Jo1by0I5K7h90nA+teSuoHQY4r1f4WeI9K0jwbf2lz4hGiXtxclg6rl1UBRkZGOajLa0pYz2kpWvdsrFU0qHJFXOp1O+ubTWtW1rW9Rn0vw7DMI7azUbHu2VQCfUjI4H9K4fxodJ+I3hqfxJpy/Y9UsBi6tu7xk4BP6c/hVH4v2WoQXml3U2sT63ptzBvtrmUAAHPIAAA/r+VU/BETjwb41l2Hyvsca7scZ35x/KuqviXWqyw7j7tm/P7+xjTpKEFWvrdLTQ4cd6YetPHGajY4BNfIs90ZTijqMsjKPUjH+etXNEe3j1mxe7fy7VZkaVsE4UEE8D6V7H488QaZrfgfV3sr+0uUbytkUShZE+dc55z+ld1DCxrU51HNLl6dzmqVvZyUeW9/wPDJDk0ynNzyKbjHWvLsdgU09aeKYeppDQ1zlqSg/eoqGUhlI3Wlpuck1IMRulNpzdKbU7lDWIAzkCkFexeG5tIXw9YLu09Ua2zKshUSGSvHmILNjpk9K6q+HVKMZKV7mNOrztq1rCP2ptK/3jSVwnSMooooAZR1/x9aVdu9NwJXcMgdxmvXbrTNMFhcolnYCBbclJPlLlsd+P1zXRQoe2Td7WM51ORrS9zx9uoopOpzS1xvdo2Eb0ptOf71NqWAelNbrTvSmt1qSkJRRRQMbRRRQAUqfepKVPvCgBaKKKAFXrTqavWnUEBTl6U2nL0qkAtKvSkpV6UwFoH3s0UVpHYB9A+9miimSPpV6UlOXnNAAe1PHSmU4dKsgXODTyc4plOHSgBy9aWkXrS1YD6cvpTaVThqpEj160tNHUU88GqTExKkj6e9R1JF1qkrkjh7V6Rc6fPqvwv8AClpbrvlkvJlUHoOWyT7Ac1wOl6Zc6zqEFlaR+bcTMFVe31PoPevV/Eeo2Xgjwda6LAw1V4ZTBcMHMZUsC5AK5xnOMele1gIpQqSnpG1vU8/FSvKKjucPquurYz2tlpc7fY9PcOkg482YHLSH15GB7Cu01C3uPDi6j4ggtWj/ALTRFsSFO6IyLulYehAyo/3q5fw/qP23z5Y9O0/S9Ptl3z3Yt/NdeDgAuTlj2H41r3nxgutUX7HOkllYK2Eksn2TxgcA5+6TjqvArppSpKLc5b7GM4zbSjH11Oft4NQuEJitLmUDrsiY/wAhXfeDbLUvEXh3UfDOoWd3HbyA3GnXM0LBILhQcrkjgOOD+Fchrl5rsFst1Brl3qWlOfkuY5n+U+jrn5W+vHvR4UuL69vG1K81K7jsNMxcSSGYlt2fkRcnG5iBRSlGNVJ3sTVg5QbVjes/hre6R513rdukhgIMVilwi+c3X5mJ+VPfqayda0m+1a7X+0dX0ixjQ7YrdLgFIV6kKqA4qX4iPJ4kjsPFSE+RqCmCSHORbypwU+hHzDPrXGLHknPeqrShTfJGOn5jpRnP3pPX8jpdNtdM0O4W5TxPiUDkWdo77h6HdgEeoNbkdj4Q8WXsv2RbqG/2DFohS3juWA+YpncFJ/u/rXBLGSQAMknGAK6VfCdvolul34hne0kcBodOgINw49W/55j3PPtSoVW9ORcoVI8v2tTo/C13Nb3k1tpmgT2IhBFxPfX8yRwjPJfbtGPavRtG+MHh7UL2z8O6zp0GuaYSkf210xHHIcAFVfJ29PmzmvOdZ+I1n49tbTS9Xt5NItYcBLq2lMgU4wDIpxuHHbnmsV/BmrWmq29jFbNfvcfNbSWYMiTqT95SP69K9FYidP3aD5ovc4J0IT1qqz/rqfROn+OPh7o2sXGnX/wwiW4t3Mci+YuMg9c46Hg19M/Bz9n/AOGXxh00eJrHRbqzgDNDLprylIlkABJwDnoexx7V8qf2VpGnaXa614rf+0PEGmxRwXml6bdKTJziF55B9zAG1sZPSvcPhV+0vqPhPwfrOvR2Njpug2rRWOm6LbRbYnmdtzMX+8xCAknvkVy45V50/wBw7T7nn0lCM1zXaOI/aq+COl/CnxFappQcaffRM6RSvuaNlIDDPXHI6/nXy5q0IR3AAHNfVX7Y+uXOqeL9N1lrprrTNRsUa0IHyRgD5lH1yG/GvlLVbkSuxHeumEpPCw9s7ztqduGfM7x2MGYYaoH657VPOQTVdueK8qW56y2BetOpo60/FJAPXrT19KaEOakVCOa2IBOlPXpSKhzTgMVSJY8dalHSoh0zT1Yk4qluJkinBqSoh1qQdK1IH9Rmng8VGp7U9elWiSQHBp4PFRKcjNSDmrRD3JEO3HrmvoP4OePtM+I66f4C8dWD66Xl/wCJfqMj/vIsDPls2d2DtxkE9cGvnvOMVZtLqazuIbi3leCeJg8csbFWRh0II6GrscWIw8a8HF79GfoXqXgXStH0C9j8PWGmaHeMi+VNs8iMupyglZMFkz1BPNef6X8MfE2uWN1Z+NY9GubC5t/I+32F55eAD+7YxFdmVPIK4P1r5m8S/GPxl4x0b+y9X12e7sSQWiKou8jpuIAJ/GuUF7ctEIjcTGIYxGZCV46cZpqMl1PBo5XXhF809WfVlr8Cfh/4LjRb7xNo0+pYx52sTqyhuvEKuoPH941Tv/BfhZIZH1T4yWkGknIksNDjjt1YdcBIyQfxBr5dU4bOBk9SalB6H+VU6c5faOtYGpvKq7+h76nj34PeAIj/AMI54VufFmo4KfatZ4h+uD/RRXP63+0p461eSNbLUk8P2cZJitNIiWFEB7ZwSfxryYHBqZD0NaRw8E7vU0jgaUXefvPuz1jw/wDtDfELS9Rhuv8AhJbq9Ctk295iSJx3DD0PtzXt2rfDSD466dpfjLwLa2cF1Mq2+q6Wu2HyZxkl/T/EYNfJFrLjbxXeeDvF2q+HUuI9O1K6sI7kATLbSsgkA6ZwairhW7VKD5ZIyq0YrWKt6H2D8Nv2YtQ07W9Om1C+s5reKQSTG0cs8bLyF5Hcj2r0T4tfBzS4dPvNZtRsneTzJoyAVYk844457e9eR/s4eJNN8Kg6xq95qqTyg7LSG0mkjZT0dmC4Ynt6etexfFL4uvaeGtL1XTVtb/QLzKlpU3B25+Vgeg4P4ivi8RUxjx8UpXt8k/I6oxwbwdT2sfe6dWfO2taQnjfSpNCbB16wRn02ZvvXEYHzW5Pcjqv4ivI/ASLY+KrzUWBX+zNOu7vk7driNlXr0O5x+OK9S1bxP4O8Q6mtw91feDdQjcvHc2wN1bhxypxkOnPYZFdLZfCq08RPr3iEX+mzWGp2XlXkmlzgxOyyB5WU4+QSKgyOq5brxX0nt/YJ05JpPv0fW3Ro8Ln9lD3nc+ddCtl8B+Fj4ouWMetX4aHRYT9+MdJLojsAMqp9ST2rsPCegaj8fvBLWWpxNDr+mlV0zxFeDbHeISAbaWTGXYZypGTXO+N/Gnh1fFDanAg8U3kSiOGOaMxadaoowkccf3pFX/a2gnPBrjNf8fa/4jv4bq+1OZpLdg1usR8uO3IOR5aLhVx2wK71CpWipR0ff9DqVOpUimtG+p0Ums+Gfh+8tnpmkjxBrsJMc2pazF+4jcEgiO3PXnPMmenSuV1zxLqnie4SbVL2W8ZBtjRzhI1/uqo4UewAr0PXtLt/i94cu/FelRCHxPp8atrempz9pXH/AB9xjqcnG8Y6815tHaFgMciuzC8s9be8t79DejGDV5fEjo/hLo39ufEvw1ZsoaNr6N3HP3UO9unsprJ8Y6yfEXi3WtUZgxu7yWbIOeGckfpiuu+Edq9j4mutWBKjS9Nu7s7epPlMige+5xXCSWxXg8nufWqjaWJk+yX5lKzqORR6VLp+p3Wj38N9YXElnewNviuITtdG9Qexpjxstbvgz4e6549vJItJtA8MXNxeTt5dvbr/AHpJDwPp1rqrSgoN1NvM1k42fOdn8UviF4jkvtG1a31/UYbfWNJt53jiu3VfMUeXJwGwDuUn/gR9a0fB1j4p1PTk1/xTqlho/hlPmF9r9hFPJPx0hjZd0hxjvjPrWhqWoeGfA/gHSL2wNr461bQbt7IXdwrCytnlHmghP+WwBDAE4GexrxvxR4y1jxpqTX+tX8t9c/w7yNsY7BVHCj2ArxqUZVYckFZd+vyRxU4+0jyxVkup6pd/H/R9GvLq38MeDbCysZU8t79M219OeMuHjx5WcfdXpnrXHya14E1mSWW90/X9MuJCWaWC8ju1LEjkiQBvXv8AnXAEk11HgTwrBr91d32qTNaaBpkXn31wv3iP4Yk9Xc8D8T2rreGpUI80b39TX2NOl7x6X4Z8OeGPCmljxHD4qazvL+OSHRZNWsmiMb7trT/IW4CkhW4+YZ7V7B8JrZvGXh7V4m1HR7zX0RQuq2M5kV32OizOmAVlCswLY+bC+lfJPjHxfceLtaa9kiW1gjRYLWzj+5bQqPlRR7Dqe5rq9H8Uah8N/h5pl7pN5JY6rrGotcM8TbSYIPlVSB1VnZsg8Haa4a+HlUjzN+8znq4efKtfebOr8cafcXbf2VB4i8PaToNg3lW1p/aSkysvBmlWMNmRiCSW6ZAFXfgx4FtdV8cnS4PFml6nb3Nu8d9p9vFM63EGBvG4qAMEghs8EV5p4y8Ptqt1Ya5oFtNe2Wuszpb28JdoLnOZYMDPQnI9QRXqngPQbn9nHwfrfizxQUsPEGqWZs9H01WDT5PJZh/Dg7SfQA57VFV8tLkT95iqP93yxl7z0XqZ37Q3xpsdUsV8B+FEWPw9p7LHcXCn/j5aPAVR/sgr17n26/PUsnqc0SzMzFmbc5OST3NQsS3Wu6jSVGHLE9bD0IUKfLFCHpUZ605mIOKZWjZ1oQniopDkcU89KjPWobNENLAcVGTzSsctTG61k3oUhrHHWoz606Q5NMY9qzbuaFrR9OOr6vY2KypAbqdIRLIcKm5gMn6ZzX0n4f8A2ePAei+Ih4c1vWLnWtdniMsduitAscY6sMdfxJ+lfLxY/wD6q9p0X9qPU7G2006loNlrOqWEbRRanLIySlTwc4HcYz64qU0nqeZjadedvYvQ8e1u1jsNYv7WLPlQXEkaFjk7VcgZ/CqDdatajeNqWoXV4yeWbiV5to5ALMTjP41UPNYvc9ZJqKUtxCxQgg4IORXtKfHvw5qsllqPiHwPb6jr9soH22N1USMBgEgjn6HOO1eKSHJplEakoJ2IrYenXSU1sbfjrxrqPj7xBNq2puDK3yRxJ9yGPsi+38651+mKkf71Rt1rncnJts6IRUIqMVohrHJ4ph60pOKaemazNEyNulNJ4xTm6UxutQ9xnb/B3whYeOPF7aXqYl+zm1kcGF9rBhjBBro/FX7OWrWJml0C9g1uBDkwbgk6g9AR0PHuPxrB+CXiew8K+P7e71KXyLeWJ4PNIyqs2MFvbNe0+MLZPC+lFdHsHv8AXbdRLbyNKyyzQhskh1wXCg/d9Mdq9/CYajiMO+dartueHicRVpYlKL0slrsz558O3esfD3xnYTtBNp19FMqtFcIV3KxAYEHqCDXVfFnUL3wD8W7290R20yWRY5/3Z+Vyy5fcvQgtnI9c13mtSXXxY8C3VlfW8MXiq1t01O3ihXDKpJwnPPIXn/eFcl8YdObxpoGleMdNIuI4LZLTUYwMSwSA/wAS9Rgkjn29aznh5UKLVJ36ry7mkK0a1WLqLyf6EHxFtLTxx4B0/wAb2dtBa36P9n1OOBQoLZxuI9Qf0Yc15ASQa9b+Cjrrui+K/CkwBjvbQzxZ7SDj/wCJP4V5IVKEqeGHBB9a87GfvFGuuqs/VHo4b3XKk+j09GKpJPNOAyaYvr61PGmea81HaTWFk+oXsFshCtPIsQJ6ZY4H86+pbj9l3w3JobW0P2mPUhHxeNKWG/1K9MZ7elcH4B+H/hnw54T03xt4supLqK4d/sWlW64Mro3G4555GcdK92+G+teJPi5oWtiS3h8L2bxhLLUIkLP1O8jcQDhR94dM17+Ep0qMW6sbtnzmOxNSTTouyWl/M8u8aeFp/CXhjQtE0xdXmexwl0dEmEbea4zuc7eQecemRWFejTta8Ga7oV9PPqupadZSXwe5lWaS0ZcYXzVGCc9QM+ma6Pwv4hitl1HwTpMDRQags0EWrXU2+aWcoVVj2CsQAADxkVz2qaTH8Nvgdb3lrppk1LxEZbW9vJRnyFDEbMds46euTzXTUqcvTSxnTvdRnvdNeZ86MmOfaq7jDZrTniC59KoSDJIr42SaZ9dFXOw8K+P7HStBfR9b0r+2rNZfNgR2AEXByBkcfhUHiv4kPrFidL0myi0XRiPmt4gN0n+8QOlcc5wTUec5roljazh7K+hmsPT5ue2ojdKYwyK17Xwvq9/avcW+mXUsCDcZFiOMevv+FZYXjnIrhlTlD4lY6VJN2QwJ6Uhj5561MIzmpBCSajlfQd11KuwUMo21dW2LDpTZLYilyBzIo7RzioiMGrToRUDrjmsmrFpkNB+7RSMcLWbLQ09DTBTz0pnSpHYG6U2nPwcU2oGNYA845pKc3Sm0PUashtHbNFIxwtQUNo7ZooP3aAGUUUVHM1sx2Q0/eJ7UUUVIxrnLUlB5OaKTAM4pmcmnGmjvUlIKKKKBjaKKKACiiigB1FFFACqOacKavWnetAmFOX0ptOT71UiRaVT2pKB96mA6iiirTsA+iiiqJH0qfepByM0A4OaAHU5elNpy9KsgWnL0ptOXpQAdx9afTKeOlWA/tmgfezSKcrS00Sx4p57UynA5FWIKegLEKASxOAB1NMrsfhZpUGoeJvtF0A1vYxNdMp7len5HmuihT9rUUL7mNSXJFyOks0i+FXhhriba3iXUUxFG3JgT1/Dr9eK5e2sJ9X8MWsEKl7ie/kkklY8KFjXLMfTnrWf4j1q58XeIJrxlLvPJtiiUZwucKoFdjqupWXh/4dDRok867kkaCWeHhRICrPz3xkL6HFe1GUJ3itIRX3+fzOBxcUm/iZyOuahCIYdM0+Uvp1uc78Y8+Qj5nPt2HtWSOlMB5p69K8aVR1Hdncko6Gx4b1C+stSjjsMO9wRE1u3zJMCfusvQjmuy1yzsdZtk0jw1PEDBK0kunhiDPJj70bN98DoAefSuc09F8OaIdQkA/tC9VorNG6xxnIeX2z90fnWPbDDptJHOVxwR716cKns6fs5a3/A45Q5pcy0t+J3Xw/dZZL/wrqzG1tdTGxGmXBt7pf8AVufTn5T9arWXw61q61O/sRZGOSwcrdySsEjgwcZdzwB6evFdvoGkadrGl2V143l/syV3UW17E2Lu4QH/AJaJg/KOMSHn616742+G3ir4leHtJvNH0iS4VWdLq30+RZYpiMeVcbxjzNyjGTyCOgNehClCcFzvY8upiuSpZdfuueATtpfg1ANIddV1jHOpsuIYD6QqfvH/AG2/AVxt2JriZ5Z3eWaQ5Z3bczH3PU17VpvwP17VPtbz2n9j6fZErd6jqQMMNuQeQxPVu20ZNZura54c8Bb4PCdr/amqqCr67qEQwvqYYjkL/vNzROknZXskaxrpO0dWzjbD4evaJFdeJr1PD1jIodFmG65m74SMc9O7YFdDY/Fq28OQnR9E06W28PMGWYyTH7ZLuxlxIPuHj7o49a871S9udSvJbq7nkubiUlnllbcxJOe9Ut/r1rL6z7HSirfmzpdFVV+9d/ToeteF47XR9QfULW4bWPDN7Gba/YL+/tkk7yJ2ZWwwbkHb15roPidqw8J6ZoXgu3n81dNR7u7kAIElxKc5+gQKPxNeefCCaSHxnFci4a2tbSGS5uyORJCilihHfJwMe9e0ad4ct/inHpniXXLOTT3si73FozeY1zF99BgfMBzwCM4OBXr4aDxFJyhozya9qNVc2qQ/4WeMG8ceBPEXh/xQgvfDul2v2iG6dj5ts2DhUb6A49OnSvnm4uxKSVJIPIz1xX0rrnimfwvpem3nhjwnC03iJjJc6bMrLJkKMMUXgAjOeAOR61zPjv4VX/xCh03W7Oxt9A1N4jHqFncnykVl6EYB9/wq6+Fm48sd47mOGrxhUcpKyl+B4JI2fpUROTXqV/8As+6vHp08tjqun6tewgO1layZcqc8jPuPxry+W3ltZ3gnjeGVCVeORSGU+hBrw6tCpRtzo9unWhU+FjkUkD61Mic801F5wKtQR5NRBNvQ1bS3GJHkVIsRxV+GzLDpVgaecdK7I0nY5nUsZRjoAxWlLZ7B71VkjK9qlwsUpXKwUinIcNSkZpCMGosMkp8Z5qNTkU5Thq0WpJKOop4OWz2plKvStEybEo608HFRKcjNPByKohq5InSpEYA4NRg4pVPetSCcGnoQDmogc09elax2ETA55qQMMVArY4p6txWiZmTjrUiPtqFW5p4Oa0TJZdglwc11/gTQr/xn4hs9F0xUe+u2KxiV9i5CljknpwDXERsBXV/DzxzcfDzxZp+v2tvFdT2TMyxTEqjZUryR9ac3LlfJuctRScHy7n6D+BdbPwx+EVnH4s1mziOkxta3M8EplRCTiNCQMhhlRjHavIvFd1eaX+z34W0e+WeTXNT1BrnT7GJSzmIknkdejA/8CrzkftDTfE+ax8I3nhrTNO07V9Vt3u3sywZz5qlifUtjBPWu5+NXjW+8VeI9V8PeFpotO8Q6RutGgC7bi7t8KdtvL/Cfm5QYJxwT0r5eGFnTrR51q3d/I8FOpGSjU07nmVxbaJ4VDz+J7n7fqUbYGg2MgyD/ANN5RkKPZcn6V2fgT4u39x4cGnQ3MWhSaxfS2NhHYqI47JkhDRbRg53SMoJJJOa+bZ7mQSOkm4SKxVw+chu4Oec5zmt7W7ifTfC3hMRM8TsJ79HBxyZdqn3/ANUOa+hq0OdJSdzrlQjOKT1Ovl+Img+KrqS08f8AhdINRVmik1jQ1FvcowP/AC0h+45B69DVWb4RJrcoPgzxDp/ipGIIsw/2a9XPrFJjP/ASaxvigiX+qWHiS3RVtdfthdMq9FuB8k6n33jP/AhXK2jlZVZSVZTlWU4Kn1B7UQoyir0pW8uhpGm+Xni9fwO28Pz+IPhh4sgukhuNL1azf5obhCm5f4kZT1VhwfavQPF/gjTtXt4PFfhi2aLRrwhbuyXn+zrk/eiPfaTkqemOKoeEvi9rE1pFpniC1tPF2lJhVg1ZN8kY/wBiUfOv5kV738GtN8M6tqUltoMs9nBqKCG80DVX3xyrg8xyr/EOoyAa4cVXqYX9+42a7bNeZlZymo7Nnk/hHwkbL4e+ONQljYGSC3sIe2XeUMfrwn615nN4cuby7jtrW2luLiUhY4okLMx9ABX6C337PttB4OuNJt71oopLoXMjsgJKgEKODzgd68c8W6Yvgy2nsvDV3o/hkOCs+q3t2sl/IOhC7AxjHsvNcGGzenUnNUtZSenkjaphq+Ft7RdD5+i+HOgeCt9z8QNQaO6jw0fhvTHD3UmeglcfLEPbO6uV8c/E+/8AFNsml2VrF4e8NxH9xo2n5WLj+KQ/8tH46n17V0Ws6H4NtbiaXUvFV9qdwzFn/s6xJ3E5JPmSsOp7461zdxrfgnS5CLTw1f6pgD59U1DywT/uRKP/AEKvchHm/eTvJ/cl6IyhZvmkrkHg6c3vg7xppIVpGNvDfxKqlyHilAPT/ZkbntiuZ07RNQ1ZlSwsLq9ZjgLbwtJ+HAr2j4JfGFdN8axafY+F9F06LU43tVNtG4cOQzIGdmYspbCkcdc15xqfxM8XanJNHca5ewRlmDW1vIYY17Fdq4GK0hKopuKVupVOVRTlHlS66klt8H/GN0seNBniaU7UjuHSJ2PsrMG/Suo8R+F9Ls9G07wzB4u0eyt4P9K1KR5nkM90eDhY1ORGPlAJ9araes3gDwuNYnlZ/E2txMtiZHLPZ2zZDzHPR5OQvtk1wYsM5JBzz1prnrO8nZIfv1JXbSSOgtdG8D6ddwfa9d1DXCJFzb6bYeUsvP3d7sDg9MgZr0/4rah4Y13x1p/hfwv4IfX9T063Notuk0kMMPzbtuxDztySWJHJPWuM+DHw11Pxf480V49Omm06C5Wae4MZ8oBPmwWxjkgDAz1r0Xxv8SdK+BUGo6F4SEOqeNL2RpdW15wrLDIxJZEHqMnA6Dvk8Vw15fvVGF5Sscla7qxUG2/wL/jj4n2n7PfhCz8O6DYaRB43uFWW/FnDugsyR0OWJL4OBknOMnqBXzD4o8X6x4x1J7/W9SuNTu2zh7h87R6KOgHTgVSvrqe/u5rm5me5uJmLySytuZ2PJJPeqT9a6aNBUtXrLqz0sNhY0Fe3vPdiH71MY804nFMbk10nobjc4prEDmgnNNf7tZloYzc0x24px6VGetS2UNbpTScClJzUbntWTdzRDSfmzTWIHNK/BxTG54rJjGnpTCeMd6cTmmN1rNmo1uOKaTgUpOTTX+7UXGhjHJpr/dpTTGYnis2+haGk8UwnCkd6c/BxTG61ncoa3pUbdaeTuNMPWp2KGHlvamnrSk4ptZspDSMt7V7P8J/jDAsNtoPiiUPDAQbG/kPMJAwFZvTHAP4GvFycU08jHvmtcPiZ4WftIGNehDExcJn0L8RNYtfCHxAsr4rPpE8sCmDV4hvhl7GOVf41xg5B3DPfityGAaps8V+G4oLqa6HlappMcoMN8vQsCcDeByMgEjg15p8PPHOm+IdF/wCEJ8XkyafI2LK+dvmtn/hXcegz0P4VBaeCvF/w38ZGysyz6dJ+8e8ZSbV4epd8fdIGT6jtX01PEOq1Ll5oy3tujw5ULe43Zrvszs9O8H6F8PPiDb66mt2+jWE0T/8AEtvj5cqlhyo9VBx/ia+fNSdX1G7ZGDI0zlWHQjccV9Ba8tv8dPA0iaIC+p6XdBY/tL4LoRgtk9mHPPcV4N4k8PXvhXWJ9M1FEju4du9Y33KMgEc/QivKzOKgkqSXJvfzPQwDu25v39rehQJwOO1e/aH4D8GeEbHRbTX9PvvEmv6oguFhsA2EQjIA5UY9zzmvAMZ49a+q7/WBr/gXwvFBbXr2OsRx2815YyBHtdqjduOD8vDZ6dMVllsITU27XXcMwnOHKo7PsXPHuqeDdD8L+GtIGjzyy2xe6tdKkmHlqGJ/1zKSSMk8AnPNeh/ss+CtV+K3jg+Ir3UvJtdJAjNsgGxldWHkqnRU25/TrXktn8I5/iZfS65pWtQ2+jgLb2yXFtIhSOMBcAY5GBkEdSfeu+8AfH/TPgNeTaX4d0K7ukZlN7davI0MtwyjgpGBhBycZzkVrilVlSlGkveZ5UVC3Km33Lv7SXwEj+CmpaVfaVePLa3TPJAXG14JEIO3I7YIwfb8a5qLUoPEmqv4bvYTc+GPF8DXlv5eM2dyFJmUHt86scepHqa2/iP+1nL8Q7mKDVvDOn3uibQjWEpZpAxPLpKMMrduBXpjWGj6FolpZaTbJaWUUYeMD7wyMliTzuOTkmjDKt7KFPEfEt35GWJqeze2+3kfA9n8Lta8RapqkGlRJLa2Fy9vJdXEgjUEEgZ98DPFWP8AhRd+POebXNIjihTe8iTFwo7E8DFetxaJosvgi00+TVGisNX1ieSWdjh7rbI22PdnA3BF5PX6msrVrzxhpl89rpng+xXw/EHi+zLKgMy9Af8A62D71rHA0GlOabv2/wCAepHFVpaRdkjzTSfg3aXmoLHL4psLheWMdkweUgegz+tcZ4+0ux0PxVe2GnIyW1sVjG9txLBRuJP1zXomteOLfwRHcx23g/8A4R3WbmH93IShAGT83515v4avtLOvi+8Q/aLuEMZWRAHaZ+uGJI4zz74ry8SsLFxpUrJt6vXT7z08O6zvOburHu9lqV0P7Kv2u2i0WLSTcXEZUYdsDtjI4Oa+crqRLi+nliUpE8jMik5IBJwK9m1z4q+GtQ0TUFt3vBdT2b20du0OEXPTpx1x+VeNWVpNe3MNvbxtPPIwREQZLE9BSzSpCpyQpPm9O48HBw5pSVhY0JAFaFtaFl+7mvStM+BTBootT8S6Zpt5IFItnOWGe3JGT24qh4h+HeqeBtYNjqcBCkkw3Cg+XMvqp/mO1cscJUi/fRs8VTm+WLOUi0liOFNQXOnMgxtNfSfwE/Zw1H40XV39nuEsNPswvn3TpvO49FVe5OM+1Y3x8/Z81b4OaiqXB/tDTZRuiv4YyF68q4/hP489q1lRpczpp6nJHGRc/Zt6nzhcwbTWdKhGRXR6lBhye1Y00XNeRVhZ2PWg27MzdgFIUBq20XFMMXsK5XFnQnYq7Rg4qIjBq40XFQFCD/jWTTHdEL/eptOf71NqWWMP3qKDyc0HgZqSkNpr9MU6mt1qBiUj+netvwfo0Gva5HaXJYQlGchDgnA6VoeNfDdlottYyWsFxbtMzqyXDZOBjFbKhKVN1L6Iz50pqJyVKo3MFHGTjNJR3zXKrX1NjttS8CWdjp15Ks10ZreISbmQBHOOxrhq1pvFWrXNq1tLfSPAy7ChAwR6dKyq6K86cmvZq2hnTUo35tRlFFFcrNBDTRTm6U2pKQUH7tFB6D3oGNoooouAUUUUAO7ZooH3BRQAHtThTacOlAmLRRRVIkfRRRTAdRRRQA9TlaKavHFOrUkVOmKdTV606gB1OQ4am0dDmrJaH0qHDUlHQ5oEPpV6UlCnrVgPXrTqavWnU0Sx/bNKvSmqcrTk5OKpCHAZrsPhdqMFj4je2uQ4j1CBrQOnJUt0OK49eteh/DCyisLbVvErxNdSaXH+6t0GSzMCMnvgev1r0MEm68bf0jkxLtTf9alq48CXXgm1uHjmtpL2ZjFDdyyrGsMfqM/xt09qyr7w6q+GdLtjqenRv500rSG4JViQowCB1HeqM/jbVrzVru+leOUXOBNbOm6FlHRdp7e/Wtq60e28Q+HdK/s9o7C4LzmKync4kOVyqOePoD1r1HKlVclSWnY5bTil7RnPL4e09Zdr+ILIAHDFY5W/L5ea6LwV4a8NXd5cTajqouLSCMMQ8bwICTxkk859K5JtHvV1Iae1rIl8zBBCy4bP0rrNX0O00bTo7O8maCwiYyM0YHn3s+MfID91B0DGscOknzypqy/Muo+iluIbPSfFmuztFeajdMzfKIrZEjhiHA+YtgKAB6VoabqvhTwjdyC0ju9YugNq3x8sLGfVFIIJ9zmuSvvE009mLCzhTTdOH3oYCcyH1kbqx/T2rZ8P+CWmtRqmt3Q0XRhyJZFzLP8A7MSdWPueK0jU5p3px16sylHljaT+Xc7jwzLpHirWooIPD2sa5qM5HJ1D94/1wmAB+VfoZ+zNd+HfD3hZtGeXT7G40+RmurWG889bdnYnDSNgFsdcdM1+cVj8RprOy/sLwjaHSba4fymuE5vbvPZ3HTP91a9MtPF0Xhrwlr+kWTB49LsltJrlRnzbqeVPOOemAE2jvxmumcFXg483zPFxNKTcXb5H0D+1h4o8GeI/GV5pFzfatp72KLEZrYCS2EvUloTg55HzA818l+Ifh5LeO7aFqum69GvIS3mEc3t+7kwfyzXV/EbxW3j/AME6R4tB36la7dM1YZySyj9zKf8AeXgn1FeJ318ZHzkhh0xxzWiUKNGNPXb7zXDwm7tO2pU1fTLzSrl4b21mtJVOCkyFTn8aq6fpl1rF3HaWcD3FxIcKijr6n6D1rsvDWpeIL+2d5dRCaDb/AOvl1NRNAv8AshWyS3oq1p6p8SLHxBFa+H9O0qaztWYW4msXSGaUMQNuMEAE9s/jWcMPSn70pW8j0HVmtEr92LDDH8MfBE99aXsN3reqTfY96oHjiRPmfYT94gkDdyM/Sszwb4v1m10jxE1pqVzFqCCK+EokJZtjbXBz1G1+h9Ku+O9K02+v7fQ9M1y3hGixfZFtb0GMF85c+Z90ksT6dKyvDPhvVdC8QWzXthKbC6VraWaH95GUkUrncuRxkHmuuUp06yjS0itNDnUYTpuUt3rqb3g7466ppGu3l5rSf2tFeKFl24SSMDj92R0GO39aufELxSvxR02CbQhcxLpCMJbCZ8zPGcZlGCS2MYOSa8ldGhkZG+8pKkHqCOuataVqlzo+oQX1pKYbmBtyOv8AI+oPQjvXPDH1YxdCo7xf3mjwlNz9rBWaJdJ1i+0C+ivNOuZbS4jYNviYqeD0PqK948WeA9K+K95p3iKy8R6bpc11ZxedbzOC5fHoCCOuOfSvPtP8Cj4kWM2s6J5OmvCx+32szERRNgNujOCduMnB5FZsWuaV4Tmb+w4RqV8qkf2neR4CN/ehj7ezNz6CuqjF0Y8tZXg9v+AYVbVJc1J2mtz0x/2YprSIS3PivTrePO3fLGVXPpktipJP2ZfEhh+0aNdaf4gt+ubScK35Hj1707VfE5g8LXOlXsA1SHS0tVvoZnJaZZlzI27s6vtwe2a5+3tr3wRqFlqWg6ndx6beKJ7O6icoWweUcDjep4I/HvXTOjQTXso/icMZ4nXnnt5FVPDV1YXctrd20lvdQuUkilXDIR2IrSPhxvLDbP0r6a8K2nhj9o3TI2vri28O+ObdVj8xyFhvF7Hnk9OnUH1Fes+Hv2Jbafw5LJrGsNHftkR/YlDxAdiSRk59BiuaWZYXCrkruz9C4qvW/hxvY/PjUNJMWfl/SucvINjEYr3H4teBZvAfiXUdFuirz2km3eo4dSMqw9MjB/GvHtUiAZq66qjOCqQ2ZpSqO9pHOyoQahfpVqfgmqrnIP1ryWj0k7ochGMU7OajHWpB0pLewMkT7tOqNWI4p9aIlkgODTgefaowc09elXckkBwaepGKjBzTl6VomQ1YlU4NSk5xUAPNSBjitEySVSM1IpGKhBxTlbitTOxMDg09SMVEDmnA4qkybE6tg1IsmDUCtzTwc1qmyLG74S1tPD/ijSNUljaWGyu4rh0Q4ZgrAkD34r3D47+Ax4lV/in4NvH1XR74ie7ERPm2kgAG7jkAYGe6n2NfOinHH616B8JvjJq3wn1OV7dFv9IueLzTZyTHKOhI9GxnnuODmuWtGTkqkd1+J5+JpT5lVpbrp3RfsNU074ppbaZqpj0zxUcR2mrKMR3pxxHcAdGJwBIPbdnrUnxu8Oal4QvPDGk38HkG20aGNduNpfLGTBHHDNg/T3q38afh7F4K8f6NdeHhLBpmuJFfafhtxhkZhlBj+6SpHXGfarvxJ+JFn4v8dalo/i2Ey6dZ3T21pqdqu25tAMBjjpIpILFTz3BzTjPmcZx2OSEm5xnDWPbscx4ful134c65o05zNpTjVbLPJCkhJkHsQUb/AIBXLW7kPn8c11unaPJ8NvF+lXuohNT8OXu6MX9sxMF1byKY3wexCtkqeQRXO+JdFl8LeI9Q0qU7mtZmRX7OnVGHsVIP41105RUtOp1wa5movQ39DuArqc19LfAy4h0G1HizUrn7Jp9nMI7eNTiS7mx9xPYZ5PavCPh14MtbnR5vFXia5k0zwraPsDxY8++lH/LGEHqfVu1aniL4qz+Kby02W0Gl6XYxeRZafbcJBHnPXqzE8knqa4a/NjP3ENur/Q5JL3+aO6Pu6T41/wDCTeF4/sEZtNQvVnjg5DDfEqsQPqCcV80+JPjFDcSNHrXh/SNeh7mWHyZv+/iYP6GuObx5daR4C8L39rMY7mHU7p0YHoVEJFYPxIeTWr+01rR7SSWx1qM3Cw26F/JmHEsWB6Nkj1BFeRgstpUJOMlo/v089zStia2JcXUn5Emqr8MPErHZea14RuyeVnjW9th+K4cD6jpWBd/A7VdRJl8LavpHi6HbnGnXapMP+2UhDZx6ZrMl+Gfim5XzZtMbTYSN3m6lKlsoHPXzGHpT9I+GtvNqEccviqza+ZsJbaJHLfT59igCj/vqvca9lrTqP56/8H8SL+zV1L9Tn5dH1vwBr1pcanpd5plzZzpMBcwtHypB4JGD07GvQp/A9h/wsfxHqWphh4XsJxeuyA5uPNAkihT3ctj2GTXa2Hiew+GWn/ZtW8aa1rNwWEf/AAj86QXW8f3WR94jBz3YH2r0zx74xsdI8NW17p2iQXEUB2XiWsix3NhjEe6P5WUlSNhODjIxjNcVTE1b2cd9DkniJymlbf5HiA+Her+Jr6bXvEU1t4atLt96m/bDbMfKkUQ+cgDAAwB71t21lomhhI/DujNrWosVC6hq0QbDekcA45P97Pat/wAOeHPB3jO8We38S6ra6jMcsmuQecXYn/non+FfU3w6/Z80fw6lnqU8rXmpQYkBBxEGxwQCM/nXBicypYaH71tPorWXzO+hhcRipctJaLzPn3xDZ6v8IvhJq1zrWqMvi/xAqw21sj4+xw5+baowF4JzgdSBXyHqdtsZixLEnJJ5JPvX1H8ebS6uvFGpTX9wbm4WRk3Z+VVB4UegHpXzjr8Kq74Ir2Mvo8tJVJP3pasyoyjGbUTjZhgkDpiqkhGKu3Z27sduKoy967WevHUiJppOTQTmkJxUXNrCMRimMwzSM3FbvhzwH4i8YQTT6Lo13qcULBJHt03BGxnB/Cs27CcowV5OyOeJpjdau6xpF74f1GfT9StZLK+gO2SCZdrIcZ5H0Iqi7YGai9zVNNXQ1iMVHnHWnE5pjdaxZY1ulNzilZuKYTmpbKSuI3Sm5xS5zTD1rO5YA4zUTHJpzMQcUyoY0gPSoj1p7MQcVGTzWT7mlhpNNYgc0r8HFMbnioYxrdKY3T3pxPFR5zmplsWhCc00njFLTW61lcoa3pTScDNKTk01ueKzuVYa5wua9v0Lxdqlh8ALq/S6M13Dd/ZUacCTbGSoxg/U9c14eTziu++EfiW3s9UuPD2qkPoetp9nmV+iSfwMPQ9vxHpXoYGryVHBO3MmjixVLngpWvy6/I6DQ/GuiRfD67vtQtDZ6nLdrEZdMjETTSKAysMHHAY5zwc1o/FfQNN8a+ET40sYpbS/ijRriORAjSoSAGZc8HHIPcVR8V/D21+HnhOOTVJP7St7a/kkit4vl89mAWPzD2ACtnHWqvwj1afxVN4v0i+kMz6pZNICx6MoIAHoACMD0Ar3ZzlphMRu1p69/mefGK1xFJ6J6nkStjPX/GvtzwNqmkXfhfTX01oBprQIioCMLxjaR69frzXxAQVOD1BwfrU0czxKQsjqCQcBiBkdD9fevCwOO+oyleN0z0MZgvrair2Z7X49+IF1pXi/VLLVtCUR7ysai6nhLRfwFdr7cYHQCtbwT8UrbVLqPTI/DV3q0Uq4a1uL0XEcYHVgZFyg753DFcFH8br6fT7K31bRNJ12W1Ty0utQiLyEfXNX9O+PAsI5Yf8AhENBW0nws8MMJTzVHYnNdTr0pyb9po/wOJ4Wahy8mve+57p4W1j4e6j4n07S9CsoI9VQSPNNAplCBRllErcHk4DAHgEDHWvLPGPxI1r4v/EeLw9b3k+k6Qbh7byYJCCyKfnd8cMSF4HQVj2nxe8JeG/tep+HfDc9hrs8BgCyS7oIsnll5z+Vc78FdVjh+IdsZoXmnuUkjjlU8xOwJMmO/AI/Gm6sXKFKEt30MqeEcOao46paXNX4p+IdPuLLT/Avhq2ubmPSp2/fZLs8gzuC468k5I/AVoeA3l0zwJqGtadLNrviBVKSWs0rf6N/s7CeTgZ9T0FWNFj07wfoXi3UNAJ1HxBp8rpPNepyq7jkqB2Iyfcit/S1S6fRfFbra2Ky2DvqEifIJCwUqSO4B3Hn1FdtKg/aOpKWrXTor6P17oqUkocqjp+vY+atW1S71i/lur6d57qRiXaQ859Pb6dqp1PqEqzX9y6HKNK7AgYyCxIP5EVAfu5r4qrJym23c+op6QS2Oz0X4W3msaFa6qdU0+yt7gHZ9pcqcgkYzjHYmm618Ode8Kql8ii6tkxIt5YtuC45DHuPXNHh7x7a22hHQ9c0xdX0xTvgQEK8TZyQD6cn86n8Q/Ek3+hLomi2J0jTBkMplLSOOu3Pp6ivSawXsuZO0rficKliPaWaum/wPQfDVvofxuSEX73dj4gsrcJLdQIPLcZ4J/Htx3xXp/hzwPrXi74c3fhPVD/xM9LvUfT7+5clJIiR827k/dLcfQV4L8JviFpHgrT9Thvra8kuLx1/e2mAVQDpkkYOea77wt408G3etNdx+JvEWhXFwxMv2plmicngBshgfxrup1Kc4KV/e6nkYmjVTko7LY+pvAvxG0L9mXTf7F07StX8Q3cjCbVL23gPlowXA2kjb06AHp1NO+Lfxb1vxD9i1Hwvp8Ouab5SnUdBuoR5zpIA0ci57dRjsR3rxXXrfXLSxbXLO7bVNMjTL3vhm/eGYLnkmElkPHXbjFMtfiJrqaTouqeHdbj1uHypLSe01mTyZJ3VtwIJOC4UgZDYIxWXsqfO6i3PM5JSak9TifE/hjwJ8Sr2ebQbs+FNbLES6TeqFj8zuBnpznp+QrzHxD8GfFWiFmOn/bYh1ks28zI9cdf0r2LxZ4T8YeIr19W0dLWWyuE8w2mp20STRuchojlBuwejZ5FeZxfFPxT4UvJ7J4La2mgcq9vJb7dhHUYBqKkKUvjVj2cPUqJWptPyueamyaNnSRGR0OGVlIKn3B6U8afnsa+jpNQ8H+OtTttI8W2i6LfT2sE0es23ybWdAxD57ZPfI9cVpH9ivxrO1xJpjWGoWC/Pb3P2gJ56EZBAxx+Jx6GuR4aKb10OpZhTjpU939T5ej0aa+uYra3iaSeVgiIvUk16BdfAyKysbeO81RoNTlUgKIt0O7+7u/8Ar81meKPC114c1C4sb63ktby3do5YZBhkYdQf8+9dh4LGtWfhq61PxFfFPDRj2xpeZaR+wKE8gZxj9BWtHD0uZqpG/maVa8+WMqcrfqeGa1ol3oOoS2d5EYpkPIPQjsQe4NZh4zXsfjCNPF/g2C+S0me788x2LOB5skY5Jb1+VSffivHpQRkEEEcEEYIrxcXh1Qn7rumepQq+1jd7kVDHpRSN1rgbOpCU09adnGaZnOakZJb3MtpKJYJGilHR0YqR+Ip19qN1fbRcXMtxs5XzXJx9M1CKaetVzSty30FZbiUj/dpaRueKwLEoP3aKRj2oAbRRRSYCN0ptKx5xSVJSCkbrS0jdaBiUUUVLAKKKKaAcp60Ui9aWmAU5elNpVPOKBMdRRRVIkf2zRSKcrS0wFT7opaReOKWgBV606mjrTjWpIq9adTM4p1ADweMUUi9aWmhMfRSKcilqiR9A+9mgcjNFUJjx1p2c0ynL0qkIcvWnp96mDrUi/eqkJksa5Fd/8Htbi0LxbGbu7W00+eNo5jJwjHHy5/GuFhXIFatlBvIFehhpOnNSRy1oqcHF9T0Txb8L7Hwhi9vn1K7srp/3VzZpF5TEnOM5P6jmoNZh8PWnh7w+rafqFxAyTTRlrhEY5kw27Cn+6MYr0f4AXkHidLnwBrg87TdUjZbN5D/qZhyACemTgj3HvSa18Ibxz4V0e+Q2Qs7a8e/mkHEEUdy+9z+A49SRXtuMfiikrnhe3UJclVvT7muhmeDtQtrrQXmNikeo+WzWBuZfNlK52L87DKjccAdK8ah0rWvFutTRrFNeX5yZi5x5eOu4nhQOnNe4p4bN3Z654i1hZfD3hv7PFBYqi/6SYo5UKbEPJBP8R4y3euE+JPiRr3TbSbRoU07RtT3STiIYlkmB+ZZWHXsccDmniIxnSXO/h6LqaYabU2orfr2Oft00LwUpmkePXtdQ/JEvNpbt6sf+WhHoOOK53V9fv9fvTdajdPdTHoX6AegHQD2FU2A6AYHtTrS0lvbqK3gUyTSuERR3JOB/n6147quSUIaL+tz1lTjG8pas6/wfcjw5Zz+IpR+8QGCwB7zkYL/RAc/XFPstXlt/Bl+jPkXV/DktkliiOT/6EKxPE97suYNLikWS201PIRk+6z5zI34tn8hWgbCa58NaFb28bzXNzc3Eiwx/MWGUUHH4Gu2Et4RWyOaUI7z6tHQ/DvWPO1G70G5nEOn65CbSRicBJOsT/g+B+NV28LJ4fnMniiR7QKTtsISDPMQcY/2F9z1HQGoIXsvBA37otR8Qg/KFIeG0Pv8A3356dBWr47i/4SfRdJ8XoQZbxfseoBf4blB19ty4OK6lZ0rt3kvyOdq1TTRPQ5nxB4kuddeJGAtrCAbbezi4jhHoB3Pqx5NbHwztUs76/wDEVymbbRYDOuRnfO2ViUe+Tn8K5jyCQOMnpXXawkug/DrSNNZdkmrTtqcmRgmJfkiz+Tn8qyo353Un9lfj0NZ2UVCHX8jh7iWS7mkmlYvLIxd2P8RJJJ/Mmrel61f6JKJLK8ntT1PkuVz+HQ1C8eKvaH4bvfEM7LbxhYI+ZrmU7Ioh6sx4H061z0nU5/d0bN5uKi+Y6vxd4gg/4SGaG+0Oz1GC4CTQyohhnKOoYfMnU8nqDUj+F/CljcQS6ne3uks67zpNxh5B6BnQfIDx1GcVu+O/EejaVomk33hVInnKmx/tEx5eJYwOF3dGOfvYzgV5JJJJd3DO7PPNI2STlmc+/cmvZxM1Qm00pv8AA8+knVgrPlPULPW/FUcgfw/HZy6PEdn9m6Y6yRuncOp+dsjOSRnmqA8FRahq2n3mmQXEelS3MUV3aSKfOsWLDKMOpXrhunrWXpHw411o1v7oJ4esh0vdSk8gY9VH3j+Ar1Lwb45sPB2kavdDXr3xV9jgRS8kYjhDFsLGjN87E89eAF6V0UEsQ+WsrevT0OerL2abp2fp19e5ynhi8fxd418TWkcUky6zDcRxhFLYYHfF+qAfjXefDvw6PDqnSfHdzYabod9iQ2s90DdwS84eNV3GM8/NuwCDXNap8RtV0S90vU9Dmt7TwrPOr+Vp8CxHIYGSKYjJ3cnqcEciuP8AE6LpvizV4Ek81FunKvkncpOV+vBFTJqF3u7mfJOvo/dVum90fTsuq+DfhNqyRWOgS+IpZUWa3vtWmzashwQY1TG8DPJJHI6Cvpb4F/tPHxfYT6RqtvBaS23lpDLbLsjO9tqR7B0xwM18BeC/GtndaV/wjfiCaRNMkbfaXg5awlOfmA7xnI3D8a9T+Ea3/hHXpLW72CSTVtPijljYMs0ZMkmUPdSFDZ/2a5sTgaGMp80leXc5FKrhk7St+pi/HfxLe6v8RfEUmoypJeLePG3l52gKdoA9gAK8X1OcMzY9a6/4yaoZfiX4nO7P+ny/+hGvO7i4D5Gea6JVFCmoLodtGDaUn1ILhsmqrH5T9aWSTcaiY9q81vU9CKJAeMUqn5qYDilU96CianoeMd6jU5FOBwa1uTYlBwadnNMU5FKDiqRDJVIzTs5qNetPBxWiZL1JVIzTs5qIHFOVuKtMjYmUjNPUjFQg4p6txWidiWTA4NPXpUQOaWrvcixMDg09elQhyacDVpiJ1609RmokOatQJuNaLUhs+ovBFm3xK+DHgi4dPOufCutKk7sOVt1O7PHONuz8q+a9TuDqGp3l0RzPPJKcf7TFv616z+zf46l8F+M49NugJdB1oraXcL/dUtwr/mcH2Na3xU8A+FNJ8darolxBP4VuIn329zboZrOWNhlCyfeQ84JXIyDXJBuhVdN9dUeJRvh60otXT1R5Z4W8YNokM+majC2qeHLo5udPLYOcHEkTfwSLwQR1xg5zXrd98NdH+IEeg+Jx4jhtvC8ERstR1K8IimbyuI1CtgGQphTjIyua5bRfgVfXF41/qN5bnwfaoZ7zWtPlWZBGP4FA+bzDwApHGc1PL42i+Iy6x4VsLMab4fjsC2iacDny5YCZNx9ZHG/J96VR88rU36iqtTlzUnr1G+NdU0nxXq1vDceJ9N0bQdNj+z6dpllDLc+TEDjnaoUyN1Y55JrJh1DwFpTDH9ua8QehMdnGf/Q2/lXmnmLwTwK6rwn8PNe8YHzLK18qzB2m8uT5cI9g3Vj7KCa6VCNOFlojp9nCnFc0z1DWfH1lpHw58N3Wl+HdLtxc3V20UV4GvGi2mJTIN5xkkHtjgVsfC7W/Gfxa0DxFoVpfvYyRRx3NpeWwFrFG+cND+7A4cE9OhGakb4Vf2V4P8O/arC21A2QuM3muzmwsIiz7tzo2JJBkDGAM9awp/GejaBfWt5qHxG1DUp7QfudM8H2gtrWPj7odsLjtnac1wyaatFXf3nm3VSLVJXfTqchqemaBoN5df8JXrV1rerwyFH03TmJG8HBElw4wOePlB+tXtPu/GnjW0k07wd4an0fRnIDx6VCyLJ/11nblu/U49q2PHnxB07wnqFrqXhrwdo0I1mAX8WqX6teSlmP7wAP8qlXyMY9K828S/E/xX4uyuq69eTwHj7MknlQgegjTCj8q2j7SWtvvOyjTnUipW+87/wADfC4eG/FtrfeKta0eyttMc3t1ax3gupyqZOdkW7uFHJHXjmvRtE8e+DfDfhg6tA+qeLzbahPBctKq2kUn2pdzgpyWT5CQDjnmvB9HEeh/DbWdQcD7Rq9wmnW+R0jQiSVh+Owfia6v4K+EdS+IOieK9DsI0USpayi4mOEjkSXjP/AC/wCVRWpcyvOX6GdSHNec3s0j6H8L6/rK6gW8PW2k+F/BqQrdNrVpbqpFsTj5pGyxl4K7Rg5FeyaN8fVu/h34g1jT4i0GlPHbwPdMWkkB2je/v82a+S38b6Tr0L/DPTFFhplmxXTb55CGub1SdzS842yHIA/h4rovgvql1efDn4peH7iOWO5gtPPMJADK6hwRz3yo/KvExOCp1Ye0qx2a+6+rfmzWjiKmHTcXYxPiF44/t2e4nlkLzSsWZvUmvFtbvBKzc55qW915pkOX4I65rnL2883PNfYQUIQUY7IdChyblG6kyxqg7cHPrViZwTzVZ8E4FZSdz1Y9hhOaY3WnlSBTG61k0aETHtXuv7Pvxf8ADnw08K61BrNxeJdT3kc8MNlGWd1VR1PQAkYOT0rwph8x+lMbpmsZK61Ma1COIh7Oex1XxU8YW/jzx9q+vWsEttbXjqyRzY3ABAvOOO1cgxyeKczcVGTis9jopxUIKEdkIxGKYetK3Smk4qLm6VhCc0xutKTikJzUMoaTTScClpjntU3GhrHJprUpOKYzZ4rKRY0mmk5NK3SmE4qGUNJ4pmcdacTmmN1qSkNJzTH6Uppuc1kNCHpTM4609+DimN1qGyxM4ph9ac3SmMe1QyhtITg5HB9RQ3SmscCpvYo9L0L41TvYjS/FOnw+ItMIAJkUCZQOAQehI/A+9d78PdG8GQx6vrXhe6c3MUJTzNSJWO13gkA5A445OT0/GvnWui8D/EDUPAd3cy2sUV1b3KbJ7a4yUcdjx0I5/M17eEzG1SP1mzS69UeXXwXNB+x0fbozom+BuqSEt/bmhsG5DC86/wDjtMf4DeJBcRBJrCa1dGdr1LjMMeOxOO/sKvH4i+B9TJk1PwMkUpU5a0cKCfp8taVr42+H0vh+50KKXWtG0+6Kl4wxcA55wctgHvxg11rD4Cq37y69WtTJ1MVBbP8A4By8Pwd1C8Z47HXNE1C5Clltra8DO+PQYrhLiOW1nkgmVo5o2KujjDAjqCK9QsPh74envoLvwx44hgvUcNCt0AjhvzH8q6XxBo1tqupwP4i8D3t3qcirHNe6bJmGTBA38EHpzyK55Zcqsf3a5X63ubxxfI7S95fdY8Cdzn1ro/h34hsvDPi6y1LUGkS3gDkmJNxJKkAY/Guw134VWGp/Ea60PSrhdLgis0uQJN0m4k4bqePWqbfAyWdJpLTxJplzbwjMsoJwh75xnFcEMDiaNTnhG/K/xR0SxFGonGTtdG9p/jz4f6TLq0ls2pb9TVluPMjZlbdnPBPH3j/KvFJbuYI0QuZWh6BSxAI+ldP4f+HN/wCKmvzp13ZvbWcnltcyyFEf0K5GccVZ174Q67o9qbmIQalaKu5pbOTdtA6nBxx70sQ8ZioKThZLt5jo+woza5rtnD01+mK6Dw94F1zxTE0unWLSwqQGmdgifgT1/Cuin+B/iGDTJ7tjbySxruFrC5d3HfHGMivLWErzjzqDsdksRSi7OWp50c5zSrTnjZcgqQwJBB7EetIFIrkSOgtRNgCr9ocsKzY+CBWnZLl1966KerMpnpPws8baz4K1xZ9MikvbdgBc2KqWWWMdeB0Izwa9J+L/AIRstP0jVItLgeGEtaa0tu64MInDJIB6DITjsTiqH7J8trafEl3ur23sYzYTIktzIqLvJXHJ96+ntE/Zm8QeMDrOp+MfENrqCXth/Z8UmmRgq0YYMHJwACGHTn6166nCEVzux8viaqp1r20S+88Y8H/EPR9C+HOhNr1wNMmMDJGkiszTKjbfMXGSQffvmvKNU8ey+K/GN3JovhPTNUhMoKT3VlulYDHzO+QF6V6R+0voWleAvFltDf6fLqpFmiadbvJ5VnBAvyhSF+Z2yCT0HPevKvCa6p8R9Ue3uLy103w5p4We7t4VEUAjz93aPvZ24yenNbubklFbDoU6fK6y6nsD+IbDWfFdnaXuk6NdSpapLJBLafbJgpGT85KxxoDxliQc5r6i+GHx58Dy+EdTazlWOz8P24F0kMDGOJACBswPmX5T09K+QPGd/pHibwnNfaHu1Cyhwl5BpDrDI0a/dDZUllX0/Hmsz4G+O/D8WrarodtBfW6azZPbt9suVkRsA8ABRzgms6tOE2oN6s4quG9rS57bHrniSb4e/F+417xnpeg3GvauZ1SXT7iZYgoA2q4HC4ZVDHJJ7V4X8Q7K81bVo9T8ZNa6FoFmc22jRyiRpSB6L1/wGK848RS698P9XudPa5udOuP79vKyLMmeGBHUVxes6zd6vN517dT3cgGA88hcgfUmuWpiY0lyJN/ke1hcE07xl7v4r0fQ7CDxzceKPiFpHlL9m06KUxwW46KpUjJ9yOPbpUHi3wZbeJL+5vNDnhW4WUx3VvKwQK/dh6ZrhLfUJtNu4rq2cxzxMGRh2Nd3EdF8fR3d3JbT22pwWxknMTbEYjoeOtclOrHEQlCerv8A1Y9SVP2TUo7WOD1vw/e+HblYL2PYzDcrKdysPY1lk5r2TSLa21bwhpsl1aQ6nex225I5vvEZ5wfyri/GPgyWxuL/AFC1iCaejRsFUdAw5x7A4/OufE4FwXtKeqfTsdNLEKUuSW5xzdKbTm6U2vIO0Q9KaKc3Sm0r2GgpG60ppuc1mMKa3WnU1utACUUZAoqRjD97NFFFIaFHWmHqacTim0DCiiipYBRRRTQAOop560wU89vpTASgfezRR60CY+iiimSKvWnU0dacaoBV60tNzinUAFOXpTacvStQYtOXpTacvSgkUdadTacDmmhMVetOpq9adVEir1p1NHWnGmgFT7v0p6+lMXjNOBwaoBTUsfWo6kj61otyGXbc4AroNLxvFc5C2MVsWNzsYH0ruoysznqK6Ppn9k7w1pXiT4uaLb6owWKMPcRpu2+ZKg3Iufrz+Ffb37Rb6V4S+GOs67a2+nnUooUSGS7gVwzFxhcH73UkA5GRnBr8u/D3ia40e7gurS4ktrqFw8csTFWQjuCOhr6StPiV/wANFfD6HwxrGrta+LNNzNbyyvhL3jq46E9c9x1HevXlT9rOElLRdD5XFUZqpzvb8jxm91u+8QWHjO81K8lvbqSyi/eSsSf+PhOB6D26VwOjxf2zYanpDSYkZTdWqnoZUByP+BKT/wB8iuomtr3QrTxjp2owPbXkVpGrxuP+m6HOe49684j1KXTr2C7gIWeFw6n3Bz/n60V5rmVz1qMNJKHyM48DJre0YHQdFuNbJAuZi1rZDuGI+eT8BkD3NSavpEeo67YvYL5dpquJI+4jJP7xf+AnP4Yq5rFjaSCO41CZ7XRrZDDp9qmPPuFB++B/CGPJY+vArjp0nBuXb+rnZKopKK+85/QdBuNZkdwy29pF8095OcRxj1J7n2HNehfEPxbaw2el6ZoUf2GNbcNJJGgQsjAFVBHIHcjvmvPtQ1ufVxBaRILWwQhYLOI/KpJxk+rHuTWl4zlD+Kb2IH5INsC89kUL/Stqc1TpSjT1b3ZnKHPUi57K5nW8eW4r0/4Q+Vql/d+Fr5sWOup5CM3SG5HML/nwfY151YxGRwqqWY9Aozmu/wDCvhbVr64gksdOvZZRIpjeGBzhgeMED1rbCwlzcxz4prkauO8O/Dm/1jxha+GzEVvJbr7LIo/gIbDn8ACfwq18UpV1/wAaXYsVZrC2ZbGxhUZIijGxAB74z+NffXhj9lkXC3niiO6Nj4q1DTjGQUDW9tcyRhZJVA+bJO76FjXl3i34E6d8GrCQRx6vqepSxhRe6VYie4U4OQjn5Ihx1wW963p16FRyoxep5MsU4tTa6WPkafwbZ+EIVu/E5JumAMOiwyYmbPQykf6tfb7x9qim8N+LPGkfm/YBpWjLjb5g+y2cI/4F1+vJNd9qc2taHNcvongGe1umbI1PUreS7u8nq2WG0H6LxXnXiOw8beI5TJqtrrV8+eBPFIQv0GMD8BW0lGC5VF2Xb/M7KU51NW0bem6Z4X0zwzq1leam/iZrMpqDW+m/uo0x8jASNyQQwzgfw1zk/wAS7u2j+z6DY2fh60B+X7LGHn+plbLE+4xU/gnwzrVt4gjguNJvo7S8iktJWaBgqq6kZOR2OD+FYDeC9eileP8Asa+O1iuRbtg4/CoqTqOnHkjZbbHRTjTUmpu7KF3qF1qT77u5mupM5DTSFz17Z/Ouk8Uf8STRNL0BMpMo+23w/wCmrj5FP+6mOPUmr3gb4caxf6o13e6VcJY2KmeWOWMq0xAJVFB5OSB0rJ1LQPEusaldXtxo1+09xI0jkW7nknp07dPwrKNOrCm5yi7y0+RTnTdTlT0X5ieGPE0mgTOkka3umzjZdWM3+rlX1H91h2YdK6P4j6fb2uoadqWnu02mX9ojxTsuCWUbGU/7QwM/nXML4M8QtwNC1Ej/AK9n/wAK9D0jTNUf4bQW2saLdS6RDeushSIi5g3YxLGvU4bcCMYIPtXVh41KkJU5J7XTsYVZU6c1UTR55DdFTnJ/DrX0dZ+MZvgX8NLS0vbiO88VXi+dZ27Lu+xoRgZPoMn8SR61xPhn4WaZ4LtpvE3jK5RtMtpA1lawtk3h6qSOvPHy+xzwOfPvH3jm68f+JLjVriJYA6iOKFTkIi8KM+vf6mqXNhYfvN30OeaWLmlD4Vu+/l/mU9Q1e41O7nurmV5rmdzJJI5yWYkkn86pmbnmqvm0ebXC5uW56MYKOxOWzTD1qMMTTh0pXKsSr1pwOKjVuaeDmmgsSA4p69KiBzUinirTIY9etSL0qMHFOVuKtMixIvWng4qMHFOBzVkkgODSg5pgOacDirTE1clUjNOzmogcU5W4rRGZMpGacDmoVbmnhyKpOwrE2c0oOKYDilU5NakWLcIzitjT7fewBFY0DHdXQ6S+JVzW9NXZjU0R3nhPwnc61dQW9lBJPdyMBFHEpLs3bA9a+o/ix8FdS8X6j4a1DWSNMs7XRol1TUZQMRspO4Ad3ORgetef/sr6va6Z8SdJaeJpTNugTaASrspAP/16+zfiLr9v/Yk+m6XNaz680Rlt7SXaxbaecA8Fhg4HrXy+bYytSxVOlTXTf1OWjh4Vqc6k5arofDPiXTfF3iS7tLLwPpWpaT4b01dlnt/cq3XdNLIcKzN7k8cVb8JeGNPm8QWreK9S8PvrlgFuI5tCYm5iVBkmd4x5RXHynPYnmsbx94g8UePtbTRpdQvr24llMaWjuVRT3ygwFA5J9MV514v1yy8OW8nhbw/MJoGlT+0tSXIa8kU/cXn/AFQ7DuRmvap05cqTkvl/n1PNcZVYuMdD2bxH8PdE+H1xc6n4V8K6T4gvmm3btY1D5bZmG5VSIgLjBOMnPpXj/jz4vfElJRZam8/hmNciK1srb7Iqr6KwGSPo1afizxbqO2/12yl33mj38mlahbyqJIrq1Z2MPmoeGAO9PyxVTQ/E194i02RfDNygulJafwpqZFzbzDubbzMn1+TO4djWippavUVClKFp1FzHLeMdQu9R8C+DZbu5mupD9s+aeRnPEo7nPrXFbmr1XxPe6FeeGvCR13RrjRI5ReMF0k4EOJcE+XJnOSOm4YxgVz5+HUGrgv4a8Q6frJ7Wk7fZbr6bH4J+hraNktDvoVIKHvKxJ4WlfxX4P1Lwy37y9s92paZnlvlH76Jf95Rux6oa4fliAASx4AHrWxby618PvEVpeSWs2n6lZyCRY7mMpkjsc9QRx7g16FovgKLXvijpN1otq11o99AdZhtkAJG3JaA9hiUbPoR6U721KdSNLmd9H+Zm+IfDeoa/4o0DwLpEYmn061WFwThFnceZPI57BScE9gld14X8c6d4S8VWPgXwfJ/oUpkt7/WlOJb66aJlVlYfdjRsbcfWuT8d+I7TwHDrGhaXMt94l1T/AJD2to+QjM297a3I/gB4Y98Y6V5r4b1GTTPEGl3UCF5YLqKREUckhhgD8sfjWFvaO72MFT9tHnltYkN3NDO25289WJZiedwP55zX0f8ABz4iQSnUPFOpLFLFbaa9j4gUn95PGOYpwufmZvuN/wDXrwP4haFfaD461i0uLGe0ZrmSaOF1JJiZyVI9Riux8Bp4g8MeEp5rHw3c6nNq14Le4he1dhJaKh3IePl3F+D/ALPtVVIxqKzFiVGpRvHdifHbwTpvgDxTZx6JcyT6Vqdml/bLL96NWPC579AeefrXmRlJ4717l+1Vpyxa54I277eOTSY4Fhk5eMKwADHuQGx+Fb2tfsh20Gn3X9k+IZrnVUAEMF7CsMUjHBxv57E9AeeKzhVUKcVJio4ulTpRdR7nzX1pwiLdq6nx38N9W+G+txaZrPkG6khWdTbyb12kkDnA54rOtdPLDkV2R95c3Q9D2kXHmi9DIFqfSmSQbR0r3nx7+zlqfg7wjpPiGFnvLKe2je9XHzWsjAHt1XnGeoI5rye40koM4OfpU03GrHmg7kxrRZysi7TVdwcVs3dps61lzJg4FRONjri7lJxg4pucVJJUDHmuNs1QhOaTOKQnFITmpNhM4ppOTQTmkY4FQ2AhYYph60E5ppOKllpCOR0qPOOtOJyaY3Ws2UJnFNYjNBPFMzmouXYRvSmN1pWbPNNJzUN2AaTmk7ZopGPas2VYY3SkoJzSE4qGWhucU0nJpW6U2ouUhp7UwnJpx6U2oYxG9KY3WnE7jTD1qW7FWQjU0n5cUpOaY3Ws+txiHjmtqx8d+ItMt/ItdbvYoh0USkj9awyecU1utVCrUpu8JNDdOMt0dNoXxE1XR/FC65cSHVLvymhb7Sx+dSOmR6V09j8YLG9YaZqXh+0tNDuCRcx2QKsSTkNxjPPUeleYNTe2K6KePxFH3VK68znnh6cnqj6YTTNB0Lw5dyaHPp2n210odZ7h98MjAcbgx5Hb2rz3wb47vfFHirT9I1RrGPSlaRmit0EUUjBTjPPIzyB/OvJ2dmVVJJUHhSeBnrxT0GBnvXoVc3lJw9nHlS6X3MIYFQUuZ3b2dj6I1e4vvDltf69qbxzWNk4TTtP099sIycK0nqefw5rybXPij4h122MDXS2cDEkpZr5e76nqfzrmY/MMflh32E5K7uPyqeK03cAVhXxtSsuWn7qNKOHhS1nqyg6M+WbJYnJJpqoM1sNYHA4rr/CfwY1zxMftE0D6TpSje97eIUXb/sg9f5e9edHDzk7JHVKvCCvJnnIGG6cjtWhasY29xXqkvhj4f6fpN1dRR6hrcdk/lzzwS4JzglwMgFRkZxWfYeEPA/iQiPSfElxY3shxHBfxjGT0XOBn8Ca6vqk6bWq1Ob61GWtnb0MXRLxYWG/G2vqP4Nftd3nwu8KNoFzpy6rpocyQhZfLeEnkgHBBXPPtzXyfr+i6l4O1RrLUYvKkxuRwcpIueGU9xVca0+0Dd+tbe0jyulVW3QwqYeNdJ9Ge+/Eb9qrxB4o1SWc6VoyW/PlRXFoJmjHpvPX9K8r1v4165qOnXtkbfS7eC7jMUv2e0EZZTnuDU3w70/TJ7TVPE+uZmsNJwVtscSyYyM+oHHHqazPiVp2k32h6f4p0W3e0t76RkmtD92KTnp6cg0VOaNNyj2v8jOlTowmqfL5X8zlvDni7UPCeqpfadOYpFOHQn5JF6YYdxXqejaTo3i3VIvFOl3LWLsrC5sYwMxSspU4/u9Sa8IMueam0/Xb7Rbgz2F1LazEFS8bYJB7H1rz6GL9m7TV1+R6VbDe0V09fzPX73UZLqKTQPGNvPLaoxjsNaeP5wBwu5hn8zx2PrXl3i7w5ceFNSNrMwmjYb4p1GBIvr9far1j8U9fst4luV1CN/vR3S7hj8KpeK/Hd34rt7eGa3ht4oCWAiz1Ix36DHYVVfEUK1N6u620CjSq0p6rR+Zzjk5rU8MeKJPC891JHbRXInjEbLKcDAOe1Y5JplePCcqb5o7nfKKlFxlsz07whrjeKNalkeAWS2dtthitDgDLc/njpWvcauL7VIdEntZxaXdvIrSzptJbHQfgD+lePQ3U9oS0M0kJPUxsVz+VdLonxEvdLRUu411JEbejTMd6cYODXq0MenDkqO3dnHPDWlzQOZ1C2NlfXFsSCYZGTI74OKr1Y1G6+339zdbNgmkZ9uc4yc4qvXiOzbaPSSaSvuNY9qSg8nNFZy3GgPQ0wdKc3SkqRhnFMPWnN0ptAHo/hE2C6FZHbZLIzN53nkb8ZPI9f8K8+viv224KgBPMbGOmMmocfnSMcLXRVrupBRtaxEIcsm7jaKKK5DYRulJSt0pKACiiipYBRRRTQBSr0pKcvOaYBRRRQA4YPSlpq8cU6glgOtPzmmU5elWID0p46Cm0q9KAFpVODSUVS3Bj6B972ooqyR9KtJSp1x600Appw6U2nL0qiWLTl6U2nL0poQoODTqZTx0piuP7ZpVODTVPalq0xWLMcmOtW4Z9prPDZGTUquAa2jKxEkmbkN6VXrVq0124066hurWZ4LiFhJHIhwVYdCDXPLNjvTvO96641nE55Uk9z3r4l6l/wkuiXPiy3O621DSoYJOfuSpMmVP6/lXj1j4fvtViaZEWC1UEm5uWEcX/fR6/QV1nw7+IVhpGkT6HrkDT6ZLIJY3C7xG2cnI9M81J4y8FX+s266po+qnxHYqOIwRviHsg4/IA+1etUjHEwVWGrtqkefSvQfs3t0Zf8B3+hWOh3MMl6l5fWnmTozIQkYYBTsJByM9Tj8K5fxDd2lnqW/UdFuLmZxvE896WWUdtpUAbfpWF4alMOuwwtlDPutpBgggOpXn8xUmm69Jp8LaZqMH23TQxDW7nDRN6o3VSPyrJ4pToxg1a2hsqPLNyTvc2PDWrWl9r2nWkeg2EYknXczeZIQM5JGW44FPufHV02o3UkFtp0XmSl/MFnGWYZPUkGrfhTwlNJq41LSCdQsEgleNhjzUfYQqOueGyfoaz4tG0/w4A2tyG6vByNNtJAcH/pq4+79Bk017aNNX08yXyOf6HU+F/Evi/xBdmHTLt4gq5d4UjhjhXHUsANg/Gvd/hLdKFl1nXPFV/qunaaR9pmS6kjso++1WBDTOegRQB6mvAtEuLzxVC8l639i+ErH5rhbNNkY9EUf8tJGOAM5xnNdjovjaHxJqkDvbLpvg7w5H9qj0xTlWYHCBz/ABu74yfTNdlJ6K7Z5eKpOa0Wh98z/tb6V4U8KXFzFpslzcQTRWoidwn7x0L4PXBVQM/7Rx2rwL4uXnhHx/ZDxLoetX/h43kpSUXLyPapOeSkhBJiJ5weVNeB3/iya++Hct1cTD7Rf67JcFFBABEXzH/x9axNB+IEmh3E6Swrf6Zdx+VeWUh+WVPb0YHkHsaUMPQw8nUp6Se5zRo1HBK+xP4+8N+JfCnlzX0k8tjLzFfWtyZreT6SKcfnXnk2qXbMcXdxj3lb/Gu+vtcv/AbJeeH7/wDtDw1qOSkN0vmRMf4opozwHH69RWeW8G+MwR83hDV26cmSxdv/AEKP9adRc7spWZ6FKXJH31dHFJq15BPHLHdT70YMv7xuoPHf1rW8b6hKfE1zPb3EywXax3UaiU/KJEDEdfUmoPEvgzWPCrD7daMIH/1d3D+8hkH+y44NaFvoL+IofDJVsJMJLWeXB2xrG2SWPsh6+1YwjXalTaZ1ydNNTRci8Rat4R8IQx2+ozw3Oss0rKW3bbcDaCM52liW/AVyg1C8IH+lT+n+tb/GtnUYrzx34on/ALMtTJEuIrdF+VYoU4XJPAGBk/Wr0djoXhWQfbJU8QaivS1tmxbRn/bfq/0Xj3rSo6k3bm92OlzOLUVdRu2ReGdP8TaxHI+n3d3BaIcy3Mly0UKf7zEgfhXoPhbxtNp3hrVtNttVm1zUoYGvAZ8+QhRlyEbO9+Du5wOOlea6v4g1DxAyi5m226f6q0hHlwxj0VBx+PWtj4cvHa+MdNWcDyLlzay5/uyKUP8A6EK6sPX9nUSg79Dlr0eeDc15nZ/tI6xcXXiLSNNkP+j29ikwwfvO/Un/AL5FeQYxwK9h/aT0823xAgi5Pl6dAufX71eSmIg1ljXKVeTZWC5VQjZEBGKKey4phGK4DvHZzTl6VGDinq3FUnYmxKpGadnNRr1p4OKtO4iVSM07OajXrTgcVRJKGGadUVPDHFWnYmxKpGadnNRg4pytxWiES5zTgcVGDinA5qiSQHBpc5qPdTlbirTJauS5zTgcVErc07dVXJsyUZXmnCTFRZpQc1VyC5HJ0rVsLoxkEVhI5Bq1DPtI5raErGco3Pqv9lC9jsda1vxPdf8AHpoOnvKGPQOwIH47Vb86r6r8StV1/wAM6brUU8raiuqzwq8DHeHfbIgAHOclsVyXg/WG0b9mDxbPbAJPe6pHaSy5wTGQnGfpkfiaTwVqF54P+HGuXbeX/bkkceqWNtcREtbxK3lG4Ho5EhxnsM1gqSnUlVkrvRfI8KW8vJnpPi/XIPF0U2lQ/YrT4rXluIbvy8okyjlo0cHas7KAG7HBFfLd4s1pqP2e5ieC4hkCSRSKVZGB5BHbHpVaXWJhcC4W4kS4DeYJgxD7s53Z9c85r1K3lh+PFrEsoS0+IFqgKzkbI9XjXnDHoJgB1/iFaU4+wXKtvyOq31f3pPT8jH03VLaP4leJNJv5PL0zW5p7CduyMz5if/gMgU/QmuBv7S70DVp7WXdBe2U7RvsO0o6kjIP4V2Xib4a+IrvxRrN3LbJpVo15My3WozrbIfmJyNxyfwFdf8UtA8CxWuj+I7rWrzVLzUIgs66QY2jnkjRAz7j9zJ5PUnOcCtm77EqtCM4pa8yKHifXtP8AF/hLwnB4lupYNXlsZJLbWWJaMMJnUrMg6qQoO8c561xdz8NPE9vqX2KPSZ70lRJHPaDzYZEPIZZBwR710/irxnZaLoHhZtG0Cyj82xkMM2pD7XLAoncYG75eTk5K96xrL4xa3OJbLXnbXdEuQFmsGPl7QOhhKAeWw9hj1FO4UlUjC8ErG9pEnifw+YNM1HXtKuoZSI10a9b+0mz0CCJQxVjnHDCveNG03w5oelax4c06SOw8QpbYuRYO0RtjN8xiRmLmMnZ8yjOCfevJH8MQ/BXw3L4m0uG51PXbxMWckiANo0Mi5EkygnEpDEA9OM1wXw+128hs/F1zFcE6glpHqCSSEljJFcI5YnrnDN9c1m/ffkcVSl9ZjzQei/Fml4kOleDLmMS+BIJYpj5kF3c6lLcwzr2Ksm0HnqP0FZVv8UbnTJ4Z9M0Dw/p80B3xyR6eHdWznIZyxyPrWt4i8RSeH9RS6it49S8IeIo/tx0uU/uldv8AWohH+rdXzgjnBGetYd/4JttYs5dT8J3EmpWsY3T6bLgXlqPdR/rF/wBpfxFaWPQpwjy++jsPin8V/Fl9rmnzWeqS2kF/p1tLClmojJLL8wDY3ffDd6574reK9W/tO10V9Wu5zpdqkNw/2hvnuCC8pJzzhm2/Ra2fC9hDq9h4K1q7UfY9EivPtZOOkDeagP18wAA15zp2nap448QiG0gmvdRv5yxCKWO5mySfpkk1EvdQqUaa7Wjc9i+PybfAPwqvAT9p/swqZd2TgLGR19yavt+0ZoXiTSdFtPFfg99fudPjVTeyXe1i+BvcAAYyQDisf9p7UYtP1nw54StmD22g6dHGTnJ3sADn8FU/jXb/ALNnwZ8L+KfBZ17XLJdVuLieSFIpGISJUIHABGWOa5ny8vvI89xoxwsatVN66WPNPib43t/iX40bV7S0ksbX7PFBFBK4ZgEGM8cd69T+AfwLXxgy6/r7iw8MWzj55W2fanyAFUn+HOAT+A6kjom+C/w18B+K7i/13WoksWXzbXRLiYLj13HlmXPQfzr0pfFHh/xz8PNU+067Z6bpsMsdvFaaapeOIAhlUAhTIzd8AAD8a58TiJKiqdJNLa51U6kZRShoki1Lcaj44u/iHpl1Y3VpYDR9ltYyqePLzh8erZ7Z4A5r5S1/ww1oDuTBHXiv0X+Bw0y48B2z2l1cX0aO8QnvI9smAfu4yflA6c4r5o/artdKtvHNwLARKxgRphFj/WEc5A4zgCuLJsdzYqeFULLf0t/mdWIw0qOHhXUr36Hx7q9l5bNxXLXkYBOOldz4hIErY9TXEaiwDMK+prpI1oNyV2ZchwarsRmppDk1XbrXlSep6Frjc4ppOTQTmkJxWVzUQtxTCc0E5pKlsaEYjFMJyaVulMJxWbZSAnNMbrSk4pjNzUMoQnNMbrSk4prNzS2KEJGKYTk0rdKbWb1KQjdKbnFKTmmt1rJlIbnFIx70E84prHtU3KGk00nJpW6U1jgVDKGn73tSE8YpRTT1qRjW6U3OKUnNNbrUFDW6U2nkZpNuOtKxSdiPOKYetSsgx3pjJgcVLKTuRscmkJ4x3opG61lLcYg6ip0GQMVAODnpXWeAfA91411IRI32bT4fmubx+FjXvyeCcdBW0IOpJRiTOXJHmZf8A/DXW/H0kw0q3QxQYEs80gSNSegyep9hXrGlfs3DWbOe00PxLp2s+JrfDzabC4VQhyPlbPUEfSuK8X+OrRbKLwv4YJtdAtciSRDta7k7sx6kZ/M12P7OtlcWnjTTfERPkaXpdwkk85UnfuyBEij77sTgAeuTivYjTpwTildo8LEVa3K6jlZdEen/AAo/ZN8S+GfFdprfiK1s/wCzrOKSYRxzCVi4U7QRjtyfwFeC/E34ga/4wurqC6v5V03zW8q0ixGgUH5QwHU4x1r9RdR8daI2iS2FjiXXrhZra2tpUOw3Kw7zG7DIGNwB6jPGa/PXx78Nf+EogudU8P6Td6VexAvd6LdwsgU55NuzABlz/AeR71nQqyrRkmrWOLD1r1FOtZ7fI8f0q8k0Xw0NQjRZWh1Hy5o2/jjeLBUjuDt/lV7wz4OsINafxDKwk8LWkZu0ZvvMR0jI/vKf5D1rYg+Geuy+CNcSe0FpMs0VxFHcOEc7Q2c9hwwxmsrwXAmlRajomt6lpw0m/j2mMXSu8cv8JXHTsT7gVUY2mrr09T1udSjJwl/wxyHjbxvc+M9bkvZ8pEuUt4e0aZ4H1PU1z5uSTW94t+Huq+Fw87Kt7YdVurc7lx2LDqK5i1hlvrhLe3jaaeRtqIoyWNeRWdXn99as9Kn7P2fubI9k8APp0Xw2nW/j863u7iUyoy7s7BkcewGa5jSdbTSNObw9r8Kz6FeMZIbyJtwjJ5BVu/r6irOqTr4G0DQdJuJllvxd/apoozwiMCGU/mRXH/aJdI1S90eSFr+xaUr9lXPIz8rJ6HGDmvRq1eTkj1Ss/mctOmm5S6N3IvGPh1/C2pi380T28q+ZBKOrIemfeufZtxr0n4pWAGgeH7ncxZEMB8zhyMDGR/wHmvNth7V4+Mp+zqtLZnfQm6kFJjX602nFSTSEYNcLR0jGPakoPJzRUMpCMcmmk45paa3PFSUJRRRgnAHU9KLXskII4nmkCRozueiqMk0yvVZb7SfD2oWkUdqG1Z0ig4XGFIAyT09a4nx1BHbeKb1IkWNcqxC9MlRmuyvhvZQ5r37mNOrzy5bHPHqKKDyc0V5x0iN6U2lJyas2elXmoIz21rLOqnBKLnBqlFy2Bu25Vpp61audPubM4nt5YecZkQqCaqnrUOLWjGmnqhKVQWYKASScUDGea7rQvB1o9nZXbXFx9pkTzVaMDahHPoa2o0ZVW0kTOSitSK+8FWNjY3cu+5klihMgLYVc+n1FcNz361rXPibVLiKSKW9eSNwVZSByPyrKqq86crcisKmpK/MFFFFcZqFFFFABSqcMKSiqQDqKKKAFHWnUzOMU/OaCWFKhw1JR0OasQ+gfe9qKKAHUUUVUdwHg5opq8cU6rJHA/Lilpq9adQA6gfe9qByDRVIlj6B972oopiH0qntSDkZo6HNUhWHjrTqZTwc1SBir1p6nBqPOKdVXJsSBiDTw5xUY5GaMVdyWiXf61e0fW77QLxbrT7l7aYdSh4b2I7j61mAc1KOlaQm4u8dCHFS0Z6xaXem/FW0P7uLTfFlqA8Todq3BHP48+vSuZ8Q+FLu58VXv7oWcDBbmaWb5Y4QwBbJ9jkYHWuUsrybT7yC6t38ueFw8bjsRzXqPie+PxH8BnWLbzIr3T3AurRGyjerY+h4PsRXu05QxtKXMvfj+J501LDyXK/df4FbRvFdt4J0kT6bb7ree5WHzpB+9uUTJkc+nUACs+38ExJq19faneGPw/AVnN5/HchxuVE9WPQ+nNO/4Rv7QYhqs5stC0aJY5ZgPnllb52SMd2JOPbFV9U1ceMtDktbW3Syh0cGS1s4yTugOA+fVgeSfc1pLVJVFtsiOVKV4fNlXxN4wl8RTxRRRCx0q1G20sojhYl9T6sepNauuzjQNAsNEU7bqXF5fEf3iP3cZ/wB1efq1c54WtYpdQa5uV32dlGbmYdjj7q/i2B+NV73U5tUvp7u5ffNM5d29ya4vaS5PaS3e3odKguZRWyOwvb4ReANGi3FmkvbmXGOAAsa1zpuyRWxqWl30nhzw1aw2VzLLIJ5gqxkk7nAGB6YUH8ahHhCSzO7WL+00hf8AnlI/mTH6IuT+eK6akajaVjCHLFbiaB4lGlyS293EbzSbkbbm1LY4/vr6MOx/CjXfC11p86yWaSahps/z291ChcOp6BsdGHQg96jlvfDtiALa1utWlH/LS7fyYz9EXJ/Miug0T4u3Wn6cNJextrXTJCQzWIaOWMHqynd97PNVT9nL3K0vS2pM+eL56UfUTwzF4n8IyCSS/h0SybHmQanKNki+hhOSePYV9LaTZ6XPocRtbe0/s2WLfiGMLGysPmwPQ5NfNcvg+18LD+2fEtx/aFtMc2NtDIfMvehDMSPlTkZ79qpwfErWLzxHaXM949vYrPHmxgYpbrGONoQHGNua+gweMjl141Fe/wB55uIwzxfvQex2vjfT4Y7VZDp2oS+HkY+S+i3EJtVH+1tQkHH97muOgl8JHb/oOsfhcxf/ABFQDVtU8A+KNRh0m+lsvKndNsZ+V1zkZXoePWu68NfYvHZlvPEPh22sNPX/AF2tWD/ZNv1Q5WQ98AZNedKpGvN8ujvs0auLoxTlt5b/AHGJap4OfGdP1s/S6h/+Ir2n4WfATRvGksFxNaavo8GVlia6uog8oyMFVCZwTxnj2qPwP8OtOvGtH+Hs+m+JNS6Syau4Wa3GfvrbsMDHr8x9q91+Dnw2v/FHjma2nGpLp3h+Rbm5vXjZZNSvVxjeW6KOdqDt9aJzhh4uU2tEeZWqyqPlpXPlz486gfEnxF1B1tHtVsR9hCyNlm8skFj6ZOfwryu6s9navffitpH23xhrd+bB9PNxdSSfZpM7oiTypz3zmvH9ZtBE7DHSuqpRc6an31OzD1EoqK6HIypg+9V2U4IrQu0CtxVJ+Oa8SWjPVT0I85pQcUzOGpQc1CZZIDg09SMVGDmlBxWkdiSYHBp6kYqIHNOBxVk2JQcGnZzUYOacDimhEqkZp2c1EDinq4A5rRMmxKp5p9Q04OQKpMmxIDg07OaYDmlBxVhYlBzSjjrUQPNOzTuSSZzTgcVGDil3VdyeVEoODT1kqEcGl3gdaaZDWp9E/C3V9I0f9n/U77XLKTUNPg12N/s8ePmfCbcg8EA84PpUfwt+InhC88d3QvdHv7q91iM2/wBqv5knDFuShjwqqpAAGPpXMfBrxpoFxod74C8VxGLRdVnEsV9G+1oJ+AuT2GQOe2eeK53xp4Pvfg38Q7e3lmW4W3ljvbW6QcSx7sgn0PHIraMjwPZRlUqU56N6r0H3nxMks7y4GjaHo+jxB28vbZLJMq54BaTdzj/Cuw+H3ijXJLiy8Q63qtxLFLdpY6XYs/lpcTMwDMVXH7tAcnHfA9a5DV/CMFz8T9YtJHe30WCZr64uVX/VWxHmA/Uhgo9yKueGfEa+KfinoUkUH2bStOY/Y7OPkRQxKzjPqWK5ZvU5rRN31OmdOEocsO2rOt13UdO+OWr6hpNzLFYeMbO4mi0u9c7ItQiV2Cwyf3XAGFbv0ritB0qW60HxN4VvbR7bWLM/2jbRSKRIJIgRNHj3Tn/gNcJLdyT3T3O9hK7mXfn5sk5z+de4fC7WJfi54ksob9hF4x01BLZ6sIspdQpw8V1jliVyA3XnBrJOzInTeGp3Xw/qeeeMHz4Z8FHPB06X/wBKJK6fw1pln8KtDtfFmvWxuNeuwX0TSZRgLjj7VKP7oz8o7mvWPH/wetPCNva+JTC2tWOgWgjs9GiiJMsplJUyEfeRS4JGMnHNfP2uWHjTx1q93rF7pWq391M3zSC1k2r/AHVUY4UDgAdqG23oLD144qGkrR6+fkZtr4u1qz16TWotQmGpyyGWWdmz5hJ53A8EH0IIr0nwI2j+NNTvprJU0XXLrTrq2n0uAHyrtmiOHhHY5Ayh9MjHSvOT4A8Uj/mXdU/8BJP8K674X/D3xXb+OdBu20O8t4FuctLOvlbUwQx5IPTNaRunsdVdUvZtppMydE3X/hTXPDd/HJFqFiTqFlE6kMki8Tx4PPKfNj1SuSsXukv4PsTzLelwsJtyfM3k8AEd88cV7pZaB4m03xlbReJdDku7mxcLba9agOxTHCzcjzkKnByNwBrc8N/CHT/hZ4t1fxtrc0UXhzSmM2lws4LTSMMqMexO0dycHtRO61ORYqME+ZXb2Xmbt3YaD4Z+F8Vh8SLqLStS1TEt4lg2J5yrArlVB+baqhjjkg9eteba/wDHuy8M6W+hfDXSV8PWGfn1KVQ11Me5yc4yO5yfpXlPibxJeeL9fvdYv5WkurqVpDls7QTwo9gOMVnKM8dqztz6MqlgUvfqO99beZPdXtxqV3Lc3c8l1cysWkmlYszn1JPWvoP9lnV9St9K8b21hdyNdRWAuLOywGQy/MN4B752jHfNfP0cBNdz8H7/AF3RviBpMnh9JJL6SURNEqbg8ZI3hh6Ac5PTFVKHuM6MVBTotI9CtXm/aCsklQRRfEGwTbLFjy01CAdx2V0zyK9C0v4aHwB4S0+78bXCWWm2t1NcT2ttIryXTkII40I9QGyewzVvwzaaJ4C+OXim4Lt5l5BJcyLFbFbewtwAzSPIeDuIPC55NX/Hvjvwx8YEsPBWj6r9rvbuZLkXMMDSRxBMsQW42kqTzz0wcVzSnPSMfhPI52npH3dzr/HXxevNJ+CWikImlXOtSl7e2tjs+z2y8qox7BMnvur5j8ReK2u9zPKWY9STWn+0X8QIdV8ax6Tp8ofTdEtlso1Q8Bx9/B74wB+FeOXWsM4OWxXTgKMMNS0Wrep2+zlX5W9lsWdY1AySMSeprl72TLGpru93k85rovhf8PH+KOvXVgL0adFbW7XD3Bj3gYIABGR1zW1SfNoj0PdoQ5p7I4WRsZzVdjk8V6l8Uvg1B8PvDFjrdt4gj1q3u7jyEMUO1ejHO7cc/dxXle70rz5pxdmdVCrCvHng9AYjFMJyaCc00nFZM6LC5FMY80m6ms3NQ2UkBOabnFBOKaTmoKGk5pM4pCcUhOaQ0NbpTc4pWbimE5rJu5SCmt1pScU1m5qblCE5pucUGm5zWdyrCN0ptKTmmk4qWUkNzikJyaVulNqLjEJpucUE4ppOam5SEagLxzSgZqWNM0hjRH8tL5VW44N3A61bj08sO+a1jTbM5TSMfyD6VFKgFb76aU7HFUZ7TbkkcUSptDjUTMd14x3qEjjHet2w8Naprb7bCwubsf3ooiQPx6V0mn/BbW5V8/VZLfRLQDLSXMgLD8Af5kVMcLVqv3Y/5FSrU4auRY+HenadoXhfVvFWsWUV7EpEFrBOoIkbIzjPfOBn0BrofEXxG0Oz0eDSZNGILiOa4sLZ/LiTI3YJXG48jjArN8S3+kyWtlpljMl14f0CETzSJytxOSQie+SST9TXE2tkl0j67rsjR21w7PHAhxLdN6KOy+/5V68qssNFUaVtt/zPOVNVm6lTv/wx6V4d1fws1kdUGmR6PYQMqMJrRJ2mJ6rGWPJ9eCBzXsfgrxjFaeFL7xJp+vWdpbw+ZDYWLW629pBIQF3ElS5bLZyO+K+WLCTUPH3iCx05AlvH/q4ooxiO2iHLHHsMknvWp4w8WQ31xb6XprY0TSgYbUD/AJaHPzyt/tMR+VZRr3jzP/hzKthPaNRv/wAA+jfEuu+Orrwr4bjtPEI1C72z3E89rqKKZiZAUIyylxhR2xnNcr8YPC+v+IIYvF9rbXiNdQq2pWbM3mQ3AwrlVz8ytjdxnGa8n8b6gV1Ows8giy0+3hBGeDtDkfmxrpPhz8Q7yMx+GtU1KeHQrwGBJUba9o5OVdWHOA2Mg8YJq/ap+60cyws6aUo2sVbHxHceJdE1nStduJbVltFc6iyncEV1AWQfxDOOeuK801/w3eaE6i5QPbycw3ER3RSr2Knv9OtexaP/AMJbH4o1fQL+ea8uobadY1ulEiu4GUOWB+U4yMnHNUV1+00C3Fl4gTT9RZn3nTtMtUcKx/vMDsz7Lz2rGrSjVSU3Y7aVR023DbyOH+Fer6hF4li02NjLp90CJoZAXQAKTn26V6TrdjY+HNI1C/sLO0s7qG3YpIIgMY6dOvNR6o0Xh21SXS9HVb9ysx0mErFLAjD78ijO45xjsM8iuQ8YeIrKNrew1i6v5nWNTPZrho1fr+8Ixv7cdK7KTjhaLjN3fRvoS716qlFWXUw4Ybbxpov9paqDb3Nv8s18OPMAxglQOeuCR0qf4h6olvFavpkMcMdyhV7yIAsyjAC7h0GPxrM/tSKbUYryPXIh5S+WtrPbNHEEPVcLkAGty30c2+jX66XJZ6lp8kgliheQFfR0OcYxwQeK8u/tIOK3fXdne17NpvYzfEStcfC7w9LMo8xZmRGHdfmA/kK4QR7RzXu/hLQxrOmjRb+zk/s1htEVwQXgbqDHIPvLnpnkZ715b4n8Ly+G9evdNlRswSEKxGNynlW/EEVhi6DajVT02Lw9ZXdP5nM+XUbrg+1az2e2qU0WwV5MoNHfzIoMKa3Ax3qxIgzUEg71ztdDVDMZppHelJxVvRbRL/V7S2lyI5pAjbTg4NJJuSiupWiV2Us01utd5q3gfT5UvIdHklbULNsyQTMMsuM/Lxz1rhHUqxVhtYcEHtWtajOjK0jOnUVTVHpOhX2keITpd5ezwpqNqvltG5xuPG1v0z+NcL4i1CXUdZu7icKrs+3C9ABwP5VnHnrzSNzTq4l1Y8tvXzCFJQldMSiig8DNcRsXNBtY73WbK3mXdFJKFYZxxXoNjbw2wu9M0dLmxlEgZ7mVcoMEAkEnnjNeZ288lrOk0LmOVDlWHUGr1z4l1W7ieKa/meNuCu7rXdQrwpRaa1OepTlN6PQ3PHGvW97bW+nwzyXclu+ZLhsYY4xxiuOpx4HtSIrSOFVSzE4AAyTXLWqOtLmN4RUFbob/AIT0S21b7bJeCV4rdA+2E/MT9PwrW8QifSdHs7nTby5tLRxt+yynaR9Aea5yB9V0OFpYluLSJyAzlCoPXA5H1qpqGpXepurXVxJOyjALnpW6qxp03G1myOTmlzX0KtFFFcLNwoooqQCiiigdrBRRRTQhwPy4opF60tMApyjim0oPOKAHUUUU0QOBzS01eOKdVAKnSlpF60tACg4NOplOHStI7EsUdafnNMpy9KYDl60tN704HNUgFTpTqavWnUyBV606mZxTqaAfnNOBxTF60tUiR9OXpTaUHFUA9etLTQcU4HNUIKfGeaZSg4NMkl/Wvffg1p9nD4OjuYURrm4dhcMeScMQAfwx+deBV6h8NbmLwp4P1bxM/nTyI/kJbh8Jk4AJHfk9ewr3coqKlW5pK9jzsbBzpWTsP+L9rEdegt5tQezs1j3RwG2YwqxyWIK9STyeM1ynh60Nhq1tcWuq2EkitgpJIyB1PBU7l6EH9a1dC8fQalC+keKIjd6bM5dLhTmW3YnOVPUgZ+v1qxeeEYfA2dZklj1WzcD+zXQbo5WIOGfsAvXHc4rrqqNer7emrr8TCDdOPsp7mn4r8HQ+EdKe3e+js7O/ui7uFLy7F5WNVHXGTk5xwK5WO98P6Yx+z2E+qyDgS3z7I/8AvhefzNXbHUrnxbpV5pt/LLe30ebqyZuW3DmRB7FckD1Fc4luemMVhWqxclKlHTzLpxdnGb1O98d+PtT1LQtCtYyNPhltRK4tCUDfMyhevAAUcetedsSWJJJJ6knJrrPF9vsXQoQm1U0yEr77tzH9TXNSR7eorLEzlUnaTuaUYxjT0K5yOTXZ6F4ds/D1lb674lQ/Z5BvstMHEl2R0LD+GPPc9af4f0C38O6WniXXrcS25ONP0+Q4a7cfxsP+eY9e5rnNX1XUfFmsvdXLPd3k7BVVBnHoqgdAOwrSMVQXNL4+i/zIlL2nurRG6vjZvENxdw+JHkns7pt6SRjJs3xgGNf7vQFfSoT8PdaNxH9ntvtFpIN0d8hxbsmM7954A/l0pq6Bp2gL5mvzmS5XkaXZsDJ9JH6J9OTW7F8RV8Q6SPDWpQRaXpDYWCa03fuCPu7wT8y+v511QUJ/7zLXp3+ZlK8f4S06mh4om0fSb601a4gXW7+8to2EW4/ZQyjYzFgcv8ynjj6msiPVdY8dataW0s32iZ3EUEAwkUQPYAcKB1z7UaroeoHRNJ0xraSbUrS9mtEiiUsZEYK6lcdR94j616n4b+G+m+A/DJuPEmuW+jXl8pSdkAedISPmiiz0JB+ZgD6V1xo1qs3ZWjuck6kKUFJ6y2Ktr4mtfCWl/wBhaDcB7iXjU9VhJDTMDnyoz2jHqMbjX3/+y38XNPf4RWd/rt6YDZM1tNfahIAshB+Uqx68YH4Edq+E9K8efCbwmVGneFrvxBOgwJNQbCE/Qn/2WpfHHx7vPHWm6fpcWnW2i6TZOzxWVmTsLHuRwMjnsOprLE4enjKaoyatfc4oc6mpxjZ92emftH/ELRvG3xB1fU9HAaylKBZMbfMKqFZse5H6V8365OrSOR3qe+8QNMpBfI+tc3fX/mE5PNejOpTo0Y0YbRVjejSd3KW7ZQu3BLGqJ6mpJpM5qqznNfP1JXZ6sFYSnA4pm6lBzWZdh9KDTQc0tUmIlzmnA4qJW5p45Fap3JsSA4NPUjFRA5pwOKYiUHBp2c1HupVbiqJJlIzTsioVbmnbqq7RLRKDg08OMc1EGBNLWlwsTUoOKiU4PNO3iqTJZJnNOBxUYOKXdTuKxIDmlBxUeR2pc00xDzhgQTxXtvxCil+JXwn8GeJrRDd6lZEaLfIg3OW/5Z5Hvj/x6vEVGRmvoX9nPX/J+H3jWxECXM1gF1KKIn5mwuG2nqGATg9iRWtNXdjysa+SMa0Vqmc18WL6fQvD2k6Sgh+1X9rGuqXdu4YSvB+7EQPouMn1Jrk/huTb6hrN9g4s9Iu5MhsYLJ5Yz/31/Kuj8Z6FbD4X6fqGmXp1DSotTkaCVv8AWxrMgLJKOzB0PPfOa57wn/o3hDxjdHYM20FspY85eYZA+oQ1vJWmiaVlS5Ucap4H5V6v+zlqVz4d8bXWuHy49HsLKVtSnlziOE4xt9WLBQB3ryxUZ2Cohdm4CqMknsBXoXjlD4A8I2Pg2CQf2hd7NR1pVJyshH7mAn/ZU7iP7xrFGuIiqkPY/wAx738SPivF46+Fd8fCU06X9xCbkJIpinMEUgEpj2nll479M18pz+KtZvECz6vfTKDkb7lyM+vWut0TxRd+GPCHhbW7N1efS9Wuo/LkHysjxozIf9kgMD9aqfFDwvZ2VzZ+IdCBbw3rSma3AOfs0v8Ay0gb0KnpntiqbOXCUYYa9Po9mcr/AGxf/wDP/c/9/m/xq3onibUdG1yx1KK+nW4tZVdJN5JUZ+Yc9QRnjvmsXHuau6Lot14g1W20+zXfcTsEUdAPUk9gBkk0oybaSPTnTjyu+x6X4jspr74j+JfEOtu95pGl3YeQPIQZif8AUQL9flyB0ANdxczp+0N8LbeG21E2/ifw8j3NxZyjZDMhJ5XHGABhfToa8++OOtvJq+naRBIj6bBaw3AmiGBdStGA0x9SdoA+hrqv2bV/snRvHuvXX7rTINMNu0p/vkMcAd+MfmPWrcteU8WcOWjGts09DxOIblFX7S23445qpbDIAxXQ6Ta+YwHetqUeY9acmlqLb6azLkAkjnGK+jrizsv2ffh7YyaXEbnxh4htRKNReMbbeIgEhc9MbgB6nmvLvDXhiXVZY4IIXmllOxEjUlmJ4AAr7F8ffDBYbDwr4g1exaey8O6WC1psLGa5OwRxkDsGGT9K4sfXhhpwg+vTv2PPkp4i9lotzwPxBr9ra+ALL4e6pdtaeIry1Rpr45McbvJ5ixSv97LBhu7Amue8E29x8D/AviXxNqNuINeuZjpOnROnKuOWf/dP3sjrtFO8U/Dm6mv7rWfFmo22greStO4lzJcybuflhXnHP8WPSmfH66jt/hf8O7G2uLu5tHjmuFlu2G914C7gOOjHvwK3drJR1vuYRgrqC2b1PBLq+kmleWRzJK7FnduSxJyST6k1QluieppbklRVGRvWlOVtD3YRTVx7zE9a3PBPxE1j4eX9xeaNJFHPPF5LmaIONu4HAB6cgVy7y0wnIrnc3e6NZU4yVpK6O18c/GHxH8Q9Nt7DWJbaS2gl85BBbrHhsEduvU1xNBOKaZMGs5Tu9R06caceWCshW6UwnJpKQnFZNm4E5pucUE4pjNzU3CwZFNYjNITikJzUjQmcU0nJoJzSE4rNsoQnNJnFITikJzUNlCZxTScmgnNITioZSEJzTG60pOKQnNTcYh6UzOKVmOKYTmoZSCmt1pScU1m5pMpCE5pucUE4ppOakY9RwBVmFM49arpzzVuBsMKqKuxPY1rC3DYxXWaJ4dl1CZIoY2lkc4VEUsxPsB1rnNJKllB45r6z/Ykl0aP4qIdSaNbg2kgsy7ADzON3XvtzivZpuNKnKo1e3TueViJuC0PI9L+BPirxFrK6Xa6JdR3W3e/2mJokjU9GYsOB6evatPxFp3gH4LxtZS20fjTxPGQZnOPs0DDPyjqOvsT9K/Qf9oh5bj4cX9voeq22k6nKqqs086wArkbhvP3cjjPHXrX5sap8JfEsXiqysr/R7lIprhd9wo8yMpkFm3rkYxnnPNc+GxCxUPacvL5Hn8/M7VJ2S7E/jXx1rGpSQ6Po93Fourx26SPYwIoSUsoYojnowB+73rwjWNU1bVrrytQubu7uNwTy53Zju6Ywe+fatzxvqb6n4q1W9O5HkuXZVxgqAxC+/AA/Ku58MWsd7oq6xrlrb/23EAllPMxEkpx+7LDI+bIwCeSK0lzYubhdq33HqUoRw0FK1zkNU0q08NaPY2mqBljizM9qjYe6nx0J7Io4z3OcVxepavPq9ybicjONqovCoo6Ko7AUazdXt5qdxLqLSG8LESeZwwPpjtj0q/4P0KLV9SeS7by9Ls0+0Xcn+wP4fqxGK8ypN1KnJBWR6UIKEeaWprWlzJ4M8JSsUKanrabY3/ijtQfmPsXPH0rn9Nj+031tbjrLKqA/UgVLrOpXfi/XpbmOB3eQhIbeIZ8tBwqgewArrPA/hy30nxPp8mr3EP2hCZF0+Iea4wpO5yOFA6+tOMHUqRhH4VoZ83JTdSW7K2src+IvGeox2UMt3I9wURIwWJAwv4Diuk07wxouizsNf1A3Myf8uGlkOSfR5T8q/hk1Vlk1jxXqV5B4V025g0eWQ/NBD5XmE9S798nPGeK6DQ/h7pWksh8SeLNP0zbgm1sQby4HthflB+prtgvfv+JxVJrltfpsfQXhGz1H426Rp1zoFg1raWLy2WqWkkgAZHgIjIfjIB7dQTmvMovgnP8ACHTJ/EnjCa10zUY/3dhZSATOHzgylQfmIGSo6ZOTX1R+y/4x+H/gjwFIr39xpmnXV3I1vd64yQtdlVUM0YH8IPH5151+1n440DUW0zXbLw1pXi/RCj26aq88hWGXfzHhGGPXnr2oVWUqji46LqeDCc4VPZ09n958c65418rVPM0mGSINKJJ7u4bddXZyCd7D7oP91eKq+Pr/AE3xbrs6Ef2XqFu3krJId0U2OzMPukdAeR610S+LNF1bW7O1j8FaRAZpkQOs0x25PXlq5LWfEOgnU7/zfDMUzee+JUvJF3fMeTnPWsqs/dalJcr6M+jpbq0bNHI6pplzpFyYbuIxS4yCejD1B6Ee4rqPhpqFpHqcul6mxOm6gnlGLGVLkjafatTRPHnh+C3NteaCY7dB+7HmeeVz1A342j6UX6aHYRwajY6B9pslkDLc21+4ZWzkB1wSpziualSjCaqU5p+R0VJucXCUWjK1fSLrw34ivbOJp7QRSHyvnIOzqpz9K9+ufhBqnxx8B+HfEPh21S71eJTZ36NIsbMV4zk8HBH5PWDFJ4X8VXtraXuj3U95JaC7sSl6Izc7/mMQbHUHdgHPSvrP9mzxj4K8G+BtKs9Q8vwkt3JJPb2Wq3YaaVS2C5JAxk8AGuxx9kpNao8PF4ipCMZQj7x8CeNfh7q3gfVptL1qxksL2LBaKQdQehB6EH1FcNeQbCcivtH9vi9gufiFpfkWjxW0engR3JA2T5cn5COoGQK+ONUIBbFcFaEeVStY9bA4h16aqPqYEy7c1Vk6Grlx94+9U5O/1rxpntR2Ij0qWyu3sLuG5jx5kTB1yMjI9ahJzSVldp3W5b1Vmd5qVwby2j8VaM5jvEwt3D1A9yPSqOtWNp4k0aXXbHEV1FzdwZwM92/z2rG8N+In8O37SmMzQSKUlizjcD/Wti78Z6e2kXlnZ6OLMXCbWdCP14r1FWp1INy69PPuvU4uSUGrI4+mk5NKTxTa8XbY7xaa3WlNNzmgAoooqWA1sE1c0S9TTdXtbqQMY4n3MF6n6VSopxbi7oprmVmdf4n8XWmtaS1rCtx5hlEmZQAAOeODXHHrTicU2rqVJVZc0iYxUFZBRRRWNywooopFx2CiiigctgoooouZgOtPzmmUq9KoBaKKKAH0UDkZopogUdadTKcDmqADTx0ptKvSgBacDim0VpHYLD6B972oopkj6VfSkoBwaAHU5elNpQecVZA6nL6U2lBwaAFNPHSm0A4qxWHp0p1NHWnGmhMdnNOBxTF606qQh1FFFUSyRDxjvXovw+uV1Xwl4k0S5iD20du14jAkMHGP8BXm6nBr0b4QQC8k8QwGQRCTT2Uu3RcnGTXp4Bt1uXun+RyYnSm32OY8OaRFeebe3rGLS7XDTOOC57Rqf7x/TrXSaJ8Sbux1Kf7RaRXejTgRvpbgeWsY6BfQj1796xfFRm067GjLG9vZ2Z+RG4MhI5kJHUnt6Disy261bnKjN046NbkSgqi5pHqE3gcwrB4q8FzSX+nROJGhAzcWTDPDr3HB5/8A11D4x8NQl7PWtOjxpmqxecoXkQyj/WRfgckD0Irofh74lufhV4fku4o4ZdU1raY7a4UsscC5/eMOvzZIAPYV9AfCb4Y+Hvjr4c1PTND/AOJJK225uNOlDOlpc8hZoX7owBVkP9K9Xlgoc0lZdfI8WrXnSfM9kfM3xI0toNatIyoWNNNtAqgcAGFT/Mk0/SfDFh4Q06LxB4lt2llkXfpmjuMNdH/nq/pGDj64r7L179lAeHtXn1vXLqz1JYYYILOCdilupSNVLzZ+8oK5CDrnk14D8RLnSdM8QXF5N4ksZ9TI2yah5X2yc9QBFGv7uFR0ABJFEPZzftItMxji27UkvU8a1jTbzVrx9b8X3clhHNgpAFHnyDssUZ+6o9Tx9axLzxcYLdrLRrddKtGGGaNt1xN/vv1/AcVra5qugtPLOtpqOtXbnJutTuNoY/7qc/rWOPGN5aIRYW9lp69mt7dd4+jNk1zTnyve34/ievTTkr2INP8AB+taknmxWEqwn/lvNiNPrubAq1/wjum2DD+09dgUg/NDYIZ3+meF/U1iX2p3epSFru6muj6zSFv51XDYGMfSuVTpxd4xu/M6eWb3dke5x+Lk+H3wt0280Z7m5uNReSO2mvipa1AyDtA+nA968iudSutSuXuLu4kubhzlpJWLMT9a7PxejR/B7wXkFf305GRju1edrLivVzCrLmjTWyS/I48LTjyuVtbmrDclTV2O/Kgc8ViLIB3NSLMcda86FRrQ6nTubTXxI61WkuSTVIzE96TzPU1TqMhQSJ2kyaidstUW40oOazvc0SJAcGlzmmA5pwOKZJJnNOBxUYOKcDmqRI+lB4poOaWrTAeDg09SMVGDmlBxVczJJgcGlzmo91OVuK0JsS5zTgcVErc07dRcRIrYNO3Z61GDilBzV3ETZxRnNR5pyuAOarm7hYk3mnqcioQc06ruuhJLSp96olPzCp0HNNasklUbule2fsqsP+FiXdlIyiC806aN0P8AHgqcfkDXjcEOcete0fsvwInxd0ne23fHOi+7GM8fkDXSlyrmPOxX8KSMH4dX9lph8W6XqFs97pM9sxe3U/N+7lA3r/tKpZh9PSpPEfhL/hEfh1dmG8jv7DVdSha0uoek0SRux3DqpBIBU9CtbnhXw3C3xZudPx5drc3V3Y7QOMOHQA+2SK6bwd4YjvtC8L+E9Q083Npq97eS3B2kSwbMKJIyOVwQ2SeODniuptJXZwOoovmXlc81+HOmw+FNJvfHmowB0sG8jSoJRxPeHo3usY5PvivOtRvLnUb6e7upWnuZ3MkkjnJZicmvY/2hNNGha7pehWLE+HrCyQaeqj5Du5kfd0di3Jb8K8cnjC5rCS0ud1G017Xq/wADoLImb4X6xHvObbU7abZjIw8ci/8Asv8AKrvwy8S2Qe78La8+PD2s4jaQ8/ZLj/lnOuemDgHpkfSqXhZhL4S8Y2u5lH2WC4x1HyTKPz+Y1x43SuEVS7NwFQEkn0FZzvpY19nzc8Xp1NPxBotz4a1u90q8XFzaSmJ+oBx0I9QRhh9a6WSZ/AnhE2+BFrOuxh3bP7y3tM8L6gyHn/dx616v4f8AAUPjXwxYa94wtJLTVNFhaOWLADXtvGm6IyoDnIAx2JAFeU+IPiHZ/wBs3GoaTpqz3ch3PqWroJZDxxsi+5GAMYGCRgVpyezXMzkVZ1vdSvy7noOm/C7TdY8HeHvFXjDU20PQ7XTlgZFyJpmWR9gUEHgqR0yT6Csnx38UvDTeCm8G+CtMubDSXuFnnubhyGnI65GSeSF6n+EVa/aKv7y70D4fNe3LNdSab508PQbyF+fA4B5x+FeLJJzUzlaWgsPR9qlUqdNkaloeRXV6IwLr9RXGW8m0it/TL0xsOcCuqjJJnXWi7H0x8APEFj4Z8eaLqV+SlrBIfMYDJUFSufwzX3bqvifQvE/h29sdJ1qwe9uLZ/KKzgbcjG71GCa/LTQvERtip3dPeuom8eyvAU8zj0rizDJ45hUjWUmmjhoYmrhFKHLdM9g8X/B7wlo1zLdeKPHtkYgC7Q2TB5ZD3GcknkeleFfHrx54f8Uw6BpXhu3uodM0WB4IpLrAZwduMDrxtHWue1zXvtDPkjnvXD6pe72PSuhUJU9Zz5mvl+A6FNOSmlaxlXbDB5rPkPBqeeTJqrI4xXLOSPZirIZSFgKYX3CkrlbNrClsikzim7qRm5qQDOKaTk0M3FN3VNykBOaTOKQnFNZuaQwzimsRmhm4phOazbuNCk5pM4pCcUhOam5QmcU0nJoJzSE4rO5VhCc0mcUhOKQnNJsYmcU09aCc0hOKkqwhOaTOKQnFITmpGkJnFNJyaCc0hOKhsoQnNMbrSk4pCc1NykrjkYAVYjfBGKpq2OD0qVJBmmnZg4m9Y3JjIJNdPpniBrXaySFHXkFTgiuDin2gZNXrW5Z5oow2C7BR+Jr0aNdxaRx1qScXc+u/jz8UpdH1nwPqRcXkk2iLHf2kxzHcQtjKsvvk8+wryzTdY1P4fajr2padetd6O+nfabN3JeKbeyiIEZ+8rEggc8e9UP2kNVnuPG2nWxPmGDToo0VBySS3A/pWj4f1SDwh4NsdA1Fkm1W/uJWgKr5q2suAU3fRiOg4Nd8F7zgtLHhwpKFKMkr36HO6h42ureO1l8TaLYazr9zKHtbd7dY5YVLdXZRnJOAAQTxWH4zufDetXb6b/a9zpc9vMzs86+fC8rfeJcfN8v3QcY4pNO8PXuhTalrHiK4j0/UfmS0lvCXZ5T96QAZLEDp9RXJXM/h+wVha29zq1x1M943lx/XYpyfxNc9StJK0ktej3PVpUoxfNF/NHa6D8Pm8X2/kalqFpfQW4Bh1KwnDysuf9W4Izj0J6Vu6l8J47fR4NLs7po9N8wz3BJAlnbooZum0DPAB57Vz/hDxbdeE/DtxrV5Fbx2twwhstPghWPzmB+Zyeu1Rxk9a2V8dzeONKnurSCaCewzJPYW8uJWhP/LWNscle6kYxXZSeEVPlcfea/A55+357p6HPagmkaBZm2EepyW6nDQaZA0MbnuHmcbm/AAVX8LeModIvriWx8OW1jDDbSSszF3mkx93Lt2yR0FWdV1/XYLWK/tr1dZ0jhTcbDHJEeuyXYQQR69DVvRfFIu9C1S6uft1p9mSNPNjn88gu/GBIPbpnoa43NKfuvlXob68t5K5wup+K9S1q6eW6vJirMWWESMI489lXsK6z4b+H7XU5ptU1eRrXw7p2JLqReGlJ6RJ/tMQPwrS8OWMni7UvstlrVnOmwyOl3pKB1A7jAwecd6PGt9rcMz6fY6HayaFZP8AIkMCyIz/AMUjBehPp2rn5Gl7STuaSmpv2UVYb4v+Jt34y1f7XKi21rEggtLKPiO2hH3UUD9T61B4b+I83hu6njlj+36Rdp5V9p8jfJOh9uzDqD6iuQl8Qwxs6XOhWiHqVHmxsD7fNTovEej+Uol0BWbPzGO8dc/TOal13tcv2CatynXr4WGkeKbHVtPZ7zQZY5bq1uVOSoVCdj+jKcDHevKZi0hJPU89c16t4C8daf4esdYlt7C7S1iRJXjkuRIpJYLwNoweT9az/EvhPQrU2+qrdalLpmokyR3MEMbojHlkPIww9KzrU41IKUGVSqOnO00ealM461e0fUrnRrtbm1k2OOCGGVYHqGB4IPpXRr4e8PzD5NfmibP/AC2sGwfptJrR0X4dWWs3gWHxDaG0iQzXMhikRoox94nK4Htk9a5YUJ3XL+Z0yrws+b8jt/Av2DxBDpXiBLcacdDmdRaqfluZD86Rxk9Msenaq/xD8UyeOUXxGsLWtzaKLK/sW5a3IJ2N7qc4z2IrPkb+2ftmi6ffaauirbmOxtIrgbxIp3LI2RksSOT7iqug3mow3ca6vbQXyNF5JvLe4jaR4yOUcbv3g7c/NxxXq8+iX9XPLVO8ub7jrvDPjKTxP8JfEun+IGGpWGkIJLFpmzLBIQ2ArdcZA7+1fP8AeS7iec16l4xtk8G/Dq9tbN2aLUb9WJPURgZVfw2144824da87HScOWEt1uduDpr3pR2exHK2W9qrSEYNPZ8moHbPFeDJ3PYXYbR2zRSMe1QUNooorO9ytVoITkUlFFIBG6U2lJ5xSUmAU1+lO9Ka3WkNISiiikUI3pSUE5NFABRRRUgFFFFBcdgooooG9QooooI2ClU4NJRVCHUUUUAKtOFNBxSjmgTFpVODSUVSJH0D73tRRTAdRSA5paAHg/Liimr1p1ak2FXrTqYDinA5oAfnNFIvWlpoTH9s0UintS1RI7OaWmr1p1NAOzmnLzxTF604HBqhIdTl6U2lBxVEkmc0U0HFOBzVIArvfhW2IfFA9dMeuCrs/hLqb2PjK3t8b4b1Gt5UPQjGQT9MfrXfgpJYiN+pyYhXps0P7VtvEPhq1l1NXmWALbSzxqDNbN/C/wDtIwHIPccVPo3gj+zGOr6oUn8PwYlE1u24XPPyoo6jJ4OegzWVYQDRvG1/oqq1xZ3Er2cqL12E5Df8B4P4Vv3vi9fDkI8JyQfbtEiQRyyH5ZZcndvQ5wACeB3r048sr1Ku6/PocTUrWh1/LqVJdfn13V5b+5YeZKwIUDhFHCqPYDgV9S/sYfFNPBnjmbTZbcz2+qQ7WdSB5JjDPvOe2N2fwr5R1LRf7LWO8s5xf6VKcRXKdV/2ZB/Cw6Yrvfhrrn/COeGPFviDIE0dmNNtWJ5Es52sR9EB/OtVLmhKlU6nJiaalTsj7P8Ajf8AHST4oadcaR4Ivjbavp4W8ktbmNQ97CYwwEOchiAQSp59K+Ktf+J+pXzMLqz0m7bcT++0yIFT36AU7xv4tu9M8Wabf2U7213b2Nk8MycFGECYI/Ko/E0cfxR0+XxBotqkGtxkDU9LthgSknieIeh7jt1qqcY0qfsqS2OWlR5GpT1T69jlL7xfaXTOZ/DeksWOSYVkiOfXhqzX1nQZm/e+H3iyOfs96wwfUAg/1qu3h/VpnKjTboHvviKgc474qVvBOqIN0/2S0GCc3F3GmB9M5ri5q0noj2EqaW4xpfC8xUmHVrfPDbZI5APfkDNdn8OPh7o3iW++3NJfT6bbBpGjuYkjE7L/AAghiSB3/LIrnbPwPZ21ut/q2tWsenB9p+yhpHkPdU4APpnpXongCTTprnVNfhu5otKsLN7WKOSERQRBh0Uk5LccnHJNetgqClVXtoLTX5dzmr1LQapyZ598Q/iFP44vo0jiFppVrlbW0UAbR03H3P6VyYOKjBpwOa8WrVlWqOcup304RhFRiSA4NPVziogc04HFZXL2JVc5p2c1EDinK3FXe5FiQMc80uc02lBxQBIDTgeKjBxTgc1aYiQHBpc5pgOacDiqJJMilUjFMoBxV3JsS0oOKZupQc00xEikZp2RUQOKcDmtE7E2JcinKRiogc04HFXe4iVSM07IqIHFLupoSJR1pcimbqUEY5p3EyQEil3mo80bqpBYsIRmrEXJqmjDOBVqFvmrSD1M5K5tWMYOBXpnwu1q58IeKtO1q0jjlmtJNwjk6MCCrD24J57V5pp0g3CvQfC86K4JxjNezRgqkbM8rENpH1jF8INO+K91Z+M/Afl22oJcJLfaVcOEKSght4PbPfseo54p/wAefD0Xwr0NLezt9usanDPbpOAStvbvK0kgVugZi+OOgFav7KnxH0HwjdX9vq1zHaLeIgjnk4QFd3BPbr1PHFdR+1rcy+KrPQNM0iwkvzLvu1ngXKbcAfe6D15NfJyqVqWYww1S/s09G+25nGlTlhHXvaXY+I7XUbG60tvDevgrp5cvZ368vYSHv7xn+IfiK4PXPAms6f4g/sf7DJdXjANELYeYsyHo6EcFT6/nXp3iHRPDnhmfdrupNq16M7tL0kgqp9JJjx9QoJrIi+II8Wac3hYMPDERwmmzWkrhFPP7qZidxVieueD2xX1dRQlqiKUpxV4oqeB/AGk2Ca9b+KNfh0+5ksGBsbOdZJURWDsz4BAI2DAyetcafHa6V/ovhTSY9ILttF4/769kzwPnP3OvRQKb4U0e7tfG7aZdxva3XlXMTqy4IJhf88/rmmeBbaPS7W+8UXihotMAW0jbgTXbfcHvt++fTA9a5m9uXQ6FGzcpO7fQ6eHxFqen+NvC+g6JcmTULK5AuJpmJW4u5Tibee6gHZ9Aa9o1D9mzwdHqsmsFL0xxSPdSafG6+S45bYMgELxjGa+V/DdprOveJrRdKWa71mSfzY2Q5O/OdxPYZ5JPoa+hfjj8ZdQ8MaTb+GLa5trjXbi226ndwKQISwAwgzwx5+gNKElJSlPZbHn4unVVWEKD1e54z8V/iOfiP4o+3x2osrG3iFtaQd1jBJye2STnjpwK49H5zUFLXI5c2p9DSpqlBQj0LaSlavW95swc1jhxnqalWX3q41LA1zaHUW+rGPucVa/tzK/eNcoLvFH2v3NdKxDRg6CerNy51PzM5JrJubrcetVHucnrUEk2T1rGdXmNY01EfLJmqztk0O+TxUeQOtcjdzoQ4nNNzik3U1nGeazbGOYjFNyKQnNNJxUhYUjFNYjNITTSc0rosUnNNzik3UhOahvULBRnFITikJzUNlCZxTScmgnNITioKQhOaTOKQnFITmpuMSkPWjdTWbmlcpCE5pKKQnFQMRiMUwnJpW6UlS2NCN0pucUM3FNJzUFJXEzimk5NK3Smk4qWWtBCc0B9vFJTW60NjJ1ckVasJCb+2/66J/6FWcpI4q5pzYvbf/rqn86um3zKxEleLPprxaNFk8byyvKh8RfYkFpFM20AZYgocH5j9MjtXL3mnahqeq6doGlazp+iMseJ44Wb7QsjAu2Cw3HOfUZ5zisv4zaW+rfFHTbJBl7iCCIEdcsxGf1rWttet4bC+1bXLYyCe5kstMmgULeRw8h3Vj1CjAGe5IBr6apUU6jg1bX7z5yMeSEZp6mX8QvAOqalZLHbCTUJ9HjWLzEkDtdqQCzAA5DgjGD27muG8NfDfU9Y1D/TLS4sdPt/nup5YyvlxgFvlB6kgHGPWuuh8D6ppV1a634VuTrdukoZZIFPmxvnhJYzyDzyRxjvXZ/Ee+1D4f6GkOjNl7uVjqMjTef9jlKj/R1H8IGT165I7Vxzp06kvaTTujohWlBKlBrX8DxDxbry+JdUDQR/ZtOt0EFpbYx5cQ6fiep9zTPDmoXfh/VrbULF9lxA+4dwfVSO4PII962R4yv3Obu107UOmftNkhJx7gA1p2HiDQrmUC98LW4HUtZXUkOefQlgK5Iw5p8ykdrk4w5eU3r7TXtI08Y+FlMOk3j+TfWTrujt5zy0Tr3Rs5U+n0rrIfBGheL/AIZNHodibHxFql3iOy8xhG80WGZUJ427HJA9fpXp37L3hTw54y1u90ODTtai0vU7R/tlvfbZbWQKcoQ4AKOP4TXtnxZ+AmleAvhzdf8ACKCDS9RtIpFtLm9utscLTMiyNvfhWKjAY+vFbyq06c/Zy3Z4FXEO6grpp/1c/P7xn5PgDT7jwtp0hbUi/wDxNr+Pjc46RRng7F7nua81+1TWkpkhlkifOd6OVOfXNfSOtfDLU9Z01ovFN7pLvCgFvrNrerNcKo6K+0EOvHc5HrXkms/C+LRxG154hshHINym3gllJHthcH86561CpLWH/DHt4evDltLf8zmF8baoVWO5kj1CIDGy9iWXj6nkfnSf2zo94Nt3o/2djz5thMV/8dbIqWTRPDNuWEniOeVh3gsGx9PmIpBH4Qh2MZ9ZuCD8yBI4/wBcmuJ+0Wkmvmd/uX91amxYWeknw1qJt76WGK5uIohJewHC7cvt+Qnrxziuw+HmgXVuk9jILTxN4evcLcWthdr5yMPuyxqxBDj6c9Ky73VfCEHg3SoxpV1NHLIzpEJfLk3L8pZ2Gc9QOlS6H438M2MsTxeBrOZgMN9rvpnz9MYwa74xjFrVbHn1HUlB2T36nqmm/sX+KtbWS50u9spLFvnt2ui8crqR0Zdpww6EeorivijpcHw5sJfA9mub+Ng2s3uzaJ5OGWJO/lrnqepr7M+En7RvhTwr8PNGk8V2y+Hbi4hY2mnwK85eFTtV14LAHtuPOOOK8M+MreCPifrEvi3WptT8GzXciRrb3hR/tUajarKoG+PgDJIxVJNyaUbLueLQxVaVW1ZXij5a8MaXeX3iWyFknzxyrI0jD5EA5JY9hUvi6z0rwTrt4kMY1G8ZvNjEgHlQK3IBAPzHHrx0rpfH+jayIHg0OG0fw/k7V0acSmQY5aT+MnHqKpWXw8uNZl0TU9RVYYUt1+0QN99iudvHuMZrD2UmuSmte/5n0LqRaVST07GP4tvbpfh5pkWpSlr+5uWuArdQmDjI7dRx715yzbjW9468SSeI9cmm5S3iJihjIxtUe3bPWuayTmvGxdT2lR2d7aHqUIcsRWYZzUZ605ulNrhOkKaetOJxTKACgnFFI3NZFCUds0UjHtQA2iiipYCGminN0ptIpBR2zRSE8YoGJRRRRcAoooqSo7hRRRQWFFIDmloAKKKKCJbhRRRTTJHA/LiimjqKeeDTASlU9u9JQODmgTH0UUU7kjgflxS0zOKdVAOXrS00HFOBzQAU5elNpQcVadwY6lU9qSjoc1RI+lXpSUA4piHjrTs5plOTk4pokWnL0ptKDimA6lXpSUA84qkK49OlOpoOKUHNUmFh+c05Tg1HnFOqrkj62PCOsRaB4l0/UJwWhgk3MFGTjBGfwzmsehuhranN05qa3RE4pxaZ6r4tsbHSLy9vrfVore41oebFNKj/ACQn7wXaD1P6Vjy6Zba3oMJ/tm0abTF8t5gkn+pY/LnjPByM9MGo/iYcWnhb1/s1K5rQNYbR9QWfaJImUxzRkcPGeGX/AD3FexWqxjWdOS0POowl7PmT1Oq0GW10O4Zk8QWE1tIpWe1lil2TLg8MNvPseor0nXdA8OW/hDS9Pi1Z9PsZ5WvkV2BNyxQAYZgAAO2a8el8OEeKbXTLd/Nt7uRDBKP4o3xg5+mc/Suw1W5/4TSfX7GN1gsNPlja2uJATHDGg8th+KgHHsa6sPPlpyg4+SOetDmnFp27m/rlncm60tLDwymrN9kiiS7vJvNUYBwCFIXgd+RVnSvH11ouqjSrf7Mxgilmu5UtxDECsZIjjAA4BAy3U1w3ijxLLp2k6TZaTLJb2ElqMzfdlmCuwAJHOM5O3tmo/C/i7VZINVae6e9it7GR1S6HmKDwMHPOPm6Vr9YjGrywbTIjQc4c0jbv9En+LER1nRQY78sF1CyllIjV8cSRseoOOnY1z48Gv4Xnmn8TQm2gt22pbBhvun7BT/d9Wr0r4L+IxNpMtvcwW9m9zcMbfykEfnkKC3HqOB+PtUPxB1rwRreqrDrVzepd2AaLyoImUnnoTjn2rtnhaU6KxCl777uyMVWnGp7K2i+88qQ6l451+0tUIknlIihiRcJEo7KOwAFdf8UNVh0PTrLwVpj5s7EB7qQc+bKecfh/PHpUtl478IeEhd3HhrTbs6s0WyG4uzuVCT6EmvNbi5lu7iWedzJNKxd3Y5LE9TXl1Kiw1JpSvOW7XRdjthB1ppyjZR2v1YgPNLnNNpQcV5NzvSsSU4HFMBzS00DVyXOaWmA4pwOatMzJFIzTs5qIHFOVuKtCsSA4NLnNNpQcUySTOacDiowcU4HNUmFiQHBpcio91KDmqTJJAcGnZzTAc0oOKdxWJMilzmowc04HFXckeGOeaXOabkHpSg4q0xWJMilV8Cowc0oOKpO5JKDmlHHWogwJ4p2aoLEmc04Niogc0oOBTuBMhGasI2CKpq2DUiSZNWnYlo3LOYowOa6jSdVERByK4WCfHetG2vtvOa9GjW5TiqU+Y9c07xYYE4c17L8SPiNquk/Bz4bTadqNxZu8U6s0MhAbBGAex/Gvk6PVmA4fFerfD/4waZceHJfB3jVfP8OFS1tdIhaW0fOflxzjJ69ueorStKFaUW+h5k6MqacorTqZeq/FNdXY/wBuaFpmrZ+9OkZtpz6/PGQCfqDWFPY+E/Ea77V9V0J2JGJ4TeQZ9nQBh+INdxqWsfDX4aaWk2kJB461qdyyPff6uBO25cYB/DJ74rlbj9pfxijbbI6dptuvCW9tZqEUfjSlUgtGyqcZyV6UbHU+CPDV1rd5pIu7q31S40mQPZ6lbSYYxY+aGVWAfAB+U4Pp0qnqfwX8Qa+bTR7Xy9J8N6Tv3ahfHYJ5WOZJQvU/3QTgYWuXb9pXx4G/4/7U/W0SuQ8V/EfxH42fOsapNdRj7sAOyJfog4/PNKeIo8vKkOOGxLnzNpfieqX3jjw38GPDtzo3gy7XV/EdzlbrWtoIj9lPQ47AdOpJrw6e6luZpJppGmmkYu8jnLMSckk1DuPHpSbjXDOo52tsepSw8aV3e8nuyTeaNxNR7qM1idA6lD4qP5fU0ZX1NGwEnmUvmZqHdSZp3YWJWk4ppkqMkDpmk3Um7oaQ9m45GKbkU3PrSFueKkqwucUmRTWbjmk3Z6VL0CwuRTScmkJxSbqnmY0hcikJyaSkJxUMdhc4ppOTSM3FJupDAnNJSE4pN1RcqwE5pM4pu6gnNJsYmcU09aCc0hOKkqwhOaSikJxUgBOabnFBOKaTmobKsJnFITk0E5ppOKgtK4E5pucUE4ppOaCkrCN0ptKTmmk4qRgTmm5xRSN1rJu4Dk7+9d/8NPBdvqJk8Qa7KbTw7YHdI/QzOOiD8QP5V5+p7V6Z4A8TaTqXh648I+IpjZWEjG4t77fgRP1w3tnp9cV34LkdW09+na/m+hy4lzVP3f8Ag2Or8Oag3xP+Ls+q2sJihtbZmgErfd2oURj6cncR7Va0zRLz4r+PLLRtGgUjAs7KNmwiRoOWJ98Fj7mrXgTRvBnhXT9VSXx5Af7QjWB5bWL94sefmCjnk564ruvAnxY+GPwn1mzvvDmhX+tahENhvrqYxhFIwxQN3IJ7CvYvJRcuvqeFObUn7OL8j0uD9mHWfgr4dvvFFqreItf8pbawisYG/wBGkkO1pWB5bA6YHfpXmlh4Q1zxAL608S+DNRsmvY/JudStoPJEx6q8sZGC4bneoB654New/En9ua3v/B6WPhCK6s9SmwZLu6jQeQB1CjJDE9M9MGvlnxh8evG+tvN5/ii/2P8AwxMIwPoFAxWVGVZwc66X9eRhTpVpvRa9yxrfwz8HfDaxji8X6jc3mrzSErbaY4ykfZiD6jByfXApmi/EH4c+CgLjQvC9xq+pZysursNsf4c/oM+9eP6zq9zqt5Ld3lxJdXEhy80zlmY+5NZoutp4Nckq6i2orQ9mOEc4r2km2fS8X7W/jgywGxvLbRreJgwt7KFQpwehJySPyrpdS/bO1HxRZzab4x0Ww1rQ7iIRz28CGNyQc7uSR1xx7ZzmvkpdTZcYamy6mzDlqcsRTaTtqT/Z9J6cp7H498MeFdR8OX/izwRqV5Zx2rr59hLuDR7iPlDdRjOepHHWvONH+LGt6IZEuJP7UjYDC3LElD3II55qz8PvHsOgyXmlamqy6Hqa7LoFclOCAw+ldXN4f0r4i+Ebn+xLCy0uZLvybWV1AaZUHQnrlgf0q1eouejK0u3cIQVF8lVXj0fY4e7tNC8RwPfWOmzoRzcQWsv72I9SwRgQy+4xWCNC028JNlrEaOekd9GYT9NwyKS80vUvCer+RMsljfwHPBwfYgjqD6963dNtrTxvcizuY1stauGCw3UQxFM/92RR0J/vD8RXA0qz96Pvdjvf7uPMnoO8QeF9Vj0/SIobOS5itrQb5IAHXczFu3bpzWt8LPCDa3rH2vU4mi0Wx/e3DTfIsmOkYJ6ZPX0ANa3iXwK/h7xRZi6u5jJNHFDZWWnErLMVQLgt/CAe/JxVfx58TplZ9AtILe5tYQsUzzqZvNdfvAZ6gHjPU4rr9lCk3OWluhxe0lUjyU+vU2PEnxZit9cutSsWi1HXJSAupSJmKzUDCx26Hjgcbz+ArzLWvENzq11LdXtw91cyHc8sz7nb3JrWsbCHUoTJe6CdPjY/8fcdz5Cj/gMmc/hW/beHvCnh/Sf+EgE8msx2mSV3goz5AUFR6Ej+dN+0r/astzWKhRVuXU5fQvAWqamo1CaUaNYqN4upjtYjrlR/U12WpfFLQbeCTy7trqWL5QqoSXI7g15V4r8b6p4tuGe8nKwAnZbRnCIPTHc+5rm2kGPSuH68sPeNH73+h0rDe196r9yHajdm+vbi4K7WmkaQqOgySf61WoJyaQnFeLJ3dz00rIbRRRWZQjHJptFFS3YaEbpSUE5ro/D3gqbxDYG6juo4VDlNrKScj6U4U5VHaKFKSgrtnN0hOTT5k8qR0JyVbGfWo6hqzsylqFFFB4GazGhlFFFBQUjdaUnFNJzQAUUUVLAKKKKCo7hTX6U6mt1pNlgOtOplOBzSQC0UUVQBRRRTRkFKOlJSr0pgLRRRQA4EUtNHWnUEsKcvSm0oOKoQ6lBxSUUwHUUUU1oA/OaKavWnVonclip0p1MBxTgc0APzmikXrS1SJsP7ZopFPalpiHZzS0wHFOBzTQD85pwOKjBxTgc1SJsPpQcUg5GaKoB4ODWz4Qgju/FOlQyoskT3KKyMMg896xgM1peHtQTSNcsb6RS8dvMsjKvUgHtW9HSpG5nUvyNI2viTqdzqPi2+jnb93auYIYwMBFHauXHTpXb/ABJ0EDxJDd2HmXUerxi7ijVCXBPUY/I1nx2Fn4aRZr9Y73UGGY7IPlIveXHf/ZH4124inOVeTk9O5y05pU421Os+Gumy6hYw3l4Ht00su9tcsACysrAjnsCQQfWuasfGW3WLKFYxa6KrGNrVD95WBVmc/wATc5zW1ZeILjS/DUep37GaTU7wReXjAFsgO5VHZct29K4rXtLbR9VuLVTvjU5ifsyHlSPbBrtr1eSjHke25hTipVJOXyNXxRaHT9N0iDO9YftEW73Ep/oRTvCNlLqNjrMEH+tmjit1HYFpAcn0ACnNWfGTRXHh3w/dw52SrIZCe0gCBv5Zre8DDTPDXgu71XV5JQmoy/Z4Y7fHmELkMVPbqacKanidXZWvcHJxorvc5bXdeMGq2i6XK0UGljy7Z1OCWByz++5q6n44xxtrmlXCoqzXFijysBjcc8Z/A4qpFe/DiKRWNjrDhSDtZwQfb71ZHj7xiPGWtJcRQC3tLdPJt0P3tmc8/wCFVVlGGHknJPm2S6CgnKrGSjZI5vOacvSowcU9W4rxjv1Hg807OaZSg4rS9ySTOacDiowcU4HNMCQGnZzUYOacDiruJokzmlqNW5p4OaaI2H5zTgcVGDinA5rS4iQHBpcimA5paCSXIopgOaXOKu4iTIpykYqOlBxTTJsSZzTgcVGDil3gdadwJM5pwOKjBxS7qpE2JM5opoI7UbqpBYkyKUDNMyD0op3JsSBjnkUuc1HupQQeuapOwrEgY55FKHw3tUY4NLuq7oRZDn0qZJitUVkGeppwlxVKYmrmitwc0jXBqkJMUGTNXzMXKi00vNRmWq7SDHU0m4Huam7e4WJS2RSVH8vqaPl9TSY7ElJnFM+X1NLlfU0gSHZFGRTCwFJuz0pjJMijfio91G6lsA4k45GKTIppOBzSbxS5kA/dikJyabupDyaLodh2RSEnsM0zeD0ozUN3Cwu73pCxzwKSkJxU3KFzikyKQnNNJxUtjFzijIppOaMgdaVwQmcUZFITmmk4qblC5xTSaCc00nFJsaFyKQmmk4pN1TcYE5pKQnFJuqR2FJzTc4pN1ITmpbGhM4pCcmgnNNJxUFJXAnNNzignFNJzQWlYTOKQnJoJzSVDYxCabRSE4rNu4AxGKYTk0E5pKRY4MAakV+faoaNw70rgadvcYxWvbakUAwe2K5pJMd6mS5IHWuuFVx2MJU0zqzrbEck1nXupmUnmsc3hA61DJcFuc1rPEOWhKpRRPNckn2qs05JqCSXB61F5g9a4JTOiMC0bg0w3BNVS4Pc0hcDuajnZfIi15gNdJ4DVr/xZoVnJNJ5H2xWCBsAEkZI9M4rlFkBNbXhfWP7C16w1ER+b9lmWXZnG7B6ZrSjLlqRbM6seaDSPTfEnhDV/iJ8QtZeyt8WtrKLdp5M+WmwAY4BJPXgA12nhT4Y/2HfafBava2WqSzxo17qc6ic5IBWCBdxQkZ+Zxn6U67tZviF9nvfD3jCw0vTrlcy2N7di2aOTPzZAGT+J/Svqz9mL4GeE9D0Gz1PUE07XNcZ2lbUopBOkbAkARt0GO5x1Ne/N06bc7XPlcVipU4KLZ8zeIbq38C2R1nV7q71efVppX061MYjktYMlTKjMSyqRwOmetePeILi6sbJr7w5FZLpectPbRbriE5/5alsspPr0r6L/AGifhbqvjD48avYaUXlslihb7VKu2C0i8sHZkcYHOAOea8j1HUPAnwvuPsdt9o8R6muUuLuFsID0KgZwR7c0pP2kbydjowk48sWtX2PKND0DVfHmoSb7h2jjwZ7u4cssY/HvjtU/jXxfarpv/CPaHH5WmxHEsxHMzA9c+mRnNT+MfiJFfWH9m6BZf2PpsmWnRQA0jE+o6CvPXc46CvFrVowi6dN3fV9z3qdNzalNWtshGYkc1Ez8YFBYim15LZ3pCZxSE5NK3Sm1JQU1utKTikJzRsNCUZxRSN1rN6jEr0T4d3kdloFzLKcRi5Ck9hnArkPDvh9tfmmBnjtoYVDSSP6E46V115p0Wl6Bcafbwy/YnO+a+kYHJGOQoznOMCvSwcJwbqW0OOu0/cOP8Q6Jc6TqM6yRMY95KSgZVhknrWT09vrXpmlavqmqS6abW1CWMmTM7LnCgkDk98CuF8SEN4g1AryDO386zxNKNNc8XozWlNv3WjNpp60pOKQ815p0oSiiigYjHOKSiigAoooqQCiiig1EPSmihjziipYBSqe3ekoHBzQgH0UUVQBRRRQZBRRRVIB3bNFIp7UtABTl6U2lBxQKw6iiimiR2c0tNXrTqoBV60tNBxTgc0AFOXpTaUHFaR2Cw6lBxSUUyR9KvSkoBxQA6nL0ptKDirJsOpQcUlFAh9KDimg5pasB4OKcDmowc09PvU0SSrxz2qdI9/ao4xkCrtvFuArojG5nJ9D1nXrqbUfhfpOs6VugeBBY3Eix5kVRwcN2GQPzrysWjOwVQWcnA+p4r0b4Z+Np/CFwba6hF/oNwSLqycZBB4LL74/OvT9Y+COmaF8S9BnshI2gXFq+stE6/wCpiiXcV+hO36dK9ypBYhRl96PGVZYZuD67HifxJt10/UrHRU27dKtI4H9PMI3v+rY/Csu/T+1fC1rdgfv9Pb7LMe5jPKMT7HIq3rf2jW9YurtkMtzdzNIEVckljnAArqfC8OmeCL02mtql1fagI43tAoZbYbsjzDnGc44HSs/Z+0qNPRS6m/tOSnF9Sl4f+HWoeKPAsSDbaTJdNNB55OHQqM4x64Bpuv6HqPh74WLZarGsUq6kGgTerEIVOenqeam8D+KbiPxbe6Hqx82z1Cd4njZuY5AcLtI6dAOPauN8aJf2niG8sb+7nvGtZGSNp5C2EzlcZ9iK6Kjowoc8E7tcrIpxqOpyye2qMQHHelzmm0A4r59M9MlopAc0tWgHqRmnZzUQOKercVSdhWHg4NOzmmUoOKtO5JJnNOBxUYOKcDmqAfTgcUwHNLTQmrkgODS5zTAc04HFVczJM5pwOKjBxS7qpMViTOaUHFMBxSg5qwsPzmnA4qMHFLvA60XJJKcDimbqUciqFYeG9OaUN60wHFG6ncRLShsCoxwaXdV3ESA5peR2plGaLhYkyKXOajB9aXK+pqrkj6cGwKj3UbqLisSbs9sUZFMDA0tNMLDgc07kdqjozV3YWH5I7Ubj6U3NG6jmYWHhjnkUuRUe6jdRzMLEmRSFjngUzdRuo5mFh24+lGSe1N3UZo5mFhxGKTIptFJu4WHZFG7HbNMJwKTeKm4WHUU3dSHk0rjHZFLvxTCRjik3UXAcRik34ptIWAqblWFpM4pN1ISO9IBTz0pCcU3NJU3Ggozik3UhOaQ7CZxRkUhOaSpuMKM4pu6kZuaQ0gzimk5NBOaQnFS2UGcU1iM0M3FNJzUFJXFJzTc4oJxTSc0FJWEzikJyaCc0lSMM4ppOTQTmmk4rJu4ATmm5xQTimk5pDSCjOKQnFNZuaTKEJoBpKKi40h3me1KJMVGajJJNFx2J9+aaWPbpUWaM1LbAUtkdKY3WlJxTSc1JdhG6U0fezSk5pKm4EoYKB61Yhk5zVFTzU0b4FOLs9RNdjodMdpZ4okA8yRggHuTgV9A+HD8VfhLoVzNpN+9pYBld7e0lSfJJxkR4PJzzivD/AIV2EereNdPSY/u4Sbgj1Kcgfnit/Vvi54jXxjq8mi301t9qnEYhRA5bZ8q8EHB4zxXuUJqNPmns3Y8bE0XUnyJKyV9T0D4g/tD/ABF8UaFcWWqo9jZzAJLLHZtCSD23H1rwG7mDE9MV674/8TanbfDn+zfEeqi81q9mSZYQBmJAc4OP5+teHzTlhzxWGMlyNRv0NcFTjGFoxtr94yZssarSEYNPkb0qCQ8V4rdz10rIQnNJRSE4rI0G0UUHgZoAQnNNorrfDPgkajbfbdRZ4bPgoi8NJ7+wq6dKdZ2iTKSgryOVhhkuJRHFG0kh6KoyTWpP4Q1eC2e4ksmSJF3NlhkD6ZzXYwz2u2e38OLHZmJ1Et1s3lgeyk9SP61qG4n01Z31ArHpUUWwySnMszHvj8a9GGChb35HNKvK6UUcn4Y8P3b+H9UZ0Ea3kQSEPyW5znHpV63s75Vjinmk07Q7JRmWT5Xmx7+n9KxF+IGp2sAt7fykhQbI2KZYKOmffFYeoazfaq2bq6kmGc7S3yj8OlR7ajTilG7aBUpyk3Oxra74xub+Uw2bNZ2SZCJHwWHqf8K50nJz3PXNFFeZVqSqO8jrjFRWghOabRRWJqFI3WlpG60AJRRRQwCiiipKSuFFFITikWNoooqQCiiimAq9KdTR1pxpoAooopiewUUUU0ZgDg07OabSr0pgLRRRQA/OaKavWnUE2CnLzTaUHBqkIdSg4pKKYDqKQHNLQA/OaKaDilBzWpNhwOOtOplOHSgBw60tNBxTgc00Jj85opoOKUHNUSOBwaXOabSg4poBwOKkTrUR5qSPqKtMllyHGRitSzQMRWTAcYrWspAGFddJ6owqHongTwld+LdasdI06E3F/eSCKGMHGWPqew75r78+KHwc1xfgvCYNOt77xSbGPSJJrKQrGluWUu2W7YQZ+p7V8K/Bn4gp8PPHei686l4rSbMqryTGQVfA9cE192fE/wDaVs9J+G1vq+k2R8SafeERs0RBijQ43eYeqnBIAI69a9pucnH2e3U+RzD2iqwsro+IPEi6T8PFuLXTLmPVfEYG19Sh5gtD/EsP95uxfp6V5DfFpJXZmLOxyWPJJr3Px54smvbWTUNIj0jWdFf5mhl02FbizP8AdkRAOmcbhwa8uGvy63cCGLw5pd1MM8xwMm0f7W1gAPc/nRXipWjfQ9bDN8vvLX1Nbwz4dfxF4q0rX4mCWSqLi6kP/LOWPAYH3JwfpmuK8baxFr3irUr6EYhklwmepVQFB/HFesWqaZN4Vfw9bXdtpOo6mjODbE+XIw4KgsTwcFc555IrxPVNOuNI1Ceyuk8u4gYo6+/+FRjF7OjGK66t+Z0YeTqVHKXTT5EFFIDmlrxEemKDzTg3FMoBxVEktFIDmlqrgPBGadnNRdKercUxMeDTgaZSg4rS9yR4OD1p2c0ylBxTAkBpwNRg4pwOasTRIG560uRUYOKUHNBnsSg0u73pgOaWrTAeDTgM1GDmnU7isPBpcimA5paYrDwcGnZFR7qUEY5qkxEmaUGmbqN4HWncmxJuz3pQ2B0zUdKDgU0wsSZFGc0wH1peD0zTuIfmlDYHTNM3UbqYyTIFG73pgYGloQhwOe9LyO2aZRmquKw/JHalD+1R5pd1FwsP3+wo3Z9qZuo3UXCw/dj3o3+wpm6jdRcLDtxPajLelMzRmi4WH4NITjvTc0UXCw7dmjdjtTcgdaQsBUjQ4tkdMUnJpu6jNAxcijIphIxxSbqVxDyT3GKbkGkpKVx2HFsjpimk0m8HpSE5pXKQpOabnHek3UhOaVwFJpM0hOKTdU3GLux70hbn0pCcU0nNJsoUmmk0E4ppOam40rik0hNN3UE5qR2YhNGRTSc0hOKVyloG73pCaSkJxUtjAmkzSUhOKzbuAE00mgnFNPNIpIKM4pCcUhOaVxiE00nJoJzRUNgFFFITikUhhbPem0UVAwozignFNJzQUgJppNK3Sm1ABnFNJpW6U2pGgzilEmBTCc0UXGka2g+Ibzw3qSX1kwSdQV+YZBB6g12P/C2IFU3seh20WtkbftQAKgevrn8a82LE0ma6KeJqUlaD0MpUoTd2jR1DVrjVLyW6upnnnlO5nc8k1RdyaYx4pua55T5ndmiVtEKWxUZO7rSt0pKzbNEGQOtMPWlJzSUhhXS6L4DvtURZpyLG2OMNIMsw9lrH0W1+26zYwZAEkyDJ+tenX0Or/wDCQpOl3bJp4wPIkfBIxycY616GFw8Zpznqro5a1Rx91Oxz8fhXQ9PuIt5u9R5JMgAWFcddx7Y9K0rya/1jy5rd00vSIcN583BlQY4UdhirU7fZ9QM11qFlbaeMtJCCGeb3PoPbmvOvEfiKfXrxmLFLVTiKEcKq9uK6qk4YePurS/QyhGVS1/xOt1Hx1pdjK7WUJuLhAyRuo2IPf3rg73UbrUpfMup5J2zn5mzVekJwa8mrialXR7HbCnGG2408n2ooorkZoFNbrSnikJzUlISiiigYh6UlBOaKACiiipGlcKKKKC0rBTScmlPSm1NxhRRRQgCikU5FLRcApw6U2lBxRcB1FFFUDVwooooM2rBRRRVCHUUgOaWgApw6U2lBxQJjqKKKdyRV6U6mA4pwOaoBQcGnZzTaVelAC04HFNoq07gx9FA5GaKokfRSA5paYDqWmg5paaFYfRSA5paZI7OacpwajBxTgc1SE1ctRsQKuW8xTrWajkGp1lxWqlykSVzftr4x4r1z4CePrjS/EcmiTTxnSNTicT20+CjMFOMA9zkj3rwqOfPfFSpePE6ujlXU7lZTggjuK9CjiOSSbOOrho1YOLPSYtH1bwr4qnnuCdKtbKQmacjKNETkIo/j3L2/wq94g1yw+IMceneHSmksSPtEBiERmT2K9doyce9O8caq+qeGPDk+qQveafLbDz7yM5kglOPmHY98g/zrlbbQLrSNNmm091vrm/8A3dvdQ5CxwcF3JP3CenPoa9eV4txj8L18zghFNKUt1oY8+oSz+L7d4Ec+RcRxQRYwwVGAUY/D8zWx8Y4Fg8azSJgefDG7Djg4wf5V1PhubSBbXGpFI9V17SrdpJ541O12wcYPRvTIFeTanqlxrN/Pe3T+ZPM2927Z9vauGv8Au8PaTvzu/pY6qT553StZW9b9isDg9aeG4qOlBxXkpnoEtFIDmlp3FYUHB604NxTKAcVRJLRSA5papAPDc9adkVEDinA5qk7CsSA0uRTAc0tPmZJIDS7vemA5pa0AkBpQaYDmlBxRcTVx4OO9OznvUYOacDiqJasSA0uajBzSg4FO5JLuoznvTAwNKDiruBJkUuc1GDzzSnB6GmhWH5I96UHPWmbsdaUHIpkkgb05o3EdqZS5ouBJnNLUQOetLgHoTTTFYkzShsDpmmbqN1VcLD8gUu73qPeKUHIouFh+7Pel5NR0Dii4iTLelG4jtTM0ZouA8MfSl3+wqPdRuouBJv8AYUhY+lM3UbqLgP3E9qMt6UzNGaLgOzjvRu96Ziii4D93vSbsds00nApN4ouNIduJ9qM03dSHk0XCw7OKMimEgdM0m6pbCw7JPagnHem5pKVxilsjpikzSEjHFJuoHYXIoPPSmkjHFNzU3HYdu96QmkpCcVLYxTkDmmk0hNN3UrgO3e9NJpCcUm6kaR2FyKaW560hOKaTmpuMUmkpCcUm6kApNNoJxSbqzbuNAW4phOT1oJzSVNx2CjOKQnFNZuaVxgTSE0hOaKlsAoopCcUirCMcUwnJ60E5NJU3GFFFITikVYCc03OKCcU0nNSAUZxSE4pCc0mNCE0hNITmipHYTOKQmlbpTam4wozikJxSE5pAFJnFFI3WpuVYSkzignFNJzSGFFFITimCJbK8ksLuG5hIEsTb1zyM0l5eT6jcPPcyGWZzlmY/5x9KhoqZTltfQfKhCBjoKT+tBOaKzeoxM4pCcmlbpTaACiig8DNTcaEJzTaKKRQUZxRSN1oASiiilcAooopFR3CiikY4FBY0/e9qKKKlAFGcUU1utDAF4p1MpwOaEAtFFFDAdnNLTV606mAUUUUyWrhRRRTRAA4NOzmm0A4pgOooooAdmlpvSlBzQJi0oOKSiqJH0UgOaWmA7OaKRetLQAoNOzmmUoOK0jsKw6lBpKKYh9KOlJQDigB1OHSm0oOKogdRRRTAfTlfApgOaWrTESrLT1l4quDilHNVck67wt49l8O2txY3Vsup6VKDutJSMA9eMg8e1dt4ht9X1BLC60CCO+0O4tgr6em0RjPUEcfmOhFePKxzxwfUVbtdVvbKLyre7ngjyTsjkKjP0FenQxvLFwq6roclXDpvmhuei+HtK1Dwlri3VpHJBayFVvbGddzRRk9QRnco9Rz6isfx34OubO/n1SxjW60i5Yur2wysWT0IHTvWz8OPHOs6x4kt7K9vPNtREx2lADkDg56/rWtp2peKdBu5ftWmQ3GnyTlRIrqGAJOCce3WvWjChiKKWtn+DONyqUqnS5492zkUV7HLp/hb4hCdbWM2d+rY+0wwkc54PTBBxXnXivwZqHhG4VbtVkt3JEc8edrex9D7GvLxGBqUPejrHujsp4iNR8r0fYwgcHrTw3FR0oOK85M6SWikDA0tUIUHmlznvTaAcU0ySXOaKaDilBzVIBwY55FPUjFR0oOKdwJAacGwOmajBxTgc1SdibDwaM00HFG6ruhEgNOBqOgHAqgJQaXNMyO1LuppgPyBS7j25plKDimRZkmRSg1GDzzTs+lAthwOD607d+FR7vWlBzVXESjIPrS59eKizRmqTAkyKUZI4puRRn0p3JsOzShsDpmmbqXd60BYfuz2oyKYGBpeO1MLDsilAzTKKBEmW9KTcR2pmaXNO4Dtx9KNx9Kbuo3UXAduPpRuPpTd1G6i4D8t6UZb0qPNGaLgOzijIpuKKQDsijdjtTScUm4UDsLuJ9qM03dRupXCw7OKTIpvHqaQnnii4WHZJ7UhOO9NzRUtoodkUhNNJxSbqVxpXFzijdjtmmHik3VIJXHbvek3/jTaQnFA7MUmjIppOaQnFK5YpNNLHPAoJzScd6QATSZFITmkqGwFpM4pN1NZuagYZFITSUUFBnFJkUhOaaTipAC2e9JRRU3GkFFFITipuMCwAqMkmgnNJSuMKKKQnFIpATTSaCcU0nNQAUUUhOKLjEpM4oJxTSc1IwpM4oJxTSc1IwoopCcUgAnNNopCcUFICaSikJxUDEJzSUUUAIelNpSc0lS2NBSHrSk4ppOagYUmcUtNbrQAlFFFSwDOKaTSt0ptIpBRRRQMQmkoooAKKKKkAooooNQppOaU9KbUsAooooAQ9KbSk84pKQBTlODz0ptFAD6KQHNLTSAKUHt3pKBwc0IB9FFFUAUUUUGQUUUVSAdnNFIvWloAKcDim0UAPooopkCg4NLnNNpQcU0A6lBpKKYDqKKKadgH5zRTQcUoOa0FYcDS5zTaUHFAh4NLnNNoBxTEPBp2c0ylBxTRI6lBpKKYD6UHFNBzS1SFYdTgaYDmlphuSKxU5UlT6g10/hn4haj4XspbW3igmSR95acFj0xjr7VywOaWuilXqUnem7GU6cZ6SVzt734t67dQiOAwafzkvbx/M3tzmsbVPGes63aG1vr97m3LBtjIoAI7jArDBzS1rLFV6mkpshUacdkOopAc0tc5rYUHBqRTkVFS1SYiWikBzS0xWDNKGx3pKKaYrEmRS5zUe6lVuKYh+acGx3pvHaiqTAkBpc5qPdTlbimKw8HB9aXdn2pgOaWq5mSPpQajHBp4IxzVJ3AeDnvSg461HS5qrgSZzS1HkGlBwKLiauPDZ6il3Ypm71pQc1RLViQEil3Z9qjzRup3JJM5pRmowQe9L9DRcB+aUNgdM0zdRup3AfkUu73pgYGlqrgOBz3pcGmUZouKw/ke9GW9KZmjNFwsPy3pRlvSmZozRcLD8t6UZb0pmaM0XCw/k9sUYNMzRmi4WHnIpN3vTaKLhYduzRux2phOKTcKltjHlsjpikzTd1G6lcBc4oyKaMDqaQnnii5SVx5PpzTS3rxTc0lISVx+78aaTk+lITik3elBolYUmjIpgwOpoJ54qbiSsLnHek3UhOaSgYZoJpu6gnNS3YBSabQTik3VPMwFyKaW5603dSE5qSrBmiikJxSQwyKQtz1pCcU0nNK4Ck0lFFTcaQUUhOKYx5qSgLZ70maSipAKKKQnFBVgJppNBOKaTmpAKKKQnFIaAmmk0E4ppOakNgpM4oJxTSc0mOwUUUVIxCabRRQNCHpSUE5oqRiHpTaUnNJSGGcU0mlbpTaBpBRRSE4rIYlFFFADSaSiikwCjOKKa3WkAUlFFIsKQ9aUnFNJzQAUUUUMAoooqSkrhRRSE4pFjaKKKkAoziimt1p3ASiiikAUUUUAKDg07OaZTl6UALRRRTuAo606mA4pwOaEwFoooqhNBRRRQZ7BSg0lFUA6iiigBQcGnCmUoOKBDqKKKpCHZzS0wHFOBzTEOBpc5ptAOKAHUtJRTTsA+ikBzS1pe5Io606mA4pwOaAH5zRTQcU4HNUgFBp2c0ylBxTIHUoNJRQA+lBpoOaWqEOpwNMBzS0wH0oNNBzS1VxWH0oNM3UoOapMQ+ikBzS0wFzShsd6bRQSS5zS1Grc07cKq4DqKKKZNh26lDcUygHFVcLEuc0U0HFG6mIeDg0uRTaKdwJcijOaj3U5W4pisPyR70objmmA5paadhWHAjtS5poOKN1XdCJN2e1GRTAwNLVAP5FKG45pmaN1AEgxS1GCD3pQcdKdwH5pQ2B0zTN1G6i5LQ/d+FLu96j3ClBzRcVmP3e9Gc96ZRimFmSYNHI7ZpmaM0FND8t6UbiO1MzRmgmzH7ie1GW9KZmjNAWY/k9sUcimZpDz3oKSH7vejd70yigmzHbs0bsdqZuFG4UrhZjtxPtRmm7qN1FyxSaMimDA6mgnnii4Di3HFJkn2pu6kPJpAO3ZpCfSk470hPPFTewC8mgnFNzSUXQDi2R0xSZpCcUm6obGLkU09abu9KN1IaAtxxSZzRRSuMKM4pu6kZuakAzSE5PWkJzRRcYUUUVIJBSFgKazAimUrlDi2e9NooqQsFGcUE4ppOaCkGaQmgnFNJzUAFFITik3UXGKTTSaCcU0nNSMKKQnFJupXBCUUUVIwzimk0E5pKBhnFITSE5oqChM4pCaCc0lABRnFITikJzRsNBSUUVm2MQmkoopAJnFITQTmkoAKKKKgYjdKbSk5pKBoKKKQnFAxKKKKLgFFFFSNK4UUUUFpWEzikJyaCecUlTcYUUUUIBD0ptKTmkpAFFFFABRRRQAUtJRQA/tmikU9qWmgCgfe9qKKGA+ikBzS1QBRRRQRLcKKKKaZIoNLnNNpV6UwFooooAdmlpvSlBzQSxaKKKpMQ+ikBzS0wFHWlpoOKcDmgApwNNorSOwWH0UgOaWmSOzmlpgOKcDmgB+c0U0HFOBzVJiFBp2c0ylBxTJHUoNJRQA+jNIDmlqkKw4GnA1GDinA5phuPopAc0tUhDgaXNMBxS7qYiTOaKaDinA5poLBRRRTFYkVsmnVDS5p3ES0UgYGlqhBmlBpKKdyR4OD60u7PtUY4NLupgSYxRTc0u71p3AcDg9aXd702iqAkBwfWl3Z9qiHBpd1JCsSDrxS8imZHajNXzMkeGOeRS5FMB55peO1HMwHDFLTKUHApp3AdmlDYHTNM3UbqoCTIo3YpgYGl47UAO3e9G73ptFO4D+TS8jtmoxx3ozRcCTLelGW9KjzRmi4EmW9KMt6VHmjNFwH8ijNMPNJj3NFwH7vejd702ii4DsijdjtTScUm4UgHFsjpikzTd1G6gBxNJkU3FFS3YB27HvSE5PpRkU0nnilzMB3WkJxTc0hbHWk3caQ/PpzTWbn0puaSkOw4t6c03JPtRRx3pIYUZxTd1IW55pXAUtxSbvemk5ooAM0UUVNyrBRSE4ppfnikA5jgU3zPam0lTcYUUUUhpBRnFJupCc1NxgTTSaCc0lABRnFITikJzU3GgpM4pN1ITmkUFJnFBOKaTmpuKwUUUUhhnFNJoJzSUDQZxSE0hOaKkYmcUhNBOaSkMKM4oprdaACkoorNu5VgzikJpCc0UgCkzignFNJzQAUUUUrgGcU0nmlbpTakqwUUUUDEPSkoJzRQAUUUVLAKKKKDRKwUmcUtNbrSbGJRRRSQBQTx70hOKQnNDASiiikAUUUUAFFFFABRRRQAU4dKbSg4oAdRRRTAUHBpc5ptKDihAOooopgFFFFMztYKKKKaEOzmimg4pwOaYBRRRQA+ikBzS0E2ClBpKKpCH0UgOaWmA7OaKaDinA5oAKcDTaK0vcB9FIDmlpkjs5paYDinA5oAfnNFNBxTgc1SYCg07OaZSg4pkDqUGkooAfRTd1KDmquIeDS5pgOKXdTBEmc0U0HFOBGOaq4rCg04GmUoOKAHg0uc0wHNKDimhDqKQHNLVCsFODkCm0U0KxNRUWacrACncB9FIGBpaYgpQR3pKKaYrDt3vTg/HrUdAOKdwsS5zRUW6nK3FNMQ+im7vWnAg07gKGOeRS5FNooQD1bB9adv8AYVFQDimBLkUZFR7qN3rSuTYkGCeKXBqMMPWlz70wsPzRmm7qN1AWHZo3Ee9N3UbqAsO3H0o3H0pu6jdQFh24+lG4+lN3UbqAsO3E+1Gabuo3UBYdmjk03dSZoCw/BNIcCmFsd6TeKAsSZFG/FR7qN1K40SMSR0pmcU080Uxjt2PekLH0pKKVwDNHWgkY4pu6pAcRikyKaTjrSbvSgBdx78UbqaTmii4w3E+1HWiilcEgopCcUm4VNxjqazbTTM0lK4xxbIptFFIAoopCcUrlC5FITScd6QnnikwDdj3pCcn0pKKQwzik3Y7ZpCc0lSPYCaQmkJzRSBBSZxQTimk5pDCiikJxSAXOKaTQTmkoGGcUhNITmioKEzikJoJzSUAFFFITijYAJptFFZt3KQZxSE0N0pKQBSZxS01utACUUUVLAKM4pCcU0nNIYtJRRQUGcUhNDdKSgAooopXAKKKKQ0rhRRRSNBpNJRRSYBRRSE4ouAE5ptFFIAooooAKKKKACiiigAooooAKKKKAHDrS00HFKDmncBaKKKLAKOtOpgOKcDmmgFooopg1cKKKKLmbVgpQcUlFUIdRSA5paACnA02igB9FIDk0tO5IU4dKbSg4qhDqKKKAHZzRTQcU4HNNOwBTgabRVp3Cw+ikBzS0yR2c0tMBxTgc0APzmimg4pd1O4hwNOzmmUoOKaJHUUgOaWmA7OaWmA4pd1O4DwaXOabQDiqEPBpwGajBzTqLhuOpQaaDmlqiRwNLmmA4pd1O4EgOaXGKZRmmmA6iiimKwoODTvM9qZRTuIlzmlqEcd6XNFwJaKYHBpwOaoQtHSiii4WDJ+tKDx6UlFO4rDt2e9ODYHTNRUY9zTQiXIoyKZuo3etO4EmM0bfaoweeDTs0gHUU3dRup3AdmjNN3etOBBouAZozRkUZFUAZozRRQAZozRRx3oAM0ZoyKMigAzRmk3elJuqbgOoxTd1G6i4D8GkJxTC2KTeKQD8ijdjtmmbqN1O4Ds0m7HemY9zRSAcW44pMk+1FFK40g60UUUrjsFFN3CkL80APprNg0zNJU3GOLZFNoopAFFFITigdhc4oyKaTmjjvSbGGaQmmk5FFSAUUhOKTdSuNIXIpCaQnFJupXHsBNJmiigNxM4pCaCc0lTcYUUUhOKQATTaKKBoM4pCaQnNFSMTOKQmgnNJSGFFFITigAJptFFZt3KsFGcUE4ppOaQBRRSE4oAQmkoopXAKKKQnBqRobRRRQUFGcUE4ppOaACiiilcAooopDSuFFFFBolYTOKQmgnNJU3AKKKKEgDOKaTk0E5pKQBRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABS0lFAD6KQHNLQAUUUUAPopAc0tUAUUUUyWrhRRRQiApQaSiqAdRSA5paACnA4ptFAD6KKKaJsKDS5zTaUHFUIdRRRQA7OaKaDinA5oAKcDTaK0vcB9FIDmlpkjsijOabSg4oAeDS5zTaAcUAOpwNNoqybD6KbupQc0CHA0uRTaKaAfRmkBzS07gOBpdxHvTAcUu6mBIDmjGKZS5ppk7jske9KG45pOO1FO4WH5pQajHBpd3rTESZzRTQcUu6ncBaKQHnml47UxWCl3EdKSigVh/me1KHGOajoppgTUYzUWaAxFO4EtFMDg0u4UXEOpKXjtRTAOlGaKKBWDNG4j3oooQWDcfSjcfSiiquFhQxzyKXIptFFwsO3e9G73ptFFwsO3e9G6m0UXCw7IpCxzwKSii4WDcfSjcfSiii4WDNGaKKkLBSYpaKBhRRRx3oAKKaXApPMpXAfjFJnFRliaQ896LjH+Z7UeZ7UyipAKKKKAsFFFITilcoXOKN+KaTmjjvRcAzSE0m6kJzSAUmkopCcUrjFzik3Y7ZpCc0lK40BNGRTSc0UgsFFITik3UrjAmkzRRUgFGcUhOKQnNACk02ikJxQUhcikJpKKgYmcUhNBOaSgAopCcUm6jYBSabRRWbdykFGcUm6kJzSAKKKQnFACE0lFFABRRSE4qRgTmm0UUigoopCcUAJRRRQAUUUVIBRRRQahSZxQTimk5pAFFFFLYAozikJxSE5oYCUUUUgCiiigAooooAKKKKACiiigAooooAKKKKACiiigApwNNooAfRRRTSAKUGkopAPopAc0tUgCiiimQ1YKKKKLkhSg0lFUA6iiigBQaUU2lBxQA6iiinclig0uRTaKoQ+ikBzS0AOzmimg4pwOaadgCnA02inzMLD6KbupQc1ZI4Glzmm0oOKAHZpQaaDmlpgOpabupQc0XFYfnNFNBxRuqiR1GaKKAHA5pcYplLmncB2aUGkopoB1OBqMcGl3etMW5IDmgimUuadwsOzSg0nHaimSOBzS8imUuadwJN2e2KMimA880vHai4D8YpKbml3U0FhaKXIpOO1MVgooooCwu4ije3pSUU7iHiT2pfMHoKjoouBLvBoyKiox7mi4Euc0tQjjvS5ouBLRUWaM0XAlxmjBqIEil3Gi4EmMUYzURYmgMRRcCWios0ZouBJnFGc1EeaBxRcCXIo3gVFj3NFFwJDJ7Unme1MoouAu4mjNJRRcAoxRRSHYKKOO9ITzxQFh2M0hOKbmipuOw7dj3pCcn0ppOKTd6UXAdnHek3UhOaSkAbifaijjvSE88UALnFJkUhOaSlcqwuaQmk3UhOaQthSaTNFITikUGcUZFITmkpXAKKKQnFIBc4ppNBOaSgBaTOKCcU0nNTcqwpNJRSE4oGITSZoopAFGcUhOKQnNA0gpKKKzbuOwZxSE0hOaKQBRRSE4oAQmkoooAKKKQnBqbjQE02iikUFFFITigAJpKKKACiiipuAUUUUFJXCiikJxSLG0UUVIBRRSE4p3ASkoopAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAKDTs5plKDigB1FFFVuAoODS5zTaUHFGwDqKKKYBRRRQS0FFFFCIFBpc5ptAOKoB1FFFACg0uRTaKAH0UgOaWmibBSg0lFUIfRSA5paAHZFGc02gHFADqWkopp2AfnNFNBxRurTcVh1KDSUUCHZzS0wHFOBzQA/Iozmm0A4poQ/NKDTaKdxWH0U3dSg5piFzSg0lFADs5opoOKXdTQDske9KG45pKKdxDqXNMHBpd1MY/Ipc5qMMDS4ppksfRTd1OBGOadwsKDg+tLuz7U2igB2c0tMoBwKYiQHB9aXf7Co91G71oAkyKMim8dqKdwH4NGDTM0ZouA6ik3UbqLgLRSbqUEY5ouAUUuRRkUXASilyKMimAlFLkUZFACUUuRRkUrgJRQSMcUm6i4C0Um6jdRcB2DSE4puaKLgOyKMim0hYCkwHFsjpikzTd1G6gBxNJkU3FFACluOKTJPtRRx3pXHYOtAFN3UZouFhcijdjtmm0hYCpGOpM4ppORSUBYcTSZopCwFK4xaTOKaTkUUgDcT7UUUUgCjOKbuoJzQApNNopCcUrjSFzikJpCc0UmMKTOKTdSE5pDDNFFFABnFNJoJzSUroaQtJRSE4qGxi5xSE0hOaKQBSZxQTimk5oAUmkooqWAUUUhOKQwJzTaKKCgoopCcUABNJRRQAUUUVIBRRRQWkFFFITikUITSUUVIBRRRVbAITTaKKkAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKAFBp2c0ynL0oAWiiinuAoNLnNNpQcU0wHUUUUwCiiighqwUUUUXJFBpc5ptAOKoB1FIDmloAKcDTaKAH0UgOTS07khSg0lFNMQ+im7qUHNMBwNLkU2igB1FIDmlpp2AUGlyKbRVJ3FYfRSA5paoQoNLnNNpQcUAOzSg00HNLQA7OaWmA4pd1O4rDgcH1pd2fam0U0SPxiim5pwIxzTAM0biPeiigB2c0tMoBwKdwH9KM0gPPNLx2poVhQxzyKXOabSYpjJM0biPemDg0u6i4rD92e2KMimBgaWncLD8ZoIpg470uaLhYdRmm7qXd60Jki5o3Ee9HHaimA7dntijIptFADsijIptFADsijOabRigB9FR49zRj3NO4ElFR49zRj3NFwH5FGRTaKQDsijIptFADt2PekLH0pKKADcT7UZo470ZFABmjrTd1G6lcaQ7GaCcU3NJRcdh2RRux2zTScUm70ouFh2aSk3Uh5NIEx2RSFjngUlFAwzR1pCRjik3VNxWFzijIpuKKLjDNHWiikAUZxTd1BOaAFJpM0lFBVgozik3UhOam4BmikJxSbqQxcikJpKKACikJxSbqAQpNJmkoqW7DsFFBOKTdUDAmkoooAKTOKCcU0nNABRRRSuAUUhOKTdUjQpNNoooKCiikJxQAE0lFFABRRRU3AKKKKCkrhRRSE4pFiE0lFFSAUUUVWwBnFNJoJzSVIBRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABS0lFAD85opoOKUHNAC0UUUAKDS5zTaUHFNMB1FFFUAUUUUEtBRRRQiApQaSiqAdRSA5paACnA4ptFAD85opgOKcDmgmwtFFFUhDsijOabSg4pgOpQaSigB2c0U0HFOBzQAUuaSirTAeDmjGKZS5p3uTYdRmiimA7OaWmUA4FAD80oNNBzS0AOBzS4xTKM00IfmlBpOO1JTuKw/OaKZSg4FMQ6ikB55peO1ABkj3pQ3HNJRQA7OaXGaZQOKAH9KM03dSgjHNVcBcke9G4+lHHaii4h2RSZFJRRcB1Lmo8e5ox7mmCJM0Zpu6jdQMduPpSh/ambqN1AD9/sKN/sKZuFG4UAPyKMimbhRuFAh+RRkUzcKNwoAfv8AYUb/AGFM3CjcKBjy/tSZJ9qbuo3UAOzRmm7qQ8mgB9JnFMx7migQ/IoyKbRSuKwbj6UZJ9qKOO9Fyg60U3dRuouA4jFJkU2ipAUtkdMUmaKKACignFN3elADs4pMikJzSUAOLZHTFJmkpCcUrjSHYzSE4puaKTGKTSZo470hPPFIYpGKTdjtmm0UAFFFITigBc4pN2O2aQnNJSvYLC0lFFZlBnFGRTSc0UAFFFITigAzikJoJzSUrgFFFFJjCjOKQnFNJzSCwUUUUFBRQTik3UABNJRRQAUUUVIBRRRQWkFFFITikUITSUUVIBRRRVbAGcU0mgnNJUgFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUtFFADqKKKACiiigBR1p1FFWAUUUUAFFFFBkFFFFNAFKOlFFMBaKKKACgGiigTH0UUUEhRRRVgKOtOoooAKKKKAFHWloooAKKKKqO4C5pR0ooqyWLRRRQAUZoooAfRRRQAUZoooAduz2oooqxMKWiigkTdinKciiigBaKKKACiiigAozRRQAoOD60u/wBhRRTQC0UUVQBRRRQAUUUUAJijFFFABijFFFBLDFGKKKAQYoxRRQULRRRQAUUUUAFJux2oooAQtkdMUmaKKlgGaKKKQBRRRQAUUUUAIxwKbuzRRQAdaKKKACiiigpDc0UUVAwprNg0UUAJRRRQAUUUUANzSUUUDQUUUVEtxiHpSZooqQCiiigBD0ptFFABRRRUsAppPNFFIaCkoooKCiiigBtFFFABRRRQwCiiipAKKKKDUQ9KbRRUsAooooQBSHrRRQwG0UUUgCiiigAooooAKKKKACiiigAooooAKKKKACiiigD/2Q=="
+File names carry a hash of their content, so a changed image always gets a
+new URL.  URLs also add ``?v=<hash>``, which makes the static handler send a
+long-lived ``Cache-Control`` header.
+
+Tenant logos entered as ``data:`` URIs go through the same path: they are
+written once to ``static/tenant/`` under their content hash.
+"""
+import base64
+import binascii
+import hashlib
+import os
+import pathlib
+
+STATIC_DIR = pathlib.Path(__file__).resolve().parents[1] / "static"
+STATIC_URL = "app/static"
+
+YORK_LOGO = "york_logo.9f9e18e17c82.jpg"
+LOGIN_BG = "login_bg.91ecb74f07f9.jpg"
+
+# MIME types the static handler serves as images (others are sent as text/plain)
+_IMAGE_EXT = {"image/jpeg": ".jpg", "image/jpg": ".jpg", "image/png": ".png",
+              "image/gif": ".gif", "image/webp": ".webp"}
+
+
+def static_url(filename: str) -> str:
+    """URL of a hashed file in ``static/`` (``name.<hash>.ext``)."""
+    digest = filename.rsplit(".", 2)[-2] if filename.count(".") >= 2 else "0"
+    return f"{STATIC_URL}/{filename}?v={digest}"
+
+
+def image_url(src: str) -> str:
+    """URL to use for an image reference.
+
+    ``data:`` URIs of JPEG/PNG/GIF/WebP images are written to
+    ``static/tenant/`` under a content hash (once) and replaced by their
+    static URL.  Anything else — ``https://`` links, unsupported types,
+    unwritable static directory — is returned unchanged.
+    """
+    src = (src or "").strip()
+    if not src.startswith("data:"):
+        return src
+    head, _, payload = src.partition(",")
+    mime = head[5:].split(";")[0].lower()
+    if mime not in _IMAGE_EXT or ";base64" not in head:
+        return src
+    try:
+        data = base64.b64decode(payload, validate=False)
+    except (binascii.Error, ValueError):
+        return src
+    filename = f"tenant/{hashlib.sha256(data).hexdigest()[:12]}{_IMAGE_EXT[mime]}"
+    dest = STATIC_DIR / filename
+    if not dest.exists():
+        try:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            tmp = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, dest)
+        except OSError:
+            return src
+    return f"{STATIC_URL}/{filename}?v={dest.stem}"
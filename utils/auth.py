@@ -78,7 +78,7 @@ def handle_login() -> bool:
     when credentials are missing / invalid.
     """
     from utils.paths import all_tenants  # deferred to avoid circular import
-    from utils.ui import YORK_LOGO_B64, LOGIN_BG_B64
+    from utils.assets import LOGIN_BG, YORK_LOGO, static_url
 
     if "auth_user" not in st.session_state:
         st.session_state["auth_user"] = None
@@ -89,7 +89,7 @@ def handle_login() -> bool:
     # ── render login page ───────────────────────────────────────────
     st.markdown(
         f"""<style>
-        [data-testid="stAppViewContainer"]{{background:url('data:image/jpeg;base64,{LOGIN_BG_B64}') center center/cover no-repeat fixed !important}}
+        [data-testid="stAppViewContainer"]{{background:url('{static_url(LOGIN_BG)}') center center/cover no-repeat fixed !important}}
         [data-testid="stAppViewContainer"]::before{{content:'';position:fixed;top:0;left:0;width:100%;height:100%;background:rgba(10,18,36,0.45);z-index:0;pointer-events:none}}
         [data-testid="stMainBlockContainer"]{{max-width:400px !important;margin:0 auto !important;padding-top:4vh !important}}
         [data-testid="stForm"]{{background:rgba(255,255,255,0.95);border-radius:0 0 16px 16px;padding:28px 32px 32px 32px;box-shadow:0 4px 24px rgba(0,0,0,.25);backdrop-filter:blur(10px);border:none}}
@@ -102,7 +102,7 @@ def handle_login() -> bool:
     st.markdown(
         f"""<div style="background:rgba(255,255,255,0.95);border-radius:16px 16px 0 0;padding:36px 32px 8px 32px;box-shadow:0 -4px 24px rgba(0,0,0,.15);backdrop-filter:blur(10px)">
             <div style="text-align:center;margin-bottom:8px;">
-                <img src="data:image/jpeg;base64,{YORK_LOGO_B64}" style="display:block;margin:0 auto 12px;max-height:120px;width:auto;object-fit:contain;">
+                <img src="{static_url(YORK_LOGO)}" style="display:block;margin:0 auto 12px;max-height:120px;width:auto;object-fit:contain;">
                 <span style="font-size:1.4rem;font-weight:800;color:#1e2a3a;">ChannelPRO\u2122</span><br>
                 <span style="font-size:.88rem;color:#4a6a8f;">Partner Revenue Optimizer</span>
             </div></div>""",
@@ -0,0 +1,136 @@
+"""
+On-disk byte caches for ChannelPRO™.
+
+Generated files (Excel workbooks, CSV reports) and Ask ChannelPRO™ replies
+are stored under ``BASE_DIR/cache/<name>/`` keyed on a hash of whatever they
+were built from — typically ``(tenant, data version, enabled metrics,
+export kind)``.  Entries are evicted least-recently-used once the directory
+exceeds its byte budget, so the caches are safe to leave on the persistent
+disk.  A cache may also expire entries a fixed time after they were written.
+"""
+import hashlib
+import json
+import os
+import pathlib
+import threading
+import time
+
+from utils.paths import BASE_DIR
+
+EXPORT_CACHE_MB = int(os.environ.get("CHANNELPRO_EXPORT_CACHE_MB", "256"))
+AI_CACHE_MB = int(os.environ.get("CHANNELPRO_AI_CACHE_MB", "64"))
+AI_CACHE_TTL_H = float(os.environ.get("CHANNELPRO_AI_CACHE_TTL_H", "24"))
+
+
+class DiskCache:
+    """Size-bounded LRU cache of ``bytes`` values stored one file per key.
+
+    An entry's access time records its last use (LRU order); its
+    modification time is when it was written, which *ttl* (seconds,
+    ``None`` = never) is measured from.
+    """
+
+    def __init__(self, root: pathlib.Path, max_bytes: int, ttl: float | None = None):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        root.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(*parts) -> str:
+        """Stable hex key for any JSON-serialisable key parts."""
+        blob = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.sha256(blob.encode()).hexdigest()[:32]
+
+    def _path(self, key: str) -> pathlib.Path:
+        return self.root / f"{key}.bin"
+
+    def get(self, key: str) -> bytes | None:
+        """Return the cached bytes for *key*, marking the entry as recently used."""
+        p = self._path(key)
+        try:
+            written = p.stat().st_mtime
+            if self.ttl is not None and time.time() - written > self.ttl:
+                p.unlink(missing_ok=True)
+                return None
+            data = p.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(p, (time.time(), written))
+        except OSError:
+            pass
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store *data* under *key*, then evict old entries beyond the budget."""
+        p = self._path(key)
+        tmp = p.with_name(f".{p.name}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, p)
+        self._evict()
+
+    def get_or_build(self, key: str, build) -> bytes | None:
+        """Return cached bytes, or call *build()* and cache a non-``None`` result."""
+        data = self.get(key)
+        if data is None:
+            data = build()
+            if data is not None:
+                self.put(key, data)
+        return data
+
+    def clear(self) -> None:
+        for p in self.root.glob("*.bin"):
+            p.unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        with self._lock:
+            entries = []
+            expired = time.time() - self.ttl if self.ttl is not None else None
+            for p in self.root.glob("*.bin"):
+                try:
+                    st_ = p.stat()
+                except FileNotFoundError:
+                    continue
+                if expired is not None and st_.st_mtime < expired:
+                    p.unlink(missing_ok=True)
+                    continue
+                entries.append((max(st_.st_atime, st_.st_mtime), st_.st_size, p))
+            total = sum(size for _, size, _ in entries)
+            for _, size, p in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                p.unlink(missing_ok=True)
+                total -= size
+
+
+_export_cache: DiskCache | None = None
+_ai_cache: DiskCache | None = None
+
+
+def export_cache() -> DiskCache:
+    """Process-wide cache for download-button exports."""
+    global _export_cache
+    if _export_cache is None:
+        _export_cache = DiskCache(BASE_DIR / "cache" / "exports", EXPORT_CACHE_MB * 1024 * 1024)
+    return _export_cache
+
+
+def ai_cache() -> DiskCache | None:
+    """Process-wide cache of parsed Ask ChannelPRO™ replies (``None`` when disabled)."""
+    global _ai_cache
+    if AI_CACHE_TTL_H <= 0 or AI_CACHE_MB <= 0:
+        return None
+    if _ai_cache is None:
+        _ai_cache = DiskCache(BASE_DIR / "cache" / "ai", AI_CACHE_MB * 1024 * 1024, ttl=AI_CACHE_TTL_H * 3600)
+    return _ai_cache
+
+
+def frame_version(df) -> str:
+    """Content hash of a DataFrame, for exports derived from computed tables."""
+    import pandas as pd
+
+    h = hashlib.sha256(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    h.update(",".join(map(str, df.columns)).encode())
+    return h.hexdigest()[:16]
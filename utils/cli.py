@@ -0,0 +1,283 @@
+"""
+Headless batch runner for ChannelPRO™.
+
+Runs the heavy tenant operations — CSV import, re-scoring, benchmark
+recalculation and exports — outside a Streamlit rerun, so they can be
+scheduled (cron, Render jobs) or pointed at files too large for a browser
+upload.  Every command targets one or more tenants explicitly; criteria are
+read from the tenant's ``scoring_criteria.json`` unless ``--criteria`` is
+given.
+
+An explicit ``--criteria`` file is read-only unless ``--save-criteria`` is
+also given, which overwrites each target tenant's ``scoring_criteria.json``
+with it.  Commands that write scores (``rescore``, ``import``) require
+``--save-criteria`` alongside ``--criteria``, so saved scores always match
+the criteria the app loads; ``benchmarks --criteria`` without it is a dry
+run.
+
+Examples::
+
+    python -m utils.cli rescore --all-tenants
+    python -m utils.cli benchmarks --tenant acme_corp
+    python -m utils.cli benchmarks --tenant acme_corp --criteria template.json   # dry run
+    python -m utils.cli rescore --tenant acme_corp --criteria template.json --save-criteria
+    python -m utils.cli import --tenant acme_corp partners.csv --map annual_revenues="Revenue 2024"
+    python -m utils.cli export --tenant acme_corp --kind assessment-xlsx --out acme.xlsx
+    python -m utils.cli export --all-tenants --kind parquet --out "{tenant}.parquet"
+    python -m utils.cli page-timings
+"""
+import argparse
+import json
+import pathlib
+import subprocess
+import sys
+
+from utils.paths import all_tenants, save_path, use_tenant
+
+
+def _quiet_streamlit() -> None:
+    """Silence the "missing ScriptRunContext" noise of bare-mode Streamlit."""
+    from streamlit import config, logger
+
+    config.set_option("global.showWarningOnDirectExecution", False)
+    logger.set_log_level("error")
+
+
+def _tenants(args) -> list[str]:
+    if args.all_tenants:
+        return all_tenants()
+    known = set(all_tenants())
+    missing = [t for t in args.tenant if t not in known]
+    if missing:
+        raise SystemExit(f"Unknown tenant(s): {', '.join(missing)}")
+    return args.tenant
+
+
+# Commands that persist scores computed from the criteria
+SCORE_WRITERS = ("rescore", "import")
+
+
+def _criteria(args) -> dict | None:
+    """Explicit ``--criteria`` file, else the active tenant's saved criteria.
+
+    With ``--save-criteria`` the explicit file also replaces the active
+    tenant's ``scoring_criteria.json``.
+    """
+    from utils.data import atomic_write_text
+    from utils.scoring import load_criteria
+
+    cr = load_criteria(pathlib.Path(args.criteria) if args.criteria else None)
+    if cr and args.criteria and args.save_criteria:
+        atomic_write_text(save_path(), json.dumps(cr, indent=2))
+    return cr
+
+
+# ── Commands ────────────────────────────────────────────────────────────
+
+def cmd_rescore(args, tid: str) -> str:
+    from utils.data import partner_count
+    from utils.scoring import rescore_all
+
+    cr = _criteria(args)
+    if not cr:
+        return "skipped (no scoring criteria)"
+    rescore_all(cr)
+    return f"re-scored {partner_count()} partners"
+
+
+def cmd_benchmarks(args, tid: str) -> str:
+    from utils.scoring import recalculate_benchmarks
+
+    cr = _criteria(args)
+    if not cr:
+        return "skipped (no scoring criteria)"
+    if args.criteria and not args.save_criteria:
+        res = recalculate_benchmarks(cr, persist=False)
+        return (f"dry run: {len(res['updated'])} metric(s) would change, {len(res['skipped'])} skipped "
+                f"(add --save-criteria to apply)")
+    res = recalculate_benchmarks(cr)
+    return f"{len(res['updated'])} metric(s) updated, {len(res['skipped'])} skipped"
+
+
+def cmd_import(args, tid: str) -> str:
+    import pandas as pd
+
+    from utils.importer import (
+        DETAIL_KEYS, auto_detail_mapping, auto_metric_mapping, auto_partner_column,
+        create_import_job, run_import_job,
+    )
+    from utils.scoring import enabled
+
+    if args.resume:
+        job_id = args.resume
+    else:
+        if not args.file:
+            return "failed (a CSV file or --resume JOB_ID is required)"
+        cr = _criteria(args)
+        if not cr:
+            return "skipped (no scoring criteria)"
+        cols = list(pd.read_csv(args.file, nrows=0).columns)
+        partner_col = args.partner_column or auto_partner_column(cols)
+        if partner_col not in cols:
+            return f"failed (partner column not found; columns: {cols})"
+        detail_mapping = auto_detail_mapping(cols)
+        metric_mapping = {} if args.no_auto_map else auto_metric_mapping(cols, enabled(cr))
+        for spec in args.map:
+            key, _, col = spec.partition("=")
+            if col not in cols:
+                return f"failed (--map {spec}: no column {col!r})"
+            if key in DETAIL_KEYS:
+                detail_mapping[key] = col
+            else:
+                metric_mapping[key] = col
+        job_id = create_import_job(
+            pathlib.Path(args.file).read_bytes(), pathlib.Path(args.file).name,
+            partner_col, detail_mapping, metric_mapping, cr,
+        )
+    try:
+        res = run_import_job(job_id)
+    except BaseException:
+        print(f"  interrupted — resume with: import --tenant {tid} --resume {job_id}", file=sys.stderr)
+        raise
+    for err in res["errors"]:
+        print(f"  row {err['row']}: {err['partner']}: {err['error']}", file=sys.stderr)
+    return (f"{res['created']} created, {res['updated']} updated, "
+            f"{len(res['errors'])} errors ({len(res['metric_mapping'])} metrics mapped)")
+
+
+def cmd_export(args, tid: str) -> str:
+    from utils.data import load_partners
+    from utils.exports import assessment_xlsx
+    from utils.paths import csv_path
+    from utils.scoring import enabled
+
+    out = pathlib.Path(args.out.format(tenant=tid))
+    if args.kind == "assessment-csv":
+        if not csv_path().exists():
+            return "skipped (no partners)"
+        out.write_bytes(csv_path().read_bytes())
+    elif args.kind in ("parquet", "arrow"):
+        from utils.snapshot import parquet_bytes, write_snapshot
+
+        cr = _criteria(args)
+        if args.kind == "arrow":
+            written = write_snapshot(cr, out)
+        else:
+            data = parquet_bytes(cr)
+            written = data is not None and out.write_bytes(data)
+        if not written:
+            return "failed (pyarrow is not installed)"
+    else:
+        cr = _criteria(args)
+        if not cr:
+            return "skipped (no scoring criteria)"
+        data = assessment_xlsx(load_partners(), enabled(cr))
+        if data is None:
+            return "failed (openpyxl is not installed)"
+        out.write_bytes(data)
+    return f"wrote {out}"
+
+
+# ── Page import timings ─────────────────────────────────────────────────
+
+# Optional dependencies worth knowing about when a page module is imported
+HEAVY_MODULES = ("pandas", "pyarrow", "st_aggrid", "plotly", "altair", "openpyxl")
+
+_TIMING_SNIPPET = """
+import importlib, json, sys, time
+import streamlit
+before = set(sys.modules)
+t = time.perf_counter()
+for name in sys.argv[1:]:
+    importlib.import_module(name)
+ms = (time.perf_counter() - t) * 1000
+print(json.dumps({"ms": ms, "new": sorted({m.split(".")[0] for m in set(sys.modules) - before})}))
+"""
+
+
+def _cold_import(modules: list[str]) -> dict:
+    """Import *modules* in a fresh interpreter (after streamlit) and time it."""
+    root = pathlib.Path(__file__).resolve().parents[1]
+    out = subprocess.run([sys.executable, "-c", _TIMING_SNIPPET, *modules], cwd=root,
+                         capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def cmd_page_timings(args) -> int:
+    """Cold-import cost of each page module versus importing every page."""
+    from pages.views import PAGE_MODULES
+
+    mods = sorted(set(PAGE_MODULES.values()))
+    targets = [("(all pages)", [f"pages.views.{m}" for m in mods])] + [(m, [f"pages.views.{m}"]) for m in mods]
+    print(f"{'page module':<24} {'import ms':>10}  heavy dependencies loaded")
+    for label, modules in targets:
+        runs = [_cold_import(modules) for _ in range(args.runs)]
+        best = min(runs, key=lambda r: r["ms"])
+        heavy = [m for m in HEAVY_MODULES if m in best["new"]]
+        print(f"{label:<24} {best['ms']:>10.1f}  {', '.join(heavy) or '—'}")
+    return 0
+
+
+# ── Entry point ─────────────────────────────────────────────────────────
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m utils.cli", description=__doc__.split("\n\n")[1])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add(name, func, help_):
+        sp = sub.add_parser(name, help=help_)
+        grp = sp.add_mutually_exclusive_group(required=True)
+        grp.add_argument("--tenant", action="append", default=[], help="Tenant ID (repeatable)")
+        grp.add_argument("--all-tenants", action="store_true", help="Run for every tenant")
+        sp.add_argument("--criteria", help="Scoring criteria JSON to use instead of the tenant's own "
+                                           "(read-only unless --save-criteria is given)")
+        sp.add_argument("--save-criteria", action="store_true",
+                        help="Overwrite each tenant's scoring_criteria.json with --criteria "
+                             f"(required by {' and '.join(SCORE_WRITERS)} when --criteria is given)")
+        sp.set_defaults(func=func)
+        return sp
+
+    add("rescore", cmd_rescore, "Re-score all partners from raw data")
+    add("benchmarks", cmd_benchmarks, "Recalculate quintile benchmarks and re-score")
+    sp = add("import", cmd_import, "Import partners from a CSV file")
+    sp.add_argument("file", nargs="?", help="CSV file to import")
+    sp.add_argument("--resume", metavar="JOB_ID", help="Resume an interrupted import job instead")
+    sp.add_argument("--partner-column", help="Column holding the partner name (default: auto-detect)")
+    sp.add_argument("--map", action="append", default=[], metavar="FIELD=COLUMN",
+                    help="Map a metric key or detail field to a CSV column (repeatable)")
+    sp.add_argument("--no-auto-map", action="store_true", help="Only use explicit --map metric mappings")
+    sp = add("export", cmd_export, "Write an assessment export to disk")
+    sp.add_argument("--kind", choices=["assessment-xlsx", "assessment-csv", "parquet", "arrow"], default="assessment-xlsx")
+    sp.add_argument("--out", required=True, help="Output path; may contain {tenant}")
+    sp = sub.add_parser("page-timings", help="Measure cold-import time of each page module")
+    sp.add_argument("--runs", type=int, default=3, help="Fresh interpreters per module (best is reported)")
+    sp.set_defaults(func=cmd_page_timings)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, "save_criteria", False) and not args.criteria:
+        parser.error("--save-criteria requires --criteria")
+    if args.command in SCORE_WRITERS and getattr(args, "criteria", None) and not args.save_criteria:
+        parser.error(f"{args.command} --criteria writes scores; add --save-criteria to also save the criteria "
+                     "to each tenant, so saved scores match the criteria the app loads")
+    _quiet_streamlit()
+    if args.command == "page-timings":
+        return args.func(args)
+    status = 0
+    for tid in _tenants(args):
+        with use_tenant(tid):
+            try:
+                msg = args.func(args, tid)
+            except Exception as e:
+                msg = f"failed ({e})"
+        if msg.startswith("failed"):
+            status = 1
+        print(f"{tid}: {msg}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""
+Ask ChannelPRO™ conversation store and token-budgeted history.
+
+Conversations are kept per user in ``<tenant>/conversations/<user>.json``
+rather than in session state.  A file holds the most recent
+``CHAT_MAX_STORED`` messages (what the chat page shows) and a running
+summary — one condensed line per older exchange.
+
+:func:`api_messages` builds the history sent to the model:
+
+* the last ``CHAT_KEEP_TURNS`` exchanges verbatim, with assistant replies
+  compacted (table rows capped at ``CHAT_TABLE_ROWS``, chart data dropped),
+  trimmed from the oldest end while they exceed ``CHAT_HISTORY_TOKENS``;
+* every older exchange as a summary line, capped at
+  ``CHAT_SUMMARY_TOKENS`` (oldest lines go first) and prefixed to the first
+  kept question.
+
+Token counts are estimated locally at about four characters per token, so
+request size stays bounded however long a conversation runs.
+"""
+import json
+import math
+import os
+import pathlib
+import re
+import time
+
+from utils.data import atomic_write_text
+from utils.paths import conversations_dir
+
+CHAT_HISTORY_TOKENS = int(os.environ.get("CHANNELPRO_AI_HISTORY_TOKENS", "6000"))
+CHAT_SUMMARY_TOKENS = int(os.environ.get("CHANNELPRO_AI_SUMMARY_TOKENS", "1500"))
+CHAT_KEEP_TURNS = int(os.environ.get("CHANNELPRO_AI_KEEP_TURNS", "6"))
+CHAT_MAX_STORED = int(os.environ.get("CHANNELPRO_AI_STORED_MESSAGES", "100"))
+CHAT_TABLE_ROWS = 15
+_SUMMARY_OPEN, _SUMMARY_CLOSE = "<earlier_conversation>", "</earlier_conversation>"
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of *text* (about four characters per token)."""
+    return math.ceil(len(text) / 4)
+
+
+# ── Store ───────────────────────────────────────────────────────────────
+
+def conversation_path(user: str) -> pathlib.Path:
+    """Path to *user*'s conversation file in the active tenant."""
+    return conversations_dir() / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', user or 'anonymous')}.json"
+
+
+def load_conversation(user: str) -> dict:
+    """``{"messages": [{"role", "content"}, ...], "summary": [str, ...]}`` for *user*."""
+    p = conversation_path(user)
+    try:
+        conv = json.loads(p.read_text())
+    except (FileNotFoundError, ValueError):
+        return {"messages": [], "summary": []}
+    return {"messages": conv.get("messages", []), "summary": conv.get("summary", [])}
+
+
+def save_conversation(user: str, conv: dict) -> None:
+    """Persist *conv*, folding messages beyond ``CHAT_MAX_STORED`` into the summary."""
+    msgs = conv["messages"]
+    if len(msgs) > CHAT_MAX_STORED:
+        old_turns = _turns(msgs[:len(msgs) - CHAT_MAX_STORED])
+        conv["summary"] = _cap_summary(conv["summary"] + [condense_turn(t) for t in old_turns])
+        conv["messages"] = msgs[len(msgs) - CHAT_MAX_STORED:]
+    atomic_write_text(conversation_path(user), json.dumps({**conv, "updated": time.strftime("%Y-%m-%dT%H:%M:%S")}))
+
+
+def append_message(user: str, role: str, content: str) -> dict:
+    """Add a message to *user*'s conversation and return the saved conversation."""
+    conv = load_conversation(user)
+    conv["messages"].append({"role": role, "content": content})
+    save_conversation(user, conv)
+    return conv
+
+
+def clear_conversation(user: str) -> None:
+    """Delete *user*'s conversation."""
+    conversation_path(user).unlink(missing_ok=True)
+
+
+# ── Budgeting ───────────────────────────────────────────────────────────
+
+def _turns(messages: list[dict]) -> list[dict]:
+    """Group messages into exchanges: a question and the replies that follow it."""
+    turns: list[dict] = []
+    for m in messages:
+        if m["role"] == "user" or not turns:
+            turns.append({"user": m["content"] if m["role"] == "user" else "", "replies": []})
+        if m["role"] != "user":
+            turns[-1]["replies"].append(m["content"])
+    return turns
+
+
+def _reply_json(content: str) -> dict | None:
+    try:
+        resp = json.loads(content)
+    except (ValueError, TypeError):
+        return None
+    return resp if isinstance(resp, dict) else None
+
+
+def _compact_reply(content: str) -> str:
+    """Assistant reply as sent back to the model: table capped, chart data dropped."""
+    resp = _reply_json(content)
+    if resp is None:
+        return content
+    table = resp.get("table") or []
+    if len(table) > CHAT_TABLE_ROWS:
+        resp = {**resp, "table": table[:CHAT_TABLE_ROWS], "table_note": f"{len(table) - CHAT_TABLE_ROWS} more rows not shown"}
+    if isinstance(resp.get("chart"), dict):
+        resp = {**resp, "chart": {k: v for k, v in resp["chart"].items() if k != "data"}}
+    return json.dumps(resp, separators=(",", ":"))
+
+
+def condense_turn(turn: dict) -> str:
+    """One summary line for an exchange."""
+    parts = []
+    if turn["user"]:
+        parts.append("Q: " + " ".join(turn["user"].split())[:200])
+    for content in turn["replies"]:
+        resp = _reply_json(content)
+        answer = (resp.get("answer", "") if resp else content) or ""
+        note = " ".join(answer.replace("\\n", " ").split())[:300]
+        if resp and resp.get("table"):
+            note += f" [table: {len(resp['table'])} rows]"
+        if resp and resp.get("updates"):
+            note += f" [proposed {len(resp['updates'])} score update(s)]"
+        parts.append("A: " + note)
+    return " → ".join(parts)
+
+
+def _cap_summary(lines: list[str]) -> list[str]:
+    """Drop the oldest summary lines until the summary fits ``CHAT_SUMMARY_TOKENS``."""
+    total = sum(estimate_tokens(s) for s in lines)
+    i = 0
+    while i < len(lines) and total > CHAT_SUMMARY_TOKENS:
+        total -= estimate_tokens(lines[i]); i += 1
+    return lines[i:]
+
+
+def _turn_messages(turn: dict) -> list[dict]:
+    out = [{"role": "user", "content": turn["user"]}]
+    if turn["replies"]:
+        out.append({"role": "assistant", "content": "\n".join(_compact_reply(c) for c in turn["replies"])})
+    return out
+
+
+def api_messages(conv: dict) -> list[dict]:
+    """Budgeted history for the API — alternating roles, ending with the latest question."""
+    turns = _turns(conv["messages"])
+    lead = [] if not turns or turns[0]["user"] else [turns.pop(0)]
+    keep = turns[-CHAT_KEEP_TURNS:] if CHAT_KEEP_TURNS > 0 else turns[-1:]
+    older = lead + turns[:len(turns) - len(keep)]
+    while len(keep) > 1 and sum(estimate_tokens(m["content"]) for t in keep for m in _turn_messages(t)) > CHAT_HISTORY_TOKENS:
+        older.append(keep.pop(0))
+    summary = _cap_summary(conv["summary"] + [condense_turn(t) for t in older])
+    msgs = [m for t in keep for m in _turn_messages(t)]
+    if summary and msgs:
+        msgs[0] = {"role": "user", "content": f"{_SUMMARY_OPEN}\n" + "\n".join(summary) + f"\n{_SUMMARY_CLOSE}\n\n{msgs[0]['content']}"}
+    return msgs
+
+
+def recent_questions(conv: dict, n: int = 2) -> list[str]:
+    """The last *n* questions asked, oldest first."""
+    return [m["content"] for m in conv["messages"] if m["role"] == "user"][-n:]
@@ -5,7 +5,9 @@ Uses ``@st.cache_data`` where appropriate to avoid redundant I/O on
 CSV and JSON files during a single Streamlit script run.
 """
 import csv
+import io
 import json
+import os
 import pathlib
 import re
 
@@ -14,10 +16,13 @@ import streamlit as st
 from utils.paths import (
     be_path,
     class_path,
+    client_path,
     csv_path,
     raw_path,
+    save_path,
     tenant_config_path,
 )
+from utils.perf import count_io
 
 
 # ── Helpers ─────────────────────────────────────────────────────────────
@@ -35,27 +40,106 @@ def _sf(val):
         return None
 
 
+def atomic_write_text(path: pathlib.Path, text: str) -> None:
+    """Write *text* to *path* via a temp file + rename, so readers never see a partial file."""
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(text)
+    os.replace(tmp, path)
+    count_io("write", path)
+
+
+def stat_token(*paths: pathlib.Path) -> str:
+    """Change token for *paths* from their mtime and size (``-`` if missing)."""
+    parts = []
+    for p in paths:
+        try:
+            st_ = p.stat()
+            parts.append(f"{st_.st_mtime_ns}:{st_.st_size}")
+        except FileNotFoundError:
+            parts.append("-")
+    return "|".join(parts)
+
+
+def data_version() -> str:
+    """Change token for the active tenant's partner data.
+
+    Built from file stats only (no reads), so it is cheap enough to compute
+    on every rerun and use as a cache key.
+    """
+    return stat_token(csv_path(), raw_path())
+
+
+def criteria_version() -> str:
+    """Change token for the active tenant's saved scoring criteria."""
+    return stat_token(save_path())
+
+
+def client_version() -> str:
+    """Change token for the active tenant's client intake info."""
+    return stat_token(client_path())
+
+
+PARTNER_DETAIL_FIELDS = [
+    "partner_name", "partner_year", "partner_tier", "partner_discount",
+    "partner_city", "partner_country", "pam_name", "pam_email",
+]
+
+
 # ── Cached CSV loading ──────────────────────────────────────────────────
 
-@st.cache_data(ttl=30)
-def load_partners_cached(_path_str: str) -> list[dict]:
+@st.cache_data(ttl=30, max_entries=64)
+def load_partners_cached(path_str: str, version: str = "") -> list[dict]:
     """Load partners from a CSV file with a 30-second TTL cache.
 
-    The *_path_str* parameter is a string (not a Path) because
-    ``@st.cache_data`` requires hashable arguments.  The leading
-    underscore tells Streamlit not to hash the parameter name.
+    Both arguments are part of the cache key: *path_str* is a string (not a
+    Path) so it hashes cheaply, and *version* is the file's stat token, so
+    writes made outside this process (CLI, background jobs) are seen at once.
     """
-    p = pathlib.Path(_path_str)
-    if not p.exists():
+    return read_partners(pathlib.Path(path_str))
+
+
+def read_partners(path: pathlib.Path) -> list[dict]:
+    """Uncached CSV read, for background jobs running outside a script run."""
+    if not path.exists():
         return []
-    with open(p, newline="") as f:
+    count_io("read", path)
+    with open(path, newline="") as f:
         return list(csv.DictReader(f))
 
 
 def load_partners(path: pathlib.Path | None = None) -> list[dict]:
     """Public wrapper — resolves the default path, then delegates to cache."""
     cp = path or csv_path()
-    return load_partners_cached(str(cp))
+    return load_partners_cached(str(cp), stat_token(cp))
+
+
+@st.cache_resource(max_entries=64)
+def _partner_index_cached(path_str: str, version: str) -> dict:
+    rows = []
+    for p in read_partners(pathlib.Path(path_str)):
+        pn = p.get("partner_name", "")
+        try: pct = float(p.get("percentage", 0) or 0)
+        except ValueError: pct = 0.0
+        rows.append((pn, pn.lower(), p.get("pam_name", "").strip(), pct))
+    rows.sort(key=lambda r: r[1])
+    return {"rows": tuple(rows), "pams": tuple(sorted({r[2] for r in rows if r[2]}))}
+
+
+def partner_index() -> dict:
+    """Name-sorted, read-only index of the active tenant's partners.
+
+    ``{"rows": ((name, name_lower, pam, pct), ...), "pams": (pam, ...)}``,
+    built once per data version and shared across sessions, so list views
+    can filter and page through it without reloading the CSV.
+    """
+    cp = csv_path()
+    return _partner_index_cached(str(cp), stat_token(cp))
+
+
+def search_partner_index(index: dict, query: str = "", pam: str | None = None) -> tuple:
+    """Rows of *index* whose name contains *query* (case-insensitive), optionally for one PAM."""
+    q = query.strip().lower()
+    return tuple(r for r in index["rows"] if (not q or q in r[1]) and (not pam or r[2] == pam))
 
 
 def invalidate_partner_cache() -> None:
@@ -63,12 +147,71 @@ def invalidate_partner_cache() -> None:
     load_partners_cached.clear()
 
 
+# ── Assessment frame ────────────────────────────────────────────────────
+
+ASSESSMENT_DETAIL_COLUMNS = {
+    "Partner": "partner_name", "Country": "partner_country", "City": "partner_city",
+    "Tier": "partner_tier", "Discount": "partner_discount", "PAM": "pam_name",
+}
+# Lower bounds of each grade (see ``utils.scoring.grade``), worst first
+GRADE_BINS = [(-float("inf"), "D"), (50, "C"), (60, "C+"), (70, "B"), (80, "B+"), (90, "A")]
+
+
+def frame_key(csv: pathlib.Path, enabled_metrics: list[dict]) -> tuple:
+    """``(path, stat token, metric keys, metric names)`` — the cache key of
+    :func:`assessment_frame`, for caches built on top of it."""
+    return (str(csv), stat_token(csv), tuple(m["key"] for m in enabled_metrics),
+            tuple(m["name"] for m in enabled_metrics))
+
+
+@st.cache_resource(max_entries=32)
+def assessment_frame_by_key(path_str: str, version: str, metric_keys: tuple, metric_names: tuple):
+    """:func:`assessment_frame` looked up by a :func:`frame_key` tuple.
+
+    For other cached functions that take the key as their own arguments, so
+    they invalidate together with the frame.  Treat the result as read-only.
+    """
+    import pandas as pd
+
+    raw = pd.DataFrame.from_records(read_partners(pathlib.Path(path_str)))
+
+    def col(field):
+        return raw[field].fillna("") if field in raw else pd.Series("", index=raw.index, dtype=object)
+
+    def num(field):
+        return pd.to_numeric(col(field), errors="coerce")
+
+    cols = {name: col(field) for name, field in ASSESSMENT_DETAIL_COLUMNS.items()}
+    for mk, name in zip(metric_keys, metric_names):
+        s = num(mk)
+        cols[name] = s.where(s.between(1, 5), 0).astype("int8")
+    cols["Total"] = num("total_score").fillna(0).astype("int32")
+    cols["Pct"] = num("percentage").fillna(0.0).round(1)
+    df = pd.DataFrame(cols, index=raw.index)
+    df["Grade"] = pd.cut(df["Pct"], bins=[b for b, _ in GRADE_BINS] + [float("inf")], right=False,
+                         labels=[g for _, g in GRADE_BINS], ordered=True)
+    return df
+
+
+def assessment_frame(enabled_metrics: list[dict], path: pathlib.Path | None = None):
+    """Typed assessment table of a tenant's partners, one row per partner.
+
+    Columns: Partner, Country, City, Tier, Discount, PAM, one ``int8``
+    column per enabled metric (named by metric name, 0 = unscored), Total
+    (``int32``), Pct (``float``, 1 dp) and Grade (ordered categorical,
+    ``D`` < … < ``A``).  Built once per data version and metric set and
+    shared across sessions and pages — treat it as read-only.
+    """
+    return assessment_frame_by_key(*frame_key(path or csv_path(), enabled_metrics))
+
+
 # ── Raw partner data (JSON) ────────────────────────────────────────────
 
 def load_raw() -> list[dict]:
     """Load the raw (pre-scored) partner data list."""
     rp = raw_path()
     if rp.exists():
+        count_io("read", rp)
         try:
             return json.loads(rp.read_text())
         except Exception:
@@ -79,7 +222,10 @@ def load_raw() -> list[dict]:
 def save_raw(partner_raw: dict) -> None:
     """Upsert a single partner's raw data into the raw JSON file."""
     rp = raw_path()
-    all_raw = json.loads(rp.read_text()) if rp.exists() else []
+    all_raw = []
+    if rp.exists():
+        count_io("read", rp)
+        all_raw = json.loads(rp.read_text())
     found = False
     for i, r in enumerate(all_raw):
         if r.get("partner_name") == partner_raw.get("partner_name"):
@@ -89,6 +235,7 @@ def save_raw(partner_raw: dict) -> None:
     if not found:
         all_raw.append(partner_raw)
     rp.write_text(json.dumps(all_raw, indent=2))
+    count_io("write", rp)
 
 
 # ── Partner CRUD ────────────────────────────────────────────────────────
@@ -108,6 +255,7 @@ def append_partner(row_dict: dict, raw_dict: dict, enabled_metrics: list) -> Non
         if not exists:
             w.writeheader()
         w.writerow(row_dict)
+    count_io("write", cp)
     save_raw(raw_dict)
     invalidate_partner_cache()
 
@@ -117,11 +265,13 @@ def delete_partner(partner_name: str) -> None:
     # Remove from raw
     rp = raw_path()
     if rp.exists():
+        count_io("read", rp)
         raw = [
             r for r in json.loads(rp.read_text())
             if r.get("partner_name") != partner_name
         ]
         rp.write_text(json.dumps(raw, indent=2))
+        count_io("write", rp)
     # Remove from CSV
     cp = csv_path()
     if cp.exists():
@@ -132,11 +282,138 @@ def delete_partner(partner_name: str) -> None:
                 w.writeheader()
                 for p in partners:
                     w.writerow(p)
+            count_io("write", cp)
         else:
             cp.unlink()
     invalidate_partner_cache()
 
 
+def upsert_partners(rows: list[tuple[dict, dict]], enabled_metrics: list) -> None:
+    """Create or replace many partners with one read and one write per file.
+
+    *rows* is a list of ``(row_dict, raw_dict)`` pairs.  Names are matched
+    case-insensitively; replaced partners move to the end, exactly as with
+    repeated :func:`upsert_partner` calls.  Both files are written atomically,
+    so applying the same batch twice leaves the same result (the import job
+    runner relies on this when it replays an interrupted chunk).
+    """
+    batch: dict[str, tuple[dict, dict]] = {}
+    for row_dict, raw_dict in rows:
+        pn = row_dict.get("partner_name", "").strip()
+        if pn:
+            batch[pn.lower()] = (row_dict, raw_dict)
+    if not batch:
+        return
+
+    def _key(d: dict) -> str:
+        return d.get("partner_name", "").strip().lower()
+
+    # Raw JSON
+    rp = raw_path()
+    all_raw = load_raw()
+    all_raw = [r for r in all_raw if _key(r) not in batch] + [raw for _, raw in batch.values()]
+    atomic_write_text(rp, json.dumps(all_raw, indent=2))
+
+    # Scored CSV — keep the existing header (it may hold disabled metrics)
+    fnames = PARTNER_DETAIL_FIELDS + [m["key"] for m in enabled_metrics]
+    fnames += ["total_score", "max_possible", "percentage"]
+    cp = csv_path()
+    existing: list[dict] = []
+    if cp.exists():
+        count_io("read", cp)
+        with open(cp, newline="") as f:
+            reader = csv.DictReader(f)
+            existing = [p for p in reader if _key(p) not in batch]
+            header = list(reader.fieldnames or [])
+        fnames = header + [k for k in fnames if k not in header]
+    buf = io.StringIO()
+    w = csv.DictWriter(buf, fieldnames=fnames, extrasaction="ignore", restval="")
+    w.writeheader()
+    w.writerows(existing)
+    w.writerows(row for row, _ in batch.values())
+    atomic_write_text(cp, buf.getvalue())
+    invalidate_partner_cache()
+
+
+def _score(val) -> int:
+    """A 1–5 score cell as an int (0 when empty or out of range)."""
+    v = _sf(val)
+    return int(v) if v is not None and 1 <= v <= 5 else 0
+
+
+def apply_score_patches(patches: list[tuple], enabled_metrics: list, dry_run: bool = False) -> list[dict]:
+    """Set many ``(partner, metric_key, score, raw_value)`` cells with one write per file.
+
+    Partners are matched case-insensitively through a name index; patches
+    for unknown partners, disabled metrics or scores outside 1–5 are
+    skipped, as are patches that change nothing.  *raw_value* (``None`` =
+    leave the raw value alone) is stored as ``raw_<metric_key>``.  Totals
+    and percentages are recomputed for the touched partners only.  Later
+    patches to the same cell win.
+
+    Returns the diff — one ``{"partner", "metric_key", "old_score",
+    "new_score", "old_pct", "new_pct"}`` per changed cell.  With *dry_run*
+    nothing is written, so the diff can preview a confirmation.
+    """
+    em_keys = [m["key"] for m in enabled_metrics]
+    cp = csv_path()
+    if not patches or not cp.exists():
+        return []
+    count_io("read", cp)
+    with open(cp, newline="") as f:
+        reader = csv.DictReader(f)
+        rows = list(reader)
+        header = list(reader.fieldnames or [])
+    index = {r.get("partner_name", "").strip().lower(): r for r in rows}
+
+    cells: dict[tuple[str, str], tuple[int, object]] = {}
+    for pn, mk, score, raw_value in patches:
+        name = str(pn or "").strip().lower()
+        if name in index and mk in em_keys and isinstance(score, int) and 1 <= score <= 5:
+            cells[(name, mk)] = (score, raw_value)
+
+    touched: dict[str, float] = {}
+    diff = []
+    for (name, mk), (score, _) in cells.items():
+        row = index[name]
+        old = _score(row.get(mk))
+        if old == score:
+            continue
+        touched.setdefault(name, _sf(row.get("percentage")) or 0.0)
+        row[mk] = score
+        diff.append({"partner": row["partner_name"], "metric_key": mk, "old_score": old or None, "new_score": score})
+    for name, old_pct in touched.items():
+        row = index[name]
+        scores = [s for s in (_score(row.get(k)) for k in em_keys) if s]
+        total, mp = sum(scores), len(scores) * 5
+        row["total_score"] = total; row["max_possible"] = mp
+        row["percentage"] = round(total / mp * 100, 1) if mp else 0
+    for d in diff:
+        row = index[d["partner"].strip().lower()]
+        d["old_pct"] = touched[d["partner"].strip().lower()]; d["new_pct"] = row["percentage"]
+    if dry_run or not diff:
+        return diff
+
+    fnames = header + [k for k in em_keys + ["total_score", "max_possible", "percentage"] if k not in header]
+    buf = io.StringIO()
+    w = csv.DictWriter(buf, fieldnames=fnames, extrasaction="ignore", restval="")
+    w.writeheader()
+    w.writerows(rows)
+    atomic_write_text(cp, buf.getvalue())
+
+    changed = {(d["partner"].strip().lower(), d["metric_key"]) for d in diff}
+    raw_cells = {c: rv for c, (_, rv) in cells.items() if rv is not None and c in changed}
+    if raw_cells:
+        all_raw = load_raw()
+        raw_index = {r.get("partner_name", "").strip().lower(): r for r in all_raw}
+        for (name, mk), rv in raw_cells.items():
+            if name in raw_index:
+                raw_index[name][f"raw_{mk}"] = rv
+        atomic_write_text(raw_path(), json.dumps(all_raw, indent=2))
+    invalidate_partner_cache()
+    return diff
+
+
 def partner_exists(name: str) -> bool:
     """Check whether a partner with the given name already exists."""
     return any(
@@ -162,6 +439,7 @@ def load_tenant_config(tid: str | None = None) -> dict:
     """Load the per-tenant configuration dict."""
     tp = tenant_config_path(tid)
     if tp.exists():
+        count_io("read", tp)
         try:
             return json.loads(tp.read_text())
         except Exception:
@@ -171,7 +449,9 @@ def load_tenant_config(tid: str | None = None) -> dict:
 
 def save_tenant_config(cfg: dict, tid: str | None = None) -> None:
     """Persist the per-tenant configuration dict."""
-    tenant_config_path(tid).write_text(json.dumps(cfg, indent=2))
+    tp = tenant_config_path(tid)
+    tp.write_text(json.dumps(cfg, indent=2))
+    count_io("write", tp)
 
 
 def max_partners() -> int:
@@ -192,6 +472,7 @@ def load_q_config() -> dict:
 
     cp = class_path()
     if cp.exists():
+        count_io("read", cp)
         try:
             raw = json.loads(cp.read_text())
             return {
@@ -205,9 +486,9 @@ def load_q_config() -> dict:
 
 def save_q_config(config: dict) -> None:
     """Persist the quadrant classification config."""
-    class_path().write_text(
-        json.dumps({str(k): v for k, v in config.items()}, indent=2)
-    )
+    cp = class_path()
+    cp.write_text(json.dumps({str(k): v for k, v in config.items()}, indent=2))
+    count_io("write", cp)
 
 
 # ── Break-even config ──────────────────────────────────────────────────
@@ -218,6 +499,7 @@ def load_be() -> dict:
 
     p = be_path()
     if p.exists():
+        count_io("read", p)
         try:
             return json.loads(p.read_text())
         except Exception:
@@ -236,4 +518,6 @@ def load_be() -> dict:
 
 def save_be(cfg: dict) -> None:
     """Persist the break-even configuration."""
-    be_path().write_text(json.dumps(cfg, indent=2))
+    p = be_path()
+    p.write_text(json.dumps(cfg, indent=2))
+    count_io("write", p)
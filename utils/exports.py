@@ -0,0 +1,263 @@
+"""
+Spreadsheet exports for ChannelPRO™.
+
+Workbook builders live here (rather than in ``app.py``) so that they can be
+used both by the Streamlit pages and by the headless CLI.  ``openpyxl`` is
+an optional dependency — builders return ``None`` when it is missing.
+
+Builders use openpyxl's ``write_only`` mode: rows are streamed to the sheet
+one at a time and styles are registered once per workbook as named styles,
+so time and memory grow linearly with the number of rows.  The finished
+workbook is spooled to a temp file (in memory while small) rather than a
+growing ``BytesIO``.
+"""
+import json
+import re
+import tempfile
+from typing import Callable, Iterable
+
+from utils.scoring import grade
+
+# Workbooks larger than this are spooled to disk while being zipped
+_SPOOL_BYTES = 8 * 1024 * 1024
+
+_HEADER_BG = "1E2A3A"
+_BORDER_COLOR = "CCCCCC"
+_SCORE_BG = {1: "FA7A7A", 2: "FA7A7A", 3: "FFFFCC", 4: "C6EFCE", 5: "C6EFCE"}
+_QUADRANT_BG = {1: "D6E4F0", 2: "C6EFCE", 3: "FFFFCC", 4: "FA7A7A"}
+
+
+# ── Helpers ─────────────────────────────────────────────────────────────
+
+def _register_styles(wb) -> None:
+    """Add the shared named styles to *wb* (once per workbook)."""
+    from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+
+    side = Side(style="thin", color=_BORDER_COLOR)
+    bdr = Border(left=side, right=side, top=side, bottom=side)
+    center = Alignment(horizontal="center")
+
+    def add(name, **attrs):
+        ns = NamedStyle(name=name, border=bdr)
+        for k, v in attrs.items():
+            setattr(ns, k, v)
+        wb.add_named_style(ns)
+
+    header = dict(fill=PatternFill(start_color=_HEADER_BG, end_color=_HEADER_BG, fill_type="solid"),
+                  font=Font(color="FFFFFF", bold=True, size=10))
+    add("cp_header", alignment=Alignment(horizontal="center", wrap_text=True), **header)
+    add("cp_header_metric", alignment=Alignment(horizontal="center", vertical="bottom",
+                                                text_rotation=55, wrap_text=False), **header)
+    add("cp_text")
+    add("cp_text_bold", font=Font(bold=True))
+    add("cp_center", alignment=center)
+    add("cp_money", alignment=center, number_format="#,##0")
+    add("cp_money_bold", alignment=center, number_format="#,##0", font=Font(bold=True))
+    add("cp_center_bold", alignment=center, font=Font(bold=True))
+    add("cp_pct", alignment=center, number_format="0.0%")
+    add("cp_pct_bold", alignment=center, number_format="0.0%", font=Font(bold=True))
+    for v, color in _SCORE_BG.items():
+        add(f"cp_score_{v}", alignment=center, font=Font(bold=True),
+            fill=PatternFill(start_color=color, end_color=color, fill_type="solid"))
+    for q, color in _QUADRANT_BG.items():
+        add(f"cp_quadrant_{q}", alignment=center,
+            fill=PatternFill(start_color=color, end_color=color, fill_type="solid"))
+
+
+def _cell(ws, value, style: str):
+    from openpyxl.cell import WriteOnlyCell
+
+    c = WriteOnlyCell(ws, value)
+    c.style = style
+    return c
+
+
+def _templates(ws, styles: list[str]) -> list:
+    """One reusable styled cell per column.
+
+    Write-only sheets serialise a row as soon as it is appended, so the same
+    cell objects can be refilled for every row instead of styling new ones.
+    """
+    return [_cell(ws, None, s) for s in styles]
+
+
+def _fill(cells: list, values) -> list:
+    for c, v in zip(cells, values):
+        c.value = v
+    return cells
+
+
+def _int(val) -> int:
+    try:
+        return int(val or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _float(val) -> float:
+    try:
+        return float(val or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _sheet_title(name: str) -> str:
+    """Excel sheet names: max 31 chars, none of ``[]:*?/\\``."""
+    return re.sub(r"[\[\]:*?/\\]", "-", name).strip()[:31] or "Sheet"
+
+
+def _save(wb) -> bytes:
+    """Zip the workbook through a spooled temp file and return its bytes."""
+    with tempfile.SpooledTemporaryFile(max_size=_SPOOL_BYTES) as f:
+        wb.save(f)
+        f.seek(0)
+        return f.read()
+
+
+def _by_total(partners: list[dict]) -> list[dict]:
+    return sorted(partners, key=lambda p: -_int(p.get("total_score", 0)))
+
+
+# ── Builders ────────────────────────────────────────────────────────────
+
+def assessment_xlsx(partners: list[dict], enabled_metrics: list[dict]) -> bytes | None:
+    """Generate an Excel workbook with the partner assessment heatmap."""
+    try:
+        import openpyxl
+        from openpyxl.utils import get_column_letter
+    except ImportError: return None
+    wb = openpyxl.Workbook(write_only=True); _register_styles(wb)
+    ws = wb.create_sheet("Partner Assessment")
+
+    n_metrics = len(enabled_metrics)
+    headers = ["Rank", "Partner Name", "Tier", "PAM", "City", "Country"] + [m["name"] for m in enabled_metrics] + ["Total", "%"]
+    for c in range(1, len(headers) + 1):
+        ws.column_dimensions[get_column_letter(c)].width = 6 if 7 <= c <= 6 + n_metrics else (14 if c > 6 else 18)
+    ws.row_dimensions[1].height = 110
+    ws.append([_cell(ws, h, "cp_header_metric" if 7 <= c <= 6 + n_metrics else "cp_header")
+               for c, h in enumerate(headers, 1)])
+
+    keys = [m["key"] for m in enabled_metrics]
+    details = _templates(ws, ["cp_center"] + ["cp_text"] * 5)
+    totals = _templates(ws, ["cp_center_bold", "cp_pct_bold"])
+    # Score cells carry fixed values, so one pre-styled cell per (column, score)
+    scores = [{v: _cell(ws, v or None, f"cp_score_{v}" if v else "cp_center") for v in range(6)} for _ in keys]
+    for rank, p in enumerate(_by_total(partners), 1):
+        vals = [_int(p.get(k, "")) for k in keys]
+        ws.append(
+            _fill(details, [rank, p.get("partner_name", ""), p.get("partner_tier", ""), p.get("pam_name", ""),
+                            p.get("partner_city", ""), p.get("partner_country", "")])
+            + [col[v if 1 <= v <= 5 else 0] for col, v in zip(scores, vals)]
+            + _fill(totals, [_int(p.get("total_score", 0)), _float(p.get("percentage", 0)) / 100])
+        )
+    return _save(wb)
+
+
+def client_sheet_rows(partners: list[dict]) -> list[list]:
+    """Rows of one client's sheet in the cross-client overview."""
+    rows = []
+    for p in _by_total(partners):
+        pv = _float(p.get("percentage", 0))
+        rows.append([p.get("partner_name", ""), p.get("pam_name", ""),
+                     _int(p.get("total_score", 0)), pv / 100, grade(pv)[0]])
+    return rows
+
+
+def all_clients_xlsx(clients: Iterable[tuple[str, list[list]]]) -> bytes | None:
+    """Cross-client overview: one sheet per client with partner totals and grades.
+
+    *clients* yields ``(client_name, rows)`` pairs with rows from
+    :func:`client_sheet_rows`; clients without rows are skipped.  It may be a
+    generator, so callers can load each tenant lazily.
+    """
+    try:
+        import openpyxl
+    except ImportError: return None
+    wb = openpyxl.Workbook(write_only=True); _register_styles(wb)
+    for name, rows in clients:
+        if not rows:
+            continue
+        ws = wb.create_sheet(_sheet_title(name))
+        ws.column_dimensions["A"].width = 28; ws.column_dimensions["B"].width = 22
+        ws.append([_cell(ws, h, "cp_header") for h in ("Partner", "PAM", "Total Score", "Percentage", "Grade")])
+        cells = _templates(ws, ["cp_text", "cp_text", "cp_center", "cp_pct", "cp_center"])
+        for r in rows:
+            ws.append(_fill(cells, r))
+    if not wb.worksheets:
+        wb.create_sheet("No Data")
+    return _save(wb)
+
+
+def all_clients_export(progress: Callable[[int, int, str], None] | None = None) -> bytes | None:
+    """Cross-client workbook for every tenant, safe to run on a worker thread.
+
+    Each tenant's sheet rows are cached under its data and client-info
+    versions, so re-exporting only reloads tenants that changed.
+    """
+    from utils.cache import export_cache
+    from utils.data import client_version, data_version, read_partners
+    from utils.paths import all_tenants, client_path, csv_path, use_tenant
+
+    tenants = all_tenants(); cache = export_cache()
+
+    def clients():
+        for i, t in enumerate(tenants, 1):
+            with use_tenant(t):
+                ck = cache.key(t, "all-clients-sheet", data_version(), client_version())
+                blob = cache.get(ck)
+                if blob is None:
+                    try: ci = json.loads(client_path().read_text()) if client_path().exists() else {}
+                    except Exception: ci = {}
+                    blob = json.dumps([ci.get("client_name", t), client_sheet_rows(read_partners(csv_path()))]).encode()
+                    cache.put(ck, blob)
+            name, rows = json.loads(blob)
+            if progress:
+                progress(i, len(tenants), name)
+            yield name, rows
+
+    return all_clients_xlsx(clients())
+
+
+def classification_xlsx(class_rows: list[dict]) -> bytes | None:
+    """Step 4 classification table; *class_rows* as built on the page."""
+    try:
+        import openpyxl
+    except ImportError: return None
+    wb = openpyxl.Workbook(write_only=True); _register_styles(wb)
+    ws = wb.create_sheet("Classification")
+    for col, width in (("A", 28), ("B", 14), ("C", 22), ("G", 24)):
+        ws.column_dimensions[col].width = width
+    ws.append([_cell(ws, h, "cp_header") for h in
+               ("Partner", "Tier", "PAM", "Total Score", "Percentage", "Quadrant", "Classification")])
+    cells = _templates(ws, ["cp_text", "cp_text", "cp_text", "cp_center", "cp_pct"])
+    label = _templates(ws, ["cp_text_bold"])
+    quadrants = {q: _cell(ws, q, f"cp_quadrant_{q}") for q in _QUADRANT_BG}
+    for r in class_rows:
+        q = r["Quadrant"]
+        ws.append(
+            _fill(cells, [r["Partner"], r["Tier"], r["PAM"], r["Total Score"], r["Percentage"] / 100])
+            + [quadrants.get(q) or _cell(ws, q, "cp_center")]
+            + _fill(label, [r["Classification"]])
+        )
+    return _save(wb)
+
+
+def cost_analysis_xlsx(df) -> bytes | None:
+    """Break-even detailed analysis table (including its TOTAL row)."""
+    try:
+        import openpyxl
+        from openpyxl.utils import get_column_letter
+    except ImportError: return None
+    wb = openpyxl.Workbook(write_only=True); _register_styles(wb)
+    ws = wb.create_sheet("Partner Costs")
+    headers = list(df.columns)
+    for c in range(1, len(headers) + 1):
+        ws.column_dimensions[get_column_letter(c)].width = 24 if c == 1 else 16
+    ws.append([_cell(ws, h, "cp_header") for h in headers])
+    kinds = ["money" if h in ("Revenues", "Support cost") else "pct" if "%" in h else "center" for h in headers]
+    plain = _templates(ws, [f"cp_{k}" for k in kinds])
+    bold = _templates(ws, [f"cp_{k}_bold" for k in kinds])
+    for row in df.itertuples(index=False):
+        vals = [v / 100 if k == "pct" and isinstance(v, (int, float)) else v for k, v in zip(kinds, row)]
+        ws.append(_fill(bold if row[0] == "TOTAL" else plain, vals))
+    return _save(wb)
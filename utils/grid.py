@@ -0,0 +1,71 @@
+"""
+Server-side row model for the Step 3 AgGrid assessment table.
+
+The score matrix is the shared typed frame from
+:func:`utils.data.assessment_frame`.  Searching, filtering and sorting run
+here, against that matrix, and only the requested page is handed to AgGrid —
+the browser never receives more than ``page_size`` rows, however large the
+tenant.  Page results are cached on ``(data version, filters, sort, page)``.
+"""
+import pathlib
+
+import pandas as pd
+import streamlit as st
+
+from utils.data import GRADE_BINS, assessment_frame, assessment_frame_by_key, frame_key
+
+PAGE_SIZES = (50, 100, 250)
+GRADES = tuple(g for _, g in reversed(GRADE_BINS))
+INFO_COLUMNS = ["Partner", "Country", "Tier", "Discount", "PAM"]
+
+
+@st.cache_data(max_entries=256)
+def _page(path_str: str, version: str, metric_keys: tuple, metric_names: tuple,
+          query: str, pam: str | None, grade_f: str | None, sort_col: str, descending: bool,
+          page: int, page_size: int) -> dict:
+    df = assessment_frame_by_key(path_str, version, metric_keys, metric_names)
+    mask = pd.Series(True, index=df.index)
+    q = query.strip().lower()
+    if q:
+        mask &= (df["Partner"].str.lower().str.contains(q, regex=False)
+                 | df["PAM"].str.lower().str.contains(q, regex=False)
+                 | df["Country"].str.lower().str.contains(q, regex=False))
+    if pam:
+        mask &= df["PAM"].str.strip() == pam
+    if grade_f:
+        mask &= df["Grade"] == grade_f
+    found = df[mask]
+    if sort_col not in df.columns:
+        sort_col = "Total"
+    if sort_col == "Partner":
+        found = found.sort_values("Partner", ascending=not descending, kind="stable", key=lambda s: s.str.lower())
+    else:
+        found = found.sort_values([sort_col, "Partner"], ascending=[not descending, True], kind="stable")
+    start = page * page_size
+    rows = found.iloc[start:start + page_size].drop(columns="City").reset_index(drop=True)
+    rows["Grade"] = rows["Grade"].astype(str)
+    return {"rows": rows, "total": len(found)}
+
+
+# ── Public API ──────────────────────────────────────────────────────────
+
+def grid_pams(csv: pathlib.Path, enabled_metrics: list[dict]) -> list[str]:
+    """Distinct PAM names for the filter dropdown."""
+    pams = assessment_frame(enabled_metrics, csv)["PAM"].str.strip()
+    return sorted(p for p in pams.unique() if p)
+
+
+def grid_sort_columns(enabled_metrics: list[dict]) -> list[str]:
+    """Columns the table can be sorted by, in dropdown order."""
+    return ["Total", "Pct", "Grade"] + INFO_COLUMNS + [m["name"] for m in enabled_metrics]
+
+
+def grid_page(csv: pathlib.Path, enabled_metrics: list[dict], query: str = "", pam: str | None = None,
+              grade_f: str | None = None, sort_col: str = "Total", descending: bool = True,
+              page: int = 0, page_size: int = PAGE_SIZES[0]) -> dict:
+    """Filter, sort and slice the score matrix.
+
+    Returns ``{"rows", "total"}`` — a DataFrame with just the requested
+    page and the number of matching partners.
+    """
+    return _page(*frame_key(csv, enabled_metrics), query, pam, grade_f, sort_col, descending, page, page_size)
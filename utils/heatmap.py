@@ -0,0 +1,119 @@
+"""
+Server-side heatmap table for Step 3 — Partner Assessment (no-AgGrid fallback).
+
+The shared assessment frame (:func:`utils.data.assessment_frame`) is turned
+once per data version into a compact tuple index with every sort order
+precomputed.  Filtering walks a precomputed order, so the
+result is already sorted, and only the requested page is rendered to HTML
+(built with ``str.join``).  Rendered pages are cached on
+``(data version, filters, sort, page)``, so reruns that don't touch the
+table cost a dictionary lookup.
+"""
+import html
+import pathlib
+
+import streamlit as st
+
+from utils.data import assessment_frame_by_key, frame_key
+
+SORT_OPTIONS = ["Score (highest first)", "Score (lowest first)", "Partner (A–Z)", "Partner (Z–A)", "PAM (A–Z)"]
+PAGE_SIZE = 50
+
+# Index row layout
+_NAME, _NAME_L, _COUNTRY, _TIER, _PAM, _SEARCH, _SCORES, _TOTAL, _PCT = range(9)
+
+
+@st.cache_resource(max_entries=16)
+def _index(path_str: str, version: str, metric_keys: tuple, metric_names: tuple) -> dict:
+    df = assessment_frame_by_key(path_str, version, metric_keys, metric_names)
+    names = df["Partner"].tolist(); pams = df["PAM"].tolist(); countries = df["Country"].tolist()
+    scores = zip(*(df[n].tolist() for n in metric_names)) if metric_names else (() for _ in names)
+    rows = [
+        (name, name.lower(), country, tier, pam, f"{name.lower()}\x00{pam.lower()}\x00{country.lower()}", sc, total, pct)
+        for name, country, tier, pam, sc, total, pct in zip(
+            names, countries, df["Tier"].tolist(), pams, scores, df["Total"].tolist(), df["Pct"].tolist())
+    ]
+    n = range(len(rows))
+    orders = {
+        "Score (highest first)": sorted(n, key=lambda i: -rows[i][_TOTAL]),
+        "Score (lowest first)": sorted(n, key=lambda i: rows[i][_TOTAL]),
+        "Partner (A–Z)": sorted(n, key=lambda i: rows[i][_NAME_L]),
+        "Partner (Z–A)": sorted(n, key=lambda i: rows[i][_NAME_L], reverse=True),
+        "PAM (A–Z)": sorted(n, key=lambda i: rows[i][_PAM].lower()),
+    }
+    return {
+        "rows": tuple(rows),
+        "orders": {k: tuple(v) for k, v in orders.items()},
+        "pams": tuple(sorted({r[_PAM].strip() for r in rows if r[_PAM].strip()})),
+    }
+
+
+def _matches(idx: dict, query: str, pam: str | None, sort_by: str, metric_pos: int | None) -> list[int]:
+    rows = idx["rows"]; q = query.strip().lower()
+    out = [i for i in idx["orders"].get(sort_by, idx["orders"][SORT_OPTIONS[0]])
+           if (not q or q in rows[i][_SEARCH]) and (not pam or rows[i][_PAM].strip() == pam)]
+    if metric_pos is not None:
+        out.sort(key=lambda i: -rows[i][_SCORES][metric_pos])
+    return out
+
+
+def _header(metric_names: tuple) -> str:
+    return "".join([
+        "<tr><th>Rank</th><th style='text-align:left'>Partner</th><th>Country</th><th>Tier</th><th>PAM</th>",
+        *(f'<th class="hm-diag" title="{html.escape(n)}"><div>{html.escape(n[:25])}</div></th>' for n in metric_names),
+        "<th>Total</th><th>%</th></tr>",
+    ])
+
+
+def _row(rank: int, r: tuple) -> str:
+    e = html.escape
+    cells = "".join(f'<td class="hm{v}">{v}</td>' if 1 <= v <= 5 else '<td style="color:#ccc">—</td>' for v in r[_SCORES])
+    return (f"<tr><td><b>{rank}</b></td><td style='text-align:left;padding-left:10px;white-space:nowrap'>{e(r[_NAME])}</td>"
+            f"<td style='white-space:nowrap'>{e(r[_COUNTRY])}</td><td>{e(r[_TIER])}</td>"
+            f"<td style='white-space:nowrap'>{e(r[_PAM])}</td>{cells}"
+            f'<td class="hm-total">{r[_TOTAL]}</td><td class="hm-total">{r[_PCT]:.1f}%</td></tr>')
+
+
+@st.cache_data(max_entries=256)
+def _render(path_str: str, version: str, metric_keys: tuple, metric_names: tuple,
+            query: str, pam: str | None, sort_by: str, filter_mk: str | None,
+            page: int, page_size: int) -> dict:
+    idx = _index(path_str, version, metric_keys, metric_names)
+    metric_pos = metric_keys.index(filter_mk) if filter_mk in metric_keys else None
+    found = _matches(idx, query, pam, sort_by, metric_pos)
+    start = page * page_size
+    shown = found[start:start + page_size]
+    body = "".join(_row(start + n, idx["rows"][i]) for n, i in enumerate(shown, 1))
+    return {
+        "html": (f'<div class="scroll-tbl"><table class="hm-tbl"><thead>{_header(metric_names)}</thead>'
+                 f"<tbody>{body}</tbody></table></div>"),
+        "total": len(found),
+        "page_names": tuple(idx["rows"][i][_NAME] for i in shown),
+    }
+
+
+# ── Public API ──────────────────────────────────────────────────────────
+
+def heatmap_pams(csv: pathlib.Path, enabled_metrics: list[dict]) -> tuple:
+    """Distinct PAM names for the filter dropdown."""
+    return _index(*frame_key(csv, enabled_metrics))["pams"]
+
+
+def heatmap_page(csv: pathlib.Path, enabled_metrics: list[dict], query: str = "", pam: str | None = None,
+                 sort_by: str = SORT_OPTIONS[0], filter_mk: str | None = None,
+                 page: int = 0, page_size: int = PAGE_SIZE) -> dict:
+    """Render one page of the heatmap.
+
+    Returns ``{"html", "total", "page_names"}`` — the table markup for the
+    page, the number of matching partners, and the page's partner names.
+    """
+    return _render(*frame_key(csv, enabled_metrics), query, pam, sort_by, filter_mk, page, page_size)
+
+
+def heatmap_names(csv: pathlib.Path, enabled_metrics: list[dict], query: str = "", pam: str | None = None,
+                  sort_by: str = SORT_OPTIONS[0], filter_mk: str | None = None) -> list[str]:
+    """All partner names matching the heatmap filters, in display order (for exports)."""
+    key = frame_key(csv, enabled_metrics)
+    idx = _index(*key)
+    metric_pos = key[2].index(filter_mk) if filter_mk in key[2] else None
+    return [idx["rows"][i][_NAME] for i in _matches(idx, query, pam, sort_by, metric_pos)]
@@ -0,0 +1,319 @@
+"""
+Bulk CSV import for ChannelPRO™.
+
+Column auto-matching, the row → scored-partner conversion and the
+checkpointed job runner used by the Import Data page.  Nothing here touches
+``st.session_state``: criteria and column mappings are passed in explicitly,
+so the same code path serves the Streamlit page and the headless CLI
+(``python -m utils.cli import``).
+"""
+import json
+import pathlib
+import shutil
+import threading
+import time
+import uuid
+from typing import Callable
+
+import pandas as pd
+
+from utils.data import atomic_write_text, load_partners, max_partners, upsert_partners
+from utils.paths import imports_dir
+from utils.scoring import calc_score, enabled
+
+# (label, field, auto-match hints) for the optional partner detail columns
+DETAIL_FIELDS = [
+    ("Year became partner", "partner_year", ["year", "since", "partner year", "start year"]),
+    ("Tier", "partner_tier", ["tier", "level", "designation"]),
+    ("Partner Discount", "partner_discount", ["discount", "partner discount", "margin"]),
+    ("City", "partner_city", ["city"]),
+    ("Country", "partner_country", ["country"]),
+    ("PAM name", "pam_name", ["pam", "pam name", "account manager", "partner manager"]),
+    ("PAM email", "pam_email", ["pam email", "manager email"]),
+]
+
+DETAIL_KEYS = [field for _, field, _ in DETAIL_FIELDS]
+
+
+# ── Column matching ─────────────────────────────────────────────────────
+
+def auto_match(label: str, cols: list[str]) -> str | None:
+    """Find the best auto-match for *label* among CSV columns."""
+    ll = label.lower()
+    for c in cols:
+        if c.lower().strip() == ll:
+            return c
+    for c in cols:
+        if ll in c.lower() or c.lower() in ll:
+            return c
+    return None
+
+
+def auto_partner_column(cols: list[str]) -> str | None:
+    """Guess which CSV column holds the partner name."""
+    return auto_match("partner", cols) or auto_match("partner name", cols) or auto_match("company", cols)
+
+
+def auto_detail_mapping(cols: list[str]) -> dict[str, str]:
+    """Map detail fields (tier, city, PAM, …) to CSV columns by hint."""
+    mapping = {}
+    for _, field, hints in DETAIL_FIELDS:
+        for h in hints:
+            auto = auto_match(h, cols)
+            if auto:
+                mapping[field] = auto
+                break
+    return mapping
+
+
+def auto_metric_mapping(cols: list[str], enabled_metrics: list[dict]) -> dict[str, str]:
+    """Map enabled metric keys to CSV columns by metric name."""
+    mapping = {}
+    for m in enabled_metrics:
+        auto = auto_match(m["name"], cols)
+        if auto:
+            mapping[m["key"]] = auto
+    return mapping
+
+
+# ── Row conversion ─────────────────────────────────────────────────────
+
+def build_partner(row, pname: str, detail_mapping: dict, metric_mapping: dict,
+                  criteria: dict) -> tuple[dict, dict]:
+    """Convert one CSV row into a ``(scored_row, raw_dict)`` pair."""
+    em = enabled(criteria)
+
+    # Build raw dict
+    raw_dict = {"partner_name": pname}
+    for field, csv_col in detail_mapping.items():
+        raw_dict[field] = str(row.get(csv_col, "")).strip()
+        if raw_dict[field].lower() == "nan":
+            raw_dict[field] = ""
+
+    # Build scored dict
+    row_dict = {"partner_name": pname}
+    for field in DETAIL_KEYS:
+        row_dict[field] = raw_dict.get(field, "")
+
+    scores = {}
+    for m in em:
+        mk = m["key"]
+        if mk in metric_mapping:
+            raw_val = row.get(metric_mapping[mk])
+            if pd.isna(raw_val) or str(raw_val).strip().lower() in ("", "nan", "none", "n/a"):
+                scores[mk] = None
+            else:
+                raw_str = str(raw_val).strip()
+                raw_dict[f"raw_{mk}"] = raw_str
+                scr = calc_score(mk, raw_str, criteria)
+                scores[mk] = scr
+                row_dict[mk] = scr if scr else ""
+        else:
+            scores[mk] = None
+            row_dict[mk] = ""
+
+    # Calculate totals
+    si = {k: v for k, v in scores.items() if v is not None}
+    total = sum(si.values())
+    mp = len(si) * 5
+    row_dict["total_score"] = total
+    row_dict["max_possible"] = mp
+    row_dict["percentage"] = round(total / mp * 100, 1) if mp else 0
+    return row_dict, raw_dict
+
+
+# ── Checkpointed import jobs ───────────────────────────────────────────
+#
+# An import is persisted as a job under ``<tenant>/imports/<job_id>/``:
+#
+#   upload.csv  — the uploaded file, verbatim
+#   job.json    — mappings, criteria snapshot, row offset and running totals
+#   chunk.json  — write-ahead record of the chunk currently being applied
+#
+# Rows are processed in chunks.  Each chunk is first built in memory and
+# written to chunk.json together with the totals it will produce; then the
+# partners are upserted in bulk; then job.json advances the offset and
+# chunk.json is removed.  A job interrupted at any point (closed tab, server
+# restart) resumes by replaying chunk.json — upserts are idempotent — and
+# continuing from the saved offset, so no row is counted or applied twice.
+
+IMPORT_CHUNK_ROWS = 250
+
+_active_jobs: set[str] = set()
+_active_lock = threading.Lock()
+
+
+def _job_dir(job_id: str) -> pathlib.Path:
+    return imports_dir() / job_id
+
+
+def _save_job(job: dict) -> None:
+    atomic_write_text(_job_dir(job["id"]) / "job.json", json.dumps(job, indent=2))
+
+
+def load_import_job(job_id: str) -> dict | None:
+    """Load a job record, or ``None`` if it does not exist."""
+    jp = _job_dir(job_id) / "job.json"
+    if not jp.exists():
+        return None
+    try:
+        return json.loads(jp.read_text())
+    except Exception:
+        return None
+
+
+def create_import_job(
+    data: bytes,
+    filename: str,
+    partner_col: str,
+    detail_mapping: dict,
+    metric_mapping: dict,
+    criteria: dict,
+) -> str:
+    """Persist an upload and its column mapping as a new import job; return its ID."""
+    job_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+    jd = _job_dir(job_id)
+    jd.mkdir(parents=True)
+    (jd / "upload.csv").write_bytes(data)
+    rows = len(pd.read_csv(jd / "upload.csv", dtype=str, usecols=[partner_col]))
+    _save_job({
+        "id": job_id,
+        "filename": filename,
+        "started": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "status": "pending",
+        "rows": rows,
+        "offset": 0,
+        "partner_col": partner_col,
+        "detail_mapping": detail_mapping,
+        "metric_mapping": metric_mapping,
+        "criteria": criteria,
+        "created": 0,
+        "updated": 0,
+        "skipped_limit": 0,
+        "max_partners": max_partners(),
+        "errors": [],
+    })
+    return job_id
+
+
+def unfinished_import_jobs() -> list[dict]:
+    """Jobs for the active tenant that were started but never completed."""
+    jobs = []
+    for jd in sorted(imports_dir().iterdir()):
+        job = load_import_job(jd.name) if jd.is_dir() else None
+        if job and job["status"] != "done":
+            job["active"] = jd.name in _active_jobs
+            jobs.append(job)
+    return jobs
+
+
+def discard_import_job(job_id: str) -> None:
+    """Delete a job and its persisted upload (already-applied rows are kept)."""
+    shutil.rmtree(_job_dir(job_id), ignore_errors=True)
+
+
+def _build_chunk(job: dict, chunk: pd.DataFrame, criteria: dict) -> dict:
+    """Convert a slice of the upload into the next write-ahead chunk record."""
+    partner_col = job["partner_col"]
+    existing_names = {p.get("partner_name", "").strip().lower() for p in load_partners()}
+    max_p = job["max_partners"]; current_count = len(existing_names)
+    created = 0; updated = 0; skipped_limit = 0; errors = []; rows = []
+
+    for pos, (_, row) in enumerate(chunk.iterrows()):
+        line = job["offset"] + pos + 2          # 1-based, after the header
+        pname = str(row.get(partner_col, "")).strip()
+        if not pname or pname.lower() in ("nan", "none", ""):
+            errors.append({"row": line, "partner": pname, "error": "Missing partner name"})
+            continue
+
+        # Check partner limit for new partners (updates are always allowed)
+        is_new = pname.lower() not in existing_names
+        if is_new and max_p and (current_count + created) >= max_p:
+            skipped_limit += 1
+            errors.append({"row": line, "partner": pname, "error": f"Partner limit ({max_p}) reached"})
+            continue
+
+        try:
+            rows.append(build_partner(row, pname, job["detail_mapping"], job["metric_mapping"], criteria))
+        except Exception as e:
+            errors.append({"row": line, "partner": pname, "error": str(e)})
+            continue
+        if is_new:
+            created += 1
+            existing_names.add(pname.lower())
+        else:
+            updated += 1
+
+    return {
+        "offset": job["offset"] + len(chunk),
+        "rows": rows,
+        "created": job["created"] + created,
+        "updated": job["updated"] + updated,
+        "skipped_limit": job["skipped_limit"] + skipped_limit,
+        "errors": job["errors"] + errors,
+    }
+
+
+def _commit_chunk(job: dict, chunk_rec: dict, em: list[dict]) -> None:
+    """Apply a write-ahead chunk, then advance the job past it."""
+    upsert_partners([tuple(r) for r in chunk_rec["rows"]], em)
+    for k in ("offset", "created", "updated", "skipped_limit", "errors"):
+        job[k] = chunk_rec[k]
+    _save_job(job)
+    (_job_dir(job["id"]) / "chunk.json").unlink(missing_ok=True)
+
+
+def run_import_job(
+    job_id: str,
+    progress: Callable[[int, int], None] | None = None,
+    chunk_rows: int = IMPORT_CHUNK_ROWS,
+) -> dict:
+    """Run (or resume) an import job to completion for the active tenant.
+
+    Existing partners (matched case-insensitively by name) are updated; new
+    names are created until the tenant's partner limit is reached.
+
+    Returns the final job record, including ``"created"``, ``"updated"``,
+    ``"skipped_limit"``, ``"max_partners"`` and
+    ``"errors": [{"row", "partner", "error"}, ...]``.
+    """
+    with _active_lock:
+        if job_id in _active_jobs:
+            raise RuntimeError("This import is already running in another session.")
+        _active_jobs.add(job_id)
+    try:
+        job = load_import_job(job_id)
+        if job is None:
+            raise FileNotFoundError(f"Import job {job_id} not found")
+        if job["status"] == "done":
+            return job
+        jd = _job_dir(job_id)
+        criteria = job["criteria"]; em = enabled(criteria)
+        job["status"] = "running"; _save_job(job)
+
+        # Replay a chunk that was interrupted between write-ahead and commit
+        wal = jd / "chunk.json"
+        if wal.exists():
+            _commit_chunk(job, json.loads(wal.read_text()), em)
+
+        if job["offset"] < job["rows"]:
+            reader = pd.read_csv(
+                jd / "upload.csv", dtype=str, chunksize=chunk_rows,
+                skiprows=range(1, job["offset"] + 1),
+            )
+            for chunk in reader:
+                chunk_rec = _build_chunk(job, chunk, criteria)
+                atomic_write_text(wal, json.dumps(chunk_rec))
+                _commit_chunk(job, chunk_rec, em)
+                if progress:
+                    progress(job["offset"], job["rows"])
+
+        job["status"] = "done"
+        job["finished"] = time.strftime("%Y-%m-%d %H:%M:%S")
+        _save_job(job)
+        (jd / "upload.csv").unlink(missing_ok=True)
+        return job
+    finally:
+        with _active_lock:
+            _active_jobs.discard(job_id)
+
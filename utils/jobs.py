@@ -0,0 +1,116 @@
+"""
+In-process background jobs for ChannelPRO™.
+
+Long-running exports (e.g. the Admin cross-client workbook) are submitted to
+a small thread pool instead of running inside the click handler, so the
+submitting session keeps rerunning normally while the job works.  Each job
+writes its artifact into the owner's directory under
+``BASE_DIR/admin_exports/<user>/``; the sidebar polls :func:`jobs_for` to
+show progress and offer the finished file.
+
+Job state lives in this process only.  Finished artifacts are files, so they
+remain downloadable (via :func:`artifacts_for`) after a restart.
+"""
+import os
+import pathlib
+import re
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from utils.paths import BASE_DIR
+
+EXPORTS_DIR = BASE_DIR / "admin_exports"
+JOB_WORKERS = int(os.environ.get("CHANNELPRO_JOB_WORKERS", "2"))
+KEEP_ARTIFACTS = 10
+
+_executor = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix="channelpro-job")
+_jobs: dict[str, dict] = {}
+_lock = threading.Lock()
+
+
+# ── Artifacts ───────────────────────────────────────────────────────────
+
+def exports_dir(owner: str) -> pathlib.Path:
+    """Return (and create) the export directory for *owner*."""
+    d = EXPORTS_DIR / re.sub(r"[^A-Za-z0-9_.-]", "_", owner or "anonymous")
+    d.mkdir(parents=True, exist_ok=True)
+    return d
+
+
+def artifacts_for(owner: str) -> list[pathlib.Path]:
+    """Finished export files for *owner*, newest first."""
+    files = [p for p in exports_dir(owner).iterdir() if p.is_file() and not p.name.startswith(".")]
+    return sorted(files, key=lambda p: p.stat().st_mtime, reverse=True)
+
+
+def _prune(owner: str) -> None:
+    for p in artifacts_for(owner)[KEEP_ARTIFACTS:]:
+        p.unlink(missing_ok=True)
+
+
+# ── Jobs ────────────────────────────────────────────────────────────────
+
+def _update(job_id: str, **fields) -> None:
+    with _lock:
+        _jobs[job_id].update(fields)
+
+
+def _run(job_id: str, fn: Callable, out: pathlib.Path) -> None:
+    def progress(done: int, total: int, message: str = "") -> None:
+        _update(job_id, done=done, total=total, message=message)
+
+    _update(job_id, status="running")
+    tmp = out.with_name(f".{out.name}.tmp")
+    try:
+        data = fn(progress)
+        if data is None:
+            raise RuntimeError("Export produced no output (is openpyxl installed?)")
+        tmp.write_bytes(data)
+        os.replace(tmp, out)
+        _update(job_id, status="done", path=str(out), finished=time.time())
+        _prune(_jobs[job_id]["owner"])
+    except Exception as e:
+        tmp.unlink(missing_ok=True)
+        traceback.print_exc()
+        _update(job_id, status="failed", error=str(e), finished=time.time())
+
+
+def submit(owner: str, label: str, file_name: str, fn: Callable) -> str:
+    """Queue ``fn(progress) -> bytes`` and return the job ID.
+
+    *fn* may call ``progress(done, total, message)``; its return value is
+    written to ``<exports_dir(owner)>/<timestamp>.<job_id>_<file_name>`` —
+    the job ID keeps same-second exports of one file apart.
+    """
+    job_id = uuid.uuid4().hex[:12]
+    out = exports_dir(owner) / f"{time.strftime('%Y%m%d-%H%M%S')}.{job_id}_{file_name}"
+    with _lock:
+        _jobs[job_id] = {
+            "id": job_id, "owner": owner, "label": label, "file_name": file_name,
+            "status": "queued", "done": 0, "total": 0, "message": "",
+            "path": None, "error": None, "started": time.time(), "finished": None,
+        }
+    _executor.submit(_run, job_id, fn, out)
+    return job_id
+
+
+def jobs_for(owner: str) -> list[dict]:
+    """Snapshot of *owner*'s jobs, newest first."""
+    with _lock:
+        jobs = [dict(j) for j in _jobs.values() if j["owner"] == owner]
+    return sorted(jobs, key=lambda j: j["started"], reverse=True)
+
+
+def has_active_jobs(owner: str) -> bool:
+    return any(j["status"] in ("queued", "running") for j in jobs_for(owner))
+
+
+def dismiss(job_id: str) -> None:
+    """Forget a finished job (its artifact file is kept)."""
+    with _lock:
+        if _jobs.get(job_id, {}).get("status") in ("done", "failed"):
+            del _jobs[job_id]
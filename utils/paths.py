@@ -5,6 +5,8 @@ All data is isolated per-tenant under BASE_DIR/tenants/<tenant_id>/.
 BASE_DIR defaults to the RENDER_DISK_PATH env var (persistent disk on Render)
 or the current working directory for local development.
 """
+import contextlib
+import contextvars
 import os
 import pathlib
 
@@ -19,6 +21,12 @@ USERS_FILE = BASE_DIR / "users.json"
 TENANTS_DIR = BASE_DIR / "tenants"
 TENANTS_DIR.mkdir(parents=True, exist_ok=True)
 
+# Explicit tenant override for code running outside a Streamlit session
+# (CLI batch jobs, background workers).  Takes precedence over session state.
+_tenant_override: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "tenant_override", default=None
+)
+
 
 # ── Tenant helpers ──────────────────────────────────────────────────────
 
@@ -38,10 +46,27 @@ def all_tenants() -> list[str]:
 
 def current_data_dir() -> pathlib.Path:
     """Return the data directory for the currently active tenant."""
-    tid = st.session_state.get("active_tenant")
+    tid = _tenant_override.get() or st.session_state.get("active_tenant")
     return tenant_dir(tid) if tid else BASE_DIR
 
 
+@contextlib.contextmanager
+def use_tenant(tid: str):
+    """Scope all per-tenant path helpers to *tid*, independent of session state.
+
+    Used by the headless CLI (``python -m utils.cli``) so that the data and
+    scoring modules can run outside a Streamlit rerun::
+
+        with use_tenant("acme_corp"):
+            rescore_all(criteria)
+    """
+    token = _tenant_override.set(tid)
+    try:
+        yield tenant_dir(tid)
+    finally:
+        _tenant_override.reset(token)
+
+
 # ── Per-tenant file paths ──────────────────────────────────────────────
 
 def save_path() -> pathlib.Path:
@@ -84,3 +109,17 @@ def be_path() -> pathlib.Path:
 def sd_path() -> pathlib.Path:
     """Path to support_data.csv for the active tenant."""
     return current_data_dir() / "support_data.csv"
+
+
+def imports_dir() -> pathlib.Path:
+    """Return (and create) the checkpointed import-job directory for the active tenant."""
+    d = current_data_dir() / "imports"
+    d.mkdir(parents=True, exist_ok=True)
+    return d
+
+
+def conversations_dir() -> pathlib.Path:
+    """Return (and create) the Ask ChannelPRO™ conversation directory for the active tenant."""
+    d = current_data_dir() / "conversations"
+    d.mkdir(parents=True, exist_ok=True)
+    return d
@@ -0,0 +1,202 @@
+"""
+Opt-in per-rerun performance instrumentation for ChannelPRO™.
+
+Off by default.  Turn it on with ``CHANNELPRO_PERF=1`` or from the
+Admin — Performance page (process-wide, until the next restart).  When it is
+off, :func:`begin_run` does nothing, :func:`section` hands back a shared
+no-op context manager and :func:`count_io` returns after one attribute
+lookup, so the hooks left in the code cost nothing measurable.
+
+A run is one execution of ``app.py``:
+
+* :func:`begin_run` starts it (per script thread);
+* ``with section("sidebar"):`` times a named part — login, sidebar,
+  criteria, partners, page, export, ai.  Repeated sections add up;
+* :func:`count_io` records file reads/writes and their sizes from
+  ``utils.data`` / ``utils.scoring``;
+* :func:`end_run` files the run under its page; :func:`discard_run` drops it.
+
+Finished runs feed a rolling latency histogram per page (the last
+``PERF_WINDOW`` runs) and are appended, one JSON object per line, to
+``BASE_DIR/logs/perf.jsonl``.  Only runs that render their page to the end
+are recorded, including pages that finish with ``st.stop()`` (empty and
+gated states, imports); ``app.py`` discards a run whose page exits through
+``st.rerun()`` or an error.  A run stopped before the page (login screen,
+access gates) is never ended — the next :func:`begin_run` on that thread
+replaces it.  Fragment reruns are not runs.
+"""
+import bisect
+import collections
+import json
+import os
+import pathlib
+import threading
+import time
+
+from utils.paths import BASE_DIR
+
+PERF_WINDOW = 500
+PERF_LOG = BASE_DIR / "logs" / "perf.jsonl"
+PERF_LOG_MAX_BYTES = 5 * 1024 * 1024
+HIST_BUCKETS_MS = (25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+_enabled = os.environ.get("CHANNELPRO_PERF", "").strip().lower() in ("1", "true", "yes", "on")
+_tls = threading.local()
+_lock = threading.Lock()
+_by_page: dict[str, collections.deque] = {}
+_recent: collections.deque = collections.deque(maxlen=200)
+
+
+class _NoSection:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SECTION = _NoSection()
+
+
+class _Section:
+    __slots__ = ("run", "name", "t0")
+
+    def __init__(self, run: dict, name: str):
+        self.run = run; self.name = name
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        ms = (time.perf_counter() - self.t0) * 1000
+        self.run["sections"][self.name] = self.run["sections"].get(self.name, 0.0) + ms
+        return False
+
+
+# ── Switch ──────────────────────────────────────────────────────────────
+
+def enabled() -> bool:
+    """True while instrumentation is on."""
+    return _enabled
+
+
+def set_enabled(on: bool) -> None:
+    """Turn instrumentation on or off for this process."""
+    global _enabled
+    _enabled = bool(on)
+
+
+# ── Recording ───────────────────────────────────────────────────────────
+
+def begin_run() -> None:
+    """Start timing a rerun on this thread, replacing any unfinished one (no-op when disabled)."""
+    _tls.run = {"t0": time.perf_counter(), "sections": {},
+                "reads": 0, "read_bytes": 0, "writes": 0, "write_bytes": 0} if _enabled else None
+
+
+def section(name: str):
+    """Context manager timing *name* within the current run."""
+    run = getattr(_tls, "run", None)
+    return _NO_SECTION if run is None else _Section(run, name)
+
+
+def count_io(kind: str, path: pathlib.Path) -> None:
+    """Count a ``"read"`` or ``"write"`` of *path* against the current run."""
+    run = getattr(_tls, "run", None)
+    if run is None:
+        return
+    try:
+        size = path.stat().st_size
+    except OSError:
+        size = 0
+    run[f"{kind}s"] += 1
+    run[f"{kind}_bytes"] += size
+
+
+def end_run(page: str) -> None:
+    """Finish the current run and file it under *page*."""
+    run = getattr(_tls, "run", None)
+    _tls.run = None
+    if run is None:
+        return
+    rec = {"ts": time.strftime("%Y-%m-%dT%H:%M:%S"), "page": page,
+           "total_ms": round((time.perf_counter() - run.pop("t0")) * 1000, 2),
+           **run, "sections": {k: round(v, 2) for k, v in run["sections"].items()}}
+    with _lock:
+        _by_page.setdefault(page, collections.deque(maxlen=PERF_WINDOW)).append(rec)
+        _recent.append(rec)
+    _log(rec)
+
+
+def discard_run() -> None:
+    """Drop the current run without recording it."""
+    _tls.run = None
+
+
+def _log(rec: dict) -> None:
+    line = json.dumps(rec, separators=(",", ":")) + "\n"
+    with _lock:
+        try:
+            PERF_LOG.parent.mkdir(parents=True, exist_ok=True)
+            if PERF_LOG.exists() and PERF_LOG.stat().st_size > PERF_LOG_MAX_BYTES:
+                os.replace(PERF_LOG, PERF_LOG.with_suffix(".jsonl.1"))
+            with open(PERF_LOG, "a") as f:
+                f.write(line)
+        except OSError:
+            pass
+
+
+# ── Reporting ───────────────────────────────────────────────────────────
+
+def _pct(sorted_vals: list[float], q: float) -> float:
+    return sorted_vals[min(len(sorted_vals) - 1, int(q * len(sorted_vals)))]
+
+
+def histogram_labels() -> list[str]:
+    """Bucket labels matching :func:`page_stats` ``"hist"`` counts."""
+    edges = HIST_BUCKETS_MS
+    return [f"<{edges[0]} ms"] + [f"{a}–{b} ms" for a, b in zip(edges, edges[1:])] + [f"≥{edges[-1]} ms"]
+
+
+def page_stats() -> dict[str, dict]:
+    """Per-page summary of the rolling window.
+
+    ``{page: {"runs", "p50_ms", "p95_ms", "max_ms", "hist", "sections_ms",
+    "reads", "read_bytes", "writes", "write_bytes"}}`` — section times and
+    I/O counts are per-run averages.
+    """
+    with _lock:
+        snap = {p: list(d) for p, d in _by_page.items() if d}
+    out = {}
+    for page, recs in snap.items():
+        totals = sorted(r["total_ms"] for r in recs)
+        hist = [0] * (len(HIST_BUCKETS_MS) + 1)
+        for t in totals:
+            hist[bisect.bisect_right(HIST_BUCKETS_MS, t)] += 1
+        sections: dict[str, float] = {}
+        for r in recs:
+            for k, v in r["sections"].items():
+                sections[k] = sections.get(k, 0.0) + v
+        n = len(recs)
+        out[page] = {
+            "runs": n, "p50_ms": _pct(totals, 0.5), "p95_ms": _pct(totals, 0.95), "max_ms": totals[-1],
+            "hist": hist, "sections_ms": {k: v / n for k, v in sections.items()},
+            **{k: sum(r[k] for r in recs) / n for k in ("reads", "read_bytes", "writes", "write_bytes")},
+        }
+    return out
+
+
+def recent_runs(limit: int = 50) -> list[dict]:
+    """The latest *limit* recorded runs across all pages, newest first."""
+    with _lock:
+        return list(reversed(_recent))[:limit]
+
+
+def reset() -> None:
+    """Forget the in-memory window (the JSON log is kept)."""
+    with _lock:
+        _by_page.clear()
+        _recent.clear()
@@ -0,0 +1,322 @@
+"""
+Local structured-query engine for Ask ChannelPRO™.
+
+Many questions are plain filters and rankings — "partners with MDF
+utilization below 40%", "top 5 by revenue", "Jane's partners in Germany".
+:func:`answer_locally` recognises those, runs them as vectorised pandas
+filters and sorts over the shared score matrix
+(:func:`utils.data.assessment_frame`) and a cached matrix of raw metric
+values, and returns the same ``answer`` / ``table`` / ``chart`` dict the
+chat renderer takes from the model — in milliseconds, with no API call.
+
+The planner is deliberately conservative.  Anything it does not fully
+account for — advice, explanations, comparisons, score changes, vague
+qualifiers ("low", "strong"), alternatives ("or"), negation, or a question
+about a named partner — yields ``None`` and the question goes to the model.
+"""
+import pathlib
+import re
+
+import pandas as pd
+import streamlit as st
+
+from utils.data import assessment_frame, stat_token
+from utils.paths import raw_path
+from utils.retrieval import match_question, vocabulary
+from utils.scoring import METRIC_ALIASES
+
+MAX_TABLE_ROWS = 50
+DEFAULT_TOP_N = 10
+PCT = "__pct__"  # target meaning the overall score percentage
+
+# Everyday names for metrics, on top of METRIC_ALIASES and the metric names
+SHORT_NAMES = {
+    "revenue": "annual_revenues", "revenues": "annual_revenues",
+    "growth": "yoy_revenue_growth", "revenue growth": "yoy_revenue_growth", "yoy growth": "yoy_revenue_growth",
+    "saas": "pct_revenues_saas", "saas revenue": "pct_revenues_saas", "expansion": "net_revenue_expansion",
+    "deal size": "avg_deal_size_net_new", "renewal deal size": "avg_deal_size_renewals",
+    "time to close": "avg_time_to_close", "sales cycle": "avg_time_to_close", "close time": "avg_time_to_close",
+    "deal registrations": "registered_deals", "win rate": "win_loss_ratio", "close rate": "win_loss_ratio",
+    "win/loss": "win_loss_ratio", "pipeline": "partner_generated_opps_pct", "renewals": "renewal_rate",
+    "satisfaction": "customer_satisfaction", "csat": "customer_satisfaction",
+    "mdf": "mdf_utilization_rate", "mdf utilization": "mdf_utilization_rate",
+    "certifications": "vendor_certifications", "certs": "vendor_certifications",
+    "litigation": "known_litigation", "financials": "financial_strength",
+}
+_OVERALL = ("overall score", "overall percentage", "total score", "overall", "percentage", "score")
+
+_OPEN_ENDED = re.compile(
+    r"\b(why|how (?:can|could|should|do|does|to|is|are)|should|would|recommend\w*|suggest\w*|explain\w*|improv\w*|"
+    r"strateg\w*|advi[cs]e|what if|set|update|change|increase|decrease|adjust|compare|comparison|versus|vs|"
+    r"correlat\w*|trend\w*|summar\w*|overview|insight\w*|analy[sz]\w*|risk\w*|invest\w*|focus|average|mean|median|"
+    r"not|without|except|excluding|unscored|missing|or|low|high|poor|good|great|weak|strong|long|short|bad|slow|"
+    r"fast|large|small|big|few)\b")
+_LISTING = re.compile(r"\b(which|what|who|list|show|find|display|give me|how many)\b")
+_CMP = re.compile(
+    r"(?P<op>at least|at most|no more than|no less than|more than|less than|fewer than|greater than|higher than|"
+    r"lower than|above|below|under|over|exceeding|>=|<=|>|<)\s*(?P<num>\$?\d[\d,]*(?:\.\d+)?)\s*"
+    r"(?P<unit>%|percent\b|k\b|m\b|days?\b)?")
+_BETWEEN = re.compile(
+    r"between\s+(?P<lo>\$?\d[\d,]*(?:\.\d+)?)\s*(?P<u1>%|k\b|m\b)?\s+and\s+(?P<hi>\$?\d[\d,]*(?:\.\d+)?)\s*"
+    r"(?P<unit>%|percent\b|k\b|m\b|days?\b)?")
+_OPS = {
+    "at least": ">=", "no less than": ">=", ">=": ">=", "at most": "<=", "no more than": "<=", "<=": "<=",
+    "more than": ">", "greater than": ">", "higher than": ">", "above": ">", "over": ">", "exceeding": ">", ">": ">",
+    "less than": "<", "fewer than": "<", "lower than": "<", "below": "<", "under": "<", "<": "<",
+}
+_OP_WORDS = {">=": "at least", "<=": "at most", ">": "above", "<": "below", "between": "between"}
+_RANK = re.compile(r"(?:\b(?P<pre>\d+)\s+)?\b(?P<word>top|bottom|best|worst|highest|lowest|strongest|weakest|"
+                   r"most|least)\b(?:\s+(?P<n>\d+))?")
+_RANK_UP = {"top", "best", "highest", "strongest", "most"}
+_RANK_RAW = {"highest", "lowest", "most", "least"}
+_GRADE = re.compile(r"\bgrade[ds]?\s+(?P<g>[abcd]\+?)(?![\w+])(?:\s+or\s+(?P<dir>better|above|higher|worse|below|lower))?"
+                    r"|\b(?P<g2>[abcd]\+?)[- ]grade[ds]?\b(?:\s+(?:partners\s+)?or\s+(?P<dir2>better|above|higher|worse|below|lower))?")
+_GRADE_ORDER = ["D", "C", "C+", "B", "B+", "A"]
+
+
+def _blank(q: str, spans: list[tuple[int, int]]) -> str:
+    """*q* with *spans* overwritten by spaces (offsets are kept)."""
+    chars = list(q)
+    for a, b in spans:
+        chars[a:b] = " " * (b - a)
+    return "".join(chars)
+
+
+def _number(text: str, unit: str | None) -> float:
+    v = float(text.replace("$", "").replace(",", ""))
+    return v * {"k": 1e3, "m": 1e6}.get((unit or "").strip(), 1)
+
+
+# ── Raw values ──────────────────────────────────────────────────────────
+
+@st.cache_resource(max_entries=16)
+def _raw_matrix(path_str: str, version: str, metric_keys: tuple) -> pd.DataFrame:
+    """Numeric raw values of quantitative metrics (NaN when missing), indexed by partner name."""
+    from utils.data import load_raw
+
+    raw = pd.DataFrame.from_records(load_raw())
+    if raw.empty or "partner_name" not in raw:
+        return pd.DataFrame(columns=list(metric_keys), dtype="float64")
+    out = pd.DataFrame(index=raw["partner_name"].fillna("").astype(str))
+    for mk in metric_keys:
+        col = raw[f"raw_{mk}"] if f"raw_{mk}" in raw else pd.Series(dtype=object, index=raw.index)
+        cleaned = col.astype(str).str.replace(r"[,$%\s]", "", regex=True)
+        out[mk] = pd.to_numeric(cleaned, errors="coerce").to_numpy()
+    return out[~out.index.duplicated(keep="last")]
+
+
+# ── Planning ────────────────────────────────────────────────────────────
+
+def _metric_spans(q: str, enabled_metrics: list[dict]) -> list[tuple[int, int, str]]:
+    """Non-overlapping ``(start, end, key)`` metric mentions in *q*, longest phrase first."""
+    em = {m["key"] for m in enabled_metrics}
+    phrases = {a: k for a, k in METRIC_ALIASES.items() if k} | SHORT_NAMES
+    phrases.update({m["name"].lower(): m["key"] for m in enabled_metrics})
+    spans, taken = [], [False] * len(q)
+    for ph in sorted(phrases, key=len, reverse=True):
+        if phrases[ph] not in em or ph not in q:
+            continue
+        for mt in re.finditer(rf"(?<![a-z0-9]){re.escape(ph)}(?![a-z0-9])", q):
+            if not any(taken[mt.start():mt.end()]):
+                taken[mt.start():mt.end()] = [True] * (mt.end() - mt.start())
+                spans.append((mt.start(), mt.end(), phrases[ph]))
+    return sorted(spans)
+
+
+def _target(q: str, pos: int, spans: list, metrics: dict, unit: str | None):
+    """``(key, use_score)`` a comparison at *pos* refers to, or ``None``."""
+    before = [s for s in spans if s[1] <= pos]
+    span = before[-1] if before else next((s for s in spans if s[0] >= pos), None)
+    if span is None:
+        if unit in ("%", "percent") or any(re.search(rf"\b{w}\b", q) for w in _OVERALL):
+            return PCT, False
+        return None
+    m = metrics[span[2]]
+    between = q[span[1]:pos] if span[1] <= pos else q[pos:span[0]]
+    return span[2], m["type"] != "quantitative" or re.search(r"\bscor", between) is not None
+
+
+def plan_question(question: str, enabled_metrics: list[dict], vocab: dict) -> dict | None:
+    """Structured plan for *question*, or ``None`` when it needs the model.
+
+    ``{"filters": [(key, use_score, op, value)], "grade": (op, grade) | None,
+    "rank": {"key", "up", "raw", "n"} | None, "count": bool, "pams",
+    "countries", "tiers", "show": [metric keys]}``
+    """
+    q = " ".join(question.lower().replace("’", "'").split()).rstrip("?.! ")
+    metrics = {m["key"]: m for m in enabled_metrics}
+    hit = match_question(q, enabled_metrics, vocab)
+    if hit["partners"]:
+        return None
+    blanked = q
+    for kind in ("pams", "countries", "tiers"):
+        for k, v in vocab[kind].items():
+            if v in hit[kind] and k in blanked:
+                blanked = re.sub(rf"(?<![a-z0-9]){re.escape(k)}(?![a-z0-9])", lambda mt: " " * len(mt.group()), blanked)
+
+    spans = _metric_spans(blanked, enabled_metrics)
+    filters, used, cut = [], set(), []
+    for mt in _BETWEEN.finditer(blanked):
+        unit = mt["unit"] or mt["u1"]
+        tgt = _target(blanked, mt.start(), spans, metrics, unit)
+        if tgt is None:
+            return None
+        filters.append((*tgt, "between", (_number(mt["lo"], unit), _number(mt["hi"], unit))))
+        used.add(tgt[0]); cut.append(mt.span())
+    for mt in _CMP.finditer(_blank(blanked, cut)):
+        tgt = _target(blanked, mt.start(), spans, metrics, mt["unit"])
+        if tgt is None:
+            return None
+        filters.append((*tgt, _OPS[mt["op"]], _number(mt["num"], mt["unit"])))
+        used.add(tgt[0]); cut.append(mt.span())
+    for key, use_score, _, value in filters:
+        lo, hi = value if isinstance(value, tuple) else (value, value)
+        if use_score and key != PCT and not (0 <= lo <= 5 and 0 <= hi <= 5):
+            return None
+
+    grade = None
+    for mt in _GRADE.finditer(blanked):
+        g = (mt["g"] or mt["g2"]).upper(); d = mt["dir"] or mt["dir2"]
+        grade = (">=" if d in ("better", "above", "higher") else "<=" if d else "==", g)
+        cut.append(mt.span())
+
+    rest = _blank(blanked, cut)
+    rank = None
+    rm = _RANK.search(rest)
+    if rm:
+        n = int(rm["n"] or rm["pre"] or DEFAULT_TOP_N)
+        after = [s for s in spans if s[0] >= rm.end() and not any(a <= s[0] < b for a, b in cut)]
+        free = [s for s in spans if s[2] not in used and not any(a <= s[0] < b for a, b in cut)]
+        key = (after or free or [(0, 0, PCT)])[0][2]
+        word = rm["word"]
+        rank = {"key": key, "up": word in _RANK_UP, "n": max(1, min(n, MAX_TABLE_ROWS)),
+                "raw": word in _RANK_RAW and key != PCT and metrics[key]["type"] == "quantitative"}
+        used.add(key); cut.append(rm.span())
+        rest = _blank(blanked, cut)
+
+    if _OPEN_ENDED.search(rest.replace("how many", "")):
+        return None
+    count = "how many" in q
+    scoped = any(hit[k] for k in ("pams", "countries", "tiers"))
+    if not (filters or grade or rank or (scoped and re.search(r"\bpartners?\b", q) and (_LISTING.search(q) or len(q.split()) <= 6))):
+        return None
+    return {"filters": filters, "grade": grade, "rank": rank, "count": count,
+            "pams": hit["pams"], "countries": hit["countries"], "tiers": hit["tiers"],
+            "show": list(dict.fromkeys([k for k in used if k != PCT] + [s[2] for s in spans]))}
+
+
+# ── Execution ───────────────────────────────────────────────────────────
+
+def _fmt(v: float, unit: str | None = None) -> str:
+    s = f"{v:,.0f}" if float(v).is_integer() or abs(v) >= 1000 else f"{v:,.2f}".rstrip("0").rstrip(".")
+    return f"${s}" if unit == "$" else f"{s}%" if unit == "%" else f"{s} {unit}" if unit in ("days", "certs") else s
+
+
+def _describe(key, use_score, op, value, metrics) -> str:
+    if key == PCT:
+        name, unit = "overall score", "%"
+    else:
+        name = metrics[key]["name"] + (" score" if use_score else "")
+        unit = None if use_score else metrics[key].get("unit")
+    if op == "between":
+        return f"{name} between {_fmt(value[0], unit)} and {_fmt(value[1], unit)}"
+    return f"{name} {_OP_WORDS[op]} {_fmt(value, unit)}"
+
+
+def run_plan(plan: dict, df: pd.DataFrame, raw: pd.DataFrame, enabled_metrics: list[dict]) -> dict:
+    """Execute *plan* against the score matrix *df* and raw matrix *raw*; chat response dict."""
+    metrics = {m["key"]: m for m in enabled_metrics}
+    raw = raw.reindex(df["Partner"]).set_axis(df.index)
+    mask = pd.Series(True, index=df.index)
+    desc = []
+    for kind, col, label in (("pams", "PAM", "PAM {}"), ("countries", "Country", "in {}"), ("tiers", "Tier", "Tier {}")):
+        if plan[kind]:
+            mask &= df[col].str.strip().isin(plan[kind])
+            desc.append(label.format(" / ".join(plan[kind])))
+
+    for key, use_score, op, value in plan["filters"]:
+        if key == PCT:
+            s = df["Pct"]
+        elif use_score:
+            s = df[metrics[key]["name"]].where(lambda x: x > 0)
+        else:
+            s = raw[key]
+        if op == "between":
+            mask &= s.between(*sorted(value))
+        else:
+            mask &= {">=": s >= value, "<=": s <= value, ">": s > value, "<": s < value}[op]
+        desc.append(_describe(key, use_score, op, value, metrics))
+
+    if plan["grade"]:
+        op, g = plan["grade"]
+        i = _GRADE_ORDER.index(g)
+        allowed = {">=": _GRADE_ORDER[i:], "<=": _GRADE_ORDER[:i + 1], "==": [g]}[op]
+        mask &= df["Grade"].isin(allowed)
+        desc.append(f"grade {g}" + {">=": " or better", "<=": " or worse", "==": ""}[op])
+
+    hits = df[mask]
+    rank = plan["rank"]
+    chart = None
+    if rank:
+        key = rank["key"]
+        if key == PCT:
+            label, value = "overall score", hits["Pct"]
+            order = hits.assign(_v=value).sort_values("_v", ascending=not rank["up"])
+            chart_unit = "%"
+        else:
+            m = metrics[key]; score = hits[m["name"]]
+            rv = raw.loc[hits.index, key] if key in raw else pd.Series(float("nan"), index=hits.index)
+            if rank["raw"]:
+                label, value, chart_unit = m["name"], rv, m.get("unit")
+                order = hits.assign(_v=value)[value.notna()].sort_values("_v", ascending=not rank["up"])
+            else:
+                label, value, chart_unit = m["name"] + " score", score, None
+                higher = m["direction"] == "higher_is_better"
+                order = (hits.assign(_v=score, _r=rv if higher else -rv)[score > 0]
+                         .sort_values(["_v", "_r"], ascending=not rank["up"], na_position="last"))
+        hits_n = len(order)
+        hits = order.head(rank["n"])
+        word = "Top" if rank["up"] else "Bottom"
+        if rank["raw"]:
+            word = "Highest" if rank["up"] else "Lowest"
+        head = f"**{word} {len(hits)}** partner{'s' if len(hits) != 1 else ''} by {label}"
+        if desc:
+            head += f" ({hits_n} match " + ", ".join(desc) + ")"
+        chart = {"type": "hbar", "title": f"{word} {len(hits)} by {label}" + (f" ({chart_unit})" if chart_unit else ""),
+                 "data": [{"label": p, "value": float(v)} for p, v in zip(hits["Partner"], hits["_v"])]}
+        answer = head + "."
+    else:
+        hits_n = len(hits)
+        what = ", ".join(desc) if desc else "all partners"
+        answer = f"**{hits_n}** of {len(df)} partners match: {what}."
+        hits = hits.sort_values("Pct", ascending=False)
+        if hits_n > MAX_TABLE_ROWS and not plan["count"]:
+            answer += f" Showing the {MAX_TABLE_ROWS} with the highest overall score."
+        hits = hits.head(0 if plan["count"] and hits_n > MAX_TABLE_ROWS else MAX_TABLE_ROWS)
+
+    cols = {"Partner": hits["Partner"], "Tier": hits["Tier"], "Country": hits["Country"], "PAM": hits["PAM"]}
+    for key in plan["show"]:
+        m = metrics[key]
+        if m["type"] == "quantitative":
+            cols[m["name"] + (f" ({m['unit']})" if m.get("unit") else "")] = raw.loc[hits.index, key]
+        cols[m["name"] + " score"] = hits[m["name"]].where(lambda x: x > 0)
+    cols["Score %"] = hits["Pct"]; cols["Grade"] = hits["Grade"].astype(str)
+    table = pd.DataFrame(cols)
+    table = table.astype(object).where(table.notna(), None)
+    answer += "\n\n_Answered from your scorecard data without an AI call._"
+    return {"answer": answer, "table": table.to_dict("records") or None, "chart": chart, "updates": None}
+
+
+def answer_locally(question: str, csv: pathlib.Path, enabled_metrics: list[dict]) -> dict | None:
+    """Chat response for *question* computed locally, or ``None`` to ask the model."""
+    if not question.strip() or not enabled_metrics:
+        return None
+    df = assessment_frame(enabled_metrics, csv)
+    if df.empty:
+        return None
+    plan = plan_question(question, enabled_metrics, vocabulary(csv, enabled_metrics))
+    if plan is None:
+        return None
+    rp = raw_path()
+    quant = tuple(m["key"] for m in enabled_metrics if m["type"] == "quantitative")
+    return run_plan(plan, df, _raw_matrix(str(rp), stat_token(rp), quant), enabled_metrics)
@@ -0,0 +1,207 @@
+"""
+Question-scoped partner context for Ask ChannelPRO™.
+
+Rather than embedding every partner in the prompt, each question is matched
+locally against the tenant's vocabulary — partner names, PAMs, countries,
+tiers and metric names / ``METRIC_ALIASES`` — and the shared score matrix
+(:func:`utils.data.assessment_frame`) is filtered to what it mentions.  The
+model receives:
+
+* :func:`tenant_summary` — grade mix, per-metric score statistics and
+  tier / country / PAM breakdowns for the whole tenant (cached per data
+  version; goes in the cacheable system prompt);
+* :func:`question_context` — at most ``MAX_CONTEXT_PARTNERS`` partner
+  lines relevant to the question, plus aggregates for the whole matching
+  set when it is larger than that.
+
+Prompt size is therefore bounded by the caps here, not by tenant size.
+"""
+import pathlib
+import re
+
+import pandas as pd
+import streamlit as st
+
+from utils.data import assessment_frame, assessment_frame_by_key, frame_key, load_raw, stat_token
+from utils.paths import raw_path
+from utils.scoring import METRIC_ALIASES
+
+MAX_CONTEXT_PARTNERS = 40
+MAX_BREAKDOWN_ROWS = 10
+_STOPWORDS = {"and", "the", "for", "from", "with", "vs", "avg", "average", "pct", "of", "if", "available",
+              "rate", "net", "new", "partner", "partners", "vendor", "vendors", "total"}
+
+
+def _tokens(text: str) -> set[str]:
+    return {t for t in re.findall(r"[a-z0-9%]+", text.lower()) if len(t) >= 3 and t not in _STOPWORDS}
+
+
+# ── Vocabulary ──────────────────────────────────────────────────────────
+
+@st.cache_resource(max_entries=16)
+def _vocab(path_str: str, version: str, metric_keys: tuple, metric_names: tuple) -> dict:
+    df = assessment_frame_by_key(path_str, version, metric_keys, metric_names)
+
+    def values(col):
+        return {v.strip().lower(): v.strip() for v in df[col].unique() if len(v.strip()) >= 2}
+
+    pams = values("PAM")
+    first = {}
+    for k, v in pams.items():
+        first.setdefault(k.split()[0], set()).add(v)
+    # A PAM's first name alone ("Jane's partners") when no other PAM shares it
+    pams.update({f: next(iter(vs)) for f, vs in first.items() if len(vs) == 1 and len(f) >= 3 and f not in pams})
+    return {
+        "partners": {n.lower(): n for n in df["Partner"] if len(n) >= 3},
+        "pams": pams, "countries": values("Country"), "tiers": values("Tier"),
+    }
+
+
+def vocabulary(csv: pathlib.Path, enabled_metrics: list[dict]) -> dict:
+    """Names a question can mention, lower-cased → as stored.
+
+    ``{"partners", "pams", "countries", "tiers"}`` — PAMs also by a first name
+    no other PAM shares.  Cached per data version and metric set.
+    """
+    return _vocab(*frame_key(csv, enabled_metrics))
+
+
+@st.cache_resource(max_entries=16)
+def _raw_index(path_str: str, version: str) -> dict:
+    return {r.get("partner_name", ""): r for r in load_raw()}
+
+
+def _contains(q: str, term: str) -> bool:
+    return re.search(rf"(?<![a-z0-9]){re.escape(term)}(?![a-z0-9])", q) is not None
+
+
+def match_question(question: str, enabled_metrics: list[dict], vocab: dict) -> dict:
+    """Partners, PAMs, countries, tiers and metric keys mentioned in *question*."""
+    q = question.lower()
+    found = {kind: sorted({v for k, v in vocab[kind].items() if k in q and _contains(q, k)})
+             for kind in ("partners", "pams", "countries", "tiers")}
+    em_keys = {m["key"] for m in enabled_metrics}
+    metrics = {mk for alias, mk in METRIC_ALIASES.items() if mk in em_keys and _contains(q, alias)}
+    qt = _tokens(q)
+    for m in enabled_metrics:
+        for words in (_tokens(m["name"]), _tokens(m["key"].replace("_", " "))):
+            if words and len(words & qt) > len(words) // 2:
+                metrics.add(m["key"])
+    found["metrics"] = [m["key"] for m in enabled_metrics if m["key"] in metrics]
+    return found
+
+
+# ── Summary ─────────────────────────────────────────────────────────────
+
+def _breakdown(df, col: str, label: str) -> str:
+    g = df[df[col].str.strip() != ""].groupby(col)["Pct"].agg(["count", "mean"]).sort_values("count", ascending=False)
+    if g.empty:
+        return ""
+    rows = [f"{k} {int(r['count'])} ({r['mean']:.1f}%)" for k, r in g.head(MAX_BREAKDOWN_ROWS).iterrows()]
+    more = f" … +{len(g) - MAX_BREAKDOWN_ROWS} more" if len(g) > MAX_BREAKDOWN_ROWS else ""
+    return f"By {label} (partners, avg %): " + "; ".join(rows) + more
+
+
+def _metric_stats(df, enabled_metrics: list[dict]) -> list[str]:
+    lines = []
+    for m in enabled_metrics:
+        s = df[m["name"]]; scored = s[s > 0]
+        if scored.empty:
+            lines.append(f"- {m['name']}: unscored"); continue
+        dist = "/".join(str(int((scored == v).sum())) for v in range(1, 6))
+        lines.append(f"- {m['name']}: mean {scored.mean():.2f}, scored {len(scored)}, 1-5 counts {dist}")
+    return lines
+
+
+def _summary_text(df, enabled_metrics: list[dict]) -> str:
+    if df.empty:
+        return "No partners scored yet."
+    grades = df["Grade"].value_counts().sort_index(ascending=False)
+    top = df.nlargest(5, "Pct"); bottom = df.nsmallest(5, "Pct")
+    parts = [
+        f"{len(df)} partners; average {df['Pct'].mean():.1f}%, median {df['Pct'].median():.1f}%.",
+        "Grades: " + ", ".join(f"{g} {int(n)}" for g, n in grades.items()),
+        "Top by %: " + ", ".join(f"{n} ({p:.1f}%)" for n, p in zip(top["Partner"], top["Pct"])),
+        "Bottom by %: " + ", ".join(f"{n} ({p:.1f}%)" for n, p in zip(bottom["Partner"], bottom["Pct"])),
+        *(b for b in (_breakdown(df, "Tier", "tier"), _breakdown(df, "Country", "country"),
+                      _breakdown(df, "PAM", "PAM")) if b),
+        "Metric score statistics:",
+        *_metric_stats(df, enabled_metrics),
+    ]
+    return "\n".join(parts)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _summary_cached(path_str: str, version: str, metric_keys: tuple, metric_names: tuple) -> str:
+    df = assessment_frame_by_key(path_str, version, metric_keys, metric_names)
+    em = [{"key": k, "name": n} for k, n in zip(metric_keys, metric_names)]
+    return _summary_text(df, em)
+
+
+def tenant_summary(csv: pathlib.Path, enabled_metrics: list[dict]) -> str:
+    """Compact tenant-wide statistics for the system prompt (cached per data version)."""
+    return _summary_cached(*frame_key(csv, enabled_metrics))
+
+
+# ── Question context ────────────────────────────────────────────────────
+
+def _partner_line(row, enabled_metrics: list[dict], focus: list[str], raw: dict) -> str:
+    head = (f"{row['Partner']} | Tier {row['Tier'] or 'N/A'} | {row['Country'] or 'N/A'} | "
+            f"PAM {row['PAM'] or 'N/A'} | {row['Pct']:.1f}% ({row['Grade']})")
+    cells = []
+    for m in enabled_metrics:
+        sc = int(row[m["name"]])
+        if m["key"] in focus:
+            rv = raw.get(f"raw_{m['key']}", "")
+            cells.append(f"{m['name']}={sc or '-'}" + (f" (raw:{rv})" if rv not in ("", None) else ""))
+        elif not focus:
+            cells.append(f"{m['key']}={sc or '-'}")
+    return head + (" | " + ", ".join(cells) if cells else "")
+
+
+def question_context(question: str, csv: pathlib.Path, enabled_metrics: list[dict]) -> str:
+    """Partner data relevant to *question*, bounded to ``MAX_CONTEXT_PARTNERS`` lines."""
+    df = assessment_frame(enabled_metrics, csv)
+    if df.empty:
+        return "No partners scored yet."
+    hit = match_question(question, enabled_metrics, vocabulary(csv, enabled_metrics))
+    rp = raw_path()
+    raw_by_name = _raw_index(str(rp), stat_token(rp))
+
+    mask = None
+    for kind, col in (("pams", "PAM"), ("countries", "Country"), ("tiers", "Tier")):
+        if hit[kind]:
+            m = df[col].str.strip().isin(hit[kind])
+            mask = m if mask is None else mask & m
+    named = df[df["Partner"].isin(hit["partners"])].head(MAX_CONTEXT_PARTNERS)
+    subset = df[mask] if mask is not None else df.iloc[0:0]
+    scope = "partners matching " + ", ".join(hit[k][0] if len(hit[k]) == 1 else "/".join(hit[k])
+                                              for k in ("pams", "countries", "tiers") if hit[k]) if mask is not None else ""
+    if mask is None and named.empty:
+        subset = df; scope = "all partners"
+
+    focus = hit["metrics"]
+    sort_col = next((m["name"] for m in enabled_metrics if m["key"] in focus), "Pct")
+    room = max(0, MAX_CONTEXT_PARTNERS - len(named))
+    rest = subset[~subset["Partner"].isin(named["Partner"])]
+    ordered = rest.sort_values([sort_col, "Pct"], ascending=False)
+    n_low = room // 2 if len(rest) > room else 0
+    shown = pd.concat([ordered.head(room - n_low), ordered.tail(n_low)]) if n_low else ordered.head(room)
+
+    lines = []
+    if focus:
+        lines.append("Metrics in question: " + ", ".join(m["name"] for m in enabled_metrics if m["key"] in focus))
+    if not focus:
+        lines.append("Score columns use metric keys; '-' = unscored.")
+    if not named.empty:
+        lines.append(f"Named partners ({len(named)}):")
+        lines += [_partner_line(r, enabled_metrics, focus, raw_by_name.get(r["Partner"], {})) for _, r in named.iterrows()]
+    if scope:
+        lines.append(f"{scope.capitalize()}: {len(subset)} — average {subset['Pct'].mean():.1f}%"
+                     + "".join(f", {m['name']} mean {subset[m['name']][subset[m['name']] > 0].mean():.2f}"
+                               for m in enabled_metrics if m["key"] in focus and (subset[m["name"]] > 0).any()))
+        if len(rest) > len(shown):
+            lines.append(f"Showing the {len(shown) - n_low} highest and {n_low} lowest by "
+                         f"{sort_col if sort_col != 'Pct' else 'overall %'}; the other {len(rest) - len(shown)} are omitted.")
+        lines += [_partner_line(r, enabled_metrics, focus, raw_by_name.get(r["Partner"], {})) for _, r in shown.iterrows()]
+    return "\n".join(lines)
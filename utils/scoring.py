@@ -9,11 +9,15 @@ import csv
 import json
 import math
 import re
+from typing import TYPE_CHECKING
 
-import pandas as pd
 import streamlit as st
 
 from utils.paths import csv_path, raw_path, save_path
+from utils.perf import count_io
+
+if TYPE_CHECKING:
+    import pandas as pd  # imported lazily: pages that never score raw data skip it
 
 
 # ── Helpers ─────────────────────────────────────────────────────────────
@@ -181,6 +185,21 @@ def synthetic_raw_for_score(mk: str, score: int, cr: dict | None = None):
 
 # ── Criteria init / migration ──────────────────────────────────────────
 
+def _default_metric(m: dict) -> dict:
+    """Default criteria entry for SCORECARD_METRICS item *m*."""
+    if m["type"] == "quantitative":
+        return {
+            "name": m["name"], "type": "quantitative", "unit": m["unit"],
+            "direction": m["direction"], "enabled": True,
+            "ranges": {s: {"min": m["defaults"][s]["min"], "max": m["defaults"][s]["max"]} for s in ("1", "2", "3", "4", "5")},
+        }
+    return {
+        "name": m["name"], "type": "qualitative", "unit": None,
+        "direction": m["direction"], "enabled": True,
+        "descriptors": {s: m["defaults"][s] for s in ("1", "2", "3", "4", "5")},
+    }
+
+
 def init_criteria() -> None:
     """Initialise scoring criteria in session state, migrating if needed."""
     if "criteria" in st.session_state:
@@ -189,18 +208,7 @@ def init_criteria() -> None:
         for m in SCORECARD_METRICS:
             k = m["key"]
             if k not in cr:
-                if m["type"] == "quantitative":
-                    cr[k] = {
-                        "name": m["name"], "type": "quantitative", "unit": m["unit"],
-                        "direction": m["direction"], "enabled": True,
-                        "ranges": {s: {"min": m["defaults"][s]["min"], "max": m["defaults"][s]["max"]} for s in ("1", "2", "3", "4", "5")},
-                    }
-                else:
-                    cr[k] = {
-                        "name": m["name"], "type": "qualitative", "unit": None,
-                        "direction": m["direction"], "enabled": True,
-                        "descriptors": {s: m["defaults"][s] for s in ("1", "2", "3", "4", "5")},
-                    }
+                cr[k] = _default_metric(m)
                 changed = True
         if changed:
             st.session_state["criteria"] = cr
@@ -208,6 +216,7 @@ def init_criteria() -> None:
 
     sp = save_path()
     if sp.exists():
+        count_io("read", sp)
         try:
             cr = json.loads(sp.read_text())
             st.session_state["criteria"] = cr
@@ -216,22 +225,29 @@ def init_criteria() -> None:
         except Exception:
             pass
 
-    cr = {}
+    st.session_state["criteria"] = {m["key"]: _default_metric(m) for m in SCORECARD_METRICS}
+
+
+def load_criteria(path=None) -> dict | None:
+    """Load criteria from disk without touching session state.
+
+    Reads *path* (default: the active tenant's ``scoring_criteria.json``)
+    and fills in any metrics missing from older files with their defaults.
+    Returns ``None`` if the file does not exist or cannot be parsed.
+    """
+    sp = path or save_path()
+    if not sp.exists():
+        return None
+    count_io("read", sp)
+    try:
+        cr = json.loads(sp.read_text())
+    except Exception:
+        return None
     for m in SCORECARD_METRICS:
         k = m["key"]
-        if m["type"] == "quantitative":
-            cr[k] = {
-                "name": m["name"], "type": "quantitative", "unit": m["unit"],
-                "direction": m["direction"], "enabled": True,
-                "ranges": {s: {"min": m["defaults"][s]["min"], "max": m["defaults"][s]["max"]} for s in ("1", "2", "3", "4", "5")},
-            }
-        else:
-            cr[k] = {
-                "name": m["name"], "type": "qualitative", "unit": None,
-                "direction": m["direction"], "enabled": True,
-                "descriptors": {s: m["defaults"][s] for s in ("1", "2", "3", "4", "5")},
-            }
-    st.session_state["criteria"] = cr
+        if k not in cr:
+            cr[k] = _default_metric(m)
+    return cr
 
 
 def ensure_criteria_complete() -> None:
@@ -240,65 +256,86 @@ def ensure_criteria_complete() -> None:
     for m in SCORECARD_METRICS:
         k = m["key"]
         if k not in cr:
-            if m["type"] == "quantitative":
-                cr[k] = {
-                    "name": m["name"], "type": "quantitative", "unit": m["unit"],
-                    "direction": m["direction"], "enabled": True,
-                    "ranges": {s: {"min": m["defaults"][s]["min"], "max": m["defaults"][s]["max"]} for s in ("1", "2", "3", "4", "5")},
-                }
-            else:
-                cr[k] = {
-                    "name": m["name"], "type": "qualitative", "unit": None,
-                    "direction": m["direction"], "enabled": True,
-                    "descriptors": {s: m["defaults"][s] for s in ("1", "2", "3", "4", "5")},
-                }
+            cr[k] = _default_metric(m)
     st.session_state["criteria"] = cr
 
 
-def save_criteria() -> None:
-    """Persist criteria from session state to disk, then re-score all partners."""
+def _criteria_edits(m: dict, cur: dict) -> dict:
+    """Step 1 widget values for metric *m* that differ from *cur*.
+
+    Only widgets present in session state count, so metrics the editor did
+    not render are never touched.  Returns ``{}`` when nothing changed.
+    """
+    mk = m["key"]; ss = st.session_state; edits: dict = {}
+    en_key = f"p1_{mk}_en"
+    if en_key in ss and ss[en_key] != cur.get("enabled", True):
+        edits["enabled"] = ss[en_key]
+    for s in ("1", "2", "3", "4", "5"):
+        if m["type"] == "quantitative":
+            for bound in ("min", "max"):
+                k = f"p1_{mk}_s{s}_{bound}"
+                if k in ss and ss[k] != cur["ranges"][s][bound]:
+                    edits.setdefault("ranges", {}).setdefault(s, {})[bound] = ss[k]
+        else:
+            k = f"p1_{mk}_s{s}_desc"
+            if k in ss and ss[k] != cur["descriptors"][s]:
+                edits.setdefault("descriptors", {})[s] = ss[k]
+    return edits
+
+
+def save_criteria() -> list[str]:
+    """Persist the Step 1 edits held in session state, then re-score all partners.
+
+    Only metrics whose editor widgets were rendered and differ from the
+    current criteria are updated.  Returns their keys; when nothing changed
+    (and the criteria file already exists) nothing is written or re-scored.
+    """
     cr = st.session_state["criteria"]
     ensure_criteria_complete()
+    dirty = []
     for m in SCORECARD_METRICS:
         mk = m["key"]
         if mk not in cr:
             continue
-        en_key = f"p1_{mk}_en"
-        if en_key in st.session_state:
-            cr[mk]["enabled"] = st.session_state[en_key]
-        if m["type"] == "quantitative":
-            for s in ("1", "2", "3", "4", "5"):
-                min_key = f"p1_{mk}_s{s}_min"
-                max_key = f"p1_{mk}_s{s}_max"
-                if min_key in st.session_state:
-                    cr[mk]["ranges"][s]["min"] = st.session_state[min_key]
-                if max_key in st.session_state:
-                    cr[mk]["ranges"][s]["max"] = st.session_state[max_key]
-        else:
-            for s in ("1", "2", "3", "4", "5"):
-                desc_key = f"p1_{mk}_s{s}_desc"
-                if desc_key in st.session_state:
-                    cr[mk]["descriptors"][s] = st.session_state[desc_key]
-    save_path().write_text(json.dumps(cr, indent=2))
+        edits = _criteria_edits(m, cr[mk])
+        if not edits:
+            continue
+        dirty.append(mk)
+        if "enabled" in edits:
+            cr[mk]["enabled"] = edits["enabled"]
+        for s, bounds in edits.get("ranges", {}).items():
+            cr[mk]["ranges"][s].update(bounds)
+        cr[mk].get("descriptors", {}).update(edits.get("descriptors", {}))
+    sp = save_path()
+    if not dirty and sp.exists():
+        return dirty
+    sp.write_text(json.dumps(cr, indent=2))
+    count_io("write", sp)
     rescore_all()
+    return dirty
 
 
 # ── Re-scoring ──────────────────────────────────────────────────────────
 
-def rescore_all() -> None:
-    """Re-score all partners using current criteria and rewrite CSV."""
+def rescore_all(criteria: dict | None = None) -> None:
+    """Re-score all partners and rewrite CSV.
+
+    Uses *criteria* when given (headless callers), otherwise the criteria
+    held in session state.
+    """
     from utils.data import invalidate_partner_cache
 
     rp = raw_path()
     if not rp.exists():
         return
+    count_io("read", rp)
     try:
         raw_partners = json.loads(rp.read_text())
     except Exception:
         return
     if not raw_partners:
         return
-    cr = st.session_state.get("criteria")
+    cr = criteria or st.session_state.get("criteria")
     if not cr:
         return
     em = enabled(cr)
@@ -335,6 +372,7 @@ def rescore_all() -> None:
             row["max_possible"] = mp
             row["percentage"] = round(total / mp * 100, 1) if mp else 0
             w.writerow(row)
+    count_io("write", cp)
     invalidate_partner_cache()
 
 
@@ -342,7 +380,7 @@ def rescore_all() -> None:
 
 
 def calculate_dynamic_ranges(
-    df: pd.DataFrame,
+    df: "pd.DataFrame",
     criteria: dict | None = None,
 ) -> dict:
     """Compute quintile-based 1–5 scoring ranges from partner data.
@@ -362,6 +400,8 @@ def calculate_dynamic_ranges(
     ``scoring_criteria.json``) with updated ``ranges`` for quantitative
     metrics.
     """
+    import pandas as pd
+
     cr = {k: dict(v) for k, v in (criteria or st.session_state.get("criteria", {})).items()}
     if not cr:
         return cr
@@ -455,13 +495,20 @@ def _fmt(val: float, metric: dict) -> str:
     return str(round(val, 2))
 
 
-def recalculate_benchmarks() -> dict:
+def recalculate_benchmarks(criteria: dict | None = None, persist: bool = True) -> dict:
     """Load the active tenant's raw partner data, compute dynamic quintile
     ranges for all quantitative metrics, persist the updated criteria, and
     re-score every partner.
 
+    When *criteria* is given (headless callers) it is used instead of the
+    session criteria, and session state is left untouched.  With
+    ``persist=False`` nothing is written — the result only reports which
+    metrics would change.
+
     Returns a summary dict ``{"updated": [list of metric names], "skipped": [...]}``.
     """
+    import pandas as pd
+
     from utils.data import load_raw
 
     raw_list = load_raw()
@@ -469,7 +516,7 @@ def recalculate_benchmarks() -> dict:
         return {"updated": [], "skipped": ["No partner data found"]}
 
     df = pd.DataFrame(raw_list)
-    cr = st.session_state.get("criteria")
+    cr = criteria or st.session_state.get("criteria")
     if not cr:
         return {"updated": [], "skipped": ["No scoring criteria loaded"]}
 
@@ -489,10 +536,16 @@ def recalculate_benchmarks() -> dict:
         elif not new_ranges or old_ranges == new_ranges:
             skipped_names.append(m["name"])
 
+    if not persist:
+        return {"updated": updated_names, "skipped": skipped_names}
+
     # Persist
-    st.session_state["criteria"] = new_cr
-    save_path().write_text(json.dumps(new_cr, indent=2))
-    rescore_all()
+    if criteria is None:
+        st.session_state["criteria"] = new_cr
+    sp = save_path()
+    sp.write_text(json.dumps(new_cr, indent=2))
+    count_io("write", sp)
+    rescore_all(new_cr)
 
     return {"updated": updated_names, "skipped": skipped_names}
 
@@ -504,7 +557,7 @@ def calculate_revenue_recovery(
     raw_partners: list[dict],
     net_new_threshold: float,
     baseline_margin_pct: float = 10.0,
-) -> pd.DataFrame:
+) -> "pd.DataFrame":
     """Identify non-performing longtail partners and calculate margin recapture.
 
     A partner is a *non-performer* when their raw net-new logo revenue is
@@ -519,6 +572,8 @@ def calculate_revenue_recovery(
         Partner, Annual Revenue, Current Margin %, Current Margin $,
         New Margin %, New Margin $, Recapture $, Net-New Logo Revenue
     """
+    import pandas as pd
+
     rows: list[dict] = []
     for rp in raw_partners:
         # Parse net-new logo revenue
@@ -0,0 +1,149 @@
+"""
+Typed columnar snapshots of a tenant's partner data for ChannelPRO™.
+
+``all_partners.csv`` stores every value as text and keeps raw metric values
+in a separate JSON file.  A snapshot joins both into one Arrow table with a
+fixed schema:
+
+* partner details — dictionary-encoded strings
+* ``<metric>`` — score 1–5 as ``int8`` (null when unscored)
+* ``raw_<metric>`` — raw value as ``float64`` for quantitative metrics,
+  dictionary-encoded string for qualitative ones
+* ``total_score`` / ``max_possible`` — ``int16``; ``percentage`` — ``float64``
+
+Schema metadata carries the criteria version (a hash of the scoring
+criteria), the enabled metric keys and the data version the snapshot was
+built from.
+
+Two file formats share that table: Parquet (``.parquet``) for BI downloads,
+and an uncompressed Arrow IPC file (``python -m utils.cli export --kind
+arrow``) that :func:`read_snapshot` memory-maps, so scripts and BI tools can
+load a large tenant without parsing CSV.  ``pyarrow`` ships with Streamlit but is treated
+as optional — functions return ``None`` when it is missing.
+"""
+import hashlib
+import json
+import os
+import pathlib
+import time
+
+from utils.data import PARTNER_DETAIL_FIELDS, _sf, data_version, load_partners, load_raw
+from utils.paths import current_data_dir
+from utils.scoring import enabled, load_criteria
+
+SNAPSHOT_SCHEMA_VERSION = "1"
+
+
+def snapshot_path() -> pathlib.Path:
+    """Path to snapshot.arrow for the active tenant."""
+    return current_data_dir() / "snapshot.arrow"
+
+
+def criteria_hash(criteria: dict) -> str:
+    """Content hash of the scoring criteria (stable across machines)."""
+    return hashlib.sha256(json.dumps(criteria, sort_keys=True).encode()).hexdigest()[:16]
+
+
+# ── Build ───────────────────────────────────────────────────────────────
+
+def build_table(criteria: dict | None = None):
+    """Join the scored CSV and raw JSON of the active tenant into a typed table."""
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return None
+    cr = criteria or load_criteria() or {}
+    em = enabled(cr) if cr else []
+    partners = load_partners()
+    raw_by_name = {r.get("partner_name", ""): r for r in load_raw()}
+    raws = [raw_by_name.get(p.get("partner_name", ""), {}) for p in partners]
+
+    def _int(v):
+        try:
+            return int(float(v)) if v not in (None, "") else None
+        except (TypeError, ValueError):
+            return None
+
+    def _str_col(values):
+        return pa.array([v if v not in (None, "") else None for v in values], pa.string()).dictionary_encode()
+
+    cols = {f: _str_col([p.get(f, "") for p in partners]) for f in PARTNER_DETAIL_FIELDS}
+    for m in em:
+        mk = m["key"]
+        scores = [_int(p.get(mk)) for p in partners]
+        cols[mk] = pa.array([s if s is not None and 1 <= s <= 5 else None for s in scores], pa.int8())
+    for m in em:
+        mk = m["key"]; vals = [r.get(f"raw_{mk}") for r in raws]
+        if m["type"] == "quantitative":
+            cols[f"raw_{mk}"] = pa.array([_sf(v) for v in vals], pa.float64())
+        else:
+            cols[f"raw_{mk}"] = _str_col(vals)
+    cols["total_score"] = pa.array([_int(p.get("total_score")) for p in partners], pa.int16())
+    cols["max_possible"] = pa.array([_int(p.get("max_possible")) for p in partners], pa.int16())
+    cols["percentage"] = pa.array([_sf(p.get("percentage")) for p in partners], pa.float64())
+
+    meta = {
+        "channelpro.schema_version": SNAPSHOT_SCHEMA_VERSION,
+        "channelpro.criteria_version": criteria_hash(cr),
+        "channelpro.data_version": data_version(),
+        "channelpro.metrics": json.dumps([m["key"] for m in em]),
+        "channelpro.generated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    return pa.table(cols).replace_schema_metadata(meta)
+
+
+# ── Writers ─────────────────────────────────────────────────────────────
+
+def parquet_bytes(criteria: dict | None = None) -> bytes | None:
+    """Snapshot of the active tenant as a Parquet file (for downloads)."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        return None
+    table = build_table(criteria)
+    if table is None:
+        return None
+    sink = pa.BufferOutputStream()
+    pq.write_table(table, sink, compression="zstd")
+    return sink.getvalue().to_pybytes()
+
+
+def write_snapshot(criteria: dict | None = None, path: pathlib.Path | None = None) -> pathlib.Path | None:
+    """(Re)write the memory-mappable Arrow IPC snapshot for the active tenant."""
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return None
+    table = build_table(criteria)
+    if table is None:
+        return None
+    dest = path or snapshot_path()
+    tmp = dest.with_name(f".{dest.name}.tmp")
+    with pa.OSFile(str(tmp), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp, dest)
+    return dest
+
+
+# ── Loader ──────────────────────────────────────────────────────────────
+
+def read_snapshot(path: pathlib.Path | None = None):
+    """Memory-map a snapshot file and return its Arrow table (``None`` if absent)."""
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return None
+    p = path or snapshot_path()
+    if not p.exists():
+        return None
+    # Buffers keep the mapping alive, so the file is not closed explicitly
+    return pa.ipc.open_file(pa.memory_map(str(p), "r")).read_all()
+
+
+def snapshot_meta(table) -> dict:
+    """Decoded ``channelpro.*`` schema metadata of a snapshot table."""
+    raw = table.schema.metadata or {}
+    return {k.decode().removeprefix("channelpro."): v.decode()
+            for k, v in raw.items() if k.startswith(b"channelpro.")}
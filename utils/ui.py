@@ -1,19 +1,24 @@
 """
 Shared UI helpers — branding, CSS, and logo rendering for ChannelPRO™.
 """
+import functools
+import html
 import json
+import pathlib
 
 import streamlit as st
 
-from utils.assets import LOGIN_BG_B64, YORK_LOGO_B64  # noqa: F401 (re-exported)
+from utils.assets import YORK_LOGO, image_url, static_url
+from utils.data import stat_token
 from utils.paths import client_path
+from utils.perf import section
 
-# Re-export so other modules can do ``from utils.ui import YORK_LOGO_B64``
 __all__ = [
-    "YORK_LOGO_B64", "LOGIN_BG_B64", "inject_css", "logo", "brand",
+    "inject_css", "logo", "brand",
     "display_styled_assessment_table",
     "display_classification_dashboard",
     "get_tenant_tier", "show_premium_placeholder",
+    "cached_download",
 ]
 
 
@@ -55,11 +60,7 @@ _METRIC_SHORT_NAMES: dict[str, str] = {
 
 # ── CSS injection ──────────────────────────────────────────────────────
 
-def inject_css() -> None:
-    """Inject the global ChannelPRO™ stylesheet (call once per page load)."""
-    st.markdown(
-        """
-<style>
+_STYLESHEET = """
 @import url('https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;600;700;800&family=JetBrains+Mono:wght@400;600;800&display=swap');
 [data-testid="stAppViewContainer"]{background:#f3f5f9;font-family:'DM Sans',sans-serif;color:#1e2a3a}
 [data-testid="stAppViewContainer"] label,[data-testid="stAppViewContainer"] .stRadio label,[data-testid="stAppViewContainer"] .stCheckbox label,[data-testid="stAppViewContainer"] .stMultiSelect label,[data-testid="stAppViewContainer"] [data-testid="stWidgetLabel"]{color:#1e2a3a!important}
@@ -112,54 +113,81 @@ section[data-testid="stSidebar"] hr{border-color:#2a3d57!important}
 .tenant-badge{display:inline-block;padding:4px 12px;border-radius:8px;font-size:.82rem;font-weight:700;background:#2563eb;color:#fff;margin-bottom:8px}
 .plist-item{display:flex;align-items:center;justify-content:space-between;padding:8px 14px;border:1px solid #e2e6ed;border-radius:8px;margin:4px 0;background:#fff;font-size:.88rem}
 section[data-testid="stSidebar"] [data-testid="stButton"] button[kind="primary"]{background:#dc4040!important;border-color:#dc4040!important;color:#fff!important;font-weight:800!important}
-</style>
-""",
-        unsafe_allow_html=True,
-    )
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _css_block() -> str:
+    """The stylesheet as a single-line ``<style>`` block (built once per process)."""
+    return "<style>" + "".join(line.strip() for line in _STYLESHEET.splitlines()) + "</style>"
+
+
+def inject_css() -> None:
+    """Inject the global ChannelPRO™ stylesheet (call once per page load).
+
+    The block is byte-identical on every rerun, so Streamlit's message cache
+    (``minCachedMessageSize`` in ``.streamlit/config.toml``) sends it once per
+    session and only a hash reference after that.
+    """
+    st.markdown(_css_block(), unsafe_allow_html=True)
 
 
 # ── Branding ───────────────────────────────────────────────────────────
 
+_BRAND_HTML = (
+    f'<div style="display:flex;align-items:center;gap:16px;margin-bottom:14px;">'
+    f'<img src="{static_url(YORK_LOGO)}" style="height:50px;border-radius:6px;">'
+    f'<div><div style="font-size:1.6rem;font-weight:800;color:#1e2a3a;">ChannelPRO\u2122</div>'
+    f'<div style="font-size:.92rem;color:#4a6a8f;font-weight:600;margin-top:-4px;">Partner Revenue Optimizer</div></div></div>'
+)
+
+
 def logo() -> None:
     """Render the small ChannelPRO™ logo in the sidebar."""
     st.markdown(
-        f'<img src="data:image/jpeg;base64,{YORK_LOGO_B64}" '
+        f'<img src="{static_url(YORK_LOGO)}" '
         f'style="height:50px;margin-bottom:8px;">',
         unsafe_allow_html=True,
     )
 
 
-def brand() -> None:
-    """Render the full header bar with ChannelPRO™ branding and optional client logo."""
-    logo_url = ""
+def _client_logo() -> str:
+    """Logo URL from the active tenant's client_info.json, memoised per session.
+
+    The file is re-read only when the tenant changes or its mtime/size does.
+    """
     cp = client_path()
-    if cp.exists():
+    key = (str(cp), stat_token(cp))
+    memo = st.session_state.get("_brand_memo")
+    if memo is None or memo[0] != key:
+        logo_url = ""
         try:
-            disk_ci = json.loads(cp.read_text())
-            logo_url = disk_ci.get("logo_url", "")
+            logo_url = json.loads(cp.read_text()).get("logo_url", "")
         except Exception:
             pass
-    if not logo_url:
-        logo_url = st.session_state.get("client_info", {}).get("logo_url", "")
-
-    brand_html = (
-        f'<div style="display:flex;align-items:center;gap:16px;margin-bottom:14px;">'
-        f'<img src="data:image/jpeg;base64,{YORK_LOGO_B64}" style="height:50px;border-radius:6px;">'
-        f'<div><div style="font-size:1.6rem;font-weight:800;color:#1e2a3a;">ChannelPRO\u2122</div>'
-        f'<div style="font-size:.92rem;color:#4a6a8f;font-weight:600;margin-top:-4px;">Partner Revenue Optimizer</div></div></div>'
-    )
+        memo = (key, logo_url)
+        st.session_state["_brand_memo"] = memo
+    return memo[1]
+
+
+@functools.lru_cache(maxsize=64)
+def _logo_img(logo_url: str) -> str:
+    return (f'<img src="{html.escape(image_url(logo_url), quote=True)}" '
+            f'style="width:80px;max-height:80px;object-fit:contain;">')
+
+
+def brand() -> None:
+    """Render the full header bar with ChannelPRO™ branding and optional client logo."""
+    logo_url = _client_logo() or st.session_state.get("client_info", {}).get("logo_url", "")
 
     if logo_url:
         left_col, right_col = st.columns([5, 1])
         with left_col:
-            st.markdown(brand_html, unsafe_allow_html=True)
+            st.markdown(_BRAND_HTML, unsafe_allow_html=True)
         with right_col:
-            try:
-                st.image(logo_url, width=80)
-            except Exception:
-                pass
+            st.markdown(_logo_img(logo_url), unsafe_allow_html=True)
     else:
-        st.markdown(brand_html, unsafe_allow_html=True)
+        st.markdown(_BRAND_HTML, unsafe_allow_html=True)
 
 
 # ── Tenant tier detection ─────────────────────────────────────────────
@@ -204,9 +232,53 @@ def show_premium_placeholder(feature_name: str) -> None:
     st.stop()
 
 
+# ── Cached, on-demand downloads ───────────────────────────────────────
+
+# Shown when build() returns None, by file extension (override with ``unavailable=``)
+_UNAVAILABLE = {
+    ".xlsx": "Install openpyxl for Excel export.",
+    ".parquet": "Install pyarrow for Parquet export.",
+}
+
+
+def cached_download(label: str, build, file_name: str, mime: str, *,
+                    kind: str, version, key: str | None = None,
+                    unavailable: str | None = None, **button_kw) -> None:
+    """Download button whose file is built only when asked for.
+
+    The export is looked up in the on-disk export cache under
+    ``(tenant, kind, version)`` — *version* should capture everything the
+    file depends on (data version, enabled metrics, filters, …).  On a cache
+    miss a "Prepare" button is shown instead; clicking it runs *build()*
+    (which returns ``bytes``/``str``, or ``None`` if the export is
+    unavailable), stores the result and shows the real download button.
+    When *build()* returns ``None`` the *unavailable* message is shown
+    (default: based on the file type).
+    """
+    from utils.cache import export_cache
+
+    cache = export_cache()
+    ck = cache.key(st.session_state.get("active_tenant"), kind, version)
+    data = cache.get(ck)
+    if data is None:
+        prep_label = label.replace("Download", "Prepare", 1) if "Download" in label else f"Prepare {label}"
+        if not st.button(prep_label, key=f"prep_{key or kind}", **button_kw):
+            return
+        with st.spinner("Preparing export…"), section("export"):
+            data = build()
+        if data is None:
+            st.warning(unavailable or _UNAVAILABLE.get(pathlib.Path(file_name).suffix.lower(),
+                                                       f"{file_name} is not available."))
+            return
+        if isinstance(data, str):
+            data = data.encode()
+        cache.put(ck, data)
+    st.download_button(label, data, file_name, mime, key=f"dl_{key or kind}", **button_kw)
+
+
 # ── Professional AG Grid assessment table ─────────────────────────────
 
-def display_styled_assessment_table(df_grid, enabled_metrics):
+def display_styled_assessment_table(df_grid, enabled_metrics, server_side=False):
     """Render the Partner Assessment table with Alpine-themed AG Grid.
 
     Args:
@@ -214,6 +286,9 @@ def display_styled_assessment_table(df_grid, enabled_metrics):
                  PAM, [metric name columns …], Total, Pct, Grade.
         enabled_metrics: list of enabled metric dicts (each with ``key``,
                          ``name``, ``explanation``, ``cat``).
+        server_side: *df_grid* is one page already filtered and sorted by
+                     the caller (see ``utils.grid``), so the grid's own
+                     sorting, filters and pagination are switched off.
 
     Returns:
         The ``AgGrid`` response object (for row-selection handling by the
@@ -363,7 +438,7 @@ def display_styled_assessment_table(df_grid, enabled_metrics):
     )
 
     # Pagination for large datasets
-    if len(df_grid) > 50:
+    if not server_side and len(df_grid) > 50:
         gb.configure_pagination(paginationAutoPageSize=False,
                                 paginationPageSize=50)
 
@@ -416,6 +491,12 @@ def display_styled_assessment_table(df_grid, enabled_metrics):
         info_cols + grouped_cols + orphan_cols + summary_cols
     )
 
+    # Server-side row model: sorting/filtering one page would be misleading
+    if server_side:
+        for col in [grid_options.get("defaultColDef", {}), *original_cols]:
+            col.update(sortable=False, filter=False, floatingFilter=False)
+            col.pop("sort", None)
+
     # ── Custom CSS — Alpine theme refinements ──
     custom_css = {
         # Category group header row